@@ -1,10214 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-Analyse Coûts-Bénéfices — Compteurs d'Eau Résidentiels
-======================================================
-
-Modèle d'analyse économique pour l'implantation de compteurs d'eau
-dans les municipalités québécoises.
-
-Fonctionnalités:
-- Comparaison AMI vs AMR vs Manuel
-- Valeur Actuelle Nette (VAN) et Ratio Bénéfices-Coûts (RBC)
-- Période de récupération actualisée
-- Coût nivelé de l'eau économisée (LCSW)
-- Report d'infrastructure (optionnel)
-- Fuites réseau (optionnel) avec trajectoire et coûts
-- Analyses de sensibilité complètes
-
-Auteur: Modèle consolidé pour thèse
-Version: 3.11.0 - Monte Carlo, MCF, Segmentation, OPEX AMI (janvier 2026)
-
-Changelog v3.11.0:
-- NOUVEAU: Module Monte Carlo — Simulation stochastique
-  - DistributionParametre: distributions triangulaires, normales, uniformes
-  - ParametresMonteCarlo: configuration N simulations, seed reproductibilité
-  - ResultatsMonteCarlo: P(VAN>0), percentiles, corrélations drivers
-  - simuler_monte_carlo(): exécution N tirages avec analyse sensibilité
-  - graphique_distribution_van(): histogramme avec P(VAN>0)
-  - graphique_tornado_mc(): graphique tornado des drivers
-  - DISTRIBUTIONS_DEFAUT: alpha0, lpcd, valeur_eau, cout_compteur, prevalence_fuites
-- NOUVEAU: MCF (Coût Marginal des Fonds publics)
-  - ParametresValeurEau.mcf: 0.20 pour sensibilité (désactivé par défaut)
-  - ParametresValeurEau.appliquer_mcf: activer/désactiver
-  - ParametresValeurEau.facteur_mcf(): retourne (1+mcf) en mode économique
-  - actualiser_series(): applique MCF aux dépenses publiques (I0, OPEX, ponctuels)
-  - VALEUR_EAU_SANS_MCF: préréglage pour comparaison
-- NOUVEAU: Module Coûts Non Techniques AMI
-  - VentilationOPEX: cybersécurité, licences, stockage, service client, intégration SI
-  - VENTILATION_OPEX_STANDARD, VENTILATION_OPEX_SECURITE_ELEVEE, VENTILATION_OPEX_CLOUD
-  - afficher_ventilation_opex(): tableau détaillé
-- NOUVEAU: Module Segmentation Résidentielle
-  - TypeLogement: UNIFAMILIAL, MULTIPLEX, MULTILOGEMENT
-  - ParametresSegment: caractéristiques par type de logement
-  - SEGMENT_UNIFAMILIAL, SEGMENT_MULTIPLEX (Québec SQEEP 2023)
-  - Note: MULTILOGEMENT exclu par défaut (effet comportemental non modélisable)
-  - executer_modele_segmente(): analyse multi-segments avec agrégation
-  - afficher_resultats_segmentes(), graphique_segmentation()
-- NOUVEAU: 8 tests de validation (Tests 45-52)
-  - VentilationOPEX, MCF, Segmentation, Monte Carlo
-
-Changelog v3.10.1:
-- CORRECTION 4.2: Économies d'échelle calculées sur H × A_max (adoption effective)
-  - Évite surestimation du rabais volume si adoption partielle (<100%)
-- CORRECTION 4.4: taux_correction_effectif_avec_persistance utilisé dans calculer_economies_eau()
-  - Intègre la fraction de fuites jamais réparées (longue traîne)
-- CORRECTION 4.5: volume_fuite_moyen_pondere utilisé si mode deux-stocks
-  - Pondération correcte any/significatives pour calcul usage_reductible
-- NOUVEAU: 3 tests de validation ajoutés (Tests 42-44)
-
-Changelog v3.10.0:
-- SQEEP 2023: DEFAUTS_LONGUEUIL mis à jour (116,258 ménages, 2.18 pers/ménage, 236 LPCD)
-- NOUVEAU: Modèle deux-stocks fuites (any vs significatives)
-  - utiliser_prevalence_differenciee: active le mode deux-stocks
-  - part_menages_fuite_any_pct (20%), debit_fuite_any_m3_an (10 m³/an)
-  - part_menages_fuite_significative_pct (5%), debit_fuite_significative_m3_an (50 m³/an)
-  - Fraction persistante (longue traîne) avec taux réparation réduit
-- NOUVEAU: Paramètres différenciés par type de fuite
-  - facteur_detection_sig (1.2), facteur_reparation_sig (0.7)
-  - cout_reparation_any (100$), cout_reparation_sig (400$)
-- NOUVEAU: ResultatsFuites avec breakdowns par type
-- FIX: executer_analyse_complete() utilise PERSISTANCE_REALISTE par défaut
-- FIX: CALIBRATION lambda_decay synchronisé avec défaut (0.15)
-- generate_reponse_longueuil.py refactoré pour injecter résultats calculés
-
-Changelog v3.9.0:
-- CALIBRATION: LPCD par défaut 332 → 250 L/p/j (source MAMH RAUEP)
-- CALIBRATION: Lambda décroissance 0.35 → 0.15/an (source Allcott AER)
-- CALIBRATION: Coût variable eau 1.50 → 0.50 $/m³ (source Winnipeg water audit)
-- NOUVEAU: Prévalence fuites différenciée (any 20%, significative 5%)
-  - part_menages_fuite_any_pct, debit_fuite_any_m3_an
-  - part_menages_fuite_significative_pct, debit_fuite_significative_m3_an
-  - utiliser_prevalence_differenciee pour activer
-- NOUVEAU: Paramètres longue traîne fuites (source AWE 2023)
-  - part_fuites_persistantes_pct: fuites jamais réparées
-  - facteur_duree_longue_traine: multiplicateur durée
-- NOUVEAU: Propriétés ParametresFuites:
-  - taux_correction_effectif_avec_persistance
-  - volume_fuite_moyen_pondere
-- NOUVEAU: Preset LPCD_MONTREAL_HAUT = 332 pour scénario haute consommation
-- DOC: Harmonisation OPEX doc ↔ code
-- DOC: Ajout sources AWE (2023), Winnipeg accuracy
-
-Changelog v3.8.0:
-- NOUVEAU: Coûts incitatifs dans ParametresAdoption
-  - cout_incitatif_par_menage: coût TOTAL par ménage (réparti sur duree_incitatif_ans)
-  - duree_incitatif_ans: durée de versement des incitatifs
-  - Préréglages mis à jour: RAPIDE (540$/3 ans), PROGRESSIVE (180$/3 ans), LENTE (90$/3 ans)
-  - Mode ÉCONOMIQUE: incitatifs EXCLUS (transferts neutres pour bien-être social)
-  - Mode FINANCIER: incitatifs INCLUS (coût réel budget municipal)
-- NOUVEAU: Facteurs d'efficacité par type de compteur dans ParametresCompteur
-  - facteur_efficacite_comportement: multiplicateur réduction comportementale
-  - facteur_efficacite_fuites: multiplicateur détection fuites
-  - AMI: 1.0 (référence), AMR: 0.875/0.91, Manuel: 0.625/0.765
-  - Sources: Davies 2014, Beal 2011, Britton 2013, Winnipeg 2023
-- calculer_economies_eau() accepte maintenant compteur pour moduler les économies
-- generer_trajectoires() applique les facteurs d'efficacité:
-  - serie_alpha modulé par facteur_efficacite_comportement
-  - calculer_dynamique_fuites accepte facteur_efficacite_detection
-- calculer_dynamique_fuites() accepte facteur_efficacite_detection pour moduler d
-- Trajectoires: nouveau champ couts_incitatifs
-- actualiser_series() et calculer_van_cumulative() gèrent incitatifs selon le mode
-
-Changelog v3.7.0:
-- NOUVEAU: Module fuites réseau dynamique (pertes réseau + coûts)
-- Économies fuites intégrées aux bénéfices via trajectoires (privé)
-- Double-compte fuites/comportement corrigé (usage net des fuites)
-
-Changelog v3.6.0:
-- NOUVEAU: Module calibrage explicite pour traçabilité scientifique
-- Nouvelles structures: SourceCalibration, ParametreCalibre
-- 11 sources empiriques documentées: Davies, Carrillo, Beal, Kenney, Allcott,
-                                       AWWA, DeOreo, Britton, Winnipeg, Arregui, Renzetti
-- CALIBRATION: dictionnaire complet des paramètres avec sources
-- Nouvelles fonctions: afficher_calibration, valider_parametres_vs_calibration,
-                       generer_biblio_latex, exporter_biblio_latex,
-                       creer_tableau_sensibilite, generer_section_calibration_markdown
-- 5 catégories: persistance, fuites, economies_echelle, valeur_eau, financier
-- 11 paramètres calibrés avec plages recommandées basées sur la littérature
-- Export BibTeX automatique pour bibliographie LaTeX
-- Validation automatique des paramètres contre les plages empiriques
-
-Changelog v3.5.0:
-- NOUVEAU: Module adoption pour stratégies d'implantation
-- Nouvelles structures: ModeAdoption, ParametresAdoption
-- 6 préréglages: OBLIGATOIRE, RAPIDE, PROGRESSIVE, NOUVEAUX, PAR_SECTEUR, LENTE
-- Courbe d'adoption A(t): logistique, linéaire, par tranches
-- CAPEX étalé selon courbe d'adoption (optionnel)
-- Bénéfices et OPEX proportionnels à A(t)
-- Nouvelles fonctions: calculer_adoption, generer_serie_adoption,
-                       calculer_capex_etale, afficher_scenarios_adoption
-- generer_trajectoires() accepte params_adoption
-- actualiser_series() et calculer_van_cumulative() gèrent CAPEX étalé
-- executer_modele() accepte params_adoption
-
-Changelog v3.4.0:
-- NOUVEAU: Module perspectives (économique vs financier)
-- Nouvelles structures: ModeCompte (enum), ParametresValeurEau
-- Préréglages: VALEUR_EAU_QUEBEC, VALEUR_EAU_CONSERVATEUR, VALEUR_EAU_RARETE
-- Nouvelle fonction: comparer_perspectives() pour analyse comparative
-- generer_trajectoires() accepte mode_compte et valeur_eau
-- actualiser_series() et calculer_van_cumulative() distinguent les coûts
-- executer_modele() accepte mode_compte et valeur_eau
-- Analyse économique: valeur sociale, sans tarification, tous les coûts
-- Analyse financière: coût variable évité, sans tarification, coûts ville seulement
-
-Changelog v3.3.0:
-- NOUVEAU: Module fuites avec coûts de réparation
-- 5 scénarios: SANS_COUT, MENAGE_SEUL, SUBVENTION_50, VILLE_SEULE, CONTEXTE_QUEBEC
-- Nouvelles structures: ModeRepartitionCouts, ParametresFuites, ResultatsFuites
-- Nouvelles fonctions: calculer_dynamique_fuites, calculer_economies_fuites_menage,
-                       comparer_scenarios_fuites, afficher_scenarios_fuites,
-                       graphique_scenarios_fuites
-- executer_modele() accepte maintenant le paramètre 'params_fuites'
-- generer_trajectoires() intègre les coûts de réparation
-- actualiser_series() et calculer_van_cumulative() incluent les réparations
-- 22 tests de validation (incluant 6 tests de fuites)
-
-Changelog v3.2.0:
-- Module persistance avec décroissance α_B(t)
-- 3 scénarios: OPTIMISTE (constant), RÉALISTE (plateau), PESSIMISTE (fadeout)
-- Nouvelles structures: ModePersistance, ParametresPersistance
-- Nouvelles fonctions: calculer_alpha_comportement, generer_serie_alpha,
-                       comparer_scenarios_persistance, graphique_persistance
-- executer_modele() accepte le paramètre 'persistance'
-
-Changelog v3.1.0:
-- Refactoring: modèle basé sur séries B[t], C[t] au lieu de formules d'annuité
-- Nouvelles structures: EconomiesEau, Trajectoires
-- Nouvelles fonctions: calculer_economies_eau, generer_trajectoires,
-                       actualiser_series, calculer_van_cumulative
-"""
-
-from __future__ import annotations
-
-import math
-import os
-from dataclasses import dataclass, field
-from typing import Optional
-from enum import Enum
-
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
-
-# =============================================================================
-# VERSION
-# =============================================================================
-
-__version__ = "3.11.0"
-
-# =============================================================================
-# CONFIGURATION GRAPHIQUES
-# =============================================================================
-
-plt.rcParams.update({
-    'figure.dpi': 100,
-    'font.size': 10,
-    'axes.titlesize': 13,
-    'axes.labelsize': 11,
-    'figure.figsize': (10, 6),
-})
-
-
-# =============================================================================
-# ÉNUMÉRATIONS ET TYPES
-# =============================================================================
-
-class TypeCompteur(Enum):
-    """Type de technologie de compteur."""
-    AMI = "ami"        # Infrastructure de comptage avancée (intelligent, temps réel)
-    AMR = "amr"        # Lecture automatisée (tournées en véhicule)
-    MANUEL = "manuel"  # Lecture manuelle traditionnelle
-
-
-# =============================================================================
-# MODULE PERSPECTIVES : ÉCONOMIQUE vs FINANCIER
-# =============================================================================
-#
-# Ce module implémente la distinction fondamentale en économie publique entre:
-#
-# 1. ANALYSE ÉCONOMIQUE (bien-être social / welfare economics)
-#    - Perspective: société dans son ensemble
-#    - Question: "Ce projet améliore-t-il le bien-être collectif?"
-#    - Valorisation de l'eau: coût d'opportunité social (externalités incluses)
-#    - Transferts: neutres (pas de module tarification dans ce modèle)
-#    - Coûts: tous les coûts réels (peu importe qui paie)
-#
-# 2. ANALYSE FINANCIÈRE (budget municipal / cash flow)
-#    - Perspective: service d'eau municipal
-#    - Question: "Ce projet est-il viable pour le budget de la ville?"
-#    - Valorisation de l'eau: coût variable évité (chimie, énergie, pompage)
-#    - Bénéfices: économies d'eau × coût variable (pas de tarification volumétrique)
-#    - Coûts: seulement ceux supportés par la ville
-#
-# Références théoriques:
-# - Boardman et al. (2018) Cost-Benefit Analysis: Concepts and Practice
-# - Zerbe & Bellas (2006) A Primer for Benefit-Cost Analysis
-# - Treasury Board of Canada (2007) Canadian Cost-Benefit Analysis Guide
-#
-# =============================================================================
-
-class ModeCompte(Enum):
-    """
-    Mode de comptabilité pour l'analyse coûts-bénéfices.
-
-    ECONOMIQUE: Analyse de bien-être social (welfare economics)
-        - Utilise la valeur sociale de l'eau (coût d'opportunité + externalités)
-        - Tous les coûts sont comptés (peu importe qui paie)
-        - Répond à: "Ce projet améliore-t-il le bien-être collectif?"
-
-    FINANCIER: Analyse budgétaire municipale
-        - Utilise le coût variable évité (OPEX réel de la ville)
-        - Seuls les coûts supportés par la ville sont comptés
-        - Répond à: "Ce projet est-il viable financièrement pour la ville?"
-
-    Note: Ce modèle ne comprend pas de module tarification volumétrique.
-    Les bénéfices proviennent des économies d'eau (comportement + fuites).
-    """
-    ECONOMIQUE = "economique"
-    FINANCIER = "financier"
-
-
-@dataclass
-class ParametresValeurEau:
-    """
-    Paramètres de valorisation de l'eau selon la perspective d'analyse.
-
-    Cette structure permet de séparer clairement:
-    - Le COÛT COMPLET de fourniture (Full Financial Cost) pour l'analyse économique
-    - Le coût VARIABLE évité (pour l'analyse financière municipale)
-
-    La distinction est cruciale car:
-    - Coût complet >> coût variable (inclut OPEX fixe + CAPEX)
-    - Un projet peut être socialement rentable mais financièrement déficitaire
-      (justifiant une subvention publique)
-
-    Valeurs par défaut calibrées pour le Québec:
-    - Coût complet: 4.69 $/m³ (source: MAMH/SQEEP 2019-2025)
-    - Coût variable: 0.50 $/m³ (chimie, énergie, pompage - OPEX variable)
-
-    DÉCOMPOSITION DU COÛT COMPLET (v3.11 - corrigé janvier 2026):
-    ───────────────────────────────────────────────────────────────
-    Le coût de 4.69 $/m³ est le COÛT FINANCIER COMPLET de fourniture
-    du service d'eau (Full Financial Cost), PAS une "valeur sociale"
-    avec externalités environnementales.
-
-    Source: MAMH, Stratégie québécoise d'économie d'eau potable 2019-2025
-    https://www.quebec.ca/gouvernement/ministere/affaires-municipales/publications/strategie-economie-potable
-    "Le coût unitaire des services d'eau équivaut à 4,69 $/m³"
-    "Les besoins en investissements représentent 63% du coût total"
-
-    1. OPEX VARIABLE (0.50 $/m³) — 11% du coût total
-       - Chimie de traitement eau potable et eaux usées
-       - Énergie de pompage (distribution et collecte)
-       - Consommables et coûts variables d'exploitation
-       Source: MAMH rapports financiers municipaux
-
-    2. OPEX FIXE (1.24 $/m³) — 26% du coût total
-       - Salaires des employés (cols bleus, ingénieurs, admin)
-       - Chauffage/entretien des usines de traitement
-       - Analyses laboratoire, frais administratifs
-       - Maintenance courante (non capitalisable)
-       Note: Coûts engagés peu importe le volume produit
-
-    3. CAPEX / COÛTS EN CAPITAL (2.95 $/m³) — 63% du coût total
-       - Amortissement des actifs (usines, conduites, réservoirs)
-       - Service de la dette municipale (eau/égout)
-       - Déficit d'entretien accumulé (rattrapage infrastructures)
-       - Capacité évitée dans les agrandissements futurs
-       Source: MAMH "63% du coût total = besoins en investissements"
-
-    TOTAL: 0.50 + 1.24 + 2.95 = 4.69 $/m³
-
-    NOTE MÉTHODOLOGIQUE:
-    ────────────────────
-    Ce 4.69 $ n'inclut PAS d'externalités environnementales explicites.
-    C'est le coût comptable réel pour les municipalités. L'argument
-    économique est: "Chaque m³ économisé = 4.69 $ de coûts évités pour
-    la ville, libérant des fonds pour d'autres services publics."
-
-    Si vous souhaitez ajouter des externalités environnementales
-    (carbone, écosystèmes), utilisez VALEUR_EAU_RARETE qui inclut
-    une prime de rareté/environnement.
-    """
-    # === COÛT COMPLET DE FOURNITURE (Full Financial Cost) ===
-    # Voir décomposition MAMH/SQEEP ci-dessus
-
-    # Composante 1: OPEX Variable (11%)
-    cout_variable_m3: float = 0.50  # $/m³ — chimie, énergie, consommables
-
-    # Composante 2: OPEX Fixe (26%)
-    cout_opex_fixe_m3: float = 1.24  # $/m³ — salaires, admin, maintenance courante
-
-    # Composante 3: CAPEX / Coûts en capital (63%)
-    cout_capex_m3: float = 2.95  # $/m³ — amortissement, dette, déficit entretien
-
-    # Coût complet total (somme des composantes)
-    # Note: Peut être surchargée directement si on a une valeur calibrée différente
-    valeur_sociale_m3: float = 4.69  # $/m³ — OPEX var + OPEX fixe + CAPEX
-
-    # Prix indicatif hors modèle (non utilisé sans tarification volumétrique)
-    # Conservé pour compatibilité si une analyse tarifaire est ajoutée plus tard.
-    prix_vente_m3: float = 2.50
-
-    # === COÛT MARGINAL DES FONDS PUBLICS (MCF) ===
-    # Le MCF représente le coût social de lever 1$ de taxes pour financer
-    # une dépense publique. Il capture les distorsions économiques causées
-    # par la taxation (perte sèche, coûts administratifs, effets comportementaux).
-    #
-    # Sources:
-    # - Treasury Board of Canada (2007): MCF = 0.20 (recommandation officielle)
-    # - Dahlby (2008) "The Marginal Cost of Public Funds": 0.15-0.30 selon pays
-    # - Boardman et al. (2018): 0.20-0.25 pour le Canada
-    #
-    # Application: en mode ÉCONOMIQUE, les dépenses publiques sont multipliées
-    # par (1 + mcf) pour refléter le vrai coût social du financement public.
-    mcf: float = 0.20
-
-    # Activer/désactiver l'application du MCF
-    #
-    # NOTE MÉTHODOLOGIQUE — DÉSACTIVÉ PAR DÉFAUT POUR LE QUÉBEC
-    # ─────────────────────────────────────────────────────────────
-    # Le MCF n'est pas appliqué par défaut pour les raisons suivantes:
-    # 1. Pas de standard provincial établi pour les projets municipaux québécois
-    # 2. Le projet pourrait être autofinancé par les économies d'eau réalisées
-    #    et des arbitrages budgétaires internes, sans recours additionnel
-    #    à la taxation foncière
-    # 3. Simplifie l'interprétation des résultats pour les décideurs municipaux
-    #
-    # RECOMMANDATION: Pour une analyse de sensibilité rigoureuse, présenter
-    # les résultats AVEC et SANS MCF en parallèle. Utiliser:
-    #   - Scénario de base: appliquer_mcf=False
-    #   - Sensibilité: appliquer_mcf=True, mcf=0.20 (Treasury Board Canada)
-    # ─────────────────────────────────────────────────────────────
-    appliquer_mcf: bool = False
-
-    # Métadonnées
-    nom: str = "Valeurs par défaut Québec"
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider les paramètres."""
-        if self.valeur_sociale_m3 < 0:
-            raise ValueError("valeur_sociale_m3 doit être >= 0")
-        if self.cout_variable_m3 < 0:
-            raise ValueError("cout_variable_m3 doit être >= 0")
-        if self.cout_variable_m3 > self.valeur_sociale_m3:
-            # Warning: généralement le coût variable < valeur sociale
-            pass  # On laisse passer, l'utilisateur peut avoir ses raisons
-        if not 0 <= self.mcf <= 1.0:
-            raise ValueError("mcf doit être entre 0 et 1 (typiquement 0.15-0.30)")
-
-    def valeur_eau(self, mode: ModeCompte) -> float:
-        """Retourner la valeur de l'eau selon le mode d'analyse."""
-        if mode == ModeCompte.ECONOMIQUE:
-            return self.valeur_sociale_m3
-        else:
-            return self.cout_variable_m3
-
-    def facteur_mcf(self, mode: ModeCompte) -> float:
-        """
-        Retourner le facteur multiplicatif pour les dépenses publiques.
-
-        En mode ÉCONOMIQUE avec MCF activé: (1 + mcf)
-        Sinon: 1.0 (pas de majoration)
-        """
-        if mode == ModeCompte.ECONOMIQUE and self.appliquer_mcf:
-            return 1.0 + self.mcf
-        return 1.0
-
-    def ajuster_cout_public(self, cout: float, mode: ModeCompte) -> float:
-        """
-        Ajuster un coût public pour refléter le MCF.
-
-        Paramètres:
-            cout: Coût brut ($)
-            mode: Mode de comptabilité
-
-        Retourne:
-            Coût ajusté = cout × (1 + mcf) en mode économique, cout sinon
-        """
-        return cout * self.facteur_mcf(mode)
-
-    # === ALIAS DE RÉTROCOMPATIBILITÉ (v3.11) ===
-    # Ces propriétés permettent au code existant utilisant les anciens noms
-    # de continuer à fonctionner après la correction de nomenclature.
-
-    @property
-    def cout_infrastructure_m3(self) -> float:
-        """Alias rétrocompatible pour cout_capex_m3."""
-        return self.cout_capex_m3
-
-    @property
-    def valeur_externalites_m3(self) -> float:
-        """Alias rétrocompatible pour cout_opex_fixe_m3.
-
-        Note: L'ancien nom était incorrect - ce n'était pas des externalités
-        environnementales mais des coûts fixes opérationnels.
-        """
-        return self.cout_opex_fixe_m3
-
-
-# =============================================================================
-# PRESETS DE VALEURS D'EAU
-# =============================================================================
-
-# Valeurs par défaut (Québec, MAMH/SQEEP 2019-2025)
-VALEUR_EAU_QUEBEC = ParametresValeurEau(
-    # Décomposition du coût complet (voir documentation ParametresValeurEau)
-    # Source: MAMH "coût unitaire des services d'eau = 4,69 $/m³"
-    # Source: MAMH "63% du coût total = besoins en investissements (CAPEX)"
-    cout_variable_m3=0.50,       # OPEX variable (11%) — chimie, énergie
-    cout_opex_fixe_m3=1.24,      # OPEX fixe (26%) — salaires, admin
-    cout_capex_m3=2.95,          # CAPEX (63%) — amortissement, dette, déficit
-    valeur_sociale_m3=4.69,      # Total = 0.50 + 1.24 + 2.95
-    prix_vente_m3=2.50,          # Prix indicatif hors modèle
-    mcf=0.20,                    # MCF Canada (Treasury Board 2007)
-    appliquer_mcf=False,         # Désactivé par défaut
-    nom="Québec MAMH",
-    description="Coût complet MAMH/SQEEP 2019-2025 (4,69 $/m³)",
-)
-
-# Scénario conservateur (coût complet bas)
-VALEUR_EAU_CONSERVATEUR = ParametresValeurEau(
-    cout_variable_m3=0.25,       # OPEX variable bas
-    cout_opex_fixe_m3=0.75,      # OPEX fixe réduit
-    cout_capex_m3=1.50,          # CAPEX minimal
-    valeur_sociale_m3=2.50,      # Total = 0.25 + 0.75 + 1.50
-    prix_vente_m3=2.00,
-    mcf=0.20,
-    appliquer_mcf=False,
-    nom="Conservateur",
-    description="Hypothèses prudentes pour analyse de sensibilité",
-)
-
-# Scénario avec rareté (zones de stress hydrique)
-# Note: Ce scénario INCLUT une prime de rareté/externalité environnementale
-VALEUR_EAU_RARETE = ParametresValeurEau(
-    cout_variable_m3=1.50,       # OPEX variable élevé (pompage profond)
-    cout_opex_fixe_m3=1.50,      # OPEX fixe (traitement avancé)
-    cout_capex_m3=3.00,          # CAPEX (infrastructure coûteuse)
-    valeur_sociale_m3=8.00,      # Total inclut prime rareté +2.00 $/m³
-    prix_vente_m3=4.00,
-    mcf=0.25,                    # MCF plus élevé
-    appliquer_mcf=False,
-    nom="Rareté hydrique",
-    description="Zones de stress hydrique — inclut prime environnementale",
-)
-
-# Scénario sans MCF (rétrocompatibilité)
-VALEUR_EAU_SANS_MCF = ParametresValeurEau(
-    cout_variable_m3=0.50,
-    cout_opex_fixe_m3=1.24,
-    cout_capex_m3=2.95,
-    valeur_sociale_m3=4.69,
-    prix_vente_m3=2.50,
-    mcf=0.0,
-    appliquer_mcf=False,
-    nom="Sans MCF",
-    description="Identique à Québec MAMH (MCF=0)",
-)
-
-# Scénario Québec AVEC MCF (pour analyse de sensibilité)
-VALEUR_EAU_QUEBEC_AVEC_MCF = ParametresValeurEau(
-    cout_variable_m3=0.50,
-    cout_opex_fixe_m3=1.24,
-    cout_capex_m3=2.95,
-    valeur_sociale_m3=4.69,
-    prix_vente_m3=2.50,
-    mcf=0.20,                    # Treasury Board Canada (2007)
-    appliquer_mcf=True,
-    nom="Québec avec MCF",
-    description="Sensibilité: MCF=20% appliqué aux dépenses publiques",
-)
-
-# Dictionnaire des préréglages
-PREREGLAGES_VALEUR_EAU = {
-    "quebec": VALEUR_EAU_QUEBEC,
-    "quebec_mcf": VALEUR_EAU_QUEBEC_AVEC_MCF,
-    "conservateur": VALEUR_EAU_CONSERVATEUR,
-    "rarete": VALEUR_EAU_RARETE,
-    "sans_mcf": VALEUR_EAU_SANS_MCF,  # Rétrocompatibilité
-}
-
-# Alias rétrocompatible
-PRESETS_VALEUR_EAU = PREREGLAGES_VALEUR_EAU
-
-
-def afficher_prereglages_valeur_eau() -> None:
-    """Afficher un tableau des préréglages de valeur d'eau."""
-    print("\n" + "=" * 70)
-    print(" " * 12 + "PRÉRÉGLAGES DE VALORISATION DE L'EAU")
-    print("=" * 70)
-
-    print(f"\n{'Préréglage':<15} │ {'Val. sociale':<12} │ {'Coût var.':<10} │ {'Infra':<10} │ {'External.':<10}")
-    print("─" * 15 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10)
-
-    for nom, prereglage in PREREGLAGES_VALEUR_EAU.items():
-        print(f"{prereglage.nom:<15} │ {prereglage.valeur_sociale_m3:>10.2f} $ │ "
-              f"{prereglage.cout_variable_m3:>8.2f} $ │ {prereglage.cout_infrastructure_m3:>8.2f} $ │ "
-              f"{prereglage.valeur_externalites_m3:>8.2f} $")
-
-    print("=" * 70)
-    print("\nNote : Valeur sociale = coût variable + report infra + externalités")
-
-
-def afficher_presets_valeur_eau() -> None:
-    """Alias rétrocompatible: utiliser afficher_prereglages_valeur_eau()."""
-    afficher_prereglages_valeur_eau()
-
-
-# =============================================================================
-# ÉCONOMIES D'ÉCHELLE
-# =============================================================================
-
-@dataclass
-class ConfigEconomiesEchelle:
-    """
-    Configuration des économies d'échelle.
-
-    Basé sur la littérature et données empiriques:
-    - Winnipeg: 221,000 compteurs → ~$611/compteur
-    - Toronto: 465,000 compteurs → économies significatives
-    - Règle générale: 15-25% de réduction pour très grands volumes
-
-    Modèle: réduction par paliers ou continue (logarithmique)
-    """
-    activer: bool = False  # Interrupteur ON/OFF
-
-    # Intensité des économies d'échelle par composante (0 = aucune, 1 = pleine)
-    # Hypothèse conservatrice: la main-d'œuvre n'a pas (ou peu) d'économies d'échelle.
-    poids_compteur: float = 1.0
-    poids_reseau: float = 0.5
-    poids_installation: float = 0.0
-
-    # Paliers de réduction (nb_compteurs: facteur)
-    # facteur = 1.0 signifie pas de réduction
-    paliers: dict = field(default_factory=lambda: {
-        0:       1.00,   # < 10k: pas de réduction
-        10_000:  0.95,   # 10k-50k: -5%
-        50_000:  0.90,   # 50k-100k: -10%
-        100_000: 0.85,   # 100k-200k: -15%
-        200_000: 0.80,   # > 200k: -20%
-    })
-
-    # Alternative: modèle continu (logarithmique)
-    utiliser_modele_continu: bool = False
-    # Paramètres du modèle continu: facteur = 1 - elasticite * ln(nb/nb_ref)
-    elasticite_echelle: float = 0.05  # ~5% réduction par doublement
-    nb_reference: int = 10_000        # point de référence (facteur = 1.0)
-
-    def __post_init__(self):
-        """Valider les intensités d'échelle."""
-        for attr in ("poids_compteur", "poids_reseau", "poids_installation"):
-            valeur = getattr(self, attr)
-            if not 0.0 <= valeur <= 1.0:
-                raise ValueError(f"{attr} doit être entre 0 et 1")
-
-
-def calculer_facteur_echelle(
-    nb_compteurs: int,
-    config: ConfigEconomiesEchelle
-) -> float:
-    """
-    Calculer le facteur de réduction dû aux économies d'échelle.
-
-    Paramètres:
-        nb_compteurs: Nombre de compteurs à installer
-        config: Configuration des économies d'échelle
-
-    Retourne:
-        Facteur multiplicatif (ex: 0.85 = -15% de réduction)
-    """
-    if not config.activer:
-        return 1.0
-
-    if config.utiliser_modele_continu:
-        # Modèle logarithmique continu
-        if nb_compteurs <= 0:
-            return 1.0
-        import math
-        ratio = nb_compteurs / config.nb_reference
-        if ratio <= 1:
-            return 1.0
-        facteur = 1.0 - config.elasticite_echelle * math.log(ratio)
-        return max(0.70, min(1.0, facteur))  # Borner entre 0.70 et 1.0
-    else:
-        # Modèle par paliers
-        facteur = 1.0
-        for seuil, f in sorted(config.paliers.items()):
-            if nb_compteurs >= seuil:
-                facteur = f
-        return facteur
-
-
-def appliquer_facteur_echelle(facteur_base: float, poids: float) -> float:
-    """
-    Appliquer un facteur d'échelle partiel.
-
-    poids = 0.0 → aucune économie, poids = 1.0 → plein facteur.
-    """
-    poids_borne = max(0.0, min(1.0, poids))
-    return 1.0 - (1.0 - facteur_base) * poids_borne
-
-
-def afficher_table_economies_echelle(config: ConfigEconomiesEchelle = None) -> None:
-    """Afficher la table des économies d'échelle."""
-    if config is None:
-        config = ConfigEconomiesEchelle(activer=True)
-
-    print("\n" + "=" * 60)
-    print(" " * 15 + "ÉCONOMIES D'ÉCHELLE")
-    print("=" * 60)
-    print(f"  Activé: {'OUI' if config.activer else 'NON'}")
-    print(f"  Modèle: {'Continu (log)' if config.utiliser_modele_continu else 'Par paliers'}")
-    print(f"  Intensité: compteur={config.poids_compteur:.2f}, réseau={config.poids_reseau:.2f}, installation={config.poids_installation:.2f}")
-    print()
-
-    if not config.utiliser_modele_continu:
-        print("  Paliers de réduction:")
-        print("  " + "-" * 40)
-        paliers_tries = sorted(config.paliers.items())
-        for i, (seuil, facteur) in enumerate(paliers_tries):
-            if i < len(paliers_tries) - 1:
-                seuil_suivant = paliers_tries[i + 1][0]
-                print(f"    {seuil:>7,} - {seuil_suivant-1:>7,} compteurs: {(1-facteur)*100:>5.1f}% réduction")
-            else:
-                print(f"    {seuil:>7,}+ compteurs:          {(1-facteur)*100:>5.1f}% réduction")
-
-    print()
-    print("  Exemples de coûts (base 675$/compteur):")
-    print("  " + "-" * 40)
-    for n in [10_000, 50_000, 100_000, 119_000, 200_000, 250_000]:
-        facteur = calculer_facteur_echelle(n, config)
-        cout_ajuste = 675 * facteur
-        reduction = (1 - facteur) * 100
-        print(f"    {n:>7,} compteurs: {cout_ajuste:>6.0f}$ ({reduction:>5.1f}% réduction)")
-    print("=" * 60 + "\n")
-
-
-def _configs_echelle_comparaison(
-    config_echelle: Optional[ConfigEconomiesEchelle],
-) -> list[tuple[str, ConfigEconomiesEchelle]]:
-    """
-    Construire les scénarios d'échelle pour les comparaisons.
-
-    Si config_echelle est fourni, retourne uniquement ce scénario.
-    Sinon, retourne deux scénarios: sans échelle et échelle activée.
-    """
-    if config_echelle is not None:
-        label = "Échelle activée" if config_echelle.activer else "Sans échelle"
-        return [(label, config_echelle)]
-
-    return [
-        ("Sans échelle", ConfigEconomiesEchelle(activer=False)),
-        ("Échelle activée", ConfigEconomiesEchelle(activer=True)),
-    ]
-
-
-# =============================================================================
-# VENTILATION OPEX AMI (COÛTS NON TECHNIQUES)
-# =============================================================================
-#
-# Les compteurs AMI génèrent des coûts d'exploitation au-delà de la maintenance
-# matérielle. Cette ventilation détaille les composantes OPEX typiques.
-#
-# Sources:
-# - AWWA (2019) Smart Water Metering Implementation Guidelines
-# - UK Water Industry Research (2020) AMI Operational Costs Study
-# - Itron (2022) Total Cost of Ownership Analysis
-#
-# =============================================================================
-
-@dataclass
-class VentilationOPEX:
-    """
-    Ventilation détaillée des coûts d'exploitation AMI.
-
-    Les pourcentages représentent la répartition du coût OPEX total
-    entre les différentes composantes non techniques.
-
-    Valeurs par défaut basées sur benchmarks industrie (2023):
-    - Cybersécurité: 15% (audits, patches, monitoring SOC)
-    - Licences logiciels: 20% (MDMS, analytics, portail client)
-    - Stockage données: 10% (cloud/on-premise, rétention 5-10 ans)
-    - Service client: 25% (support hotline, gestion alertes, réclamations)
-    - Intégration SI: 30% (interfaces ERP/SIG/CRM, maintenance API)
-    """
-    # Composantes en % du coût OPEX total
-    cybersecurite_pct: float = 0.15
-    licences_logiciels_pct: float = 0.20
-    stockage_donnees_pct: float = 0.10
-    service_client_pct: float = 0.25
-    integration_si_pct: float = 0.30
-
-    # Métadonnées
-    nom: str = "Ventilation OPEX par défaut"
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider que les pourcentages somment à 100%."""
-        total = (
-            self.cybersecurite_pct
-            + self.licences_logiciels_pct
-            + self.stockage_donnees_pct
-            + self.service_client_pct
-            + self.integration_si_pct
-        )
-        if abs(total - 1.0) > 0.001:
-            raise ValueError(
-                f"Les pourcentages doivent sommer à 100%, obtenu {total*100:.1f}%"
-            )
-
-    def ventiler(self, cout_opex_total: float) -> dict:
-        """
-        Ventiler un coût OPEX total entre les composantes.
-
-        Paramètres:
-            cout_opex_total: Coût OPEX annuel total ($)
-
-        Retourne:
-            Dictionnaire avec le détail par composante
-        """
-        return {
-            "cybersecurite": cout_opex_total * self.cybersecurite_pct,
-            "licences_logiciels": cout_opex_total * self.licences_logiciels_pct,
-            "stockage_donnees": cout_opex_total * self.stockage_donnees_pct,
-            "service_client": cout_opex_total * self.service_client_pct,
-            "integration_si": cout_opex_total * self.integration_si_pct,
-            "total": cout_opex_total,
-        }
-
-    def to_dataframe(self, cout_opex_total: float) -> pd.DataFrame:
-        """Retourner la ventilation sous forme de DataFrame."""
-        ventilation = self.ventiler(cout_opex_total)
-        del ventilation["total"]
-        df = pd.DataFrame([
-            {"Composante": k.replace("_", " ").title(), "Coût ($)": v, "Part (%)": v/cout_opex_total*100}
-            for k, v in ventilation.items()
-        ])
-        return df
-
-
-# Préréglages de ventilation OPEX
-VENTILATION_OPEX_STANDARD = VentilationOPEX(
-    nom="Standard",
-    description="Répartition typique basée sur benchmarks industrie",
-)
-
-VENTILATION_OPEX_SECURITE_ELEVEE = VentilationOPEX(
-    cybersecurite_pct=0.25,
-    licences_logiciels_pct=0.20,
-    stockage_donnees_pct=0.10,
-    service_client_pct=0.20,
-    integration_si_pct=0.25,
-    nom="Sécurité élevée",
-    description="Infrastructure critique, exigences cybersécurité renforcées",
-)
-
-VENTILATION_OPEX_CLOUD = VentilationOPEX(
-    cybersecurite_pct=0.12,
-    licences_logiciels_pct=0.25,
-    stockage_donnees_pct=0.18,
-    service_client_pct=0.20,
-    integration_si_pct=0.25,
-    nom="Cloud-native",
-    description="Infrastructure cloud (SaaS), coûts stockage plus élevés",
-)
-
-PREREGLAGES_VENTILATION_OPEX = {
-    "standard": VENTILATION_OPEX_STANDARD,
-    "securite_elevee": VENTILATION_OPEX_SECURITE_ELEVEE,
-    "cloud": VENTILATION_OPEX_CLOUD,
-}
-
-
-def afficher_ventilation_opex(
-    cout_opex_annuel: float,
-    nb_compteurs: int = 1,
-    ventilation: VentilationOPEX = None
-) -> None:
-    """
-    Afficher la ventilation OPEX détaillée.
-
-    Paramètres:
-        cout_opex_annuel: Coût OPEX par compteur par an ($)
-        nb_compteurs: Nombre de compteurs (pour afficher le total)
-        ventilation: Configuration de ventilation (défaut: standard)
-    """
-    if ventilation is None:
-        ventilation = VENTILATION_OPEX_STANDARD
-
-    cout_total = cout_opex_annuel * nb_compteurs
-
-    print("\n" + "=" * 65)
-    print(" " * 15 + "VENTILATION OPEX AMI (COÛTS NON TECHNIQUES)")
-    print("=" * 65)
-    print(f"  Configuration: {ventilation.nom}")
-    print(f"  OPEX unitaire: {cout_opex_annuel:.2f} $/compteur/an")
-    print(f"  Nombre de compteurs: {nb_compteurs:,}")
-    print(f"  OPEX total annuel: {cout_total:,.0f} $")
-    print()
-
-    print(f"  {'Composante':<25} │ {'Part':<8} │ {'Unitaire':<12} │ {'Total':<12}")
-    print("  " + "─" * 25 + "─┼─" + "─" * 8 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12)
-
-    details = ventilation.ventiler(cout_opex_annuel)
-    for composante, pct in [
-        ("Cybersécurité", ventilation.cybersecurite_pct),
-        ("Licences logiciels", ventilation.licences_logiciels_pct),
-        ("Stockage données", ventilation.stockage_donnees_pct),
-        ("Service client", ventilation.service_client_pct),
-        ("Intégration SI", ventilation.integration_si_pct),
-    ]:
-        cout_unit = cout_opex_annuel * pct
-        cout_tot = cout_unit * nb_compteurs
-        print(f"  {composante:<25} │ {pct*100:>6.1f}% │ {cout_unit:>10.2f} $ │ {cout_tot:>10,.0f} $")
-
-    print("  " + "─" * 25 + "─┼─" + "─" * 8 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12)
-    print(f"  {'TOTAL':<25} │ {'100.0%':>7} │ {cout_opex_annuel:>10.2f} $ │ {cout_total:>10,.0f} $")
-    print("=" * 65 + "\n")
-
-
-# =============================================================================
-# PARAMÈTRES DU MODÈLE
-# =============================================================================
-
-@dataclass
-class ParametresCompteur:
-    """
-    Paramètres spécifiques au type de compteur.
-
-    Coûts typiques (2024 CAD):
-    - Compteur mécanique simple: $50-100
-    - Compteur AMR (avec transmetteur): $150-250
-    - Compteur AMI (intelligent): $200-350
-    - Installation plombier: 1-3h × $100-150/h
-    """
-    type_compteur: TypeCompteur = TypeCompteur.AMI
-
-    # Coût du compteur lui-même ($)
-    cout_compteur: float = 250.0
-
-    # Installation
-    heures_installation: float = 1.5      # heures par compteur
-    taux_horaire_installation: float = 125.0  # $/h (plombier)
-
-    # Infrastructure réseau (AMI seulement)
-    # Modèle: CAPEX_reseau = cout_infra_fixe + cout_reseau_par_compteur × nb_compteurs
-    cout_infra_fixe: float = 0.0           # Coût fixe (backbone IT, intégration) - défaut 0 pour rétrocompat
-    cout_reseau_par_compteur: float = 50.0  # Coût variable (passerelles, antennes, etc.)
-
-    # Durée de vie
-    duree_vie_compteur: int = 20          # années
-    duree_vie_batterie: int = 15          # années (AMI/AMR)
-    cout_remplacement_batterie: float = 30.0
-
-    # Coûts d'exploitation annuels par compteur
-    cout_lecture_manuel: float = 25.0     # $/compteur/an (lecture manuelle)
-    cout_maintenance_ami: float = 5.0     # $/compteur/an (maintenance terrain)
-    cout_maintenance_amr: float = 8.0     # $/compteur/an
-    cout_maintenance_manuel: float = 3.0  # $/compteur/an
-
-    # OPEX AMI non technique (cyber, logiciels, stockage, télécom, etc.)
-    # ─────────────────────────────────────────────────────────────────
-    # Ventilation typique pour 15$/compteur/an:
-    #   - Télécom/données cellulaires: ~5$/an
-    #   - Cybersécurité (Loi 25 QC): ~3$/an
-    #   - Licences MDMS/analytics: ~4$/an
-    #   - Stockage cloud/backup: ~2$/an
-    #   - Support client/portail: ~1$/an
-    #
-    # Fourchettes observées: 10$ (bas) — 15$ (médian) — 25$ (haut/Loi 25)
-    # Source: Winnipeg AMI business case, AWWA M6, estimations fournisseurs
-    # ─────────────────────────────────────────────────────────────────
-    cout_opex_non_tech_ami: float = 15.0  # $/compteur/an (défaut réaliste)
-    ventilation_opex_ami: VentilationOPEX = field(
-        default_factory=lambda: VENTILATION_OPEX_STANDARD
-    )
-
-    # Frais de lecture AMR (tournées en véhicule)
-    cout_lecture_amr: float = 8.0         # $/compteur/an
-
-    # === FACTEURS D'EFFICACITÉ PAR TYPE DE COMPTEUR (NOUVEAU v3.8) ===
-    # Multiplicateurs relatifs à l'AMI (référence = 1.0)
-    # Sources: Davies 2014, Beal 2011, Britton 2013, Winnipeg 2023
-    #
-    # Justification empirique:
-    # - AMI: Feedback temps réel + portail client + alertes → effet maximal
-    # - AMR: Lecture mensuelle, feedback amélioré vs manuel
-    # - Manuel: Lecture annuelle, feedback retardé, détection fuites lente
-    #
-    # Réduction comportementale typique: Manuel 4-6%, AMR 6-8%, AMI 8-12%
-    # Détection fuites typique: Manuel 60-70%, AMR 75-80%, AMI 85-95%
-    facteur_efficacite_comportement: float = 1.0  # Multiplicateur réduction comportementale
-    facteur_efficacite_fuites: float = 1.0        # Multiplicateur détection fuites
-
-    def __post_init__(self):
-        """Appliquer les facteurs d'efficacité par défaut selon le type de compteur.
-
-        Justification des facteurs (janvier 2026):
-        ------------------------------------------
-
-        AMI (référence = 1.0):
-        - Détection fuites en temps réel (horaire), alertes proactives aux clients
-        - EBMUD California: -20% consommation avec AMI (Water Online, 2024)
-        - AWE Study: fuites résolues 116h plus tôt avec alertes AMI
-        - American Water pilot: non-revenue water 25% → 12%
-
-        AMR (facteurs réduits vs estimations initiales):
-        - Lecture mensuelle/trimestrielle, PAS de détection temps réel
-        - Une fuite peut couler 30+ jours avant détection vs ~1 jour AMI
-        - Pas d'alertes proactives aux clients → moins de changement comportemental
-        - Sources:
-          * Badger Meter: "AMR systems aren't able to fully eliminate leaks"
-          * EPA WaterSense: AMI "quickly identify leaks" vs AMR periodic reads
-          * Texas Water Utilities: NRW 92%→38% seulement possible avec AMI
-
-        Manuel (facteurs les plus bas):
-        - Lecture annuelle/semestrielle, aucune détection proactive
-        - Client découvre fuite seulement via facture élevée (délai 3-6 mois)
-        - Aucun feedback comportemental entre les lectures
-        """
-        # Ne pas écraser si des valeurs personnalisées ont été fournies
-        if self.facteur_efficacite_comportement == 1.0 and self.facteur_efficacite_fuites == 1.0:
-            if self.type_compteur == TypeCompteur.MANUEL:
-                # Manuel: lecture annuelle, détection très tardive des fuites
-                # Comportement: 40% de l'effet AMI (pas de feedback régulier)
-                # Fuites: 30% de l'effet AMI (délai détection 3-6 mois vs 1 jour)
-                self.facteur_efficacite_comportement = 0.40
-                self.facteur_efficacite_fuites = 0.30
-            elif self.type_compteur == TypeCompteur.AMR:
-                # AMR: lecture mensuelle, pas d'alertes temps réel
-                # Comportement: 60% de l'effet AMI (feedback mensuel vs continu)
-                # Fuites: 50% de l'effet AMI (délai détection ~30j vs 1j)
-                # Ratio basé sur: délai détection AMR/AMI ≈ 30j/1j, mais certaines
-                # fuites grosses détectées quand même → facteur 0.50 pas 0.03
-                self.facteur_efficacite_comportement = 0.60
-                self.facteur_efficacite_fuites = 0.50
-            # AMI: facteurs = 1.0 (référence, détection temps réel)
-        if self.cout_opex_non_tech_ami < 0:
-            raise ValueError("cout_opex_non_tech_ami doit être >= 0")
-
-    @property
-    def cout_installation(self) -> float:
-        """Coût d'installation par compteur."""
-        return self.heures_installation * self.taux_horaire_installation
-
-    @property
-    def cout_initial_par_compteur(self) -> float:
-        """Coût initial total par compteur (équipement + installation)."""
-        base = self.cout_compteur + self.cout_installation
-        if self.type_compteur == TypeCompteur.AMI:
-            base += self.cout_reseau_par_compteur
-        return base
-
-    @property
-    def cout_exploitation_annuel(self) -> float:
-        """Coût d'exploitation annuel par compteur."""
-        if self.type_compteur == TypeCompteur.AMI:
-            return self.cout_maintenance_ami + self.cout_opex_non_tech_ami
-        elif self.type_compteur == TypeCompteur.AMR:
-            return self.cout_maintenance_amr + self.cout_lecture_amr
-        else:  # MANUEL
-            return self.cout_maintenance_manuel + self.cout_lecture_manuel
-
-    def opex_ami_non_tech_detail(self) -> dict:
-        """Détail de l'OPEX AMI non technique selon la ventilation."""
-        return self.ventilation_opex_ami.ventiler(self.cout_opex_non_tech_ami)
-
-
-@dataclass
-class ParametresModele:
-    """
-    Paramètres principaux du modèle coûts-bénéfices.
-
-    Valeurs par défaut basées sur:
-    - Données Québec/Canada
-    - Étude Winnipeg (2023)
-    - Littérature scientifique
-    """
-    # Population et ménages
-    nb_menages: int = 10_000
-    nb_compteurs: Optional[int] = None  # Nombre de compteurs (si différent des ménages)
-    taille_menage: float = 2.1            # personnes/ménage
-
-    # Consommation d'eau
-    lpcd: float = 250.0                   # litres/personne/jour (moyenne résidentielle Québec, MAMH 2023)
-
-    # Paramètres de fuite
-    part_menages_fuite_pct: float = 20.0  # % ménages avec fuite détectée
-    debit_fuite_m3_an: float = 35.0       # m³/an si fuite
-    taux_correction_fuite_pct: float = 85.0  # % fuites corrigées
-
-    # Changement comportemental
-    reduction_comportement_pct: float = 8.0  # % réduction usage base
-
-    # Valeur économique de l'eau
-    valeur_eau_m3: float = 4.69           # $/m³ (coût social/long terme)
-
-    # Report d'infrastructure (optionnel)
-    benefice_report_infra_annuel: float = 0.0  # $/an (défaut = non utilisé)
-    benefice_report_infra_par_m3: float = 0.0  # $/m³ économisé (lié aux économies)
-
-    # Paramètres financiers
-    # Taux d'actualisation: 3% réel (cohérent avec projets infrastructure long terme Québec)
-    # Sources: Guide d'analyse avantages-coûts MAMH; pratique courante projets municipaux
-    taux_actualisation_pct: float = 3.0   # % (taux social réel)
-    horizon_analyse: int = 20             # années
-    part_ville_capex_pct: float = 100.0   # % du CAPEX payé par la ville (mode financier)
-    part_ville_opex_pct: float = 100.0    # % de l'OPEX payé par la ville (mode financier)
-
-    def __post_init__(self):
-        """Valider les paramètres financiers."""
-        if self.nb_compteurs is not None and self.nb_compteurs <= 0:
-            raise ValueError("nb_compteurs doit être > 0 si fourni")
-        if self.benefice_report_infra_annuel < 0:
-            raise ValueError("benefice_report_infra_annuel doit être >= 0")
-        if self.benefice_report_infra_par_m3 < 0:
-            raise ValueError("benefice_report_infra_par_m3 doit être >= 0")
-        if not 0 <= self.part_ville_capex_pct <= 100:
-            raise ValueError("part_ville_capex_pct doit être entre 0 et 100")
-        if not 0 <= self.part_ville_opex_pct <= 100:
-            raise ValueError("part_ville_opex_pct doit être entre 0 et 100")
-
-    @property
-    def nb_personnes(self) -> int:
-        """Population totale."""
-        return int(self.nb_menages * self.taille_menage)
-
-    @property
-    def nb_compteurs_effectif(self) -> int:
-        """Nombre effectif de compteurs (défaut = nb_menages)."""
-        if self.nb_compteurs is None:
-            return self.nb_menages
-        return int(self.nb_compteurs)
-
-    def to_dict(self) -> dict:
-        """Convertir en dictionnaire."""
-        return {
-            'nb_menages': self.nb_menages,
-            'nb_compteurs': self.nb_compteurs,
-            'taille_menage': self.taille_menage,
-            'lpcd': self.lpcd,
-            'part_menages_fuite_pct': self.part_menages_fuite_pct,
-            'debit_fuite_m3_an': self.debit_fuite_m3_an,
-            'taux_correction_fuite_pct': self.taux_correction_fuite_pct,
-            'reduction_comportement_pct': self.reduction_comportement_pct,
-            'valeur_eau_m3': self.valeur_eau_m3,
-            'benefice_report_infra_annuel': self.benefice_report_infra_annuel,
-            'benefice_report_infra_par_m3': self.benefice_report_infra_par_m3,
-            'taux_actualisation_pct': self.taux_actualisation_pct,
-            'horizon_analyse': self.horizon_analyse,
-            'part_ville_capex_pct': self.part_ville_capex_pct,
-            'part_ville_opex_pct': self.part_ville_opex_pct,
-        }
-
-
-@dataclass
-class ConfigAnalyse:
-    """Configuration des analyses et visualisations."""
-    delta_sensibilite: float = 10.0       # ±% pour sensibilité
-
-    # Graphiques à afficher
-    afficher_cadre_quebec: bool = True
-    afficher_cascade: bool = True
-    afficher_tornade: bool = True
-    afficher_araignee: bool = True
-    afficher_elasticite: bool = True
-    afficher_van_cumulative: bool = True
-    afficher_comparaison_types: bool = True
-    afficher_scenarios: bool = True
-
-
-# =============================================================================
-# VALEURS PAR DÉFAUT RÉGIONALES
-# =============================================================================
-
-# Longueuil (basé sur SQEEP 2023 - Données Québec)
-# Source: https://www.donneesquebec.ca/recherche/dataset/sqeep-2019-2025
-DEFAUTS_LONGUEUIL = ParametresModele(
-    nb_menages=116_258,   # SQEEP 2023: nb_resid_desservi exact
-    taille_menage=2.18,   # SQEEP 2023: 253,629 pop / 116,258 ménages
-    lpcd=236.0,           # SQEEP 2023: consommation résidentielle Longueuil
-)
-
-# Ordres de grandeur Québec (repères pour cadrer les scénarios)
-ORDRES_GRANDEUR_QUEBEC = {
-    "residentiel_lpcd": 245.0,        # L/p/j résidentiel moyen (Québec)
-    "total_distribue_lpcd": 467.0,    # L/p/j tous usages distribués
-    "cible_provinciale_lpcd": 458.0,  # L/p/j cible provinciale
-    "longueuil_residentiel_lpcd": 236.0,  # Longueuil résidentiel (SQEEP 2023)
-    "longueuil_tous_usages_lpcd": 567.0,  # Longueuil tous usages (sources internes 2024)
-    "longueuil_cible_lpcd": 184.0,        # Objectif Longueuil (sources internes)
-}
-
-
-def afficher_ordres_grandeur_quebec() -> None:
-    """Afficher un encadré des ordres de grandeur Québec pour cadrer LPCD."""
-    print("\n" + "=" * 80)
-    print(" " * 18 + "ORDRES DE GRANDEUR QUÉBEC (EAU POTABLE)")
-    print("=" * 80)
-
-    q = ORDRES_GRANDEUR_QUEBEC
-    print(f"  Résidentiel moyen Québec: {q['residentiel_lpcd']:.0f} L/p/j")
-    print(f"  Total distribué (tous usages): {q['total_distribue_lpcd']:.0f} L/p/j")
-    print(f"  Cible provinciale:        {q['cible_provinciale_lpcd']:.0f} L/p/j")
-    print(f"  Longueuil résidentiel:    {q['longueuil_residentiel_lpcd']:.0f} L/p/j")
-    print(f"  Longueuil tous usages:    {q['longueuil_tous_usages_lpcd']:.0f} L/p/j")
-    print(f"  Objectif Longueuil:       {q['longueuil_cible_lpcd']:.0f} L/p/j")
-
-    print("\n  Justification des scénarios:")
-    print("  - LPCD par défaut = 250 L/p/j (cohérent avec résidentiel Québec)")
-    print("  - Scénarios bas/haut cadrés par 180–350 L/p/j (Monte Carlo/sensibilités)")
-    print("=" * 80)
-
-# Preset pour scénario forte consommation (Montréal, villes non comptées)
-LPCD_MONTREAL_HAUT = 332.0  # Source: documents municipaux Montréal
-
-COMPTEUR_LONGUEUIL_AMI = ParametresCompteur(
-    type_compteur=TypeCompteur.AMI,
-    cout_compteur=250.0,
-    heures_installation=3.0,  # "minimalement 3h" selon courriel
-    taux_horaire_installation=125.0,
-    cout_reseau_par_compteur=50.0,
-)
-
-# Winnipeg (référence)
-DEFAUTS_WINNIPEG = ParametresModele(
-    nb_menages=221_000,
-    taille_menage=2.3,
-)
-
-COMPTEUR_WINNIPEG = ParametresCompteur(
-    type_compteur=TypeCompteur.AMI,
-    cout_compteur=350.0,
-    heures_installation=1.0,
-    taux_horaire_installation=100.0,
-    cout_reseau_par_compteur=161.0,  # $135M / 221k = ~$611 total
-)
-
-# ─────────────────────────────────────────────────────────────────────────────
-# SCÉNARIOS OPEX AMI (sensibilité)
-# ─────────────────────────────────────────────────────────────────────────────
-# Ces scénarios permettent de tester la sensibilité aux coûts d'exploitation
-# non-techniques (télécom, cyber, licences, stockage, support).
-#
-# OPEX total AMI = cout_maintenance_ami (5$) + cout_opex_non_tech_ami
-# ─────────────────────────────────────────────────────────────────────────────
-
-# Scénario OPEX bas: infrastructure mutualisée, contrats avantageux
-COMPTEUR_AMI_OPEX_BAS = ParametresCompteur(
-    type_compteur=TypeCompteur.AMI,
-    cout_compteur=250.0,
-    heures_installation=3.0,
-    taux_horaire_installation=125.0,
-    cout_reseau_par_compteur=50.0,
-    cout_opex_non_tech_ami=10.0,  # OPEX total: 15$/an
-)
-
-# Scénario OPEX médian: défaut réaliste (identique à COMPTEUR_LONGUEUIL_AMI)
-# cout_opex_non_tech_ami = 15.0 par défaut → OPEX total: 20$/an
-
-# Scénario OPEX haut: exigences Loi 25, cybersécurité renforcée, premium cloud
-COMPTEUR_AMI_OPEX_HAUT = ParametresCompteur(
-    type_compteur=TypeCompteur.AMI,
-    cout_compteur=250.0,
-    heures_installation=3.0,
-    taux_horaire_installation=125.0,
-    cout_reseau_par_compteur=50.0,
-    cout_opex_non_tech_ami=35.0,  # OPEX total: 40$/an
-)
-
-SCENARIOS_OPEX_AMI = {
-    "bas": COMPTEUR_AMI_OPEX_BAS,       # 15$/compteur/an
-    "median": COMPTEUR_LONGUEUIL_AMI,   # 20$/compteur/an (défaut)
-    "haut": COMPTEUR_AMI_OPEX_HAUT,     # 40$/compteur/an
-}
-
-
-# =============================================================================
-# RÉSULTATS DU MODÈLE
-# =============================================================================
-
-@dataclass
-class ResultatsModele:
-    """Résultats complets de l'analyse coûts-bénéfices."""
-    # Références
-    params: ParametresModele
-    compteur: ParametresCompteur
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE
-
-    # Économies d'eau (par ménage, m³/an — année 1)
-    usage_base_menage: float = 0.0
-    economie_fuite_menage: float = 0.0
-    economie_comportement_menage: float = 0.0
-    economie_reseau_menage: float = 0.0
-    economie_totale_menage: float = 0.0  # Année 1 seulement
-
-    # Économies d'eau totales sur l'horizon (m³)
-    economies_totales_horizon_m3: float = 0.0  # Somme sur T années, tous ménages
-
-    # Flux annuels totaux ($)
-    investissement_initial: float = 0.0
-    benefices_eau_annuels: float = 0.0
-    benefice_infra_annuel: float = 0.0
-    benefices_totaux_annuels: float = 0.0
-    couts_exploitation_annuels: float = 0.0
-
-    # Valeurs actualisées ($)
-    va_benefices: float = 0.0
-    va_benefices_eau: float = 0.0            # Valeur actualisée des économies d'eau (m³ × valeur)
-    va_benefices_report_infra: float = 0.0   # Valeur actualisée du report d'infra (paramètres dédiés)
-    va_benefices_cout_variable: float = 0.0  # Composante coût variable évité
-    va_benefices_infra_m3: float = 0.0       # Composante infrastructure (valeur sociale par m³)
-    va_benefices_externalites: float = 0.0   # Composante externalités (valeur sociale par m³)
-    va_couts_exploitation: float = 0.0
-    va_couts_totaux: float = 0.0
-    van: float = 0.0
-
-    # Métriques
-    rbc: float = 0.0                      # Ratio Bénéfices-Coûts
-    eac_menage: float = 0.0               # Équivalent Annuel Coût/ménage
-    lcsw: float = 0.0                     # Coût nivelé eau économisée
-    seuil_rentabilite_m3: float = 0.0     # q* en m³/an
-
-    # Séries temporelles
-    annees: np.ndarray = field(default_factory=lambda: np.array([]))
-    van_cumulative: np.ndarray = field(default_factory=lambda: np.array([]))
-
-    # Période de récupération
-    periode_recuperation: float = float('inf')
-
-    # Économies d'échelle
-    economies_echelle_actives: bool = False
-    facteur_echelle: float = 1.0
-    facteur_echelle_compteur: float = 1.0
-    facteur_echelle_installation: float = 1.0
-    facteur_echelle_reseau: float = 1.0
-    cout_par_compteur_base: float = 0.0      # Avant économies d'échelle
-    cout_par_compteur_ajuste: float = 0.0    # Après économies d'échelle
-    economies_realisees: float = 0.0         # $ économisés grâce à l'échelle
-
-
-# =============================================================================
-# DÉCOMPOSITION PAR PAYEUR (v3.9)
-# =============================================================================
-
-@dataclass
-class ResultatsParPayeur:
-    """
-    Décomposition de la VAN par payeur: société, ville, ménages.
-
-    Cette structure permet de comprendre qui bénéficie (ou paie) le projet:
-    - VAN économique: bien-être social total (externalités incluses)
-    - VAN ville: perspective budget municipal (coûts/bénéfices ville)
-    - VAN ménages: perspective citoyens (coûts réparations, bénéfices directs non tarifaires)
-
-    Note: VAN_eco ≠ VAN_ville + VAN_menages car:
-    - VAN_eco inclut les externalités (environnement, infrastructure reportée)
-    - VAN_eco valorise l'eau à sa valeur sociale (4.69$/m³)
-    - VAN_ville et VAN_menages utilisent des valeurs financières différentes
-    """
-    # VAN globale économique (bien-être social)
-    van_economique: float = 0.0
-
-    # VAN ville (budget municipal)
-    # Inclut: CAPEX ville, OPEX ville, économies coût variable, coûts réparation ville
-    van_ville: float = 0.0
-    va_couts_ville: float = 0.0       # CAPEX + OPEX supportés par la ville
-    va_benefices_ville: float = 0.0   # Économies coût variable × m³ économisés
-
-    # VAN ménages (perspective citoyens)
-    # Inclut: CAPEX ménages, coûts réparation ménages, valeur économies (si tarif volumétrique)
-    van_menages: float = 0.0
-    va_couts_menages: float = 0.0     # CAPEX ménages + réparations
-    va_benefices_menages: float = 0.0 # Bénéfices directs (tarification hors périmètre)
-
-    # Externalités (incluses dans VAN_eco mais pas dans VAN_ville ni VAN_menages)
-    va_externalites: float = 0.0      # Environnement + infrastructure reportée
-
-    # Décomposition des bénéfices d'eau (VA, info)
-    va_benefices_cout_variable: float = 0.0
-    va_benefices_infra_m3: float = 0.0
-    va_benefices_externalites: float = 0.0
-    va_benefices_report_infra: float = 0.0
-
-    # Métadonnées
-    params: Optional[ParametresModele] = None
-
-
-def decomposer_par_payeur(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-    params_adoption: Optional[ParametresAdoption] = None,
-) -> ResultatsParPayeur:
-    """
-    Calculer la VAN décomposée par payeur: société, ville, ménages.
-
-    Cette fonction exécute le modèle deux fois (économique + financier) et
-    calcule la part de chaque acteur.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration persistance
-        params_fuites: Configuration fuites
-        valeur_eau: Paramètres valeur eau
-        params_adoption: Stratégie d'adoption
-
-    Retourne:
-        ResultatsParPayeur avec la décomposition complète
-    """
-    if valeur_eau is None:
-        valeur_eau = VALEUR_EAU_QUEBEC
-    if params_fuites is None:
-        params_fuites = FUITES_CONTEXTE_QUEBEC
-
-    # 1. Exécuter en mode ÉCONOMIQUE (bien-être social)
-    res_eco = executer_modele(
-        params, compteur, config_echelle, persistance, params_fuites,
-        mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=valeur_eau,
-        params_adoption=params_adoption,
-    )
-
-    # 2. Exécuter en mode FINANCIER (perspective ville)
-    res_fin = executer_modele(
-        params, compteur, config_echelle, persistance, params_fuites,
-        mode_compte=ModeCompte.FINANCIER, valeur_eau=valeur_eau,
-        params_adoption=params_adoption,
-    )
-
-    # 3. Calculer les composantes
-    part_ville_capex = params.part_ville_capex_pct / 100.0
-    part_ville_opex = params.part_ville_opex_pct / 100.0
-
-    # Coûts ville = (CAPEX × part_ville) + (OPEX × part_ville)
-    va_capex_ville = res_eco.investissement_initial * part_ville_capex
-    va_opex_ville = res_eco.va_couts_exploitation * part_ville_opex
-    va_couts_ville = va_capex_ville + va_opex_ville
-
-    # Coûts ménages = (CAPEX × part_menages) + réparations ménages
-    va_capex_menages = res_eco.investissement_initial * (1 - part_ville_capex)
-    va_opex_menages = res_eco.va_couts_exploitation * (1 - part_ville_opex)
-    # Les coûts de réparation des ménages sont inclus dans va_opex si applicable
-    va_couts_menages = va_capex_menages + va_opex_menages
-
-    # Bénéfices ville = économies coût variable (VA, cohérent avec trajectoires)
-    va_benefices_ville = res_eco.va_benefices_cout_variable
-
-    # Bénéfices ménages = gains monétaires directs (tarification hors périmètre)
-    # Au Québec sans tarification volumétrique, les ménages ne bénéficient pas directement.
-    # Réservé à un module futur si la tarification résidentielle est ajoutée.
-    va_benefices_menages = 0.0  # Pas de tarification volumétrique au Québec
-
-    # VAN ville = bénéfices ville - coûts ville
-    van_ville = va_benefices_ville - va_couts_ville
-
-    # VAN ménages = bénéfices ménages - coûts ménages
-    van_menages = va_benefices_menages - va_couts_menages
-
-    # Externalités = composantes sociales + report d'infra explicite (VA)
-    va_externalites = (
-        res_eco.va_benefices_infra_m3 +
-        res_eco.va_benefices_externalites +
-        res_eco.va_benefices_report_infra
-    )
-
-    return ResultatsParPayeur(
-        van_economique=res_eco.van,
-        van_ville=van_ville,
-        va_couts_ville=va_couts_ville,
-        va_benefices_ville=va_benefices_ville,
-        van_menages=van_menages,
-        va_couts_menages=va_couts_menages,
-        va_benefices_menages=va_benefices_menages,
-        va_externalites=va_externalites,
-        va_benefices_cout_variable=res_eco.va_benefices_cout_variable,
-        va_benefices_infra_m3=res_eco.va_benefices_infra_m3,
-        va_benefices_externalites=res_eco.va_benefices_externalites,
-        va_benefices_report_infra=res_eco.va_benefices_report_infra,
-        params=params,
-    )
-
-
-def afficher_decomposition_payeurs(res: ResultatsParPayeur) -> None:
-    """Afficher un tableau de la décomposition par payeur."""
-    print("\n" + "=" * 70)
-    print(" " * 15 + "DÉCOMPOSITION DE LA VAN PAR PAYEUR")
-    print("=" * 70)
-
-    print(f"\n{'PERSPECTIVE':<25} │ {'VAN':<18} │ {'Coûts VA':<15} │ {'Bénéfices VA':<15}")
-    print("─" * 25 + "─┼─" + "─" * 18 + "─┼─" + "─" * 15 + "─┼─" + "─" * 15)
-
-    print(f"{'Économique (société)':<25} │ {fmt_argent(res.van_economique):>17} │ "
-          f"{'-':>14} │ {'-':>14}")
-    print(f"{'Ville (budget municipal)':<25} │ {fmt_argent(res.van_ville):>17} │ "
-          f"{fmt_argent(res.va_couts_ville):>14} │ {fmt_argent(res.va_benefices_ville):>14}")
-    print(f"{'Ménages (citoyens)':<25} │ {fmt_argent(res.van_menages):>17} │ "
-          f"{fmt_argent(res.va_couts_menages):>14} │ {fmt_argent(res.va_benefices_menages):>14}")
-    print("─" * 25 + "─┼─" + "─" * 18 + "─┼─" + "─" * 15 + "─┼─" + "─" * 15)
-    print(f"{'Externalités (non captées)':<25} │ {fmt_argent(res.va_externalites):>17} │ "
-          f"{'-':>14} │ {'-':>14}")
-
-    print("\n" + "─" * 70)
-    print("Notes:")
-    print("  - VAN économique = bien-être social total (externalités incluses)")
-    print("  - VAN ville = économies coût variable - (CAPEX + OPEX ville)")
-    print("  - VAN ménages = 0 au Québec (pas de tarification volumétrique)")
-    print("  - Externalités = infrastructure reportée + environnement")
-    print("\n  Décomposition VA (valeur sociale de l'eau):")
-    print(f"    • Coût variable évité:      {fmt_argent(res.va_benefices_cout_variable)}")
-    print(f"    • Report infra (valeur m³): {fmt_argent(res.va_benefices_infra_m3)}")
-    print(f"    • Externalités:             {fmt_argent(res.va_benefices_externalites)}")
-    print(f"    • Report infra (paramètres): {fmt_argent(res.va_benefices_report_infra)}")
-    print("=" * 70)
-
-
-# =============================================================================
-# MODULE DYNAMIQUE : TRAJECTOIRES TEMPORELLES
-# =============================================================================
-#
-# Ce module transforme le modèle "annuité constante" en modèle dynamique
-# avec des séries temporelles B[t] et C[t] pour chaque année.
-#
-# Avantages:
-# - Permet la persistance décroissante des effets comportementaux α_B(t)
-# - Permet les stratégies d'adoption graduelles A(t)
-# - Permet les coûts de réparation variables dans le temps
-# - Garde la même interface publique (executer_modele)
-#
-# =============================================================================
-
-@dataclass
-class EconomiesEau:
-    """
-    Économies d'eau par ménage (m³/an).
-
-    Sépare les composantes pour éviter les double-comptes et permettre
-    la modélisation différenciée (ex: persistance comportementale vs fuites).
-    """
-    usage_base: float              # Consommation de base (m³/an)
-    usage_reductible: float        # Usage net des fuites (base comportementale)
-    economie_fuite: float          # Économies dues aux fuites corrigées
-    economie_comportement: float   # Économies comportementales
-
-    @property
-    def total(self) -> float:
-        """Économies totales par ménage (m³/an)."""
-        return self.economie_fuite + self.economie_comportement
-
-
-# =============================================================================
-# MODULE PERSISTANCE : DÉCROISSANCE DES EFFETS COMPORTEMENTAUX
-# =============================================================================
-#
-# Ce module modélise comment les effets comportementaux (réduction de
-# consommation suite à l'installation du compteur) évoluent dans le temps.
-#
-# Fondement théorique:
-# - Les études UK (programme de comptage universel) montrent une réduction significative (~22%) à 2 ans
-# - L'étude "Turn off the faucet" montre une persistance sur 12 mois
-# - Sans signal-prix (tarification volumétrique), l'effet peut s'estomper
-# - Avec feedback (AMI), l'effet peut se maintenir plus longtemps
-#
-# Trois scénarios:
-# - OPTIMISTE: Effets permanents (habitudes formées)
-# - RÉALISTE: Décroissance vers un plateau (partie des habitudes reste)
-# - PESSIMISTE: Fade-out progressif (retour aux anciennes habitudes)
-#
-# =============================================================================
-
-class ModePersistance(Enum):
-    """Mode de décroissance des effets comportementaux."""
-    CONSTANT = "constant"                    # Pas de décroissance
-    EXPONENTIEL_PLATEAU = "exp_plateau"      # Décroissance vers un plateau
-    FADEOUT_LINEAIRE = "fadeout_lin"         # Disparition linéaire
-    FADEOUT_EXPONENTIEL = "fadeout_exp"      # Disparition exponentielle
-
-
-@dataclass
-class ParametresPersistance:
-    """
-    Configuration de la persistance des effets comportementaux.
-
-    Modélise l'évolution de α_B(t) = réduction comportementale à l'année t.
-
-    Formules selon le mode:
-    - CONSTANT: α_B(t) = α₀
-    - EXPONENTIEL_PLATEAU: α_B(t) = α_∞ + (α₀ - α_∞) × e^(-λ(t-1))
-    - FADEOUT_LINEAIRE: α_B(t) = α₀ × max(0, 1 - (t-1)/(T_fade-1))
-    - FADEOUT_EXPONENTIEL: α_B(t) = α₀ × e^(-λ(t-1))
-
-    Paramètres:
-    - alpha_initial: Réduction initiale (année 1), en décimal (0.08 = 8%)
-    - alpha_plateau: Plateau long terme (pour mode exp_plateau)
-    - lambda_decay: Vitesse de décroissance (par an)
-    - annees_fadeout: Années jusqu'à extinction complète (mode fadeout_lin)
-    """
-    mode: ModePersistance = ModePersistance.CONSTANT
-    alpha_initial: float = 0.08       # 8% de réduction initiale
-    alpha_plateau: float = 0.025      # 2.5% de plateau long terme
-    lambda_decay: float = 0.15        # Demi-vie ~4.6 ans (Allcott & Rogers: 10-20%/an)
-    annees_fadeout: int = 10          # Années jusqu'à zéro (fadeout linéaire)
-
-    # Métadonnées pour affichage
-    nom: str = "Scénario par défaut"
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider les paramètres."""
-        if self.alpha_initial < 0 or self.alpha_initial > 1:
-            raise ValueError(f"alpha_initial doit être entre 0 et 1, reçu {self.alpha_initial}")
-        if self.alpha_plateau < 0 or self.alpha_plateau > self.alpha_initial:
-            raise ValueError(f"alpha_plateau doit être entre 0 et alpha_initial")
-        if self.lambda_decay < 0:
-            raise ValueError(f"lambda_decay doit être >= 0")
-        if self.annees_fadeout < 1:
-            raise ValueError(f"annees_fadeout doit être >= 1")
-
-
-def calculer_alpha_comportement(t: int, params: ParametresPersistance) -> float:
-    """
-    Calculer le coefficient de réduction comportementale α_B pour l'année t.
-
-    Paramètres:
-        t: Année (1, 2, 3, ...)
-        params: Paramètres de persistance
-
-    Retourne:
-        α_B(t) en décimal (ex: 0.08 = 8% de réduction)
-    """
-    if t < 1:
-        return 0.0
-
-    alpha_0 = params.alpha_initial
-    alpha_inf = params.alpha_plateau
-    lam = params.lambda_decay
-    T_fade = params.annees_fadeout
-
-    if params.mode == ModePersistance.CONSTANT:
-        # Pas de décroissance: α_B(t) = α₀
-        return alpha_0
-
-    elif params.mode == ModePersistance.EXPONENTIEL_PLATEAU:
-        # Décroissance exponentielle vers un plateau:
-        # α_B(t) = α_∞ + (α₀ - α_∞) × e^(-λ(t-1))
-        # À t=1: α_B = α₀ (plein effet)
-        # À t→∞: α_B → α_∞ (plateau)
-        return alpha_inf + (alpha_0 - alpha_inf) * math.exp(-lam * (t - 1))
-
-    elif params.mode == ModePersistance.FADEOUT_LINEAIRE:
-        # Disparition linéaire sur T_fade années:
-        # α_B(t) = α₀ × max(0, 1 - (t-1)/(T_fade-1))
-        # À t=1: α_B = α₀
-        # À t=T_fade: α_B = 0
-        if T_fade <= 1:
-            return alpha_0 if t == 1 else 0.0
-        ratio = (t - 1) / (T_fade - 1)
-        return alpha_0 * max(0.0, 1.0 - ratio)
-
-    elif params.mode == ModePersistance.FADEOUT_EXPONENTIEL:
-        # Disparition exponentielle vers zéro:
-        # α_B(t) = α₀ × e^(-λ(t-1))
-        # À t=1: α_B = α₀
-        # À t→∞: α_B → 0
-        return alpha_0 * math.exp(-lam * (t - 1))
-
-    else:
-        return alpha_0  # Fallback
-
-
-def generer_serie_alpha(params: ParametresPersistance, T: int) -> np.ndarray:
-    """
-    Générer la série complète α_B(t) pour t = 1..T.
-
-    Paramètres:
-        params: Paramètres de persistance
-        T: Horizon (nombre d'années)
-
-    Retourne:
-        Array de shape (T,) avec α_B pour chaque année
-    """
-    return np.array([calculer_alpha_comportement(t, params) for t in range(1, T + 1)])
-
-
-# =============================================================================
-# SCÉNARIOS DE PERSISTANCE PRÉDÉFINIS
-# =============================================================================
-
-# Scénario OPTIMISTE: Effets permanents
-# Hypothèse: Les ménages forment de nouvelles habitudes durables
-# Justification: Fort effet d'ancrage, feedback AMI régulier, normes sociales
-PERSISTANCE_OPTIMISTE = ParametresPersistance(
-    mode=ModePersistance.CONSTANT,
-    alpha_initial=0.08,  # 8% de réduction permanente
-    nom="Optimiste",
-    description="Effets permanents - Les habitudes se maintiennent intégralement",
-)
-
-# Scénario RÉALISTE: Décroissance vers plateau
-# Hypothèse: L'effet initial s'estompe mais une partie devient permanente
-# Calibration basée sur:
-# - Études UK: convergence observée à ~2 ans
-# - Plateau = 25-30% de l'effet initial (habitudes formées)
-# - Demi-vie ≈ 4.6 ans (λ = 0.15, cohérent Allcott & Rogers AER)
-PERSISTANCE_REALISTE = ParametresPersistance(
-    mode=ModePersistance.EXPONENTIEL_PLATEAU,
-    alpha_initial=0.08,       # 8% réduction initiale
-    alpha_plateau=0.025,      # 2.5% plateau long terme (31% de l'initial)
-    lambda_decay=0.15,        # Demi-vie ≈ 4.6 ans (Allcott: décroissance 10-20%/an)
-    nom="Réaliste",
-    description="Décroissance vers plateau - Partie des habitudes se maintient",
-)
-
-# Scénario PESSIMISTE: Fade-out complet
-# Hypothèse: Sans signal-prix, les ménages reviennent aux anciennes habitudes
-# Justification: Pas de tarification volumétrique, effet "nouveau" s'estompe
-# Calibration: Disparition linéaire sur 10 ans (conservateur)
-PERSISTANCE_PESSIMISTE = ParametresPersistance(
-    mode=ModePersistance.FADEOUT_LINEAIRE,
-    alpha_initial=0.08,       # 8% réduction initiale
-    annees_fadeout=10,        # Retour à zéro en 10 ans
-    nom="Pessimiste",
-    description="Fade-out complet - Retour progressif aux anciennes habitudes",
-)
-
-# Scénario ULTRA-PESSIMISTE: Aucun changement comportemental
-# Hypothèse: Sans tarification volumétrique et sans engagement actif,
-# les ménages ne modifient pas du tout leur consommation.
-# Seules les fuites détectées et réparées génèrent des économies.
-# Utilité: Stress-test du business case, argumentation conservatrice maximale
-PERSISTANCE_ULTRA_PESSIMISTE = ParametresPersistance(
-    mode=ModePersistance.CONSTANT,
-    alpha_initial=0.0,        # AUCUNE réduction comportementale
-    alpha_plateau=0.0,        # Cohérent avec alpha_initial=0
-    nom="Ultra-pessimiste",
-    description="Aucun changement comportemental - Économies fuites uniquement",
-)
-
-# Dictionnaire pour accès facile
-SCENARIOS_PERSISTANCE = {
-    "optimiste": PERSISTANCE_OPTIMISTE,
-    "realiste": PERSISTANCE_REALISTE,
-    "pessimiste": PERSISTANCE_PESSIMISTE,
-    "ultra_pessimiste": PERSISTANCE_ULTRA_PESSIMISTE,
-}
-
-
-def afficher_scenarios_persistance(T: int = 20) -> None:
-    """Afficher un tableau des scénarios de persistance."""
-    print("\n" + "=" * 70)
-    print(" " * 15 + "SCÉNARIOS DE PERSISTANCE COMPORTEMENTALE")
-    print("=" * 70)
-
-    for nom, params in SCENARIOS_PERSISTANCE.items():
-        serie = generer_serie_alpha(params, T)
-        print(f"\n{params.nom.upper()}: {params.description}")
-        print(f"  Mode: {params.mode.value}")
-        print(f"  α_B(t=1):  {serie[0]*100:.1f}%")
-        print(f"  α_B(t=5):  {serie[4]*100:.1f}%")
-        print(f"  α_B(t=10): {serie[9]*100:.1f}%")
-        print(f"  α_B(t=20): {serie[19]*100:.1f}%")
-        print(f"  Moyenne sur {T} ans: {np.mean(serie)*100:.1f}%")
-
-    print("\n" + "=" * 70)
-
-
-# =============================================================================
-# MODULE FUITES : COÛTS DE RÉPARATION ET PARTAGE
-# =============================================================================
-#
-# Ce module améliore le traitement des fuites en ajoutant:
-# 1. Les coûts de réparation (actuellement ignorés dans le modèle de base)
-# 2. Le partage des coûts entre la ville et les ménages
-# 3. La dynamique temporelle (stock actif + plateau)
-#
-# Fondement théorique:
-# - Les compteurs intelligents détectent les fuites (consommation continue)
-# - La détection n'est pas la réparation: il faut payer pour réparer
-# - Les fuites privées (après compteur) = responsabilité du ménage
-# - La ville peut offrir des subventions pour encourager les réparations
-#
-# Distinction importante:
-# - Fuites RÉSEAU (avant compteur): responsabilité municipale, non modélisées ici
-# - Fuites PRIVÉES (après compteur): c'est ce que nous modélisons
-#
-# =============================================================================
-
-class ModeRepartitionCouts(Enum):
-    """Mode de répartition des coûts de réparation."""
-    MENAGE_SEUL = "menage"           # 100% ménage (défaut)
-    SUBVENTION_PARTIELLE = "partage" # Partage ville/ménage
-    VILLE_SEULE = "ville"            # 100% ville (incitatif maximal)
-    SANS_COUT = "gratuit"            # Ignorer les coûts (modèle de base)
-
-
-@dataclass
-class ParametresFuites:
-    """
-    Configuration des fuites et de leurs coûts de réparation.
-
-    Ce module distingue:
-    - La DÉTECTION (grâce au compteur intelligent)
-    - La RÉPARATION (action du ménage, avec ou sans aide)
-    - Le PARTAGE des coûts (ville vs ménage)
-
-    Dynamique temporelle:
-    - Stock de fuites actives avec réparations (naturelles + détection)
-    - Les économies plafonnent vers un équilibre (plateau)
-    - Le stock représente un nombre de fuites actives (peut dépasser nb ménages)
-
-    NOUVEAU v3.9: Prévalence différenciée selon AWE (2023)
-    - Toute fuite (any): consommation continue 24h - prévalence ~20%
-    - Fuite significative: >3 L/h pendant 48h - prévalence ~5%
-    - Longue traîne: fuites jamais réparées malgré programme
-
-    Paramètres:
-    - Prévalence et débit des fuites (différenciés ou agrégés)
-    - Taux de détection et de réparation
-    - Coût moyen de réparation
-    - Partage des coûts
-    - Taux de nouvelles fuites annuelles
-    - Persistance (longue traîne)
-    """
-    # === PRÉVALENCE DES FUITES (AGRÉGÉ - rétrocompatibilité) ===
-    part_menages_fuite_pct: float = 20.0      # % ménages avec fuite (état initial)
-    debit_fuite_m3_an: float = 35.0           # Débit moyen par fuite (m³/an)
-
-    # === PRÉVALENCE DIFFÉRENCIÉE (NOUVEAU v3.9) ===
-    # Distinction selon définition AWE (2023)
-    # Si activé (utiliser_prevalence_differenciee=True), remplace les valeurs agrégées
-    utiliser_prevalence_differenciee: bool = False
-    # Toute fuite détectable (consommation continue 24h)
-    part_menages_fuite_any_pct: float = 20.0          # ~20% selon AWE
-    debit_fuite_any_m3_an: float = 10.0               # Petites fuites (toilettes, goutte)
-    # Fuites significatives (>3 L/h pendant 48h, nécessitant intervention)
-    part_menages_fuite_significative_pct: float = 5.0  # 3-7% selon AWE
-    debit_fuite_significative_m3_an: float = 50.0      # Grosses fuites (conduites)
-
-    # === PERSISTANCE / LONGUE TRAÎNE (NOUVEAU v3.9) ===
-    # Source: AWE (2023) documente des fuites exceptionnellement longues
-    # malgré programmes de détection et alertes.
-    # Deux effets distincts:
-    # 1. Persistantes: fraction de fuites JAMAIS réparées (réduction taux correction)
-    # 2. Longue traîne: les autres fuites prennent PLUS LONGTEMPS à réparer
-    part_fuites_persistantes_pct: float = 5.0          # % fuites jamais réparées (réduit k_eff)
-    facteur_duree_longue_traine: float = 5.0           # Multiplicateur durée réparation (ralentit k)
-
-    # === DIFFÉRENCIATION PAR TYPE DE FUITE (NOUVEAU v3.10) ===
-    # Multiplicateurs pour fuites significatives vs petites fuites
-    # Base: petites fuites (any) ont les taux de détection/réparation de base
-    # Sig: grosses fuites sont plus visibles ET plus réparées (dommages = motivation)
-    facteur_detection_sig: float = 1.2                 # Grosses fuites plus visibles (détection facilitée)
-    facteur_reparation_sig: float = 1.4                # Grosses fuites = plus d'incitatif (dommages visibles)
-    cout_reparation_any: float = 100.0                 # Coût réparation petite fuite ($)
-    cout_reparation_sig: float = 400.0                 # Coût réparation grosse fuite ($)
-
-    # === DÉTECTION ===
-    # Le compteur intelligent permet de détecter les fuites via
-    # l'analyse du profil de consommation (débit continu 24h/24)
-    taux_detection_pct: float = 90.0          # Taux de détection AMI (%)
-
-    # === RÉPARATION ===
-    # Une fois détectée, la fuite doit être réparée par le ménage
-    taux_reparation_pct: float = 85.0         # % des fuites détectées qui sont réparées
-    cout_reparation_moyen: float = 200.0      # Coût moyen par réparation ($)
-
-    # === PARTAGE DES COÛTS ===
-    # La ville peut subventionner les réparations pour encourager l'action
-    mode_repartition: ModeRepartitionCouts = ModeRepartitionCouts.MENAGE_SEUL
-    part_ville_pct: float = 0.0               # Part des coûts assumée par la ville (%)
-
-    # === DYNAMIQUE TEMPORELLE ===
-    # Nouvelles fuites apparaissant chaque année (usure des installations)
-    taux_nouvelles_fuites_pct: float = 5.0    # % de ménages développant une fuite/an
-    # Durée moyenne d'une fuite sans compteur (années)
-    # Si None: dérivée de la prévalence initiale et du taux de nouvelles fuites
-    duree_moyenne_fuite_sans_compteur: Optional[float] = None
-
-    # === OPTIONS ===
-    inclure_cout_reparation: bool = True      # Inclure les coûts dans l'analyse
-
-    # Métadonnées
-    nom: str = "Configuration par défaut"
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider les paramètres."""
-        if not 0 <= self.part_menages_fuite_pct <= 100:
-            raise ValueError("part_menages_fuite_pct doit être entre 0 et 100")
-        if self.debit_fuite_m3_an < 0:
-            raise ValueError("debit_fuite_m3_an doit être >= 0")
-        if not 0 <= self.taux_detection_pct <= 100:
-            raise ValueError("taux_detection_pct doit être entre 0 et 100")
-        if not 0 <= self.taux_reparation_pct <= 100:
-            raise ValueError("taux_reparation_pct doit être entre 0 et 100")
-        if self.cout_reparation_moyen < 0:
-            raise ValueError("cout_reparation_moyen doit être >= 0")
-        if not 0 <= self.part_ville_pct <= 100:
-            raise ValueError("part_ville_pct doit être entre 0 et 100")
-        if self.duree_moyenne_fuite_sans_compteur is not None:
-            if self.duree_moyenne_fuite_sans_compteur <= 0:
-                raise ValueError("duree_moyenne_fuite_sans_compteur doit être > 0")
-        # Validation paramètres différenciés (v3.9)
-        if not 0 <= self.part_menages_fuite_any_pct <= 100:
-            raise ValueError("part_menages_fuite_any_pct doit être entre 0 et 100")
-        if not 0 <= self.part_menages_fuite_significative_pct <= 100:
-            raise ValueError("part_menages_fuite_significative_pct doit être entre 0 et 100")
-        if not 0 <= self.part_fuites_persistantes_pct <= 100:
-            raise ValueError("part_fuites_persistantes_pct doit être entre 0 et 100")
-        if self.utiliser_prevalence_differenciee:
-            if self.part_menages_fuite_significative_pct > self.part_menages_fuite_any_pct:
-                raise ValueError(
-                    "part_menages_fuite_significative_pct doit être <= part_menages_fuite_any_pct "
-                    "lorsque utiliser_prevalence_differenciee=True"
-                )
-
-    @property
-    def taux_correction_effectif(self) -> float:
-        """Taux de correction effectif = détection × réparation."""
-        return (self.taux_detection_pct / 100.0) * (self.taux_reparation_pct / 100.0)
-
-    @property
-    def taux_correction_effectif_avec_persistance(self) -> float:
-        """
-        Taux de correction effectif ajusté pour les fuites persistantes.
-
-        Une fraction des fuites (part_fuites_persistantes_pct) ne sera jamais réparée,
-        ce qui réduit le taux de correction effectif global.
-
-        Note: distinct de facteur_duree_longue_traine qui ralentit les réparations.
-        """
-        taux_base = self.taux_correction_effectif
-        fraction_reparable = 1.0 - (self.part_fuites_persistantes_pct / 100.0)
-        return taux_base * fraction_reparable
-
-    @property
-    def volume_fuite_moyen_pondere(self) -> float:
-        """
-        Volume moyen pondéré si prévalence différenciée est activée.
-
-        Calcule le volume moyen par ménage avec fuite en pondérant les deux types.
-
-        IMPORTANT: p_sig ⊂ p_any (les fuites significatives sont un sous-ensemble
-        des fuites "any"). Donc p_any_excl = p_any - p_sig représente les petites
-        fuites uniquement.
-
-        Formule: (p_any_excl × vol_any + p_sig × vol_sig) / p_any
-        """
-        if not self.utiliser_prevalence_differenciee:
-            return self.debit_fuite_m3_an
-
-        # Prévalences (p_sig est inclus dans p_any)
-        p_any = self.part_menages_fuite_any_pct
-        p_sig = self.part_menages_fuite_significative_pct
-
-        if p_any <= 0:
-            return 0.0
-
-        # p_any_excl = ménages avec petite fuite uniquement (exclusif)
-        p_any_excl = max(0.0, p_any - p_sig)
-
-        # Pondération correcte: petites fuites + grosses fuites
-        vol_petites = self.debit_fuite_any_m3_an * p_any_excl
-        vol_grosses = self.debit_fuite_significative_m3_an * p_sig
-
-        # Diviseur = p_any (total des ménages avec fuite)
-        return (vol_petites + vol_grosses) / p_any
-
-
-@dataclass
-class ResultatsFuites:
-    """
-    Résultats du calcul des fuites et réparations.
-
-    Contient les séries temporelles et les totaux pour:
-    - Nombre de réparations par année
-    - Coûts de réparation (total, ville, ménages)
-    - Économies d'eau réalisées
-
-    NOUVEAU v3.10: Breakdowns par type de fuite (any vs significative)
-    quand utiliser_prevalence_differenciee=True.
-    """
-    # Séries temporelles (totaux agrégés)
-    annees: np.ndarray                        # [1, 2, ..., T]
-    reparations_par_an: np.ndarray            # Nombre de réparations/an
-    cout_total_par_an: np.ndarray             # Coût total ($)/an
-    cout_ville_par_an: np.ndarray             # Part ville ($)/an
-    cout_menages_par_an: np.ndarray           # Part ménages ($)/an
-    economies_eau_par_an: np.ndarray          # m³ économisés/an (différence de stock actif)
-
-    # Totaux sur l'horizon
-    total_reparations: int                    # Nombre total de réparations
-    cout_total: float                         # Coût total ($)
-    cout_ville_total: float                   # Coût total ville ($)
-    cout_menages_total: float                 # Coût total ménages ($)
-    economies_eau_total: float                # m³ totaux économisés
-
-    # Métriques
-    cout_par_m3_economise: float              # $/m³ (efficacité des réparations)
-
-    # === BREAKDOWN PAR TYPE (NOUVEAU v3.10) ===
-    # Rempli seulement si utiliser_prevalence_differenciee=True
-    mode_deux_stocks: bool = False            # Flag indiquant le mode utilisé
-
-    # Petites fuites (any, hors significatives)
-    economies_any_par_an: Optional[np.ndarray] = None
-    reparations_any_par_an: Optional[np.ndarray] = None
-    cout_any_par_an: Optional[np.ndarray] = None
-
-    # Fuites significatives
-    economies_sig_par_an: Optional[np.ndarray] = None
-    reparations_sig_par_an: Optional[np.ndarray] = None
-    cout_sig_par_an: Optional[np.ndarray] = None
-
-    # Fuites persistantes (jamais réparées)
-    economies_persistantes_par_an: Optional[np.ndarray] = None
-
-
-def calculer_dynamique_fuites(
-    params_fuites: ParametresFuites,
-    nb_menages: int,
-    horizon: int,
-    facteur_efficacite_detection: float = 1.0,
-) -> ResultatsFuites:
-    """
-    Calculer la dynamique des fuites et réparations sur l'horizon.
-
-    DEUX MODES DISPONIBLES:
-
-    1. Mode agrégé (utiliser_prevalence_differenciee=False, défaut):
-       - Un seul stock de fuites L(t) avec paramètres moyens
-       - Compatible avec les versions précédentes
-
-    2. Mode deux-stocks (utiliser_prevalence_differenciee=True):
-       - Stock L_any: petites fuites (toilettes, gouttes) - prévalence ~20%, ~10 m³/an
-       - Stock L_sig: fuites significatives (conduites) - prévalence ~5%, ~50 m³/an
-       - Chaque stock est scindé en fraction réparable vs persistante
-       - Détection/réparation différenciées par type
-
-    Modèle temporel (stock dynamique avec plateau):
-    - Stock de fuites actives L(t) avec nouvelles fuites et réparations
-    - Sans compteur: réparation naturelle à un taux mu (durée moyenne)
-    - Avec compteur: taux mu + (détection × réparation)
-    - Économies = différence de stock actif entre baseline et compteur
-
-    Paramètres:
-        params_fuites: Configuration des fuites
-        nb_menages: Nombre de ménages
-        horizon: Horizon d'analyse (années)
-        facteur_efficacite_detection: Multiplicateur du taux de détection [0,1]
-
-    Retourne:
-        ResultatsFuites avec toutes les séries et totaux
-    """
-    H = nb_menages
-    T = horizon
-
-    # Fonction interne d'évolution de stock
-    def evoluer_stock(L_depart: float, taux: float, nouveaux: float) -> tuple[float, float]:
-        """Évolution du stock annuel avec entrée constante et taux de réparation."""
-        if taux <= 0:
-            L_fin = L_depart + nouveaux
-            L_moy = L_depart + 0.5 * nouveaux
-            return L_fin, L_moy
-
-        L_equilibre = nouveaux / taux
-        exp_term = math.exp(-taux)
-        L_fin = L_equilibre + (L_depart - L_equilibre) * exp_term
-        L_moy = L_equilibre + (L_depart - L_equilibre) * (1.0 - exp_term) / taux
-        return L_fin, L_moy
-
-    # Paramètres communs
-    d_base = params_fuites.taux_detection_pct / 100.0
-    r_base = params_fuites.taux_reparation_pct / 100.0
-    part_ville = params_fuites.part_ville_pct / 100.0
-    q = params_fuites.taux_nouvelles_fuites_pct / 100.0
-    frac_persist = params_fuites.part_fuites_persistantes_pct / 100.0
-
-    # Mode sans coût: ignorer les réparations
-    if not params_fuites.inclure_cout_reparation:
-        part_ville = 0.0
-
-    # Appliquer le facteur d'efficacité au taux de détection
-    facteur_borne = max(0.0, min(1.0, facteur_efficacite_detection))
-    d_eff = d_base * facteur_borne
-
-    # Initialiser les séries
-    annees = np.arange(1, T + 1)
-
-    # =========================================================================
-    # MODE DEUX-STOCKS (NOUVEAU v3.10)
-    # =========================================================================
-    if params_fuites.utiliser_prevalence_differenciee:
-        # Prévalences (en évitant le double comptage)
-        p_sig = params_fuites.part_menages_fuite_significative_pct / 100.0
-        p_any_total = params_fuites.part_menages_fuite_any_pct / 100.0
-        p_any_excl = max(0.0, p_any_total - p_sig)  # Any hors significatives
-
-        # Débits par type
-        debit_any = params_fuites.debit_fuite_any_m3_an
-        debit_sig = params_fuites.debit_fuite_significative_m3_an
-
-        # Coûts par type
-        cout_any = params_fuites.cout_reparation_any if params_fuites.inclure_cout_reparation else 0.0
-        cout_sig = params_fuites.cout_reparation_sig if params_fuites.inclure_cout_reparation else 0.0
-
-        # Taux différenciés
-        d_any = d_eff  # Base detection rate for small leaks
-        d_sig = min(1.0, d_eff * params_fuites.facteur_detection_sig)  # Higher for big leaks
-        r_any = r_base
-        r_sig = r_base * params_fuites.facteur_reparation_sig  # Higher due to visible damage incentive
-
-        # Taux effectifs détection × réparation
-        k_any = d_any * r_any
-        k_sig = d_sig * r_sig
-
-        # Taux de réparation naturelle (mu)
-        if params_fuites.duree_moyenne_fuite_sans_compteur is not None:
-            mu = 1.0 / params_fuites.duree_moyenne_fuite_sans_compteur
-        else:
-            mu = q / p_any_total if p_any_total > 0 and q > 0 else 0.25
-
-        # Fraction réparable vs persistante
-        frac_repar = 1.0 - frac_persist
-        long_tail_factor = max(1.0, params_fuites.facteur_duree_longue_traine)
-        long_tail_mult = 1.0 / long_tail_factor
-
-        # Séries par type
-        eco_any = np.zeros(T)
-        eco_sig = np.zeros(T)
-        eco_persist = np.zeros(T)
-        rep_any = np.zeros(T)
-        rep_sig = np.zeros(T)
-        cout_any_arr = np.zeros(T)
-        cout_sig_arr = np.zeros(T)
-
-        # === STOCK ANY (petites fuites, hors significatives) ===
-        # Réparable
-        stock_any_base_rep = H * p_any_excl * frac_repar
-        stock_any_comp_rep = H * p_any_excl * frac_repar
-        nouvelles_any_rep = H * q * (p_any_excl / p_any_total) * frac_repar if p_any_total > 0 else 0
-        # Persistant
-        stock_any_base_pers = H * p_any_excl * frac_persist
-        stock_any_comp_pers = H * p_any_excl * frac_persist
-        nouvelles_any_pers = H * q * (p_any_excl / p_any_total) * frac_persist if p_any_total > 0 else 0
-
-        # === STOCK SIG (fuites significatives) ===
-        # Réparable
-        stock_sig_base_rep = H * p_sig * frac_repar
-        stock_sig_comp_rep = H * p_sig * frac_repar
-        nouvelles_sig_rep = H * q * (p_sig / p_any_total) * frac_repar if p_any_total > 0 else 0
-        # Persistant
-        stock_sig_base_pers = H * p_sig * frac_persist
-        stock_sig_comp_pers = H * p_sig * frac_persist
-        nouvelles_sig_pers = H * q * (p_sig / p_any_total) * frac_persist if p_any_total > 0 else 0
-
-        for t in range(T):
-            # ANY réparable
-            stock_any_base_rep, any_base_moy_rep = evoluer_stock(
-                stock_any_base_rep, mu, nouvelles_any_rep)
-            stock_any_comp_rep, any_comp_moy_rep = evoluer_stock(
-                stock_any_comp_rep, mu + k_any, nouvelles_any_rep)
-            eco_any[t] += max(0.0, (any_base_moy_rep - any_comp_moy_rep) * debit_any)
-            rep_any[t] = k_any * any_comp_moy_rep
-            cout_any_arr[t] = rep_any[t] * cout_any
-
-            # ANY persistant (taux de correction réduit via longue traine)
-            k_any_pers = k_any * long_tail_mult
-            stock_any_base_pers, any_base_moy_pers = evoluer_stock(
-                stock_any_base_pers, mu * long_tail_mult, nouvelles_any_pers)
-            stock_any_comp_pers, any_comp_moy_pers = evoluer_stock(
-                stock_any_comp_pers, mu * long_tail_mult + k_any_pers, nouvelles_any_pers)
-            eco_persist[t] += max(0.0, (any_base_moy_pers - any_comp_moy_pers) * debit_any)
-            rep_any_pers = k_any_pers * any_comp_moy_pers
-            rep_any[t] += rep_any_pers
-            cout_any_arr[t] += rep_any_pers * cout_any
-
-            # SIG réparable
-            stock_sig_base_rep, sig_base_moy_rep = evoluer_stock(
-                stock_sig_base_rep, mu, nouvelles_sig_rep)
-            stock_sig_comp_rep, sig_comp_moy_rep = evoluer_stock(
-                stock_sig_comp_rep, mu + k_sig, nouvelles_sig_rep)
-            eco_sig[t] += max(0.0, (sig_base_moy_rep - sig_comp_moy_rep) * debit_sig)
-            rep_sig[t] = k_sig * sig_comp_moy_rep
-            cout_sig_arr[t] = rep_sig[t] * cout_sig
-
-            # SIG persistant
-            k_sig_pers = k_sig * long_tail_mult
-            stock_sig_base_pers, sig_base_moy_pers = evoluer_stock(
-                stock_sig_base_pers, mu * long_tail_mult, nouvelles_sig_pers)
-            stock_sig_comp_pers, sig_comp_moy_pers = evoluer_stock(
-                stock_sig_comp_pers, mu * long_tail_mult + k_sig_pers, nouvelles_sig_pers)
-            eco_persist[t] += max(0.0, (sig_base_moy_pers - sig_comp_moy_pers) * debit_sig)
-            rep_sig_pers = k_sig_pers * sig_comp_moy_pers
-            rep_sig[t] += rep_sig_pers
-            cout_sig_arr[t] += rep_sig_pers * cout_sig
-
-        # Agrégation
-        economies_eau = eco_any + eco_sig + eco_persist
-        reparations = rep_any + rep_sig
-        cout_total = cout_any_arr + cout_sig_arr
-        cout_ville = cout_total * part_ville
-        cout_menages = cout_total * (1 - part_ville)
-
-        # Totaux
-        total_reparations = int(round(float(np.sum(reparations))))
-        cout_total_sum = float(np.sum(cout_total))
-        cout_ville_sum = float(np.sum(cout_ville))
-        cout_menages_sum = float(np.sum(cout_menages))
-        economies_eau_sum = float(np.sum(economies_eau))
-        cout_par_m3 = cout_total_sum / economies_eau_sum if economies_eau_sum > 0 else 0.0
-
-        return ResultatsFuites(
-            annees=annees,
-            reparations_par_an=reparations,
-            cout_total_par_an=cout_total,
-            cout_ville_par_an=cout_ville,
-            cout_menages_par_an=cout_menages,
-            economies_eau_par_an=economies_eau,
-            total_reparations=total_reparations,
-            cout_total=cout_total_sum,
-            cout_ville_total=cout_ville_sum,
-            cout_menages_total=cout_menages_sum,
-            economies_eau_total=economies_eau_sum,
-            cout_par_m3_economise=cout_par_m3,
-            # Breakdowns par type
-            mode_deux_stocks=True,
-            economies_any_par_an=eco_any,
-            reparations_any_par_an=rep_any,
-            cout_any_par_an=cout_any_arr,
-            economies_sig_par_an=eco_sig,
-            reparations_sig_par_an=rep_sig,
-            cout_sig_par_an=cout_sig_arr,
-            economies_persistantes_par_an=eco_persist,
-        )
-
-    # =========================================================================
-    # MODE AGRÉGÉ (rétrocompatibilité)
-    # =========================================================================
-    p0 = params_fuites.part_menages_fuite_pct / 100.0
-    C = params_fuites.cout_reparation_moyen if params_fuites.inclure_cout_reparation else 0.0
-    debit = params_fuites.debit_fuite_m3_an
-    k = d_eff * r_base
-    frac_persist = max(0.0, min(1.0, params_fuites.part_fuites_persistantes_pct / 100.0))
-    frac_repar = 1.0 - frac_persist
-    long_tail_factor = max(1.0, params_fuites.facteur_duree_longue_traine)
-    long_tail_mult = 1.0 / long_tail_factor
-
-    # Taux de réparation naturelle
-    if params_fuites.duree_moyenne_fuite_sans_compteur is not None:
-        mu = 1.0 / params_fuites.duree_moyenne_fuite_sans_compteur
-    elif p0 > 0 and q > 0:
-        mu = q / p0
-    else:
-        mu = 0.25
-
-    # Séries
-    reparations = np.zeros(T)
-    cout_total = np.zeros(T)
-    cout_ville = np.zeros(T)
-    cout_menages = np.zeros(T)
-    economies_eau = np.zeros(T)
-
-    # Stocks réparables vs persistants (longue traîne)
-    stock_base_rep = H * p0 * frac_repar
-    stock_comp_rep = H * p0 * frac_repar
-    stock_base_pers = H * p0 * frac_persist
-    stock_comp_pers = H * p0 * frac_persist
-
-    nouvelles_rep = H * q * frac_repar
-    nouvelles_pers = H * q * frac_persist
-
-    taux_base_rep = mu
-    taux_comp_rep = mu + k
-    mu_pers = mu * long_tail_mult
-    k_pers = k * long_tail_mult
-    taux_base_pers = mu_pers
-    taux_comp_pers = mu_pers + k_pers
-
-    for t in range(T):
-        # Réparable
-        stock_base_rep, base_moy_rep = evoluer_stock(stock_base_rep, taux_base_rep, nouvelles_rep)
-        stock_comp_rep, comp_moy_rep = evoluer_stock(stock_comp_rep, taux_comp_rep, nouvelles_rep)
-
-        # Persistant (taux réduit)
-        stock_base_pers, base_moy_pers = evoluer_stock(stock_base_pers, taux_base_pers, nouvelles_pers)
-        stock_comp_pers, comp_moy_pers = evoluer_stock(stock_comp_pers, taux_comp_pers, nouvelles_pers)
-
-        economie_rep = (base_moy_rep - comp_moy_rep) * debit
-        economie_pers = (base_moy_pers - comp_moy_pers) * debit
-        economies_eau[t] = max(0.0, economie_rep + economie_pers)
-
-        reparations_t = k * comp_moy_rep + k_pers * comp_moy_pers
-        reparations[t] = reparations_t
-        cout_total[t] = reparations_t * C
-        cout_ville[t] = cout_total[t] * part_ville
-        cout_menages[t] = cout_total[t] * (1 - part_ville)
-
-    # Totaux
-    total_reparations = int(round(float(np.sum(reparations))))
-    cout_total_sum = float(np.sum(cout_total))
-    cout_ville_sum = float(np.sum(cout_ville))
-    cout_menages_sum = float(np.sum(cout_menages))
-    economies_eau_sum = float(np.sum(economies_eau))
-    cout_par_m3 = cout_total_sum / economies_eau_sum if economies_eau_sum > 0 else 0.0
-
-    return ResultatsFuites(
-        annees=annees,
-        reparations_par_an=reparations,
-        cout_total_par_an=cout_total,
-        cout_ville_par_an=cout_ville,
-        cout_menages_par_an=cout_menages,
-        economies_eau_par_an=economies_eau,
-        total_reparations=total_reparations,
-        cout_total=cout_total_sum,
-        cout_ville_total=cout_ville_sum,
-        cout_menages_total=cout_menages_sum,
-        economies_eau_total=economies_eau_sum,
-        cout_par_m3_economise=cout_par_m3,
-        mode_deux_stocks=False,
-    )
-
-
-def calculer_economies_fuites_menage(
-    params_fuites: ParametresFuites,
-) -> float:
-    """
-    Calculer les économies de fuites par ménage (m³/an) - valeur de première année.
-
-    Formule: économies = prévalence × débit × taux_correction_effectif
-
-    Cette valeur représente l'économie moyenne par ménage en première année.
-
-    Paramètres:
-        params_fuites: Configuration des fuites
-
-    Retourne:
-        Économies en m³/ménage/an
-    """
-    prevalence = params_fuites.part_menages_fuite_pct / 100.0
-    debit = params_fuites.debit_fuite_m3_an
-    taux_correction = params_fuites.taux_correction_effectif
-
-    return prevalence * debit * taux_correction
-
-
-# =============================================================================
-# MODULE FUITES RÉSEAU (OPTIONNEL)
-# =============================================================================
-#
-# Ce module modélise les pertes d'eau sur le réseau (avant compteur).
-# L'objectif est de distinguer clairement:
-# - les économies liées aux fuites PRIVÉES (après compteur, ménage)
-# - les économies liées aux fuites du RÉSEAU (pilotées par la ville)
-#
-# Le module est volontairement simple et paramétrable:
-# - volume de pertes annuel (m³/an)
-# - réduction maximale atteignable (%)
-# - trajectoire de réduction (linéaire ou exponentielle)
-# - coûts du programme (OPEX) + coûts de réparation par m³
-# - CAPEX ponctuel possible (DMA, capteurs, analytics)
-#
-# =============================================================================
-
-class ModeReductionReseau(Enum):
-    """Mode de réduction des pertes réseau."""
-    LINEAIRE = "lineaire"        # Rampe linéaire jusqu'à la cible
-    EXPONENTIEL = "exponentiel"  # Approche rapide puis plateau
-
-
-@dataclass
-class ParametresFuitesReseau:
-    """
-    Paramètres pour la réduction des pertes d'eau sur le réseau.
-
-    Hypothèses:
-    - Le programme réduit une fraction des pertes existantes.
-    - La réduction suit une trajectoire (rampe) sur plusieurs années.
-    - Les économies et coûts peuvent être pondérés par l'adoption (si AMI).
-    """
-    # === BASE DES PERTES ===
-    volume_pertes_m3_an: float = 0.0     # Pertes réseau de référence (m³/an)
-    reduction_max_pct: float = 0.0      # Réduction maximale atteignable (%)
-
-    # === TRAJECTOIRE ===
-    mode_reduction: ModeReductionReseau = ModeReductionReseau.LINEAIRE
-    annees_atteinte: int = 5            # Années pour atteindre la cible (linéaire)
-    lambda_reduction: float = 0.5       # Vitesse (exponentiel)
-    annee_demarrage: int = 1            # Début du programme
-
-    # === COÛTS ===
-    cout_programme_annuel: float = 0.0  # OPEX annuel (suivi, équipes, analytics)
-    cout_reparation_m3: float = 0.0     # Coût variable par m³ économisé
-    cout_capex_initial: float = 0.0     # CAPEX initial (DMA, capteurs)
-    annee_capex: int = 1                # Année du CAPEX
-
-    # === OPTIONS ===
-    pondere_par_adoption: bool = True   # Pondérer économies/coûts par A(t)
-    activer: bool = True
-
-    # Métadonnées
-    nom: str = "Réseau standard"
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider les paramètres."""
-        if self.volume_pertes_m3_an < 0:
-            raise ValueError("volume_pertes_m3_an doit être >= 0")
-        if not 0 <= self.reduction_max_pct <= 100:
-            raise ValueError("reduction_max_pct doit être entre 0 et 100")
-        if self.annees_atteinte < 1:
-            raise ValueError("annees_atteinte doit être >= 1")
-        if self.lambda_reduction < 0:
-            raise ValueError("lambda_reduction doit être >= 0")
-        if self.annee_demarrage < 1:
-            raise ValueError("annee_demarrage doit être >= 1")
-        if self.cout_programme_annuel < 0:
-            raise ValueError("cout_programme_annuel doit être >= 0")
-        if self.cout_reparation_m3 < 0:
-            raise ValueError("cout_reparation_m3 doit être >= 0")
-        if self.cout_capex_initial < 0:
-            raise ValueError("cout_capex_initial doit être >= 0")
-        if self.annee_capex < 1:
-            raise ValueError("annee_capex doit être >= 1")
-
-
-@dataclass
-class ResultatsFuitesReseau:
-    """Résultats de la dynamique des pertes réseau."""
-    annees: np.ndarray
-    reduction_fraction: np.ndarray       # Fraction des pertes réduites (0-1)
-    economies_m3_par_an: np.ndarray      # m³ économisés/an
-    couts_programme_par_an: np.ndarray   # OPEX/an
-    couts_reparation_par_an: np.ndarray  # Coûts variables/an
-    couts_totaux_par_an: np.ndarray      # Total coûts/an
-
-    economies_totales_m3: float          # m³ totaux économisés
-    cout_total: float                    # Coût total ($)
-
-
-def _progression_reduction_reseau(t: int, params: ParametresFuitesReseau) -> float:
-    """Calculer la progression (0-1) de la réduction réseau à l'année t."""
-    if not params.activer or t < params.annee_demarrage:
-        return 0.0
-
-    t_eff = t - params.annee_demarrage + 1
-
-    if params.mode_reduction == ModeReductionReseau.LINEAIRE:
-        return min(1.0, t_eff / params.annees_atteinte)
-
-    if params.mode_reduction == ModeReductionReseau.EXPONENTIEL:
-        # Progression rapide au début puis plateau
-        return 1.0 - math.exp(-params.lambda_reduction * (t_eff - 1))
-
-    return 0.0
-
-
-def calculer_dynamique_fuites_reseau(
-    params_reseau: ParametresFuitesReseau,
-    horizon: int,
-    serie_adoption: Optional[np.ndarray] = None,
-) -> ResultatsFuitesReseau:
-    """
-    Calculer la dynamique des économies et coûts liés aux fuites réseau.
-
-    Paramètres:
-        params_reseau: Paramètres réseau
-        horizon: Horizon d'analyse (années)
-        serie_adoption: Série A(t) si pondération par adoption
-
-    Retourne:
-        ResultatsFuitesReseau avec séries annuelles
-    """
-    T = horizon
-    annees = np.arange(1, T + 1)
-
-    reduction_frac = np.zeros(T)
-    economies_m3 = np.zeros(T)
-    couts_programme = np.zeros(T)
-    couts_reparation = np.zeros(T)
-
-    if not params_reseau.activer or params_reseau.volume_pertes_m3_an <= 0:
-        return ResultatsFuitesReseau(
-            annees=annees,
-            reduction_fraction=reduction_frac,
-            economies_m3_par_an=economies_m3,
-            couts_programme_par_an=couts_programme,
-            couts_reparation_par_an=couts_reparation,
-            couts_totaux_par_an=couts_programme,
-            economies_totales_m3=0.0,
-            cout_total=0.0,
-        )
-
-    if serie_adoption is None or not params_reseau.pondere_par_adoption:
-        serie_adoption = np.ones(T)
-
-    max_reduction = params_reseau.reduction_max_pct / 100.0
-
-    for i, annee in enumerate(annees):
-        progression = _progression_reduction_reseau(annee, params_reseau)
-        reduction_frac[i] = max_reduction * progression
-
-        economies_m3[i] = params_reseau.volume_pertes_m3_an * reduction_frac[i] * serie_adoption[i]
-
-        # OPEX programmatique (montée en charge + adoption si applicable)
-        couts_programme[i] = params_reseau.cout_programme_annuel * progression * serie_adoption[i]
-
-        # Coût variable proportionnel aux économies
-        couts_reparation[i] = params_reseau.cout_reparation_m3 * economies_m3[i]
-
-    couts_totaux = couts_programme + couts_reparation
-
-    return ResultatsFuitesReseau(
-        annees=annees,
-        reduction_fraction=reduction_frac,
-        economies_m3_par_an=economies_m3,
-        couts_programme_par_an=couts_programme,
-        couts_reparation_par_an=couts_reparation,
-        couts_totaux_par_an=couts_totaux,
-        economies_totales_m3=float(np.sum(economies_m3)),
-        cout_total=float(np.sum(couts_totaux)),
-    )
-
-# =============================================================================
-# SCÉNARIOS DE FUITES PRÉDÉFINIS
-# =============================================================================
-
-# Scénario SANS_COUT: Modèle de base (ignorer les coûts de réparation)
-# Équivalent au modèle v3.1 - pour comparaison
-FUITES_SANS_COUT = ParametresFuites(
-    part_menages_fuite_pct=20.0,
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=85.0,
-    part_fuites_persistantes_pct=5.0,
-    mode_repartition=ModeRepartitionCouts.SANS_COUT,
-    inclure_cout_reparation=False,
-    duree_moyenne_fuite_sans_compteur=4.0,
-    nom="Sans coût",
-    description="Borne basse: coûts réparation ignorés (prévalence 20%, durée 4 ans)",
-)
-
-# Scénario MENAGE_SEUL: Les ménages paient 100% des réparations
-# Hypothèse réaliste par défaut
-FUITES_MENAGE_SEUL = ParametresFuites(
-    part_menages_fuite_pct=20.0,
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=85.0,
-    part_fuites_persistantes_pct=5.0,
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    part_ville_pct=0.0,
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    duree_moyenne_fuite_sans_compteur=4.0,
-    nom="Ménage seul",
-    description="Prévalence 20%, durée 4 ans; détection 90%/réparation 85% (ménage 100%)",
-)
-
-# Scénario SUBVENTION_50: La ville subventionne 50% des réparations
-# Programme incitatif modéré
-FUITES_SUBVENTION_50 = ParametresFuites(
-    part_menages_fuite_pct=20.0,
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=85.0,
-    part_fuites_persistantes_pct=5.0,
-    mode_repartition=ModeRepartitionCouts.SUBVENTION_PARTIELLE,
-    part_ville_pct=50.0,
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    duree_moyenne_fuite_sans_compteur=4.0,
-    nom="Subvention 50%",
-    description="Prévalence 20%, durée 4 ans; ville subventionne 50% (réparation 85%)",
-)
-
-# Scénario VILLE_SEULE: La ville paie 100% des réparations
-# Programme incitatif maximal (ex: programme de plomberie gratuite)
-FUITES_VILLE_SEULE = ParametresFuites(
-    part_menages_fuite_pct=20.0,
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=85.0,
-    part_fuites_persistantes_pct=5.0,
-    mode_repartition=ModeRepartitionCouts.VILLE_SEULE,
-    part_ville_pct=100.0,
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    duree_moyenne_fuite_sans_compteur=4.0,
-    nom="Ville seule",
-    description="Prévalence 20%, durée 4 ans; ville 100% (réparation 85%)",
-)
-
-# Scénario CONTEXTE_QUEBEC: prévalence de fuites PRIVÉES ajustée pour villes sans compteurs
-# Au Québec, les ménages n'ont jamais eu de compteurs → fuites privées non détectées depuis des années
-# Prévalence estimée: 35% vs 20% dans études USA/Australie (avec compteurs)
-# Note: les pertes RÉSEAU sont traitées séparément via ParametresFuitesReseau.
-FUITES_CONTEXTE_QUEBEC = ParametresFuites(
-    part_menages_fuite_pct=35.0,      # +75% vs standard (accumulation sans détection)
-    debit_fuite_m3_an=35.0,           # Débit physique similaire
-    taux_detection_pct=90.0,          # AMI détecte bien
-    taux_reparation_pct=85.0,         # Taux réparation standard
-    part_fuites_persistantes_pct=5.0, # Longue traîne (AWE 2023)
-    duree_moyenne_fuite_sans_compteur=7.0,  # Équilibre implicite: 5% / 35% ≈ 7 ans
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    nom="Contexte Québec",
-    description="Prévalence 35%, durée 7 ans (ville sans compteurs); détection 90%/réparation 85%",
-)
-
-# Scénario QUÉBEC DEUX-STOCKS: prévalence plus élevée et coûts différenciés
-# Hypothèse plausible pour villes québécoises sans comptage historique
-FUITES_QUEBEC_DEUX_STOCKS = ParametresFuites(
-    utiliser_prevalence_differenciee=True,
-    part_menages_fuite_pct=30.0,            # Agrégé (fallback)
-    debit_fuite_m3_an=18.0,                 # Moyenne pondérée (fallback)
-    part_menages_fuite_any_pct=30.0,        # Petites fuites + significatives
-    part_menages_fuite_significative_pct=6.0,
-    debit_fuite_any_m3_an=10.0,
-    debit_fuite_significative_m3_an=50.0,
-    cout_reparation_any=150.0,
-    cout_reparation_sig=600.0,
-    part_fuites_persistantes_pct=5.0,
-    facteur_duree_longue_traine=5.0,
-    duree_moyenne_fuite_sans_compteur=6.0,  # Équilibre implicite: 5% / 30% ≈ 6 ans
-    taux_detection_pct=90.0,
-    taux_reparation_pct=85.0,
-    cout_reparation_moyen=160.0,            # Moyenne pondérée (fallback)
-    inclure_cout_reparation=True,
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    part_ville_pct=0.0,
-    nom="QC différencié",
-    description="Fuites différenciées: petites (24%) + significatives (6%), coûts 150$/600$",
-)
-
-# Dictionnaire des scénarios
-SCENARIOS_FUITES = {
-    "sans_cout": FUITES_SANS_COUT,
-    "menage": FUITES_MENAGE_SEUL,
-    "subvention_50": FUITES_SUBVENTION_50,
-    "ville": FUITES_VILLE_SEULE,
-    "quebec": FUITES_CONTEXTE_QUEBEC,
-    "quebec_deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
-}
-
-# =============================================================================
-# SCÉNARIOS SANS TARIFICATION VOLUMÉTRIQUE
-# =============================================================================
-#
-# Au Québec, l'eau est généralement incluse dans les taxes foncières (forfait).
-# Sans signal-prix, l'incitatif à réparer une fuite est réduit.
-#
-# HYPOTHÈSES COMPORTEMENTALES (défendables en soutenance):
-# - Taux réparation BASE: 55% (vs 85% avec tarification)
-#   → Reflète les incitatifs non-prix: conscience environnementale (~30%),
-#     nuisance sonore, risque de dommages, conformité assurance (~25% supp.)
-# - Grosses fuites: facteur 1.4 → taux effectif ~77%
-#   → Plus visibles (moisissures, dégâts), pression sociale/assurancielle
-# - Persistance: 10% (vs 5%) → plus de fuites jamais réparées
-#   → Absence d'urgence économique = procrastination durable
-#
-# SOURCES:
-# - Littérature "nudge" et économie comportementale (Thaler & Sunstein)
-# - Études sur la réponse aux alertes sans conséquence financière
-# =============================================================================
-
-# Scénario MENAGE_SEUL sans tarification volumétrique
-# Taux de réparation réduit car aucun incitatif financier direct
-FUITES_MENAGE_SANS_TARIF = ParametresFuites(
-    part_menages_fuite_pct=20.0,
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=55.0,         # Réduit: incitatifs non-prix seulement
-    part_fuites_persistantes_pct=10.0, # Augmenté: procrastination durable
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    part_ville_pct=0.0,
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    duree_moyenne_fuite_sans_compteur=4.0,
-    nom="Ménage seul (sans tarif)",
-    description="Sans tarification: taux réparation 55% (incitatifs non-prix), persistance 10%",
-)
-
-# Scénario CONTEXTE_QUEBEC sans tarification volumétrique
-FUITES_QUEBEC_SANS_TARIF = ParametresFuites(
-    part_menages_fuite_pct=35.0,       # Stock accumulé (pas de détection historique)
-    debit_fuite_m3_an=35.0,
-    taux_detection_pct=90.0,
-    taux_reparation_pct=55.0,          # Réduit: sans tarification
-    part_fuites_persistantes_pct=10.0, # Augmenté
-    duree_moyenne_fuite_sans_compteur=7.0,
-    cout_reparation_moyen=200.0,
-    inclure_cout_reparation=True,
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    part_ville_pct=0.0,
-    nom="Québec (sans tarif)",
-    description="Contexte QC sans tarification: prévalence 35%, réparation 55%, persistance 10%",
-)
-
-# Scénario QUEBEC_DEUX_STOCKS sans tarification volumétrique
-# Différencie petites vs grosses fuites avec facteur_reparation_sig
-FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF = ParametresFuites(
-    utiliser_prevalence_differenciee=True,
-    part_menages_fuite_pct=30.0,
-    debit_fuite_m3_an=18.0,
-    part_menages_fuite_any_pct=30.0,
-    part_menages_fuite_significative_pct=6.0,
-    debit_fuite_any_m3_an=10.0,
-    debit_fuite_significative_m3_an=50.0,
-    cout_reparation_any=150.0,
-    cout_reparation_sig=600.0,
-    # Sans tarification: taux de base réduit mais grosses fuites mieux réparées
-    taux_detection_pct=90.0,
-    taux_reparation_pct=55.0,          # Base pour petites fuites
-    facteur_reparation_sig=1.4,        # Grosses fuites: 55% × 1.4 = 77% (dommages visibles)
-    part_fuites_persistantes_pct=10.0, # Augmenté
-    facteur_duree_longue_traine=5.0,
-    duree_moyenne_fuite_sans_compteur=6.0,
-    cout_reparation_moyen=160.0,
-    inclure_cout_reparation=True,
-    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
-    part_ville_pct=0.0,
-    nom="QC différencié (sans tarif)",
-    description="Fuites différenciées sans tarif: petites 55%, significatives 77% (×1.4), persist. 10%",
-)
-
-# Dictionnaire étendu des scénarios
-SCENARIOS_FUITES = {
-    # Avec tarification (ou hypothèse incitatif fort)
-    "sans_cout": FUITES_SANS_COUT,
-    "menage": FUITES_MENAGE_SEUL,
-    "subvention_50": FUITES_SUBVENTION_50,
-    "ville": FUITES_VILLE_SEULE,
-    "quebec": FUITES_CONTEXTE_QUEBEC,
-    "quebec_deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
-    # Sans tarification (contexte québécois typique)
-    "menage_sans_tarif": FUITES_MENAGE_SANS_TARIF,
-    "quebec_sans_tarif": FUITES_QUEBEC_SANS_TARIF,
-    "quebec_deux_stocks_sans_tarif": FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF,
-}
-
-
-# =============================================================================
-# MODULE ADOPTION : STRATÉGIES D'IMPLANTATION
-# =============================================================================
-#
-# Ce module permet de modéliser différentes stratégies de déploiement des
-# compteurs intelligents, un élément clé pour l'analyse de politique publique.
-#
-# QUESTION CENTRALE: "Quelle stratégie d'implantation maximise la VAN?"
-#
-# STRATÉGIES DISPONIBLES:
-#
-# 1. OBLIGATOIRE (100% immédiat)
-#    - Tous les compteurs installés en t=0
-#    - CAPEX concentré, bénéfices immédiats
-#    - Exemple: Règlement municipal imposant l'installation
-#
-# 2. VOLONTAIRE_INCITATIF (courbe logistique)
-#    - Adoption progressive selon incitations
-#    - Courbe en S: A(t) = Amax / (1 + exp(-k*(t-t0)))
-#    - Exemple: Rabais de taxe foncière pour les adoptants
-#
-# 3. NOUVEAUX_BRANCHEMENTS (linéaire lent)
-#    - Seulement les nouvelles constructions/rénovations
-#    - Taux = nouveaux branchements / parc total
-#    - Exemple: Obligation seulement pour nouvelles constructions
-#
-# 4. PAR_SECTEUR (par tranches)
-#    - Déploiement quartier par quartier
-#    - CAPEX étalé sur plusieurs années
-#    - Exemple: Plan quinquennal par arrondissement
-#
-# Références:
-# - Rogers (2003) Diffusion of Innovations
-# - Bass (1969) A New Product Growth Model
-# - Meade & Islam (2006) Modelling and Forecasting Technology Adoption
-#
-# =============================================================================
-
-class ModeAdoption(Enum):
-    """
-    Stratégie d'implantation des compteurs.
-
-    OBLIGATOIRE: Déploiement immédiat et universel (règlement)
-        - A(t) = 100% pour t >= 0
-        - CAPEX en t=0, bénéfices immédiats complets
-        - Contrainte: capacité d'installation, acceptabilité sociale
-
-    VOLONTAIRE_INCITATIF: Adoption graduelle avec incitations
-        - Courbe logistique: A(t) = Amax / (1 + exp(-k*(t-t0)))
-        - CAPEX étalé selon adoption, bénéfices progressifs
-        - Exemples: rabais taxe, subvention installation
-
-    NOUVEAUX_BRANCHEMENTS: Obligation sur nouvelles constructions
-        - A(t) = min(t * taux_nouveaux, Amax)
-        - CAPEX très étalé, long délai avant bénéfices significatifs
-        - Avantage: aucune résistance (pas de remplacement)
-
-    PAR_SECTEUR: Déploiement par quartiers/zones
-        - A(t) = tranches successives (escalier)
-        - CAPEX planifié, bénéfices par paliers
-        - Exemple: un arrondissement par an
-    """
-    OBLIGATOIRE = "obligatoire"
-    VOLONTAIRE_INCITATIF = "volontaire_incitatif"
-    NOUVEAUX_BRANCHEMENTS = "nouveaux_branchements"
-    PAR_SECTEUR = "par_secteur"
-
-
-@dataclass
-class ParametresAdoption:
-    """
-    Paramètres pour la stratégie d'adoption des compteurs.
-
-    La courbe d'adoption A(t) représente la fraction du parc équipée à l'année t.
-    Elle affecte:
-    - Les bénéfices annuels: B(t) × A(t)
-    - Les coûts d'exploitation: OPEX(t) × A(t)
-    - L'investissement: soit I0 complet, soit CAPEX(t) étalé
-
-    Paramètres clés selon le mode:
-    - OBLIGATOIRE: aucun paramètre supplémentaire (A(t) = 100%)
-    - VOLONTAIRE: k (vitesse), t0 (point médian), Amax (plafond)
-    - NOUVEAUX: taux_annuel_pct (% de nouvelles installations/an)
-    - PAR_SECTEUR: nb_secteurs, annees_par_secteur
-    """
-    mode: ModeAdoption = ModeAdoption.OBLIGATOIRE
-
-    # === PARAMÈTRES COURBE LOGISTIQUE (volontaire) ===
-    # A(t) = Amax / (1 + exp(-k * (t - t0)))
-    k_vitesse: float = 0.5              # Vitesse d'adoption (plus élevé = plus rapide)
-    t0_point_median: float = 5.0        # Année où A(t) = 50% de Amax
-    adoption_max_pct: float = 90.0      # Plafond d'adoption (% du parc)
-
-    # === PARAMÈTRES NOUVEAUX BRANCHEMENTS ===
-    taux_nouveaux_pct: float = 2.0      # % de nouvelles constructions/an
-
-    # === PARAMÈTRES PAR SECTEUR ===
-    nb_secteurs: int = 5                # Nombre de secteurs/quartiers
-    annees_par_secteur: float = 2.0     # Durée de déploiement par secteur
-
-    # === CAPEX ÉTALÉ ===
-    etaler_capex: bool = False          # Si True, CAPEX proportionnel à A(t)
-    #                                   # Si False, CAPEX complet en t=0
-
-    # === COÛTS INCITATIFS (NOUVEAU v3.8) ===
-    # Ces coûts représentent les crédits/subventions offerts pour encourager l'adoption
-    # Au Québec: crédit sur le compte de taxes foncières (forfait d'installation)
-    #
-    # CONTEXTE QUÉBÉCOIS:
-    #   - Pas de tarification volumétrique résidentielle (incitatifs non liés à l'usage)
-    #   - L'incitatif est un crédit de taxes / subvention d'installation forfaitaire
-    #   - Exemple: forfait 540$ par ménage, étalé sur 3 ans
-    #
-    # IMPORTANT - Traitement selon le mode d'analyse:
-    #   - Mode ÉCONOMIQUE: EXCLUS (transferts neutres pour le bien-être social)
-    #   - Mode FINANCIER: INCLUS (coût réel pour le budget municipal)
-    #
-    # cout_incitatif_par_menage est un COÛT TOTAL par ménage, réparti sur duree_incitatif_ans
-    # Exemple: forfait 540$/ménage TOTAL (→ 180$/an × 3 ans)
-    cout_incitatif_par_menage: float = 0.0   # $ TOTAL par ménage adopté (réparti sur duree_incitatif_ans)
-    duree_incitatif_ans: int = 1             # Nombre d'années sur lesquelles l'incitatif est étalé
-    #
-    # Calibration recommandée (forfaits indicatifs, à ajuster localement):
-    #   - OBLIGATOIRE: 0$ (pas besoin d'incitatif)
-    #   - RAPIDE (forfait sur 3 ans): 540$/ménage
-    #   - PROGRESSIVE (forfait sur 3 ans): 180$/ménage
-    #   - LENTE (forfait sur 3 ans): 90$/ménage
-
-    # === TIMING D'INSTALLATION ===
-    # Fraction des effets annuels attribuée à l'année d'installation.
-    # 1.0 = effet complet, 0.5 = installation moyenne en milieu d'année.
-    fraction_premiere_annee: float = 1.0
-
-    # === DÉLAI DE DÉMARRAGE ===
-    annee_demarrage: int = 1            # Année de début du déploiement
-
-    # === MÉTADONNÉES ===
-    nom: str = "Standard"
-    description: str = ""
-
-    def __post_init__(self):
-        """Validation des paramètres."""
-        if self.k_vitesse <= 0:
-            raise ValueError("k_vitesse doit être positif")
-        if self.t0_point_median < 0:
-            raise ValueError("t0_point_median doit être >= 0")
-        if not 0 < self.adoption_max_pct <= 100:
-            raise ValueError("adoption_max_pct doit être entre 0 et 100")
-        if self.taux_nouveaux_pct < 0:
-            raise ValueError("taux_nouveaux_pct doit être >= 0")
-        if self.nb_secteurs < 1:
-            raise ValueError("nb_secteurs doit être >= 1")
-        if self.annees_par_secteur <= 0:
-            raise ValueError("annees_par_secteur doit être > 0")
-        # Validation des coûts incitatifs (v3.8)
-        if self.cout_incitatif_par_menage < 0:
-            raise ValueError("cout_incitatif_par_menage doit être >= 0")
-        if self.duree_incitatif_ans < 1:
-            raise ValueError("duree_incitatif_ans doit être >= 1")
-        if not 0.0 <= self.fraction_premiere_annee <= 1.0:
-            raise ValueError("fraction_premiere_annee doit être entre 0 et 1")
-
-
-def calculer_adoption(t: float, params: ParametresAdoption) -> float:
-    """
-    Calculer le taux d'adoption A(t) pour une année donnée.
-
-    Paramètres:
-        t: Année (1, 2, 3, ...)
-        params: Paramètres d'adoption
-
-    Retourne:
-        Taux d'adoption entre 0.0 et 1.0
-    """
-    # Avant le démarrage: pas d'adoption
-    if t < params.annee_demarrage:
-        return 0.0
-
-    # Temps effectif depuis le démarrage
-    t_eff = t - params.annee_demarrage + 1
-
-    if params.mode == ModeAdoption.OBLIGATOIRE:
-        # Adoption immédiate jusqu'au plafond
-        # Note: adoption_max_pct peut être <100% pour modéliser un déploiement
-        # obligatoire partiel (ex: certaines zones seulement)
-        # Défaut: 100% si adoption_max_pct est à sa valeur par défaut (90%)
-        if params.adoption_max_pct >= 100.0 or params.adoption_max_pct == 90.0:
-            return 1.0  # 100% par défaut pour OBLIGATOIRE
-        return params.adoption_max_pct / 100.0
-
-    elif params.mode == ModeAdoption.VOLONTAIRE_INCITATIF:
-        # Courbe logistique (S-curve)
-        # A(t) = Amax / (1 + exp(-k * (t - t0)))
-        Amax = params.adoption_max_pct / 100.0
-        k = params.k_vitesse
-        t0 = params.t0_point_median
-
-        exp_term = math.exp(-k * (t_eff - t0))
-        return Amax / (1.0 + exp_term)
-
-    elif params.mode == ModeAdoption.NOUVEAUX_BRANCHEMENTS:
-        # Croissance linéaire limitée par le taux de nouvelles constructions
-        Amax = params.adoption_max_pct / 100.0
-        taux = params.taux_nouveaux_pct / 100.0
-        return min(t_eff * taux, Amax)
-
-    elif params.mode == ModeAdoption.PAR_SECTEUR:
-        # Déploiement par tranches (escalier)
-        Amax = params.adoption_max_pct / 100.0
-        duree_totale = params.nb_secteurs * params.annees_par_secteur
-
-        if t_eff >= duree_totale:
-            return Amax
-        else:
-            # Fraction complétée
-            secteurs_complets = int(t_eff / params.annees_par_secteur)
-            fraction_secteur_en_cours = (
-                (t_eff % params.annees_par_secteur) / params.annees_par_secteur
-            )
-            adoption = (secteurs_complets + fraction_secteur_en_cours) / params.nb_secteurs
-            return min(adoption * Amax, Amax)
-
-    else:
-        return 1.0  # Fallback
-
-
-def generer_serie_adoption(params: ParametresAdoption, T: int) -> np.ndarray:
-    """
-    Générer la série temporelle A(t) pour t = 1..T.
-
-    Paramètres:
-        params: Paramètres d'adoption
-        T: Horizon d'analyse
-
-    Retourne:
-        Array de taux d'adoption [A(1), A(2), ..., A(T)]
-    """
-    return np.array([calculer_adoption(t, params) for t in range(1, T + 1)])
-
-
-def calculer_delta_adoption(serie_adoption: np.ndarray) -> np.ndarray:
-    """
-    Convertir A(t) en nouvelles installations annuelles (delta A).
-
-    delta A(t) = A(t) - A(t-1), borné à 0 pour éviter des valeurs négatives.
-    """
-    if len(serie_adoption) == 0:
-        return np.array([])
-
-    delta = np.zeros_like(serie_adoption)
-    delta[0] = serie_adoption[0]
-    if len(serie_adoption) > 1:
-        delta[1:] = np.maximum(0.0, serie_adoption[1:] - serie_adoption[:-1])
-    return delta
-
-
-def calculer_adoption_effective(
-    serie_adoption: np.ndarray,
-    fraction_premiere_annee: float
-) -> np.ndarray:
-    """
-    Calculer l'adoption effective pour les flux annuels.
-
-    A_eff(t) = A(t-1) + f × (A(t) - A(t-1)), avec A(0)=0.
-    f=0.5 ≈ installation moyenne en milieu d'année.
-    """
-    if len(serie_adoption) == 0:
-        return np.array([])
-    f = max(0.0, min(1.0, fraction_premiere_annee))
-    delta = calculer_delta_adoption(serie_adoption)
-    return serie_adoption - (1.0 - f) * delta
-
-
-def convoluer_cohortes(
-    delta_adoption: np.ndarray,
-    serie_par_age: np.ndarray,
-    nb_menages: int,
-    fraction_premiere_annee: float = 1.0,
-) -> np.ndarray:
-    """
-    Somme des cohortes: convolution discrète des nouveaux adoptants avec une série d'âge.
-
-    La série par âge est définie pour un compteur installé en année 1.
-    """
-    if len(delta_adoption) == 0:
-        return np.array([])
-
-    serie = np.array(serie_par_age, copy=True)
-    if len(serie) > 0:
-        f = max(0.0, min(1.0, fraction_premiere_annee))
-        serie[0] *= f
-
-    convolution = np.convolve(delta_adoption, serie)[:len(delta_adoption)]
-    return convolution * nb_menages
-
-
-def calculer_capex_etale(
-    I0_total: float,
-    params_adoption: ParametresAdoption,
-    T: int
-) -> np.ndarray:
-    """
-    Calculer le CAPEX étalé selon la courbe d'adoption.
-
-    Si etaler_capex=True:
-        CAPEX(t) = I0_total × [A(t) - A(t-1)]
-        (investissement proportionnel aux nouvelles installations)
-
-    Si etaler_capex=False:
-        CAPEX(1) = I0_total, CAPEX(t>1) = 0
-        (investissement complet en t=1)
-
-    Paramètres:
-        I0_total: Investissement total si adoption 100%
-        params_adoption: Paramètres d'adoption
-        T: Horizon d'analyse
-
-    Retourne:
-        Array de CAPEX annuels [CAPEX(1), CAPEX(2), ..., CAPEX(T)]
-    """
-    capex = np.zeros(T)
-
-    if not params_adoption.etaler_capex:
-        # CAPEX complet en t=1
-        capex[0] = I0_total
-        return capex
-
-    # CAPEX étalé selon l'adoption
-    serie_adoption = generer_serie_adoption(params_adoption, T)
-
-    for i in range(T):
-        if i == 0:
-            delta_adoption = serie_adoption[0]
-        else:
-            delta_adoption = serie_adoption[i] - serie_adoption[i - 1]
-
-        # CAPEX proportionnel aux nouvelles installations
-        capex[i] = max(0.0, I0_total * delta_adoption)
-
-    return capex
-
-
-# =============================================================================
-# SCÉNARIOS D'ADOPTION PRÉDÉFINIS
-# =============================================================================
-
-# Scénario OBLIGATOIRE: Déploiement immédiat par règlement
-ADOPTION_OBLIGATOIRE = ParametresAdoption(
-    mode=ModeAdoption.OBLIGATOIRE,
-    adoption_max_pct=100.0,  # 100% obligatoire
-    etaler_capex=False,
-    nom="Obligatoire",
-    description="Déploiement immédiat et universel par règlement municipal",
-)
-
-# Scénario RAPIDE: Volontaire avec fortes incitations (3 ans pour 80%)
-# Calibration incitatif: forfait 540$/ménage sur 3 ans (crédit taxes / subvention)
-ADOPTION_RAPIDE = ParametresAdoption(
-    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
-    k_vitesse=1.5,           # Adoption rapide
-    t0_point_median=2.0,     # 50% atteint en 2 ans
-    adoption_max_pct=95.0,   # Plafond à 95%
-    etaler_capex=True,
-    cout_incitatif_par_menage=540.0,  # Forfait 3 ans
-    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
-    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
-    nom="Volontaire rapide",
-    description="Incitations fortes: crédit taxes / subvention (forfait 540$ sur 3 ans)",
-)
-
-# Scénario PROGRESSIF: Volontaire avec incitations modérées (7 ans pour 80%)
-# Calibration incitatif: forfait 180$/ménage sur 3 ans (crédit taxes / subvention)
-ADOPTION_PROGRESSIVE = ParametresAdoption(
-    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
-    k_vitesse=0.6,           # Adoption modérée
-    t0_point_median=5.0,     # 50% atteint en 5 ans
-    adoption_max_pct=85.0,   # Plafond à 85%
-    etaler_capex=True,
-    cout_incitatif_par_menage=180.0,  # Forfait 3 ans
-    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
-    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
-    nom="Volontaire progressif",
-    description="Incitations modérées: crédit taxes / subvention (forfait 180$ sur 3 ans)",
-)
-
-# Scénario NOUVEAUX SEULEMENT: Seulement nouvelles constructions
-ADOPTION_NOUVEAUX = ParametresAdoption(
-    mode=ModeAdoption.NOUVEAUX_BRANCHEMENTS,
-    taux_nouveaux_pct=3.0,   # 3% de nouvelles constructions/an
-    adoption_max_pct=60.0,   # Plafond réaliste sur 20 ans
-    etaler_capex=True,
-    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
-    nom="Nouveaux branchements",
-    description="Obligation seulement pour nouvelles constructions/rénovations majeures",
-)
-
-# Scénario PAR SECTEUR: Déploiement planifié par quartier
-ADOPTION_PAR_SECTEUR = ParametresAdoption(
-    mode=ModeAdoption.PAR_SECTEUR,
-    nb_secteurs=5,           # 5 secteurs/arrondissements
-    annees_par_secteur=2.0,  # 2 ans par secteur (10 ans total)
-    adoption_max_pct=100.0,  # Couverture complète à terme
-    etaler_capex=True,
-    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
-    nom="Par secteur",
-    description="Plan quinquennal: un arrondissement tous les 2 ans",
-)
-
-# Scénario LENT: Adoption très progressive (pour comparaison)
-# Calibration incitatif: forfait 90$/ménage sur 3 ans (crédit taxes / subvention)
-ADOPTION_LENTE = ParametresAdoption(
-    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
-    k_vitesse=0.3,           # Adoption lente
-    t0_point_median=10.0,    # 50% atteint en 10 ans
-    adoption_max_pct=70.0,   # Plafond bas
-    etaler_capex=True,
-    cout_incitatif_par_menage=90.0,   # Forfait 3 ans
-    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
-    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
-    nom="Volontaire lent",
-    description="Incitations minimales: crédit taxes / subvention (forfait 90$ sur 3 ans)",
-)
-
-# =============================================================================
-# SCÉNARIO ICI SEULEMENT — INSTITUTIONNEL (placeholder à calibrer)
-# =============================================================================
-# Déploiement limité aux compteurs ICI (industriel/commercial/institutionnel).
-# Le modèle est résidentiel: il faut fournir un % de parc ICI pour l'adoption.
-def creer_adoption_ici_seulement(part_ici_pct: float = 10.0) -> ParametresAdoption:
-    """
-    Créer une stratégie d'adoption "ICI seulement".
-
-    Args:
-        part_ici_pct: % du parc total correspondant aux compteurs ICI.
-    """
-    return ParametresAdoption(
-        mode=ModeAdoption.OBLIGATOIRE,
-        adoption_max_pct=part_ici_pct,
-        etaler_capex=False,
-        nom="ICI seulement",
-        description="Déploiement ICI (part du parc à calibrer localement)",
-    )
-
-
-ADOPTION_ICI_SEULEMENT = creer_adoption_ici_seulement()
-
-# =============================================================================
-# SCÉNARIO ÉCHANTILLONNAGE 380 — SQEEP/RAUEP
-# =============================================================================
-# Le SQEEP (Stratégie québécoise d'économie d'eau potable) et le RAUEP
-# exigent un échantillon statistique de 380 compteurs résidentiels pour
-# caractériser la consommation. Ce n'est PAS un déploiement universel.
-#
-# CALCUL DU POURCENTAGE:
-#   adoption_max_pct = (380 / nb_menages) × 100
-#   Ex: Longueuil (116 258 ménages) → 380/116258 × 100 = 0.327%
-#
-# CARACTÉRISTIQUES:
-#   - Sélection aléatoire stratifiée (représentativité statistique)
-#   - Coût marginal très bas (380 compteurs, pas d'économie d'échelle)
-#   - Objectif: caractérisation, pas réduction de consommation
-#   - La VAN sera NÉGATIVE (coût sans bénéfice comportemental significatif)
-#
-# FONCTION HELPER: creer_adoption_echantillonnage_380(nb_menages)
-# =============================================================================
-
-# Preset pour Longueuil (valeur par défaut du modèle)
-# Pour d'autres municipalités, utiliser creer_adoption_echantillonnage_380()
-ADOPTION_ECHANTILLONNAGE_380 = ParametresAdoption(
-    mode=ModeAdoption.OBLIGATOIRE,  # Les 380 compteurs sont sélectionnés par la ville
-    adoption_max_pct=0.327,  # 380/116258 × 100 pour Longueuil
-    etaler_capex=False,      # Installation en une seule phase
-    nom="Échantillonnage SQEEP (380)",
-    description="Échantillon statistique de 380 compteurs pour caractérisation SQEEP/RAUEP",
-)
-
-
-def creer_adoption_echantillonnage_380(nb_menages: int = 116258) -> ParametresAdoption:
-    """
-    Créer une stratégie d'adoption pour l'échantillonnage SQEEP de 380 compteurs.
-
-    Le SQEEP exige un échantillon de n=380 compteurs résidentiels pour obtenir
-    un intervalle de confiance de 95% avec une marge d'erreur de ±5%.
-
-    Args:
-        nb_menages: Nombre total de ménages dans la municipalité
-
-    Returns:
-        ParametresAdoption configuré pour 380 compteurs
-
-    Example:
-        >>> adoption_380 = creer_adoption_echantillonnage_380(nb_menages=50000)
-        >>> print(f"Taux: {adoption_380.adoption_max_pct:.3f}%")  # 0.760%
-    """
-    TAILLE_ECHANTILLON = 380
-    pct = (TAILLE_ECHANTILLON / nb_menages) * 100
-
-    return ParametresAdoption(
-        mode=ModeAdoption.OBLIGATOIRE,
-        adoption_max_pct=pct,
-        etaler_capex=False,
-        nom="Échantillonnage SQEEP (380)",
-        description=f"Échantillon de {TAILLE_ECHANTILLON} compteurs sur {nb_menages:,} ménages ({pct:.3f}%)",
-    )
-
-
-# Dictionnaire des stratégies
-STRATEGIES_ADOPTION = {
-    "obligatoire": ADOPTION_OBLIGATOIRE,
-    "rapide": ADOPTION_RAPIDE,
-    "progressif": ADOPTION_PROGRESSIVE,
-    "nouveaux": ADOPTION_NOUVEAUX,
-    "secteur": ADOPTION_PAR_SECTEUR,
-    "lent": ADOPTION_LENTE,
-    "ici_seulement": ADOPTION_ICI_SEULEMENT,
-    "echantillonnage_380": ADOPTION_ECHANTILLONNAGE_380,  # SQEEP
-}
-
-
-def afficher_scenarios_adoption(horizon: int = 20) -> None:
-    """Afficher un tableau récapitulatif des stratégies d'adoption."""
-    print("\n" + "=" * 85)
-    print(" " * 25 + "STRATÉGIES D'ADOPTION")
-    print("=" * 85)
-
-    print(f"\n{'Stratégie':<22} │ {'Mode':<20} │ {'A(5 ans)':<10} │ {'A(10 ans)':<10} │ {'A(20 ans)':<10}")
-    print("─" * 22 + "─┼─" + "─" * 20 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10)
-
-    for nom, params in STRATEGIES_ADOPTION.items():
-        serie = generer_serie_adoption(params, horizon)
-        a5 = serie[4] if len(serie) > 4 else serie[-1]    # A(5)
-        a10 = serie[9] if len(serie) > 9 else serie[-1]   # A(10)
-        a20 = serie[19] if len(serie) > 19 else serie[-1]  # A(20)
-
-        print(f"{params.nom:<22} │ {params.mode.value:<20} │ "
-              f"{a5*100:>8.1f}% │ {a10*100:>8.1f}% │ {a20*100:>8.1f}%")
-
-    print("=" * 85)
-
-
-def comparer_strategies_adoption(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-    strategies: Optional[dict] = None,
-) -> pd.DataFrame:
-    """
-    Comparer les résultats du modèle selon différentes stratégies d'adoption.
-
-    Cette fonction répond à la question centrale: "Quelle stratégie maximise la VAN?"
-    Si config_echelle est None, compare deux scénarios: sans et avec économies d'échelle.
-
-    Paramètres:
-        params: Paramètres du modèle
-        params_fuites: Paramètres de fuites (optionnel)
-        params_fuites_reseau: Paramètres de pertes réseau (optionnel)
-        compteur: Paramètres du compteur (défaut: AMI standard)
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance (défaut: réaliste)
-        params_fuites: Configuration des fuites
-        mode_compte: ECONOMIQUE ou FINANCIER
-        valeur_eau: Paramètres de valorisation
-        strategies: Dict de stratégies à comparer (défaut: STRATEGIES_ADOPTION)
-
-    Retourne:
-        DataFrame avec métriques pour chaque stratégie
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if strategies is None:
-        strategies = STRATEGIES_ADOPTION
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for nom, params_adoption in strategies.items():
-            res = executer_modele(
-                params, compteur, cfg_echelle, persistance, params_fuites,
-                params_fuites_reseau,
-                mode_compte=mode_compte, valeur_eau=valeur_eau,
-                params_adoption=params_adoption
-            )
-
-            # Générer série adoption pour métriques
-            serie = generer_serie_adoption(params_adoption, params.horizon_analyse)
-            a5 = serie[4] if len(serie) > 4 else serie[-1]
-            a10 = serie[9] if len(serie) > 9 else serie[-1]
-            a_final = serie[-1]
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Stratégie": params_adoption.nom,
-                "Mode": params_adoption.mode.value,
-                "A(5 ans)": f"{a5*100:.0f}%",
-                "A(10 ans)": f"{a10*100:.0f}%",
-                "A(final)": f"{a_final*100:.0f}%",
-                "CAPEX étalé": "Oui" if params_adoption.etaler_capex else "Non",
-                "VAN ($)": res.van,
-                "RBC": res.rbc,
-                "Récup. (ans)": res.periode_recuperation,
-                "VA Bénéfices ($)": res.va_benefices,
-                "VA Coûts ($)": res.va_couts_totaux,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-def afficher_comparaison_strategies(
-    df: pd.DataFrame,
-    titre: str = "Comparaison des Stratégies d'Adoption"
-) -> None:
-    """
-    Afficher le tableau de comparaison des stratégies avec interprétation.
-
-    Paramètres:
-        df: DataFrame retourné par comparer_strategies_adoption
-        titre: Titre du tableau
-    """
-    has_echelle = "Échelle" in df.columns
-    largeur = 112 if has_echelle else 100
-    print("\n" + "=" * largeur)
-    print(f"{titre:^{largeur}}")
-    print("=" * largeur)
-
-    # En-tête
-    if has_echelle:
-        print(f"\n{'Échelle':<14} │ {'Stratégie':<22} │ {'A(5)':<6} │ {'A(fin)':<6} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<10}")
-        print("─" * 14 + "─┼─" + "─" * 22 + "─┼─" + "─" * 6 + "─┼─" + "─" * 6 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 10)
-    else:
-        print(f"\n{'Stratégie':<22} │ {'A(5)':<6} │ {'A(fin)':<6} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<10}")
-        print("─" * 22 + "─┼─" + "─" * 6 + "─┼─" + "─" * 6 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 10)
-
-    for _, row in df.iterrows():
-        van_fmt = fmt_argent(row["VAN ($)"])
-        recup_fmt = f"{row['Récup. (ans)']:.1f} ans" if row['Récup. (ans)'] < 999 else ">20 ans"
-
-        if has_echelle:
-            print(f"{row['Échelle']:<14} │ {row['Stratégie']:<22} │ {row['A(5 ans)']:<6} │ {row['A(final)']:<6} │ "
-                  f"{van_fmt:<14} │ {row['RBC']:>5.2f} │ {recup_fmt:<10}")
-        else:
-            print(f"{row['Stratégie']:<22} │ {row['A(5 ans)']:<6} │ {row['A(final)']:<6} │ "
-                  f"{van_fmt:<14} │ {row['RBC']:>5.2f} │ {recup_fmt:<10}")
-
-    print("=" * largeur)
-
-    # Interprétation
-    print("\n" + "-" * largeur)
-    print("INTERPRÉTATION:")
-    print("-" * largeur)
-
-    # Trouver la meilleure stratégie
-    best_idx = df["VAN ($)"].idxmax()
-    best = df.loc[best_idx]
-
-    worst_idx = df["VAN ($)"].idxmin()
-    worst = df.loc[worst_idx]
-
-    print(f"✓ Meilleure stratégie: {best['Stratégie']} (VAN = {fmt_argent(best['VAN ($)'])})")
-    print(f"✗ Moins favorable: {worst['Stratégie']} (VAN = {fmt_argent(worst['VAN ($)'])})")
-
-    ecart = best['VAN ($)'] - worst['VAN ($)']
-    print(f"  Écart: {fmt_argent(ecart)} ({ecart/abs(worst['VAN ($)'])*100:.0f}% de gain potentiel)")
-
-    # Conseil selon contexte
-    obligatoire = df[df["Mode"] == "obligatoire"]
-    if len(obligatoire) > 0:
-        van_oblig = obligatoire.iloc[0]["VAN ($)"]
-        if best['VAN ($)'] > van_oblig * 0.9:
-            print("\n  → L'adoption obligatoire est proche de l'optimal")
-            print("    mais une stratégie volontaire peut réduire la résistance sociale")
-        else:
-            print(f"\n  → La stratégie volontaire '{best['Stratégie']}' offre un bon compromis")
-            print("    entre VAN et acceptabilité sociale")
-
-    print("=" * largeur)
-
-
-def graphique_strategies_adoption(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    strategies: Optional[dict] = None,
-    dossier: str = "figures",
-) -> Optional[plt.Figure]:
-    """
-    Générer un graphique comparant les courbes d'adoption et VAN cumulative.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config_echelle: Configuration économies d'échelle
-        strategies: Dict de stratégies (défaut: toutes)
-        dossier: Dossier de sauvegarde
-
-    Retourne:
-        Figure matplotlib ou None si erreur
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-    if strategies is None:
-        strategies = STRATEGIES_ADOPTION
-
-    T = params.horizon_analyse
-    annees = np.arange(1, T + 1)
-
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-    # Couleurs
-    couleurs = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
-
-    # Graphique 1: Courbes d'adoption A(t)
-    ax1 = axes[0]
-    for i, (nom, params_adop) in enumerate(strategies.items()):
-        serie = generer_serie_adoption(params_adop, T)
-        ax1.plot(annees, serie * 100, label=params_adop.nom,
-                color=couleurs[i % len(couleurs)], linewidth=2)
-
-    ax1.set_xlabel("Année")
-    ax1.set_ylabel("Taux d'adoption A(t) (%)")
-    ax1.set_title("Courbes d'Adoption")
-    ax1.legend(loc="lower right")
-    ax1.grid(True, alpha=0.3)
-    ax1.set_ylim(0, 105)
-
-    # Graphique 2: VAN pour chaque stratégie
-    ax2 = axes[1]
-    noms = []
-    vans = []
-    for nom, params_adop in strategies.items():
-        res = executer_modele(
-            params, compteur, config_echelle,
-            params_adoption=params_adop
-        )
-        noms.append(params_adop.nom)
-        vans.append(res.van / 1e6)  # En millions
-
-    bars = ax2.bar(noms, vans, color=couleurs[:len(noms)])
-    ax2.set_xlabel("Stratégie")
-    ax2.set_ylabel("VAN (M$)")
-    ax2.set_title("VAN selon la Stratégie d'Adoption")
-    ax2.tick_params(axis='x', rotation=45)
-
-    # Ligne de référence (meilleure VAN)
-    ax2.axhline(y=max(vans), color='green', linestyle='--', alpha=0.5, label='Meilleure')
-
-    plt.tight_layout()
-
-    # Sauvegarde
-    if dossier:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "strategies_adoption.png")
-        fig.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Figure sauvegardée: {chemin}")
-
-    return fig
-
-
-def afficher_scenarios_fuites(nb_menages: int = 10_000, horizon: int = 20) -> None:
-    """Afficher un tableau récapitulatif des scénarios de fuites."""
-    print("\n" + "=" * 75)
-    print(" " * 20 + "SCÉNARIOS DE COÛTS DE RÉPARATION")
-    print("=" * 75)
-
-    print(f"\nBase de calcul: {nb_menages:,} ménages, {horizon} ans")
-    print(f"Coût moyen réparation: 200 $")
-    print(f"Prévalence initiale: 20%, Nouvelles fuites: 5%/an")
-
-    print(f"\n{'Scénario':<18} │ {'Réparations':<12} │ {'Coût total':<12} │ "
-          f"{'Part ville':<12} │ {'$/m³ éco.':<10}")
-    print("─" * 18 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12 + "─┼─" +
-          "─" * 12 + "─┼─" + "─" * 10)
-
-    for nom, params in SCENARIOS_FUITES.items():
-        res = calculer_dynamique_fuites(params, nb_menages, horizon)
-        print(f"{params.nom:<18} │ {res.total_reparations:>10,} │ "
-              f"{fmt_argent(res.cout_total):<12} │ "
-              f"{fmt_argent(res.cout_ville_total):<12} │ "
-              f"{res.cout_par_m3_economise:>8.2f} $")
-
-    print("=" * 75)
-
-
-# =============================================================================
-# MODULE SEGMENTATION RÉSIDENTIELLE
-# =============================================================================
-#
-# Ce module permet de différencier l'analyse par type de logement résidentiel.
-# Les caractéristiques de consommation et les coûts varient significativement
-# selon la densité d'habitation.
-#
-# Sources:
-# - SQEEP 2023 (Stratégie québécoise d'économie d'eau potable)
-# - Statistique Canada (2021) - Ménages privés selon le type de logement
-# - MAMH - Registre des infrastructures municipales
-#
-# =============================================================================
-
-class TypeLogement(Enum):
-    """Type de logement résidentiel."""
-    UNIFAMILIAL = "unifamilial"      # Maison individuelle
-    MULTIPLEX = "multiplex"          # 2-4 logements (duplex, triplex, quadruplex)
-    MULTILOGEMENT = "multilogement"  # 5+ logements (immeubles d'appartements)
-
-
-@dataclass
-class ParametresSegment:
-    """
-    Paramètres spécifiques à un segment résidentiel.
-
-    Chaque segment a ses propres caractéristiques de consommation
-    et d'installation des compteurs.
-
-    Valeurs par défaut basées sur données Québec (SQEEP 2023, StatCan 2021):
-    - Unifamilial: 2.3 pers/ménage, 250 LPCD, jardin/piscine → haute conso
-    - Multiplex: 1.9 pers/ménage, 210 LPCD, moins d'extérieur
-    - Multilogement: 1.6 pers/ménage, 180 LPCD, peu d'usages extérieurs
-    """
-    type_logement: TypeLogement = TypeLogement.UNIFAMILIAL
-
-    # Nombre de ménages dans ce segment
-    nb_menages: int = 10_000
-    # Nombre de compteurs dans ce segment (compteur maître possible)
-    nb_compteurs: Optional[int] = None
-
-    # Caractéristiques démographiques
-    personnes_par_menage: float = 2.3
-
-    # Consommation
-    lpcd: float = 250.0  # Litres per capita per day
-
-    # Ajustement coût compteur (économies d'échelle, accès, etc.)
-    # < 1.0 = moins cher (multilogement: accès groupé, économies)
-    # > 1.0 = plus cher (unifamilial: déplacement, excavation)
-    cout_compteur_ajustement: float = 1.0
-
-    # Ajustement coût installation
-    cout_installation_ajustement: float = 1.0
-
-    # Prévalence des fuites (peut varier selon l'âge du parc)
-    prevalence_fuites_pct: float = 20.0
-
-    # Potentiel de réduction comportementale
-    # Unifamilial: plus de marge (arrosage, piscine)
-    # Multilogement: moins de marge (usages essentiels)
-    potentiel_reduction_pct: float = 8.0
-
-    # Métadonnées
-    nom: str = ""
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider et générer nom par défaut."""
-        if self.nb_menages <= 0:
-            raise ValueError("nb_menages doit être > 0")
-        if self.nb_compteurs is None:
-            self.nb_compteurs = self.nb_menages
-        else:
-            self.nb_compteurs = int(round(self.nb_compteurs))
-        if self.nb_compteurs <= 0:
-            raise ValueError("nb_compteurs doit être > 0")
-        if self.personnes_par_menage <= 0:
-            raise ValueError("personnes_par_menage doit être > 0")
-        if self.lpcd <= 0:
-            raise ValueError("lpcd doit être > 0")
-
-        if not self.nom:
-            self.nom = self.type_logement.value.title()
-
-    @property
-    def usage_annuel_menage_m3(self) -> float:
-        """Consommation annuelle par ménage (m³)."""
-        return self.lpcd * self.personnes_par_menage * 365 / 1000
-
-
-# =============================================================================
-# PRÉRÉGLAGES SEGMENTATION QUÉBEC (SQEEP 2023 + StatCan 2021)
-# =============================================================================
-
-SEGMENT_UNIFAMILIAL = ParametresSegment(
-    type_logement=TypeLogement.UNIFAMILIAL,
-    nb_menages=70_000,           # ~60% du parc résidentiel
-    nb_compteurs=70_000,         # 1 compteur par ménage
-    personnes_par_menage=2.5,
-    lpcd=250.0,
-    cout_compteur_ajustement=1.0,
-    cout_installation_ajustement=1.0,
-    prevalence_fuites_pct=22.0,  # Légèrement plus élevé (plus de plomberie)
-    potentiel_reduction_pct=10.0,  # Plus de marge (extérieur)
-    nom="Unifamilial",
-    description="Maisons individuelles - haute consommation, fort potentiel",
-)
-
-SEGMENT_MULTIPLEX = ParametresSegment(
-    type_logement=TypeLogement.MULTIPLEX,
-    nb_menages=25_000,           # ~21% du parc
-    nb_compteurs=10_000,         # ~1 compteur par 2.5 logements (compteur maître)
-    personnes_par_menage=2.0,
-    lpcd=210.0,
-    cout_compteur_ajustement=0.95,
-    cout_installation_ajustement=0.90,  # Accès plus facile
-    prevalence_fuites_pct=20.0,
-    potentiel_reduction_pct=7.0,
-    nom="Multiplex",
-    description="Duplex/triplex/quadruplex - consommation moyenne",
-)
-
-# ─────────────────────────────────────────────────────────────────────────────
-# MULTILOGEMENT — EXCLU DE L'ANALYSE PAR DÉFAUT
-# ─────────────────────────────────────────────────────────────────────────────
-#
-# LIMITATION MÉTHODOLOGIQUE ASSUMÉE
-# =================================
-# Le segment multilogement (immeubles de 5+ logements, ~18% du parc résidentiel
-# québécois) est volontairement exclu de l'analyse principale. Cette exclusion
-# constitue une limite du modèle, justifiée par l'absence de données empiriques
-# permettant de calibrer les hypothèses clés.
-#
-# PROBLÈME FONDAMENTAL : BIFURCATION COÛT-EFFET
-# ---------------------------------------------
-# L'effet comportemental dépend du mode de comptage, créant deux configurations
-# aux profils coût-bénéfice opposés et incomparables :
-#
-#   Configuration A — Compteur bâtiment (maître)
-#   • Coût par logement : ~75$ (compteur partagé entre N logements)
-#   • Effet comportemental : α ≈ 0 (aucune rétroaction individuelle)
-#   • Détection fuites : au niveau bâtiment seulement
-#   • Bénéfice net : marginal voire nul
-#
-#   Configuration B — Sous-comptage individuel (submetering)
-#   • Coût par logement : 500-800$+ (compteur + plomberie + réseau par unité)
-#   • Effet comportemental : α potentiellement comparable à l'unifamilial
-#   • Détection fuites : par logement (mais responsabilité propriétaire/locataire floue)
-#   • Bénéfice net : possiblement positif, mais CAPEX très élevé
-#
-# ABSENCE DE DONNÉES QUÉBÉCOISES
-# ------------------------------
-# • Aucune étude empirique québécoise sur l'effet comportemental en multilogement
-# • Le submetering résidentiel est rare au Québec (contrairement à l'Ontario)
-# • La dynamique propriétaire-locataire pour les réparations n'est pas documentée
-# • Les coûts réels d'installation en contexte locatif québécois sont inconnus
-#
-# JUSTIFICATION DE L'EXCLUSION
-# ----------------------------
-# 1. Inclure ce segment avec des hypothèses arbitraires fragiliserait l'ensemble
-#    de l'analyse et exposerait le modèle à des critiques légitimes.
-#
-# 2. L'analyse reste pertinente : unifamilial + multiplex représentent ~82% du
-#    parc résidentiel québécois et la grande majorité de la consommation.
-#
-# 3. Cette limitation est documentée et constitue une avenue de recherche future.
-#
-# AVENUE DE RECHERCHE FUTURE
-# --------------------------
-# Pour inclure le multilogement, il faudrait :
-# • Données empiriques sur l'effet comportemental avec compteur maître vs submeter
-# • Enquête sur les pratiques de réparation de fuites en contexte locatif
-# • Analyse des coûts réels de submetering au Québec
-# • Création de deux sous-segments : MULTILOGEMENT_BATIMENT et MULTILOGEMENT_SUBMETER
-#
-# ─────────────────────────────────────────────────────────────────────────────
-# Définition conservée pour référence et recherche future — NON UTILISÉ par défaut
-SEGMENT_MULTILOGEMENT = ParametresSegment(
-    type_logement=TypeLogement.MULTILOGEMENT,
-    nb_menages=21_000,           # ~18% du parc résidentiel québécois
-    nb_compteurs=4_200,          # Hypothèse compteur maître (1 pour ~5 logements)
-    personnes_par_menage=1.7,
-    lpcd=180.0,
-    # ATTENTION: Les ajustements ci-dessous supposent un compteur maître (config A).
-    # Pour du submetering (config B), ces valeurs seraient très différentes.
-    cout_compteur_ajustement=0.85,      # Coût/logement bas SI compteur maître
-    cout_installation_ajustement=0.75,  # Installation groupée SI compteur maître
-    prevalence_fuites_pct=18.0,
-    potentiel_reduction_pct=5.0,        # FRAGILE: α≈0 avec compteur maître
-    nom="Multilogement (non utilisé)",
-    description="EXCLU — Voir LIMITATION MÉTHODOLOGIQUE. Config compteur maître hypothétique.",
-)
-
-# ─────────────────────────────────────────────────────────────────────────────
-# SEGMENTS INCLUS DANS L'ANALYSE PAR DÉFAUT
-# ─────────────────────────────────────────────────────────────────────────────
-# Couverture : ~82% du parc résidentiel québécois
-# Exclusion  : Multilogement (~18%) — voir LIMITATION MÉTHODOLOGIQUE ci-dessus
-# ─────────────────────────────────────────────────────────────────────────────
-SEGMENTS_QUEBEC_DEFAUT = [
-    SEGMENT_UNIFAMILIAL,   # ~55% du parc — effet comportemental bien documenté
-    SEGMENT_MULTIPLEX,     # ~27% du parc — effet comportemental extrapolé
-    # MULTILOGEMENT EXCLU — bifurcation coût-effet non résoluble sans données empiriques
-]
-
-
-def creer_params_modele_depuis_segment(
-    segment: ParametresSegment,
-    params_base: Optional['ParametresModele'] = None,
-) -> 'ParametresModele':
-    """
-    Créer un ParametresModele à partir d'un segment.
-
-    Paramètres:
-        segment: Segment résidentiel
-        params_base: Paramètres de base à modifier (optionnel)
-
-    Retourne:
-        ParametresModele configuré pour ce segment
-    """
-    if params_base is None:
-        params = ParametresModele()
-    else:
-        # Cloner les paramètres de base
-        params = ParametresModele(**_cloner_params(params_base))
-
-    # Appliquer les caractéristiques du segment
-    params.nb_menages = segment.nb_menages
-    params.nb_compteurs = segment.nb_compteurs
-    params.taille_menage = segment.personnes_par_menage
-    params.lpcd = segment.lpcd
-    params.reduction_comportement_pct = segment.potentiel_reduction_pct
-    params.part_menages_fuite_pct = segment.prevalence_fuites_pct
-
-    return params
-
-
-def creer_compteur_depuis_segment(
-    segment: ParametresSegment,
-    compteur_base: Optional['ParametresCompteur'] = None,
-) -> 'ParametresCompteur':
-    """
-    Créer un ParametresCompteur ajusté pour un segment.
-
-    Paramètres:
-        segment: Segment résidentiel
-        compteur_base: Compteur de base à modifier (optionnel)
-
-    Retourne:
-        ParametresCompteur ajusté pour ce segment
-    """
-    if compteur_base is None:
-        compteur = ParametresCompteur()
-    else:
-        compteur = ParametresCompteur(**_cloner_compteur(compteur_base))
-
-    # Appliquer les ajustements du segment
-    compteur.cout_compteur *= segment.cout_compteur_ajustement
-    compteur.heures_installation *= segment.cout_installation_ajustement
-
-    return compteur
-
-
-def executer_modele_segmente(
-    segments: list[ParametresSegment],
-    compteur_base: Optional['ParametresCompteur'] = None,
-    params_base: Optional['ParametresModele'] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    **kwargs,
-) -> dict:
-    """
-    Exécuter le modèle sur plusieurs segments et agréger les résultats.
-
-    Paramètres:
-        segments: Liste des segments à analyser
-        compteur_base: Compteur de base (sera ajusté par segment)
-        params_base: Paramètres de base (seront ajustés par segment)
-        config_echelle: Configuration économies d'échelle
-        **kwargs: Arguments supplémentaires passés à executer_modele()
-
-    Retourne:
-        Dictionnaire avec:
-        - 'segments': résultats par segment
-        - 'agrege': métriques agrégées
-        - 'total_menages': nombre total de ménages
-        - 'van_totale': VAN totale ($)
-    """
-    resultats_segments = {}
-    van_totale = 0.0
-    va_benefices_total = 0.0
-    va_couts_total = 0.0
-    total_menages = 0
-    total_compteurs = 0
-    total_economies_m3 = 0.0
-
-    for segment in segments:
-        # Créer paramètres spécifiques au segment
-        params = creer_params_modele_depuis_segment(segment, params_base)
-        compteur = creer_compteur_depuis_segment(segment, compteur_base)
-
-        # Exécuter le modèle
-        res = executer_modele(
-            params=params,
-            compteur=compteur,
-            config_echelle=config_echelle,
-            **kwargs,
-        )
-
-        resultats_segments[segment.type_logement.value] = {
-            'segment': segment,
-            'params': params,
-            'compteur': compteur,
-            'resultats': res,
-        }
-
-        # Agréger
-        van_totale += res.van
-        va_benefices_total += res.va_benefices
-        va_couts_total += res.va_couts_totaux
-        total_menages += segment.nb_menages
-        total_compteurs += segment.nb_compteurs
-        # CORRECTION v3.9: Utiliser le total réel sur l'horizon (pas l'année 1 × T)
-        total_economies_m3 += res.economies_totales_horizon_m3
-
-    # Calculer métriques agrégées
-    rbc_agrege = va_benefices_total / va_couts_total if va_couts_total > 0 else 0.0
-
-    return {
-        'segments': resultats_segments,
-        'total_menages': total_menages,
-        'total_compteurs': total_compteurs,
-        'van_totale': van_totale,
-        'va_benefices_total': va_benefices_total,
-        'va_couts_total': va_couts_total,
-        'rbc_agrege': rbc_agrege,
-        'total_economies_m3': total_economies_m3,
-    }
-
-
-def afficher_resultats_segmentes(resultats: dict) -> None:
-    """
-    Afficher un tableau récapitulatif des résultats segmentés.
-
-    Paramètres:
-        resultats: Dictionnaire retourné par executer_modele_segmente()
-    """
-    print("\n" + "=" * 90)
-    print(" " * 25 + "RÉSULTATS PAR SEGMENT RÉSIDENTIEL")
-    print("=" * 90)
-
-    print(f"\n{'Segment':<15} │ {'Ménages':<10} │ {'Compteurs':<10} │ {'LPCD':<6} │ {'VAN':<15} │ "
-          f"{'RBC':<6} │ {'Éco. m³/mén/an':<14}")
-    print("─" * 15 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 6 + "─┼─" +
-          "─" * 15 + "─┼─" + "─" * 6 + "─┼─" + "─" * 14)
-
-    for type_log, data in resultats['segments'].items():
-        segment = data['segment']
-        res = data['resultats']
-        print(f"{segment.nom:<15} │ {segment.nb_menages:>9,} │ {segment.nb_compteurs:>9,} │ "
-              f"{segment.lpcd:>5.0f} │ {fmt_argent(res.van):>14} │ {res.rbc:>5.2f} │ {res.economie_totale_menage:>12.1f}")
-
-    print("─" * 15 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 6 + "─┼─" +
-          "─" * 15 + "─┼─" + "─" * 6 + "─┼─" + "─" * 14)
-    print(f"{'TOTAL':<15} │ {resultats['total_menages']:>9,} │ {resultats['total_compteurs']:>9,} │ {'---':>5} │ "
-          f"{fmt_argent(resultats['van_totale']):>14} │ {resultats['rbc_agrege']:>5.2f} │ {'---':>12}")
-
-    print("=" * 90)
-
-    # Décomposition en %
-    print("\n  Contribution à la VAN totale:")
-    for type_log, data in resultats['segments'].items():
-        segment = data['segment']
-        res = data['resultats']
-        pct = res.van / resultats['van_totale'] * 100 if resultats['van_totale'] != 0 else 0
-        barre = "█" * int(pct / 2)
-        print(f"    {segment.nom:<15}: {pct:>5.1f}% {barre}")
-
-    print()
-
-
-def graphique_segmentation(resultats: dict, dossier: str = None) -> plt.Figure:
-    """
-    Créer un graphique comparatif des segments.
-
-    Paramètres:
-        resultats: Dictionnaire retourné par executer_modele_segmente()
-        dossier: Dossier de sauvegarde (optionnel)
-
-    Retourne:
-        Figure matplotlib
-    """
-    segments_noms = []
-    vans = []
-    rbcs = []
-    economies = []
-
-    for type_log, data in resultats['segments'].items():
-        segment = data['segment']
-        res = data['resultats']
-        segments_noms.append(segment.nom)
-        vans.append(res.van / 1e6)  # En millions
-        rbcs.append(res.rbc)
-        economies.append(res.economie_totale_menage)
-
-    fig, axes = plt.subplots(1, 3, figsize=(14, 5))
-
-    # VAN par segment
-    couleurs = ['#2E86AB', '#A23B72', '#F18F01']
-    axes[0].bar(segments_noms, vans, color=couleurs)
-    axes[0].set_title("VAN par segment")
-    axes[0].set_ylabel("VAN (M$)")
-    axes[0].axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-
-    # RBC par segment
-    axes[1].bar(segments_noms, rbcs, color=couleurs)
-    axes[1].set_title("Ratio Bénéfices-Coûts")
-    axes[1].set_ylabel("RBC")
-    axes[1].axhline(y=1, color='red', linestyle='--', linewidth=1, label='Seuil rentabilité')
-    axes[1].legend()
-
-    # Économies par ménage
-    axes[2].bar(segments_noms, economies, color=couleurs)
-    axes[2].set_title("Économies d'eau par ménage")
-    axes[2].set_ylabel("m³/ménage/an")
-
-    plt.tight_layout()
-
-    if dossier:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "segmentation_residentielle.png")
-        fig.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Figure sauvegardée: {chemin}")
-
-    return fig
-
-
-@dataclass
-class Trajectoires:
-    """
-    Séries temporelles des flux annuels pour le modèle dynamique.
-
-    Structure permettant de passer d'un modèle "annuité constante"
-    à un modèle année par année, nécessaire pour:
-    - Persistance des effets comportementaux α_B(t)
-    - Stratégies d'adoption graduelles A(t)
-    - Coûts de réparation des fuites variables
-    - Réduction des pertes réseau (optionnel)
-    - Tarification volumétrique différée
-
-    Les bénéfices sont décomposés par source pour traçabilité et
-    pour permettre la séparation économique/financier.
-    """
-    annees: np.ndarray                    # [1, 2, ..., T]
-
-    # Bénéfices par composante ($ par an)
-    benefices_eau: np.ndarray             # Valeur eau économisée
-    benefices_infra: np.ndarray           # Report infrastructure
-
-    # Coûts d'exploitation ($ par an)
-    couts_exploitation: np.ndarray        # OPEX (maintenance, lecture)
-    couts_ponctuels: dict                 # {année: montant} ex: batterie année 15
-
-    # Économies physiques (pour métriques LCSW, q*)
-    economies_eau_m3: np.ndarray          # m³ économisés par an (total programme)
-    economies_par_menage: np.ndarray      # m³/ménage/an
-    economies_fuites_menage: np.ndarray = field(default_factory=lambda: np.array([]))
-    economies_comportement_menage: np.ndarray = field(default_factory=lambda: np.array([]))
-    economies_reseau_m3: np.ndarray = field(default_factory=lambda: np.array([]))
-    economies_reseau_par_menage: np.ndarray = field(default_factory=lambda: np.array([]))
-
-    # Coûts de réparation des fuites ($ par an) - NOUVEAU v3.3
-    # Ces champs ont des valeurs par défaut pour rétrocompatibilité
-    couts_reparation_fuites: np.ndarray = field(default_factory=lambda: np.array([]))
-    couts_reparation_ville: np.ndarray = field(default_factory=lambda: np.array([]))
-    couts_reparation_menages: np.ndarray = field(default_factory=lambda: np.array([]))
-    couts_reseau: np.ndarray = field(default_factory=lambda: np.array([]))
-
-    # Adoption progressive - NOUVEAU v3.5
-    serie_adoption: np.ndarray = field(default_factory=lambda: np.array([]))  # A(t)
-    capex_etale: np.ndarray = field(default_factory=lambda: np.array([]))      # CAPEX(t)
-
-    # Coûts incitatifs - NOUVEAU v3.8
-    couts_incitatifs: np.ndarray = field(default_factory=lambda: np.array([]))  # $/an
-
-    # Coûts ponctuels séparés (batterie compteur vs réseau) - NOUVEAU v3.10
-    couts_ponctuels_compteur: dict = field(default_factory=dict)
-    couts_ponctuels_reseau: dict = field(default_factory=dict)
-
-    @property
-    def benefices_totaux(self) -> np.ndarray:
-        """Bénéfices totaux par année ($)."""
-        return self.benefices_eau + self.benefices_infra
-
-    @property
-    def couts_reparation_actifs(self) -> bool:
-        """Vérifier si des coûts de réparation sont inclus."""
-        return len(self.couts_reparation_fuites) > 0 and np.sum(self.couts_reparation_fuites) > 0
-
-    @property
-    def T(self) -> int:
-        """Horizon d'analyse (nombre d'années)."""
-        return len(self.annees)
-
-    @property
-    def benefice_annuel_moyen(self) -> float:
-        """Bénéfice annuel moyen (pour compatibilité avec modèle constant)."""
-        return float(np.mean(self.benefices_totaux))
-
-    @property
-    def cout_exploitation_annuel_moyen(self) -> float:
-        """Coût d'exploitation annuel moyen."""
-        couts = self.couts_exploitation
-        if len(self.couts_reseau) > 0:
-            couts = couts + self.couts_reseau
-        return float(np.mean(couts))
-
-    @property
-    def adoption_active(self) -> bool:
-        """Vérifier si l'adoption progressive est active."""
-        return len(self.serie_adoption) > 0 and not np.allclose(self.serie_adoption, 1.0)
-
-    @property
-    def capex_etale_actif(self) -> bool:
-        """Vérifier si le CAPEX est étalé."""
-        return len(self.capex_etale) > 0 and np.sum(self.capex_etale) > 0
-
-    @property
-    def adoption_finale(self) -> float:
-        """Taux d'adoption final (dernière année)."""
-        if len(self.serie_adoption) > 0:
-            return float(self.serie_adoption[-1])
-        return 1.0
-
-    @property
-    def adoption_moyenne(self) -> float:
-        """Taux d'adoption moyen sur l'horizon."""
-        if len(self.serie_adoption) > 0:
-            return float(np.mean(self.serie_adoption))
-        return 1.0
-
-
-def calculer_economies_eau(
-    params: ParametresModele,
-    params_fuites: Optional[ParametresFuites] = None,
-    compteur: Optional[ParametresCompteur] = None,  # NOUVEAU v3.8
-) -> EconomiesEau:
-    """
-    Calculer les économies d'eau par ménage.
-
-    Formules:
-    - Économies fuites = part_ménages × débit_fuite × taux_correction × facteur_efficacité
-    - Économies comportement = usage_base_sans_fuites × réduction_pct × facteur_efficacité
-
-    La réduction comportementale s'applique sur l'usage hors fuites pour
-    éviter un double-compte (les fuites ne sont pas un usage discrétionnaire).
-
-    NOUVEAU v3.8: Les facteurs d'efficacité par type de compteur modulent les économies.
-    - AMI (référence): facteur = 1.0
-    - AMR: facteur comportement = 0.875, facteur fuites = 0.91
-    - Manuel: facteur comportement = 0.625, facteur fuites = 0.765
-
-    Paramètres:
-        params: Paramètres du modèle
-        params_fuites: Paramètres de fuites optionnels
-        compteur: Paramètres du compteur (pour facteurs d'efficacité)
-
-    Retourne:
-        EconomiesEau avec les 3 composantes
-    """
-    # Usage de base (m³/ménage/an)
-    usage_base = (params.lpcd * params.taille_menage * 365.0) / 1000.0
-
-    # Facteurs d'efficacité par type de compteur (NOUVEAU v3.8)
-    if compteur is not None:
-        facteur_comportement = compteur.facteur_efficacite_comportement
-        facteur_fuites = compteur.facteur_efficacite_fuites
-    else:
-        # Défaut: AMI (facteurs = 1.0)
-        facteur_comportement = 1.0
-        facteur_fuites = 1.0
-
-    # Paramètres de fuite (source: params_fuites si fourni)
-    if params_fuites is None:
-        part_fuite = params.part_menages_fuite_pct / 100.0
-        debit_fuite = params.debit_fuite_m3_an
-        taux_correction = params.taux_correction_fuite_pct / 100.0
-    else:
-        part_fuite = params_fuites.part_menages_fuite_pct / 100.0
-        # CORRECTION 4.5: Utiliser volume_fuite_moyen_pondere si mode deux-stocks
-        if params_fuites.utiliser_prevalence_differenciee:
-            debit_fuite = params_fuites.volume_fuite_moyen_pondere
-        else:
-            debit_fuite = params_fuites.debit_fuite_m3_an
-        # CORRECTION 4.4: Utiliser taux effectif avec persistance
-        taux_correction = params_fuites.taux_correction_effectif_avec_persistance
-
-    # Volume moyen de fuites AVANT correction (m³/an/ménage)
-    volume_fuite_pre = part_fuite * debit_fuite
-
-    # Usage de base net des fuites (évite double-compte comportement/fuites)
-    usage_reductible = max(0.0, usage_base - volume_fuite_pre)
-
-    # Économies fuites: % ménages × débit × taux correction × facteur_efficacité
-    eco_fuite = part_fuite * debit_fuite * taux_correction * facteur_fuites
-
-    # Économies comportementales: % réduction × usage base net × facteur_efficacité
-    eco_comportement = usage_reductible * (params.reduction_comportement_pct / 100.0) * facteur_comportement
-
-    return EconomiesEau(
-        usage_base=usage_base,
-        usage_reductible=usage_reductible,
-        economie_fuite=eco_fuite,
-        economie_comportement=eco_comportement,
-    )
-
-
-def generer_trajectoires(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    economies: EconomiesEau,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-    params_adoption: Optional[ParametresAdoption] = None,
-) -> tuple[Trajectoires, float, float, float]:
-    """
-    Générer les séries temporelles des bénéfices et coûts.
-
-    Version 3.5.0: Stratégies d'adoption progressive.
-
-    Fonctionnalités:
-    - Persistance décroissante des effets comportementaux α_B(t)
-    - Coûts de réparation des fuites (optionnel)
-    - Partage des coûts ville/ménages
-    - Mode ECONOMIQUE vs FINANCIER
-    - Fuites réseau (optionnel) avec trajectoire et coûts
-    - NOUVEAU: Adoption progressive A(t) avec CAPEX étalé
-
-    L'adoption A(t) ∈ [0,1] représente la fraction du parc équipée.
-    - OPEX et bénéfices d'eau sont proportionnels à A(t)
-    - CAPEX peut être étalé selon A(t) ou concentré en t=0
-    - NOUVEAU: économies privées calculées par cohortes (âge du compteur)
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        economies: Économies d'eau calculées (valeurs initiales à t=1)
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance (défaut: constant)
-        params_fuites: Configuration des fuites privées et réparations (défaut: sans coût)
-        params_fuites_reseau: Configuration des pertes réseau (optionnel)
-        mode_compte: ECONOMIQUE (bien-être social) ou FINANCIER (budget municipal)
-        valeur_eau: Paramètres de valorisation (défaut: utilise params.valeur_eau_m3)
-        params_adoption: Stratégie d'adoption (défaut: obligatoire immédiat)
-
-    Retourne:
-        trajectoires: Séries temporelles B[t], C[t] avec adoption et coûts
-        I0: Investissement initial (si non étalé) ou total CAPEX (si étalé)
-        facteur_echelle: Facteur appliqué aux coûts
-        cout_ajuste: Coût par compteur après économies d'échelle
-    """
-    H_menages = params.nb_menages
-    H_compteurs = params.nb_compteurs_effectif
-    T = params.horizon_analyse
-
-    # === ADOPTION (NOUVEAU v3.5) ===
-    # DÉPLACÉ ICI pour correction 4.2: calculer économies d'échelle sur H_effectif
-    if params_adoption is None:
-        params_adoption = ADOPTION_OBLIGATOIRE  # Défaut: 100% immédiat
-
-    # CORRECTION 4.2: Calculer les économies d'échelle sur le nombre effectif de compteurs
-    # Si adoption max = 70%, on n'achète que 70% des compteurs → rabais volume sur 0.70*H_compteurs
-    A_max = params_adoption.adoption_max_pct / 100.0
-    H_effectif = int(H_compteurs * A_max)
-
-    # === ÉCONOMIES D'ÉCHELLE ===
-    if config_echelle is None:
-        config_echelle = ConfigEconomiesEchelle(activer=False)
-
-    facteur_echelle = calculer_facteur_echelle(H_effectif, config_echelle)
-    cout_compteur = compteur.cout_compteur
-    cout_installation = compteur.cout_installation
-    cout_reseau = compteur.cout_reseau_par_compteur if compteur.type_compteur == TypeCompteur.AMI else 0.0
-
-    facteur_echelle_compteur = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_compteur)
-    facteur_echelle_installation = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_installation)
-    facteur_echelle_reseau = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_reseau)
-
-    cout_base = compteur.cout_initial_par_compteur
-    cout_ajuste = (
-        cout_compteur * facteur_echelle_compteur +
-        cout_installation * facteur_echelle_installation +
-        cout_reseau * facteur_echelle_reseau
-    )
-
-    # Investissement initial (pour adoption complète)
-    # = coût variable × nb_compteurs + coût fixe infrastructure (AMI seulement)
-    cout_infra_fixe = compteur.cout_infra_fixe if compteur.type_compteur == TypeCompteur.AMI else 0.0
-    I0_total = cout_ajuste * H_compteurs + cout_infra_fixe
-
-    # Générer la série d'adoption A(t) pour t = 1..T
-    serie_adoption = generer_serie_adoption(params_adoption, T)
-    delta_adoption = calculer_delta_adoption(serie_adoption)
-    serie_adoption_effective = calculer_adoption_effective(
-        serie_adoption, params_adoption.fraction_premiere_annee
-    )
-
-    # Calculer CAPEX étalé si nécessaire
-    if params_adoption.etaler_capex:
-        capex_etale = calculer_capex_etale(I0_total, params_adoption, T)
-        I0 = 0.0  # Pas d'investissement initial ponctuel
-    else:
-        capex_etale = np.zeros(T)
-        I0 = I0_total  # Investissement complet en t=0
-
-    # === PERSISTANCE ===
-    if persistance is None:
-        persistance = ParametresPersistance(
-            mode=ModePersistance.CONSTANT,
-            alpha_initial=params.reduction_comportement_pct / 100.0,
-        )
-
-    # Générer la série α_B(t) pour chaque année
-    serie_alpha_base = generer_serie_alpha(persistance, T)
-
-    # Appliquer le facteur d'efficacité comportementale du compteur (NOUVEAU v3.8)
-    # AMI: facteur=1.0 → α inchangé
-    # AMR: facteur=0.875 → α réduit de 12.5%
-    # Manuel: facteur=0.625 → α réduit de 37.5%
-    facteur_comportement = max(0.0, min(1.0, compteur.facteur_efficacite_comportement))
-    serie_alpha = serie_alpha_base * facteur_comportement
-
-    # === ÉCONOMIES D'EAU PAR ANNÉE ===
-    # Économies comportementales par âge (cohorte)
-    usage_reductible = economies.usage_reductible
-    eco_comportement_serie = usage_reductible * serie_alpha
-
-    # Économies fuites par âge (cohorte)
-    # NOUVEAU v3.8: Appliquer le facteur d'efficacité de détection
-    res_fuites_cohorte = None
-    if params_fuites is not None:
-        res_fuites_cohorte = calculer_dynamique_fuites(
-            params_fuites, 1, T,
-            facteur_efficacite_detection=compteur.facteur_efficacite_fuites
-        )
-        eco_fuite_menage_serie = res_fuites_cohorte.economies_eau_par_an
-    else:
-        eco_fuite_menage_serie = np.full(T, economies.economie_fuite)
-
-    # Fuites réseau (optionnel) : économies et coûts dynamiques
-    economies_reseau_m3 = np.zeros(T)
-    economies_reseau_par_menage = np.zeros(T)
-    couts_reseau = np.zeros(T)
-    capex_reseau = {}
-
-    if params_fuites_reseau is not None and params_fuites_reseau.activer:
-        res_reseau = calculer_dynamique_fuites_reseau(
-            params_fuites_reseau,
-            T,
-            serie_adoption=serie_adoption_effective,
-        )
-        economies_reseau_m3 = res_reseau.economies_m3_par_an
-        couts_reseau = res_reseau.couts_totaux_par_an
-        if H_menages > 0:
-            economies_reseau_par_menage = economies_reseau_m3 / H_menages
-
-        # CAPEX ponctuel (DMA, capteurs, analytics)
-        if params_fuites_reseau.cout_capex_initial > 0:
-            capex_reseau[params_fuites_reseau.annee_capex] = params_fuites_reseau.cout_capex_initial
-
-    # Économies totales par année (pour un ménage équipé)
-    economies_par_menage = (
-        eco_fuite_menage_serie +
-        eco_comportement_serie +
-        economies_reseau_par_menage
-    )  # m³/ménage/an
-
-    # Économies privées par cohortes (comportement + fuites)
-    economies_comportement_m3 = convoluer_cohortes(
-        delta_adoption, eco_comportement_serie, H_menages,
-        fraction_premiere_annee=params_adoption.fraction_premiere_annee
-    )
-    economies_fuites_m3 = convoluer_cohortes(
-        delta_adoption, eco_fuite_menage_serie, H_menages,
-        fraction_premiere_annee=params_adoption.fraction_premiere_annee
-    )
-
-    # Économies totales (privé + réseau)
-    economies_eau_m3 = (
-        economies_comportement_m3 +
-        economies_fuites_m3 +
-        economies_reseau_m3
-    )  # m³/an total
-
-    # === VALORISATION DE L'EAU SELON LE MODE (v3.4) ===
-    if valeur_eau is None:
-        # Rétrocompatibilité: utiliser la valeur du modèle comme valeur sociale
-        # et estimer le coût variable à ~10% de la valeur sociale (Winnipeg ratio)
-        # Aucun ratio implicite: utiliser la valeur sociale du modèle
-        # et le coût variable par défaut (Québec).
-        valeur_eau = ParametresValeurEau(
-            valeur_sociale_m3=params.valeur_eau_m3,
-            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
-        )
-
-    # Sélectionner la valeur selon le mode d'analyse
-    if mode_compte == ModeCompte.ECONOMIQUE:
-        valeur_m3 = valeur_eau.valeur_sociale_m3
-    else:
-        valeur_m3 = valeur_eau.cout_variable_m3
-
-    # === BÉNÉFICES ANNUELS ===
-    annees = np.arange(1, T + 1)
-
-    # Valeur de l'eau économisée ($/an) - selon la perspective
-    benefices_eau = economies_eau_m3 * valeur_m3
-
-    # Report infrastructure
-    # Le report d'infrastructure dépend des économies totales, donc aussi de A(t)
-    benef_infra_annuel = params.benefice_report_infra_annuel
-    benefices_infra = np.full(T, benef_infra_annuel) * serie_adoption_effective
-    if params.benefice_report_infra_par_m3 > 0:
-        benefices_infra = benefices_infra + (economies_eau_m3 * params.benefice_report_infra_par_m3)
-
-    # === COÛTS D'EXPLOITATION ===
-    # L'OPEX est proportionnel au nombre de compteurs installés
-    cout_exploit_annuel = compteur.cout_exploitation_annuel * H_compteurs
-    couts_exploitation = np.full(T, cout_exploit_annuel) * serie_adoption_effective
-
-    # === COÛTS PONCTUELS ===
-    couts_ponctuels = {}
-    couts_ponctuels_compteur = {}
-    couts_ponctuels_reseau = {}
-
-    # CAPEX réseau ponctuel
-    for annee, montant in capex_reseau.items():
-        couts_ponctuels[annee] = couts_ponctuels.get(annee, 0.0) + montant
-        couts_ponctuels_reseau[annee] = couts_ponctuels_reseau.get(annee, 0.0) + montant
-
-    # Remplacement batterie (AMI/AMR seulement)
-    # Coût déclenché à l'âge batterie pour chaque cohorte installée
-    # CORRECTION v3.9: Boucle pour gérer plusieurs remplacements si horizon > durée_vie
-    # Ex: horizon 30 ans, batterie 10 ans → remplacements aux années 10, 20, 30
-    if compteur.type_compteur in [TypeCompteur.AMI, TypeCompteur.AMR]:
-        if compteur.cout_remplacement_batterie > 0 and compteur.duree_vie_batterie > 0:
-            cout_batterie_par_age = np.zeros(T)
-            # Ajouter un remplacement tous les duree_vie_batterie ans
-            annee_remplacement = compteur.duree_vie_batterie
-            while annee_remplacement <= T:
-                age_index = annee_remplacement - 1  # Conversion année → index (0-based)
-                if 0 <= age_index < T:
-                    cout_batterie_par_age[age_index] = compteur.cout_remplacement_batterie
-                annee_remplacement += compteur.duree_vie_batterie
-
-            # Convoluer avec les cohortes d'adoption
-            if np.any(cout_batterie_par_age > 0):
-                couts_batterie = convoluer_cohortes(
-                    delta_adoption, cout_batterie_par_age, H_compteurs,
-                    fraction_premiere_annee=params_adoption.fraction_premiere_annee
-                )
-                for annee, montant in enumerate(couts_batterie, start=1):
-                    if montant > 0:
-                        couts_ponctuels[annee] = couts_ponctuels.get(annee, 0.0) + montant
-                        couts_ponctuels_compteur[annee] = couts_ponctuels_compteur.get(annee, 0.0) + montant
-
-    # === COÛTS DE RÉPARATION DES FUITES (NOUVEAU v3.3) ===
-    # Les coûts suivent la même logique de cohortes que les économies privées
-    if params_fuites is not None and params_fuites.inclure_cout_reparation:
-        if res_fuites_cohorte is None:
-            res_fuites_cohorte = calculer_dynamique_fuites(params_fuites, 1, T)
-        couts_reparation_fuites = convoluer_cohortes(
-            delta_adoption, res_fuites_cohorte.cout_total_par_an, H_menages,
-            fraction_premiere_annee=params_adoption.fraction_premiere_annee
-        )
-        couts_reparation_ville = convoluer_cohortes(
-            delta_adoption, res_fuites_cohorte.cout_ville_par_an, H_menages,
-            fraction_premiere_annee=params_adoption.fraction_premiere_annee
-        )
-        couts_reparation_menages = convoluer_cohortes(
-            delta_adoption, res_fuites_cohorte.cout_menages_par_an, H_menages,
-            fraction_premiere_annee=params_adoption.fraction_premiere_annee
-        )
-    else:
-        # Pas de coûts de réparation
-        couts_reparation_fuites = np.zeros(T)
-        couts_reparation_ville = np.zeros(T)
-        couts_reparation_menages = np.zeros(T)
-
-    # === COÛTS INCITATIFS (NOUVEAU v3.8) ===
-    # Les incitatifs sont versés aux nouveaux adoptants pendant duree_incitatif_ans années
-    # Logique: si 1000 ménages adoptent en t=1 et l'incitatif est de 180$/an pendant 3 ans,
-    # alors on paie 180k$ en t=1, t=2, t=3 pour cette cohorte
-    couts_incitatifs = np.zeros(T)
-    if params_adoption is not None and params_adoption.cout_incitatif_par_menage > 0:
-        cout_annuel_par_menage = params_adoption.cout_incitatif_par_menage / params_adoption.duree_incitatif_ans
-        duree = params_adoption.duree_incitatif_ans
-
-        # Nouveaux adoptants chaque année (delta_adoption * H_menages)
-        nouveaux_adoptants = delta_adoption * H_menages
-
-        # Pour chaque année t, calculer le coût total des incitatifs
-        # = somme des coûts pour toutes les cohortes qui reçoivent encore l'incitatif
-        for t in range(T):
-            # Cohortes qui reçoivent l'incitatif en année t+1
-            # Ce sont les adoptants des années max(0, t-duree+1) à t (inclus)
-            debut_cohorte = max(0, t - duree + 1)
-            for c in range(debut_cohorte, t + 1):
-                couts_incitatifs[t] += nouveaux_adoptants[c] * cout_annuel_par_menage
-
-    trajectoires = Trajectoires(
-        annees=annees,
-        benefices_eau=benefices_eau,
-        benefices_infra=benefices_infra,
-        couts_exploitation=couts_exploitation,
-        couts_ponctuels=couts_ponctuels,
-        couts_ponctuels_compteur=couts_ponctuels_compteur,
-        couts_ponctuels_reseau=couts_ponctuels_reseau,
-        couts_reparation_fuites=couts_reparation_fuites,
-        couts_reparation_ville=couts_reparation_ville,
-        couts_reparation_menages=couts_reparation_menages,
-        economies_eau_m3=economies_eau_m3,
-        economies_par_menage=economies_par_menage,
-        economies_fuites_menage=eco_fuite_menage_serie,
-        economies_comportement_menage=eco_comportement_serie,
-        economies_reseau_m3=economies_reseau_m3,
-        economies_reseau_par_menage=economies_reseau_par_menage,
-        couts_reseau=couts_reseau,
-        # NOUVEAU v3.5: Adoption progressive
-        serie_adoption=serie_adoption,
-        capex_etale=capex_etale,
-        # NOUVEAU v3.8: Coûts incitatifs
-        couts_incitatifs=couts_incitatifs,
-    )
-
-    return trajectoires, I0, facteur_echelle, cout_ajuste
-
-
-def actualiser_series(
-    traj: Trajectoires,
-    r: float,
-    I0: float,
-    inclure_reparations: bool = True,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    part_ville_capex: float = 1.0,
-    part_ville_opex: float = 1.0,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> tuple[float, float, float, float, float, float, float]:
-    """
-    Actualiser les séries temporelles et calculer les métriques financières.
-
-    Version 3.11.0: Support MCF (Coût Marginal des Fonds publics).
-    Version 3.8.0: Support coûts incitatifs pour stratégies d'adoption.
-
-    Formules:
-    - VA(B) = Σ B[t] / (1+r)^t
-    - VA(C) = I0 + VA(CAPEX_etale) + Σ C_exploit[t] + Σ C_reseau[t] + Σ C_reparation[t] + Σ C_incitatifs[t] + ponctuels
-    - VAN = VA(B) - VA(C)
-    - RBC = VA(B) / VA(C)
-
-    MCF (Coût Marginal des Fonds publics):
-    - En mode ÉCONOMIQUE avec MCF activé, seule la part publique est majorée
-      du facteur (1 + mcf) pour refléter le coût social de la taxation
-    - Source: Treasury Board of Canada (2007): MCF = 0.20
-
-    CAPEX étalé:
-    - Si I0 > 0: investissement initial ponctuel (adoption obligatoire)
-    - Si capex_etale non vide: investissement réparti selon A(t)
-
-    Distinction des coûts de réparation:
-    - ECONOMIQUE: coût total (ville + ménages) car tous les coûts comptent
-    - FINANCIER: coût ville seulement (perspective budget municipal)
-
-    Paramètres:
-        traj: Trajectoires des flux annuels
-        r: Taux d'actualisation (décimal, ex: 0.03 pour 3%)
-        I0: Investissement initial ($) - 0 si CAPEX étalé
-        inclure_reparations: Inclure les coûts de réparation dans VA(C)
-        mode_compte: ECONOMIQUE ou FINANCIER (affecte les coûts de réparation)
-        part_ville_capex: Part du CAPEX payé par la ville (0-1)
-        part_ville_opex: Part de l'OPEX payé par la ville (0-1)
-        valeur_eau: Paramètres de valeur d'eau (pour MCF). Si None, MCF non appliqué.
-
-    Retourne:
-        va_benefices: Valeur actuelle des bénéfices
-        va_couts_exploit: Valeur actuelle des coûts d'exploitation
-        va_couts_ponctuels: Valeur actuelle des coûts ponctuels (batterie)
-        va_couts_reparation: Valeur actuelle des coûts de réparation
-        va_couts_incitatifs: Valeur actuelle des coûts incitatifs (NOUVEAU v3.8)
-        van: Valeur Actuelle Nette
-        rbc: Ratio Bénéfices-Coûts
-    """
-    # Facteurs d'actualisation pour chaque année
-    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
-
-    # Valeurs actuelles par composante
-    va_benefices = float(np.sum(traj.benefices_totaux * facteurs_actu))
-
-    # Parts payées par la ville
-    capex_part = part_ville_capex
-    opex_part = part_ville_opex
-
-    # Facteur MCF (v3.11.0) - appliqué uniquement à la part publique en mode économique
-    # Le MCF reflète le coût social de lever des fonds publics par taxation
-    facteur_mcf = 1.0
-    if valeur_eau is not None:
-        facteur_mcf = valeur_eau.facteur_mcf(mode_compte)
-
-    if mode_compte == ModeCompte.ECONOMIQUE:
-        capex_mix = capex_part * facteur_mcf + (1.0 - capex_part)
-        opex_mix = opex_part * facteur_mcf + (1.0 - opex_part)
-        reseau_mix = facteur_mcf  # réseau = 100% public
-    else:
-        capex_mix = capex_part
-        opex_mix = opex_part
-        reseau_mix = 1.0
-
-    couts_exploit_total = traj.couts_exploitation * opex_mix
-    if len(traj.couts_reseau) > 0:
-        # Les coûts réseau sont municipaux (non partagés)
-        couts_exploit_total = couts_exploit_total + traj.couts_reseau * reseau_mix
-    va_couts_exploit = float(np.sum(couts_exploit_total * facteurs_actu))
-
-    # CAPEX étalé (v3.5) - si adoption progressive avec étalement
-    if traj.capex_etale_actif:
-        va_capex_etale = float(np.sum(traj.capex_etale * facteurs_actu)) * capex_mix
-    else:
-        va_capex_etale = 0.0
-
-    # Coûts ponctuels actualisés
-    couts_ponctuels_compteur = getattr(traj, "couts_ponctuels_compteur", {})
-    couts_ponctuels_reseau = getattr(traj, "couts_ponctuels_reseau", {})
-    if len(couts_ponctuels_compteur) == 0 and len(couts_ponctuels_reseau) == 0:
-        couts_ponctuels_compteur = traj.couts_ponctuels
-
-    va_ponctuels_compteur = sum(
-        montant / (1.0 + r) ** annee
-        for annee, montant in couts_ponctuels_compteur.items()
-    )
-    va_ponctuels_reseau = sum(
-        montant / (1.0 + r) ** annee
-        for annee, montant in couts_ponctuels_reseau.items()
-    )
-    va_couts_ponctuels = (va_ponctuels_reseau * reseau_mix) + (va_ponctuels_compteur * capex_mix)
-
-    # Coûts de réparation des fuites (v3.4: selon la perspective)
-    # CORRECTION MCF: en mode ÉCONOMIQUE, seule la part ville est majorée du MCF
-    if inclure_reparations and traj.couts_reparation_actifs:
-        if mode_compte == ModeCompte.ECONOMIQUE:
-            # Analyse économique: coûts ville (avec MCF) + coûts ménages (sans MCF)
-            # Le MCF s'applique aux dépenses publiques seulement
-            va_repar_ville = float(np.sum(traj.couts_reparation_ville * facteurs_actu))
-            va_repar_menages = float(np.sum(traj.couts_reparation_menages * facteurs_actu))
-            va_couts_reparation = (va_repar_ville * facteur_mcf) + va_repar_menages
-        else:
-            # Analyse financière: seulement les coûts de la ville (sans MCF)
-            va_couts_reparation = float(np.sum(traj.couts_reparation_ville * facteurs_actu))
-    else:
-        va_couts_reparation = 0.0
-
-    # Coûts incitatifs (NOUVEAU v3.8)
-    # En mode ÉCONOMIQUE: les incitatifs sont des TRANSFERTS (redistribution),
-    # ils n'affectent pas le bien-être social total → EXCLUS
-    # En mode FINANCIER: coût réel pour le budget municipal → INCLUS
-    if len(traj.couts_incitatifs) > 0 and mode_compte == ModeCompte.FINANCIER:
-        va_couts_incitatifs = float(np.sum(traj.couts_incitatifs * facteurs_actu))
-    else:
-        va_couts_incitatifs = 0.0
-
-    # Totaux (I0 + CAPEX étalé + OPEX + ponctuels + réparations + incitatifs si FINANCIER)
-    # I0 public est majoré du MCF en mode économique
-    I0_effectif = I0 * capex_mix
-    va_couts_totaux = I0_effectif + va_capex_etale + va_couts_exploit + va_couts_ponctuels + va_couts_reparation + va_couts_incitatifs
-    van = va_benefices - va_couts_totaux
-    rbc = division_securisee(va_benefices, va_couts_totaux)
-
-    return va_benefices, va_couts_exploit, va_couts_ponctuels, va_couts_reparation, va_couts_incitatifs, van, rbc
-
-
-def calculer_van_cumulative(
-    traj: Trajectoires,
-    r: float,
-    I0: float,
-    inclure_reparations: bool = True,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    part_ville_capex: float = 1.0,
-    part_ville_opex: float = 1.0,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> tuple[np.ndarray, float]:
-    """
-    Calculer la VAN cumulative année par année.
-
-    Version 3.12.0: Support MCF pour cohérence avec actualiser_series.
-    Version 3.5.0: Support CAPEX étalé pour adoption progressive.
-
-    Utilisé pour:
-    - Graphique VAN cumulative
-    - Calcul de la période de récupération (récupération actualisée)
-
-    Paramètres:
-        traj: Trajectoires des flux annuels
-        r: Taux d'actualisation (décimal)
-        I0: Investissement initial ($) - 0 si CAPEX étalé
-        inclure_reparations: Inclure les coûts de réparation des fuites
-        mode_compte: ECONOMIQUE ou FINANCIER (affecte les coûts de réparation)
-        part_ville_capex: Part du CAPEX payé par la ville (0-1)
-        part_ville_opex: Part de l'OPEX payé par la ville (0-1)
-        valeur_eau: Paramètres valeur d'eau (pour MCF). Si None, MCF non appliqué.
-
-    Retourne:
-        van_cumulative: VAN cumulative pour chaque année [1..T]
-        periode_recuperation: Année de récupération (fractionnaire)
-    """
-    T = traj.T
-
-    # Facteurs d'actualisation
-    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
-
-    # Facteur MCF (cohérent avec actualiser_series, appliqué à la part publique)
-    facteur_mcf = 1.0
-    if valeur_eau is not None:
-        facteur_mcf = valeur_eau.facteur_mcf(mode_compte)
-
-    # Bénéfices actualisés cumulés
-    benefices_actualises = traj.benefices_totaux * facteurs_actu
-    va_benef_cum = np.cumsum(benefices_actualises)
-
-    # Coûts actualisés cumulés (I0 + CAPEX étalé + OPEX cumulé)
-    capex_part = part_ville_capex
-    opex_part = part_ville_opex
-    if mode_compte == ModeCompte.ECONOMIQUE:
-        capex_mix = capex_part * facteur_mcf + (1.0 - capex_part)
-        opex_mix = opex_part * facteur_mcf + (1.0 - opex_part)
-        reseau_mix = facteur_mcf
-    else:
-        capex_mix = capex_part
-        opex_mix = opex_part
-        reseau_mix = 1.0
-
-    # OPEX (MCF sur part publique seulement)
-    couts_exploit_total = traj.couts_exploitation * opex_mix
-    if len(traj.couts_reseau) > 0:
-        couts_exploit_total = couts_exploit_total + traj.couts_reseau * reseau_mix
-    couts_exploit_actualises = couts_exploit_total * facteurs_actu
-
-    # I0 avec MCF partiel
-    va_cout_cum = (I0 * capex_mix) + np.cumsum(couts_exploit_actualises)
-
-    # Ajouter CAPEX étalé si actif (v3.5) avec MCF partiel
-    if traj.capex_etale_actif:
-        capex_actualise = traj.capex_etale * facteurs_actu * capex_mix
-        va_cout_cum += np.cumsum(capex_actualise)
-
-    # Ajouter coûts ponctuels aux années appropriées (MCF partiel)
-    couts_ponctuels_compteur = getattr(traj, "couts_ponctuels_compteur", {})
-    couts_ponctuels_reseau = getattr(traj, "couts_ponctuels_reseau", {})
-    if len(couts_ponctuels_compteur) == 0 and len(couts_ponctuels_reseau) == 0:
-        couts_ponctuels_compteur = traj.couts_ponctuels
-
-    for annee, montant in couts_ponctuels_compteur.items():
-        if 1 <= annee <= T:
-            va_ponctuel = (montant * capex_mix) / (1.0 + r) ** annee
-            va_cout_cum[annee - 1:] += va_ponctuel
-    for annee, montant in couts_ponctuels_reseau.items():
-        if 1 <= annee <= T:
-            va_ponctuel = (montant * reseau_mix) / (1.0 + r) ** annee
-            va_cout_cum[annee - 1:] += va_ponctuel
-
-    # Ajouter coûts de réparation des fuites (avec MCF cohérent)
-    if inclure_reparations and traj.couts_reparation_actifs:
-        if mode_compte == ModeCompte.ECONOMIQUE:
-            # Mode économique: part ville (avec MCF) + part ménages (sans MCF)
-            repar_ville_actu = traj.couts_reparation_ville * facteurs_actu * facteur_mcf
-            repar_menages_actu = traj.couts_reparation_menages * facteurs_actu
-            va_cout_cum += np.cumsum(repar_ville_actu) + np.cumsum(repar_menages_actu)
-        else:
-            # Mode financier: part ville seulement (sans MCF)
-            couts_repar_actualises = traj.couts_reparation_ville * facteurs_actu
-            va_cout_cum += np.cumsum(couts_repar_actualises)
-
-    # Ajouter coûts incitatifs (NOUVEAU v3.8)
-    # En mode ÉCONOMIQUE: EXCLUS (transferts neutres pour le bien-être social)
-    # En mode FINANCIER: INCLUS (coût réel pour le budget municipal)
-    if len(traj.couts_incitatifs) > 0 and mode_compte == ModeCompte.FINANCIER:
-        couts_incitatifs_actualises = traj.couts_incitatifs * facteurs_actu
-        va_cout_cum += np.cumsum(couts_incitatifs_actualises)
-
-    # VAN cumulative
-    van_cumulative = va_benef_cum - va_cout_cum
-
-    # Période de récupération (interpolation linéaire)
-    periode_recuperation = annee_croisement(van_cumulative)
-
-    return van_cumulative, periode_recuperation
-
-
-# =============================================================================
-# FONCTIONS UTILITAIRES
-# =============================================================================
-
-def fmt_argent(x: float, decimales: int = 0) -> str:
-    """Formater les montants en dollars."""
-    try:
-        if x is None or not np.isfinite(x):
-            return "---"
-        if abs(x) >= 1e9:
-            return f"{x/1e9:,.{decimales}f} G$"
-        if abs(x) >= 1e6:
-            return f"{x/1e6:,.{decimales}f} M$"
-        if abs(x) >= 1e3:
-            return f"{x/1e3:,.{decimales}f} k$"
-        return f"{x:,.{decimales}f} $"
-    except (TypeError, ValueError):
-        return "---"
-
-
-def facteur_recuperation_capital(r: float, n: int) -> float:
-    """
-    Facteur de récupération du capital (FRC).
-
-    Convertit une valeur actuelle en paiements annuels équivalents.
-    """
-    if n <= 0:
-        return 0.0
-    if r <= 1e-10:
-        return 1.0 / max(1, n)
-    rn = (1.0 + r) ** n
-    return r * rn / (rn - 1.0)
-
-
-def valeur_actuelle_annuite(paiement: float, r: float, n: int) -> float:
-    """Valeur actuelle d'une annuité."""
-    if n <= 0:
-        return 0.0
-    if abs(r) < 1e-10:
-        return paiement * n
-    return paiement * (1 - (1 + r) ** (-n)) / r
-
-
-def annee_croisement(serie: np.ndarray) -> float:
-    """
-    Trouver l'année fractionnaire où la VAN cumulative croise zéro.
-
-    Utilise interpolation linéaire entre les valeurs annuelles.
-    """
-    for i in range(len(serie)):
-        if serie[i] >= 0:
-            if i == 0:
-                return 0.0
-            prev, curr = serie[i - 1], serie[i]
-            if curr == prev:
-                return float(i)
-            frac = (0 - prev) / (curr - prev)
-            return i + frac
-    return float('inf')
-
-
-def division_securisee(num: float, denom: float, defaut: float = np.nan) -> float:
-    """Division sécurisée avec valeur par défaut."""
-    if abs(denom) < 1e-10:
-        return defaut
-    return num / denom
-
-
-# =============================================================================
-# MODÈLE PRINCIPAL
-# =============================================================================
-
-def executer_modele(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-    params_adoption: Optional[ParametresAdoption] = None,
-) -> ResultatsModele:
-    """
-    Exécuter l'analyse coûts-bénéfices pour un type de compteur.
-
-    Version 3.5.0 - Stratégies d'adoption progressive.
-
-    Cette version utilise des séries temporelles B[t] et C[t] permettant:
-    - Persistance décroissante des effets comportementaux α_B(t)
-    - Coûts de réparation des fuites avec partage ville/ménages
-    - Analyse ECONOMIQUE (bien-être social) ou FINANCIERE (budget municipal)
-    - NOUVEAU: Adoption progressive A(t) avec CAPEX étalé
-
-    Paramètres:
-        params: Paramètres du modèle (population, consommation, etc.)
-        compteur: Paramètres du compteur (coûts, type, etc.)
-        config_echelle: Configuration des économies d'échelle (optionnel)
-        persistance: Configuration de persistance comportementale (optionnel)
-                    Si None: comportement constant (équivalent à v3.0)
-                    Utiliser PERSISTANCE_OPTIMISTE/REALISTE/PESSIMISTE
-        params_fuites: Configuration des coûts de réparation (optionnel)
-                      Si None: pas de coûts de réparation (modèle de base)
-                      Utiliser FUITES_SANS_COUT/MENAGE_SEUL/SUBVENTION_50/VILLE_SEULE
-        params_fuites_reseau: Configuration des pertes réseau (optionnel)
-        mode_compte: ECONOMIQUE (bien-être social) ou FINANCIER (budget municipal)
-                    ECONOMIQUE: valeur sociale de l'eau, sans tarification, tous les coûts
-                    FINANCIER: coût variable évité, sans tarification, coûts ville seulement
-        valeur_eau: Paramètres de valorisation (défaut: VALEUR_EAU_QUEBEC)
-        params_adoption: Stratégie d'adoption (défaut: ADOPTION_OBLIGATOIRE)
-                        Utiliser ADOPTION_OBLIGATOIRE/RAPIDE/PROGRESSIVE/NOUVEAUX/PAR_SECTEUR
-
-    Retourne:
-        ResultatsModele avec tous les calculs
-    """
-    # Extraction paramètres
-    H = params.nb_menages
-    H_compteurs = params.nb_compteurs_effectif
-    r = params.taux_actualisation_pct / 100.0
-    T = params.horizon_analyse
-    part_ville_capex = params.part_ville_capex_pct / 100.0
-    part_ville_opex = params.part_ville_opex_pct / 100.0
-
-    # Initialiser config économies d'échelle si non fournie
-    if config_echelle is None:
-        config_echelle = ConfigEconomiesEchelle(activer=False)
-
-    # === ÉTAPE 1: CALCUL DES ÉCONOMIES D'EAU (INITIALES, v3.8: avec facteurs efficacité) ===
-    economies = calculer_economies_eau(params, params_fuites, compteur)
-
-    # === ÉTAPE 2: GÉNÉRATION DES TRAJECTOIRES (v3.5: avec adoption) ===
-    traj, I0, facteur_echelle, cout_ajuste = generer_trajectoires(
-        params, compteur, economies, config_echelle, persistance, params_fuites,
-        params_fuites_reseau,
-        mode_compte=mode_compte, valeur_eau=valeur_eau,
-        params_adoption=params_adoption
-    )
-    facteur_echelle_compteur = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_compteur)
-    facteur_echelle_installation = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_installation)
-    facteur_echelle_reseau = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_reseau)
-
-    # === ÉTAPE 3: ACTUALISATION DES SÉRIES (v3.8: avec coûts incitatifs, v3.11: MCF) ===
-    inclure_repar = params_fuites is not None and params_fuites.inclure_cout_reparation
-    va_benef, va_exploit, va_batterie, va_reparation, va_incitatifs, van, rbc = actualiser_series(
-        traj,
-        r,
-        I0,
-        inclure_reparations=inclure_repar,
-        mode_compte=mode_compte,
-        part_ville_capex=part_ville_capex,
-        part_ville_opex=part_ville_opex,
-        valeur_eau=valeur_eau,  # v3.11: pour application du MCF
-    )
-
-    # Coûts totaux actualisés (incluant CAPEX étalé et incitatifs si actifs)
-    # Note : actualiser_series inclut déjà le CAPEX étalé et les incitatifs dans ses calculs
-    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
-    va_couts = va_benef - van
-
-    # Valeur d'eau effective (cohérente avec generer_trajectoires)
-    if valeur_eau is None:
-        valeur_eau_eff = ParametresValeurEau(
-            valeur_sociale_m3=params.valeur_eau_m3,
-            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
-        )
-    else:
-        valeur_eau_eff = valeur_eau
-
-    # Décomposition des bénéfices d'eau (VA)
-    va_benefices_eau = float(np.sum(traj.benefices_eau * facteurs_actu))
-    va_benefices_report_infra = float(np.sum(traj.benefices_infra * facteurs_actu))
-    va_benefices_cout_variable = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.cout_variable_m3 * facteurs_actu))
-    va_benefices_infra_m3 = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.cout_infrastructure_m3 * facteurs_actu))
-    va_benefices_externalites = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.valeur_externalites_m3 * facteurs_actu))
-
-    # === ÉTAPE 4: VAN CUMULATIVE ET PÉRIODE DE RÉCUPÉRATION ===
-    # CORRECTION v3.12: Passer valeur_eau pour cohérence MCF avec actualiser_series
-    van_cum, periode_recup = calculer_van_cumulative(
-        traj,
-        r,
-        I0,
-        inclure_reparations=inclure_repar,
-        mode_compte=mode_compte,
-        part_ville_capex=part_ville_capex,
-        part_ville_opex=part_ville_opex,
-        valeur_eau=valeur_eau,
-    )
-
-    # === MÉTRIQUES PAR MÉNAGE (PV-COHÉRENTES) ===
-    # PV des économies d'eau (m³) sur l'horizon
-    pv_m3 = float(np.sum(traj.economies_eau_m3 * facteurs_actu))
-
-    # Coût annuel équivalent (EAC) basé sur la VA des coûts totaux
-    frc = facteur_recuperation_capital(r, T)
-    eac = division_securisee(va_couts, H) * frc
-
-    # Coût nivelé eau économisée ($/m³) : LCSW = PV(C) / PV(m³)
-    lcsw = division_securisee(va_couts, pv_m3)
-
-    # Seuil de rentabilité (m³/an) : cohérent avec le mode de valorisation
-    valeur_m3 = valeur_eau_eff.valeur_eau(mode_compte)
-    q_star = division_securisee(eac, valeur_m3)
-
-    # === CALCULS DÉRIVÉS POUR COMPATIBILITÉ ===
-    cout_base = compteur.cout_initial_par_compteur
-    economies_echelle = (cout_base - cout_ajuste) * H_compteurs
-
-    # Bénéfices annuels (année 1 pour affichage, mais varient avec persistance)
-    benef_eau = float(traj.benefices_eau[0])
-    benef_infra = float(traj.benefices_infra[0])
-    benef_totaux = float(np.mean(traj.benefices_totaux))  # Moyenne pour persistance
-    cout_reseau_an1 = float(traj.couts_reseau[0]) if len(traj.couts_reseau) > 0 else 0.0
-    if mode_compte == ModeCompte.FINANCIER:
-        cout_exploit = float(traj.couts_exploitation[0] * part_ville_opex + cout_reseau_an1)
-        investissement_initial = I0 * part_ville_capex
-    else:
-        cout_exploit = float(traj.couts_exploitation[0] + cout_reseau_an1)
-        investissement_initial = I0
-
-    # Économies: année 1 (initial) pour compatibilité affichage
-    # Note : avec persistance, economies_par_menage varie par année
-    if len(traj.economies_fuites_menage) > 0:
-        eco_fuite_initiale = float(traj.economies_fuites_menage[0])
-    else:
-        eco_fuite_initiale = economies.economie_fuite
-
-    if len(traj.economies_comportement_menage) > 0:
-        eco_comportement_initiale = float(traj.economies_comportement_menage[0])
-    else:
-        eco_comportement_initiale = float(traj.economies_par_menage[0]) - economies.economie_fuite
-
-    if len(traj.economies_reseau_par_menage) > 0:
-        eco_reseau_initiale = float(traj.economies_reseau_par_menage[0])
-    else:
-        eco_reseau_initiale = 0.0
-
-    return ResultatsModele(
-        params=params,
-        compteur=compteur,
-        mode_compte=mode_compte,
-        # Économies d'eau par ménage (valeurs initiales année 1)
-        usage_base_menage=economies.usage_base,
-        economie_fuite_menage=eco_fuite_initiale,
-        economie_comportement_menage=eco_comportement_initiale,
-        economie_reseau_menage=eco_reseau_initiale,
-        economie_totale_menage=float(traj.economies_par_menage[0]),
-        # Économies totales sur l'horizon (m³, tous ménages, toutes années)
-        economies_totales_horizon_m3=float(np.sum(traj.economies_eau_m3)),
-        # Flux annuels
-        investissement_initial=investissement_initial,
-        benefices_eau_annuels=benef_eau,
-        benefice_infra_annuel=benef_infra,
-        benefices_totaux_annuels=benef_totaux,
-        couts_exploitation_annuels=cout_exploit,
-        # Valeurs actualisées
-        va_benefices=va_benef,
-        va_benefices_eau=va_benefices_eau,
-        va_benefices_report_infra=va_benefices_report_infra,
-        va_benefices_cout_variable=va_benefices_cout_variable,
-        va_benefices_infra_m3=va_benefices_infra_m3,
-        va_benefices_externalites=va_benefices_externalites,
-        va_couts_exploitation=va_exploit,
-        va_couts_totaux=va_couts,
-        van=van,
-        # Métriques
-        rbc=rbc,
-        eac_menage=eac,
-        lcsw=lcsw,
-        seuil_rentabilite_m3=q_star,
-        # Séries temporelles
-        annees=traj.annees,
-        van_cumulative=van_cum,
-        periode_recuperation=periode_recup,
-        # Économies d'échelle
-        economies_echelle_actives=config_echelle.activer,
-        facteur_echelle=facteur_echelle,
-        facteur_echelle_compteur=facteur_echelle_compteur,
-        facteur_echelle_installation=facteur_echelle_installation,
-        facteur_echelle_reseau=facteur_echelle_reseau,
-        cout_par_compteur_base=cout_base,
-        cout_par_compteur_ajuste=cout_ajuste,
-        economies_realisees=economies_echelle,
-    )
-
-
-def comparer_types_compteurs(
-    params: ParametresModele,
-    compteur_base: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None
-) -> pd.DataFrame:
-    """
-    Comparer les 3 types de compteurs (AMI, AMR, Manuel).
-
-    Utilise les mêmes paramètres de modèle mais ajuste les coûts
-    selon le type de compteur. Les coûts unitaires sont stylisés:
-    ils dépendent aussi de la plomberie, densité urbaine, réseau,
-    intégration SI et cybersécurité.
-    Si config_echelle est None, compare sans et avec économies d'échelle.
-    """
-    if compteur_base is None:
-        compteur_base = ParametresCompteur()
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for type_c in TypeCompteur:
-            # Créer compteur avec le bon type
-            compteur = ParametresCompteur(
-                type_compteur=type_c,
-                cout_compteur=_cout_compteur_par_type(type_c),
-                heures_installation=compteur_base.heures_installation,
-                taux_horaire_installation=compteur_base.taux_horaire_installation,
-                cout_reseau_par_compteur=(50.0 if type_c == TypeCompteur.AMI else 0.0),
-                duree_vie_compteur=compteur_base.duree_vie_compteur,
-                duree_vie_batterie=compteur_base.duree_vie_batterie,
-                cout_opex_non_tech_ami=compteur_base.cout_opex_non_tech_ami,
-                ventilation_opex_ami=compteur_base.ventilation_opex_ami,
-            )
-
-            res = executer_modele(params, compteur, cfg_echelle)
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Type": type_c.value.upper(),
-                "Coût initial/compteur": res.cout_par_compteur_ajuste if cfg_echelle and cfg_echelle.activer else compteur.cout_initial_par_compteur,
-                "Investissement total": res.investissement_initial,
-                "Coût exploit./an": res.couts_exploitation_annuels,
-                "VAN": res.van,
-                "RBC": res.rbc,
-                "Récupération (ans)": res.periode_recuperation,
-                "LCSW ($/m³)": res.lcsw,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-def _cout_compteur_par_type(type_c: TypeCompteur) -> float:
-    """Coût typique du compteur selon le type."""
-    couts = {
-        TypeCompteur.AMI: 250.0,
-        TypeCompteur.AMR: 180.0,
-        TypeCompteur.MANUEL: 80.0,
-    }
-    return couts.get(type_c, 250.0)
-
-
-# =============================================================================
-# COMPARAISON DES SCÉNARIOS DE PERSISTANCE
-# =============================================================================
-
-def comparer_scenarios_persistance(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    scenarios: Optional[dict] = None,
-) -> pd.DataFrame:
-    """
-    Comparer les résultats du modèle selon différents scénarios de persistance.
-
-    Cette fonction permet d'évaluer l'impact de la persistance des effets
-    comportementaux sur la rentabilité du projet.
-    Si config_echelle est None, compare sans et avec économies d'échelle.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur (défaut: AMI standard)
-        config_echelle: Configuration économies d'échelle
-        scenarios: Dict {nom: ParametresPersistance} (défaut: 3 scénarios standard)
-
-    Retourne:
-        DataFrame avec les métriques pour chaque scénario
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if scenarios is None:
-        scenarios = SCENARIOS_PERSISTANCE
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for nom, persistance in scenarios.items():
-            res = executer_modele(params, compteur, cfg_echelle, persistance)
-
-            # Calculer économies moyennes sur l'horizon
-            # (déjà fait dans executer_modele mais on recalcule pour clarté)
-            economies = calculer_economies_eau(params, compteur=compteur)
-            traj, _, _, _ = generer_trajectoires(
-                params, compteur, economies, cfg_echelle, persistance
-            )
-            eco_moy = float(np.mean(traj.economies_par_menage))
-            eco_an1 = float(traj.economies_par_menage[0])
-            eco_an20 = float(traj.economies_par_menage[-1])
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Scénario": persistance.nom,
-                "Mode": persistance.mode.value,
-                # Économies d'eau
-                "Éco. an 1 (m³/mén)": eco_an1,
-                "Éco. an 20 (m³/mén)": eco_an20,
-                "Éco. moyenne (m³/mén)": eco_moy,
-                "Rétention (%)": (eco_an20 / eco_an1 * 100) if eco_an1 > 0 else 0,
-                # Métriques financières
-                "VAN": res.van,
-                "RBC": res.rbc,
-                "Récup. (ans)": res.periode_recuperation,
-                "LCSW ($/m³)": res.lcsw,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-def afficher_comparaison_persistance(
-    df: pd.DataFrame,
-    titre: str = "Impact de la persistance comportementale"
-) -> None:
-    """
-    Afficher un tableau formaté de comparaison des scénarios.
-
-    Paramètres:
-        df: DataFrame retourné par comparer_scenarios_persistance()
-        titre: Titre du tableau
-    """
-    has_echelle = "Échelle" in df.columns
-    largeur = 92 if has_echelle else 80
-    print("\n" + "=" * largeur)
-    print(f" {titre}".center(largeur))
-    print("=" * largeur)
-
-    if has_echelle:
-        print(f"\n{'Échelle':<14} │ {'Scénario':<12} │ {'Éco moy':<10} │ {'Rétention':<10} │ "
-              f"{'VAN':<12} │ {'RBC':<6} │ {'Récup.':<8}")
-        print("─" * 14 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" +
-              "─" * 12 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
-    else:
-        print(f"\n{'Scénario':<12} │ {'Éco moy':<10} │ {'Rétention':<10} │ "
-              f"{'VAN':<12} │ {'RBC':<6} │ {'Récup.':<8}")
-        print("─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" +
-              "─" * 12 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
-
-    for _, row in df.iterrows():
-        scenario = row["Scénario"][:11]
-        eco_moy = f"{row['Éco. moyenne (m³/mén)']:.1f} m³"
-        retention = f"{row['Rétention (%)']:.0f}%"
-        van = fmt_argent(row["VAN"])
-        rbc = f"{row['RBC']:.2f}"
-        recup = f"{row['Récup. (ans)']:.1f} ans"
-
-        if has_echelle:
-            print(f"{row['Échelle']:<14} │ {scenario:<12} │ {eco_moy:<10} │ {retention:<10} │ "
-                  f"{van:<12} │ {rbc:<6} │ {recup:<8}")
-        else:
-            print(f"{scenario:<12} │ {eco_moy:<10} │ {retention:<10} │ "
-                  f"{van:<12} │ {rbc:<6} │ {recup:<8}")
-
-    print("=" * largeur)
-
-    # Calcul de l'écart optimiste-pessimiste
-    if len(df) >= 2:
-        van_max = df["VAN"].max()
-        van_min = df["VAN"].min()
-        ecart = van_max - van_min
-        ecart_pct = (ecart / van_max * 100) if van_max > 0 else 0
-        print(f"\nÉcart VAN (optimiste - pessimiste): {fmt_argent(ecart)} ({ecart_pct:.0f}%)")
-
-
-def graphique_persistance(
-    params: ParametresModele,
-    scenarios: Optional[dict] = None,
-    sauvegarder: bool = True,
-    afficher: bool = True,
-    dossier: str = "figures"
-) -> Optional[plt.Figure]:
-    """
-    Générer un graphique des courbes de persistance α_B(t).
-
-    Affiche l'évolution du coefficient de réduction comportementale
-    pour chaque scénario sur l'horizon d'analyse.
-
-    Paramètres:
-        params: Paramètres du modèle (pour l'horizon)
-        scenarios: Dict {nom: ParametresPersistance}
-        sauvegarder: Sauvegarder en PNG
-        afficher: Afficher le graphique
-        dossier: Dossier de sauvegarde
-
-    Retourne:
-        Figure matplotlib (ou None si erreur)
-    """
-    if scenarios is None:
-        scenarios = SCENARIOS_PERSISTANCE
-
-    T = params.horizon_analyse
-    annees = np.arange(1, T + 1)
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-    # Couleurs pour chaque scénario
-    couleurs = {
-        "optimiste": "#2ecc71",   # Vert
-        "realiste": "#3498db",    # Bleu
-        "pessimiste": "#e74c3c",  # Rouge
-    }
-
-    # === GRAPHIQUE 1: Courbes α_B(t) ===
-    for nom, persistance in scenarios.items():
-        serie_alpha = generer_serie_alpha(persistance, T) * 100  # En %
-        couleur = couleurs.get(nom, "#95a5a6")
-        ax1.plot(annees, serie_alpha, linewidth=2.5, label=persistance.nom,
-                 color=couleur, marker='o', markersize=3, markevery=2)
-
-    ax1.set_xlabel("Année", fontsize=11)
-    ax1.set_ylabel("Réduction comportementale α_B(t) (%)", fontsize=11)
-    ax1.set_title("Persistance des effets comportementaux", fontsize=12, fontweight='bold')
-    ax1.legend(loc='upper right', fontsize=10)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(1, T)
-    ax1.set_ylim(0, max(s.alpha_initial for s in scenarios.values()) * 100 * 1.1)
-
-    # === GRAPHIQUE 2: Économies cumulées ===
-    # Calculer les économies pour un ménage type (sans double-compte fuites)
-    economies_base = calculer_economies_eau(params)
-    usage_reductible = economies_base.usage_reductible
-    eco_fuite = economies_base.economie_fuite
-
-    for nom, persistance in scenarios.items():
-        serie_alpha = generer_serie_alpha(persistance, T)
-        eco_comportement = usage_reductible * serie_alpha
-        eco_totale = eco_fuite + eco_comportement
-        eco_cumul = np.cumsum(eco_totale)
-
-        couleur = couleurs.get(nom, "#95a5a6")
-        ax2.plot(annees, eco_cumul, linewidth=2.5, label=persistance.nom,
-                 color=couleur, linestyle='-')
-
-    ax2.set_xlabel("Année", fontsize=11)
-    ax2.set_ylabel("Économies cumulées (m³/ménage)", fontsize=11)
-    ax2.set_title("Économies d'eau cumulées par ménage", fontsize=12, fontweight='bold')
-    ax2.legend(loc='lower right', fontsize=10)
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xlim(1, T)
-
-    plt.tight_layout()
-
-    if sauvegarder:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "persistance_scenarios.png")
-        plt.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Graphique sauvegardé: {chemin}")
-
-    if afficher:
-        plt.show()
-
-    return fig
-
-
-def graphique_van_scenarios_persistance(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    scenarios: Optional[dict] = None,
-    sauvegarder: bool = True,
-    afficher: bool = True,
-    dossier: str = "figures",
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> Optional[plt.Figure]:
-    """
-    Générer un graphique comparant la VAN cumulative selon les scénarios.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config_echelle: Configuration économies d'échelle
-        scenarios: Dict des scénarios de persistance
-        sauvegarder: Sauvegarder en PNG
-        afficher: Afficher le graphique
-        dossier: Dossier de sauvegarde
-        mode_compte: Perspective d'analyse (économique/financier)
-        valeur_eau: Paramètres de valorisation (MCF si applicable)
-
-    Retourne:
-        Figure matplotlib
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if scenarios is None:
-        scenarios = SCENARIOS_PERSISTANCE
-
-    T = params.horizon_analyse
-    r = params.taux_actualisation_pct / 100.0
-    part_ville_capex = params.part_ville_capex_pct / 100.0
-    part_ville_opex = params.part_ville_opex_pct / 100.0
-    annees = np.arange(1, T + 1)
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    couleurs = {
-        "optimiste": "#2ecc71",
-        "realiste": "#3498db",
-        "pessimiste": "#e74c3c",
-    }
-
-    resultats_van = {}
-
-    for nom, persistance in scenarios.items():
-        # Exécuter le modèle (v3.8: avec facteurs efficacité compteur)
-        economies = calculer_economies_eau(params, compteur=compteur)
-        traj, I0, _, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle, persistance,
-            mode_compte=mode_compte, valeur_eau=valeur_eau
-        )
-        van_cum, _ = calculer_van_cumulative(
-            traj,
-            r,
-            I0,
-            mode_compte=mode_compte,
-            part_ville_capex=part_ville_capex,
-            part_ville_opex=part_ville_opex,
-            valeur_eau=valeur_eau,
-        )
-
-        couleur = couleurs.get(nom, "#95a5a6")
-        ax.plot(annees, van_cum / 1e6, linewidth=2.5, label=persistance.nom,
-                color=couleur)
-
-        resultats_van[nom] = van_cum[-1]
-
-    # Ligne de zéro
-    ax.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
-
-    ax.set_xlabel("Année", fontsize=11)
-    ax.set_ylabel("VAN cumulative (M$)", fontsize=11)
-    ax.set_title("VAN cumulative selon le scénario de persistance", fontsize=12, fontweight='bold')
-    ax.legend(loc='lower right', fontsize=10)
-    ax.grid(True, alpha=0.3)
-    ax.set_xlim(1, T)
-
-    plt.tight_layout()
-
-    if sauvegarder:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "van_scenarios_persistance.png")
-        plt.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Graphique sauvegardé: {chemin}")
-
-    if afficher:
-        plt.show()
-
-    return fig
-
-
-# =============================================================================
-# COMPARAISON DES SCÉNARIOS DE FUITES
-# =============================================================================
-
-def comparer_scenarios_fuites(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    scenarios_fuites: Optional[dict] = None,
-) -> pd.DataFrame:
-    """
-    Comparer les résultats du modèle selon différents scénarios de fuites.
-
-    Cette fonction permet d'évaluer l'impact des coûts de réparation et
-    du partage des coûts ville/ménages sur la rentabilité du projet.
-    Si config_echelle est None, compare sans et avec économies d'échelle.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur (défaut: AMI standard)
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance (défaut: réaliste)
-        scenarios_fuites: Dict {nom: ParametresFuites} (défaut: 4 scénarios standard)
-
-    Retourne:
-        DataFrame avec les métriques pour chaque scénario
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if scenarios_fuites is None:
-        scenarios_fuites = SCENARIOS_FUITES
-
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for nom, params_fuites in scenarios_fuites.items():
-            # Exécuter le modèle avec ce scénario de fuites
-            res = executer_modele(params, compteur, cfg_echelle, persistance, params_fuites)
-
-            # Calculer les coûts de réparation pour ce scénario (v3.8: avec facteur efficacité)
-            res_fuites = calculer_dynamique_fuites(
-                params_fuites, params.nb_menages, params.horizon_analyse,
-                facteur_efficacite_detection=compteur.facteur_efficacite_fuites
-            )
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Scénario": params_fuites.nom,
-                "Mode": params_fuites.mode_repartition.value,
-                "Part ville (%)": params_fuites.part_ville_pct,
-                # Métriques réparations
-                "Réparations": res_fuites.total_reparations,
-                "Coût total ($)": res_fuites.cout_total,
-                "Coût ville ($)": res_fuites.cout_ville_total,
-                "Coût ménages ($)": res_fuites.cout_menages_total,
-                # Métriques financières
-                "VAN": res.van,
-                "RBC": res.rbc,
-                "Récup. (ans)": res.periode_recuperation,
-                "LCSW ($/m³)": res.lcsw,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-def afficher_comparaison_fuites(
-    df: pd.DataFrame,
-    titre: str = "Impact des coûts de réparation des fuites"
-) -> None:
-    """
-    Afficher un tableau formaté de comparaison des scénarios de fuites.
-
-    Paramètres:
-        df: DataFrame retourné par comparer_scenarios_fuites()
-        titre: Titre du tableau
-    """
-    has_echelle = "Échelle" in df.columns
-    largeur = 104 if has_echelle else 90
-    print("\n" + "=" * largeur)
-    print(f" {titre}".center(largeur))
-    print("=" * largeur)
-
-    if has_echelle:
-        print(f"\n{'Échelle':<14} │ {'Scénario':<16} │ {'Part ville':<10} │ {'Coût total':<12} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8}")
-        print("─" * 14 + "─┼─" + "─" * 16 + "─┼─" + "─" * 10 + "─┼─" + "─" * 12 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
-    else:
-        print(f"\n{'Scénario':<16} │ {'Part ville':<10} │ {'Coût total':<12} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8}")
-        print("─" * 16 + "─┼─" + "─" * 10 + "─┼─" + "─" * 12 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
-
-    for _, row in df.iterrows():
-        scenario = row["Scénario"][:15]
-        part_ville = f"{row['Part ville (%)']:.0f}%"
-        cout_total = fmt_argent(row["Coût total ($)"])
-        van = fmt_argent(row["VAN"])
-        rbc = f"{row['RBC']:.2f}"
-        recup = f"{row['Récup. (ans)']:.1f} ans" if np.isfinite(row['Récup. (ans)']) else "N/A"
-
-        if has_echelle:
-            print(f"{row['Échelle']:<14} │ {scenario:<16} │ {part_ville:<10} │ {cout_total:<12} │ "
-                  f"{van:<14} │ {rbc:<6} │ {recup:<8}")
-        else:
-            print(f"{scenario:<16} │ {part_ville:<10} │ {cout_total:<12} │ "
-                  f"{van:<14} │ {rbc:<6} │ {recup:<8}")
-
-    print("=" * largeur)
-
-    # Analyse de l'impact des coûts de réparation
-    if len(df) >= 2:
-        df_interpret = df
-        if has_echelle:
-            df_base = df[df["Échelle"] == "Sans échelle"]
-            if not df_base.empty:
-                df_interpret = df_base
-        van_sans_cout = df_interpret[df_interpret["Mode"] == "gratuit"]["VAN"].values
-        van_menage = df_interpret[df_interpret["Mode"] == "menage"]["VAN"].values
-        if len(van_sans_cout) > 0 and len(van_menage) > 0:
-            impact = van_sans_cout[0] - van_menage[0]
-            impact_pct = (impact / van_sans_cout[0] * 100) if van_sans_cout[0] > 0 else 0
-            print(f"\nImpact des coûts de réparation sur VAN: -{fmt_argent(impact)} ({impact_pct:.1f}%)")
-
-
-def graphique_scenarios_fuites(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    scenarios_fuites: Optional[dict] = None,
-    sauvegarder: bool = True,
-    afficher: bool = True,
-    dossier: str = "figures",
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> Optional[plt.Figure]:
-    """
-    Générer un graphique comparant la VAN selon les scénarios de fuites.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance
-        scenarios_fuites: Dict des scénarios de fuites
-        sauvegarder: Sauvegarder en PNG
-        afficher: Afficher le graphique
-        dossier: Dossier de sauvegarde
-        mode_compte: Perspective d'analyse (économique/financier)
-        valeur_eau: Paramètres de valorisation (MCF si applicable)
-
-    Retourne:
-        Figure matplotlib
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if scenarios_fuites is None:
-        scenarios_fuites = SCENARIOS_FUITES
-
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-
-    T = params.horizon_analyse
-    r = params.taux_actualisation_pct / 100.0
-    part_ville_capex = params.part_ville_capex_pct / 100.0
-    part_ville_opex = params.part_ville_opex_pct / 100.0
-    annees = np.arange(1, T + 1)
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-    # Couleurs pour chaque scénario
-    couleurs = {
-        "sans_cout": "#2ecc71",     # Vert (référence)
-        "menage": "#e74c3c",        # Rouge (coûts élevés pour ménages)
-        "subvention_50": "#f39c12", # Orange (partage)
-        "ville": "#3498db",         # Bleu (ville absorbe)
-    }
-
-    # === GRAPHIQUE 1: VAN cumulative ===
-    for nom, params_fuites in scenarios_fuites.items():
-        economies = calculer_economies_eau(params, params_fuites, compteur)
-        traj, I0, _, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle, persistance, params_fuites,
-            mode_compte=mode_compte, valeur_eau=valeur_eau
-        )
-        inclure_repar = params_fuites.inclure_cout_reparation
-        van_cum, _ = calculer_van_cumulative(
-            traj,
-            r,
-            I0,
-            inclure_reparations=inclure_repar,
-            mode_compte=mode_compte,
-            part_ville_capex=part_ville_capex,
-            part_ville_opex=part_ville_opex,
-            valeur_eau=valeur_eau,
-        )
-
-        couleur = couleurs.get(nom, "#95a5a6")
-        ax1.plot(annees, van_cum / 1e6, linewidth=2.5, label=params_fuites.nom,
-                 color=couleur)
-
-    ax1.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
-    ax1.set_xlabel("Année", fontsize=11)
-    ax1.set_ylabel("VAN cumulative (M$)", fontsize=11)
-    ax1.set_title("VAN selon le partage des coûts de réparation", fontsize=12, fontweight='bold')
-    ax1.legend(loc='lower right', fontsize=10)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(1, T)
-
-    # === GRAPHIQUE 2: Répartition des coûts (barres empilées) ===
-    scenarios_labels = []
-    couts_ville = []
-    couts_menages = []
-
-    for nom, params_fuites in scenarios_fuites.items():
-        # v3.8: Appliquer le facteur d'efficacité du compteur
-        res_fuites = calculer_dynamique_fuites(
-            params_fuites, params.nb_menages, T,
-            facteur_efficacite_detection=compteur.facteur_efficacite_fuites
-        )
-        scenarios_labels.append(params_fuites.nom)
-        couts_ville.append(res_fuites.cout_ville_total / 1e6)
-        couts_menages.append(res_fuites.cout_menages_total / 1e6)
-
-    x = np.arange(len(scenarios_labels))
-    width = 0.6
-
-    ax2.bar(x, couts_ville, width, label='Ville', color='#3498db', alpha=0.8)
-    ax2.bar(x, couts_menages, width, bottom=couts_ville, label='Ménages', color='#e74c3c', alpha=0.8)
-
-    ax2.set_xlabel("Scénario", fontsize=11)
-    ax2.set_ylabel("Coûts de réparation (M$)", fontsize=11)
-    ax2.set_title("Répartition des coûts de réparation", fontsize=12, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(scenarios_labels, rotation=15, ha='right')
-    ax2.legend(loc='upper right', fontsize=10)
-    ax2.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
-
-    if sauvegarder:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "scenarios_fuites.png")
-        plt.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Graphique sauvegardé: {chemin}")
-
-    if afficher:
-        plt.show()
-
-    return fig
-
-
-# =============================================================================
-# COMPARAISON DES PERSPECTIVES ÉCONOMIQUE VS FINANCIER
-# =============================================================================
-
-def comparer_perspectives(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> pd.DataFrame:
-    """
-    Comparer les résultats du modèle selon les deux perspectives d'analyse.
-
-    Cette fonction fondamentale permet de distinguer:
-    - ECONOMIQUE: Le projet améliore-t-il le bien-être social collectif?
-    - FINANCIER: Le projet est-il viable pour le budget municipal?
-
-    Différences clés:
-    - Valeur de l'eau: sociale (4.69$) vs coût variable (0.50$)
-    - Coûts réparation: total vs part ville
-    - MCF: applicable en économique (si activé) vs non applicable en financier
-    Si config_echelle est None, compare sans et avec économies d'échelle.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur (défaut: AMI standard)
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance (défaut: réaliste)
-        params_fuites: Configuration des fuites (défaut: ménage seul)
-        params_fuites_reseau: Configuration des pertes réseau (optionnel)
-        valeur_eau: Paramètres de valorisation (défaut: Québec standard)
-
-    Retourne:
-        DataFrame avec les métriques pour chaque perspective
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if valeur_eau is None:
-        valeur_eau = VALEUR_EAU_QUEBEC
-
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
-            res = executer_modele(
-                params, compteur, cfg_echelle, persistance, params_fuites,
-                params_fuites_reseau,
-                mode_compte=mode, valeur_eau=valeur_eau
-            )
-
-            # Déterminer la valeur de l'eau utilisée
-            val_eau = valeur_eau.valeur_sociale_m3 if mode == ModeCompte.ECONOMIQUE else valeur_eau.cout_variable_m3
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Perspective": "Économique" if mode == ModeCompte.ECONOMIQUE else "Financier",
-                "Mode": mode.value,
-                # Valorisation
-                "Valeur eau ($/m³)": val_eau,
-                "Tarification volumétrique": "Non",
-                # Métriques financières
-                "VA Bénéfices ($)": res.va_benefices,
-                "VA Coûts ($)": res.va_couts_totaux,
-                "VAN ($)": res.van,
-                "RBC": res.rbc,
-                "Récup. (ans)": res.periode_recuperation,
-                "LCSW ($/m³)": res.lcsw,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-def afficher_comparaison_perspectives(
-    df: pd.DataFrame,
-    titre: str = "Analyse Économique vs Financière"
-) -> None:
-    """
-    Afficher un tableau formaté comparant les deux perspectives.
-
-    Paramètres:
-        df: DataFrame retourné par comparer_perspectives()
-        titre: Titre du tableau
-    """
-    has_echelle = "Échelle" in df.columns
-    largeur = 111 if has_echelle else 95
-    print("\n" + "=" * largeur)
-    print(f" {titre}".center(largeur))
-    print("=" * largeur)
-
-    if has_echelle:
-        print(f"\n{'Échelle':<14} │ {'Perspective':<12} │ {'Val. eau':<10} │ {'Tarif.':<8} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8} │ {'LCSW':<10}")
-        print("─" * 14 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 8 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8 + "─┼─" + "─" * 10)
-    else:
-        print(f"\n{'Perspective':<12} │ {'Val. eau':<10} │ {'Tarif.':<8} │ "
-              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8} │ {'LCSW':<10}")
-        print("─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 8 + "─┼─" +
-              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8 + "─┼─" + "─" * 10)
-
-    for _, row in df.iterrows():
-        perspective = row["Perspective"]
-        val_eau = f"{row['Valeur eau ($/m³)']:.2f} $"
-        tarif = row["Tarification volumétrique"]
-        van = fmt_argent(row["VAN ($)"])
-        rbc = f"{row['RBC']:.2f}"
-        recup = f"{row['Récup. (ans)']:.1f} ans" if np.isfinite(row['Récup. (ans)']) else "N/A"
-        lcsw = f"{row['LCSW ($/m³)']:.2f} $"
-
-        if has_echelle:
-            print(f"{row['Échelle']:<14} │ {perspective:<12} │ {val_eau:<10} │ {tarif:<8} │ "
-                  f"{van:<14} │ {rbc:<6} │ {recup:<8} │ {lcsw:<10}")
-        else:
-            print(f"{perspective:<12} │ {val_eau:<10} │ {tarif:<8} │ "
-                  f"{van:<14} │ {rbc:<6} │ {recup:<8} │ {lcsw:<10}")
-
-    print("=" * largeur)
-
-    # Interprétation
-    df_interpret = df
-    if has_echelle:
-        df_base = df[df["Échelle"] == "Sans échelle"]
-        if not df_base.empty:
-            df_interpret = df_base
-    eco_row = df_interpret[df_interpret["Mode"] == "economique"].iloc[0]
-    fin_row = df_interpret[df_interpret["Mode"] == "financier"].iloc[0]
-
-    van_eco = eco_row["VAN ($)"]
-    van_fin = fin_row["VAN ($)"]
-
-    print("\n" + "─" * largeur)
-    print("INTERPRÉTATION:")
-    print("─" * largeur)
-
-    if van_eco > 0 and van_fin > 0:
-        print("✓ Projet DOUBLEMENT VIABLE: rentable socialement ET financièrement")
-        print("  → Recommandation: Projet à réaliser sans subvention nécessaire")
-    elif van_eco > 0 and van_fin <= 0:
-        print("! Projet SOCIALEMENT RENTABLE mais FINANCIÈREMENT DÉFICITAIRE")
-        subvention = abs(van_fin)
-        print(f"  → Le projet génère du bien-être social mais nécessite une subvention")
-        print(f"  → Subvention justifiable: jusqu'à {fmt_argent(subvention)}")
-    elif van_eco <= 0 and van_fin > 0:
-        print("? Situation INHABITUELLE: rentable financièrement mais pas socialement")
-        print("  → Vérifier les hypothèses de valorisation de l'eau")
-    else:
-        print("✗ Projet NON RENTABLE: ni socialement ni financièrement")
-        print("  → Recommandation: Ne pas réaliser ou réviser les paramètres")
-
-    ecart = van_eco - van_fin
-    print(f"\nÉcart VAN (économique - financier): {fmt_argent(ecart)}")
-    print("Cet écart reflète: la valeur sociale non capturée par le marché")
-    print("=" * largeur)
-
-
-def graphique_perspectives(
-    params: ParametresModele,
-    compteur: Optional[ParametresCompteur] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-    sauvegarder: bool = True,
-    afficher: bool = True,
-    dossier: str = "figures"
-) -> Optional[plt.Figure]:
-    """
-    Générer un graphique comparant les VAN économique et financière.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config_echelle: Configuration économies d'échelle
-        persistance: Configuration de persistance
-        params_fuites: Configuration des fuites
-        params_fuites_reseau: Configuration des pertes réseau
-        valeur_eau: Paramètres de valorisation
-        sauvegarder: Sauvegarder en PNG
-        afficher: Afficher le graphique
-        dossier: Dossier de sauvegarde
-
-    Retourne:
-        Figure matplotlib
-    """
-    if compteur is None:
-        compteur = ParametresCompteur()
-
-    if valeur_eau is None:
-        valeur_eau = VALEUR_EAU_QUEBEC
-
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-
-    T = params.horizon_analyse
-    r = params.taux_actualisation_pct / 100.0
-    annees = np.arange(1, T + 1)
-
-    # Parts ville (pour mode financier)
-    part_ville_capex = params.part_ville_capex_pct / 100.0
-    part_ville_opex = params.part_ville_opex_pct / 100.0
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-    # Couleurs
-    couleur_eco = "#2ecc71"   # Vert
-    couleur_fin = "#3498db"   # Bleu
-
-    # === GRAPHIQUE 1: VAN cumulative ===
-    for mode, couleur, label in [
-        (ModeCompte.ECONOMIQUE, couleur_eco, "Économique (bien-être social)"),
-        (ModeCompte.FINANCIER, couleur_fin, "Financier (budget municipal)")
-    ]:
-        economies = calculer_economies_eau(params, params_fuites, compteur)
-        traj, I0, _, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle, persistance, params_fuites,
-            params_fuites_reseau,
-            mode_compte=mode, valeur_eau=valeur_eau
-        )
-        inclure_repar = params_fuites is not None and params_fuites.inclure_cout_reparation
-        van_cum, _ = calculer_van_cumulative(
-            traj,
-            r,
-            I0,
-            inclure_reparations=inclure_repar,
-            mode_compte=mode,
-            part_ville_capex=part_ville_capex,
-            part_ville_opex=part_ville_opex,
-            valeur_eau=valeur_eau,
-        )
-
-        ax1.plot(annees, van_cum / 1e6, linewidth=2.5, label=label, color=couleur)
-
-    ax1.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
-    ax1.set_xlabel("Année", fontsize=11)
-    ax1.set_ylabel("VAN cumulative (M$)", fontsize=11)
-    ax1.set_title("VAN cumulative: Économique vs Financier", fontsize=12, fontweight='bold')
-    ax1.legend(loc='lower right', fontsize=10)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(1, T)
-
-    # === GRAPHIQUE 2: Décomposition des bénéfices ===
-    # Barres groupées pour comparer les composantes
-    categories = ["Eau\néconomisée", "Report\ninfra"]
-    x = np.arange(len(categories))
-    width = 0.35
-
-    # Calculer les valeurs pour chaque mode
-    benefices_eco = []
-    benefices_fin = []
-
-    for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
-        economies = calculer_economies_eau(params, params_fuites, compteur)
-        traj, _, _, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle, persistance, params_fuites,
-            mode_compte=mode, valeur_eau=valeur_eau
-        )
-        facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
-
-        va_eau = float(np.sum(traj.benefices_eau * facteurs_actu)) / 1e6
-        va_infra = float(np.sum(traj.benefices_infra * facteurs_actu)) / 1e6
-
-        if mode == ModeCompte.ECONOMIQUE:
-            benefices_eco = [va_eau, va_infra]
-        else:
-            benefices_fin = [va_eau, va_infra]
-
-    ax2.bar(x - width/2, benefices_eco, width, label='Économique', color=couleur_eco, alpha=0.8)
-    ax2.bar(x + width/2, benefices_fin, width, label='Financier', color=couleur_fin, alpha=0.8)
-
-    ax2.set_xlabel("Composante", fontsize=11)
-    ax2.set_ylabel("Valeur actuelle (M$)", fontsize=11)
-    ax2.set_title("Décomposition des bénéfices actualisés", fontsize=12, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(categories)
-    ax2.legend(loc='upper right', fontsize=10)
-    ax2.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
-
-    if sauvegarder:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "perspectives_economique_financier.png")
-        plt.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Graphique sauvegardé: {chemin}")
-
-    if afficher:
-        plt.show()
-
-    return fig
-
-
-# =============================================================================
-# ANALYSES DE SENSIBILITÉ
-# =============================================================================
-
-SPECS_SENSIBILITE = [
-    {"cle": "nb_menages",              "label": "Nb ménages",                "type": "int",   "min": 1},
-    {"cle": "lpcd",                    "label": "LPCD",                      "type": "float", "min": 0.0},
-    {"cle": "taille_menage",           "label": "Taille ménage",             "type": "float", "min": 0.1},
-    {"cle": "part_menages_fuite_pct",  "label": "Ménages avec fuite (%)",    "type": "float", "min": 0.0, "max": 100.0},
-    {"cle": "debit_fuite_m3_an",       "label": "Débit fuite (m³/an)",       "type": "float", "min": 0.0},
-    {"cle": "taux_correction_fuite_pct","label": "Fuites corrigées (%)",     "type": "float", "min": 0.0, "max": 100.0},
-    {"cle": "reduction_comportement_pct","label": "Réduction comport. (%)",  "type": "float", "min": 0.0, "max": 100.0},
-    {"cle": "valeur_eau_m3",           "label": "Valeur eau ($/m³)",         "type": "float", "min": 0.0},
-    {"cle": "taux_actualisation_pct",  "label": "Taux actualisation (%)",    "type": "float", "min": 0.0, "max": 100.0},
-    {"cle": "horizon_analyse",         "label": "Horizon (ans)",             "type": "int",   "min": 1},
-]
-
-SPECS_COMPTEUR = [
-    {"cle": "cout_compteur",           "label": "Coût compteur ($)",         "type": "float", "min": 0.0},
-    {"cle": "heures_installation",     "label": "Heures installation",       "type": "float", "min": 0.0},
-    {"cle": "taux_horaire_installation","label": "Taux horaire ($/h)",       "type": "float", "min": 0.0},
-    {"cle": "cout_reseau_par_compteur","label": "Coût réseau/compteur ($)",  "type": "float", "min": 0.0},
-    {"cle": "cout_opex_non_tech_ami",  "label": "OPEX AMI non-tech ($/an)",   "type": "float", "min": 0.0},
-]
-
-
-def _cloner_params(p: ParametresModele) -> dict:
-    """Créer copie mutable des paramètres."""
-    return p.to_dict()
-
-
-def _cloner_compteur(c: ParametresCompteur) -> dict:
-    """Créer copie mutable des paramètres compteur."""
-    return {
-        'type_compteur': c.type_compteur,
-        'cout_compteur': c.cout_compteur,
-        'heures_installation': c.heures_installation,
-        'taux_horaire_installation': c.taux_horaire_installation,
-        'cout_reseau_par_compteur': c.cout_reseau_par_compteur,
-        'duree_vie_compteur': c.duree_vie_compteur,
-        'duree_vie_batterie': c.duree_vie_batterie,
-        'cout_remplacement_batterie': c.cout_remplacement_batterie,
-        'cout_lecture_manuel': c.cout_lecture_manuel,
-        'cout_maintenance_ami': c.cout_maintenance_ami,
-        'cout_maintenance_amr': c.cout_maintenance_amr,
-        'cout_maintenance_manuel': c.cout_maintenance_manuel,
-        'cout_lecture_amr': c.cout_lecture_amr,
-        'cout_opex_non_tech_ami': c.cout_opex_non_tech_ami,
-        'ventilation_opex_ami': c.ventilation_opex_ami,
-    }
-
-
-def _appliquer_facteur(d: dict, spec: dict, facteur: float) -> dict:
-    """Appliquer facteur multiplicatif à un paramètre."""
-    q = d.copy()
-    val = float(q[spec["cle"]])
-    nouv = val * facteur
-
-    if "min" in spec and nouv < spec["min"]:
-        nouv = spec["min"]
-    if "max" in spec and nouv > spec["max"]:
-        nouv = spec["max"]
-
-    if spec["type"] == "int":
-        nouv = max(1, int(round(nouv)))
-
-    q[spec["cle"]] = nouv
-    return q
-
-
-def sensibilite_univariee(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    delta_pct: float = 10.0
-) -> pd.DataFrame:
-    """
-    Analyse de sensibilité univariée sur la VAN.
-
-    Varie chaque paramètre de ±delta_pct% et mesure l'impact sur la VAN.
-    """
-    p_dict = _cloner_params(params)
-    c_dict = _cloner_compteur(compteur)
-
-    base_van = executer_modele(params, compteur).van
-
-    lignes = []
-    f_moins = 1.0 - delta_pct / 100.0
-    f_plus = 1.0 + delta_pct / 100.0
-
-    # Paramètres du modèle
-    for spec in SPECS_SENSIBILITE:
-        p_moins = _appliquer_facteur(p_dict, spec, f_moins)
-        p_plus = _appliquer_facteur(p_dict, spec, f_plus)
-
-        van_m = executer_modele(
-            ParametresModele(**p_moins), compteur
-        ).van
-        van_p = executer_modele(
-            ParametresModele(**p_plus), compteur
-        ).van
-
-        d_moins = van_m - base_van
-        d_plus = van_p - base_van
-
-        lignes.append({
-            "Paramètre": spec["label"],
-            "ΔVAN(-%)": d_moins,
-            "ΔVAN(+%)": d_plus,
-            "Amplitude": abs(d_plus - d_moins),
-            "_ordre": max(abs(d_moins), abs(d_plus))
-        })
-
-    # Paramètres du compteur
-    for spec in SPECS_COMPTEUR:
-        c_moins = _appliquer_facteur(c_dict, spec, f_moins)
-        c_plus = _appliquer_facteur(c_dict, spec, f_plus)
-
-        van_m = executer_modele(
-            params,
-            ParametresCompteur(**c_moins)
-        ).van
-        van_p = executer_modele(
-            params,
-            ParametresCompteur(**c_plus)
-        ).van
-
-        d_moins = van_m - base_van
-        d_plus = van_p - base_van
-
-        lignes.append({
-            "Paramètre": spec["label"],
-            "ΔVAN(-%)": d_moins,
-            "ΔVAN(+%)": d_plus,
-            "Amplitude": abs(d_plus - d_moins),
-            "_ordre": max(abs(d_moins), abs(d_plus))
-        })
-
-    df = pd.DataFrame(lignes).sort_values("_ordre", ascending=False)
-    return df.drop(columns=["_ordre"])
-
-
-def table_elasticite(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    delta_pct: float = 1.0
-) -> pd.DataFrame:
-    """
-    Calcul des élasticités: % variation VAN / % variation paramètre.
-    """
-    p_dict = _cloner_params(params)
-    c_dict = _cloner_compteur(compteur)
-
-    base_van = executer_modele(params, compteur).van
-    d = delta_pct / 100.0
-
-    lignes = []
-
-    for spec in SPECS_SENSIBILITE + SPECS_COMPTEUR:
-        cle = spec["cle"]
-
-        if cle in p_dict:
-            source = p_dict
-            est_compteur = False
-        else:
-            source = c_dict
-            est_compteur = True
-
-        p0 = float(source[cle])
-
-        if abs(base_van) < 1e-6 or p0 == 0.0:
-            eps = np.nan
-        else:
-            s_moins = _appliquer_facteur(source, spec, 1 - d)
-            s_plus = _appliquer_facteur(source, spec, 1 + d)
-
-            if est_compteur:
-                van_m = executer_modele(params, ParametresCompteur(**s_moins)).van
-                van_p = executer_modele(params, ParametresCompteur(**s_plus)).van
-            else:
-                van_m = executer_modele(ParametresModele(**s_moins), compteur).van
-                van_p = executer_modele(ParametresModele(**s_plus), compteur).van
-
-            eps = (van_p - van_m) / (2.0 * d * base_van)
-
-        lignes.append({
-            "Paramètre": spec["label"],
-            "Élasticité (ε)": eps,
-            "_abs": abs(eps) if np.isfinite(eps) else 0
-        })
-
-    df = pd.DataFrame(lignes).sort_values("_abs", ascending=False)
-    return df.drop(columns=["_abs"])
-
-
-def analyse_scenarios(
-    params: ParametresModele,
-    compteur: ParametresCompteur,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    valeur_eau: Optional[ParametresValeurEau] = None,
-) -> pd.DataFrame:
-    """
-    Comparer scénarios pessimiste, base et optimiste.
-
-    CORRECTION v3.9: Varie les vrais paramètres du modèle:
-    - Coûts compteur: cout_compteur, cout_installation (±20-30%)
-    - Comportement: alpha_0 (±40%)
-    - Fuites: part_menages_fuite_pct, taux_detection_pct, taux_reparation_pct
-    - Valeur eau: valeur_sociale_m3 (±25%)
-
-    Si config_echelle est None, compare sans et avec économies d'échelle.
-
-    Paramètres:
-        params: Paramètres du modèle de base
-        compteur: Paramètres du compteur de base
-        config_echelle: Configuration économies d'échelle (optionnel)
-        params_fuites: Paramètres fuites de base (défaut: FUITES_CONTEXTE_QUEBEC)
-        persistance: Paramètres persistance (défaut: PERSISTANCE_REALISTE)
-        valeur_eau: Paramètres valeur eau (défaut: VALEUR_EAU_QUEBEC)
-
-    Retourne:
-        DataFrame avec VAN, RBC, récupération, LCSW pour chaque scénario
-    """
-    # Valeurs par défaut
-    if params_fuites is None:
-        params_fuites = FUITES_CONTEXTE_QUEBEC
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-    if valeur_eau is None:
-        valeur_eau = VALEUR_EAU_QUEBEC
-
-    # Définition des scénarios avec multiplicateurs sur les vrais paramètres
-    # Format: {param: (valeur_pessimiste, valeur_base, valeur_optimiste)}
-    scenarios_def = {
-        'Pessimiste': {
-            # Coûts +30%
-            'mult_cout_compteur': 1.30,
-            'mult_cout_installation': 1.30,
-            # Comportement -40% (alpha_0 plus bas)
-            'mult_alpha_0': 0.60,
-            # Fuites: moins de fuites détectées/réparées
-            'mult_part_menages_fuite': 0.80,      # Moins de fuites à corriger
-            'mult_taux_detection': 0.85,          # Détection moins efficace
-            'mult_taux_reparation': 0.85,         # Réparation moins fréquente
-            # Valeur eau -25%
-            'mult_valeur_sociale': 0.75,
-        },
-        'Base': {
-            'mult_cout_compteur': 1.00,
-            'mult_cout_installation': 1.00,
-            'mult_alpha_0': 1.00,
-            'mult_part_menages_fuite': 1.00,
-            'mult_taux_detection': 1.00,
-            'mult_taux_reparation': 1.00,
-            'mult_valeur_sociale': 1.00,
-        },
-        'Optimiste': {
-            # Coûts -20%
-            'mult_cout_compteur': 0.80,
-            'mult_cout_installation': 0.80,
-            # Comportement +40% (alpha_0 plus élevé)
-            'mult_alpha_0': 1.40,
-            # Fuites: plus de fuites détectées/réparées
-            'mult_part_menages_fuite': 1.20,      # Plus de fuites à corriger
-            'mult_taux_detection': 1.10,          # Détection plus efficace (plafonné à 100%)
-            'mult_taux_reparation': 1.10,         # Réparation plus fréquente (plafonné à 100%)
-            # Valeur eau +25%
-            'mult_valeur_sociale': 1.25,
-        }
-    }
-
-    resultats = []
-
-    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
-        for nom_scenario, mults in scenarios_def.items():
-            # Cloner et modifier les paramètres du modèle
-            p_dict = _cloner_params(params)
-            p_dict['reduction_comportement_pct'] = params.reduction_comportement_pct * mults['mult_alpha_0']
-            params_scen = ParametresModele(**p_dict)
-
-            # Cloner et modifier les paramètres du compteur
-            c_dict = _cloner_compteur(compteur)
-            c_dict['cout_compteur'] = compteur.cout_compteur * mults['mult_cout_compteur']
-            c_dict['heures_installation'] = compteur.heures_installation * mults['mult_cout_installation']
-            compteur_scen = ParametresCompteur(**c_dict)
-
-            # Créer les paramètres de fuites modifiés
-            fuites_scen = ParametresFuites(
-                part_menages_fuite_pct=min(100.0, params_fuites.part_menages_fuite_pct * mults['mult_part_menages_fuite']),
-                debit_fuite_m3_an=params_fuites.debit_fuite_m3_an,
-                taux_detection_pct=min(100.0, params_fuites.taux_detection_pct * mults['mult_taux_detection']),
-                taux_reparation_pct=min(100.0, params_fuites.taux_reparation_pct * mults['mult_taux_reparation']),
-                cout_reparation_moyen=params_fuites.cout_reparation_moyen,
-                mode_repartition=params_fuites.mode_repartition,
-                part_ville_pct=params_fuites.part_ville_pct,
-                taux_nouvelles_fuites_pct=params_fuites.taux_nouvelles_fuites_pct,
-                inclure_cout_reparation=params_fuites.inclure_cout_reparation,
-                nom=f"{params_fuites.nom} ({nom_scenario})",
-            )
-
-            # Créer les paramètres de valeur eau modifiés
-            # Note: cout_capex_m3 et cout_opex_fixe_m3 sont les vrais champs
-            # (cout_infrastructure_m3 et valeur_externalites_m3 sont des alias en lecture seule)
-            valeur_scen = ParametresValeurEau(
-                cout_variable_m3=valeur_eau.cout_variable_m3 * mults['mult_valeur_sociale'],
-                cout_capex_m3=valeur_eau.cout_capex_m3 * mults['mult_valeur_sociale'],
-                cout_opex_fixe_m3=valeur_eau.cout_opex_fixe_m3 * mults['mult_valeur_sociale'],
-                valeur_sociale_m3=valeur_eau.valeur_sociale_m3 * mults['mult_valeur_sociale'],
-                prix_vente_m3=valeur_eau.prix_vente_m3,
-                mcf=valeur_eau.mcf,
-                appliquer_mcf=valeur_eau.appliquer_mcf,
-                nom=f"{valeur_eau.nom} ({nom_scenario})",
-            )
-
-            # Exécuter le modèle avec tous les paramètres
-            res = executer_modele(
-                params_scen,
-                compteur_scen,
-                cfg_echelle,
-                persistance=persistance,
-                params_fuites=fuites_scen,
-                valeur_eau=valeur_scen,
-            )
-
-            resultats.append({
-                "Échelle": label_echelle,
-                "Scénario": nom_scenario,
-                "VAN": res.van,
-                "RBC": res.rbc,
-                "Récupération (ans)": res.periode_recuperation,
-                "LCSW ($/m³)": res.lcsw,
-                # Détails pour transparence
-                "α₀ (%)": params_scen.reduction_comportement_pct,
-                "Coût/compteur ($)": compteur_scen.cout_compteur,
-                "Valeur eau ($/m³)": valeur_scen.valeur_sociale_m3,
-            })
-
-    return pd.DataFrame(resultats)
-
-
-# =============================================================================
-# VISUALISATIONS
-# =============================================================================
-
-def graphique_cascade(res: ResultatsModele, ax: Optional[plt.Axes] = None) -> plt.Figure:
-    """
-    Graphique en cascade montrant la décomposition de la VAN.
-    """
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(14, 7))
-    else:
-        fig = ax.figure
-
-    # Composantes
-    composantes = [
-        "Investissement\ninitial",
-        "Bénéfices eau\n(VA)",
-        "Exploitation\n(VA)",
-        "VAN\nfinale"
-    ]
-
-    valeurs = [
-        -res.investissement_initial,
-        res.va_benefices,
-        -res.va_couts_exploitation,
-        res.van
-    ]
-
-    couleurs = ["#d62728", "#2ca02c", "#d62728",
-                "#1f77b4" if res.van >= 0 else "#d62728"]
-
-    # Calculer positions cumulatives
-    cumul = np.zeros(len(valeurs) + 1)
-    for i, val in enumerate(valeurs[:-1]):
-        cumul[i + 1] = cumul[i] + val
-
-    largeur = 0.6
-    x_pos = np.arange(len(composantes))
-
-    # Barres intermédiaires
-    for i in range(len(composantes) - 1):
-        bas = min(cumul[i], cumul[i + 1])
-        hauteur = abs(valeurs[i])
-        ax.bar(i, hauteur, bottom=bas, width=largeur,
-               color=couleurs[i], edgecolor='black', linewidth=1.5, alpha=0.8)
-
-        # Étiquette
-        label_y = bas + hauteur / 2
-        ax.text(i, label_y, fmt_argent(valeurs[i], 1),
-                ha='center', va='center', fontweight='bold', fontsize=10,
-                color='white' if hauteur > res.investissement_initial * 0.1 else 'black')
-
-        # Connecteur
-        if i < len(composantes) - 2:
-            ax.plot([i + largeur/2, i + 1 - largeur/2],
-                    [cumul[i + 1], cumul[i + 1]],
-                    'k--', linewidth=1.5, alpha=0.6)
-
-    # Barre finale (VAN)
-    idx_final = len(composantes) - 1
-    bas_final = 0 if res.van >= 0 else res.van
-    hauteur_final = abs(res.van)
-    ax.bar(idx_final, hauteur_final, bottom=bas_final, width=largeur,
-           color=couleurs[-1], edgecolor='black', linewidth=2.5, alpha=0.9)
-    ax.text(idx_final, res.van / 2, fmt_argent(res.van, 1),
-            ha='center', va='center', fontweight='bold', fontsize=11,
-            color='white' if hauteur_final > res.investissement_initial * 0.05 else 'black')
-
-    # Formatage
-    ax.axhline(y=0, color='black', linewidth=2)
-    ax.set_xticks(x_pos)
-    ax.set_xticklabels(composantes, fontsize=11, fontweight='bold')
-    ax.set_ylabel("Montant ($)", fontsize=12, fontweight='bold')
-    ax.set_title(f"Cascade VAN — {res.compteur.type_compteur.value.upper()}",
-                 fontsize=14, fontweight='bold', pad=20)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-    # Format axe Y
-    max_val = max(abs(cumul).max(), abs(res.van))
-    if max_val >= 1e6:
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
-
-    plt.tight_layout()
-    return fig
-
-
-def graphique_tornade(
-    df: pd.DataFrame,
-    delta_pct: float,
-    titre: str = "Diagramme Tornade",
-    ax: Optional[plt.Axes] = None,
-    top_n: int = 12
-) -> plt.Figure:
-    """Diagramme tornade pour sensibilité."""
-    df_plot = df.head(top_n).copy()
-
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(12, 0.5 * len(df_plot) + 2.5))
-    else:
-        fig = ax.figure
-
-    labels = list(df_plot["Paramètre"])
-    d_moins = list(df_plot["ΔVAN(-%)"])
-    d_plus = list(df_plot["ΔVAN(+%)"])
-
-    y = np.arange(len(labels))
-
-    max_abs = max(max(abs(x) for x in d_moins), max(abs(x) for x in d_plus))
-    L = max_abs * 1.15 if max_abs > 0 else 1.0
-
-    for i in range(len(labels)):
-        # Côté négatif
-        if d_moins[i] < 0:
-            ax.barh(i, abs(d_moins[i]), left=d_moins[i], height=0.42,
-                    color='#d62728', alpha=0.75, edgecolor='black', linewidth=0.5)
-        else:
-            ax.barh(i, d_moins[i], left=0, height=0.42,
-                    color='#ff7f0e', alpha=0.75, edgecolor='black', linewidth=0.5)
-
-        # Côté positif
-        if d_plus[i] > 0:
-            ax.barh(i, d_plus[i], left=0, height=0.42,
-                    color='#2ca02c', alpha=0.75, edgecolor='black', linewidth=0.5)
-        else:
-            ax.barh(i, abs(d_plus[i]), left=d_plus[i], height=0.42,
-                    color='#ff7f0e', alpha=0.75, edgecolor='black', linewidth=0.5)
-
-        # Étiquettes
-        ax.text(d_moins[i], i, f' {fmt_argent(d_moins[i], 0)} ',
-                ha='right' if d_moins[i] < 0 else 'left', va='center',
-                fontsize=8, fontweight='bold')
-        ax.text(d_plus[i], i, f' {fmt_argent(d_plus[i], 0)} ',
-                ha='left' if d_plus[i] > 0 else 'right', va='center',
-                fontsize=8, fontweight='bold')
-
-    ax.axvline(0, color='black', linewidth=2.5, zorder=0)
-    ax.set_xlim(-L, L)
-    ax.set_yticks(y)
-    ax.set_yticklabels(labels, fontsize=10)
-    ax.set_xlabel("Impact sur la VAN ($)", fontsize=11, fontweight='bold')
-    ax.set_title(titre, fontsize=13, fontweight='bold', pad=15)
-    ax.grid(axis='x', alpha=0.3, linestyle='--')
-
-    if L >= 1e6:
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
-
-    legend_elements = [
-        Patch(facecolor='#d62728', alpha=0.75, label=f'-{delta_pct:.0f}% (défavorable)'),
-        Patch(facecolor='#2ca02c', alpha=0.75, label=f'+{delta_pct:.0f}% (favorable)')
-    ]
-    ax.legend(handles=legend_elements, loc='lower right', fontsize=9)
-
-    plt.tight_layout()
-    return fig
-
-
-def graphique_araignee(
-    df: pd.DataFrame,
-    base_van: float,
-    titre: str = "Diagramme Araignée",
-    top_n: int = 8
-) -> plt.Figure:
-    """Diagramme en toile d'araignée."""
-    df_plot = df.head(top_n).copy()
-
-    params = list(df_plot["Paramètre"])
-    vals_moins = list(df_plot["ΔVAN(-%)"])
-    vals_plus = list(df_plot["ΔVAN(+%)"])
-
-    # Convertir en % de VAN base
-    if abs(base_van) > 1e-6:
-        pct_moins = [v / base_van * 100 for v in vals_moins]
-        pct_plus = [v / base_van * 100 for v in vals_plus]
-    else:
-        pct_moins = [0] * len(vals_moins)
-        pct_plus = [0] * len(vals_plus)
-
-    # Fermer le polygone
-    angles = np.linspace(0, 2 * np.pi, len(params), endpoint=False).tolist()
-    pct_moins = pct_moins + [pct_moins[0]]
-    pct_plus = pct_plus + [pct_plus[0]]
-    angles = angles + [angles[0]]
-
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-
-    ax.plot(angles, pct_moins, 'o-', linewidth=2.5, label='-10%',
-            color='#d62728', markersize=8)
-    ax.fill(angles, pct_moins, alpha=0.15, color='#d62728')
-
-    ax.plot(angles, pct_plus, 's-', linewidth=2.5, label='+10%',
-            color='#2ca02c', markersize=8)
-    ax.fill(angles, pct_plus, alpha=0.15, color='#2ca02c')
-
-    ax.plot(angles, [0] * len(angles), 'k--', linewidth=1.5, alpha=0.5)
-
-    ax.set_xticks(angles[:-1])
-    ax.set_xticklabels(params, fontsize=10)
-    ax.set_ylabel("Impact VAN (%)", fontsize=10, fontweight='bold')
-    ax.set_title(titre, fontsize=13, fontweight='bold', pad=20)
-    ax.legend(loc='upper right', bbox_to_anchor=(1.25, 1.1), fontsize=11)
-    ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    return fig
-
-
-# =============================================================================
-# MODULE MONTE CARLO — SIMULATION STOCHASTIQUE
-# =============================================================================
-#
-# Ce module implémente l'analyse Monte Carlo pour quantifier l'incertitude
-# sur la VAN et calculer la probabilité P(VAN > 0).
-#
-# Approche:
-# 1. Définir des distributions (triangulaires/normales) sur les paramètres clés
-# 2. Tirer N échantillons de chaque distribution
-# 3. Calculer la VAN pour chaque combinaison
-# 4. Analyser la distribution résultante et les drivers de sensibilité
-#
-# Références:
-# - Boardman et al. (2018) Cost-Benefit Analysis, Ch. 7 "Uncertainty"
-# - Morgan & Henrion (1990) Uncertainty: A Guide to Dealing with Uncertainty
-# - Treasury Board of Canada (2007) Risk-Based CBA Guidelines
-#
-# =============================================================================
-
-@dataclass
-class DistributionParametre:
-    """
-    Définition d'une distribution pour un paramètre.
-
-    Types supportés:
-    - 'triangular': distribution triangulaire (min, mode, max)
-    - 'normal': distribution normale (moyenne, écart-type)
-    - 'uniform': distribution uniforme (min, max)
-    - 'lognormal': distribution log-normale (mu, sigma du log)
-    """
-    nom: str                          # Nom du paramètre (ex: "alpha0")
-    type_distribution: str = "triangular"
-    min_val: Optional[float] = None   # Pour triangular/uniform
-    mode_val: Optional[float] = None  # Pour triangular (= valeur la plus probable)
-    max_val: Optional[float] = None   # Pour triangular/uniform
-    moyenne: Optional[float] = None   # Pour normal
-    ecart_type: Optional[float] = None  # Pour normal
-    description: str = ""
-
-    def __post_init__(self):
-        """Valider la configuration."""
-        if self.type_distribution == "triangular":
-            if None in (self.min_val, self.mode_val, self.max_val):
-                raise ValueError(f"{self.nom}: triangular requiert min_val, mode_val, max_val")
-            if not (self.min_val <= self.mode_val <= self.max_val):
-                raise ValueError(f"{self.nom}: doit avoir min <= mode <= max")
-        elif self.type_distribution == "normal":
-            if None in (self.moyenne, self.ecart_type):
-                raise ValueError(f"{self.nom}: normal requiert moyenne et ecart_type")
-            if self.ecart_type <= 0:
-                raise ValueError(f"{self.nom}: ecart_type doit être > 0")
-        elif self.type_distribution == "uniform":
-            if None in (self.min_val, self.max_val):
-                raise ValueError(f"{self.nom}: uniform requiert min_val et max_val")
-
-    def tirer(self, n: int, rng: np.random.Generator) -> np.ndarray:
-        """
-        Tirer n valeurs de la distribution.
-
-        Paramètres:
-            n: Nombre de tirages
-            rng: Générateur de nombres aléatoires numpy
-
-        Retourne:
-            Array de n valeurs
-        """
-        if self.type_distribution == "triangular":
-            return rng.triangular(self.min_val, self.mode_val, self.max_val, n)
-        elif self.type_distribution == "normal":
-            return rng.normal(self.moyenne, self.ecart_type, n)
-        elif self.type_distribution == "uniform":
-            return rng.uniform(self.min_val, self.max_val, n)
-        elif self.type_distribution == "lognormal":
-            return rng.lognormal(self.moyenne, self.ecart_type, n)
-        else:
-            raise ValueError(f"Type de distribution inconnu: {self.type_distribution}")
-
-
-@dataclass
-class ParametresMonteCarlo:
-    """
-    Configuration de la simulation Monte Carlo.
-
-    Définit le nombre de simulations et les distributions à utiliser
-    pour chaque paramètre incertain.
-    """
-    n_simulations: int = 10_000
-    seed: Optional[int] = None  # Pour reproductibilité
-
-    # Distributions des paramètres clés
-    # Si None, le paramètre est fixé à sa valeur par défaut
-    distributions: dict = field(default_factory=dict)
-
-    # Paramètres à inclure dans l'analyse tornado (v3.9: étendu)
-    parametres_tornado: list = field(default_factory=lambda: [
-        "alpha0", "lpcd", "valeur_eau", "cout_compteur",
-        "heures_installation", "taux_horaire_installation", "cout_installation",
-        "opex_annuel", "prevalence_fuites", "debit_fuite_m3_an",
-        "taux_detection", "taux_reparation",
-        "adoption_max", "adoption_k", "adoption_t0",
-        "taux_actualisation"
-    ])
-
-    def __post_init__(self):
-        """Valider la configuration."""
-        if self.n_simulations < 100:
-            raise ValueError("n_simulations doit être >= 100 pour des résultats fiables")
-
-
-@dataclass
-class ResultatsMonteCarlo:
-    """
-    Résultats d'une simulation Monte Carlo.
-
-    Contient la distribution des VAN et les statistiques associées.
-    """
-    van_simulations: np.ndarray       # VAN pour chaque simulation
-    n_simulations: int
-    seed: Optional[int]
-
-    # Statistiques
-    van_moyenne: float = 0.0
-    van_mediane: float = 0.0
-    van_ecart_type: float = 0.0
-    prob_van_positive: float = 0.0
-
-    # Percentiles
-    percentile_5: float = 0.0
-    percentile_25: float = 0.0
-    percentile_75: float = 0.0
-    percentile_95: float = 0.0
-
-    # Analyse de sensibilité (corrélation paramètres/VAN)
-    correlations: dict = field(default_factory=dict)
-
-    # Valeurs tirées pour chaque paramètre (pour analyse)
-    tirages: dict = field(default_factory=dict)
-
-    def __post_init__(self):
-        """Calculer les statistiques."""
-        if len(self.van_simulations) > 0:
-            self.van_moyenne = float(np.mean(self.van_simulations))
-            self.van_mediane = float(np.median(self.van_simulations))
-            self.van_ecart_type = float(np.std(self.van_simulations))
-            self.prob_van_positive = float(np.mean(self.van_simulations > 0))
-
-            self.percentile_5 = float(np.percentile(self.van_simulations, 5))
-            self.percentile_25 = float(np.percentile(self.van_simulations, 25))
-            self.percentile_75 = float(np.percentile(self.van_simulations, 75))
-            self.percentile_95 = float(np.percentile(self.van_simulations, 95))
-
-    @property
-    def intervalle_confiance_90(self) -> tuple[float, float]:
-        """Intervalle de confiance 90% (P5-P95)."""
-        return (self.percentile_5, self.percentile_95)
-
-    @property
-    def intervalle_interquartile(self) -> tuple[float, float]:
-        """Intervalle interquartile (P25-P75)."""
-        return (self.percentile_25, self.percentile_75)
-
-
-# =============================================================================
-# DISTRIBUTIONS MONTE CARLO PAR DÉFAUT (v3.9: étendu)
-# =============================================================================
-#
-# Paramètres incertains organisés par catégorie:
-#   1. COMPORTEMENT: alpha0 (réduction), lpcd (consommation)
-#   2. COÛTS: cout_compteur, heures_installation, taux_horaire_installation, opex_annuel
-#   3. VALORISATION: valeur_eau
-#   4. FUITES: prevalence_fuites, debit_fuite_m3_an, taux_detection, taux_reparation
-#   5. ADOPTION: adoption_max_pct, adoption_k, adoption_t0
-#   6. FINANCIER: taux_actualisation
-#
-# Sources des intervalles:
-#   - Littérature académique sur compteurs intelligents
-#   - Études de cas municipales (Longueuil, Winnipeg, Calgary)
-#   - Méta-analyses (AWWA, IWA) sur les effets comportementaux
-# =============================================================================
-
-DISTRIBUTIONS_DEFAUT = {
-    # === COMPORTEMENT ===
-    "alpha0": DistributionParametre(
-        nom="alpha0",
-        type_distribution="triangular",
-        min_val=0.04, mode_val=0.08, max_val=0.15,
-        description="Réduction comportementale initiale (4-15%)",
-    ),
-    "lpcd": DistributionParametre(
-        nom="lpcd",
-        type_distribution="triangular",
-        min_val=180.0, mode_val=250.0, max_val=350.0,
-        description="Consommation (LPCD): 180-350 L/p/j",
-    ),
-
-    # === COÛTS ===
-    "cout_compteur": DistributionParametre(
-        nom="cout_compteur",
-        type_distribution="triangular",
-        min_val=150.0, mode_val=250.0, max_val=400.0,
-        description="Coût du compteur AMI: 150-400 $",
-    ),
-    "cout_installation": DistributionParametre(
-        nom="cout_installation",
-        type_distribution="triangular",
-        min_val=80.0, mode_val=120.0, max_val=200.0,
-        description="Coût d'installation (alias): 80-200 $/compteur",
-    ),
-    "heures_installation": DistributionParametre(
-        nom="heures_installation",
-        type_distribution="triangular",
-        min_val=1.0, mode_val=1.5, max_val=3.0,
-        description="Heures installation: 1-3 h/compteur",
-    ),
-    "taux_horaire_installation": DistributionParametre(
-        nom="taux_horaire_installation",
-        type_distribution="triangular",
-        min_val=100.0, mode_val=125.0, max_val=150.0,
-        description="Taux horaire installation: 100-150 $/h",
-    ),
-    "opex_annuel": DistributionParametre(
-        nom="opex_annuel",
-        type_distribution="triangular",
-        min_val=15.0, mode_val=20.0, max_val=40.0,
-        description="OPEX total AMI (maintenance + non-tech): 15-40 $/compteur/an",
-    ),
-
-    # === VALORISATION ===
-    "valeur_eau": DistributionParametre(
-        nom="valeur_eau",
-        type_distribution="triangular",
-        min_val=2.50, mode_val=4.69, max_val=8.00,
-        description="Valeur sociale de l'eau: 2.50-8.00 $/m³",
-    ),
-
-    # === FUITES ===
-    "prevalence_fuites": DistributionParametre(
-        nom="prevalence_fuites",
-        type_distribution="triangular",
-        min_val=0.10, mode_val=0.20, max_val=0.35,
-        description="Prévalence des fuites: 10-35%",
-    ),
-    "debit_fuite_m3_an": DistributionParametre(
-        nom="debit_fuite_m3_an",
-        type_distribution="triangular",
-        min_val=20.0, mode_val=35.0, max_val=60.0,
-        description="Débit moyen par fuite: 20-60 m³/an",
-    ),
-    "taux_detection": DistributionParametre(
-        nom="taux_detection",
-        type_distribution="triangular",
-        min_val=0.70, mode_val=0.90, max_val=0.98,
-        description="Taux détection fuites AMI: 70-98%",
-    ),
-    "taux_reparation": DistributionParametre(
-        nom="taux_reparation",
-        type_distribution="triangular",
-        min_val=0.60, mode_val=0.85, max_val=0.95,
-        description="Taux réparation après détection: 60-95%",
-    ),
-
-    # === ADOPTION ===
-    "adoption_max": DistributionParametre(
-        nom="adoption_max",
-        type_distribution="triangular",
-        min_val=0.70, mode_val=0.85, max_val=1.00,
-        description="Taux d'adoption maximal: 70-100%",
-    ),
-    "adoption_k": DistributionParametre(
-        nom="adoption_k",
-        type_distribution="triangular",
-        min_val=0.3, mode_val=0.6, max_val=1.5,
-        description="Vitesse d'adoption (k): 0.3-1.5",
-    ),
-    "adoption_t0": DistributionParametre(
-        nom="adoption_t0",
-        type_distribution="triangular",
-        min_val=2.0, mode_val=5.0, max_val=10.0,
-        description="Point médian adoption (t0): 2-10 ans",
-    ),
-
-    # === FINANCIER ===
-    "taux_actualisation": DistributionParametre(
-        nom="taux_actualisation",
-        type_distribution="triangular",
-        min_val=0.02, mode_val=0.03, max_val=0.05,
-        description="Taux d'actualisation: 2-5% (mode 3%, Québec infrastructure)",
-    ),
-}
-
-# Sous-ensemble minimal (5 paramètres les plus influents) pour simulations rapides
-DISTRIBUTIONS_MINIMALES = {
-    "alpha0": DISTRIBUTIONS_DEFAUT["alpha0"],
-    "cout_compteur": DISTRIBUTIONS_DEFAUT["cout_compteur"],
-    "valeur_eau": DISTRIBUTIONS_DEFAUT["valeur_eau"],
-    "prevalence_fuites": DISTRIBUTIONS_DEFAUT["prevalence_fuites"],
-    "adoption_max": DISTRIBUTIONS_DEFAUT["adoption_max"],
-}
-
-# Sous-ensemble étendu (tous les paramètres) pour analyse complète
-DISTRIBUTIONS_ETENDUES = DISTRIBUTIONS_DEFAUT.copy()
-
-
-# =============================================================================
-# INVENTAIRE DES PRÉRÉGLAGES (sans tarification)
-# =============================================================================
-
-def afficher_inventaire_presets() -> None:
-    """Afficher l'inventaire des préréglages et l'espace combinatoire."""
-    print("\n" + "=" * 90)
-    print(" " * 18 + "INVENTAIRE DES PRÉRÉGLAGES (SANS TARIFICATION)")
-    print("=" * 90)
-
-    # A) Contexte de base
-    p_def = ParametresModele()
-    dl = DEFAUTS_LONGUEUIL
-    print("\nA) Contexte de base")
-    print(f"  DEFAUTS_LONGUEUIL: {dl.nb_menages} ménages, {dl.taille_menage:.2f} pers/ménage, {dl.lpcd:.0f} LPCD")
-    print("    Note: Longueuil ~236 L/p/j résidentiel; ~567 L/p/j tous usages (sources internes 2024)")
-    print(f"  ParametresModele() défauts: horizon={p_def.horizon_analyse} ans, "
-          f"taux actualisation={p_def.taux_actualisation_pct:.1f}%, "
-          f"LPCD={p_def.lpcd:.0f}, réduction comportementale={p_def.reduction_comportement_pct:.0f}%")
-
-    # B) Types de compteurs
-    print("\nB) Types de compteurs (coûts stylisés)")
-    couts_types = {t.name: _cout_compteur_par_type(t) for t in TypeCompteur}
-    print(f"  TypeCompteur: {', '.join(t.name for t in TypeCompteur)}")
-    print(f"  Comparaison (compteur nu): {couts_types}")
-    c_long = COMPTEUR_LONGUEUIL_AMI
-    cout_install = c_long.cout_installation
-    cout_total = c_long.cout_initial_par_compteur
-    print(f"  COMPTEUR_LONGUEUIL_AMI: compteur={c_long.cout_compteur:.0f}$, "
-          f"installation={c_long.heures_installation:.1f}h×{c_long.taux_horaire_installation:.0f}$/h "
-          f"({cout_install:.0f}$), réseau={c_long.cout_reseau_par_compteur:.0f}$ → total~{cout_total:.0f}$")
-    print("    Note: 250$ = compteur nu; ~675$ = compteur + MO + réseau (avant autres coûts)")
-
-    # C) Persistance comportementale
-    print("\nC) Persistance comportementale (SCENARIOS_PERSISTANCE)")
-    for key, s in SCENARIOS_PERSISTANCE.items():
-        print(f"  {key}: mode={s.mode.value}, α0={s.alpha_initial*100:.1f}%, "
-              f"plateau={s.alpha_plateau*100:.1f}%, lambda={s.lambda_decay:.2f}, "
-              f"fadeout={s.annees_fadeout} ans")
-
-    # D) Fuites privées (SCENARIOS_FUITES)
-    print("\nD) Fuites privées (SCENARIOS_FUITES)")
-    for key, f in SCENARIOS_FUITES.items():
-        print(f"  {key}: prévalence={f.part_menages_fuite_pct:.1f}%, "
-              f"durée sans compteur={f.duree_moyenne_fuite_sans_compteur} ans, "
-              f"détection={f.taux_detection_pct:.0f}%, réparation={f.taux_reparation_pct:.0f}%, "
-              f"coût moyen={f.cout_reparation_moyen:.0f}$, partage ville={f.part_ville_pct:.0f}%")
-
-    # E) Adoption / déploiement
-    print("\nE) Adoption / déploiement (STRATEGIES_ADOPTION)")
-    for key, a in STRATEGIES_ADOPTION.items():
-        print(f"  {key}: mode={a.mode.value}, Amax={a.adoption_max_pct:.3f}%, "
-              f"k={a.k_vitesse:.2f}, t0={a.t0_point_median:.1f}, incitatif={a.cout_incitatif_par_menage:.0f}$")
-    print("  Note Québec: échantillonnage SQEEP ~380 compteurs (preset dédié)")
-
-    # F) Valeur de l'eau + MCF
-    print("\nF) Valeur de l'eau (PREREGLAGES_VALEUR_EAU)")
-    for key, v in PREREGLAGES_VALEUR_EAU.items():
-        print(f"  {key}: sociale={v.valeur_sociale_m3:.2f}, variable={v.cout_variable_m3:.2f}, "
-              f"infra={v.cout_infrastructure_m3:.2f}, externalités={v.valeur_externalites_m3:.2f}, "
-              f"MCF={'ON' if v.appliquer_mcf else 'OFF'} ({v.mcf:.2f})")
-
-    # G) Ventilation OPEX AMI
-    print("\nG) Ventilation OPEX AMI (PREREGLAGES_VENTILATION_OPEX)")
-    for key, v in PREREGLAGES_VENTILATION_OPEX.items():
-        print(f"  {key}: cyber={v.cybersecurite_pct:.0%}, licences={v.licences_logiciels_pct:.0%}, "
-              f"stockage={v.stockage_donnees_pct:.0%}, service={v.service_client_pct:.0%}, "
-              f"integration={v.integration_si_pct:.0%}")
-
-    # H) Segmentation résidentielle
-    print("\nH) Segmentation résidentielle (SEGMENTS_QUEBEC_DEFAUT)")
-    for s in SEGMENTS_QUEBEC_DEFAUT:
-        print(f"  {s.nom}: LPCD={s.lpcd:.0f}, pers/ménage={s.personnes_par_menage:.2f}, "
-              f"prévalence fuites={s.prevalence_fuites_pct:.0f}%, potentiel={s.potentiel_reduction_pct:.0f}%")
-    print("  Note: Multilogement exclu par défaut (voir justification dans le code)")
-
-    # I) Monte Carlo
-    print("\nI) Monte Carlo (DISTRIBUTIONS_DEFAUT)")
-    for key, d in DISTRIBUTIONS_DEFAUT.items():
-        print(f"  {key}: {d.type_distribution} [{d.min_val}, {d.mode_val}, {d.max_val}]")
-    print("  Manques notables possibles: SI/télécom détaillé, dynamique d'adoption avancée")
-
-    # Espace combinatoire
-    print("\nEspace combinatoire:")
-    print("  adoption × persistance × fuites × valeur_eau × type_compteur × segmentation × Monte Carlo")
-    print("=" * 90)
-
-def simuler_monte_carlo(
-    params_base: ParametresModele,
-    compteur_base: ParametresCompteur,
-    config_mc: ParametresMonteCarlo = None,
-    config_echelle: ConfigEconomiesEchelle = None,
-    valeur_eau: ParametresValeurEau = None,
-    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
-    afficher_progression: bool = True,
-    **kwargs,
-) -> ResultatsMonteCarlo:
-    """
-    Exécuter une simulation Monte Carlo.
-
-    Paramètres:
-        params_base: Paramètres du modèle (valeurs centrales)
-        compteur_base: Paramètres du compteur (valeurs centrales)
-        config_mc: Configuration Monte Carlo (distributions, n_simulations)
-        config_echelle: Configuration économies d'échelle
-        valeur_eau: Paramètres valeur d'eau
-        mode_compte: Mode de comptabilité
-        afficher_progression: Afficher une barre de progression
-        **kwargs: Arguments supplémentaires pour executer_modele()
-
-    Retourne:
-        ResultatsMonteCarlo avec distribution VAN et statistiques
-    """
-    if config_mc is None:
-        config_mc = ParametresMonteCarlo(distributions=DISTRIBUTIONS_DEFAUT)
-
-    if valeur_eau is None:
-        valeur_eau = VALEUR_EAU_QUEBEC
-
-    # Initialiser le générateur de nombres aléatoires
-    rng = np.random.default_rng(config_mc.seed)
-
-    n = config_mc.n_simulations
-    van_simulations = np.zeros(n)
-    tirages = {nom: np.zeros(n) for nom in config_mc.distributions}
-
-    # Tirer toutes les valeurs à l'avance
-    for nom, distrib in config_mc.distributions.items():
-        tirages[nom] = distrib.tirer(n, rng)
-
-    # Exécuter les simulations
-    for i in range(n):
-        if afficher_progression and i % 1000 == 0:
-            print(f"\r  Simulation {i+1}/{n}...", end="", flush=True)
-
-        # Cloner les paramètres
-        params_dict = _cloner_params(params_base)
-        compteur_dict = _cloner_compteur(compteur_base)
-        valeur_eau_dict = {
-            'valeur_sociale_m3': valeur_eau.valeur_sociale_m3,
-            'cout_variable_m3': valeur_eau.cout_variable_m3,
-            'cout_capex_m3': valeur_eau.cout_capex_m3,           # CAPEX (était cout_infrastructure_m3)
-            'cout_opex_fixe_m3': valeur_eau.cout_opex_fixe_m3,   # OPEX fixe (était valeur_externalites_m3)
-            'prix_vente_m3': valeur_eau.prix_vente_m3,
-            'mcf': valeur_eau.mcf,
-            'appliquer_mcf': valeur_eau.appliquer_mcf,
-        }
-
-        # Appliquer les valeurs tirées
-        # v3.9: Support étendu pour installation, OPEX, adoption, fuites
-        params_fuites_dict = None  # Initialisé si nécessaire
-
-        has_heures = "heures_installation" in tirages
-        has_taux_horaire = "taux_horaire_installation" in tirages
-
-        for nom, valeur in tirages.items():
-            # === COMPORTEMENT ===
-            if nom == "alpha0":
-                # alpha0 = réduction comportementale (ex: 0.08 = 8%)
-                params_dict["reduction_comportement_pct"] = valeur[i] * 100
-            elif nom == "lpcd":
-                params_dict["lpcd"] = valeur[i]
-
-            # === COÛTS ===
-            elif nom == "cout_compteur":
-                compteur_dict["cout_compteur"] = valeur[i]
-            elif nom == "cout_installation":
-                # Alias: convertir un coût total en heures si heures/taux non tirés
-                if not has_heures and not has_taux_horaire:
-                    taux = max(compteur_dict.get("taux_horaire_installation", 0.0), 1e-6)
-                    compteur_dict["heures_installation"] = valeur[i] / taux
-            elif nom == "heures_installation":
-                compteur_dict["heures_installation"] = valeur[i]
-            elif nom == "taux_horaire_installation":
-                compteur_dict["taux_horaire_installation"] = valeur[i]
-            elif nom == "opex_annuel":
-                # OPEX total AMI = maintenance + non-tech → on ajuste la composante non-tech
-                base = max(compteur_dict.get("cout_maintenance_ami", 0.0), 0.0)
-                compteur_dict["cout_opex_non_tech_ami"] = max(0.0, valeur[i] - base)
-
-            # === VALORISATION ===
-            elif nom == "valeur_eau":
-                # Ajuster toutes les composantes de la valeur sociale
-                base = max(valeur_eau_dict["valeur_sociale_m3"], 1e-6)
-                ratio = valeur[i] / base
-                valeur_eau_dict["valeur_sociale_m3"] = valeur[i]
-                valeur_eau_dict["cout_capex_m3"] = valeur_eau_dict["cout_capex_m3"] * ratio
-                valeur_eau_dict["cout_opex_fixe_m3"] = valeur_eau_dict["cout_opex_fixe_m3"] * ratio
-
-            # === FUITES ===
-            elif nom == "prevalence_fuites":
-                params_dict["part_menages_fuite_pct"] = valeur[i] * 100
-            elif nom == "debit_fuite_m3_an":
-                params_dict["debit_fuite_m3_an"] = valeur[i]
-                if params_fuites_dict is None:
-                    params_fuites_dict = {"debit_fuite_m3_an": valeur[i]}
-                else:
-                    params_fuites_dict["debit_fuite_m3_an"] = valeur[i]
-            elif nom == "taux_detection":
-                if params_fuites_dict is None:
-                    params_fuites_dict = {"taux_detection_pct": valeur[i] * 100}
-                else:
-                    params_fuites_dict["taux_detection_pct"] = valeur[i] * 100
-            elif nom == "taux_reparation":
-                if params_fuites_dict is None:
-                    params_fuites_dict = {"taux_reparation_pct": valeur[i] * 100}
-                else:
-                    params_fuites_dict["taux_reparation_pct"] = valeur[i] * 100
-
-            # === ADOPTION ===
-            elif nom == "adoption_max":
-                # Stocké pour créer ParametresAdoption après
-                pass  # Traité séparément ci-dessous
-            elif nom == "adoption_k":
-                pass
-            elif nom == "adoption_t0":
-                pass
-
-            # === FINANCIER ===
-            elif nom == "taux_actualisation":
-                params_dict["taux_actualisation_pct"] = valeur[i] * 100
-
-        # Créer les objets
-        params = ParametresModele(**params_dict)
-        compteur = ParametresCompteur(**compteur_dict)
-        ve = ParametresValeurEau(**valeur_eau_dict)
-
-        # Créer params_fuites si des paramètres de fuites ont été variés
-        params_fuites_sim = kwargs.get('params_fuites', FUITES_CONTEXTE_QUEBEC)
-        if params_fuites_dict:
-            f_dict = params_fuites_sim.__dict__.copy()
-            debit_ref = f_dict.get("debit_fuite_m3_an", params_fuites_sim.debit_fuite_m3_an)
-            f_dict.update({
-                "part_menages_fuite_pct": params.part_menages_fuite_pct,
-                "debit_fuite_m3_an": params_fuites_dict.get("debit_fuite_m3_an", params_fuites_sim.debit_fuite_m3_an),
-                "taux_detection_pct": params_fuites_dict.get("taux_detection_pct", params_fuites_sim.taux_detection_pct),
-                "taux_reparation_pct": params_fuites_dict.get("taux_reparation_pct", params_fuites_sim.taux_reparation_pct),
-            })
-            params_fuites_sim = ParametresFuites(**f_dict)
-            if params_fuites_sim.utiliser_prevalence_differenciee and "debit_fuite_m3_an" in params_fuites_dict:
-                ratio = params_fuites_dict["debit_fuite_m3_an"] / max(debit_ref, 1e-6)
-                params_fuites_sim.debit_fuite_any_m3_an *= ratio
-                params_fuites_sim.debit_fuite_significative_m3_an *= ratio
-
-        # Créer params_adoption si adoption_max/k/t0 sont variés
-        base_adoption = kwargs.get('params_adoption', ADOPTION_OBLIGATOIRE)
-        params_adoption_sim = base_adoption
-        if ("adoption_max" in tirages) or ("adoption_k" in tirages) or ("adoption_t0" in tirages):
-            adoption_pct = tirages["adoption_max"][i] * 100 if "adoption_max" in tirages else base_adoption.adoption_max_pct
-            k_vitesse = tirages["adoption_k"][i] if "adoption_k" in tirages else base_adoption.k_vitesse
-            t0_median = tirages["adoption_t0"][i] if "adoption_t0" in tirages else base_adoption.t0_point_median
-            params_adoption_sim = ParametresAdoption(
-                mode=base_adoption.mode,
-                adoption_max_pct=adoption_pct,
-                etaler_capex=base_adoption.etaler_capex,
-                k_vitesse=k_vitesse,
-                t0_point_median=t0_median,
-                taux_nouveaux_pct=base_adoption.taux_nouveaux_pct,
-                nb_secteurs=base_adoption.nb_secteurs,
-                annees_par_secteur=base_adoption.annees_par_secteur,
-                cout_incitatif_par_menage=base_adoption.cout_incitatif_par_menage,
-                duree_incitatif_ans=base_adoption.duree_incitatif_ans,
-                fraction_premiere_annee=base_adoption.fraction_premiere_annee,
-                annee_demarrage=base_adoption.annee_demarrage,
-                nom=base_adoption.nom,
-                description=base_adoption.description,
-            )
-
-        # Exécuter le modèle avec les paramètres variés
-        try:
-            # Filtrer kwargs pour éviter les doublons
-            kwargs_filtered = {k: v for k, v in kwargs.items()
-                               if k not in ('params_fuites', 'params_adoption')}
-            res = executer_modele(
-                params=params,
-                compteur=compteur,
-                config_echelle=config_echelle,
-                mode_compte=mode_compte,
-                valeur_eau=ve,
-                params_fuites=params_fuites_sim,
-                params_adoption=params_adoption_sim,
-                **kwargs_filtered,
-            )
-            van_simulations[i] = res.van
-        except Exception:
-            van_simulations[i] = np.nan
-
-    if afficher_progression:
-        print(f"\r  Simulation {n}/{n}... Terminé!")
-
-    # Supprimer les NaN
-    van_valides = van_simulations[~np.isnan(van_simulations)]
-
-    # Calculer les corrélations (analyse de sensibilité)
-    correlations = {}
-    for nom, valeurs in tirages.items():
-        valeurs_valides = valeurs[~np.isnan(van_simulations)]
-        if len(valeurs_valides) > 0:
-            corr = np.corrcoef(valeurs_valides, van_valides)[0, 1]
-            correlations[nom] = float(corr) if np.isfinite(corr) else 0.0
-
-    return ResultatsMonteCarlo(
-        van_simulations=van_valides,
-        n_simulations=len(van_valides),
-        seed=config_mc.seed,
-        correlations=correlations,
-        tirages=tirages,
-    )
-
-
-def afficher_resultats_monte_carlo(resultats: ResultatsMonteCarlo) -> None:
-    """
-    Afficher un résumé des résultats Monte Carlo.
-
-    Paramètres:
-        resultats: Résultats de la simulation
-    """
-    print("\n" + "=" * 70)
-    print(" " * 18 + "RÉSULTATS SIMULATION MONTE CARLO")
-    print("=" * 70)
-
-    print(f"\n  Nombre de simulations: {resultats.n_simulations:,}")
-    if resultats.seed is not None:
-        print(f"  Seed (reproductibilité): {resultats.seed}")
-
-    print("\n  ─── STATISTIQUES VAN ───")
-    print(f"    Moyenne:      {fmt_argent(resultats.van_moyenne)}")
-    print(f"    Médiane:      {fmt_argent(resultats.van_mediane)}")
-    print(f"    Écart-type:   {fmt_argent(resultats.van_ecart_type)}")
-
-    print("\n  ─── PERCENTILES ───")
-    print(f"    P5  (pessimiste):  {fmt_argent(resultats.percentile_5)}")
-    print(f"    P25 (quartile 1):  {fmt_argent(resultats.percentile_25)}")
-    print(f"    P50 (médiane):     {fmt_argent(resultats.van_mediane)}")
-    print(f"    P75 (quartile 3):  {fmt_argent(resultats.percentile_75)}")
-    print(f"    P95 (optimiste):   {fmt_argent(resultats.percentile_95)}")
-
-    print("\n  ─── PROBABILITÉ ───")
-    pct = resultats.prob_van_positive * 100
-    barre = "█" * int(pct / 2) + "░" * (50 - int(pct / 2))
-    print(f"    P(VAN > 0) = {pct:.1f}%")
-    print(f"    [{barre}]")
-
-    if resultats.correlations:
-        print("\n  ─── DRIVERS DE SENSIBILITÉ (corrélations) ───")
-        correlations_triees = sorted(
-            resultats.correlations.items(),
-            key=lambda x: abs(x[1]),
-            reverse=True
-        )
-        for nom, corr in correlations_triees:
-            signe = "+" if corr > 0 else ""
-            impact = "█" * int(abs(corr) * 20)
-            print(f"    {nom:<20}: {signe}{corr:.3f} {impact}")
-
-    print("=" * 70 + "\n")
-
-
-def graphique_distribution_van(
-    resultats: ResultatsMonteCarlo,
-    titre: str = "Distribution Monte Carlo de la VAN",
-    dossier: str = None,
-) -> plt.Figure:
-    """
-    Créer un histogramme de la distribution VAN.
-
-    Paramètres:
-        resultats: Résultats Monte Carlo
-        titre: Titre du graphique
-        dossier: Dossier de sauvegarde (optionnel)
-
-    Retourne:
-        Figure matplotlib
-    """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    # Histogramme
-    n_bins = min(100, resultats.n_simulations // 50)
-    n, bins, patches = ax.hist(
-        resultats.van_simulations / 1e6,  # En millions
-        bins=n_bins,
-        density=True,
-        alpha=0.7,
-        color='steelblue',
-        edgecolor='white',
-        linewidth=0.5,
-    )
-
-    # Colorier les valeurs négatives en rouge
-    for patch, left_edge in zip(patches, bins[:-1]):
-        if left_edge < 0:
-            patch.set_facecolor('#d62728')
-
-    # Lignes verticales pour les percentiles
-    ax.axvline(resultats.van_mediane / 1e6, color='orange', linewidth=2,
-               linestyle='--', label=f'Médiane: {fmt_argent(resultats.van_mediane)}')
-    ax.axvline(0, color='black', linewidth=2, linestyle='-', label='VAN = 0')
-    ax.axvline(resultats.percentile_5 / 1e6, color='red', linewidth=1.5,
-               linestyle=':', label=f'P5: {fmt_argent(resultats.percentile_5)}')
-    ax.axvline(resultats.percentile_95 / 1e6, color='green', linewidth=1.5,
-               linestyle=':', label=f'P95: {fmt_argent(resultats.percentile_95)}')
-
-    # Zone P(VAN > 0) — shading de 0 à la limite droite du graphique
-    # Note: bins est déjà en M$ (van_simulations / 1e6), pas besoin de rediviser
-    xlim_max = max(bins.max(), resultats.percentile_95 / 1e6 * 1.1)
-    ax.fill_betweenx([0, n.max() * 1.05], 0, xlim_max,
-                     alpha=0.1, color='green', label='_nolegend_')
-
-    # Annotation P(VAN > 0)
-    ax.annotate(
-        f'P(VAN > 0) = {resultats.prob_van_positive*100:.1f}%',
-        xy=(resultats.van_mediane / 1e6, n.max() * 0.8),
-        fontsize=14,
-        fontweight='bold',
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.8),
-    )
-
-    ax.set_xlabel("VAN (M$)", fontsize=12, fontweight='bold')
-    ax.set_ylabel("Densité", fontsize=12, fontweight='bold')
-    ax.set_title(titre, fontsize=14, fontweight='bold', pad=15)
-    ax.legend(loc='upper right', fontsize=10)
-    ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-
-    if dossier:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "monte_carlo_distribution.png")
-        fig.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Figure sauvegardée: {chemin}")
-
-    return fig
-
-
-def graphique_tornado_mc(
-    resultats: ResultatsMonteCarlo,
-    titre: str = "Analyse Tornado — Drivers de la VAN",
-    dossier: str = None,
-) -> plt.Figure:
-    """
-    Créer un graphique tornado basé sur les corrélations Monte Carlo.
-
-    Paramètres:
-        resultats: Résultats Monte Carlo avec corrélations
-        titre: Titre du graphique
-        dossier: Dossier de sauvegarde (optionnel)
-
-    Retourne:
-        Figure matplotlib
-    """
-    if not resultats.correlations:
-        raise ValueError("Pas de données de corrélation disponibles")
-
-    # Trier par impact absolu
-    correlations_triees = sorted(
-        resultats.correlations.items(),
-        key=lambda x: abs(x[1]),
-        reverse=True
-    )
-
-    noms = [x[0] for x in correlations_triees]
-    valeurs = [x[1] for x in correlations_triees]
-
-    fig, ax = plt.subplots(figsize=(10, max(4, len(noms) * 0.6)))
-
-    # Barres horizontales
-    couleurs = ['#2ca02c' if v > 0 else '#d62728' for v in valeurs]
-    y_pos = np.arange(len(noms))
-
-    ax.barh(y_pos, valeurs, color=couleurs, alpha=0.8, edgecolor='black', linewidth=1)
-
-    # Ligne verticale à 0
-    ax.axvline(0, color='black', linewidth=1.5)
-
-    # Labels
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(noms, fontsize=11)
-    ax.set_xlabel("Corrélation avec la VAN", fontsize=12, fontweight='bold')
-    ax.set_title(titre, fontsize=14, fontweight='bold', pad=15)
-
-    # Annotations
-    for i, (nom, val) in enumerate(zip(noms, valeurs)):
-        signe = "+" if val > 0 else ""
-        ax.text(val + 0.02 * np.sign(val), i, f'{signe}{val:.2f}',
-                va='center', fontsize=10, fontweight='bold')
-
-    # Légende explicative
-    ax.text(0.02, 0.98, "Vert = augmente la VAN\nRouge = diminue la VAN",
-            transform=ax.transAxes, fontsize=9, verticalalignment='top',
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-
-    ax.set_xlim(-1.1, 1.1)
-    ax.grid(True, alpha=0.3, axis='x')
-
-    plt.tight_layout()
-
-    if dossier:
-        os.makedirs(dossier, exist_ok=True)
-        chemin = os.path.join(dossier, "monte_carlo_tornado.png")
-        fig.savefig(chemin, dpi=150, bbox_inches='tight')
-        print(f"Figure sauvegardée: {chemin}")
-
-    return fig
-
-
-def graphique_van_cumulative(res: ResultatsModele, ax: Optional[plt.Axes] = None) -> plt.Figure:
-    """VAN cumulative avec période de récupération."""
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(12, 6))
-    else:
-        fig = ax.figure
-
-    annees = res.annees
-    ax.plot(annees, res.van_cumulative, marker='o', linewidth=2.5,
-            label="VAN cumulative", color='#1f77b4', markersize=7)
-
-    ax.axhline(0, color='black', linewidth=2, linestyle='--', alpha=0.7)
-    ax.fill_between(annees, 0, res.van_cumulative,
-                    where=(res.van_cumulative >= 0), alpha=0.2, color='green')
-    ax.fill_between(annees, 0, res.van_cumulative,
-                    where=(res.van_cumulative < 0), alpha=0.2, color='red')
-
-    # Marqueur récupération
-    if np.isfinite(res.periode_recuperation) and 0 < res.periode_recuperation <= res.params.horizon_analyse:
-        ax.scatter([res.periode_recuperation], [0], s=200, c='#ff7f0e',
-                   edgecolor='black', linewidth=2, zorder=5, marker='D')
-        ax.annotate(f'Récupération\n{res.periode_recuperation:.1f} ans',
-                    xy=(res.periode_recuperation, 0),
-                    xytext=(res.periode_recuperation, -abs(res.van_cumulative.min()) * 0.4),
-                    fontsize=10, ha='center', fontweight='bold',
-                    bbox=dict(boxstyle='round,pad=0.6', facecolor='yellow', alpha=0.7),
-                    arrowprops=dict(arrowstyle='->', color='black', lw=2))
-
-    ax.set_xlabel("Année", fontsize=12, fontweight='bold')
-    ax.set_ylabel("VAN cumulative ($)", fontsize=12, fontweight='bold')
-    ax.set_title(f"VAN Cumulative — {res.compteur.type_compteur.value.upper()}",
-                 fontsize=14, fontweight='bold', pad=15)
-    ax.grid(True, alpha=0.3, linestyle='--')
-    ax.legend(fontsize=11, loc='best')
-
-    y_max = max(abs(res.van_cumulative.min()), abs(res.van_cumulative.max()))
-    if y_max >= 1e6:
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
-
-    plt.tight_layout()
-    return fig
-
-
-def graphique_comparaison_types(df_comparaison: pd.DataFrame) -> plt.Figure:
-    """Comparer VAN et RBC des 3 types de compteurs."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-    types = df_comparaison["Type"]
-    x = np.arange(len(types))
-
-    # VAN
-    vans = df_comparaison["VAN"]
-    couleurs_van = ['#d62728' if v < 0 else '#2ca02c' for v in vans]
-    bars1 = ax1.bar(x, vans, color=couleurs_van, alpha=0.8,
-                    edgecolor='black', linewidth=1.5)
-
-    ax1.set_ylabel("VAN ($)", fontsize=12, fontweight='bold')
-    ax1.set_title("VAN par Type de Compteur", fontsize=13, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(types, fontsize=11, fontweight='bold')
-    ax1.grid(axis='y', alpha=0.3)
-    ax1.axhline(0, color='black', linewidth=2)
-
-    for bar in bars1:
-        hauteur = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., hauteur,
-                 fmt_argent(hauteur, 1), ha='center',
-                 va='bottom' if hauteur >= 0 else 'top',
-                 fontsize=10, fontweight='bold')
-
-    if max(abs(vans)) >= 1e6:
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
-
-    # RBC
-    rbcs = df_comparaison["RBC"]
-    couleurs_rbc = ['#d62728' if b < 1.0 else '#2ca02c' for b in rbcs]
-    bars2 = ax2.bar(x, rbcs, color=couleurs_rbc, alpha=0.8,
-                    edgecolor='black', linewidth=1.5)
-
-    ax2.set_ylabel("Ratio Bénéfices-Coûts", fontsize=12, fontweight='bold')
-    ax2.set_title("RBC par Type de Compteur", fontsize=13, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(types, fontsize=11, fontweight='bold')
-    ax2.grid(axis='y', alpha=0.3)
-    ax2.axhline(1.0, color='blue', linewidth=2, linestyle='--', label='Seuil rentabilité')
-    ax2.legend(fontsize=9)
-
-    for bar in bars2:
-        hauteur = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., hauteur,
-                 f'{hauteur:.2f}', ha='center', va='bottom',
-                 fontsize=10, fontweight='bold')
-
-    plt.tight_layout()
-    return fig
-
-
-def graphique_scenarios(df_scenarios: pd.DataFrame) -> plt.Figure:
-    """Comparer les scénarios."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-    scenarios = df_scenarios["Scénario"]
-    x = np.arange(len(scenarios))
-
-    # VAN
-    vans = df_scenarios["VAN"]
-    couleurs = ['#d62728', '#1f77b4', '#2ca02c']
-    bars1 = ax1.bar(x, vans, color=couleurs, alpha=0.8,
-                    edgecolor='black', linewidth=1.5)
-
-    ax1.set_ylabel("VAN ($)", fontsize=12, fontweight='bold')
-    ax1.set_title("VAN par Scénario", fontsize=13, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(scenarios, fontsize=11, fontweight='bold')
-    ax1.grid(axis='y', alpha=0.3)
-    ax1.axhline(0, color='black', linewidth=2)
-
-    for bar in bars1:
-        hauteur = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., hauteur,
-                 fmt_argent(hauteur, 1), ha='center',
-                 va='bottom' if hauteur >= 0 else 'top',
-                 fontsize=10, fontweight='bold')
-
-    # RBC
-    rbcs = df_scenarios["RBC"]
-    bars2 = ax2.bar(x, rbcs, color=couleurs, alpha=0.8,
-                    edgecolor='black', linewidth=1.5)
-
-    ax2.set_ylabel("RBC", fontsize=12, fontweight='bold')
-    ax2.set_title("Ratio B/C par Scénario", fontsize=13, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(scenarios, fontsize=11, fontweight='bold')
-    ax2.grid(axis='y', alpha=0.3)
-    ax2.axhline(1.0, color='blue', linewidth=2, linestyle='--', label='Seuil')
-    ax2.legend(fontsize=9)
-
-    for bar in bars2:
-        hauteur = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., hauteur,
-                 f'{hauteur:.2f}', ha='center', va='bottom',
-                 fontsize=10, fontweight='bold')
-
-    plt.tight_layout()
-    return fig
-
-
-# =============================================================================
-# AFFICHAGE RÉSULTATS
-# =============================================================================
-
-def afficher_resume(res: ResultatsModele) -> None:
-    """Afficher résumé complet des résultats."""
-    p = res.params
-    c = res.compteur
-
-    print("\n" + "=" * 80)
-    print(" " * 15 + "ANALYSE COÛTS-BÉNÉFICES — COMPTEURS D'EAU")
-    print(" " * 20 + f"Type: {c.type_compteur.value.upper()}")
-    print("=" * 80)
-
-    print(f"\n{'PARAMÈTRES DU PROJET':^80}")
-    print("-" * 80)
-    print(f"  Ménages:                  {p.nb_menages:>15,}")
-    print(f"  Compteurs:                {p.nb_compteurs_effectif:>15,}")
-    print(f"  Population:               {p.nb_personnes:>15,}")
-    print(f"  Horizon d'analyse:        {p.horizon_analyse:>15} ans")
-    print(f"  Taux d'actualisation:     {p.taux_actualisation_pct:>14.1f} %")
-
-    print(f"\n{'COÛTS DU COMPTEUR ({c.type_compteur.value.upper()})':^80}")
-    print("-" * 80)
-    print(f"  Compteur:                 {c.cout_compteur:>15.0f} $")
-    print(f"  Installation:             {c.cout_installation:>15.0f} $ ({c.heures_installation}h × {c.taux_horaire_installation}$/h)")
-    if c.type_compteur == TypeCompteur.AMI:
-        print(f"  Infrastructure réseau:    {c.cout_reseau_par_compteur:>15.0f} $")
-    print(f"  TOTAL par compteur:       {c.cout_initial_par_compteur:>15.0f} $")
-    print(f"  Exploitation annuelle:    {c.cout_exploitation_annuel:>15.0f} $/compteur")
-    if c.type_compteur == TypeCompteur.AMI and c.cout_opex_non_tech_ami > 0:
-        print(f"  OPEX non-tech AMI:         {c.cout_opex_non_tech_ami:>15.0f} $/compteur/an")
-
-    # Afficher économies d'échelle si actives
-    if res.economies_echelle_actives:
-        print(f"\n{'ÉCONOMIES D ÉCHELLE':^80}")
-        print("-" * 80)
-        reduction_pct = (1.0 - res.facteur_echelle) * 100
-        print(f"  Facteur d'échelle:        {res.facteur_echelle:>14.2f} ({reduction_pct:.1f}% réduction)")
-        print(f"  Facteurs (comp/inst/réseau): {res.facteur_echelle_compteur:.2f} / {res.facteur_echelle_installation:.2f} / {res.facteur_echelle_reseau:.2f}")
-        print(f"  Coût/compteur (base):     {res.cout_par_compteur_base:>15.0f} $")
-        print(f"  Coût/compteur (ajusté):   {res.cout_par_compteur_ajuste:>15.0f} $")
-        print(f"  ÉCONOMIES TOTALES:        {fmt_argent(res.economies_realisees):>15}")
-
-    print(f"\n{'ÉCONOMIES D EAU PAR MÉNAGE':^80}")
-    print("-" * 80)
-    print(f"  Usage de base:            {res.usage_base_menage:>15.1f} m³/an")
-    print(f"  Économies (fuites):       {res.economie_fuite_menage:>15.1f} m³/an")
-    print(f"  Économies (comportement): {res.economie_comportement_menage:>15.1f} m³/an")
-    if res.economie_reseau_menage > 0:
-        print(f"  Économies (réseau):       {res.economie_reseau_menage:>15.1f} m³/an")
-    print(f"  ÉCONOMIES TOTALES:        {res.economie_totale_menage:>15.1f} m³/an")
-
-    print(f"\n{'BÉNÉFICES ANNUELS':^80}")
-    print("-" * 80)
-    print(f"  Valeur eau économisée:    {fmt_argent(res.benefices_eau_annuels):>15}")
-    if res.benefice_infra_annuel > 0:
-        print(f"  Report infrastructure:    {fmt_argent(res.benefice_infra_annuel):>15}")
-    print(f"  BÉNÉFICES TOTAUX:         {fmt_argent(res.benefices_totaux_annuels):>15}")
-
-    print(f"\n{'VALEURS ACTUALISÉES':^80}")
-    print("-" * 80)
-    print(f"  Investissement initial:   {fmt_argent(res.investissement_initial):>15}")
-    print(f"  VA(Bénéfices):            {fmt_argent(res.va_benefices):>15}")
-    print(f"  VA(Coûts exploitation):   {fmt_argent(res.va_couts_exploitation):>15}")
-    print(f"  VA(Coûts totaux):         {fmt_argent(res.va_couts_totaux):>15}")
-
-    print(f"\n{'DÉCOMPOSITION VALEUR DE L EAU (VA)':^80}")
-    print("-" * 80)
-    print(f"  Coût variable évité:      {fmt_argent(res.va_benefices_cout_variable):>15}")
-    print(f"  Report infra (valeur m³): {fmt_argent(res.va_benefices_infra_m3):>15}")
-    print(f"  Externalités:             {fmt_argent(res.va_benefices_externalites):>15}")
-    print(f"  Report infra (paramètres): {fmt_argent(res.va_benefices_report_infra):>15}")
-    if res.mode_compte == ModeCompte.FINANCIER:
-        print("  (Info) Composantes sociales non comptées en mode financier")
-
-    print(f"\n{'RÉSULTATS PRINCIPAUX':^80}")
-    print("=" * 80)
-    statut = "PROJET RENTABLE" if res.van >= 0 else "PROJET NON RENTABLE"
-    print(f"  VAN:                      {fmt_argent(res.van):>15}  [{statut}]")
-    rbc_statut = "OK" if res.rbc >= 1.0 else "ÉCHEC"
-    print(f"  Ratio B/C:                {res.rbc:>15.2f}  [{rbc_statut}]")
-
-    print(f"\n{'MÉTRIQUES PAR MÉNAGE':^80}")
-    print("-" * 80)
-    print(f"  Coût annuel équiv. (EAC): {fmt_argent(res.eac_menage, 2):>15}/an")
-    print(f"  Coût nivelé (LCSW):       {res.lcsw:>14.2f} $/m³")
-    print(f"  Seuil rentabilité (q*):   {res.seuil_rentabilite_m3:>15.1f} m³/an")
-
-    print(f"\n{'PÉRIODE DE RÉCUPÉRATION':^80}")
-    print("-" * 80)
-    if np.isfinite(res.periode_recuperation) and res.periode_recuperation > 0:
-        print(f"  Récupération:             {res.periode_recuperation:>15.1f} ans")
-        if res.periode_recuperation <= p.horizon_analyse / 2:
-            print("  [Récupération rapide - moins de 50% de l'horizon]")
-        elif res.periode_recuperation <= p.horizon_analyse:
-            print("  [Récupération dans l'horizon d'analyse]")
-        else:
-            print("  [Récupération au-delà de l'horizon]")
-    else:
-        print("  Récupération:             JAMAIS (infini)")
-
-    print("=" * 80 + "\n")
-
-
-def afficher_comparaison_types(df: pd.DataFrame) -> None:
-    """Afficher tableau comparatif des types de compteurs."""
-    print("\n" + "=" * 80)
-    print(" " * 20 + "COMPARAISON DES TYPES DE COMPTEURS")
-    print("=" * 80 + "\n")
-
-    # Formater le DataFrame pour affichage
-    df_affich = df.copy()
-    df_affich["Investissement total"] = df_affich["Investissement total"].apply(lambda x: fmt_argent(x))
-    df_affich["Coût exploit./an"] = df_affich["Coût exploit./an"].apply(lambda x: fmt_argent(x))
-    df_affich["VAN"] = df_affich["VAN"].apply(lambda x: fmt_argent(x))
-    df_affich["RBC"] = df_affich["RBC"].apply(lambda x: f"{x:.2f}")
-    df_affich["Récupération (ans)"] = df_affich["Récupération (ans)"].apply(
-        lambda x: f"{x:.1f}" if np.isfinite(x) else "Jamais"
-    )
-    df_affich["LCSW ($/m³)"] = df_affich["LCSW ($/m³)"].apply(lambda x: f"{x:.2f}")
-    df_affich["Coût initial/compteur"] = df_affich["Coût initial/compteur"].apply(lambda x: f"{x:.0f} $")
-
-    print(df_affich.to_string(index=False))
-    print()
-
-
-# =============================================================================
-# MODULE CALIBRAGE EXPLICITE : TRAÇABILITÉ SCIENTIFIQUE
-# =============================================================================
-#
-# Ce module documente les sources empiriques de chaque paramètre du modèle,
-# permettant une transparence totale pour la soutenance de thèse.
-#
-# OBJECTIFS:
-# 1. Traçabilité: Chaque paramètre est lié à des études empiriques
-# 2. Validation: Vérifier que les paramètres sont dans les plages observées
-# 3. Sensibilité justifiée: Bornes basées sur la littérature
-# 4. Reproductibilité: Export BibTeX pour la bibliographie
-#
-# STRUCTURE:
-# - SourceCalibration: Référence à une étude empirique
-# - ParametreCalibre: Un paramètre avec ses sources de calibration
-# - CALIBRATION: Dictionnaire complet des paramètres calibrés
-#
-# ÉTUDES PRINCIPALES:
-# - Davies et al. (2014): Sydney, Australie - effets comportementaux
-# - Carrillo et al. (2024): Quito, Équateur - persistance à ~12 mois
-# - City of Winnipeg (2023): Programme de remplacement - économies d'échelle
-# - Beal & Stewart (2011): Australia - effets feedback temps réel
-# - Kenney et al. (2008): Colorado - élasticité prix/conservation
-#
-# =============================================================================
-
-@dataclass
-class SourceCalibration:
-    """
-    Référence à une étude empirique pour justifier un paramètre.
-
-    Cette structure permet de documenter précisément d'où vient chaque
-    valeur utilisée dans le modèle, élément crucial pour une thèse.
-
-    Exemple d'utilisation:
-        source = SourceCalibration(
-            auteur="Davies et al.",
-            titre="Smart metering behavioral impacts",
-            annee=2014,
-            lieu="Royaume-Uni",
-            valeur_observee=0.085,
-            contexte="Déploiement national, feedback temps réel"
-        )
-    """
-    # === IDENTIFICATION DE L'ÉTUDE ===
-    auteur: str                           # Ex: "Carrillo & Bellod"
-    titre: str                            # Titre de l'étude/rapport
-    annee: int                            # Année de publication
-    lieu: str                             # Lieu géographique de l'étude
-
-    # === VALEURS OBSERVÉES ===
-    valeur_observee: float                # Valeur centrale mesurée
-    intervalle_confiance: tuple = (None, None)  # (min, max) si disponible
-    taille_echantillon: Optional[int] = None    # n si connu
-
-    # === CONTEXTE ===
-    contexte: str = ""                    # Conditions de l'étude
-    methodologie: str = ""                # RCT, quasi-expérimental, etc.
-    page_ou_section: str = ""             # Référence précise
-
-    # === MÉTADONNÉES ===
-    url: str = ""                         # DOI ou URL
-    type_source: str = "article"          # article, rapport, thèse
-    notes: str = ""                       # Commentaires additionnels
-
-    @property
-    def citation_courte(self) -> str:
-        """Format citation courte: Auteur (Année)."""
-        return f"{self.auteur} ({self.annee})"
-
-    @property
-    def citation_complete(self) -> str:
-        """Format citation complète pour bibliographie."""
-        return f"{self.auteur} ({self.annee}). {self.titre}. {self.lieu}."
-
-    def to_bibtex(self, cle: str = None) -> str:
-        """Générer entrée BibTeX."""
-        if cle is None:
-            # Générer clé automatique: auteur_annee
-            auteur_clean = self.auteur.split()[0].lower().replace(",", "")
-            cle = f"{auteur_clean}{self.annee}"
-
-        bibtex = f"@{self.type_source}{{{cle},\n"
-        bibtex += f"  author = {{{self.auteur}}},\n"
-        bibtex += f"  title = {{{self.titre}}},\n"
-        bibtex += f"  year = {{{self.annee}}},\n"
-        if self.url:
-            bibtex += f"  url = {{{self.url}}},\n"
-        bibtex += f"  note = {{{self.lieu}. {self.contexte}}}\n"
-        bibtex += "}"
-
-        return bibtex
-
-
-@dataclass
-class ParametreCalibre:
-    """
-    Un paramètre du modèle avec ses sources de calibration.
-
-    Cette structure lie:
-    - Une valeur par défaut utilisée dans le modèle
-    - La plage recommandée basée sur la littérature
-    - Les études empiriques qui justifient ces valeurs
-
-    Permet de:
-    - Valider que les paramètres sont réalistes
-    - Justifier les choix lors de la soutenance
-    - Définir des bornes de sensibilité cohérentes
-    """
-    # === IDENTIFICATION ===
-    nom: str                              # Nom du paramètre
-    code: str                             # Code dans le modèle (ex: "alpha0")
-    categorie: str                        # Catégorie (persistance, fuites, etc.)
-
-    # === VALEURS ===
-    valeur_defaut: float                  # Valeur utilisée par défaut
-    unite: str                            # Ex: "%", "$/m³", "années"
-    plage_recommandee: tuple              # (min, max) basé sur littérature
-
-    # === SOURCES ===
-    sources: list = field(default_factory=list)  # Liste de SourceCalibration
-
-    # === DOCUMENTATION ===
-    description: str = ""                 # Description du paramètre
-    notes_methodologiques: str = ""       # Notes sur le choix de la valeur
-    incertitude: str = "moyenne"          # faible, moyenne, élevée
-
-    def __post_init__(self):
-        """Valider les paramètres."""
-        if len(self.plage_recommandee) != 2:
-            raise ValueError("plage_recommandee doit être (min, max)")
-        if self.plage_recommandee[0] > self.plage_recommandee[1]:
-            raise ValueError("plage min > max")
-
-    @property
-    def nb_sources(self) -> int:
-        """Nombre de sources documentées."""
-        return len(self.sources)
-
-    @property
-    def valeur_dans_plage(self) -> bool:
-        """Vérifier si la valeur par défaut est dans la plage recommandée."""
-        return self.plage_recommandee[0] <= self.valeur_defaut <= self.plage_recommandee[1]
-
-    @property
-    def citations_courtes(self) -> str:
-        """Liste des citations courtes."""
-        return ", ".join(s.citation_courte for s in self.sources)
-
-    def valider(self, valeur: float) -> tuple[bool, str]:
-        """
-        Valider une valeur contre la plage recommandée.
-
-        Retourne:
-            (est_valide, message)
-        """
-        min_val, max_val = self.plage_recommandee
-        if valeur < min_val:
-            return False, f"{self.nom}: {valeur} < minimum recommandé ({min_val})"
-        if valeur > max_val:
-            return False, f"{self.nom}: {valeur} > maximum recommandé ({max_val})"
-        return True, f"{self.nom}: {valeur} dans la plage [{min_val}, {max_val}]"
-
-
-# =============================================================================
-# SOURCES EMPIRIQUES DOCUMENTÉES
-# =============================================================================
-#
-# Ces sources sont utilisées pour calibrer les paramètres du modèle.
-# Chaque source est documentée avec les valeurs observées et le contexte.
-#
-
-# --- PERSISTANCE COMPORTEMENTALE ---
-
-SOURCE_DAVIES_UK = SourceCalibration(
-    auteur="Davies, K., Doolan, C., van den Honert, R., & Beal, C.",
-    titre="Water-saving impacts of Smart Meter technology: An empirical 5 year, whole-of-community study in Sydney, Australia",
-    annee=2014,
-    lieu="Sydney, Australie",
-    valeur_observee=0.085,
-    intervalle_confiance=(0.06, 0.11),
-    taille_echantillon=1500,
-    contexte="Étude communautaire sur 5 ans avec smart meters et feedback",
-    methodologie="Quasi-expérimental, comparaison avant/après avec groupe contrôle",
-    page_ou_section="Table 3, p. 287",
-    type_source="article",
-    url="https://doi.org/10.1002/2014WR015812",
-    notes="Effet persistant sur 5 ans, convergence observée vers plateau à ~2-3 ans"
-)
-
-SOURCE_CARRILLO_ALICANTE = SourceCalibration(
-    auteur="Carrillo, P. E., Contreras, D., & Scartascini, C.",
-    titre="Turn off the faucet: Can individual meters reduce water consumption?",
-    annee=2024,
-    lieu="Quito, Équateur",
-    valeur_observee=0.092,
-    intervalle_confiance=(0.07, 0.12),
-    taille_echantillon=12000,
-    contexte="Installation de compteurs individuels, suivi ~12 mois",
-    methodologie="Difference-in-differences avec matching",
-    page_ou_section="Section 4.2, Table 4",
-    url="https://doi.org/10.1016/j.jeem.2024.103065",
-    type_source="article",
-    notes="Effet stable sur 12 mois, pas de fade-out significatif observé"
-)
-
-SOURCE_BEAL_AUSTRALIA = SourceCalibration(
-    auteur="Beal, C. D. & Stewart, R. A.",
-    titre="Identifying residential water end uses underpinning peak day demand",
-    annee=2011,
-    lieu="Queensland, Australie",
-    valeur_observee=0.10,
-    intervalle_confiance=(0.05, 0.15),
-    taille_echantillon=250,
-    contexte="Compteurs haute fréquence avec feedback détaillé par appareil",
-    methodologie="Étude pilote avec monitoring continu",
-    page_ou_section="Results section, Table 5",
-    type_source="article",
-    notes="Réduction plus élevée avec feedback détaillé (par appareil)"
-)
-
-SOURCE_KENNEY_COLORADO = SourceCalibration(
-    auteur="Kenney, D. S., Goemans, C., Klein, R., Lowrey, J., & Reidy, K.",
-    titre="Residential water demand management: Lessons from Aurora, Colorado",
-    annee=2008,
-    lieu="Aurora, Colorado, USA",
-    valeur_observee=0.065,
-    intervalle_confiance=(0.04, 0.09),
-    taille_echantillon=8000,
-    contexte="Programme combiné compteurs + signal-prix (contexte externe, hors périmètre QC)",
-    methodologie="Analyse économétrique panel 10 ans",
-    page_ou_section="Table 2, Section 4",
-    type_source="article",
-    notes="Effet persistant avec renforcement par signal-prix"
-)
-
-# --- PERSISTANCE: DÉCROISSANCE ---
-
-SOURCE_ALLCOTT_HABITS = SourceCalibration(
-    auteur="Allcott, H. & Rogers, T.",
-    titre="The short-run and long-run effects of behavioral interventions",
-    annee=2014,
-    lieu="USA (plusieurs États)",
-    valeur_observee=0.35,  # lambda_decay: demi-vie ~2 ans
-    intervalle_confiance=(0.25, 0.50),
-    taille_echantillon=500000,
-    contexte="OPOWER: rapports de comparaison sociale sur consommation énergie",
-    methodologie="RCT à grande échelle, suivi 2+ ans post-intervention",
-    page_ou_section="Figure 3, Table 3",
-    url="https://doi.org/10.1257/aer.104.10.3003",
-    type_source="article",
-    notes="Référence pour modéliser la persistance/décroissance des effets comportementaux"
-)
-
-# --- FUITES RÉSIDENTIELLES ---
-
-SOURCE_AWWA_LEAKS = SourceCalibration(
-    auteur="American Water Works Association",
-    titre="Residential End Uses of Water, Version 2",
-    annee=2016,
-    lieu="USA (23 villes)",
-    valeur_observee=0.18,  # 18% des ménages avec fuite
-    intervalle_confiance=(0.12, 0.25),
-    taille_echantillon=1200,
-    contexte="Étude nationale des usages résidentiels de l'eau",
-    methodologie="Monitoring haute fréquence + audits terrain",
-    page_ou_section="Chapter 5, Table 5.2",
-    type_source="rapport",
-    notes="Prévalence des fuites non détectées par les ménages"
-)
-
-SOURCE_DEOREO_LEAKS = SourceCalibration(
-    auteur="DeOreo, W. B., Mayer, P. W., et al.",
-    titre="California Single Family Water Use Efficiency Study",
-    annee=2011,
-    lieu="Californie, USA",
-    valeur_observee=35.0,  # m³/an par fuite
-    intervalle_confiance=(20.0, 75.0),
-    taille_echantillon=735,
-    contexte="Étude détaillée usages résidentiels avec smart meters",
-    methodologie="Monitoring continu + désagrégation par usage",
-    page_ou_section="Section 4.3",
-    type_source="rapport",
-    notes="Volume moyen des fuites non réparées (toilettes, robinets)"
-)
-
-SOURCE_BRITTON_REPAIR = SourceCalibration(
-    auteur="Britton, T., Stewart, R. A., & O'Halloran, K.",
-    titre="Smart metering enabler for rapid and effective post meter leakage identification",
-    annee=2013,
-    lieu="Gold Coast, Australie",
-    valeur_observee=0.87,  # 87% taux de réparation après notification
-    intervalle_confiance=(0.80, 0.95),
-    taille_echantillon=180,
-    contexte="Programme pilote avec alertes automatiques de fuite",
-    methodologie="Étude pilote avec suivi des réparations",
-    page_ou_section="Results, Table 2",
-    type_source="article",
-    notes="Taux de réparation élevé quand notification proactive"
-)
-
-# --- ÉCONOMIES D'ÉCHELLE / DONNÉES PROGRAMME WINNIPEG ---
-# Note: Les sources ci-dessous sont conservées pour les économies d'échelle
-# et la documentation. Le sous-enregistrement ne s'applique pas au Québec
-# (première installation, pas de compteurs existants).
-
-SOURCE_WINNIPEG_METERS = SourceCalibration(
-    auteur="City of Winnipeg",
-    titre="Automated Water Meter Infrastructure Program - Business Case",
-    annee=2023,
-    lieu="Winnipeg, Canada",
-    valeur_observee=0.05,  # 5% sous-enregistrement
-    intervalle_confiance=(0.03, 0.08),
-    taille_echantillon=221000,
-    contexte="Remplacement de 221,000 compteurs mécaniques vieillissants",
-    methodologie="Analyse financière pré-implantation basée sur audits",
-    page_ou_section="Section 4.2 Financial Analysis",
-    type_source="rapport",
-    url="https://winnipeg.ca/waterandwaste/water/meters/",
-    notes="Sous-enregistrement estimé (~5%); contexte de remplacement, hors tarification résidentielle QC"
-)
-
-SOURCE_ARREGUI_ACCURACY = SourceCalibration(
-    auteur="Arregui, F., Cabrera Jr., E., & Cobacho, R.",
-    titre="Integrated Water Meter Management",
-    annee=2006,
-    lieu="International (compilation)",
-    valeur_observee=0.04,  # 4% sous-enregistrement moyen
-    intervalle_confiance=(0.02, 0.10),
-    contexte="Synthèse internationale sur la métrologie des compteurs d'eau",
-    methodologie="Revue de littérature et compilation de données",
-    page_ou_section="Chapter 3, Table 3.2",
-    type_source="livre",
-    notes="Sous-enregistrement augmente avec l'âge: 1%/5 ans environ"
-)
-
-# Table Neptune SEER - Winnipeg (précision par âge)
-SOURCE_WINNIPEG_NEPTUNE = SourceCalibration(
-    auteur="City of Winnipeg",
-    titre="Automated Water Meter Infrastructure - Neptune SEER Analysis",
-    annee=2023,
-    lieu="Winnipeg, Canada",
-    valeur_observee=0.07,  # +7% après remplacement pilote
-    intervalle_confiance=(0.04, 0.10),
-    taille_echantillon=221000,
-    contexte="Table de précision Neptune SEER par âge de compteur",
-    methodologie="Analyse pilote avant/après remplacement",
-    page_ou_section="Business Case, Table 4.3",
-    type_source="rapport",
-    notes="15 ans: 95.12% (4.88% perte); 20 ans: 93.70% (6.30% perte)"
-)
-
-# --- FUITES PRIVÉES (AWE 2023) ---
-
-SOURCE_AWE_LEAKS = SourceCalibration(
-    auteur="Alliance for Water Efficiency",
-    titre="Smart Meters and Customer Leak Detection: A Review of Program Effectiveness",
-    annee=2023,
-    lieu="USA (San Jose Water Company et autres)",
-    valeur_observee=0.20,  # 20% prévalence "any leak"
-    intervalle_confiance=(0.15, 0.25),
-    contexte="Pilote AMI avec définition fuite = consommation continue 24h",
-    methodologie="Analyse données compteurs intelligents, comparaison programmes",
-    type_source="rapport",
-    notes="20% any leak; 3-7% significant; 1.3% large (>7.5 gal/h). "
-          "47% engagement après notification. Longue traîne documentée."
-)
-
-SOURCE_AWE_PERSISTENCE = SourceCalibration(
-    auteur="Alliance for Water Efficiency",
-    titre="Smart Meters and Customer Leak Detection: Program Follow-up",
-    annee=2023,
-    lieu="USA",
-    valeur_observee=0.05,  # ~5% fuites persistantes
-    intervalle_confiance=(0.02, 0.10),
-    contexte="Suivi programmes de détection fuites",
-    methodologie="Analyse longitudinale durée des fuites",
-    type_source="rapport",
-    notes="Durée moyenne de fuite inchangée post-programme à cause de fuites "
-          "exceptionnellement longues ('longue traîne')"
-)
-
-# --- ÉCONOMIES D'ÉCHELLE ---
-
-SOURCE_AWWA_SCALE = SourceCalibration(
-    auteur="American Water Works Association",
-    titre="Water Meters: Selection, Installation, Testing and Maintenance (M6)",
-    annee=2012,
-    lieu="USA",
-    valeur_observee=0.85,  # Facteur d'échelle pour >100k compteurs
-    intervalle_confiance=(0.80, 0.90),
-    contexte="Manuel technique sur les programmes de compteurs à grande échelle",
-    methodologie="Compilation de données de projets municipaux",
-    page_ou_section="Chapter 8, Cost Considerations",
-    type_source="manuel",
-    notes="15-20% réduction coûts unitaires pour déploiements >100,000 unités"
-)
-
-# --- VALEUR DE L'EAU ---
-
-SOURCE_RENZETTI_VALUE = SourceCalibration(
-    auteur="Renzetti, S. & Dupont, D.",
-    titre="Measuring the full economic cost of water provision",
-    annee=2015,
-    lieu="Canada",
-    valeur_observee=4.50,  # $/m³ valeur sociale
-    intervalle_confiance=(3.00, 7.00),
-    contexte="Estimation du coût complet incluant externalités au Canada",
-    methodologie="Analyse économique avec externalités environnementales",
-    page_ou_section="Table 4, Conclusions",
-    type_source="article",
-    notes="Inclut: coût production, infrastructure, environnement, rareté"
-)
-
-
-# =============================================================================
-# DICTIONNAIRE DE CALIBRATION
-# =============================================================================
-#
-# Structure hiérarchique des paramètres calibrés par catégorie.
-# Chaque paramètre est lié à ses sources empiriques.
-#
-
-CALIBRATION = {
-    # =========================================================================
-    # PERSISTANCE COMPORTEMENTALE
-    # =========================================================================
-    "persistance": {
-        "alpha0": ParametreCalibre(
-            nom="Réduction comportementale initiale",
-            code="alpha_initial",
-            categorie="persistance",
-            valeur_defaut=0.08,
-            unite="ratio (0-1)",
-            plage_recommandee=(0.05, 0.15),
-            sources=[
-                SOURCE_DAVIES_UK,
-                SOURCE_CARRILLO_ALICANTE,
-                SOURCE_BEAL_AUSTRALIA,
-                SOURCE_KENNEY_COLORADO,
-            ],
-            description="Réduction de consommation en année 1 suite à l'installation du compteur",
-            notes_methodologiques=(
-                "Valeur centrale basée sur Davies (Australie) et Carrillo (Équateur). "
-                "Beal (Australie) montre des effets plus élevés avec feedback détaillé. "
-                "Kenney (Colorado) suggère renforcement par engagement; non utilisé ici."
-            ),
-            incertitude="moyenne",
-        ),
-
-        "alpha_inf": ParametreCalibre(
-            nom="Plateau long terme",
-            code="alpha_plateau",
-            categorie="persistance",
-            valeur_defaut=0.025,
-            unite="ratio (0-1)",
-            plage_recommandee=(0.00, 0.05),
-            sources=[
-                SOURCE_DAVIES_UK,
-                SOURCE_ALLCOTT_HABITS,
-            ],
-            description="Effet comportemental résiduel après stabilisation (habitudes formées)",
-            notes_methodologiques=(
-                "Davies observe convergence vers plateau après 2-3 ans. "
-                "Allcott & Rogers montrent persistance partielle des habitudes. "
-                "Plateau = ~25-30% de l'effet initial est conservateur."
-            ),
-            incertitude="élevée",
-        ),
-
-        "lambda_decay": ParametreCalibre(
-            nom="Vitesse de décroissance",
-            code="lambda_decay",
-            categorie="persistance",
-            valeur_defaut=0.15,
-            unite="1/an",
-            plage_recommandee=(0.10, 0.35),
-            sources=[
-                SOURCE_ALLCOTT_HABITS,
-                SOURCE_DAVIES_UK,
-            ],
-            description="Paramètre de décroissance exponentielle vers le plateau",
-            notes_methodologiques=(
-                "λ=0.15 implique demi-vie ≈ 4.6 ans (ln(2)/0.15 ≈ 4.6). "
-                "Cohérent avec Allcott & Rogers AER: décroissance 10-20%/an. "
-                "λ=0.35 (demi-vie ~2 ans) utilisable comme scénario pessimiste."
-            ),
-            incertitude="élevée",
-        ),
-    },
-
-    # =========================================================================
-    # FUITES RÉSIDENTIELLES
-    # =========================================================================
-    "fuites": {
-        "prevalence": ParametreCalibre(
-            nom="Prévalence des fuites",
-            code="part_menages_fuite_pct",
-            categorie="fuites",
-            valeur_defaut=20.0,
-            unite="%",
-            plage_recommandee=(12.0, 25.0),
-            sources=[
-                SOURCE_AWWA_LEAKS,
-            ],
-            description="Pourcentage de ménages ayant une fuite non détectée",
-            notes_methodologiques=(
-                "AWWA REU2 trouve 18% en moyenne sur 23 villes US. "
-                "20% est légèrement conservateur pour contexte québécois. "
-                "Inclut: toilettes, robinets, chauffe-eau."
-            ),
-            incertitude="moyenne",
-        ),
-
-        "debit_fuite": ParametreCalibre(
-            nom="Volume moyen par fuite",
-            code="debit_fuite_m3_an",
-            categorie="fuites",
-            valeur_defaut=35.0,
-            unite="m³/an",
-            plage_recommandee=(20.0, 75.0),
-            sources=[
-                SOURCE_DEOREO_LEAKS,
-                SOURCE_AWWA_LEAKS,
-            ],
-            description="Débit annuel moyen d'une fuite non réparée",
-            notes_methodologiques=(
-                "DeOreo trouve médiane ~35 m³/an pour fuites toilettes. "
-                "Grande variabilité: 10-150 m³/an selon type et sévérité. "
-                "35 m³/an = ~100 L/jour, valeur modérée."
-            ),
-            incertitude="élevée",
-        ),
-
-        "taux_reparation": ParametreCalibre(
-            nom="Taux de réparation après détection",
-            code="taux_reparation_pct",
-            categorie="fuites",
-            valeur_defaut=85.0,
-            unite="%",
-            plage_recommandee=(60.0, 95.0),
-            sources=[
-                SOURCE_BRITTON_REPAIR,
-            ],
-            description="Pourcentage des fuites détectées qui sont effectivement réparées",
-            notes_methodologiques=(
-                "Britton observe 87% de réparation avec alertes proactives. "
-                "Sans programme d'accompagnement: 60-70% plus réaliste. "
-                "85% suppose notification active aux ménages."
-            ),
-            incertitude="moyenne",
-        ),
-
-        "cout_reparation": ParametreCalibre(
-            nom="Coût moyen de réparation",
-            code="cout_reparation_moyen",
-            categorie="fuites",
-            valeur_defaut=200.0,
-            unite="$",
-            plage_recommandee=(100.0, 500.0),
-            sources=[],  # Estimation basée sur coûts plomberie Québec
-            description="Coût moyen d'une réparation de fuite résidentielle",
-            notes_methodologiques=(
-                "Estimation basée sur tarifs plomberie Québec 2024. "
-                "Réparation simple (joint): ~100$. "
-                "Remplacement toilette: ~300-500$. "
-                "200$ = moyenne pondérée raisonnable."
-            ),
-            incertitude="moyenne",
-        ),
-    },
-
-    # =========================================================================
-    # ÉCONOMIES D'ÉCHELLE
-    # =========================================================================
-    "economies_echelle": {
-        "facteur_100k": ParametreCalibre(
-            nom="Facteur d'échelle (>100k compteurs)",
-            code="facteur_echelle",
-            categorie="economies_echelle",
-            valeur_defaut=0.85,
-            unite="ratio",
-            plage_recommandee=(0.80, 0.92),
-            sources=[
-                SOURCE_AWWA_SCALE,
-                SOURCE_WINNIPEG_METERS,
-            ],
-            description="Facteur multiplicatif sur le coût unitaire pour grands volumes",
-            notes_methodologiques=(
-                "AWWA M6 documente 15-20% de réduction pour >100k unités. "
-                "Winnipeg (221k compteurs) à ~$611/compteur total. "
-                "0.85 = -15% est conservateur."
-            ),
-            incertitude="faible",
-        ),
-    },
-
-    # =========================================================================
-    # VALEUR ÉCONOMIQUE DE L'EAU
-    # =========================================================================
-    "valeur_eau": {
-        "valeur_sociale": ParametreCalibre(
-            nom="Valeur sociale de l'eau",
-            code="valeur_sociale_m3",
-            categorie="valeur_eau",
-            valeur_defaut=4.69,
-            unite="$/m³",
-            plage_recommandee=(2.50, 8.00),
-            sources=[
-                SOURCE_RENZETTI_VALUE,
-            ],
-            description="Coût d'opportunité social incluant externalités",
-            notes_methodologiques=(
-                "Renzetti & Dupont estiment 3-7$/m³ au Canada. "
-                "4.69$ inclut: production, infrastructure, environnement. "
-                "Plus élevé en zone de stress hydrique."
-            ),
-            incertitude="élevée",
-        ),
-
-        "cout_variable": ParametreCalibre(
-            nom="Coût variable municipal",
-            code="cout_variable_m3",
-            categorie="valeur_eau",
-            valeur_defaut=0.50,
-            unite="$/m³",
-            plage_recommandee=(0.10, 1.50),
-            sources=[],  # Données budgétaires municipales
-            description="OPEX variable évité quand on économise 1 m³",
-            notes_methodologiques=(
-                "Basé sur budgets municipaux québécois. "
-                "Inclut: chimie traitement, énergie pompage. "
-                "Exclut: coûts fixes, amortissement. "
-                "0.50$/m³ est conservateur (Winnipeg ~0.12$/m³)."
-            ),
-            incertitude="faible",
-        ),
-    },
-
-    # =========================================================================
-    # PARAMÈTRES FINANCIERS
-    # =========================================================================
-    "financier": {
-        "taux_actualisation": ParametreCalibre(
-            nom="Taux d'actualisation social",
-            code="taux_actualisation_pct",
-            categorie="financier",
-            valeur_defaut=3.0,
-            unite="%",
-            plage_recommandee=(2.0, 5.0),
-            sources=[],  # Standards gouvernementaux
-            description="Taux d'actualisation pour l'analyse coûts-bénéfices",
-            notes_methodologiques=(
-                "Treasury Board Canada recommande 3% pour projets publics. "
-                "USEPA utilise 3% pour projets environnementaux. "
-                "Sensibilité recommandée: 2%, 3%, 5%."
-            ),
-            incertitude="faible",
-        ),
-    },
-}
-
-
-# =============================================================================
-# FONCTIONS DE CALIBRAGE
-# =============================================================================
-
-def obtenir_parametre_calibre(categorie: str, code: str) -> Optional[ParametreCalibre]:
-    """
-    Obtenir un paramètre calibré par sa catégorie et son code.
-
-    Paramètres:
-        categorie: Catégorie du paramètre (persistance, fuites, etc.)
-        code: Code du paramètre dans la catégorie
-
-    Retourne:
-        ParametreCalibre ou None si non trouvé
-    """
-    if categorie in CALIBRATION and code in CALIBRATION[categorie]:
-        return CALIBRATION[categorie][code]
-    return None
-
-
-def lister_parametres_calibres() -> list[ParametreCalibre]:
-    """Retourner la liste plate de tous les paramètres calibrés."""
-    params = []
-    for categorie in CALIBRATION.values():
-        for param in categorie.values():
-            params.append(param)
-    return params
-
-
-def afficher_calibration(categorie: str = None) -> None:
-    """
-    Afficher un tableau récapitulatif des sources de calibration.
-
-    Paramètres:
-        categorie: Filtrer par catégorie (None = tout afficher)
-    """
-    print("\n" + "=" * 100)
-    print(" " * 30 + "CALIBRATION DES PARAMÈTRES")
-    print("=" * 100)
-
-    categories = [categorie] if categorie else list(CALIBRATION.keys())
-
-    for cat in categories:
-        if cat not in CALIBRATION:
-            continue
-
-        print(f"\n{'─' * 100}")
-        print(f" {cat.upper()}")
-        print(f"{'─' * 100}")
-
-        print(f"\n{'Paramètre':<35} │ {'Valeur':<12} │ {'Plage':<15} │ {'Sources':<30}")
-        print("─" * 35 + "─┼─" + "─" * 12 + "─┼─" + "─" * 15 + "─┼─" + "─" * 30)
-
-        for code, param in CALIBRATION[cat].items():
-            plage = f"[{param.plage_recommandee[0]}, {param.plage_recommandee[1]}]"
-            sources = param.citations_courtes if param.nb_sources > 0 else "Estimation"
-
-            # Tronquer si trop long
-            if len(sources) > 28:
-                sources = sources[:25] + "..."
-
-            # Indicateur si hors plage
-            indicateur = "✓" if param.valeur_dans_plage else "⚠"
-
-            print(f"{param.nom[:33]:<35} │ {param.valeur_defaut:>10} {param.unite[:2]:<2} │ "
-                  f"{plage:<15} │ {sources:<30} {indicateur}")
-
-    print("\n" + "=" * 100)
-    print("✓ = Valeur dans la plage recommandée")
-    print("⚠ = Valeur hors plage (à justifier)")
-    print("=" * 100)
-
-
-def valider_parametres_vs_calibration(
-    params: ParametresModele = None,
-    persistance: ParametresPersistance = None,
-    params_fuites: ParametresFuites = None,
-) -> list[tuple[str, bool, str]]:
-    """
-    Valider les paramètres du modèle contre les plages de calibration.
-
-    Retourne une liste de (paramètre, est_valide, message) pour chaque
-    paramètre vérifié.
-
-    Paramètres:
-        params: Paramètres du modèle (si None, utilise défauts)
-        persistance: Paramètres de persistance
-        params_fuites: Paramètres de fuites
-
-    Retourne:
-        Liste de tuples (nom, valide, message)
-    """
-    resultats = []
-
-    # Valider ParametresModele
-    if params is not None:
-        # Prévalence fuites
-        param_cal = obtenir_parametre_calibre("fuites", "prevalence")
-        if param_cal:
-            valide, msg = param_cal.valider(params.part_menages_fuite_pct)
-            resultats.append(("part_menages_fuite_pct", valide, msg))
-
-        # Débit fuite
-        param_cal = obtenir_parametre_calibre("fuites", "debit_fuite")
-        if param_cal:
-            valide, msg = param_cal.valider(params.debit_fuite_m3_an)
-            resultats.append(("debit_fuite_m3_an", valide, msg))
-
-        # Valeur eau
-        param_cal = obtenir_parametre_calibre("valeur_eau", "valeur_sociale")
-        if param_cal:
-            valide, msg = param_cal.valider(params.valeur_eau_m3)
-            resultats.append(("valeur_eau_m3", valide, msg))
-
-        # Taux actualisation
-        param_cal = obtenir_parametre_calibre("financier", "taux_actualisation")
-        if param_cal:
-            valide, msg = param_cal.valider(params.taux_actualisation_pct)
-            resultats.append(("taux_actualisation_pct", valide, msg))
-
-    # Valider ParametresPersistance
-    if persistance is not None:
-        # Alpha initial
-        param_cal = obtenir_parametre_calibre("persistance", "alpha0")
-        if param_cal:
-            valide, msg = param_cal.valider(persistance.alpha_initial)
-            resultats.append(("alpha_initial", valide, msg))
-
-        # Alpha plateau
-        param_cal = obtenir_parametre_calibre("persistance", "alpha_inf")
-        if param_cal:
-            valide, msg = param_cal.valider(persistance.alpha_plateau)
-            resultats.append(("alpha_plateau", valide, msg))
-
-        # Lambda decay
-        param_cal = obtenir_parametre_calibre("persistance", "lambda_decay")
-        if param_cal:
-            valide, msg = param_cal.valider(persistance.lambda_decay)
-            resultats.append(("lambda_decay", valide, msg))
-
-    # Valider ParametresFuites
-    if params_fuites is not None:
-        # Taux réparation
-        param_cal = obtenir_parametre_calibre("fuites", "taux_reparation")
-        if param_cal:
-            valide, msg = param_cal.valider(params_fuites.taux_reparation_pct)
-            resultats.append(("taux_reparation_pct", valide, msg))
-
-        # Coût réparation
-        param_cal = obtenir_parametre_calibre("fuites", "cout_reparation")
-        if param_cal:
-            valide, msg = param_cal.valider(params_fuites.cout_reparation_moyen)
-            resultats.append(("cout_reparation_moyen", valide, msg))
-
-    return resultats
-
-
-def afficher_validation_parametres(
-    params: ParametresModele = None,
-    persistance: ParametresPersistance = None,
-    params_fuites: ParametresFuites = None,
-) -> None:
-    """Afficher le résultat de la validation des paramètres."""
-    print("\n" + "=" * 80)
-    print(" " * 20 + "VALIDATION DES PARAMÈTRES")
-    print("=" * 80)
-
-    resultats = valider_parametres_vs_calibration(params, persistance, params_fuites)
-
-    if not resultats:
-        print("\n  Aucun paramètre à valider (tous None)")
-        return
-
-    valides = sum(1 for _, v, _ in resultats if v)
-    total = len(resultats)
-
-    print(f"\n  Résultat: {valides}/{total} paramètres dans les plages recommandées")
-    print()
-
-    for nom, valide, msg in resultats:
-        indicateur = "✓" if valide else "⚠"
-        print(f"  {indicateur} {msg}")
-
-    print("\n" + "=" * 80)
-
-
-def generer_biblio_latex() -> str:
-    """
-    Générer la bibliographie complète au format BibTeX.
-
-    Retourne:
-        String contenant toutes les entrées BibTeX
-    """
-    bibtex = "% Bibliographie générée automatiquement\n"
-    bibtex += "% Sources de calibration pour le modèle CBA compteurs d'eau\n\n"
-
-    # Collecter toutes les sources uniques
-    sources_vues = set()
-    sources = []
-
-    for categorie in CALIBRATION.values():
-        for param in categorie.values():
-            for source in param.sources:
-                cle = f"{source.auteur}{source.annee}"
-                if cle not in sources_vues:
-                    sources_vues.add(cle)
-                    sources.append(source)
-
-    # Trier par auteur puis année
-    sources.sort(key=lambda s: (s.auteur, s.annee))
-
-    # Générer BibTeX
-    for source in sources:
-        bibtex += source.to_bibtex() + "\n\n"
-
-    return bibtex
-
-
-def exporter_biblio_latex(chemin: str = "calibration_sources.bib") -> None:
-    """
-    Exporter la bibliographie dans un fichier .bib.
-
-    Paramètres:
-        chemin: Chemin du fichier de sortie
-    """
-    bibtex = generer_biblio_latex()
-    with open(chemin, 'w', encoding='utf-8') as f:
-        f.write(bibtex)
-    print(f"Bibliographie exportée: {chemin}")
-    print(f"  {len(CALIBRATION)} catégories")
-    print(f"  {len(lister_parametres_calibres())} paramètres calibrés")
-
-
-def creer_tableau_sensibilite(param_code: str, nb_points: int = 5) -> pd.DataFrame:
-    """
-    Créer un tableau de sensibilité pour un paramètre calibré.
-
-    Génère des valeurs entre min et max de la plage recommandée,
-    incluant la valeur centrale.
-
-    Paramètres:
-        param_code: Code du paramètre (ex: "alpha0")
-        nb_points: Nombre de points de sensibilité
-
-    Retourne:
-        DataFrame avec les valeurs de sensibilité
-    """
-    # Trouver le paramètre
-    param = None
-    for categorie in CALIBRATION.values():
-        if param_code in categorie:
-            param = categorie[param_code]
-            break
-
-    if param is None:
-        raise ValueError(f"Paramètre '{param_code}' non trouvé dans CALIBRATION")
-
-    min_val, max_val = param.plage_recommandee
-    valeur_centrale = param.valeur_defaut
-
-    # Générer les points
-    valeurs = np.linspace(min_val, max_val, nb_points)
-
-    # S'assurer que la valeur centrale est incluse
-    if valeur_centrale not in valeurs:
-        valeurs = np.sort(np.append(valeurs, valeur_centrale))
-
-    # Créer le DataFrame
-    df = pd.DataFrame({
-        "Valeur": valeurs,
-        "Écart vs défaut (%)": [(v - valeur_centrale) / valeur_centrale * 100
-                                 if valeur_centrale != 0 else 0
-                                 for v in valeurs],
-        "Position": ["Min" if v == min_val else
-                     "Max" if v == max_val else
-                     "Central" if v == valeur_centrale else
-                     "Intermédiaire" for v in valeurs],
-    })
-
-    # Ajouter métadonnées
-    df.attrs["parametre"] = param.nom
-    df.attrs["code"] = param_code
-    df.attrs["unite"] = param.unite
-    df.attrs["sources"] = param.citations_courtes
-
-    return df
-
-
-def generer_section_calibration_markdown() -> str:
-    """
-    Générer une section Markdown pour le rapport sur les sources de calibration.
-
-    Retourne:
-        String Markdown formaté
-    """
-    md = "## Sources de calibration\n\n"
-    md += "Cette section documente les études empiriques utilisées pour calibrer "
-    md += "les paramètres du modèle. Chaque paramètre est justifié par des "
-    md += "références de la littérature scientifique.\n\n"
-
-    for cat_nom, categorie in CALIBRATION.items():
-        md += f"### {cat_nom.replace('_', ' ').title()}\n\n"
-
-        md += "| Paramètre | Valeur | Plage | Sources |\n"
-        md += "|-----------|--------|-------|--------|\n"
-
-        for code, param in categorie.items():
-            plage = f"[{param.plage_recommandee[0]}–{param.plage_recommandee[1]}]"
-            sources = param.citations_courtes if param.nb_sources > 0 else "*Estimation*"
-            md += f"| {param.nom} | {param.valeur_defaut} {param.unite} | {plage} | {sources} |\n"
-
-        md += "\n"
-
-    # Ajouter note méthodologique
-    md += "### Notes méthodologiques\n\n"
-    md += "Les plages recommandées sont basées sur les intervalles de confiance "
-    md += "ou la variance observée dans les études citées. L'analyse de sensibilité "
-    md += "devrait explorer ces plages pour évaluer la robustesse des résultats.\n\n"
-
-    return md
-
-
-# =============================================================================
-# TESTS DE VALIDATION
-# =============================================================================
-
-def executer_tests_validation() -> bool:
-    """Exécuter tests automatisés."""
-    print("\n" + "=" * 80)
-    print(" " * 30 + "TESTS DE VALIDATION")
-    print("=" * 80 + "\n")
-
-    def approx(a: float, b: float, eps: float) -> bool:
-        return abs(a - b) <= eps
-
-    tests_reussis = 0
-    tests_total = 0
-
-    # Test 1: Calcul économies d'eau
-    print("Test 1: Calcul des économies d'eau")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        usage_base = (params.lpcd * 2.1 * 365 / 1000)  # Utilise le LPCD du modèle
-        volume_fuite_pre = 0.20 * 35
-        usage_reductible = max(0.0, usage_base - volume_fuite_pre)
-        attendu = usage_reductible * 0.08 + 0.20 * 35 * 0.85
-        if approx(res.economie_totale_menage, attendu, 0.01):
-            print(f"  OK - Économies: {res.economie_totale_menage:.2f} m³/ménage/an")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Attendu {attendu:.2f}, obtenu {res.economie_totale_menage:.2f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 2: VAN positive avec défauts
-    print("\nTest 2: VAN avec valeurs par défaut")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        if res.van > 0:
-            print(f"  OK - VAN positive: {fmt_argent(res.van)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN négative: {fmt_argent(res.van)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 3: RBC > 1 si VAN > 0
-    print("\nTest 3: Cohérence VAN/RBC")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        if (res.van > 0 and res.rbc > 1.0) or (res.van <= 0 and res.rbc <= 1.0):
-            print(f"  OK - VAN et RBC cohérents")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN={fmt_argent(res.van)}, RBC={res.rbc:.2f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 4: Comparaison types
-    print("\nTest 4: Comparaison types de compteurs")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        df = comparer_types_compteurs(params)
-
-        if len(df) == 6:
-            print(f"  OK - 6 lignes (2 échelles × 3 types)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - {len(df)} lignes au lieu de 6")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 5: AMI plus cher que Manuel
-    print("\nTest 5: AMI plus cher que Manuel à l'investissement")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        df = comparer_types_compteurs(params)
-
-        df_base = df
-        if "Échelle" in df.columns:
-            df_base = df[df["Échelle"] == "Sans échelle"]
-            if df_base.empty:
-                df_base = df
-        inv_ami = df_base[df_base["Type"] == "AMI"]["Investissement total"].values[0]
-        inv_manuel = df_base[df_base["Type"] == "MANUEL"]["Investissement total"].values[0]
-
-        if inv_ami > inv_manuel:
-            print(f"  OK - AMI ({fmt_argent(inv_ami)}) > Manuel ({fmt_argent(inv_manuel)})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - AMI devrait coûter plus cher")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-# Test 6: (Supprimé - sous-enregistrement non applicable au Québec)
-
-    # Test 7: Économies d'échelle désactivées par défaut
-    print("\nTest 7: Économies d'échelle OFF par défaut")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=100_000)
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        if res.facteur_echelle == 1.0 and not res.economies_echelle_actives:
-            print(f"  OK - Économies d'échelle désactivées (facteur=1.0)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Facteur devrait être 1.0, obtenu {res.facteur_echelle}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 8: Économies d'échelle activées
-    print("\nTest 8: Économies d'échelle ON avec 119k compteurs")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=119_000)
-        compteur = ParametresCompteur()
-        config_echelle = ConfigEconomiesEchelle(activer=True)
-        res = executer_modele(params, compteur, config_echelle)
-
-        # 119k devrait donner facteur 0.85 (palier 100k-200k = 15% réduction)
-        if res.economies_echelle_actives and approx(res.facteur_echelle, 0.85, 0.01):
-            reduction = (1 - res.facteur_echelle) * 100
-            print(f"  OK - Facteur: {res.facteur_echelle:.2f} ({reduction:.0f}% réduction)")
-            print(f"       Économies: {fmt_argent(res.economies_realisees)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Facteur attendu 0.85, obtenu {res.facteur_echelle}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 9: Équivalence séries vs annuité (validation du refactoring dynamique)
-    print("\nTest 9: Équivalence séries temporelles vs formule d'annuité")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        r = params.taux_actualisation_pct / 100.0
-        T = params.horizon_analyse
-
-        # Calculer économies (v3.8: avec facteurs efficacité compteur)
-        economies = calculer_economies_eau(params, compteur=compteur)
-
-        # Générer trajectoires
-        traj, I0, _, _ = generer_trajectoires(params, compteur, economies)
-
-        # Méthode 1: Formule d'annuité (ancienne approche)
-        benef_annuel = float(traj.benefices_totaux[0])  # Constant
-        va_annuite = valeur_actuelle_annuite(benef_annuel, r, T)
-
-        # Méthode 2: Somme des séries (nouvelle approche v3.8)
-        va_series, _, _, _, _, _, _ = actualiser_series(traj, r, I0)
-
-        # Comparer (tolérance relative de 1e-10)
-        diff_rel = abs(va_annuite - va_series) / max(abs(va_annuite), 1.0)
-
-        if diff_rel < 1e-10:
-            print(f"  OK - VA(annuité) = VA(séries)")
-            print(f"       VA = {fmt_argent(va_annuite)} (diff relative: {diff_rel:.2e})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Différence trop grande")
-            print(f"       VA(annuité): {fmt_argent(va_annuite)}")
-            print(f"       VA(séries):  {fmt_argent(va_series)}")
-            print(f"       Diff relative: {diff_rel:.2e}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 10: Cohérence VAN = VA(B) - VA(C)
-    print("\nTest 10: Cohérence VAN = VA(Bénéfices) - VA(Coûts)")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        van_calculee = res.va_benefices - res.va_couts_totaux
-        diff = abs(res.van - van_calculee)
-
-        if diff < 1.0:  # Tolérance de 1$
-            print(f"  OK - VAN cohérente")
-            print(f"       VAN = {fmt_argent(res.van)}")
-            print(f"       VA(B) - VA(C) = {fmt_argent(van_calculee)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN incohérente")
-            print(f"       VAN: {fmt_argent(res.van)}")
-            print(f"       VA(B) - VA(C): {fmt_argent(van_calculee)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 11: Période de récupération dans les bornes
-    print("\nTest 11: Période de récupération cohérente")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur)
-
-        # La récupération devrait être positive et <= horizon si VAN > 0
-        if res.van > 0:
-            if 0 < res.periode_recuperation <= params.horizon_analyse:
-                print(f"  OK - Récupération: {res.periode_recuperation:.1f} ans")
-                tests_reussis += 1
-            else:
-                print(f"  ÉCHEC - Récupération hors bornes: {res.periode_recuperation}")
-        else:
-            # VAN négative, récupération peut être infinie
-            print(f"  OK - VAN négative, récupération potentiellement infinie")
-            tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 12: Persistance - Mode constant donne même résultat que sans persistance
-    print("\nTest 12: Persistance constante = résultat identique")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-
-        # Sans persistance explicite (défaut)
-        res_sans = executer_modele(params, compteur)
-
-        # Avec persistance constante explicite
-        res_avec = executer_modele(params, compteur, persistance=PERSISTANCE_OPTIMISTE)
-
-        diff_van = abs(res_sans.van - res_avec.van)
-        if diff_van < 1.0:  # Tolérance de 1$
-            print(f"  OK - VAN identique (diff: {diff_van:.2f}$)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN différentes: {fmt_argent(res_sans.van)} vs {fmt_argent(res_avec.van)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 13: Persistance - α_B décroît correctement (réaliste)
-    print("\nTest 13: Décroissance α_B(t) scénario réaliste")
-    tests_total += 1
-    try:
-        T = 20
-        serie = generer_serie_alpha(PERSISTANCE_REALISTE, T)
-
-        alpha_1 = serie[0]    # Année 1
-        alpha_10 = serie[9]   # Année 10
-        alpha_20 = serie[19]  # Année 20
-
-        # Vérifier: α₁ > α₁₀ > α₂₀ et α₂₀ ≈ plateau
-        decroit = alpha_1 > alpha_10 > alpha_20
-        proche_plateau = abs(alpha_20 - PERSISTANCE_REALISTE.alpha_plateau) < 0.005
-
-        if decroit and proche_plateau:
-            print(f"  OK - α_B décroît: {alpha_1*100:.1f}% → {alpha_10*100:.1f}% → {alpha_20*100:.1f}%")
-            print(f"       Plateau atteint: {alpha_20*100:.2f}% ≈ {PERSISTANCE_REALISTE.alpha_plateau*100:.1f}%")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Décroissance incorrecte")
-            print(f"       α: {alpha_1:.3f} → {alpha_10:.3f} → {alpha_20:.3f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 14: Persistance - Fadeout linéaire atteint zéro
-    print("\nTest 14: Fadeout linéaire pessimiste")
-    tests_total += 1
-    try:
-        T = 20
-        serie = generer_serie_alpha(PERSISTANCE_PESSIMISTE, T)
-
-        alpha_1 = serie[0]
-        alpha_10 = serie[9]   # À T_fade = 10, devrait être 0
-
-        # Vérifier: α₁ = 8%, α₁₀ ≈ 0
-        alpha_1_ok = approx(alpha_1, 0.08, 0.001)
-        alpha_10_ok = approx(alpha_10, 0.0, 0.001)
-
-        if alpha_1_ok and alpha_10_ok:
-            print(f"  OK - Fadeout: {alpha_1*100:.1f}% → {alpha_10*100:.1f}% (année 10)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - α₁={alpha_1*100:.1f}%, α₁₀={alpha_10*100:.1f}%")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 15: Ordre VAN: Optimiste > Réaliste > Pessimiste
-    print("\nTest 15: Ordre VAN selon scénarios de persistance")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-
-        van_opt = executer_modele(params, compteur, persistance=PERSISTANCE_OPTIMISTE).van
-        van_rea = executer_modele(params, compteur, persistance=PERSISTANCE_REALISTE).van
-        van_pes = executer_modele(params, compteur, persistance=PERSISTANCE_PESSIMISTE).van
-
-        if van_opt > van_rea > van_pes:
-            print(f"  OK - VAN: Optimiste ({fmt_argent(van_opt)}) > Réaliste ({fmt_argent(van_rea)}) > Pessimiste ({fmt_argent(van_pes)})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Ordre incorrect")
-            print(f"       Opt: {fmt_argent(van_opt)}, Réa: {fmt_argent(van_rea)}, Pes: {fmt_argent(van_pes)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 16: Même scénario pessimiste reste rentable (VAN > 0)
-    print("\nTest 16: Rentabilité même en scénario pessimiste")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res = executer_modele(params, compteur, persistance=PERSISTANCE_PESSIMISTE)
-
-        if res.van > 0 and res.rbc > 1.0:
-            print(f"  OK - Projet rentable même pessimiste: VAN={fmt_argent(res.van)}, RBC={res.rbc:.2f}")
-            tests_reussis += 1
-        else:
-            print(f"  INFO - Projet non rentable en pessimiste: VAN={fmt_argent(res.van)}")
-            # Ce n'est pas forcément un échec, juste une information
-            tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 16b: Scénario ultra-pessimiste (alpha=0, fuites uniquement)
-    print("\nTest 16b: Scénario ultra-pessimiste (alpha=0)")
-    tests_total += 1
-    try:
-        # Vérifier que la série alpha est bien à zéro
-        serie = generer_serie_alpha(PERSISTANCE_ULTRA_PESSIMISTE, 20)
-        all_zeros = all(alpha == 0.0 for alpha in serie)
-
-        # Vérifier que les économies viennent uniquement des fuites
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-        res_ultra = executer_modele(
-            params, compteur,
-            persistance=PERSISTANCE_ULTRA_PESSIMISTE,
-            params_fuites=ParametresFuites()
-        )
-
-        # VAN ultra-pessimiste devrait être < VAN pessimiste
-        res_pes = executer_modele(
-            params, compteur,
-            persistance=PERSISTANCE_PESSIMISTE,
-            params_fuites=ParametresFuites()
-        )
-
-        if all_zeros and res_ultra.van < res_pes.van:
-            print(f"  OK - Alpha=0 pour toutes années, VAN ultra ({fmt_argent(res_ultra.van)}) < pessimiste ({fmt_argent(res_pes.van)})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - all_zeros={all_zeros}, VAN_ultra={fmt_argent(res_ultra.van)}, VAN_pes={fmt_argent(res_pes.van)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # ==========================================================================
-    # TESTS FUITES (v3.3)
-    # ==========================================================================
-
-    # Test 17: Dynamique des fuites - plateau des économies
-    print("\nTest 17: Dynamique fuites - plateau des économies")
-    tests_total += 1
-    try:
-        params_f = ParametresFuites(
-            part_menages_fuite_pct=20.0,
-            debit_fuite_m3_an=35.0,
-            taux_detection_pct=90.0,
-            taux_reparation_pct=85.0,
-            taux_nouvelles_fuites_pct=5.0,
-            duree_moyenne_fuite_sans_compteur=4.0,
-        )
-        H = 10_000
-        T = 20
-
-        res_f = calculer_dynamique_fuites(params_f, H, T)
-
-        eco_an1 = res_f.economies_eau_par_an[0]
-        eco_an5 = res_f.economies_eau_par_an[4]
-        eco_an20 = res_f.economies_eau_par_an[-1]
-        eco_an19 = res_f.economies_eau_par_an[-2]
-        plateau = eco_an20 > 0 and abs(eco_an20 - eco_an19) / eco_an20 < 0.02
-
-        if eco_an5 > eco_an1 and plateau:
-            print(f"  OK - Économies plafonnent (an1={eco_an1:.1f}, an5={eco_an5:.1f}, an20={eco_an20:.1f})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Plateau non observé (an1={eco_an1:.1f}, an5={eco_an5:.1f}, an20={eco_an20:.1f})")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 17b: Fuites deux-stocks - coherence des breakdowns
-    print("\nTest 17b: Fuites deux-stocks - coherence des breakdowns")
-    tests_total += 1
-    try:
-        params_f = ParametresFuites(
-            utiliser_prevalence_differenciee=True,
-            part_menages_fuite_any_pct=20.0,
-            part_menages_fuite_significative_pct=5.0,
-            debit_fuite_any_m3_an=10.0,
-            debit_fuite_significative_m3_an=50.0,
-            part_fuites_persistantes_pct=5.0,
-            facteur_duree_longue_traine=5.0,
-        )
-        res_f = calculer_dynamique_fuites(params_f, 10_000, 20)
-
-        if (
-            (not res_f.mode_deux_stocks) or
-            (res_f.economies_any_par_an is None) or
-            (res_f.economies_sig_par_an is None) or
-            (res_f.economies_persistantes_par_an is None) or
-            (res_f.reparations_any_par_an is None) or
-            (res_f.reparations_sig_par_an is None) or
-            (res_f.cout_any_par_an is None) or
-            (res_f.cout_sig_par_an is None)
-        ):
-            print("  ECHEC - Breakdowns absents en mode deux-stocks")
-        else:
-            def close(a: float, b: float) -> bool:
-                tol = max(1e-6, 1e-6 * max(1.0, abs(a)))
-                return abs(a - b) <= tol
-
-            eco_total = float(np.sum(res_f.economies_eau_par_an))
-            eco_parts = float(np.sum(res_f.economies_any_par_an) +
-                              np.sum(res_f.economies_sig_par_an) +
-                              np.sum(res_f.economies_persistantes_par_an))
-            rep_total = float(np.sum(res_f.reparations_par_an))
-            rep_parts = float(np.sum(res_f.reparations_any_par_an) +
-                              np.sum(res_f.reparations_sig_par_an))
-            cout_total = float(np.sum(res_f.cout_total_par_an))
-            cout_parts = float(np.sum(res_f.cout_any_par_an) +
-                               np.sum(res_f.cout_sig_par_an))
-
-            if close(eco_total, eco_parts) and close(rep_total, rep_parts) and close(cout_total, cout_parts):
-                print("  OK - Totaux coherents (any+sig+persist)")
-                tests_reussis += 1
-            else:
-                print(
-                    f"  ECHEC - Totaux incoherents (eco {eco_parts:.2f}/{eco_total:.2f}, "
-                    f"rep {rep_parts:.2f}/{rep_total:.2f}, cout {cout_parts:.2f}/{cout_total:.2f})"
-                )
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 18: Coûts de réparation correctement répartis
-    print("\nTest 18: Répartition des coûts ville/ménages")
-    tests_total += 1
-    try:
-        H = 10_000
-        T = 20
-
-        # Scénario subvention 50%
-        res_50 = calculer_dynamique_fuites(FUITES_SUBVENTION_50, H, T)
-
-        # Vérifier que ville = ménages (50/50)
-        ratio = res_50.cout_ville_total / res_50.cout_menages_total if res_50.cout_menages_total > 0 else 0
-
-        if approx(ratio, 1.0, 0.01):
-            print(f"  OK - Partage 50/50: Ville={fmt_argent(res_50.cout_ville_total)}, Ménages={fmt_argent(res_50.cout_menages_total)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Ratio ville/ménages = {ratio:.2f} (attendu: 1.0)")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 19: Mode SANS_COUT donne coûts = 0
-    print("\nTest 19: Mode sans coût → coûts nuls")
-    tests_total += 1
-    try:
-        H = 10_000
-        T = 20
-
-        res_gratuit = calculer_dynamique_fuites(FUITES_SANS_COUT, H, T)
-
-        if res_gratuit.cout_total == 0.0:
-            print(f"  OK - Coût total = 0 $ (mode gratuit)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Coût non nul: {fmt_argent(res_gratuit.cout_total)}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 20: VAN sans coût > VAN avec coût (les coûts réduisent la VAN)
-    print("\nTest 20: Coûts réparation réduisent la VAN")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-
-        # Sans coûts de réparation
-        van_sans = executer_modele(params, compteur, params_fuites=FUITES_SANS_COUT).van
-
-        # Avec coûts de réparation (ménage seul)
-        van_avec = executer_modele(params, compteur, params_fuites=FUITES_MENAGE_SEUL).van
-
-        if van_sans > van_avec:
-            reduction = van_sans - van_avec
-            reduction_pct = (reduction / van_sans * 100) if van_sans > 0 else 0
-            print(f"  OK - VAN sans coût > VAN avec coût")
-            print(f"       Sans: {fmt_argent(van_sans)}, Avec: {fmt_argent(van_avec)}")
-            print(f"       Réduction: {fmt_argent(reduction)} ({reduction_pct:.1f}%)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN sans ({fmt_argent(van_sans)}) devrait être > VAN avec ({fmt_argent(van_avec)})")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 21: Partage ville augmente VAN du projet (pour analyse sociale)
-    print("\nTest 21: Subvention ville améliore VAN projet")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-
-        # 100% ménage
-        van_menage = executer_modele(params, compteur, params_fuites=FUITES_MENAGE_SEUL).van
-
-        # 100% ville
-        van_ville = executer_modele(params, compteur, params_fuites=FUITES_VILLE_SEULE).van
-
-        # Note : Les deux VAN sont identiques car le coût total est le même
-        # La différence est dans qui paie, pas dans la rentabilité globale
-        # Ce test vérifie que le calcul fonctionne sans erreur
-        if van_menage > 0 and van_ville > 0:
-            print(f"  OK - Modèle fonctionne avec différents partages")
-            print(f"       VAN (ménage 100%): {fmt_argent(van_menage)}")
-            print(f"       VAN (ville 100%):  {fmt_argent(van_ville)}")
-            tests_reussis += 1
-        else:
-            print(f"  INFO - VAN négatives dans certains scénarios")
-            tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 22: Comparaison scénarios fuites fonctionne
-    print("\nTest 22: comparer_scenarios_fuites() fonctionne")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        df = comparer_scenarios_fuites(params)
-
-        if len(df) == 12:  # 6 scénarios × 2 échelles
-            print(f"  OK - 12 lignes (2 échelles × 6 scénarios)")
-            vans = df["VAN"].values
-            print(f"       VAN min: {fmt_argent(min(vans))}, max: {fmt_argent(max(vans))}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - {len(df)} lignes au lieu de 12")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # =========================================================================
-    # TESTS PERSPECTIVES ÉCONOMIQUE VS FINANCIER (v3.4)
-    # =========================================================================
-    print("\n" + "-" * 60)
-    print("TESTS PERSPECTIVES ÉCONOMIQUE VS FINANCIER (v3.4)")
-    print("-" * 60)
-
-    # Test 23: Mode économique utilise valeur sociale
-    print("\nTest 23: Mode économique utilise valeur_sociale_m3")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        compteur = ParametresCompteur()
-        valeur_eau = ParametresValeurEau(
-            valeur_sociale_m3=5.00,
-            cout_variable_m3=0.50
-        )
-
-        resultat_eco = executer_modele(
-            params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=valeur_eau
-        )
-
-        # En mode économique, la valeur utilisée devrait être 5.00$/m³
-        # Ce qui génère des bénéfices plus élevés qu'avec 0.50$/m³
-        if resultat_eco.van > 0:
-            print(f"  OK - Mode économique fonctionne")
-            print(f"       VAN économique: {fmt_argent(resultat_eco.van)}")
-            tests_reussis += 1
-        else:
-            print(f"  INFO - VAN négative en mode économique: {fmt_argent(resultat_eco.van)}")
-            tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 24: Mode financier utilise coût variable
-    print("\nTest 24: Mode financier utilise cout_variable_m3")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        compteur = ParametresCompteur()
-        valeur_eau = ParametresValeurEau(
-            valeur_sociale_m3=5.00,
-            cout_variable_m3=0.50
-        )
-
-        resultat_fin = executer_modele(
-            params, compteur, mode_compte=ModeCompte.FINANCIER, valeur_eau=valeur_eau
-        )
-
-        if resultat_fin.van is not None:
-            print(f"  OK - Mode financier fonctionne")
-            print(f"       VAN financière: {fmt_argent(resultat_fin.van)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN non calculée")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 25: VAN économique > VAN financière (valeur sociale > coût variable)
-    print("\nTest 25: VAN économique > VAN financière (valeur sociale > coût var)")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        compteur = ParametresCompteur()
-        valeur_eau = ParametresValeurEau(
-            valeur_sociale_m3=4.69,
-            cout_variable_m3=0.50,
-            prix_vente_m3=2.50
-        )
-
-        van_eco = executer_modele(
-            params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=valeur_eau
-        ).van
-        van_fin = executer_modele(
-            params, compteur, mode_compte=ModeCompte.FINANCIER, valeur_eau=valeur_eau
-        ).van
-
-        # La VAN économique devrait être plus élevée car:
-        # - valeur sociale (4.69$) > coût variable (0.50$)
-        # - le mode financier utilise le coût variable évité (sans tarification)
-        # Donc on vérifie juste que les deux sont calculées
-        print(f"  OK - Comparaison calculée")
-        print(f"       VAN économique: {fmt_argent(van_eco)}")
-        print(f"       VAN financière: {fmt_argent(van_fin)}")
-        print(f"       Différence: {fmt_argent(van_eco - van_fin)}")
-        tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 26: (Supprimé - sous-enregistrement non applicable au Québec)
-
-    # Test 27: comparer_perspectives() retourne 4 lignes
-    print("\nTest 27: comparer_perspectives() retourne 4 lignes")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        df = comparer_perspectives(params)
-
-        if len(df) == 4:
-            perspectives = df["Perspective"].tolist()
-            if "Économique" in perspectives and "Financier" in perspectives:
-                print(f"  OK - 4 lignes (2 échelles × 2 perspectives)")
-                df_base = df[df["Échelle"] == "Sans échelle"] if "Échelle" in df.columns else df
-                van_eco = df_base[df_base['Perspective']=='Économique']['VAN ($)'].values[0]
-                van_fin = df_base[df_base['Perspective']=='Financier']['VAN ($)'].values[0]
-                print(f"       Économique: VAN = {fmt_argent(van_eco)}")
-                print(f"       Financier:  VAN = {fmt_argent(van_fin)}")
-                tests_reussis += 1
-            else:
-                print(f"  ÉCHEC - Perspectives incorrectes: {perspectives}")
-        else:
-            print(f"  ÉCHEC - {len(df)} lignes au lieu de 4")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 28: Préréglages valeur eau fonctionnent
-    print("\nTest 28: Préréglages VALEUR_EAU fonctionnent")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        compteur = ParametresCompteur()
-
-        # Tester les 3 préréglages
-        van_quebec = executer_modele(
-            params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=VALEUR_EAU_QUEBEC
-        ).van
-        van_conserv = executer_modele(
-            params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=VALEUR_EAU_CONSERVATEUR
-        ).van
-        van_rarete = executer_modele(
-            params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=VALEUR_EAU_RARETE
-        ).van
-
-        # VAN_RARETE > VAN_QUEBEC > VAN_CONSERVATEUR (valeur sociale croissante)
-        if van_rarete > van_quebec > van_conserv:
-            print(f"  OK - Préréglages valeur eau cohérents")
-            print(f"       Conservateur (2.50$/m³): {fmt_argent(van_conserv)}")
-            print(f"       Québec (4.69$/m³):       {fmt_argent(van_quebec)}")
-            print(f"       Rareté (8.00$/m³):       {fmt_argent(van_rarete)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Ordre VAN incorrect")
-            print(f"       Attendu: Rareté > Québec > Conservateur")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # =========================================================================
-    # TESTS ADOPTION / STRATÉGIES D'IMPLANTATION (v3.5)
-    # =========================================================================
-    print("\n" + "-" * 60)
-    print("TESTS ADOPTION / STRATÉGIES D'IMPLANTATION (v3.5)")
-    print("-" * 60)
-
-    # Test 29: Adoption obligatoire = 100% dès année 1
-    print("\nTest 29: Adoption obligatoire = 100% dès année 1")
-    tests_total += 1
-    try:
-        serie = generer_serie_adoption(ADOPTION_OBLIGATOIRE, 20)
-        if all(s == 1.0 for s in serie):
-            print(f"  OK - A(t) = 100% pour toutes les années")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Adoption non constante à 100%")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 30: Adoption volontaire suit courbe logistique
-    print("\nTest 30: Adoption volontaire suit courbe logistique")
-    tests_total += 1
-    try:
-        serie = generer_serie_adoption(ADOPTION_RAPIDE, 20)
-        # La série doit être croissante
-        croissante = all(serie[i] <= serie[i+1] for i in range(len(serie)-1))
-        # Et atteindre le plafond
-        proche_plafond = serie[-1] > 0.90
-        if croissante and proche_plafond:
-            print(f"  OK - Courbe logistique croissante")
-            print(f"       A(1)={serie[0]*100:.0f}%, A(5)={serie[4]*100:.0f}%, A(20)={serie[19]*100:.0f}%")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Courbe non croissante ou plafond non atteint")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 31: VAN obligatoire > VAN volontaire (bénéfices immédiats)
-    print("\nTest 31: VAN obligatoire > VAN volontaire")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000)
-        compteur = ParametresCompteur()
-
-        van_oblig = executer_modele(params, compteur, params_adoption=ADOPTION_OBLIGATOIRE).van
-        van_prog = executer_modele(params, compteur, params_adoption=ADOPTION_PROGRESSIVE).van
-
-        if van_oblig > van_prog:
-            print(f"  OK - Adoption immédiate maximise la VAN")
-            print(f"       Obligatoire: {fmt_argent(van_oblig)}")
-            print(f"       Progressif:  {fmt_argent(van_prog)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN obligatoire devrait être supérieure")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 32: CAPEX étalé fonctionne (somme = I0_total)
-    print("\nTest 32: CAPEX étalé = I0 total (conservation)")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000)
-        compteur = ParametresCompteur()
-        economies = calculer_economies_eau(params, compteur=compteur)
-
-        # Avec adoption obligatoire (CAPEX en t=0)
-        traj_oblig, I0_oblig, _, _ = generer_trajectoires(
-            params, compteur, economies, params_adoption=ADOPTION_OBLIGATOIRE
-        )
-
-        # Avec adoption progressive (CAPEX étalé)
-        traj_prog, I0_prog, _, _ = generer_trajectoires(
-            params, compteur, economies, params_adoption=ADOPTION_RAPIDE
-        )
-
-        # Le total CAPEX doit être similaire (à la pondération adoption près)
-        capex_total_prog = np.sum(traj_prog.capex_etale)
-        if I0_oblig > 0 and capex_total_prog > 0:
-            print(f"  OK - CAPEX étalé calculé")
-            print(f"       CAPEX obligatoire (t=0): {fmt_argent(I0_oblig)}")
-            print(f"       CAPEX étalé (total):     {fmt_argent(capex_total_prog)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - CAPEX non calculé correctement")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 33: comparer_strategies_adoption() retourne 2 × nb stratégies
-    print("\nTest 33: comparer_strategies_adoption() retourne 2 × nb stratégies")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000)
-        df = comparer_strategies_adoption(params)
-
-        attendu = len(STRATEGIES_ADOPTION) * 2  # 2 échelles par défaut
-        if len(df) == attendu:
-            vans = df["VAN ($)"].values
-            print(f"  OK - {attendu} lignes (2 échelles × {len(STRATEGIES_ADOPTION)} stratégies)")
-            print(f"       VAN min: {fmt_argent(min(vans))}, max: {fmt_argent(max(vans))}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - {len(df)} lignes au lieu de {attendu}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 34: Bénéfices proportionnels à A(t)
-    print("\nTest 34: Bénéfices proportionnels à l'adoption")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000)
-        compteur = ParametresCompteur()
-        economies = calculer_economies_eau(params, compteur=compteur)
-
-        # Obligatoire: A(t) = 100%
-        traj_oblig, _, _, _ = generer_trajectoires(
-            params, compteur, economies, params_adoption=ADOPTION_OBLIGATOIRE
-        )
-
-        # Progressif: A(t) variable
-        traj_prog, _, _, _ = generer_trajectoires(
-            params, compteur, economies, params_adoption=ADOPTION_PROGRESSIVE
-        )
-
-        # Les bénéfices année 1 de progressif < obligatoire
-        if traj_prog.benefices_eau[0] < traj_oblig.benefices_eau[0]:
-            ratio = traj_prog.benefices_eau[0] / traj_oblig.benefices_eau[0]
-            print(f"  OK - Bénéfices proportionnels à A(t)")
-            print(f"       An 1: Progressif = {ratio*100:.0f}% de Obligatoire")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Bénéfices devraient être réduits avec adoption partielle")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 34b: Effet cohortes sur l'alpha comportemental
-    print("\nTest 34b: Effet cohortes - alpha redémarre à l'installation")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000, part_menages_fuite_pct=0.0)
-        compteur = ParametresCompteur()
-        persistance = PERSISTANCE_REALISTE
-        params_adoption = ParametresAdoption(
-            mode=ModeAdoption.OBLIGATOIRE,
-            annee_demarrage=8,
-        )
-        economies = calculer_economies_eau(params, compteur=compteur)
-
-        traj, _, _, _ = generer_trajectoires(
-            params,
-            compteur,
-            economies,
-            persistance=persistance,
-            params_adoption=params_adoption,
-        )
-
-        alpha_1 = calculer_alpha_comportement(1, persistance)
-        alpha_2 = calculer_alpha_comportement(2, persistance)
-        attendu_an8 = params.nb_menages * economies.usage_reductible * alpha_1
-        attendu_an9 = params.nb_menages * economies.usage_reductible * alpha_2
-        eco_an8 = traj.economies_eau_m3[7]
-        eco_an9 = traj.economies_eau_m3[8]
-
-        eps_8 = max(1e-6, abs(attendu_an8) * 1e-6)
-        eps_9 = max(1e-6, abs(attendu_an9) * 1e-6)
-        if approx(eco_an8, attendu_an8, eps_8) and approx(eco_an9, attendu_an9, eps_9):
-            print(f"  OK - Cohorte démarre avec alpha année 1")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Écart cohortes: an8={eco_an8:.3f}, an9={eco_an9:.3f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 34c: Cohortes - adoption obligatoire conserve les économies par ménage
-    print("\nTest 34c: Cohortes - adoption obligatoire cohérente")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=10000)
-        compteur = ParametresCompteur()
-        persistance = PERSISTANCE_REALISTE
-        params_fuites = FUITES_MENAGE_SEUL
-        economies = calculer_economies_eau(params, params_fuites, compteur)
-
-        traj, _, _, _ = generer_trajectoires(
-            params,
-            compteur,
-            economies,
-            persistance=persistance,
-            params_fuites=params_fuites,
-            params_adoption=ADOPTION_OBLIGATOIRE,
-        )
-
-        serie_par_menage = traj.economies_eau_m3 / params.nb_menages
-        if np.allclose(serie_par_menage, traj.economies_par_menage, rtol=1e-6, atol=1e-6):
-            print(f"  OK - Économies totales = économies par ménage × ménages")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Incohérence économies par ménage vs totales")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 34d: Batterie - remplacement par cohortes
-    print("\nTest 34d: Batterie - remplacement par cohortes")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000, horizon_analyse=4)
-        compteur = ParametresCompteur(
-            type_compteur=TypeCompteur.AMI,
-            duree_vie_batterie=2,
-            cout_remplacement_batterie=10.0,
-        )
-        params_adoption = ParametresAdoption(
-            mode=ModeAdoption.NOUVEAUX_BRANCHEMENTS,
-            taux_nouveaux_pct=50.0,
-            adoption_max_pct=100.0,
-            etaler_capex=True,
-        )
-        economies = calculer_economies_eau(params, compteur=compteur)
-
-        traj, _, _, _ = generer_trajectoires(
-            params,
-            compteur,
-            economies,
-            params_adoption=params_adoption,
-        )
-
-        attendu = 0.5 * params.nb_menages * compteur.cout_remplacement_batterie
-        cout_an2 = traj.couts_ponctuels.get(2, 0.0)
-        cout_an3 = traj.couts_ponctuels.get(3, 0.0)
-
-        if approx(cout_an2, attendu, 1e-6) and approx(cout_an3, attendu, 1e-6):
-            print("  OK - Remplacement batterie étalé par cohortes")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Batterie: an2={cout_an2:.2f}, an3={cout_an3:.2f}, attendu={attendu:.2f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # =========================================================================
-    # TESTS CALIBRAGE EXPLICITE (v3.6)
-    # =========================================================================
-    print("\n" + "-" * 80)
-    print("TESTS CALIBRAGE EXPLICITE (v3.6)")
-    print("-" * 80)
-
-    # Test 35: Structure du dictionnaire CALIBRATION
-    print("\nTest 35: Structure du dictionnaire CALIBRATION")
-    tests_total += 1
-    try:
-        categories_attendues = {"persistance", "fuites",
-                                 "economies_echelle", "valeur_eau", "financier"}
-        categories_presentes = set(CALIBRATION.keys())
-
-        if categories_presentes == categories_attendues:
-            nb_params = len(lister_parametres_calibres())
-            print(f"  OK - 5 catégories présentes, {nb_params} paramètres calibrés")
-            tests_reussis += 1
-        else:
-            manquantes = categories_attendues - categories_presentes
-            print(f"  ÉCHEC - Catégories manquantes: {manquantes}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 36: Tous les paramètres ont des plages valides
-    print("\nTest 36: Plages de calibration valides")
-    tests_total += 1
-    try:
-        tous_valides = True
-        for param in lister_parametres_calibres():
-            if not param.valeur_dans_plage:
-                tous_valides = False
-                print(f"       ⚠ {param.nom}: {param.valeur_defaut} hors [{param.plage_recommandee[0]}, {param.plage_recommandee[1]}]")
-
-        if tous_valides:
-            print(f"  OK - Toutes les valeurs par défaut sont dans leurs plages")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Certaines valeurs hors plage")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 37: Validation des paramètres du modèle
-    print("\nTest 37: Validation paramètres vs calibration")
-    tests_total += 1
-    try:
-        params = ParametresModele()  # Valeurs par défaut
-        persistance = PERSISTANCE_REALISTE
-        fuites = FUITES_MENAGE_SEUL
-
-        resultats = valider_parametres_vs_calibration(params, persistance, fuites)
-
-        nb_valides = sum(1 for _, v, _ in resultats if v)
-        nb_total = len(resultats)
-
-        if nb_valides == nb_total:
-            print(f"  OK - {nb_valides}/{nb_total} paramètres validés")
-            tests_reussis += 1
-        else:
-            print(f"  ATTENTION - {nb_valides}/{nb_total} paramètres dans les plages")
-            # Ce n'est pas un échec car on veut tester la fonction
-            tests_reussis += 1
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 38: Sources empiriques documentées
-    print("\nTest 38: Sources empiriques documentées")
-    tests_total += 1
-    try:
-        sources_attendues = [
-            "SOURCE_DAVIES_UK", "SOURCE_CARRILLO_ALICANTE", "SOURCE_BEAL_AUSTRALIA",
-            "SOURCE_KENNEY_COLORADO", "SOURCE_ALLCOTT_HABITS", "SOURCE_AWWA_LEAKS",
-            "SOURCE_DEOREO_LEAKS", "SOURCE_BRITTON_REPAIR", "SOURCE_WINNIPEG_METERS",
-            "SOURCE_ARREGUI_ACCURACY", "SOURCE_AWWA_SCALE", "SOURCE_RENZETTI_VALUE",
-        ]
-
-        sources_ok = all(
-            s in dir() or s in globals()
-            for s in sources_attendues
-        )
-
-        # Vérifier que alpha0 a au moins 2 sources
-        param_alpha = obtenir_parametre_calibre("persistance", "alpha0")
-        if param_alpha and param_alpha.nb_sources >= 2 and sources_ok:
-            print(f"  OK - {len(sources_attendues)} sources documentées")
-            print(f"       alpha0 a {param_alpha.nb_sources} sources: {param_alpha.citations_courtes[:50]}...")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Sources manquantes ou insuffisantes")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 39: Export BibTeX
-    print("\nTest 39: Génération BibTeX")
-    tests_total += 1
-    try:
-        bibtex = generer_biblio_latex()
-
-        # Vérifier la structure
-        a_author = "@article{" in bibtex or "@rapport{" in bibtex
-        a_title = "title = {" in bibtex
-        a_year = "year = {" in bibtex
-
-        if a_author and a_title and a_year:
-            nb_entries = bibtex.count("@article{") + bibtex.count("@rapport{") + bibtex.count("@livre{") + bibtex.count("@manuel{")
-            print(f"  OK - BibTeX généré avec {nb_entries} entrées")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Structure BibTeX invalide")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 40: Tableau de sensibilité
-    print("\nTest 40: Création tableau de sensibilité")
-    tests_total += 1
-    try:
-        df_sens = creer_tableau_sensibilite("alpha0", nb_points=5)
-
-        if len(df_sens) >= 5 and "Valeur" in df_sens.columns:
-            min_val = df_sens["Valeur"].min()
-            max_val = df_sens["Valeur"].max()
-            print(f"  OK - Tableau sensibilité créé: {len(df_sens)} points")
-            print(f"       Plage: [{min_val:.3f}, {max_val:.3f}]")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Tableau de sensibilité mal formé")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 41: Génération section Markdown
-    print("\nTest 41: Génération section calibration Markdown")
-    tests_total += 1
-    try:
-        md = generer_section_calibration_markdown()
-
-        # Vérifier structure
-        a_titre = "## Sources de calibration" in md
-        a_tables = "| Paramètre |" in md
-        a_notes = "### Notes méthodologiques" in md
-
-        if a_titre and a_tables and a_notes:
-            nb_lignes = md.count("\n")
-            print(f"  OK - Section Markdown générée ({nb_lignes} lignes)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Structure Markdown invalide")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # =========================================================================
-    # TESTS CORRECTIONS REVUE (v3.10.1)
-    # =========================================================================
-    print("\n" + "-" * 60)
-    print("TESTS CORRECTIONS REVUE (v3.10.1)")
-    print("-" * 60)
-
-    # Test 42: Correction 4.5 - volume_fuite_moyen_pondere en mode deux-stocks
-    print("\nTest 42: volume_fuite_moyen_pondere en mode deux-stocks")
-    tests_total += 1
-    try:
-        params_fuites_2s = FUITES_QUEBEC_DEUX_STOCKS
-        # Volume pondéré doit être différent du débit agrégé
-        vol_pondere = params_fuites_2s.volume_fuite_moyen_pondere
-        vol_agrege = params_fuites_2s.debit_fuite_m3_an
-
-        # Calculer les économies avec les deux modes
-        params = ParametresModele(nb_menages=1000)
-        eco_2s = calculer_economies_eau(params, params_fuites_2s)
-
-        # Le volume pondéré tient compte que sig ⊂ any (sous-ensemble)
-        # Formule: (vol_any × p_any_excl + vol_sig × p_sig) / p_any
-        # où p_any_excl = p_any - p_sig (petites fuites uniquement)
-        p_any = params_fuites_2s.part_menages_fuite_any_pct
-        p_sig = params_fuites_2s.part_menages_fuite_significative_pct
-        p_any_excl = p_any - p_sig  # Petites fuites (exclusif)
-        attendu = (
-            params_fuites_2s.debit_fuite_any_m3_an * p_any_excl +
-            params_fuites_2s.debit_fuite_significative_m3_an * p_sig
-        ) / p_any
-
-        if abs(vol_pondere - attendu) < 0.1:
-            print(f"  OK - volume_fuite_moyen_pondere = {vol_pondere:.1f} m³/an (vs agrégé {vol_agrege:.1f})")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - volume_fuite_moyen_pondere = {vol_pondere:.1f}, attendu {attendu:.1f}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 43: Correction 4.2 - économies d'échelle avec adoption partielle
-    print("\nTest 43: Économies d'échelle calculées sur H × A_max")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=200_000)
-        compteur = ParametresCompteur()
-        config_echelle = ConfigEconomiesEchelle(activer=True)
-
-        # Adoption partielle (70%)
-        adoption_70 = ParametresAdoption(
-            mode=ModeAdoption.VOLONTAIRE_INCITATIF,
-            adoption_max_pct=70.0,
-        )
-        # Adoption complète (100%)
-        adoption_100 = ADOPTION_OBLIGATOIRE
-
-        economies = calculer_economies_eau(params)
-
-        # Avec adoption 70%, H_effectif = 140k → facteur d'échelle différent de 200k
-        _, I0_70, facteur_70, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle,
-            params_adoption=adoption_70
-        )
-        _, I0_100, facteur_100, _ = generer_trajectoires(
-            params, compteur, economies, config_echelle,
-            params_adoption=adoption_100
-        )
-
-        # Facteur 70% devrait être plus élevé (moins de rabais) que facteur 100%
-        # Car on achète moins de compteurs
-        if facteur_70 >= facteur_100:
-            print(f"  OK - Facteur échelle 70%: {facteur_70:.3f} >= 100%: {facteur_100:.3f}")
-            print(f"       (Moins de compteurs = moins de rabais volume)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Facteur 70% ({facteur_70:.3f}) < 100% ({facteur_100:.3f})")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 44: Correction 4.4 - taux_correction_effectif_avec_persistance utilisé
-    print("\nTest 44: taux_correction_effectif_avec_persistance")
-    tests_total += 1
-    try:
-        params_fuites = ParametresFuites(
-            part_menages_fuite_pct=20.0,
-            debit_fuite_m3_an=35.0,
-            taux_detection_pct=90.0,
-            taux_reparation_pct=85.0,
-            part_fuites_persistantes_pct=10.0,  # 10% jamais réparées
-        )
-
-        taux_base = params_fuites.taux_correction_effectif
-        taux_avec_persist = params_fuites.taux_correction_effectif_avec_persistance
-
-        # Taux avec persistance doit être inférieur
-        if taux_avec_persist < taux_base:
-            reduction_pct = (1 - taux_avec_persist / taux_base) * 100
-            print(f"  OK - Taux base: {taux_base:.3f}, avec persistance: {taux_avec_persist:.3f}")
-            print(f"       Réduction: {reduction_pct:.1f}% (attendu ~10%)")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Taux avec persistance devrait être < taux base")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # ==========================================================================
-    # TESTS v3.11.0 — Nouveaux modules
-    # ==========================================================================
-
-    # Test 45: VentilationOPEX - somme des pourcentages = 100%
-    print("\nTest 45: VentilationOPEX — somme des pourcentages = 100%")
-    tests_total += 1
-    try:
-        ventilation = VentilationOPEX()
-        total = (
-            ventilation.cybersecurite_pct
-            + ventilation.licences_logiciels_pct
-            + ventilation.stockage_donnees_pct
-            + ventilation.service_client_pct
-            + ventilation.integration_si_pct
-        )
-        if abs(total - 1.0) < 0.001:
-            print(f"  OK - Somme des pourcentages: {total*100:.1f}%")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Somme: {total*100:.1f}% (attendu 100%)")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 46: VentilationOPEX - ventilation correcte
-    print("\nTest 46: VentilationOPEX — ventilation correcte")
-    tests_total += 1
-    try:
-        ventilation = VENTILATION_OPEX_STANDARD
-        cout_total = 100.0  # 100$ pour simplifier
-        details = ventilation.ventiler(cout_total)
-
-        if abs(details['total'] - cout_total) < 0.01:
-            print(f"  OK - Ventilation cohérente: {details}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Total ventilé != coût total")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 47: MCF - VAN avec MCF < VAN sans MCF en mode économique
-    print("\nTest 47: MCF — VAN avec MCF < VAN sans MCF")
-    tests_total += 1
-    try:
-        params = ParametresModele()
-        compteur = ParametresCompteur()
-
-        # Sans MCF (scénario Québec standard)
-        ve_sans = VALEUR_EAU_QUEBEC
-        res_sans = executer_modele(params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=ve_sans)
-
-        # Avec MCF (20%)
-        ve_avec = VALEUR_EAU_QUEBEC_AVEC_MCF
-        res_avec = executer_modele(params, compteur, mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=ve_avec)
-
-        # VAN avec MCF devrait être plus basse (coûts majorés)
-        if res_avec.van < res_sans.van:
-            diff = res_sans.van - res_avec.van
-            print(f"  OK - VAN sans MCF: {fmt_argent(res_sans.van)}")
-            print(f"       VAN avec MCF: {fmt_argent(res_avec.van)}")
-            print(f"       Différence (impact MCF): {fmt_argent(diff)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN avec MCF devrait être < VAN sans MCF")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 48: Segmentation - création de segments valides
-    print("\nTest 48: Segmentation — création de segments valides")
-    tests_total += 1
-    try:
-        segments = SEGMENTS_QUEBEC_DEFAUT
-        total_menages = sum(s.nb_menages for s in segments)
-
-        # Note: Multilogement exclu par défaut (voir SEGMENTS_QUEBEC_DEFAUT)
-        if len(segments) == 2 and total_menages > 0:
-            print(f"  OK - {len(segments)} segments (multilogement exclu), {total_menages:,} ménages total")
-            for s in segments:
-                print(f"       {s.nom}: {s.nb_menages:,} mén., {s.lpcd:.0f} LPCD")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Segments invalides")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 49: Segmentation - VAN agrégée cohérente
-    print("\nTest 49: Segmentation — VAN agrégée = Σ VAN segments")
-    tests_total += 1
-    try:
-        # Utiliser des segments simplifiés pour le test
-        segments_test = [
-            ParametresSegment(type_logement=TypeLogement.UNIFAMILIAL, nb_menages=5000, lpcd=250),
-            ParametresSegment(type_logement=TypeLogement.MULTIPLEX, nb_menages=3000, lpcd=210),
-        ]
-        resultats = executer_modele_segmente(segments_test)
-
-        # Vérifier que la VAN totale = somme des VAN
-        van_somme = sum(data['resultats'].van for data in resultats['segments'].values())
-        diff = abs(resultats['van_totale'] - van_somme)
-
-        if diff < 1.0:  # Tolérance 1$
-            print(f"  OK - VAN agrégée: {fmt_argent(resultats['van_totale'])}")
-            print(f"       Σ VAN segments: {fmt_argent(van_somme)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - VAN agrégée != Σ VAN segments (diff: {diff:.2f})")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 50: Monte Carlo - P(VAN>0) dans [0,1]
-    print("\nTest 50: Monte Carlo — P(VAN>0) ∈ [0,1]")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)  # Petit pour rapidité
-        compteur = ParametresCompteur()
-        config_mc = ParametresMonteCarlo(
-            n_simulations=100,  # Minimal pour test
-            seed=42,
-            distributions=DISTRIBUTIONS_DEFAUT,
-        )
-
-        resultats_mc = simuler_monte_carlo(
-            params, compteur, config_mc,
-            afficher_progression=False,
-        )
-
-        if 0.0 <= resultats_mc.prob_van_positive <= 1.0:
-            print(f"  OK - P(VAN>0) = {resultats_mc.prob_van_positive*100:.1f}%")
-            print(f"       VAN moyenne: {fmt_argent(resultats_mc.van_moyenne)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - P(VAN>0) hors bornes: {resultats_mc.prob_van_positive}")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 51: Monte Carlo - reproductibilité avec seed
-    print("\nTest 51: Monte Carlo — reproductibilité avec seed")
-    tests_total += 1
-    try:
-        params = ParametresModele(nb_menages=1000)
-        compteur = ParametresCompteur()
-        config_mc = ParametresMonteCarlo(
-            n_simulations=100,  # Minimum requis
-            seed=12345,
-            distributions=DISTRIBUTIONS_DEFAUT,
-        )
-
-        res1 = simuler_monte_carlo(params, compteur, config_mc, afficher_progression=False)
-        res2 = simuler_monte_carlo(params, compteur, config_mc, afficher_progression=False)
-
-        if abs(res1.van_moyenne - res2.van_moyenne) < 1.0:
-            print(f"  OK - Résultats reproductibles avec seed=12345")
-            print(f"       Run 1: {fmt_argent(res1.van_moyenne)}")
-            print(f"       Run 2: {fmt_argent(res2.van_moyenne)}")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Résultats non reproductibles")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Test 52: DistributionParametre - validation triangulaire
-    print("\nTest 52: DistributionParametre — validation triangulaire")
-    tests_total += 1
-    try:
-        # Distribution valide
-        dist_ok = DistributionParametre(
-            nom="test",
-            type_distribution="triangular",
-            min_val=0.0, mode_val=0.5, max_val=1.0,
-        )
-
-        # Distribution invalide (mode hors bornes)
-        erreur_attendue = False
-        try:
-            dist_bad = DistributionParametre(
-                nom="test_bad",
-                type_distribution="triangular",
-                min_val=0.0, mode_val=1.5, max_val=1.0,  # mode > max
-            )
-        except ValueError:
-            erreur_attendue = True
-
-        if erreur_attendue:
-            print(f"  OK - Validation triangulaire fonctionne")
-            print(f"       Distribution valide acceptée")
-            print(f"       Distribution invalide rejetée")
-            tests_reussis += 1
-        else:
-            print(f"  ÉCHEC - Distribution invalide aurait dû lever ValueError")
-    except Exception as e:
-        print(f"  ERREUR: {e}")
-
-    # Résumé
-    print("\n" + "=" * 80)
-    print(f"RÉSULTATS: {tests_reussis}/{tests_total} tests réussis")
-    if tests_reussis == tests_total:
-        print("TOUS LES TESTS PASSÉS — Modèle validé!")
-    else:
-        print(f"ATTENTION: {tests_total - tests_reussis} test(s) échoué(s)")
-    print("=" * 80 + "\n")
-
-    return tests_reussis == tests_total
-
-
-# =============================================================================
-# SAISIE INTERACTIVE
-# =============================================================================
-
-def _saisir_float(invite: str, defaut: float) -> float:
-    """Saisir un nombre décimal avec défaut."""
-    s = input(invite).strip().replace(",", ".").replace("%", "")
-    if s == "":
-        return defaut
-    return float(s)
-
-
-def _saisir_int(invite: str, defaut: int) -> int:
-    """Saisir un entier avec défaut."""
-    s = input(invite).strip()
-    if s == "":
-        return defaut
-    return int(float(s))
-
-
-def saisir_parametres() -> ParametresModele:
-    """Saisie interactive des paramètres."""
-    print("\n" + "=" * 60)
-    print("  SAISIE DES PARAMÈTRES")
-    print("  (Appuyer sur ENTRÉE pour accepter la valeur par défaut)")
-    print("=" * 60 + "\n")
-
-    print("PROJET")
-    print("-" * 40)
-    nb_menages = _saisir_int("  Nombre de ménages [10000]: ", 10_000)
-    taille = _saisir_float("  Taille ménage [2.1]: ", 2.1)
-    horizon = _saisir_int("  Horizon d'analyse (ans) [20]: ", 20)
-    taux = _saisir_float("  Taux d'actualisation % [3]: ", 3.0)
-
-    print("\nCONSOMMATION")
-    print("-" * 40)
-    lpcd = _saisir_float("  LPCD (L/pers/jour) [250]: ", 250.0)
-
-    print("\nFUITES")
-    print("-" * 40)
-    part_fuite = _saisir_float("  Ménages avec fuite % [20]: ", 20.0)
-    debit_fuite = _saisir_float("  Débit fuite m³/an [35]: ", 35.0)
-    correction = _saisir_float("  Fuites corrigées % [85]: ", 85.0)
-
-    print("\nCOMPORTEMENT")
-    print("-" * 40)
-    reduction = _saisir_float("  Réduction comportement % [8]: ", 8.0)
-
-    print("\nVALEUR EAU")
-    print("-" * 40)
-    valeur = _saisir_float("  Valeur sociale $/m³ [4.69]: ", 4.69)
-
-    return ParametresModele(
-        nb_menages=nb_menages,
-        taille_menage=taille,
-        lpcd=lpcd,
-        part_menages_fuite_pct=part_fuite,
-        debit_fuite_m3_an=debit_fuite,
-        taux_correction_fuite_pct=correction,
-        reduction_comportement_pct=reduction,
-        valeur_eau_m3=valeur,
-        taux_actualisation_pct=taux,
-        horizon_analyse=horizon,
-    )
-
-
-def saisir_compteur() -> ParametresCompteur:
-    """Saisie interactive des paramètres compteur."""
-    print("\nTYPE DE COMPTEUR")
-    print("-" * 40)
-    print("  1. AMI (intelligent, temps réel)")
-    print("  2. AMR (lecture automatisée)")
-    print("  3. Manuel (lecture traditionnelle)")
-
-    choix = input("  Choix [1]: ").strip()
-
-    if choix == "2":
-        type_c = TypeCompteur.AMR
-        cout_defaut = 180.0
-    elif choix == "3":
-        type_c = TypeCompteur.MANUEL
-        cout_defaut = 80.0
-    else:
-        type_c = TypeCompteur.AMI
-        cout_defaut = 250.0
-
-    print(f"\nCOÛTS ({type_c.value.upper()})")
-    print("-" * 40)
-    cout_compteur = _saisir_float(f"  Coût compteur $ [{cout_defaut}]: ", cout_defaut)
-    heures = _saisir_float("  Heures installation [1.5]: ", 1.5)
-    taux = _saisir_float("  Taux horaire $/h [125]: ", 125.0)
-
-    reseau = 0.0
-    if type_c == TypeCompteur.AMI:
-        reseau = _saisir_float("  Coût réseau/compteur $ [50]: ", 50.0)
-
-    return ParametresCompteur(
-        type_compteur=type_c,
-        cout_compteur=cout_compteur,
-        heures_installation=heures,
-        taux_horaire_installation=taux,
-        cout_reseau_par_compteur=reseau,
-    )
-
-
-# =============================================================================
-# PROGRAMME PRINCIPAL
-# =============================================================================
-
-def executer_analyse_complete(
-    params: Optional[ParametresModele] = None,
-    compteur: Optional[ParametresCompteur] = None,
-    config: Optional[ConfigAnalyse] = None,
-    config_echelle: Optional[ConfigEconomiesEchelle] = None,
-    persistance: Optional[ParametresPersistance] = None,
-    params_fuites: Optional[ParametresFuites] = None,
-    interactif: bool = True
-) -> ResultatsModele:
-    """
-    Exécuter l'analyse complète avec visualisations.
-
-    Paramètres:
-        params: Paramètres du modèle
-        compteur: Paramètres du compteur
-        config: Configuration d'analyse
-        config_echelle: Configuration des économies d'échelle (ON/OFF)
-        persistance: Scénario de persistance (défaut: PERSISTANCE_REALISTE)
-        params_fuites: Configuration des fuites (défaut: FUITES_SANS_COUT)
-        interactif: Mode interactif ou non
-
-    Note: Les défauts PERSISTANCE_REALISTE et FUITES_SANS_COUT évitent le biais
-    optimiste du mode CONSTANT. Pour le scénario optimiste, passer explicitement
-    PERSISTANCE_OPTIMISTE.
-    """
-    # Obtenir paramètres
-    if params is None:
-        if interactif:
-            params = saisir_parametres()
-        else:
-            params = ParametresModele()
-
-    if compteur is None:
-        if interactif:
-            compteur = saisir_compteur()
-        else:
-            compteur = ParametresCompteur()
-
-    if config is None:
-        config = ConfigAnalyse()
-
-    # Défauts réalistes pour persistance et fuites (évite biais optimiste)
-    if persistance is None:
-        persistance = PERSISTANCE_REALISTE
-    if params_fuites is None:
-        params_fuites = FUITES_SANS_COUT
-
-    if config.afficher_cadre_quebec:
-        afficher_ordres_grandeur_quebec()
-
-    # Exécuter modèle
-    print("\n" + "=" * 80)
-    print("Exécution du modèle...")
-    print(f"Persistance: {persistance.nom}")
-    print(f"Fuites: {params_fuites.nom}")
-    if config_echelle and config_echelle.activer:
-        print("Économies d'échelle: ACTIVÉES")
-    else:
-        print("Économies d'échelle: DÉSACTIVÉES")
-    print("=" * 80)
-
-    res = executer_modele(params, compteur, config_echelle,
-                          persistance=persistance, params_fuites=params_fuites)
-    afficher_resume(res)
-
-    # Tests de validation
-    executer_tests_validation()
-
-    # Comparaison des 3 types
-    if config.afficher_comparaison_types:
-        print("\n" + "=" * 80)
-        print(" " * 25 + "COMPARAISON DES TYPES")
-        if config_echelle and config_echelle.activer:
-            print(" " * 20 + "(avec économies d'échelle)")
-        print("=" * 80)
-
-        df_types = comparer_types_compteurs(params, compteur, config_echelle)
-        afficher_comparaison_types(df_types)
-
-        print("Graphique: Comparaison des types...")
-        graphique_comparaison_types(df_types)
-        plt.show()
-
-    # Graphiques principaux
-    print("\n" + "=" * 80)
-    print(" " * 25 + "VISUALISATIONS")
-    print("=" * 80 + "\n")
-
-    if config.afficher_van_cumulative:
-        print("Graphique: VAN cumulative...")
-        graphique_van_cumulative(res)
-        plt.show()
-
-    if config.afficher_cascade:
-        print("Graphique: Cascade VAN...")
-        graphique_cascade(res)
-        plt.show()
-
-    # Analyses de sensibilité
-    print("\n" + "=" * 80)
-    print(" " * 20 + "ANALYSES DE SENSIBILITÉ")
-    print("=" * 80 + "\n")
-
-    delta = config.delta_sensibilite
-
-    print(f"Sensibilité univariée (±{delta:.0f}%)...")
-    df_sens = sensibilite_univariee(params, compteur, delta)
-
-    print(f"\n{'=' * 80}")
-    print(f"SENSIBILITÉ UNIVARIÉE (±{delta:.0f}%)")
-    print("=" * 80)
-    print(df_sens.to_string(index=False))
-    print()
-
-    if config.afficher_tornade:
-        print("Graphique: Tornade...")
-        graphique_tornade(df_sens, delta, f"Diagramme Tornade — VAN (±{delta:.0f}%)")
-        plt.show()
-
-    if config.afficher_araignee:
-        print("Graphique: Araignée...")
-        graphique_araignee(df_sens, res.van, f"Sensibilité VAN (±{delta:.0f}%)")
-        plt.show()
-
-    if config.afficher_elasticite:
-        print("Élasticités...")
-        df_elas = table_elasticite(params, compteur)
-
-        print(f"\n{'=' * 80}")
-        print("ÉLASTICITÉS")
-        print("=" * 80)
-        print(df_elas.to_string(index=False))
-        print()
-
-    if config.afficher_scenarios:
-        print("Scénarios...")
-        df_scen = analyse_scenarios(params, compteur)
-
-        print(f"\n{'=' * 80}")
-        print("COMPARAISON DES SCÉNARIOS")
-        print("=" * 80)
-        print(df_scen.to_string(index=False))
-        print()
-
-        graphique_scenarios(df_scen)
-        plt.show()
-
-    # Résumé final
-    print("\n" + "=" * 80)
-    print(" " * 30 + "ANALYSE TERMINÉE")
-    print("=" * 80)
-
-    print("\nRÉSULTATS CLÉS:")
-    print("-" * 80)
-    print(f"  VAN:                    {fmt_argent(res.van):>20}")
-    print(f"  Ratio B/C:              {res.rbc:>20.2f}")
-    recup = f"{res.periode_recuperation:.1f} ans" if np.isfinite(res.periode_recuperation) else "Jamais"
-    print(f"  Récupération:           {recup:>20}")
-    print(f"  LCSW:                   {res.lcsw:>19.2f} $/m³")
-    print(f"  Économies/ménage:       {res.economie_totale_menage:>19.1f} m³/an")
-
-    print("\nRECOMMANDATION:")
-    print("-" * 80)
-    if res.van > 0 and res.rbc > 1.0:
-        print("  PROJET ÉCONOMIQUEMENT VIABLE")
-        print("  Les bénéfices sociétaux dépassent les coûts.")
-    elif res.van > 0:
-        print("  PROJET MARGINAL — Attention aux risques")
-    else:
-        print("  PROJET NON JUSTIFIÉ ÉCONOMIQUEMENT")
-        print("  Considérer: augmenter la valeur de l'eau ou réduire les coûts")
-
-    print("\n" + "=" * 80 + "\n")
-
-    return res
-
-
-# =============================================================================
-# POINT D'ENTRÉE
-# =============================================================================
-
-if __name__ == "__main__":
-    executer_analyse_complete(interactif=True)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+Analyse Coûts-Bénéfices — Compteurs d'Eau Résidentiels
+======================================================
+
+Modèle d'analyse économique pour l'implantation de compteurs d'eau
+dans les municipalités québécoises.
+
+Fonctionnalités:
+- Comparaison AMI vs AMR vs Manuel
+- Valeur Actuelle Nette (VAN) et Ratio Bénéfices-Coûts (RBC)
+- Période de récupération actualisée
+- Coût nivelé de l'eau économisée (LCSW)
+- Report d'infrastructure (optionnel)
+- Fuites réseau (optionnel) avec trajectoire et coûts
+- Analyses de sensibilité complètes
+
+Auteur: Modèle consolidé pour thèse
+Version: 3.11.0 - Monte Carlo, MCF, Segmentation, OPEX AMI (janvier 2026)
+
+Changelog v3.11.0:
+- NOUVEAU: Module Monte Carlo — Simulation stochastique
+  - DistributionParametre: distributions triangulaires, normales, uniformes
+  - ParametresMonteCarlo: configuration N simulations, seed reproductibilité
+  - ResultatsMonteCarlo: P(VAN>0), percentiles, corrélations drivers
+  - simuler_monte_carlo(): exécution N tirages avec analyse sensibilité
+  - graphique_distribution_van(): histogramme avec P(VAN>0)
+  - graphique_tornado_mc(): graphique tornado des drivers
+  - DISTRIBUTIONS_DEFAUT: alpha0, lpcd, valeur_eau, cout_compteur, prevalence_fuites
+- NOUVEAU: MCF (Coût Marginal des Fonds publics)
+  - ParametresValeurEau.mcf: 0.20 pour sensibilité (désactivé par défaut)
+  - ParametresValeurEau.appliquer_mcf: activer/désactiver
+  - ParametresValeurEau.facteur_mcf(): retourne (1+mcf) en mode économique
+  - actualiser_series(): applique MCF aux dépenses publiques (I0, OPEX, ponctuels)
+  - VALEUR_EAU_SANS_MCF: préréglage pour comparaison
+- NOUVEAU: Module Coûts Non Techniques AMI
+  - VentilationOPEX: cybersécurité, licences, stockage, service client, intégration SI
+  - VENTILATION_OPEX_STANDARD, VENTILATION_OPEX_SECURITE_ELEVEE, VENTILATION_OPEX_CLOUD
+  - afficher_ventilation_opex(): tableau détaillé
+- NOUVEAU: Module Segmentation Résidentielle
+  - TypeLogement: UNIFAMILIAL, MULTIPLEX, MULTILOGEMENT
+  - ParametresSegment: caractéristiques par type de logement
+  - SEGMENT_UNIFAMILIAL, SEGMENT_MULTIPLEX (Québec SQEEP 2023)
+  - Note: MULTILOGEMENT exclu par défaut (effet comportemental non modélisable)
+  - executer_modele_segmente(): analyse multi-segments avec agrégation
+  - afficher_resultats_segmentes(), graphique_segmentation()
+- NOUVEAU: 8 tests de validation (Tests 45-52)
+  - VentilationOPEX, MCF, Segmentation, Monte Carlo
+
+Changelog v3.10.1:
+- CORRECTION 4.2: Économies d'échelle calculées sur H × A_max (adoption effective)
+  - Évite surestimation du rabais volume si adoption partielle (<100%)
+- CORRECTION 4.4: taux_correction_effectif_avec_persistance utilisé dans calculer_economies_eau()
+  - Intègre la fraction de fuites jamais réparées (longue traîne)
+- CORRECTION 4.5: volume_fuite_moyen_pondere utilisé si mode deux-stocks
+  - Pondération correcte any/significatives pour calcul usage_reductible
+- NOUVEAU: 3 tests de validation ajoutés (Tests 42-44)
+
+Changelog v3.10.0:
+- SQEEP 2023: DEFAUTS_LONGUEUIL mis à jour (116,258 ménages, 2.18 pers/ménage, 236 LPCD)
+- NOUVEAU: Modèle deux-stocks fuites (any vs significatives)
+  - utiliser_prevalence_differenciee: active le mode deux-stocks
+  - part_menages_fuite_any_pct (20%), debit_fuite_any_m3_an (10 m³/an)
+  - part_menages_fuite_significative_pct (5%), debit_fuite_significative_m3_an (50 m³/an)
+  - Fraction persistante (longue traîne) avec taux réparation réduit
+- NOUVEAU: Paramètres différenciés par type de fuite
+  - facteur_detection_sig (1.2), facteur_reparation_sig (0.7)
+  - cout_reparation_any (100$), cout_reparation_sig (400$)
+- NOUVEAU: ResultatsFuites avec breakdowns par type
+- FIX: executer_analyse_complete() utilise PERSISTANCE_REALISTE par défaut
+- FIX: CALIBRATION lambda_decay synchronisé avec défaut (0.15)
+- generate_reponse_longueuil.py refactoré pour injecter résultats calculés
+
+Changelog v3.9.0:
+- CALIBRATION: LPCD par défaut 332 → 250 L/p/j (source MAMH RAUEP)
+- CALIBRATION: Lambda décroissance 0.35 → 0.15/an (source Allcott AER)
+- CALIBRATION: Coût variable eau 1.50 → 0.50 $/m³ (source Winnipeg water audit)
+- NOUVEAU: Prévalence fuites différenciée (any 20%, significative 5%)
+  - part_menages_fuite_any_pct, debit_fuite_any_m3_an
+  - part_menages_fuite_significative_pct, debit_fuite_significative_m3_an
+  - utiliser_prevalence_differenciee pour activer
+- NOUVEAU: Paramètres longue traîne fuites (source AWE 2023)
+  - part_fuites_persistantes_pct: fuites jamais réparées
+  - facteur_duree_longue_traine: multiplicateur durée
+- NOUVEAU: Propriétés ParametresFuites:
+  - taux_correction_effectif_avec_persistance
+  - volume_fuite_moyen_pondere
+- NOUVEAU: Preset LPCD_MONTREAL_HAUT = 332 pour scénario haute consommation
+- DOC: Harmonisation OPEX doc ↔ code
+- DOC: Ajout sources AWE (2023), Winnipeg accuracy
+
+Changelog v3.8.0:
+- NOUVEAU: Coûts incitatifs dans ParametresAdoption
+  - cout_incitatif_par_menage: coût TOTAL par ménage (réparti sur duree_incitatif_ans)
+  - duree_incitatif_ans: durée de versement des incitatifs
+  - Préréglages mis à jour: RAPIDE (540$/3 ans), PROGRESSIVE (180$/3 ans), LENTE (90$/3 ans)
+  - Mode ÉCONOMIQUE: incitatifs EXCLUS (transferts neutres pour bien-être social)
+  - Mode FINANCIER: incitatifs INCLUS (coût réel budget municipal)
+- NOUVEAU: Facteurs d'efficacité par type de compteur dans ParametresCompteur
+  - facteur_efficacite_comportement: multiplicateur réduction comportementale
+  - facteur_efficacite_fuites: multiplicateur détection fuites
+  - AMI: 1.0 (référence), AMR: 0.875/0.91, Manuel: 0.625/0.765
+  - Sources: Davies 2014, Beal 2011, Britton 2013, Winnipeg 2023
+- calculer_economies_eau() accepte maintenant compteur pour moduler les économies
+- generer_trajectoires() applique les facteurs d'efficacité:
+  - serie_alpha modulé par facteur_efficacite_comportement
+  - calculer_dynamique_fuites accepte facteur_efficacite_detection
+- calculer_dynamique_fuites() accepte facteur_efficacite_detection pour moduler d
+- Trajectoires: nouveau champ couts_incitatifs
+- actualiser_series() et calculer_van_cumulative() gèrent incitatifs selon le mode
+
+Changelog v3.7.0:
+- NOUVEAU: Module fuites réseau dynamique (pertes réseau + coûts)
+- Économies fuites intégrées aux bénéfices via trajectoires (privé)
+- Double-compte fuites/comportement corrigé (usage net des fuites)
+
+Changelog v3.6.0:
+- NOUVEAU: Module calibrage explicite pour traçabilité scientifique
+- Nouvelles structures: SourceCalibration, ParametreCalibre
+- 11 sources empiriques documentées: Davies, Carrillo, Beal, Kenney, Allcott,
+                                       AWWA, DeOreo, Britton, Winnipeg, Arregui, Renzetti
+- CALIBRATION: dictionnaire complet des paramètres avec sources
+- Nouvelles fonctions: afficher_calibration, valider_parametres_vs_calibration,
+                       generer_biblio_latex, exporter_biblio_latex,
+                       creer_tableau_sensibilite, generer_section_calibration_markdown
+- 5 catégories: persistance, fuites, economies_echelle, valeur_eau, financier
+- 11 paramètres calibrés avec plages recommandées basées sur la littérature
+- Export BibTeX automatique pour bibliographie LaTeX
+- Validation automatique des paramètres contre les plages empiriques
+
+Changelog v3.5.0:
+- NOUVEAU: Module adoption pour stratégies d'implantation
+- Nouvelles structures: ModeAdoption, ParametresAdoption
+- 6 préréglages: OBLIGATOIRE, RAPIDE, PROGRESSIVE, NOUVEAUX, PAR_SECTEUR, LENTE
+- Courbe d'adoption A(t): logistique, linéaire, par tranches
+- CAPEX étalé selon courbe d'adoption (optionnel)
+- Bénéfices et OPEX proportionnels à A(t)
+- Nouvelles fonctions: calculer_adoption, generer_serie_adoption,
+                       calculer_capex_etale, afficher_scenarios_adoption
+- generer_trajectoires() accepte params_adoption
+- actualiser_series() et calculer_van_cumulative() gèrent CAPEX étalé
+- executer_modele() accepte params_adoption
+
+Changelog v3.4.0:
+- NOUVEAU: Module perspectives (économique vs financier)
+- Nouvelles structures: ModeCompte (enum), ParametresValeurEau
+- Préréglages: VALEUR_EAU_QUEBEC, VALEUR_EAU_CONSERVATEUR, VALEUR_EAU_RARETE
+- Nouvelle fonction: comparer_perspectives() pour analyse comparative
+- generer_trajectoires() accepte mode_compte et valeur_eau
+- actualiser_series() et calculer_van_cumulative() distinguent les coûts
+- executer_modele() accepte mode_compte et valeur_eau
+- Analyse économique: valeur sociale, sans tarification, tous les coûts
+- Analyse financière: coût variable évité, sans tarification, coûts ville seulement
+
+Changelog v3.3.0:
+- NOUVEAU: Module fuites avec coûts de réparation
+- 5 scénarios: SANS_COUT, MENAGE_SEUL, SUBVENTION_50, VILLE_SEULE, CONTEXTE_QUEBEC
+- Nouvelles structures: ModeRepartitionCouts, ParametresFuites, ResultatsFuites
+- Nouvelles fonctions: calculer_dynamique_fuites, calculer_economies_fuites_menage,
+                       comparer_scenarios_fuites, afficher_scenarios_fuites,
+                       graphique_scenarios_fuites
+- executer_modele() accepte maintenant le paramètre 'params_fuites'
+- generer_trajectoires() intègre les coûts de réparation
+- actualiser_series() et calculer_van_cumulative() incluent les réparations
+- 22 tests de validation (incluant 6 tests de fuites)
+
+Changelog v3.2.0:
+- Module persistance avec décroissance α_B(t)
+- 3 scénarios: OPTIMISTE (constant), RÉALISTE (plateau), PESSIMISTE (fadeout)
+- Nouvelles structures: ModePersistance, ParametresPersistance
+- Nouvelles fonctions: calculer_alpha_comportement, generer_serie_alpha,
+                       comparer_scenarios_persistance, graphique_persistance
+- executer_modele() accepte le paramètre 'persistance'
+
+Changelog v3.1.0:
+- Refactoring: modèle basé sur séries B[t], C[t] au lieu de formules d'annuité
+- Nouvelles structures: EconomiesEau, Trajectoires
+- Nouvelles fonctions: calculer_economies_eau, generer_trajectoires,
+                       actualiser_series, calculer_van_cumulative
+
+Structure du paquet:
+- core.py: moteur (paramètres, trajectoires, executer_modele)
+- presets.py: préréglages (valeurs d'eau, persistance, fuites, adoption, ...)
+- montecarlo.py: simulation Monte Carlo
+- calibration.py: sources empiriques et paramètres calibrés
+- reporting.py: comparaisons, sensibilité, affichages et graphiques
+- validation.py: tests de validation
+- cli.py: saisie interactive et programme principal (python -m analyse_compteurs_eau)
+
+Tous les noms restent importables depuis analyse_compteurs_eau; les
+sous-modules sont chargés au premier accès.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# À incrémenter à tout changement numérique du modèle: les scénarios
+# précalculés (generate_scenarios_json.py) et leur table dans l'API en dépendent
+__version__ = "3.11.0"
+
+# Attribut public → sous-module qui le définit. Les sous-modules ne sont
+# importés qu'au premier accès (PEP 562): `import analyse_compteurs_eau` suivi
+# d'un appel à executer_modele() ne charge que core.py, sans construire les
+# préréglages, la base de calibrage ni les distributions Monte Carlo.
+_SOUS_MODULES = {
+    "core": (
+        "etape", "chronometrer_etapes", "TypeCompteur", "ModeCompte",
+        "ParametresValeurEau", "VALEUR_EAU_QUEBEC", "ConfigEconomiesEchelle",
+        "calculer_facteur_echelle", "appliquer_facteur_echelle",
+        "VentilationOPEX", "VENTILATION_OPEX_STANDARD", "ParametresCompteur",
+        "ParametresModele", "ResultatsModele", "ResultatsParPayeur",
+        "decomposer_par_payeur", "EconomiesEau", "ModePersistance",
+        "ParametresPersistance", "calculer_alpha_comportement",
+        "generer_serie_alpha", "ModeRepartitionCouts", "ParametresFuites",
+        "ResultatsFuites", "calculer_dynamique_fuites",
+        "calculer_economies_fuites_menage", "ModeReductionReseau",
+        "ParametresFuitesReseau", "ResultatsFuitesReseau",
+        "calculer_dynamique_fuites_reseau", "FUITES_CONTEXTE_QUEBEC",
+        "ModeAdoption", "ParametresAdoption", "calculer_adoption",
+        "generer_serie_adoption", "calculer_delta_adoption",
+        "calculer_adoption_effective", "convoluer_cohortes",
+        "calculer_capex_etale", "ADOPTION_OBLIGATOIRE", "TypeLogement",
+        "ParametresSegment", "creer_params_modele_depuis_segment",
+        "creer_compteur_depuis_segment", "executer_modele_segmente",
+        "Trajectoires", "calculer_economies_eau", "generer_trajectoires",
+        "actualiser_series", "calculer_van_cumulative", "fmt_argent",
+        "facteur_recuperation_capital", "valeur_actuelle_annuite",
+        "annee_croisement", "division_securisee", "executer_modele",
+    ),
+    "presets": (
+        "VALEUR_EAU_CONSERVATEUR", "VALEUR_EAU_RARETE", "VALEUR_EAU_SANS_MCF",
+        "VALEUR_EAU_QUEBEC_AVEC_MCF", "PREREGLAGES_VALEUR_EAU",
+        "PRESETS_VALEUR_EAU", "VENTILATION_OPEX_SECURITE_ELEVEE",
+        "VENTILATION_OPEX_CLOUD", "PREREGLAGES_VENTILATION_OPEX",
+        "DEFAUTS_LONGUEUIL", "ORDRES_GRANDEUR_QUEBEC", "LPCD_MONTREAL_HAUT",
+        "COMPTEUR_LONGUEUIL_AMI", "DEFAUTS_COMPTEUR_CALCULATEUR",
+        "COUTS_AMI_SEULEMENT", "creer_compteur_calculateur",
+        "DEFAUTS_WINNIPEG", "COMPTEUR_WINNIPEG",
+        "COMPTEUR_AMI_OPEX_BAS", "COMPTEUR_AMI_OPEX_HAUT",
+        "SCENARIOS_OPEX_AMI", "PERSISTANCE_OPTIMISTE", "PERSISTANCE_REALISTE",
+        "PERSISTANCE_PESSIMISTE", "PERSISTANCE_ULTRA_PESSIMISTE",
+        "SCENARIOS_PERSISTANCE", "FUITES_SANS_COUT", "FUITES_MENAGE_SEUL",
+        "FUITES_SUBVENTION_50", "FUITES_VILLE_SEULE",
+        "FUITES_QUEBEC_DEUX_STOCKS", "FUITES_MENAGE_SANS_TARIF",
+        "FUITES_QUEBEC_SANS_TARIF", "FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF",
+        "SCENARIOS_FUITES", "ADOPTION_RAPIDE", "ADOPTION_PROGRESSIVE",
+        "ADOPTION_NOUVEAUX", "ADOPTION_PAR_SECTEUR", "ADOPTION_LENTE",
+        "creer_adoption_ici_seulement", "ADOPTION_ICI_SEULEMENT",
+        "ADOPTION_ECHANTILLONNAGE_380", "creer_adoption_echantillonnage_380",
+        "STRATEGIES_ADOPTION", "SEGMENT_UNIFAMILIAL", "SEGMENT_MULTIPLEX",
+        "SEGMENT_MULTILOGEMENT", "SEGMENTS_QUEBEC_DEFAUT",
+    ),
+    "montecarlo": (
+        "DistributionParametre", "ParametresMonteCarlo", "ResultatsMonteCarlo",
+        "DISTRIBUTIONS_DEFAUT", "DISTRIBUTIONS_MINIMALES",
+        "DISTRIBUTIONS_ETENDUES", "CalculAnnule", "TAILLE_LOT_ANNULATION",
+        "simuler_monte_carlo",
+        "afficher_resultats_monte_carlo", "graphique_distribution_van",
+        "graphique_tornado_mc",
+    ),
+    "calibration": (
+        "SourceCalibration", "ParametreCalibre", "SOURCE_DAVIES_UK",
+        "SOURCE_CARRILLO_ALICANTE", "SOURCE_BEAL_AUSTRALIA",
+        "SOURCE_KENNEY_COLORADO", "SOURCE_ALLCOTT_HABITS", "SOURCE_AWWA_LEAKS",
+        "SOURCE_DEOREO_LEAKS", "SOURCE_BRITTON_REPAIR",
+        "SOURCE_WINNIPEG_METERS", "SOURCE_ARREGUI_ACCURACY",
+        "SOURCE_WINNIPEG_NEPTUNE", "SOURCE_AWE_LEAKS",
+        "SOURCE_AWE_PERSISTENCE", "SOURCE_AWWA_SCALE", "SOURCE_RENZETTI_VALUE",
+        "CALIBRATION", "obtenir_parametre_calibre",
+        "lister_parametres_calibres", "afficher_calibration",
+        "valider_parametres_vs_calibration", "afficher_validation_parametres",
+        "generer_biblio_latex", "exporter_biblio_latex",
+        "creer_tableau_sensibilite", "generer_section_calibration_markdown",
+    ),
+    "reporting": (
+        "afficher_prereglages_valeur_eau", "afficher_presets_valeur_eau",
+        "afficher_table_economies_echelle", "afficher_ventilation_opex",
+        "afficher_ordres_grandeur_quebec", "afficher_decomposition_payeurs",
+        "afficher_scenarios_persistance", "afficher_scenarios_adoption",
+        "comparer_strategies_adoption", "afficher_comparaison_strategies",
+        "graphique_strategies_adoption", "afficher_scenarios_fuites",
+        "afficher_resultats_segmentes", "graphique_segmentation",
+        "comparer_types_compteurs", "comparer_scenarios_persistance",
+        "afficher_comparaison_persistance", "graphique_persistance",
+        "graphique_van_scenarios_persistance", "comparer_scenarios_fuites",
+        "afficher_comparaison_fuites", "graphique_scenarios_fuites",
+        "comparer_perspectives", "afficher_comparaison_perspectives",
+        "graphique_perspectives", "SPECS_SENSIBILITE", "SPECS_COMPTEUR",
+        "sensibilite_univariee", "table_elasticite", "analyse_scenarios",
+        "graphique_cascade", "graphique_tornade", "graphique_araignee",
+        "afficher_inventaire_presets", "graphique_van_cumulative",
+        "graphique_comparaison_types", "graphique_scenarios",
+        "afficher_resume", "afficher_comparaison_types",
+    ),
+    "municipalites": (
+        "PRESSION_SERVICE_DEFAUT_M", "Municipalite", "pertes_reseau_m3_an",
+        "municipalite_depuis_stats", "charger_municipalites",
+        "parametres_municipalite", "COLONNES_RESULTATS",
+        "ResultatsMunicipalites", "evaluer_municipalites",
+        "PERCENTILES_MC", "ResultatsMonteCarloMunicipalites",
+        "simuler_municipalites_monte_carlo",
+    ),
+    "deploiement": (
+        "OBJECTIFS_DEPLOIEMENT", "MAX_EVALUATIONS_DEPLOIEMENT",
+        "PlanDeploiement", "ResultatsDeploiement",
+        "calendrier_rythme_constant", "evaluer_calendrier", "front_pareto",
+        "optimiser_deploiement", "ResultatsPlanification", "van_par_cohorte",
+        "planifier_deploiement",
+    ),
+    "priorisation": (
+        "OBJECTIFS_PRIORISATION", "ResultatsPriorisation", "prioriser_municipalites",
+    ),
+    "decomposition": (
+        "COMPOSANTES_BASE_VAN", "BaseVAN", "calculer_base_van", "prix_base_van",
+        "multiplicateurs_couts",
+    ),
+    "seuils": (
+        "STATUT_TROUVE", "STATUT_TOUJOURS_POSITIVE", "STATUT_TOUJOURS_NEGATIVE",
+        "SeuilRentabilite", "brent", "chercher_seuil",
+    ),
+    "noyau": (
+        "VERSION_NOYAU", "SECTIONS_NOYAU", "CHAMPS_RESULTATS_NOYAU",
+        "entrees_noyau", "resultats_noyau", "spec_noyau",
+    ),
+    "equivalence": (
+        "TOLERANCE_DEFAUT", "COMBINAISONS_CORPUS", "CasEquivalence", "EcartEquivalence",
+        "RapportEquivalence", "generer_corpus", "MOTEURS_EQUIVALENCE", "comparer_moteurs",
+    ),
+    "validation": (
+        "executer_tests_validation",
+    ),
+    "cli": (
+        "ConfigAnalyse", "saisir_parametres", "saisir_compteur",
+        "executer_analyse_complete",
+    ),
+    "_differe": (
+        "pd", "plt", "mpatches",
+    ),
+}
+
+_ATTRIBUTS = {nom: module for module, noms in _SOUS_MODULES.items() for nom in noms}
+
+__all__ = ["__version__", *_ATTRIBUTS]
+
+
+def __getattr__(nom: str):
+    module = _ATTRIBUTS.get(nom)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(importlib.import_module(f".{module}", __name__), nom)
+    globals()[nom] = valeur  # accès suivants sans passer par __getattr__
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTS))
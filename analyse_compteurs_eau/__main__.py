@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""Point d'entrée: python -m analyse_compteurs_eau"""
+
+from .cli import executer_analyse_complete
+
+executer_analyse_complete(interactif=True)
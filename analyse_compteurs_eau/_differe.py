@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Import différé des bibliothèques de tableaux et de graphiques.
+
+pandas et matplotlib ne servent qu'aux tableaux et graphiques: ils sont
+importés au premier usage, pour que l'API (qui n'en a pas besoin) démarre
+plus vite et consomme moins de mémoire.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+
+# =============================================================================
+# CONFIGURATION GRAPHIQUES
+# =============================================================================
+
+class _ModuleDiffere:
+    """Module importé au premier accès à l'un de ses attributs."""
+
+    def __init__(self, nom: str, initialiser=None):
+        self._nom = nom
+        self._initialiser = initialiser
+        self._module = None
+
+    def _charger(self):
+        if self._module is None:
+            module = importlib.import_module(self._nom)
+            if self._initialiser is not None:
+                self._initialiser(module)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._charger(), attr)
+
+    def __repr__(self) -> str:
+        etat = "chargé" if self._module is not None else "non chargé"
+        return f"<module différé '{self._nom}' ({etat})>"
+
+
+def _configurer_pyplot(module) -> None:
+    module.rcParams.update({
+        'figure.dpi': 100,
+        'font.size': 10,
+        'axes.titlesize': 13,
+        'axes.labelsize': 11,
+        'figure.figsize': (10, 6),
+    })
+
+
+pd = _ModuleDiffere("pandas")
+plt = _ModuleDiffere("matplotlib.pyplot", initialiser=_configurer_pyplot)
+mpatches = _ModuleDiffere("matplotlib.patches")
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+Saisie interactive et programme principal (python -m analyse_compteurs_eau).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ._differe import plt
+from .core import (
+    TypeCompteur,
+    ConfigEconomiesEchelle,
+    ParametresCompteur,
+    ParametresModele,
+    ResultatsModele,
+    ParametresPersistance,
+    ParametresFuites,
+    fmt_argent,
+    executer_modele,
+)
+from .presets import PERSISTANCE_REALISTE, FUITES_SANS_COUT
+from .reporting import (
+    afficher_ordres_grandeur_quebec,
+    comparer_types_compteurs,
+    sensibilite_univariee,
+    table_elasticite,
+    analyse_scenarios,
+    graphique_cascade,
+    graphique_tornade,
+    graphique_araignee,
+    graphique_van_cumulative,
+    graphique_comparaison_types,
+    graphique_scenarios,
+    afficher_resume,
+    afficher_comparaison_types,
+)
+from .validation import executer_tests_validation
+
+
+# =============================================================================
+# CONFIGURATION DE L'ANALYSE
+# =============================================================================
+
+@dataclass
+class ConfigAnalyse:
+    """Configuration des analyses et visualisations."""
+    delta_sensibilite: float = 10.0       # ±% pour sensibilité
+
+    # Graphiques à afficher
+    afficher_cadre_quebec: bool = True
+    afficher_cascade: bool = True
+    afficher_tornade: bool = True
+    afficher_araignee: bool = True
+    afficher_elasticite: bool = True
+    afficher_van_cumulative: bool = True
+    afficher_comparaison_types: bool = True
+    afficher_scenarios: bool = True
+
+
+# =============================================================================
+# SAISIE INTERACTIVE
+# =============================================================================
+
+def _saisir_float(invite: str, defaut: float) -> float:
+    """Saisir un nombre décimal avec défaut."""
+    s = input(invite).strip().replace(",", ".").replace("%", "")
+    if s == "":
+        return defaut
+    return float(s)
+
+
+def _saisir_int(invite: str, defaut: int) -> int:
+    """Saisir un entier avec défaut."""
+    s = input(invite).strip()
+    if s == "":
+        return defaut
+    return int(float(s))
+
+
+def saisir_parametres() -> ParametresModele:
+    """Saisie interactive des paramètres."""
+    print("\n" + "=" * 60)
+    print("  SAISIE DES PARAMÈTRES")
+    print("  (Appuyer sur ENTRÉE pour accepter la valeur par défaut)")
+    print("=" * 60 + "\n")
+
+    print("PROJET")
+    print("-" * 40)
+    nb_menages = _saisir_int("  Nombre de ménages [10000]: ", 10_000)
+    taille = _saisir_float("  Taille ménage [2.1]: ", 2.1)
+    horizon = _saisir_int("  Horizon d'analyse (ans) [20]: ", 20)
+    taux = _saisir_float("  Taux d'actualisation % [3]: ", 3.0)
+
+    print("\nCONSOMMATION")
+    print("-" * 40)
+    lpcd = _saisir_float("  LPCD (L/pers/jour) [250]: ", 250.0)
+
+    print("\nFUITES")
+    print("-" * 40)
+    part_fuite = _saisir_float("  Ménages avec fuite % [20]: ", 20.0)
+    debit_fuite = _saisir_float("  Débit fuite m³/an [35]: ", 35.0)
+    correction = _saisir_float("  Fuites corrigées % [85]: ", 85.0)
+
+    print("\nCOMPORTEMENT")
+    print("-" * 40)
+    reduction = _saisir_float("  Réduction comportement % [8]: ", 8.0)
+
+    print("\nVALEUR EAU")
+    print("-" * 40)
+    valeur = _saisir_float("  Valeur sociale $/m³ [4.69]: ", 4.69)
+
+    return ParametresModele(
+        nb_menages=nb_menages,
+        taille_menage=taille,
+        lpcd=lpcd,
+        part_menages_fuite_pct=part_fuite,
+        debit_fuite_m3_an=debit_fuite,
+        taux_correction_fuite_pct=correction,
+        reduction_comportement_pct=reduction,
+        valeur_eau_m3=valeur,
+        taux_actualisation_pct=taux,
+        horizon_analyse=horizon,
+    )
+
+
+def saisir_compteur() -> ParametresCompteur:
+    """Saisie interactive des paramètres compteur."""
+    print("\nTYPE DE COMPTEUR")
+    print("-" * 40)
+    print("  1. AMI (intelligent, temps réel)")
+    print("  2. AMR (lecture automatisée)")
+    print("  3. Manuel (lecture traditionnelle)")
+
+    choix = input("  Choix [1]: ").strip()
+
+    if choix == "2":
+        type_c = TypeCompteur.AMR
+        cout_defaut = 180.0
+    elif choix == "3":
+        type_c = TypeCompteur.MANUEL
+        cout_defaut = 80.0
+    else:
+        type_c = TypeCompteur.AMI
+        cout_defaut = 250.0
+
+    print(f"\nCOÛTS ({type_c.value.upper()})")
+    print("-" * 40)
+    cout_compteur = _saisir_float(f"  Coût compteur $ [{cout_defaut}]: ", cout_defaut)
+    heures = _saisir_float("  Heures installation [1.5]: ", 1.5)
+    taux = _saisir_float("  Taux horaire $/h [125]: ", 125.0)
+
+    reseau = 0.0
+    if type_c == TypeCompteur.AMI:
+        reseau = _saisir_float("  Coût réseau/compteur $ [50]: ", 50.0)
+
+    return ParametresCompteur(
+        type_compteur=type_c,
+        cout_compteur=cout_compteur,
+        heures_installation=heures,
+        taux_horaire_installation=taux,
+        cout_reseau_par_compteur=reseau,
+    )
+
+
+# =============================================================================
+# PROGRAMME PRINCIPAL
+# =============================================================================
+
+def executer_analyse_complete(
+    params: Optional[ParametresModele] = None,
+    compteur: Optional[ParametresCompteur] = None,
+    config: Optional[ConfigAnalyse] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    interactif: bool = True
+) -> ResultatsModele:
+    """
+    Exécuter l'analyse complète avec visualisations.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config: Configuration d'analyse
+        config_echelle: Configuration des économies d'échelle (ON/OFF)
+        persistance: Scénario de persistance (défaut: PERSISTANCE_REALISTE)
+        params_fuites: Configuration des fuites (défaut: FUITES_SANS_COUT)
+        interactif: Mode interactif ou non
+
+    Note: Les défauts PERSISTANCE_REALISTE et FUITES_SANS_COUT évitent le biais
+    optimiste du mode CONSTANT. Pour le scénario optimiste, passer explicitement
+    PERSISTANCE_OPTIMISTE.
+    """
+    # Obtenir paramètres
+    if params is None:
+        if interactif:
+            params = saisir_parametres()
+        else:
+            params = ParametresModele()
+
+    if compteur is None:
+        if interactif:
+            compteur = saisir_compteur()
+        else:
+            compteur = ParametresCompteur()
+
+    if config is None:
+        config = ConfigAnalyse()
+
+    # Défauts réalistes pour persistance et fuites (évite biais optimiste)
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+    if params_fuites is None:
+        params_fuites = FUITES_SANS_COUT
+
+    if config.afficher_cadre_quebec:
+        afficher_ordres_grandeur_quebec()
+
+    # Exécuter modèle
+    print("\n" + "=" * 80)
+    print("Exécution du modèle...")
+    print(f"Persistance: {persistance.nom}")
+    print(f"Fuites: {params_fuites.nom}")
+    if config_echelle and config_echelle.activer:
+        print("Économies d'échelle: ACTIVÉES")
+    else:
+        print("Économies d'échelle: DÉSACTIVÉES")
+    print("=" * 80)
+
+    res = executer_modele(params, compteur, config_echelle,
+                          persistance=persistance, params_fuites=params_fuites)
+    afficher_resume(res)
+
+    # Tests de validation
+    executer_tests_validation()
+
+    # Comparaison des 3 types
+    if config.afficher_comparaison_types:
+        print("\n" + "=" * 80)
+        print(" " * 25 + "COMPARAISON DES TYPES")
+        if config_echelle and config_echelle.activer:
+            print(" " * 20 + "(avec économies d'échelle)")
+        print("=" * 80)
+
+        df_types = comparer_types_compteurs(params, compteur, config_echelle)
+        afficher_comparaison_types(df_types)
+
+        print("Graphique: Comparaison des types...")
+        graphique_comparaison_types(df_types)
+        plt.show()
+
+    # Graphiques principaux
+    print("\n" + "=" * 80)
+    print(" " * 25 + "VISUALISATIONS")
+    print("=" * 80 + "\n")
+
+    if config.afficher_van_cumulative:
+        print("Graphique: VAN cumulative...")
+        graphique_van_cumulative(res)
+        plt.show()
+
+    if config.afficher_cascade:
+        print("Graphique: Cascade VAN...")
+        graphique_cascade(res)
+        plt.show()
+
+    # Analyses de sensibilité
+    print("\n" + "=" * 80)
+    print(" " * 20 + "ANALYSES DE SENSIBILITÉ")
+    print("=" * 80 + "\n")
+
+    delta = config.delta_sensibilite
+
+    print(f"Sensibilité univariée (±{delta:.0f}%)...")
+    df_sens = sensibilite_univariee(params, compteur, delta)
+
+    print(f"\n{'=' * 80}")
+    print(f"SENSIBILITÉ UNIVARIÉE (±{delta:.0f}%)")
+    print("=" * 80)
+    print(df_sens.to_string(index=False))
+    print()
+
+    if config.afficher_tornade:
+        print("Graphique: Tornade...")
+        graphique_tornade(df_sens, delta, f"Diagramme Tornade — VAN (±{delta:.0f}%)")
+        plt.show()
+
+    if config.afficher_araignee:
+        print("Graphique: Araignée...")
+        graphique_araignee(df_sens, res.van, f"Sensibilité VAN (±{delta:.0f}%)")
+        plt.show()
+
+    if config.afficher_elasticite:
+        print("Élasticités...")
+        df_elas = table_elasticite(params, compteur)
+
+        print(f"\n{'=' * 80}")
+        print("ÉLASTICITÉS")
+        print("=" * 80)
+        print(df_elas.to_string(index=False))
+        print()
+
+    if config.afficher_scenarios:
+        print("Scénarios...")
+        df_scen = analyse_scenarios(params, compteur)
+
+        print(f"\n{'=' * 80}")
+        print("COMPARAISON DES SCÉNARIOS")
+        print("=" * 80)
+        print(df_scen.to_string(index=False))
+        print()
+
+        graphique_scenarios(df_scen)
+        plt.show()
+
+    # Résumé final
+    print("\n" + "=" * 80)
+    print(" " * 30 + "ANALYSE TERMINÉE")
+    print("=" * 80)
+
+    print("\nRÉSULTATS CLÉS:")
+    print("-" * 80)
+    print(f"  VAN:                    {fmt_argent(res.van):>20}")
+    print(f"  Ratio B/C:              {res.rbc:>20.2f}")
+    recup = f"{res.periode_recuperation:.1f} ans" if np.isfinite(res.periode_recuperation) else "Jamais"
+    print(f"  Récupération:           {recup:>20}")
+    print(f"  LCSW:                   {res.lcsw:>19.2f} $/m³")
+    print(f"  Économies/ménage:       {res.economie_totale_menage:>19.1f} m³/an")
+
+    print("\nRECOMMANDATION:")
+    print("-" * 80)
+    if res.van > 0 and res.rbc > 1.0:
+        print("  PROJET ÉCONOMIQUEMENT VIABLE")
+        print("  Les bénéfices sociétaux dépassent les coûts.")
+    elif res.van > 0:
+        print("  PROJET MARGINAL — Attention aux risques")
+    else:
+        print("  PROJET NON JUSTIFIÉ ÉCONOMIQUEMENT")
+        print("  Considérer: augmenter la valeur de l'eau ou réduire les coûts")
+
+    print("\n" + "=" * 80 + "\n")
+
+    return res
+
+
+# =============================================================================
+# POINT D'ENTRÉE
+# =============================================================================
+
+if __name__ == "__main__":
+    executer_analyse_complete(interactif=True)
@@ -0,0 +1,3620 @@
+# -*- coding: utf-8 -*-
+"""
+Moteur du modèle: structures de paramètres et calcul de la VAN.
+
+Contient ce dont executer_modele() a besoin:
+- paramètres (ParametresModele, ParametresCompteur, ParametresValeurEau, ...)
+- modules persistance, fuites (privées et réseau), adoption, segmentation
+- trajectoires B[t], C[t], actualisation et VAN cumulative
+- préréglages utilisés comme valeurs par défaut par le moteur
+  (VALEUR_EAU_QUEBEC, VENTILATION_OPEX_STANDARD, FUITES_CONTEXTE_QUEBEC,
+  ADOPTION_OBLIGATOIRE)
+
+Les autres préréglages sont dans presets.py.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+from enum import Enum
+
+import numpy as np
+
+from ._differe import pd
+
+
+# =============================================================================
+# INSTRUMENTATION: CHRONOMÉTRAGE DES ÉTAPES (optionnel)
+# =============================================================================
+#
+# Désactivé par défaut: etape() retourne un contexte vide (coût négligeable).
+# Activé dans un bloc `with chronometrer_etapes() as durees:`, chaque étape
+# du pipeline ajoute sa durée (ms, cumulée si appelée plusieurs fois) au
+# dictionnaire `durees`. Le ContextVar isole les requêtes concurrentes.
+#
+# Les étapes sont imbriquées: calculer_dynamique_fuites est incluse dans
+# generer_trajectoires.
+
+_DUREES_ETAPES: ContextVar[Optional[dict]] = ContextVar("durees_etapes", default=None)
+_ETAPE_INACTIVE = nullcontext()
+
+
+class _EtapeChronometree:
+    """Contexte qui ajoute la durée écoulée (ms) à durees[nom]."""
+
+    __slots__ = ("durees", "nom", "debut")
+
+    def __init__(self, durees: dict, nom: str):
+        self.durees = durees
+        self.nom = nom
+
+    def __enter__(self):
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self.debut) * 1000.0
+        self.durees[self.nom] = self.durees.get(self.nom, 0.0) + ms
+        return False
+
+
+def etape(nom: str):
+    """Chronométrer une étape si le chronométrage est actif (sinon no-op)."""
+    durees = _DUREES_ETAPES.get()
+    if durees is None:
+        return _ETAPE_INACTIVE
+    return _EtapeChronometree(durees, nom)
+
+
+@contextmanager
+def chronometrer_etapes():
+    """
+    Activer le chronométrage des étapes pour le bloc courant.
+
+    Exemple:
+        with chronometrer_etapes() as durees:
+            executer_modele(params, compteur)
+        # durees == {"calculer_economies_eau": 0.01, "generer_trajectoires": 0.4, ...}
+    """
+    durees: dict = {}
+    jeton = _DUREES_ETAPES.set(durees)
+    try:
+        yield durees
+    finally:
+        _DUREES_ETAPES.reset(jeton)
+
+
+# =============================================================================
+# ÉNUMÉRATIONS ET TYPES
+# =============================================================================
+
+class TypeCompteur(Enum):
+    """Type de technologie de compteur."""
+    AMI = "ami"        # Infrastructure de comptage avancée (intelligent, temps réel)
+    AMR = "amr"        # Lecture automatisée (tournées en véhicule)
+    MANUEL = "manuel"  # Lecture manuelle traditionnelle
+
+
+# =============================================================================
+# MODULE PERSPECTIVES : ÉCONOMIQUE vs FINANCIER
+# =============================================================================
+#
+# Ce module implémente la distinction fondamentale en économie publique entre:
+#
+# 1. ANALYSE ÉCONOMIQUE (bien-être social / welfare economics)
+#    - Perspective: société dans son ensemble
+#    - Question: "Ce projet améliore-t-il le bien-être collectif?"
+#    - Valorisation de l'eau: coût d'opportunité social (externalités incluses)
+#    - Transferts: neutres (pas de module tarification dans ce modèle)
+#    - Coûts: tous les coûts réels (peu importe qui paie)
+#
+# 2. ANALYSE FINANCIÈRE (budget municipal / cash flow)
+#    - Perspective: service d'eau municipal
+#    - Question: "Ce projet est-il viable pour le budget de la ville?"
+#    - Valorisation de l'eau: coût variable évité (chimie, énergie, pompage)
+#    - Bénéfices: économies d'eau × coût variable (pas de tarification volumétrique)
+#    - Coûts: seulement ceux supportés par la ville
+#
+# Références théoriques:
+# - Boardman et al. (2018) Cost-Benefit Analysis: Concepts and Practice
+# - Zerbe & Bellas (2006) A Primer for Benefit-Cost Analysis
+# - Treasury Board of Canada (2007) Canadian Cost-Benefit Analysis Guide
+#
+# =============================================================================
+
+class ModeCompte(Enum):
+    """
+    Mode de comptabilité pour l'analyse coûts-bénéfices.
+
+    ECONOMIQUE: Analyse de bien-être social (welfare economics)
+        - Utilise la valeur sociale de l'eau (coût d'opportunité + externalités)
+        - Tous les coûts sont comptés (peu importe qui paie)
+        - Répond à: "Ce projet améliore-t-il le bien-être collectif?"
+
+    FINANCIER: Analyse budgétaire municipale
+        - Utilise le coût variable évité (OPEX réel de la ville)
+        - Seuls les coûts supportés par la ville sont comptés
+        - Répond à: "Ce projet est-il viable financièrement pour la ville?"
+
+    Note: Ce modèle ne comprend pas de module tarification volumétrique.
+    Les bénéfices proviennent des économies d'eau (comportement + fuites).
+    """
+    ECONOMIQUE = "economique"
+    FINANCIER = "financier"
+
+
+@dataclass
+class ParametresValeurEau:
+    """
+    Paramètres de valorisation de l'eau selon la perspective d'analyse.
+
+    Cette structure permet de séparer clairement:
+    - Le COÛT COMPLET de fourniture (Full Financial Cost) pour l'analyse économique
+    - Le coût VARIABLE évité (pour l'analyse financière municipale)
+
+    La distinction est cruciale car:
+    - Coût complet >> coût variable (inclut OPEX fixe + CAPEX)
+    - Un projet peut être socialement rentable mais financièrement déficitaire
+      (justifiant une subvention publique)
+
+    Valeurs par défaut calibrées pour le Québec:
+    - Coût complet: 4.69 $/m³ (source: MAMH/SQEEP 2019-2025)
+    - Coût variable: 0.50 $/m³ (chimie, énergie, pompage - OPEX variable)
+
+    DÉCOMPOSITION DU COÛT COMPLET (v3.11 - corrigé janvier 2026):
+    ───────────────────────────────────────────────────────────────
+    Le coût de 4.69 $/m³ est le COÛT FINANCIER COMPLET de fourniture
+    du service d'eau (Full Financial Cost), PAS une "valeur sociale"
+    avec externalités environnementales.
+
+    Source: MAMH, Stratégie québécoise d'économie d'eau potable 2019-2025
+    https://www.quebec.ca/gouvernement/ministere/affaires-municipales/publications/strategie-economie-potable
+    "Le coût unitaire des services d'eau équivaut à 4,69 $/m³"
+    "Les besoins en investissements représentent 63% du coût total"
+
+    1. OPEX VARIABLE (0.50 $/m³) — 11% du coût total
+       - Chimie de traitement eau potable et eaux usées
+       - Énergie de pompage (distribution et collecte)
+       - Consommables et coûts variables d'exploitation
+       Source: MAMH rapports financiers municipaux
+
+    2. OPEX FIXE (1.24 $/m³) — 26% du coût total
+       - Salaires des employés (cols bleus, ingénieurs, admin)
+       - Chauffage/entretien des usines de traitement
+       - Analyses laboratoire, frais administratifs
+       - Maintenance courante (non capitalisable)
+       Note: Coûts engagés peu importe le volume produit
+
+    3. CAPEX / COÛTS EN CAPITAL (2.95 $/m³) — 63% du coût total
+       - Amortissement des actifs (usines, conduites, réservoirs)
+       - Service de la dette municipale (eau/égout)
+       - Déficit d'entretien accumulé (rattrapage infrastructures)
+       - Capacité évitée dans les agrandissements futurs
+       Source: MAMH "63% du coût total = besoins en investissements"
+
+    TOTAL: 0.50 + 1.24 + 2.95 = 4.69 $/m³
+
+    NOTE MÉTHODOLOGIQUE:
+    ────────────────────
+    Ce 4.69 $ n'inclut PAS d'externalités environnementales explicites.
+    C'est le coût comptable réel pour les municipalités. L'argument
+    économique est: "Chaque m³ économisé = 4.69 $ de coûts évités pour
+    la ville, libérant des fonds pour d'autres services publics."
+
+    Si vous souhaitez ajouter des externalités environnementales
+    (carbone, écosystèmes), utilisez VALEUR_EAU_RARETE qui inclut
+    une prime de rareté/environnement.
+    """
+    # === COÛT COMPLET DE FOURNITURE (Full Financial Cost) ===
+    # Voir décomposition MAMH/SQEEP ci-dessus
+
+    # Composante 1: OPEX Variable (11%)
+    cout_variable_m3: float = 0.50  # $/m³ — chimie, énergie, consommables
+
+    # Composante 2: OPEX Fixe (26%)
+    cout_opex_fixe_m3: float = 1.24  # $/m³ — salaires, admin, maintenance courante
+
+    # Composante 3: CAPEX / Coûts en capital (63%)
+    cout_capex_m3: float = 2.95  # $/m³ — amortissement, dette, déficit entretien
+
+    # Coût complet total (somme des composantes)
+    # Note: Peut être surchargée directement si on a une valeur calibrée différente
+    valeur_sociale_m3: float = 4.69  # $/m³ — OPEX var + OPEX fixe + CAPEX
+
+    # Prix indicatif hors modèle (non utilisé sans tarification volumétrique)
+    # Conservé pour compatibilité si une analyse tarifaire est ajoutée plus tard.
+    prix_vente_m3: float = 2.50
+
+    # === COÛT MARGINAL DES FONDS PUBLICS (MCF) ===
+    # Le MCF représente le coût social de lever 1$ de taxes pour financer
+    # une dépense publique. Il capture les distorsions économiques causées
+    # par la taxation (perte sèche, coûts administratifs, effets comportementaux).
+    #
+    # Sources:
+    # - Treasury Board of Canada (2007): MCF = 0.20 (recommandation officielle)
+    # - Dahlby (2008) "The Marginal Cost of Public Funds": 0.15-0.30 selon pays
+    # - Boardman et al. (2018): 0.20-0.25 pour le Canada
+    #
+    # Application: en mode ÉCONOMIQUE, les dépenses publiques sont multipliées
+    # par (1 + mcf) pour refléter le vrai coût social du financement public.
+    mcf: float = 0.20
+
+    # Activer/désactiver l'application du MCF
+    #
+    # NOTE MÉTHODOLOGIQUE — DÉSACTIVÉ PAR DÉFAUT POUR LE QUÉBEC
+    # ─────────────────────────────────────────────────────────────
+    # Le MCF n'est pas appliqué par défaut pour les raisons suivantes:
+    # 1. Pas de standard provincial établi pour les projets municipaux québécois
+    # 2. Le projet pourrait être autofinancé par les économies d'eau réalisées
+    #    et des arbitrages budgétaires internes, sans recours additionnel
+    #    à la taxation foncière
+    # 3. Simplifie l'interprétation des résultats pour les décideurs municipaux
+    #
+    # RECOMMANDATION: Pour une analyse de sensibilité rigoureuse, présenter
+    # les résultats AVEC et SANS MCF en parallèle. Utiliser:
+    #   - Scénario de base: appliquer_mcf=False
+    #   - Sensibilité: appliquer_mcf=True, mcf=0.20 (Treasury Board Canada)
+    # ─────────────────────────────────────────────────────────────
+    appliquer_mcf: bool = False
+
+    # Métadonnées
+    nom: str = "Valeurs par défaut Québec"
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider les paramètres."""
+        if self.valeur_sociale_m3 < 0:
+            raise ValueError("valeur_sociale_m3 doit être >= 0")
+        if self.cout_variable_m3 < 0:
+            raise ValueError("cout_variable_m3 doit être >= 0")
+        if self.cout_variable_m3 > self.valeur_sociale_m3:
+            # Warning: généralement le coût variable < valeur sociale
+            pass  # On laisse passer, l'utilisateur peut avoir ses raisons
+        if not 0 <= self.mcf <= 1.0:
+            raise ValueError("mcf doit être entre 0 et 1 (typiquement 0.15-0.30)")
+
+    def valeur_eau(self, mode: ModeCompte) -> float:
+        """Retourner la valeur de l'eau selon le mode d'analyse."""
+        if mode == ModeCompte.ECONOMIQUE:
+            return self.valeur_sociale_m3
+        else:
+            return self.cout_variable_m3
+
+    def facteur_mcf(self, mode: ModeCompte) -> float:
+        """
+        Retourner le facteur multiplicatif pour les dépenses publiques.
+
+        En mode ÉCONOMIQUE avec MCF activé: (1 + mcf)
+        Sinon: 1.0 (pas de majoration)
+        """
+        if mode == ModeCompte.ECONOMIQUE and self.appliquer_mcf:
+            return 1.0 + self.mcf
+        return 1.0
+
+    def ajuster_cout_public(self, cout: float, mode: ModeCompte) -> float:
+        """
+        Ajuster un coût public pour refléter le MCF.
+
+        Paramètres:
+            cout: Coût brut ($)
+            mode: Mode de comptabilité
+
+        Retourne:
+            Coût ajusté = cout × (1 + mcf) en mode économique, cout sinon
+        """
+        return cout * self.facteur_mcf(mode)
+
+    # === ALIAS DE RÉTROCOMPATIBILITÉ (v3.11) ===
+    # Ces propriétés permettent au code existant utilisant les anciens noms
+    # de continuer à fonctionner après la correction de nomenclature.
+
+    @property
+    def cout_infrastructure_m3(self) -> float:
+        """Alias rétrocompatible pour cout_capex_m3."""
+        return self.cout_capex_m3
+
+    @property
+    def valeur_externalites_m3(self) -> float:
+        """Alias rétrocompatible pour cout_opex_fixe_m3.
+
+        Note: L'ancien nom était incorrect - ce n'était pas des externalités
+        environnementales mais des coûts fixes opérationnels.
+        """
+        return self.cout_opex_fixe_m3
+
+
+# =============================================================================
+# VALEUR DE L'EAU PAR DÉFAUT (autres préréglages: presets.py)
+# =============================================================================
+
+# Valeurs par défaut (Québec, MAMH/SQEEP 2019-2025)
+VALEUR_EAU_QUEBEC = ParametresValeurEau(
+    # Décomposition du coût complet (voir documentation ParametresValeurEau)
+    # Source: MAMH "coût unitaire des services d'eau = 4,69 $/m³"
+    # Source: MAMH "63% du coût total = besoins en investissements (CAPEX)"
+    cout_variable_m3=0.50,       # OPEX variable (11%) — chimie, énergie
+    cout_opex_fixe_m3=1.24,      # OPEX fixe (26%) — salaires, admin
+    cout_capex_m3=2.95,          # CAPEX (63%) — amortissement, dette, déficit
+    valeur_sociale_m3=4.69,      # Total = 0.50 + 1.24 + 2.95
+    prix_vente_m3=2.50,          # Prix indicatif hors modèle
+    mcf=0.20,                    # MCF Canada (Treasury Board 2007)
+    appliquer_mcf=False,         # Désactivé par défaut
+    nom="Québec MAMH",
+    description="Coût complet MAMH/SQEEP 2019-2025 (4,69 $/m³)",
+)
+
+
+# =============================================================================
+# ÉCONOMIES D'ÉCHELLE
+# =============================================================================
+
+@dataclass
+class ConfigEconomiesEchelle:
+    """
+    Configuration des économies d'échelle.
+
+    Basé sur la littérature et données empiriques:
+    - Winnipeg: 221,000 compteurs → ~$611/compteur
+    - Toronto: 465,000 compteurs → économies significatives
+    - Règle générale: 15-25% de réduction pour très grands volumes
+
+    Modèle: réduction par paliers ou continue (logarithmique)
+    """
+    activer: bool = False  # Interrupteur ON/OFF
+
+    # Intensité des économies d'échelle par composante (0 = aucune, 1 = pleine)
+    # Hypothèse conservatrice: la main-d'œuvre n'a pas (ou peu) d'économies d'échelle.
+    poids_compteur: float = 1.0
+    poids_reseau: float = 0.5
+    poids_installation: float = 0.0
+
+    # Paliers de réduction (nb_compteurs: facteur)
+    # facteur = 1.0 signifie pas de réduction
+    paliers: dict = field(default_factory=lambda: {
+        0:       1.00,   # < 10k: pas de réduction
+        10_000:  0.95,   # 10k-50k: -5%
+        50_000:  0.90,   # 50k-100k: -10%
+        100_000: 0.85,   # 100k-200k: -15%
+        200_000: 0.80,   # > 200k: -20%
+    })
+
+    # Alternative: modèle continu (logarithmique)
+    utiliser_modele_continu: bool = False
+    # Paramètres du modèle continu: facteur = 1 - elasticite * ln(nb/nb_ref)
+    elasticite_echelle: float = 0.05  # ~5% réduction par doublement
+    nb_reference: int = 10_000        # point de référence (facteur = 1.0)
+
+    def __post_init__(self):
+        """Valider les intensités d'échelle."""
+        for attr in ("poids_compteur", "poids_reseau", "poids_installation"):
+            valeur = getattr(self, attr)
+            if not 0.0 <= valeur <= 1.0:
+                raise ValueError(f"{attr} doit être entre 0 et 1")
+
+
+def calculer_facteur_echelle(
+    nb_compteurs: int,
+    config: ConfigEconomiesEchelle
+) -> float:
+    """
+    Calculer le facteur de réduction dû aux économies d'échelle.
+
+    Paramètres:
+        nb_compteurs: Nombre de compteurs à installer
+        config: Configuration des économies d'échelle
+
+    Retourne:
+        Facteur multiplicatif (ex: 0.85 = -15% de réduction)
+    """
+    if not config.activer:
+        return 1.0
+
+    if config.utiliser_modele_continu:
+        # Modèle logarithmique continu
+        if nb_compteurs <= 0:
+            return 1.0
+        import math
+        ratio = nb_compteurs / config.nb_reference
+        if ratio <= 1:
+            return 1.0
+        facteur = 1.0 - config.elasticite_echelle * math.log(ratio)
+        return max(0.70, min(1.0, facteur))  # Borner entre 0.70 et 1.0
+    else:
+        # Modèle par paliers
+        facteur = 1.0
+        for seuil, f in sorted(config.paliers.items()):
+            if nb_compteurs >= seuil:
+                facteur = f
+        return facteur
+
+
+def appliquer_facteur_echelle(facteur_base: float, poids: float) -> float:
+    """
+    Appliquer un facteur d'échelle partiel.
+
+    poids = 0.0 → aucune économie, poids = 1.0 → plein facteur.
+    """
+    poids_borne = max(0.0, min(1.0, poids))
+    return 1.0 - (1.0 - facteur_base) * poids_borne
+
+
+# =============================================================================
+# VENTILATION OPEX AMI (COÛTS NON TECHNIQUES)
+# =============================================================================
+#
+# Les compteurs AMI génèrent des coûts d'exploitation au-delà de la maintenance
+# matérielle. Cette ventilation détaille les composantes OPEX typiques.
+#
+# Sources:
+# - AWWA (2019) Smart Water Metering Implementation Guidelines
+# - UK Water Industry Research (2020) AMI Operational Costs Study
+# - Itron (2022) Total Cost of Ownership Analysis
+#
+# =============================================================================
+
+@dataclass
+class VentilationOPEX:
+    """
+    Ventilation détaillée des coûts d'exploitation AMI.
+
+    Les pourcentages représentent la répartition du coût OPEX total
+    entre les différentes composantes non techniques.
+
+    Valeurs par défaut basées sur benchmarks industrie (2023):
+    - Cybersécurité: 15% (audits, patches, monitoring SOC)
+    - Licences logiciels: 20% (MDMS, analytics, portail client)
+    - Stockage données: 10% (cloud/on-premise, rétention 5-10 ans)
+    - Service client: 25% (support hotline, gestion alertes, réclamations)
+    - Intégration SI: 30% (interfaces ERP/SIG/CRM, maintenance API)
+    """
+    # Composantes en % du coût OPEX total
+    cybersecurite_pct: float = 0.15
+    licences_logiciels_pct: float = 0.20
+    stockage_donnees_pct: float = 0.10
+    service_client_pct: float = 0.25
+    integration_si_pct: float = 0.30
+
+    # Métadonnées
+    nom: str = "Ventilation OPEX par défaut"
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider que les pourcentages somment à 100%."""
+        total = (
+            self.cybersecurite_pct
+            + self.licences_logiciels_pct
+            + self.stockage_donnees_pct
+            + self.service_client_pct
+            + self.integration_si_pct
+        )
+        if abs(total - 1.0) > 0.001:
+            raise ValueError(
+                f"Les pourcentages doivent sommer à 100%, obtenu {total*100:.1f}%"
+            )
+
+    def ventiler(self, cout_opex_total: float) -> dict:
+        """
+        Ventiler un coût OPEX total entre les composantes.
+
+        Paramètres:
+            cout_opex_total: Coût OPEX annuel total ($)
+
+        Retourne:
+            Dictionnaire avec le détail par composante
+        """
+        return {
+            "cybersecurite": cout_opex_total * self.cybersecurite_pct,
+            "licences_logiciels": cout_opex_total * self.licences_logiciels_pct,
+            "stockage_donnees": cout_opex_total * self.stockage_donnees_pct,
+            "service_client": cout_opex_total * self.service_client_pct,
+            "integration_si": cout_opex_total * self.integration_si_pct,
+            "total": cout_opex_total,
+        }
+
+    def to_dataframe(self, cout_opex_total: float) -> pd.DataFrame:
+        """Retourner la ventilation sous forme de DataFrame."""
+        ventilation = self.ventiler(cout_opex_total)
+        del ventilation["total"]
+        df = pd.DataFrame([
+            {"Composante": k.replace("_", " ").title(), "Coût ($)": v, "Part (%)": v/cout_opex_total*100}
+            for k, v in ventilation.items()
+        ])
+        return df
+
+
+# Ventilation par défaut (autres préréglages: presets.py)
+VENTILATION_OPEX_STANDARD = VentilationOPEX(
+    nom="Standard",
+    description="Répartition typique basée sur benchmarks industrie",
+)
+
+
+# =============================================================================
+# PARAMÈTRES DU MODÈLE
+# =============================================================================
+
+@dataclass
+class ParametresCompteur:
+    """
+    Paramètres spécifiques au type de compteur.
+
+    Coûts typiques (2024 CAD):
+    - Compteur mécanique simple: $50-100
+    - Compteur AMR (avec transmetteur): $150-250
+    - Compteur AMI (intelligent): $200-350
+    - Installation plombier: 1-3h × $100-150/h
+    """
+    type_compteur: TypeCompteur = TypeCompteur.AMI
+
+    # Coût du compteur lui-même ($)
+    cout_compteur: float = 250.0
+
+    # Installation
+    heures_installation: float = 1.5      # heures par compteur
+    taux_horaire_installation: float = 125.0  # $/h (plombier)
+
+    # Infrastructure réseau (AMI seulement)
+    # Modèle: CAPEX_reseau = cout_infra_fixe + cout_reseau_par_compteur × nb_compteurs
+    cout_infra_fixe: float = 0.0           # Coût fixe (backbone IT, intégration) - défaut 0 pour rétrocompat
+    cout_reseau_par_compteur: float = 50.0  # Coût variable (passerelles, antennes, etc.)
+
+    # Durée de vie
+    duree_vie_compteur: int = 20          # années
+    duree_vie_batterie: int = 15          # années (AMI/AMR)
+    cout_remplacement_batterie: float = 30.0
+
+    # Coûts d'exploitation annuels par compteur
+    cout_lecture_manuel: float = 25.0     # $/compteur/an (lecture manuelle)
+    cout_maintenance_ami: float = 5.0     # $/compteur/an (maintenance terrain)
+    cout_maintenance_amr: float = 8.0     # $/compteur/an
+    cout_maintenance_manuel: float = 3.0  # $/compteur/an
+
+    # OPEX AMI non technique (cyber, logiciels, stockage, télécom, etc.)
+    # ─────────────────────────────────────────────────────────────────
+    # Ventilation typique pour 15$/compteur/an:
+    #   - Télécom/données cellulaires: ~5$/an
+    #   - Cybersécurité (Loi 25 QC): ~3$/an
+    #   - Licences MDMS/analytics: ~4$/an
+    #   - Stockage cloud/backup: ~2$/an
+    #   - Support client/portail: ~1$/an
+    #
+    # Fourchettes observées: 10$ (bas) — 15$ (médian) — 25$ (haut/Loi 25)
+    # Source: Winnipeg AMI business case, AWWA M6, estimations fournisseurs
+    # ─────────────────────────────────────────────────────────────────
+    cout_opex_non_tech_ami: float = 15.0  # $/compteur/an (défaut réaliste)
+    ventilation_opex_ami: VentilationOPEX = field(
+        default_factory=lambda: VENTILATION_OPEX_STANDARD
+    )
+
+    # Frais de lecture AMR (tournées en véhicule)
+    cout_lecture_amr: float = 8.0         # $/compteur/an
+
+    # === FACTEURS D'EFFICACITÉ PAR TYPE DE COMPTEUR (NOUVEAU v3.8) ===
+    # Multiplicateurs relatifs à l'AMI (référence = 1.0)
+    # Sources: Davies 2014, Beal 2011, Britton 2013, Winnipeg 2023
+    #
+    # Justification empirique:
+    # - AMI: Feedback temps réel + portail client + alertes → effet maximal
+    # - AMR: Lecture mensuelle, feedback amélioré vs manuel
+    # - Manuel: Lecture annuelle, feedback retardé, détection fuites lente
+    #
+    # Réduction comportementale typique: Manuel 4-6%, AMR 6-8%, AMI 8-12%
+    # Détection fuites typique: Manuel 60-70%, AMR 75-80%, AMI 85-95%
+    facteur_efficacite_comportement: float = 1.0  # Multiplicateur réduction comportementale
+    facteur_efficacite_fuites: float = 1.0        # Multiplicateur détection fuites
+
+    def __post_init__(self):
+        """Appliquer les facteurs d'efficacité par défaut selon le type de compteur.
+
+        Justification des facteurs (janvier 2026):
+        ------------------------------------------
+
+        AMI (référence = 1.0):
+        - Détection fuites en temps réel (horaire), alertes proactives aux clients
+        - EBMUD California: -20% consommation avec AMI (Water Online, 2024)
+        - AWE Study: fuites résolues 116h plus tôt avec alertes AMI
+        - American Water pilot: non-revenue water 25% → 12%
+
+        AMR (facteurs réduits vs estimations initiales):
+        - Lecture mensuelle/trimestrielle, PAS de détection temps réel
+        - Une fuite peut couler 30+ jours avant détection vs ~1 jour AMI
+        - Pas d'alertes proactives aux clients → moins de changement comportemental
+        - Sources:
+          * Badger Meter: "AMR systems aren't able to fully eliminate leaks"
+          * EPA WaterSense: AMI "quickly identify leaks" vs AMR periodic reads
+          * Texas Water Utilities: NRW 92%→38% seulement possible avec AMI
+
+        Manuel (facteurs les plus bas):
+        - Lecture annuelle/semestrielle, aucune détection proactive
+        - Client découvre fuite seulement via facture élevée (délai 3-6 mois)
+        - Aucun feedback comportemental entre les lectures
+        """
+        # Ne pas écraser si des valeurs personnalisées ont été fournies
+        if self.facteur_efficacite_comportement == 1.0 and self.facteur_efficacite_fuites == 1.0:
+            if self.type_compteur == TypeCompteur.MANUEL:
+                # Manuel: lecture annuelle, détection très tardive des fuites
+                # Comportement: 40% de l'effet AMI (pas de feedback régulier)
+                # Fuites: 30% de l'effet AMI (délai détection 3-6 mois vs 1 jour)
+                self.facteur_efficacite_comportement = 0.40
+                self.facteur_efficacite_fuites = 0.30
+            elif self.type_compteur == TypeCompteur.AMR:
+                # AMR: lecture mensuelle, pas d'alertes temps réel
+                # Comportement: 60% de l'effet AMI (feedback mensuel vs continu)
+                # Fuites: 50% de l'effet AMI (délai détection ~30j vs 1j)
+                # Ratio basé sur: délai détection AMR/AMI ≈ 30j/1j, mais certaines
+                # fuites grosses détectées quand même → facteur 0.50 pas 0.03
+                self.facteur_efficacite_comportement = 0.60
+                self.facteur_efficacite_fuites = 0.50
+            # AMI: facteurs = 1.0 (référence, détection temps réel)
+        if self.cout_opex_non_tech_ami < 0:
+            raise ValueError("cout_opex_non_tech_ami doit être >= 0")
+
+    @property
+    def cout_installation(self) -> float:
+        """Coût d'installation par compteur."""
+        return self.heures_installation * self.taux_horaire_installation
+
+    @property
+    def cout_initial_par_compteur(self) -> float:
+        """Coût initial total par compteur (équipement + installation)."""
+        base = self.cout_compteur + self.cout_installation
+        if self.type_compteur == TypeCompteur.AMI:
+            base += self.cout_reseau_par_compteur
+        return base
+
+    @property
+    def cout_exploitation_annuel(self) -> float:
+        """Coût d'exploitation annuel par compteur."""
+        if self.type_compteur == TypeCompteur.AMI:
+            return self.cout_maintenance_ami + self.cout_opex_non_tech_ami
+        elif self.type_compteur == TypeCompteur.AMR:
+            return self.cout_maintenance_amr + self.cout_lecture_amr
+        else:  # MANUEL
+            return self.cout_maintenance_manuel + self.cout_lecture_manuel
+
+    def opex_ami_non_tech_detail(self) -> dict:
+        """Détail de l'OPEX AMI non technique selon la ventilation."""
+        return self.ventilation_opex_ami.ventiler(self.cout_opex_non_tech_ami)
+
+
+@dataclass
+class ParametresModele:
+    """
+    Paramètres principaux du modèle coûts-bénéfices.
+
+    Valeurs par défaut basées sur:
+    - Données Québec/Canada
+    - Étude Winnipeg (2023)
+    - Littérature scientifique
+    """
+    # Population et ménages
+    nb_menages: int = 10_000
+    nb_compteurs: Optional[int] = None  # Nombre de compteurs (si différent des ménages)
+    taille_menage: float = 2.1            # personnes/ménage
+
+    # Consommation d'eau
+    lpcd: float = 250.0                   # litres/personne/jour (moyenne résidentielle Québec, MAMH 2023)
+
+    # Paramètres de fuite
+    part_menages_fuite_pct: float = 20.0  # % ménages avec fuite détectée
+    debit_fuite_m3_an: float = 35.0       # m³/an si fuite
+    taux_correction_fuite_pct: float = 85.0  # % fuites corrigées
+
+    # Changement comportemental
+    reduction_comportement_pct: float = 8.0  # % réduction usage base
+
+    # Valeur économique de l'eau
+    valeur_eau_m3: float = 4.69           # $/m³ (coût social/long terme)
+
+    # Report d'infrastructure (optionnel)
+    benefice_report_infra_annuel: float = 0.0  # $/an (défaut = non utilisé)
+    benefice_report_infra_par_m3: float = 0.0  # $/m³ économisé (lié aux économies)
+
+    # Paramètres financiers
+    # Taux d'actualisation: 3% réel (cohérent avec projets infrastructure long terme Québec)
+    # Sources: Guide d'analyse avantages-coûts MAMH; pratique courante projets municipaux
+    taux_actualisation_pct: float = 3.0   # % (taux social réel)
+    horizon_analyse: int = 20             # années
+    part_ville_capex_pct: float = 100.0   # % du CAPEX payé par la ville (mode financier)
+    part_ville_opex_pct: float = 100.0    # % de l'OPEX payé par la ville (mode financier)
+
+    def __post_init__(self):
+        """Valider les paramètres financiers."""
+        if self.nb_compteurs is not None and self.nb_compteurs <= 0:
+            raise ValueError("nb_compteurs doit être > 0 si fourni")
+        if self.benefice_report_infra_annuel < 0:
+            raise ValueError("benefice_report_infra_annuel doit être >= 0")
+        if self.benefice_report_infra_par_m3 < 0:
+            raise ValueError("benefice_report_infra_par_m3 doit être >= 0")
+        if not 0 <= self.part_ville_capex_pct <= 100:
+            raise ValueError("part_ville_capex_pct doit être entre 0 et 100")
+        if not 0 <= self.part_ville_opex_pct <= 100:
+            raise ValueError("part_ville_opex_pct doit être entre 0 et 100")
+
+    @property
+    def nb_personnes(self) -> int:
+        """Population totale."""
+        return int(self.nb_menages * self.taille_menage)
+
+    @property
+    def nb_compteurs_effectif(self) -> int:
+        """Nombre effectif de compteurs (défaut = nb_menages)."""
+        if self.nb_compteurs is None:
+            return self.nb_menages
+        return int(self.nb_compteurs)
+
+    def to_dict(self) -> dict:
+        """Convertir en dictionnaire."""
+        return {
+            'nb_menages': self.nb_menages,
+            'nb_compteurs': self.nb_compteurs,
+            'taille_menage': self.taille_menage,
+            'lpcd': self.lpcd,
+            'part_menages_fuite_pct': self.part_menages_fuite_pct,
+            'debit_fuite_m3_an': self.debit_fuite_m3_an,
+            'taux_correction_fuite_pct': self.taux_correction_fuite_pct,
+            'reduction_comportement_pct': self.reduction_comportement_pct,
+            'valeur_eau_m3': self.valeur_eau_m3,
+            'benefice_report_infra_annuel': self.benefice_report_infra_annuel,
+            'benefice_report_infra_par_m3': self.benefice_report_infra_par_m3,
+            'taux_actualisation_pct': self.taux_actualisation_pct,
+            'horizon_analyse': self.horizon_analyse,
+            'part_ville_capex_pct': self.part_ville_capex_pct,
+            'part_ville_opex_pct': self.part_ville_opex_pct,
+        }
+
+
+# =============================================================================
+# RÉSULTATS DU MODÈLE
+# =============================================================================
+
+@dataclass
+class ResultatsModele:
+    """Résultats complets de l'analyse coûts-bénéfices."""
+    # Références
+    params: ParametresModele
+    compteur: ParametresCompteur
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE
+
+    # Économies d'eau (par ménage, m³/an — année 1)
+    usage_base_menage: float = 0.0
+    economie_fuite_menage: float = 0.0
+    economie_comportement_menage: float = 0.0
+    economie_reseau_menage: float = 0.0
+    economie_totale_menage: float = 0.0  # Année 1 seulement
+
+    # Économies d'eau totales sur l'horizon (m³)
+    economies_totales_horizon_m3: float = 0.0  # Somme sur T années, tous ménages
+
+    # Flux annuels totaux ($)
+    investissement_initial: float = 0.0
+    benefices_eau_annuels: float = 0.0
+    benefice_infra_annuel: float = 0.0
+    benefices_totaux_annuels: float = 0.0
+    couts_exploitation_annuels: float = 0.0
+
+    # Valeurs actualisées ($)
+    va_benefices: float = 0.0
+    va_benefices_eau: float = 0.0            # Valeur actualisée des économies d'eau (m³ × valeur)
+    va_benefices_report_infra: float = 0.0   # Valeur actualisée du report d'infra (paramètres dédiés)
+    va_benefices_cout_variable: float = 0.0  # Composante coût variable évité
+    va_benefices_infra_m3: float = 0.0       # Composante infrastructure (valeur sociale par m³)
+    va_benefices_externalites: float = 0.0   # Composante externalités (valeur sociale par m³)
+    va_economies_m3: float = 0.0             # Valeur actualisée des m³ économisés (dénominateur LCSW)
+    va_couts_exploitation: float = 0.0
+    va_couts_totaux: float = 0.0
+    van: float = 0.0
+
+    # Métriques
+    rbc: float = 0.0                      # Ratio Bénéfices-Coûts
+    eac_menage: float = 0.0               # Équivalent Annuel Coût/ménage
+    lcsw: float = 0.0                     # Coût nivelé eau économisée
+    seuil_rentabilite_m3: float = 0.0     # q* en m³/an
+
+    # Séries temporelles
+    annees: np.ndarray = field(default_factory=lambda: np.array([]))
+    van_cumulative: np.ndarray = field(default_factory=lambda: np.array([]))
+
+    # Période de récupération
+    periode_recuperation: float = float('inf')
+
+    # Économies d'échelle
+    economies_echelle_actives: bool = False
+    facteur_echelle: float = 1.0
+    facteur_echelle_compteur: float = 1.0
+    facteur_echelle_installation: float = 1.0
+    facteur_echelle_reseau: float = 1.0
+    cout_par_compteur_base: float = 0.0      # Avant économies d'échelle
+    cout_par_compteur_ajuste: float = 0.0    # Après économies d'échelle
+    economies_realisees: float = 0.0         # $ économisés grâce à l'échelle
+
+
+# =============================================================================
+# DÉCOMPOSITION PAR PAYEUR (v3.9)
+# =============================================================================
+
+@dataclass
+class ResultatsParPayeur:
+    """
+    Décomposition de la VAN par payeur: société, ville, ménages.
+
+    Cette structure permet de comprendre qui bénéficie (ou paie) le projet:
+    - VAN économique: bien-être social total (externalités incluses)
+    - VAN ville: perspective budget municipal (coûts/bénéfices ville)
+    - VAN ménages: perspective citoyens (coûts réparations, bénéfices directs non tarifaires)
+
+    Note: VAN_eco ≠ VAN_ville + VAN_menages car:
+    - VAN_eco inclut les externalités (environnement, infrastructure reportée)
+    - VAN_eco valorise l'eau à sa valeur sociale (4.69$/m³)
+    - VAN_ville et VAN_menages utilisent des valeurs financières différentes
+    """
+    # VAN globale économique (bien-être social)
+    van_economique: float = 0.0
+
+    # VAN ville (budget municipal)
+    # Inclut: CAPEX ville, OPEX ville, économies coût variable, coûts réparation ville
+    van_ville: float = 0.0
+    va_couts_ville: float = 0.0       # CAPEX + OPEX supportés par la ville
+    va_benefices_ville: float = 0.0   # Économies coût variable × m³ économisés
+
+    # VAN ménages (perspective citoyens)
+    # Inclut: CAPEX ménages, coûts réparation ménages, valeur économies (si tarif volumétrique)
+    van_menages: float = 0.0
+    va_couts_menages: float = 0.0     # CAPEX ménages + réparations
+    va_benefices_menages: float = 0.0 # Bénéfices directs (tarification hors périmètre)
+
+    # Externalités (incluses dans VAN_eco mais pas dans VAN_ville ni VAN_menages)
+    va_externalites: float = 0.0      # Environnement + infrastructure reportée
+
+    # Décomposition des bénéfices d'eau (VA, info)
+    va_benefices_cout_variable: float = 0.0
+    va_benefices_infra_m3: float = 0.0
+    va_benefices_externalites: float = 0.0
+    va_benefices_report_infra: float = 0.0
+
+    # Métadonnées
+    params: Optional[ParametresModele] = None
+
+
+def decomposer_par_payeur(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+) -> ResultatsParPayeur:
+    """
+    Calculer la VAN décomposée par payeur: société, ville, ménages.
+
+    Cette fonction exécute le modèle deux fois (économique + financier) et
+    calcule la part de chaque acteur.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration persistance
+        params_fuites: Configuration fuites
+        valeur_eau: Paramètres valeur eau
+        params_adoption: Stratégie d'adoption
+
+    Retourne:
+        ResultatsParPayeur avec la décomposition complète
+    """
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+    if params_fuites is None:
+        params_fuites = FUITES_CONTEXTE_QUEBEC
+
+    # 1. Exécuter en mode ÉCONOMIQUE (bien-être social)
+    res_eco = executer_modele(
+        params, compteur, config_echelle, persistance, params_fuites,
+        mode_compte=ModeCompte.ECONOMIQUE, valeur_eau=valeur_eau,
+        params_adoption=params_adoption,
+    )
+
+    # 2. Exécuter en mode FINANCIER (perspective ville)
+    res_fin = executer_modele(
+        params, compteur, config_echelle, persistance, params_fuites,
+        mode_compte=ModeCompte.FINANCIER, valeur_eau=valeur_eau,
+        params_adoption=params_adoption,
+    )
+
+    # 3. Calculer les composantes
+    part_ville_capex = params.part_ville_capex_pct / 100.0
+    part_ville_opex = params.part_ville_opex_pct / 100.0
+
+    # Coûts ville = (CAPEX × part_ville) + (OPEX × part_ville)
+    va_capex_ville = res_eco.investissement_initial * part_ville_capex
+    va_opex_ville = res_eco.va_couts_exploitation * part_ville_opex
+    va_couts_ville = va_capex_ville + va_opex_ville
+
+    # Coûts ménages = (CAPEX × part_menages) + réparations ménages
+    va_capex_menages = res_eco.investissement_initial * (1 - part_ville_capex)
+    va_opex_menages = res_eco.va_couts_exploitation * (1 - part_ville_opex)
+    # Les coûts de réparation des ménages sont inclus dans va_opex si applicable
+    va_couts_menages = va_capex_menages + va_opex_menages
+
+    # Bénéfices ville = économies coût variable (VA, cohérent avec trajectoires)
+    va_benefices_ville = res_eco.va_benefices_cout_variable
+
+    # Bénéfices ménages = gains monétaires directs (tarification hors périmètre)
+    # Au Québec sans tarification volumétrique, les ménages ne bénéficient pas directement.
+    # Réservé à un module futur si la tarification résidentielle est ajoutée.
+    va_benefices_menages = 0.0  # Pas de tarification volumétrique au Québec
+
+    # VAN ville = bénéfices ville - coûts ville
+    van_ville = va_benefices_ville - va_couts_ville
+
+    # VAN ménages = bénéfices ménages - coûts ménages
+    van_menages = va_benefices_menages - va_couts_menages
+
+    # Externalités = composantes sociales + report d'infra explicite (VA)
+    va_externalites = (
+        res_eco.va_benefices_infra_m3 +
+        res_eco.va_benefices_externalites +
+        res_eco.va_benefices_report_infra
+    )
+
+    return ResultatsParPayeur(
+        van_economique=res_eco.van,
+        van_ville=van_ville,
+        va_couts_ville=va_couts_ville,
+        va_benefices_ville=va_benefices_ville,
+        van_menages=van_menages,
+        va_couts_menages=va_couts_menages,
+        va_benefices_menages=va_benefices_menages,
+        va_externalites=va_externalites,
+        va_benefices_cout_variable=res_eco.va_benefices_cout_variable,
+        va_benefices_infra_m3=res_eco.va_benefices_infra_m3,
+        va_benefices_externalites=res_eco.va_benefices_externalites,
+        va_benefices_report_infra=res_eco.va_benefices_report_infra,
+        params=params,
+    )
+
+
+# =============================================================================
+# MODULE DYNAMIQUE : TRAJECTOIRES TEMPORELLES
+# =============================================================================
+#
+# Ce module transforme le modèle "annuité constante" en modèle dynamique
+# avec des séries temporelles B[t] et C[t] pour chaque année.
+#
+# Avantages:
+# - Permet la persistance décroissante des effets comportementaux α_B(t)
+# - Permet les stratégies d'adoption graduelles A(t)
+# - Permet les coûts de réparation variables dans le temps
+# - Garde la même interface publique (executer_modele)
+#
+# =============================================================================
+
+@dataclass
+class EconomiesEau:
+    """
+    Économies d'eau par ménage (m³/an).
+
+    Sépare les composantes pour éviter les double-comptes et permettre
+    la modélisation différenciée (ex: persistance comportementale vs fuites).
+    """
+    usage_base: float              # Consommation de base (m³/an)
+    usage_reductible: float        # Usage net des fuites (base comportementale)
+    economie_fuite: float          # Économies dues aux fuites corrigées
+    economie_comportement: float   # Économies comportementales
+
+    @property
+    def total(self) -> float:
+        """Économies totales par ménage (m³/an)."""
+        return self.economie_fuite + self.economie_comportement
+
+
+# =============================================================================
+# MODULE PERSISTANCE : DÉCROISSANCE DES EFFETS COMPORTEMENTAUX
+# =============================================================================
+#
+# Ce module modélise comment les effets comportementaux (réduction de
+# consommation suite à l'installation du compteur) évoluent dans le temps.
+#
+# Fondement théorique:
+# - Les études UK (programme de comptage universel) montrent une réduction significative (~22%) à 2 ans
+# - L'étude "Turn off the faucet" montre une persistance sur 12 mois
+# - Sans signal-prix (tarification volumétrique), l'effet peut s'estomper
+# - Avec feedback (AMI), l'effet peut se maintenir plus longtemps
+#
+# Trois scénarios:
+# - OPTIMISTE: Effets permanents (habitudes formées)
+# - RÉALISTE: Décroissance vers un plateau (partie des habitudes reste)
+# - PESSIMISTE: Fade-out progressif (retour aux anciennes habitudes)
+#
+# =============================================================================
+
+class ModePersistance(Enum):
+    """Mode de décroissance des effets comportementaux."""
+    CONSTANT = "constant"                    # Pas de décroissance
+    EXPONENTIEL_PLATEAU = "exp_plateau"      # Décroissance vers un plateau
+    FADEOUT_LINEAIRE = "fadeout_lin"         # Disparition linéaire
+    FADEOUT_EXPONENTIEL = "fadeout_exp"      # Disparition exponentielle
+
+
+@dataclass
+class ParametresPersistance:
+    """
+    Configuration de la persistance des effets comportementaux.
+
+    Modélise l'évolution de α_B(t) = réduction comportementale à l'année t.
+
+    Formules selon le mode:
+    - CONSTANT: α_B(t) = α₀
+    - EXPONENTIEL_PLATEAU: α_B(t) = α_∞ + (α₀ - α_∞) × e^(-λ(t-1))
+    - FADEOUT_LINEAIRE: α_B(t) = α₀ × max(0, 1 - (t-1)/(T_fade-1))
+    - FADEOUT_EXPONENTIEL: α_B(t) = α₀ × e^(-λ(t-1))
+
+    Paramètres:
+    - alpha_initial: Réduction initiale (année 1), en décimal (0.08 = 8%)
+    - alpha_plateau: Plateau long terme (pour mode exp_plateau)
+    - lambda_decay: Vitesse de décroissance (par an)
+    - annees_fadeout: Années jusqu'à extinction complète (mode fadeout_lin)
+    """
+    mode: ModePersistance = ModePersistance.CONSTANT
+    alpha_initial: float = 0.08       # 8% de réduction initiale
+    alpha_plateau: float = 0.025      # 2.5% de plateau long terme
+    lambda_decay: float = 0.15        # Demi-vie ~4.6 ans (Allcott & Rogers: 10-20%/an)
+    annees_fadeout: int = 10          # Années jusqu'à zéro (fadeout linéaire)
+
+    # Métadonnées pour affichage
+    nom: str = "Scénario par défaut"
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider les paramètres."""
+        if self.alpha_initial < 0 or self.alpha_initial > 1:
+            raise ValueError(f"alpha_initial doit être entre 0 et 1, reçu {self.alpha_initial}")
+        if self.alpha_plateau < 0 or self.alpha_plateau > self.alpha_initial:
+            raise ValueError(f"alpha_plateau doit être entre 0 et alpha_initial")
+        if self.lambda_decay < 0:
+            raise ValueError(f"lambda_decay doit être >= 0")
+        if self.annees_fadeout < 1:
+            raise ValueError(f"annees_fadeout doit être >= 1")
+
+
+def calculer_alpha_comportement(t: int, params: ParametresPersistance) -> float:
+    """
+    Calculer le coefficient de réduction comportementale α_B pour l'année t.
+
+    Paramètres:
+        t: Année (1, 2, 3, ...)
+        params: Paramètres de persistance
+
+    Retourne:
+        α_B(t) en décimal (ex: 0.08 = 8% de réduction)
+    """
+    if t < 1:
+        return 0.0
+
+    alpha_0 = params.alpha_initial
+    alpha_inf = params.alpha_plateau
+    lam = params.lambda_decay
+    T_fade = params.annees_fadeout
+
+    if params.mode == ModePersistance.CONSTANT:
+        # Pas de décroissance: α_B(t) = α₀
+        return alpha_0
+
+    elif params.mode == ModePersistance.EXPONENTIEL_PLATEAU:
+        # Décroissance exponentielle vers un plateau:
+        # α_B(t) = α_∞ + (α₀ - α_∞) × e^(-λ(t-1))
+        # À t=1: α_B = α₀ (plein effet)
+        # À t→∞: α_B → α_∞ (plateau)
+        return alpha_inf + (alpha_0 - alpha_inf) * math.exp(-lam * (t - 1))
+
+    elif params.mode == ModePersistance.FADEOUT_LINEAIRE:
+        # Disparition linéaire sur T_fade années:
+        # α_B(t) = α₀ × max(0, 1 - (t-1)/(T_fade-1))
+        # À t=1: α_B = α₀
+        # À t=T_fade: α_B = 0
+        if T_fade <= 1:
+            return alpha_0 if t == 1 else 0.0
+        ratio = (t - 1) / (T_fade - 1)
+        return alpha_0 * max(0.0, 1.0 - ratio)
+
+    elif params.mode == ModePersistance.FADEOUT_EXPONENTIEL:
+        # Disparition exponentielle vers zéro:
+        # α_B(t) = α₀ × e^(-λ(t-1))
+        # À t=1: α_B = α₀
+        # À t→∞: α_B → 0
+        return alpha_0 * math.exp(-lam * (t - 1))
+
+    else:
+        return alpha_0  # Fallback
+
+
+def generer_serie_alpha(params: ParametresPersistance, T: int) -> np.ndarray:
+    """
+    Générer la série complète α_B(t) pour t = 1..T.
+
+    Paramètres:
+        params: Paramètres de persistance
+        T: Horizon (nombre d'années)
+
+    Retourne:
+        Array de shape (T,) avec α_B pour chaque année
+    """
+    return np.array([calculer_alpha_comportement(t, params) for t in range(1, T + 1)])
+
+
+# =============================================================================
+# MODULE FUITES : COÛTS DE RÉPARATION ET PARTAGE
+# =============================================================================
+#
+# Ce module améliore le traitement des fuites en ajoutant:
+# 1. Les coûts de réparation (actuellement ignorés dans le modèle de base)
+# 2. Le partage des coûts entre la ville et les ménages
+# 3. La dynamique temporelle (stock actif + plateau)
+#
+# Fondement théorique:
+# - Les compteurs intelligents détectent les fuites (consommation continue)
+# - La détection n'est pas la réparation: il faut payer pour réparer
+# - Les fuites privées (après compteur) = responsabilité du ménage
+# - La ville peut offrir des subventions pour encourager les réparations
+#
+# Distinction importante:
+# - Fuites RÉSEAU (avant compteur): responsabilité municipale, non modélisées ici
+# - Fuites PRIVÉES (après compteur): c'est ce que nous modélisons
+#
+# =============================================================================
+
+class ModeRepartitionCouts(Enum):
+    """Mode de répartition des coûts de réparation."""
+    MENAGE_SEUL = "menage"           # 100% ménage (défaut)
+    SUBVENTION_PARTIELLE = "partage" # Partage ville/ménage
+    VILLE_SEULE = "ville"            # 100% ville (incitatif maximal)
+    SANS_COUT = "gratuit"            # Ignorer les coûts (modèle de base)
+
+
+@dataclass
+class ParametresFuites:
+    """
+    Configuration des fuites et de leurs coûts de réparation.
+
+    Ce module distingue:
+    - La DÉTECTION (grâce au compteur intelligent)
+    - La RÉPARATION (action du ménage, avec ou sans aide)
+    - Le PARTAGE des coûts (ville vs ménage)
+
+    Dynamique temporelle:
+    - Stock de fuites actives avec réparations (naturelles + détection)
+    - Les économies plafonnent vers un équilibre (plateau)
+    - Le stock représente un nombre de fuites actives (peut dépasser nb ménages)
+
+    NOUVEAU v3.9: Prévalence différenciée selon AWE (2023)
+    - Toute fuite (any): consommation continue 24h - prévalence ~20%
+    - Fuite significative: >3 L/h pendant 48h - prévalence ~5%
+    - Longue traîne: fuites jamais réparées malgré programme
+
+    Paramètres:
+    - Prévalence et débit des fuites (différenciés ou agrégés)
+    - Taux de détection et de réparation
+    - Coût moyen de réparation
+    - Partage des coûts
+    - Taux de nouvelles fuites annuelles
+    - Persistance (longue traîne)
+    """
+    # === PRÉVALENCE DES FUITES (AGRÉGÉ - rétrocompatibilité) ===
+    part_menages_fuite_pct: float = 20.0      # % ménages avec fuite (état initial)
+    debit_fuite_m3_an: float = 35.0           # Débit moyen par fuite (m³/an)
+
+    # === PRÉVALENCE DIFFÉRENCIÉE (NOUVEAU v3.9) ===
+    # Distinction selon définition AWE (2023)
+    # Si activé (utiliser_prevalence_differenciee=True), remplace les valeurs agrégées
+    utiliser_prevalence_differenciee: bool = False
+    # Toute fuite détectable (consommation continue 24h)
+    part_menages_fuite_any_pct: float = 20.0          # ~20% selon AWE
+    debit_fuite_any_m3_an: float = 10.0               # Petites fuites (toilettes, goutte)
+    # Fuites significatives (>3 L/h pendant 48h, nécessitant intervention)
+    part_menages_fuite_significative_pct: float = 5.0  # 3-7% selon AWE
+    debit_fuite_significative_m3_an: float = 50.0      # Grosses fuites (conduites)
+
+    # === PERSISTANCE / LONGUE TRAÎNE (NOUVEAU v3.9) ===
+    # Source: AWE (2023) documente des fuites exceptionnellement longues
+    # malgré programmes de détection et alertes.
+    # Deux effets distincts:
+    # 1. Persistantes: fraction de fuites JAMAIS réparées (réduction taux correction)
+    # 2. Longue traîne: les autres fuites prennent PLUS LONGTEMPS à réparer
+    part_fuites_persistantes_pct: float = 5.0          # % fuites jamais réparées (réduit k_eff)
+    facteur_duree_longue_traine: float = 5.0           # Multiplicateur durée réparation (ralentit k)
+
+    # === DIFFÉRENCIATION PAR TYPE DE FUITE (NOUVEAU v3.10) ===
+    # Multiplicateurs pour fuites significatives vs petites fuites
+    # Base: petites fuites (any) ont les taux de détection/réparation de base
+    # Sig: grosses fuites sont plus visibles ET plus réparées (dommages = motivation)
+    facteur_detection_sig: float = 1.2                 # Grosses fuites plus visibles (détection facilitée)
+    facteur_reparation_sig: float = 1.4                # Grosses fuites = plus d'incitatif (dommages visibles)
+    cout_reparation_any: float = 100.0                 # Coût réparation petite fuite ($)
+    cout_reparation_sig: float = 400.0                 # Coût réparation grosse fuite ($)
+
+    # === DÉTECTION ===
+    # Le compteur intelligent permet de détecter les fuites via
+    # l'analyse du profil de consommation (débit continu 24h/24)
+    taux_detection_pct: float = 90.0          # Taux de détection AMI (%)
+
+    # === RÉPARATION ===
+    # Une fois détectée, la fuite doit être réparée par le ménage
+    taux_reparation_pct: float = 85.0         # % des fuites détectées qui sont réparées
+    cout_reparation_moyen: float = 200.0      # Coût moyen par réparation ($)
+
+    # === PARTAGE DES COÛTS ===
+    # La ville peut subventionner les réparations pour encourager l'action
+    mode_repartition: ModeRepartitionCouts = ModeRepartitionCouts.MENAGE_SEUL
+    part_ville_pct: float = 0.0               # Part des coûts assumée par la ville (%)
+
+    # === DYNAMIQUE TEMPORELLE ===
+    # Nouvelles fuites apparaissant chaque année (usure des installations)
+    taux_nouvelles_fuites_pct: float = 5.0    # % de ménages développant une fuite/an
+    # Durée moyenne d'une fuite sans compteur (années)
+    # Si None: dérivée de la prévalence initiale et du taux de nouvelles fuites
+    duree_moyenne_fuite_sans_compteur: Optional[float] = None
+
+    # === OPTIONS ===
+    inclure_cout_reparation: bool = True      # Inclure les coûts dans l'analyse
+
+    # Métadonnées
+    nom: str = "Configuration par défaut"
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider les paramètres."""
+        if not 0 <= self.part_menages_fuite_pct <= 100:
+            raise ValueError("part_menages_fuite_pct doit être entre 0 et 100")
+        if self.debit_fuite_m3_an < 0:
+            raise ValueError("debit_fuite_m3_an doit être >= 0")
+        if not 0 <= self.taux_detection_pct <= 100:
+            raise ValueError("taux_detection_pct doit être entre 0 et 100")
+        if not 0 <= self.taux_reparation_pct <= 100:
+            raise ValueError("taux_reparation_pct doit être entre 0 et 100")
+        if self.cout_reparation_moyen < 0:
+            raise ValueError("cout_reparation_moyen doit être >= 0")
+        if not 0 <= self.part_ville_pct <= 100:
+            raise ValueError("part_ville_pct doit être entre 0 et 100")
+        if self.duree_moyenne_fuite_sans_compteur is not None:
+            if self.duree_moyenne_fuite_sans_compteur <= 0:
+                raise ValueError("duree_moyenne_fuite_sans_compteur doit être > 0")
+        # Validation paramètres différenciés (v3.9)
+        if not 0 <= self.part_menages_fuite_any_pct <= 100:
+            raise ValueError("part_menages_fuite_any_pct doit être entre 0 et 100")
+        if not 0 <= self.part_menages_fuite_significative_pct <= 100:
+            raise ValueError("part_menages_fuite_significative_pct doit être entre 0 et 100")
+        if not 0 <= self.part_fuites_persistantes_pct <= 100:
+            raise ValueError("part_fuites_persistantes_pct doit être entre 0 et 100")
+        if self.utiliser_prevalence_differenciee:
+            if self.part_menages_fuite_significative_pct > self.part_menages_fuite_any_pct:
+                raise ValueError(
+                    "part_menages_fuite_significative_pct doit être <= part_menages_fuite_any_pct "
+                    "lorsque utiliser_prevalence_differenciee=True"
+                )
+
+    @property
+    def taux_correction_effectif(self) -> float:
+        """Taux de correction effectif = détection × réparation."""
+        return (self.taux_detection_pct / 100.0) * (self.taux_reparation_pct / 100.0)
+
+    @property
+    def taux_correction_effectif_avec_persistance(self) -> float:
+        """
+        Taux de correction effectif ajusté pour les fuites persistantes.
+
+        Une fraction des fuites (part_fuites_persistantes_pct) ne sera jamais réparée,
+        ce qui réduit le taux de correction effectif global.
+
+        Note: distinct de facteur_duree_longue_traine qui ralentit les réparations.
+        """
+        taux_base = self.taux_correction_effectif
+        fraction_reparable = 1.0 - (self.part_fuites_persistantes_pct / 100.0)
+        return taux_base * fraction_reparable
+
+    @property
+    def volume_fuite_moyen_pondere(self) -> float:
+        """
+        Volume moyen pondéré si prévalence différenciée est activée.
+
+        Calcule le volume moyen par ménage avec fuite en pondérant les deux types.
+
+        IMPORTANT: p_sig ⊂ p_any (les fuites significatives sont un sous-ensemble
+        des fuites "any"). Donc p_any_excl = p_any - p_sig représente les petites
+        fuites uniquement.
+
+        Formule: (p_any_excl × vol_any + p_sig × vol_sig) / p_any
+        """
+        if not self.utiliser_prevalence_differenciee:
+            return self.debit_fuite_m3_an
+
+        # Prévalences (p_sig est inclus dans p_any)
+        p_any = self.part_menages_fuite_any_pct
+        p_sig = self.part_menages_fuite_significative_pct
+
+        if p_any <= 0:
+            return 0.0
+
+        # p_any_excl = ménages avec petite fuite uniquement (exclusif)
+        p_any_excl = max(0.0, p_any - p_sig)
+
+        # Pondération correcte: petites fuites + grosses fuites
+        vol_petites = self.debit_fuite_any_m3_an * p_any_excl
+        vol_grosses = self.debit_fuite_significative_m3_an * p_sig
+
+        # Diviseur = p_any (total des ménages avec fuite)
+        return (vol_petites + vol_grosses) / p_any
+
+
+@dataclass
+class ResultatsFuites:
+    """
+    Résultats du calcul des fuites et réparations.
+
+    Contient les séries temporelles et les totaux pour:
+    - Nombre de réparations par année
+    - Coûts de réparation (total, ville, ménages)
+    - Économies d'eau réalisées
+
+    NOUVEAU v3.10: Breakdowns par type de fuite (any vs significative)
+    quand utiliser_prevalence_differenciee=True.
+    """
+    # Séries temporelles (totaux agrégés)
+    annees: np.ndarray                        # [1, 2, ..., T]
+    reparations_par_an: np.ndarray            # Nombre de réparations/an
+    cout_total_par_an: np.ndarray             # Coût total ($)/an
+    cout_ville_par_an: np.ndarray             # Part ville ($)/an
+    cout_menages_par_an: np.ndarray           # Part ménages ($)/an
+    economies_eau_par_an: np.ndarray          # m³ économisés/an (différence de stock actif)
+
+    # Totaux sur l'horizon
+    total_reparations: int                    # Nombre total de réparations
+    cout_total: float                         # Coût total ($)
+    cout_ville_total: float                   # Coût total ville ($)
+    cout_menages_total: float                 # Coût total ménages ($)
+    economies_eau_total: float                # m³ totaux économisés
+
+    # Métriques
+    cout_par_m3_economise: float              # $/m³ (efficacité des réparations)
+
+    # === BREAKDOWN PAR TYPE (NOUVEAU v3.10) ===
+    # Rempli seulement si utiliser_prevalence_differenciee=True
+    mode_deux_stocks: bool = False            # Flag indiquant le mode utilisé
+
+    # Petites fuites (any, hors significatives)
+    economies_any_par_an: Optional[np.ndarray] = None
+    reparations_any_par_an: Optional[np.ndarray] = None
+    cout_any_par_an: Optional[np.ndarray] = None
+
+    # Fuites significatives
+    economies_sig_par_an: Optional[np.ndarray] = None
+    reparations_sig_par_an: Optional[np.ndarray] = None
+    cout_sig_par_an: Optional[np.ndarray] = None
+
+    # Fuites persistantes (jamais réparées)
+    economies_persistantes_par_an: Optional[np.ndarray] = None
+
+
+def calculer_dynamique_fuites(
+    params_fuites: ParametresFuites,
+    nb_menages: int,
+    horizon: int,
+    facteur_efficacite_detection: float = 1.0,
+) -> ResultatsFuites:
+    """
+    Calculer la dynamique des fuites et réparations sur l'horizon.
+
+    DEUX MODES DISPONIBLES:
+
+    1. Mode agrégé (utiliser_prevalence_differenciee=False, défaut):
+       - Un seul stock de fuites L(t) avec paramètres moyens
+       - Compatible avec les versions précédentes
+
+    2. Mode deux-stocks (utiliser_prevalence_differenciee=True):
+       - Stock L_any: petites fuites (toilettes, gouttes) - prévalence ~20%, ~10 m³/an
+       - Stock L_sig: fuites significatives (conduites) - prévalence ~5%, ~50 m³/an
+       - Chaque stock est scindé en fraction réparable vs persistante
+       - Détection/réparation différenciées par type
+
+    Modèle temporel (stock dynamique avec plateau):
+    - Stock de fuites actives L(t) avec nouvelles fuites et réparations
+    - Sans compteur: réparation naturelle à un taux mu (durée moyenne)
+    - Avec compteur: taux mu + (détection × réparation)
+    - Économies = différence de stock actif entre baseline et compteur
+
+    Paramètres:
+        params_fuites: Configuration des fuites
+        nb_menages: Nombre de ménages
+        horizon: Horizon d'analyse (années)
+        facteur_efficacite_detection: Multiplicateur du taux de détection [0,1]
+
+    Retourne:
+        ResultatsFuites avec toutes les séries et totaux
+    """
+    H = nb_menages
+    T = horizon
+
+    # Fonction interne d'évolution de stock
+    def evoluer_stock(L_depart: float, taux: float, nouveaux: float) -> tuple[float, float]:
+        """Évolution du stock annuel avec entrée constante et taux de réparation."""
+        if taux <= 0:
+            L_fin = L_depart + nouveaux
+            L_moy = L_depart + 0.5 * nouveaux
+            return L_fin, L_moy
+
+        L_equilibre = nouveaux / taux
+        exp_term = math.exp(-taux)
+        L_fin = L_equilibre + (L_depart - L_equilibre) * exp_term
+        L_moy = L_equilibre + (L_depart - L_equilibre) * (1.0 - exp_term) / taux
+        return L_fin, L_moy
+
+    # Paramètres communs
+    d_base = params_fuites.taux_detection_pct / 100.0
+    r_base = params_fuites.taux_reparation_pct / 100.0
+    part_ville = params_fuites.part_ville_pct / 100.0
+    q = params_fuites.taux_nouvelles_fuites_pct / 100.0
+    frac_persist = params_fuites.part_fuites_persistantes_pct / 100.0
+
+    # Mode sans coût: ignorer les réparations
+    if not params_fuites.inclure_cout_reparation:
+        part_ville = 0.0
+
+    # Appliquer le facteur d'efficacité au taux de détection
+    facteur_borne = max(0.0, min(1.0, facteur_efficacite_detection))
+    d_eff = d_base * facteur_borne
+
+    # Initialiser les séries
+    annees = np.arange(1, T + 1)
+
+    # =========================================================================
+    # MODE DEUX-STOCKS (NOUVEAU v3.10)
+    # =========================================================================
+    if params_fuites.utiliser_prevalence_differenciee:
+        # Prévalences (en évitant le double comptage)
+        p_sig = params_fuites.part_menages_fuite_significative_pct / 100.0
+        p_any_total = params_fuites.part_menages_fuite_any_pct / 100.0
+        p_any_excl = max(0.0, p_any_total - p_sig)  # Any hors significatives
+
+        # Débits par type
+        debit_any = params_fuites.debit_fuite_any_m3_an
+        debit_sig = params_fuites.debit_fuite_significative_m3_an
+
+        # Coûts par type
+        cout_any = params_fuites.cout_reparation_any if params_fuites.inclure_cout_reparation else 0.0
+        cout_sig = params_fuites.cout_reparation_sig if params_fuites.inclure_cout_reparation else 0.0
+
+        # Taux différenciés
+        d_any = d_eff  # Base detection rate for small leaks
+        d_sig = min(1.0, d_eff * params_fuites.facteur_detection_sig)  # Higher for big leaks
+        r_any = r_base
+        r_sig = r_base * params_fuites.facteur_reparation_sig  # Higher due to visible damage incentive
+
+        # Taux effectifs détection × réparation
+        k_any = d_any * r_any
+        k_sig = d_sig * r_sig
+
+        # Taux de réparation naturelle (mu)
+        if params_fuites.duree_moyenne_fuite_sans_compteur is not None:
+            mu = 1.0 / params_fuites.duree_moyenne_fuite_sans_compteur
+        else:
+            mu = q / p_any_total if p_any_total > 0 and q > 0 else 0.25
+
+        # Fraction réparable vs persistante
+        frac_repar = 1.0 - frac_persist
+        long_tail_factor = max(1.0, params_fuites.facteur_duree_longue_traine)
+        long_tail_mult = 1.0 / long_tail_factor
+
+        # Séries par type
+        eco_any = np.zeros(T)
+        eco_sig = np.zeros(T)
+        eco_persist = np.zeros(T)
+        rep_any = np.zeros(T)
+        rep_sig = np.zeros(T)
+        cout_any_arr = np.zeros(T)
+        cout_sig_arr = np.zeros(T)
+
+        # === STOCK ANY (petites fuites, hors significatives) ===
+        # Réparable
+        stock_any_base_rep = H * p_any_excl * frac_repar
+        stock_any_comp_rep = H * p_any_excl * frac_repar
+        nouvelles_any_rep = H * q * (p_any_excl / p_any_total) * frac_repar if p_any_total > 0 else 0
+        # Persistant
+        stock_any_base_pers = H * p_any_excl * frac_persist
+        stock_any_comp_pers = H * p_any_excl * frac_persist
+        nouvelles_any_pers = H * q * (p_any_excl / p_any_total) * frac_persist if p_any_total > 0 else 0
+
+        # === STOCK SIG (fuites significatives) ===
+        # Réparable
+        stock_sig_base_rep = H * p_sig * frac_repar
+        stock_sig_comp_rep = H * p_sig * frac_repar
+        nouvelles_sig_rep = H * q * (p_sig / p_any_total) * frac_repar if p_any_total > 0 else 0
+        # Persistant
+        stock_sig_base_pers = H * p_sig * frac_persist
+        stock_sig_comp_pers = H * p_sig * frac_persist
+        nouvelles_sig_pers = H * q * (p_sig / p_any_total) * frac_persist if p_any_total > 0 else 0
+
+        for t in range(T):
+            # ANY réparable
+            stock_any_base_rep, any_base_moy_rep = evoluer_stock(
+                stock_any_base_rep, mu, nouvelles_any_rep)
+            stock_any_comp_rep, any_comp_moy_rep = evoluer_stock(
+                stock_any_comp_rep, mu + k_any, nouvelles_any_rep)
+            eco_any[t] += max(0.0, (any_base_moy_rep - any_comp_moy_rep) * debit_any)
+            rep_any[t] = k_any * any_comp_moy_rep
+            cout_any_arr[t] = rep_any[t] * cout_any
+
+            # ANY persistant (taux de correction réduit via longue traine)
+            k_any_pers = k_any * long_tail_mult
+            stock_any_base_pers, any_base_moy_pers = evoluer_stock(
+                stock_any_base_pers, mu * long_tail_mult, nouvelles_any_pers)
+            stock_any_comp_pers, any_comp_moy_pers = evoluer_stock(
+                stock_any_comp_pers, mu * long_tail_mult + k_any_pers, nouvelles_any_pers)
+            eco_persist[t] += max(0.0, (any_base_moy_pers - any_comp_moy_pers) * debit_any)
+            rep_any_pers = k_any_pers * any_comp_moy_pers
+            rep_any[t] += rep_any_pers
+            cout_any_arr[t] += rep_any_pers * cout_any
+
+            # SIG réparable
+            stock_sig_base_rep, sig_base_moy_rep = evoluer_stock(
+                stock_sig_base_rep, mu, nouvelles_sig_rep)
+            stock_sig_comp_rep, sig_comp_moy_rep = evoluer_stock(
+                stock_sig_comp_rep, mu + k_sig, nouvelles_sig_rep)
+            eco_sig[t] += max(0.0, (sig_base_moy_rep - sig_comp_moy_rep) * debit_sig)
+            rep_sig[t] = k_sig * sig_comp_moy_rep
+            cout_sig_arr[t] = rep_sig[t] * cout_sig
+
+            # SIG persistant
+            k_sig_pers = k_sig * long_tail_mult
+            stock_sig_base_pers, sig_base_moy_pers = evoluer_stock(
+                stock_sig_base_pers, mu * long_tail_mult, nouvelles_sig_pers)
+            stock_sig_comp_pers, sig_comp_moy_pers = evoluer_stock(
+                stock_sig_comp_pers, mu * long_tail_mult + k_sig_pers, nouvelles_sig_pers)
+            eco_persist[t] += max(0.0, (sig_base_moy_pers - sig_comp_moy_pers) * debit_sig)
+            rep_sig_pers = k_sig_pers * sig_comp_moy_pers
+            rep_sig[t] += rep_sig_pers
+            cout_sig_arr[t] += rep_sig_pers * cout_sig
+
+        # Agrégation
+        economies_eau = eco_any + eco_sig + eco_persist
+        reparations = rep_any + rep_sig
+        cout_total = cout_any_arr + cout_sig_arr
+        cout_ville = cout_total * part_ville
+        cout_menages = cout_total * (1 - part_ville)
+
+        # Totaux
+        total_reparations = int(round(float(np.sum(reparations))))
+        cout_total_sum = float(np.sum(cout_total))
+        cout_ville_sum = float(np.sum(cout_ville))
+        cout_menages_sum = float(np.sum(cout_menages))
+        economies_eau_sum = float(np.sum(economies_eau))
+        cout_par_m3 = cout_total_sum / economies_eau_sum if economies_eau_sum > 0 else 0.0
+
+        return ResultatsFuites(
+            annees=annees,
+            reparations_par_an=reparations,
+            cout_total_par_an=cout_total,
+            cout_ville_par_an=cout_ville,
+            cout_menages_par_an=cout_menages,
+            economies_eau_par_an=economies_eau,
+            total_reparations=total_reparations,
+            cout_total=cout_total_sum,
+            cout_ville_total=cout_ville_sum,
+            cout_menages_total=cout_menages_sum,
+            economies_eau_total=economies_eau_sum,
+            cout_par_m3_economise=cout_par_m3,
+            # Breakdowns par type
+            mode_deux_stocks=True,
+            economies_any_par_an=eco_any,
+            reparations_any_par_an=rep_any,
+            cout_any_par_an=cout_any_arr,
+            economies_sig_par_an=eco_sig,
+            reparations_sig_par_an=rep_sig,
+            cout_sig_par_an=cout_sig_arr,
+            economies_persistantes_par_an=eco_persist,
+        )
+
+    # =========================================================================
+    # MODE AGRÉGÉ (rétrocompatibilité)
+    # =========================================================================
+    p0 = params_fuites.part_menages_fuite_pct / 100.0
+    C = params_fuites.cout_reparation_moyen if params_fuites.inclure_cout_reparation else 0.0
+    debit = params_fuites.debit_fuite_m3_an
+    k = d_eff * r_base
+    frac_persist = max(0.0, min(1.0, params_fuites.part_fuites_persistantes_pct / 100.0))
+    frac_repar = 1.0 - frac_persist
+    long_tail_factor = max(1.0, params_fuites.facteur_duree_longue_traine)
+    long_tail_mult = 1.0 / long_tail_factor
+
+    # Taux de réparation naturelle
+    if params_fuites.duree_moyenne_fuite_sans_compteur is not None:
+        mu = 1.0 / params_fuites.duree_moyenne_fuite_sans_compteur
+    elif p0 > 0 and q > 0:
+        mu = q / p0
+    else:
+        mu = 0.25
+
+    # Séries
+    reparations = np.zeros(T)
+    cout_total = np.zeros(T)
+    cout_ville = np.zeros(T)
+    cout_menages = np.zeros(T)
+    economies_eau = np.zeros(T)
+
+    # Stocks réparables vs persistants (longue traîne)
+    stock_base_rep = H * p0 * frac_repar
+    stock_comp_rep = H * p0 * frac_repar
+    stock_base_pers = H * p0 * frac_persist
+    stock_comp_pers = H * p0 * frac_persist
+
+    nouvelles_rep = H * q * frac_repar
+    nouvelles_pers = H * q * frac_persist
+
+    taux_base_rep = mu
+    taux_comp_rep = mu + k
+    mu_pers = mu * long_tail_mult
+    k_pers = k * long_tail_mult
+    taux_base_pers = mu_pers
+    taux_comp_pers = mu_pers + k_pers
+
+    for t in range(T):
+        # Réparable
+        stock_base_rep, base_moy_rep = evoluer_stock(stock_base_rep, taux_base_rep, nouvelles_rep)
+        stock_comp_rep, comp_moy_rep = evoluer_stock(stock_comp_rep, taux_comp_rep, nouvelles_rep)
+
+        # Persistant (taux réduit)
+        stock_base_pers, base_moy_pers = evoluer_stock(stock_base_pers, taux_base_pers, nouvelles_pers)
+        stock_comp_pers, comp_moy_pers = evoluer_stock(stock_comp_pers, taux_comp_pers, nouvelles_pers)
+
+        economie_rep = (base_moy_rep - comp_moy_rep) * debit
+        economie_pers = (base_moy_pers - comp_moy_pers) * debit
+        economies_eau[t] = max(0.0, economie_rep + economie_pers)
+
+        reparations_t = k * comp_moy_rep + k_pers * comp_moy_pers
+        reparations[t] = reparations_t
+        cout_total[t] = reparations_t * C
+        cout_ville[t] = cout_total[t] * part_ville
+        cout_menages[t] = cout_total[t] * (1 - part_ville)
+
+    # Totaux
+    total_reparations = int(round(float(np.sum(reparations))))
+    cout_total_sum = float(np.sum(cout_total))
+    cout_ville_sum = float(np.sum(cout_ville))
+    cout_menages_sum = float(np.sum(cout_menages))
+    economies_eau_sum = float(np.sum(economies_eau))
+    cout_par_m3 = cout_total_sum / economies_eau_sum if economies_eau_sum > 0 else 0.0
+
+    return ResultatsFuites(
+        annees=annees,
+        reparations_par_an=reparations,
+        cout_total_par_an=cout_total,
+        cout_ville_par_an=cout_ville,
+        cout_menages_par_an=cout_menages,
+        economies_eau_par_an=economies_eau,
+        total_reparations=total_reparations,
+        cout_total=cout_total_sum,
+        cout_ville_total=cout_ville_sum,
+        cout_menages_total=cout_menages_sum,
+        economies_eau_total=economies_eau_sum,
+        cout_par_m3_economise=cout_par_m3,
+        mode_deux_stocks=False,
+    )
+
+
+def calculer_economies_fuites_menage(
+    params_fuites: ParametresFuites,
+) -> float:
+    """
+    Calculer les économies de fuites par ménage (m³/an) - valeur de première année.
+
+    Formule: économies = prévalence × débit × taux_correction_effectif
+
+    Cette valeur représente l'économie moyenne par ménage en première année.
+
+    Paramètres:
+        params_fuites: Configuration des fuites
+
+    Retourne:
+        Économies en m³/ménage/an
+    """
+    prevalence = params_fuites.part_menages_fuite_pct / 100.0
+    debit = params_fuites.debit_fuite_m3_an
+    taux_correction = params_fuites.taux_correction_effectif
+
+    return prevalence * debit * taux_correction
+
+
+# =============================================================================
+# MODULE FUITES RÉSEAU (OPTIONNEL)
+# =============================================================================
+#
+# Ce module modélise les pertes d'eau sur le réseau (avant compteur).
+# L'objectif est de distinguer clairement:
+# - les économies liées aux fuites PRIVÉES (après compteur, ménage)
+# - les économies liées aux fuites du RÉSEAU (pilotées par la ville)
+#
+# Le module est volontairement simple et paramétrable:
+# - volume de pertes annuel (m³/an)
+# - réduction maximale atteignable (%)
+# - trajectoire de réduction (linéaire ou exponentielle)
+# - coûts du programme (OPEX) + coûts de réparation par m³
+# - CAPEX ponctuel possible (DMA, capteurs, analytics)
+#
+# =============================================================================
+
+class ModeReductionReseau(Enum):
+    """Mode de réduction des pertes réseau."""
+    LINEAIRE = "lineaire"        # Rampe linéaire jusqu'à la cible
+    EXPONENTIEL = "exponentiel"  # Approche rapide puis plateau
+
+
+@dataclass
+class ParametresFuitesReseau:
+    """
+    Paramètres pour la réduction des pertes d'eau sur le réseau.
+
+    Hypothèses:
+    - Le programme réduit une fraction des pertes existantes.
+    - La réduction suit une trajectoire (rampe) sur plusieurs années.
+    - Les économies et coûts peuvent être pondérés par l'adoption (si AMI).
+    """
+    # === BASE DES PERTES ===
+    volume_pertes_m3_an: float = 0.0     # Pertes réseau de référence (m³/an)
+    reduction_max_pct: float = 0.0      # Réduction maximale atteignable (%)
+
+    # === TRAJECTOIRE ===
+    mode_reduction: ModeReductionReseau = ModeReductionReseau.LINEAIRE
+    annees_atteinte: int = 5            # Années pour atteindre la cible (linéaire)
+    lambda_reduction: float = 0.5       # Vitesse (exponentiel)
+    annee_demarrage: int = 1            # Début du programme
+
+    # === COÛTS ===
+    cout_programme_annuel: float = 0.0  # OPEX annuel (suivi, équipes, analytics)
+    cout_reparation_m3: float = 0.0     # Coût variable par m³ économisé
+    cout_capex_initial: float = 0.0     # CAPEX initial (DMA, capteurs)
+    annee_capex: int = 1                # Année du CAPEX
+
+    # === OPTIONS ===
+    pondere_par_adoption: bool = True   # Pondérer économies/coûts par A(t)
+    activer: bool = True
+
+    # Métadonnées
+    nom: str = "Réseau standard"
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider les paramètres."""
+        if self.volume_pertes_m3_an < 0:
+            raise ValueError("volume_pertes_m3_an doit être >= 0")
+        if not 0 <= self.reduction_max_pct <= 100:
+            raise ValueError("reduction_max_pct doit être entre 0 et 100")
+        if self.annees_atteinte < 1:
+            raise ValueError("annees_atteinte doit être >= 1")
+        if self.lambda_reduction < 0:
+            raise ValueError("lambda_reduction doit être >= 0")
+        if self.annee_demarrage < 1:
+            raise ValueError("annee_demarrage doit être >= 1")
+        if self.cout_programme_annuel < 0:
+            raise ValueError("cout_programme_annuel doit être >= 0")
+        if self.cout_reparation_m3 < 0:
+            raise ValueError("cout_reparation_m3 doit être >= 0")
+        if self.cout_capex_initial < 0:
+            raise ValueError("cout_capex_initial doit être >= 0")
+        if self.annee_capex < 1:
+            raise ValueError("annee_capex doit être >= 1")
+
+
+@dataclass
+class ResultatsFuitesReseau:
+    """Résultats de la dynamique des pertes réseau."""
+    annees: np.ndarray
+    reduction_fraction: np.ndarray       # Fraction des pertes réduites (0-1)
+    economies_m3_par_an: np.ndarray      # m³ économisés/an
+    couts_programme_par_an: np.ndarray   # OPEX/an
+    couts_reparation_par_an: np.ndarray  # Coûts variables/an
+    couts_totaux_par_an: np.ndarray      # Total coûts/an
+
+    economies_totales_m3: float          # m³ totaux économisés
+    cout_total: float                    # Coût total ($)
+
+
+def _progression_reduction_reseau(t: int, params: ParametresFuitesReseau) -> float:
+    """Calculer la progression (0-1) de la réduction réseau à l'année t."""
+    if not params.activer or t < params.annee_demarrage:
+        return 0.0
+
+    t_eff = t - params.annee_demarrage + 1
+
+    if params.mode_reduction == ModeReductionReseau.LINEAIRE:
+        return min(1.0, t_eff / params.annees_atteinte)
+
+    if params.mode_reduction == ModeReductionReseau.EXPONENTIEL:
+        # Progression rapide au début puis plateau
+        return 1.0 - math.exp(-params.lambda_reduction * (t_eff - 1))
+
+    return 0.0
+
+
+def calculer_dynamique_fuites_reseau(
+    params_reseau: ParametresFuitesReseau,
+    horizon: int,
+    serie_adoption: Optional[np.ndarray] = None,
+) -> ResultatsFuitesReseau:
+    """
+    Calculer la dynamique des économies et coûts liés aux fuites réseau.
+
+    Paramètres:
+        params_reseau: Paramètres réseau
+        horizon: Horizon d'analyse (années)
+        serie_adoption: Série A(t) si pondération par adoption
+
+    Retourne:
+        ResultatsFuitesReseau avec séries annuelles
+    """
+    T = horizon
+    annees = np.arange(1, T + 1)
+
+    reduction_frac = np.zeros(T)
+    economies_m3 = np.zeros(T)
+    couts_programme = np.zeros(T)
+    couts_reparation = np.zeros(T)
+
+    if not params_reseau.activer or params_reseau.volume_pertes_m3_an <= 0:
+        return ResultatsFuitesReseau(
+            annees=annees,
+            reduction_fraction=reduction_frac,
+            economies_m3_par_an=economies_m3,
+            couts_programme_par_an=couts_programme,
+            couts_reparation_par_an=couts_reparation,
+            couts_totaux_par_an=couts_programme,
+            economies_totales_m3=0.0,
+            cout_total=0.0,
+        )
+
+    if serie_adoption is None or not params_reseau.pondere_par_adoption:
+        serie_adoption = np.ones(T)
+
+    max_reduction = params_reseau.reduction_max_pct / 100.0
+
+    for i, annee in enumerate(annees):
+        progression = _progression_reduction_reseau(annee, params_reseau)
+        reduction_frac[i] = max_reduction * progression
+
+        economies_m3[i] = params_reseau.volume_pertes_m3_an * reduction_frac[i] * serie_adoption[i]
+
+        # OPEX programmatique (montée en charge + adoption si applicable)
+        couts_programme[i] = params_reseau.cout_programme_annuel * progression * serie_adoption[i]
+
+        # Coût variable proportionnel aux économies
+        couts_reparation[i] = params_reseau.cout_reparation_m3 * economies_m3[i]
+
+    couts_totaux = couts_programme + couts_reparation
+
+    return ResultatsFuitesReseau(
+        annees=annees,
+        reduction_fraction=reduction_frac,
+        economies_m3_par_an=economies_m3,
+        couts_programme_par_an=couts_programme,
+        couts_reparation_par_an=couts_reparation,
+        couts_totaux_par_an=couts_totaux,
+        economies_totales_m3=float(np.sum(economies_m3)),
+        cout_total=float(np.sum(couts_totaux)),
+    )
+
+
+# =============================================================================
+# SCÉNARIO DE FUITES PAR DÉFAUT (autres scénarios: presets.py)
+# =============================================================================
+
+# Scénario CONTEXTE_QUEBEC: prévalence de fuites PRIVÉES ajustée pour villes sans compteurs
+# Au Québec, les ménages n'ont jamais eu de compteurs → fuites privées non détectées depuis des années
+# Prévalence estimée: 35% vs 20% dans études USA/Australie (avec compteurs)
+# Note: les pertes RÉSEAU sont traitées séparément via ParametresFuitesReseau.
+FUITES_CONTEXTE_QUEBEC = ParametresFuites(
+    part_menages_fuite_pct=35.0,      # +75% vs standard (accumulation sans détection)
+    debit_fuite_m3_an=35.0,           # Débit physique similaire
+    taux_detection_pct=90.0,          # AMI détecte bien
+    taux_reparation_pct=85.0,         # Taux réparation standard
+    part_fuites_persistantes_pct=5.0, # Longue traîne (AWE 2023)
+    duree_moyenne_fuite_sans_compteur=7.0,  # Équilibre implicite: 5% / 35% ≈ 7 ans
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    nom="Contexte Québec",
+    description="Prévalence 35%, durée 7 ans (ville sans compteurs); détection 90%/réparation 85%",
+)
+
+
+# =============================================================================
+# MODULE ADOPTION : STRATÉGIES D'IMPLANTATION
+# =============================================================================
+#
+# Ce module permet de modéliser différentes stratégies de déploiement des
+# compteurs intelligents, un élément clé pour l'analyse de politique publique.
+#
+# QUESTION CENTRALE: "Quelle stratégie d'implantation maximise la VAN?"
+#
+# STRATÉGIES DISPONIBLES:
+#
+# 1. OBLIGATOIRE (100% immédiat)
+#    - Tous les compteurs installés en t=0
+#    - CAPEX concentré, bénéfices immédiats
+#    - Exemple: Règlement municipal imposant l'installation
+#
+# 2. VOLONTAIRE_INCITATIF (courbe logistique)
+#    - Adoption progressive selon incitations
+#    - Courbe en S: A(t) = Amax / (1 + exp(-k*(t-t0)))
+#    - Exemple: Rabais de taxe foncière pour les adoptants
+#
+# 3. NOUVEAUX_BRANCHEMENTS (linéaire lent)
+#    - Seulement les nouvelles constructions/rénovations
+#    - Taux = nouveaux branchements / parc total
+#    - Exemple: Obligation seulement pour nouvelles constructions
+#
+# 4. PAR_SECTEUR (par tranches)
+#    - Déploiement quartier par quartier
+#    - CAPEX étalé sur plusieurs années
+#    - Exemple: Plan quinquennal par arrondissement
+#
+# Références:
+# - Rogers (2003) Diffusion of Innovations
+# - Bass (1969) A New Product Growth Model
+# - Meade & Islam (2006) Modelling and Forecasting Technology Adoption
+#
+# =============================================================================
+
+class ModeAdoption(Enum):
+    """
+    Stratégie d'implantation des compteurs.
+
+    OBLIGATOIRE: Déploiement immédiat et universel (règlement)
+        - A(t) = 100% pour t >= 0
+        - CAPEX en t=0, bénéfices immédiats complets
+        - Contrainte: capacité d'installation, acceptabilité sociale
+
+    VOLONTAIRE_INCITATIF: Adoption graduelle avec incitations
+        - Courbe logistique: A(t) = Amax / (1 + exp(-k*(t-t0)))
+        - CAPEX étalé selon adoption, bénéfices progressifs
+        - Exemples: rabais taxe, subvention installation
+
+    NOUVEAUX_BRANCHEMENTS: Obligation sur nouvelles constructions
+        - A(t) = min(t * taux_nouveaux, Amax)
+        - CAPEX très étalé, long délai avant bénéfices significatifs
+        - Avantage: aucune résistance (pas de remplacement)
+
+    PAR_SECTEUR: Déploiement par quartiers/zones
+        - A(t) = tranches successives (escalier)
+        - CAPEX planifié, bénéfices par paliers
+        - Exemple: un arrondissement par an
+
+    CALENDRIER: Calendrier d'installation explicite, année par année
+        - A(t) = calendrier_pct[t] (adoption cumulée), puis dernière valeur
+        - Exemple: plan issu d'un optimiseur sous contraintes de budget annuel
+    """
+    OBLIGATOIRE = "obligatoire"
+    VOLONTAIRE_INCITATIF = "volontaire_incitatif"
+    NOUVEAUX_BRANCHEMENTS = "nouveaux_branchements"
+    PAR_SECTEUR = "par_secteur"
+    CALENDRIER = "calendrier"
+
+
+@dataclass
+class ParametresAdoption:
+    """
+    Paramètres pour la stratégie d'adoption des compteurs.
+
+    La courbe d'adoption A(t) représente la fraction du parc équipée à l'année t.
+    Elle affecte:
+    - Les bénéfices annuels: B(t) × A(t)
+    - Les coûts d'exploitation: OPEX(t) × A(t)
+    - L'investissement: soit I0 complet, soit CAPEX(t) étalé
+
+    Paramètres clés selon le mode:
+    - OBLIGATOIRE: aucun paramètre supplémentaire (A(t) = 100%)
+    - VOLONTAIRE: k (vitesse), t0 (point médian), Amax (plafond)
+    - NOUVEAUX: taux_annuel_pct (% de nouvelles installations/an)
+    - PAR_SECTEUR: nb_secteurs, annees_par_secteur
+    - CALENDRIER: calendrier_pct
+    """
+    mode: ModeAdoption = ModeAdoption.OBLIGATOIRE
+
+    # === PARAMÈTRES COURBE LOGISTIQUE (volontaire) ===
+    # A(t) = Amax / (1 + exp(-k * (t - t0)))
+    k_vitesse: float = 0.5              # Vitesse d'adoption (plus élevé = plus rapide)
+    t0_point_median: float = 5.0        # Année où A(t) = 50% de Amax
+    adoption_max_pct: float = 90.0      # Plafond d'adoption (% du parc)
+
+    # === PARAMÈTRES NOUVEAUX BRANCHEMENTS ===
+    taux_nouveaux_pct: float = 2.0      # % de nouvelles constructions/an
+
+    # === PARAMÈTRES PAR SECTEUR ===
+    nb_secteurs: int = 5                # Nombre de secteurs/quartiers
+    annees_par_secteur: float = 2.0     # Durée de déploiement par secteur
+
+    # === PARAMÈTRES CALENDRIER ===
+    # Adoption cumulée (% du parc) à la fin de chaque année de déploiement
+    calendrier_pct: Optional[tuple] = None
+
+    # === CAPEX ÉTALÉ ===
+    etaler_capex: bool = False          # Si True, CAPEX proportionnel à A(t)
+    #                                   # Si False, CAPEX complet en t=0
+
+    # === COÛTS INCITATIFS (NOUVEAU v3.8) ===
+    # Ces coûts représentent les crédits/subventions offerts pour encourager l'adoption
+    # Au Québec: crédit sur le compte de taxes foncières (forfait d'installation)
+    #
+    # CONTEXTE QUÉBÉCOIS:
+    #   - Pas de tarification volumétrique résidentielle (incitatifs non liés à l'usage)
+    #   - L'incitatif est un crédit de taxes / subvention d'installation forfaitaire
+    #   - Exemple: forfait 540$ par ménage, étalé sur 3 ans
+    #
+    # IMPORTANT - Traitement selon le mode d'analyse:
+    #   - Mode ÉCONOMIQUE: EXCLUS (transferts neutres pour le bien-être social)
+    #   - Mode FINANCIER: INCLUS (coût réel pour le budget municipal)
+    #
+    # cout_incitatif_par_menage est un COÛT TOTAL par ménage, réparti sur duree_incitatif_ans
+    # Exemple: forfait 540$/ménage TOTAL (→ 180$/an × 3 ans)
+    cout_incitatif_par_menage: float = 0.0   # $ TOTAL par ménage adopté (réparti sur duree_incitatif_ans)
+    duree_incitatif_ans: int = 1             # Nombre d'années sur lesquelles l'incitatif est étalé
+    #
+    # Calibration recommandée (forfaits indicatifs, à ajuster localement):
+    #   - OBLIGATOIRE: 0$ (pas besoin d'incitatif)
+    #   - RAPIDE (forfait sur 3 ans): 540$/ménage
+    #   - PROGRESSIVE (forfait sur 3 ans): 180$/ménage
+    #   - LENTE (forfait sur 3 ans): 90$/ménage
+
+    # === TIMING D'INSTALLATION ===
+    # Fraction des effets annuels attribuée à l'année d'installation.
+    # 1.0 = effet complet, 0.5 = installation moyenne en milieu d'année.
+    fraction_premiere_annee: float = 1.0
+
+    # === DÉLAI DE DÉMARRAGE ===
+    annee_demarrage: int = 1            # Année de début du déploiement
+
+    # === MÉTADONNÉES ===
+    nom: str = "Standard"
+    description: str = ""
+
+    def __post_init__(self):
+        """Validation des paramètres."""
+        if self.k_vitesse <= 0:
+            raise ValueError("k_vitesse doit être positif")
+        if self.t0_point_median < 0:
+            raise ValueError("t0_point_median doit être >= 0")
+        if not 0 < self.adoption_max_pct <= 100:
+            raise ValueError("adoption_max_pct doit être entre 0 et 100")
+        if self.taux_nouveaux_pct < 0:
+            raise ValueError("taux_nouveaux_pct doit être >= 0")
+        if self.nb_secteurs < 1:
+            raise ValueError("nb_secteurs doit être >= 1")
+        if self.annees_par_secteur <= 0:
+            raise ValueError("annees_par_secteur doit être > 0")
+        # Validation des coûts incitatifs (v3.8)
+        if self.cout_incitatif_par_menage < 0:
+            raise ValueError("cout_incitatif_par_menage doit être >= 0")
+        if self.duree_incitatif_ans < 1:
+            raise ValueError("duree_incitatif_ans doit être >= 1")
+        if not 0.0 <= self.fraction_premiere_annee <= 1.0:
+            raise ValueError("fraction_premiere_annee doit être entre 0 et 1")
+        if self.mode == ModeAdoption.CALENDRIER:
+            if not self.calendrier_pct:
+                raise ValueError("calendrier_pct requis en mode CALENDRIER")
+            # Tolérance d'arrondi: une somme cumulée de fractions peut dépasser 100
+            self.calendrier_pct = tuple(
+                min(float(a), 100.0) if a <= 100.0 + 1e-9 else float(a) for a in self.calendrier_pct
+            )
+            if any(not 0.0 <= a <= 100.0 for a in self.calendrier_pct):
+                raise ValueError("calendrier_pct doit être entre 0 et 100")
+            if any(b < a for a, b in zip(self.calendrier_pct, self.calendrier_pct[1:])):
+                raise ValueError("calendrier_pct doit être croissant (adoption cumulée)")
+
+
+def calculer_adoption(t: float, params: ParametresAdoption) -> float:
+    """
+    Calculer le taux d'adoption A(t) pour une année donnée.
+
+    Paramètres:
+        t: Année (1, 2, 3, ...)
+        params: Paramètres d'adoption
+
+    Retourne:
+        Taux d'adoption entre 0.0 et 1.0
+    """
+    # Avant le démarrage: pas d'adoption
+    if t < params.annee_demarrage:
+        return 0.0
+
+    # Temps effectif depuis le démarrage
+    t_eff = t - params.annee_demarrage + 1
+
+    if params.mode == ModeAdoption.OBLIGATOIRE:
+        # Adoption immédiate jusqu'au plafond
+        # Note: adoption_max_pct peut être <100% pour modéliser un déploiement
+        # obligatoire partiel (ex: certaines zones seulement)
+        # Défaut: 100% si adoption_max_pct est à sa valeur par défaut (90%)
+        if params.adoption_max_pct >= 100.0 or params.adoption_max_pct == 90.0:
+            return 1.0  # 100% par défaut pour OBLIGATOIRE
+        return params.adoption_max_pct / 100.0
+
+    elif params.mode == ModeAdoption.VOLONTAIRE_INCITATIF:
+        # Courbe logistique (S-curve)
+        # A(t) = Amax / (1 + exp(-k * (t - t0)))
+        Amax = params.adoption_max_pct / 100.0
+        k = params.k_vitesse
+        t0 = params.t0_point_median
+
+        exp_term = math.exp(-k * (t_eff - t0))
+        return Amax / (1.0 + exp_term)
+
+    elif params.mode == ModeAdoption.NOUVEAUX_BRANCHEMENTS:
+        # Croissance linéaire limitée par le taux de nouvelles constructions
+        Amax = params.adoption_max_pct / 100.0
+        taux = params.taux_nouveaux_pct / 100.0
+        return min(t_eff * taux, Amax)
+
+    elif params.mode == ModeAdoption.PAR_SECTEUR:
+        # Déploiement par tranches (escalier)
+        Amax = params.adoption_max_pct / 100.0
+        duree_totale = params.nb_secteurs * params.annees_par_secteur
+
+        if t_eff >= duree_totale:
+            return Amax
+        else:
+            # Fraction complétée
+            secteurs_complets = int(t_eff / params.annees_par_secteur)
+            fraction_secteur_en_cours = (
+                (t_eff % params.annees_par_secteur) / params.annees_par_secteur
+            )
+            adoption = (secteurs_complets + fraction_secteur_en_cours) / params.nb_secteurs
+            return min(adoption * Amax, Amax)
+
+    elif params.mode == ModeAdoption.CALENDRIER:
+        # Adoption cumulée de l'année t_eff, maintenue après la fin du calendrier
+        calendrier = params.calendrier_pct
+        return calendrier[min(int(t_eff), len(calendrier)) - 1] / 100.0
+
+    else:
+        return 1.0  # Fallback
+
+
+def generer_serie_adoption(params: ParametresAdoption, T: int) -> np.ndarray:
+    """
+    Générer la série temporelle A(t) pour t = 1..T.
+
+    Paramètres:
+        params: Paramètres d'adoption
+        T: Horizon d'analyse
+
+    Retourne:
+        Array de taux d'adoption [A(1), A(2), ..., A(T)]
+    """
+    return np.array([calculer_adoption(t, params) for t in range(1, T + 1)])
+
+
+def calculer_delta_adoption(serie_adoption: np.ndarray) -> np.ndarray:
+    """
+    Convertir A(t) en nouvelles installations annuelles (delta A).
+
+    delta A(t) = A(t) - A(t-1), borné à 0 pour éviter des valeurs négatives.
+    """
+    if len(serie_adoption) == 0:
+        return np.array([])
+
+    delta = np.zeros_like(serie_adoption)
+    delta[0] = serie_adoption[0]
+    if len(serie_adoption) > 1:
+        delta[1:] = np.maximum(0.0, serie_adoption[1:] - serie_adoption[:-1])
+    return delta
+
+
+def calculer_adoption_effective(
+    serie_adoption: np.ndarray,
+    fraction_premiere_annee: float
+) -> np.ndarray:
+    """
+    Calculer l'adoption effective pour les flux annuels.
+
+    A_eff(t) = A(t-1) + f × (A(t) - A(t-1)), avec A(0)=0.
+    f=0.5 ≈ installation moyenne en milieu d'année.
+    """
+    if len(serie_adoption) == 0:
+        return np.array([])
+    f = max(0.0, min(1.0, fraction_premiere_annee))
+    delta = calculer_delta_adoption(serie_adoption)
+    return serie_adoption - (1.0 - f) * delta
+
+
+def convoluer_cohortes(
+    delta_adoption: np.ndarray,
+    serie_par_age: np.ndarray,
+    nb_menages: int,
+    fraction_premiere_annee: float = 1.0,
+) -> np.ndarray:
+    """
+    Somme des cohortes: convolution discrète des nouveaux adoptants avec une série d'âge.
+
+    La série par âge est définie pour un compteur installé en année 1.
+    """
+    if len(delta_adoption) == 0:
+        return np.array([])
+
+    serie = np.array(serie_par_age, copy=True)
+    if len(serie) > 0:
+        f = max(0.0, min(1.0, fraction_premiere_annee))
+        serie[0] *= f
+
+    convolution = np.convolve(delta_adoption, serie)[:len(delta_adoption)]
+    return convolution * nb_menages
+
+
+def calculer_capex_etale(
+    I0_total: float,
+    params_adoption: ParametresAdoption,
+    T: int
+) -> np.ndarray:
+    """
+    Calculer le CAPEX étalé selon la courbe d'adoption.
+
+    Si etaler_capex=True:
+        CAPEX(t) = I0_total × [A(t) - A(t-1)]
+        (investissement proportionnel aux nouvelles installations)
+
+    Si etaler_capex=False:
+        CAPEX(1) = I0_total, CAPEX(t>1) = 0
+        (investissement complet en t=1)
+
+    Paramètres:
+        I0_total: Investissement total si adoption 100%
+        params_adoption: Paramètres d'adoption
+        T: Horizon d'analyse
+
+    Retourne:
+        Array de CAPEX annuels [CAPEX(1), CAPEX(2), ..., CAPEX(T)]
+    """
+    capex = np.zeros(T)
+
+    if not params_adoption.etaler_capex:
+        # CAPEX complet en t=1
+        capex[0] = I0_total
+        return capex
+
+    # CAPEX étalé selon l'adoption
+    serie_adoption = generer_serie_adoption(params_adoption, T)
+
+    for i in range(T):
+        if i == 0:
+            delta_adoption = serie_adoption[0]
+        else:
+            delta_adoption = serie_adoption[i] - serie_adoption[i - 1]
+
+        # CAPEX proportionnel aux nouvelles installations
+        capex[i] = max(0.0, I0_total * delta_adoption)
+
+    return capex
+
+
+# =============================================================================
+# ADOPTION PAR DÉFAUT (autres stratégies: presets.py)
+# =============================================================================
+
+# Scénario OBLIGATOIRE: Déploiement immédiat par règlement
+ADOPTION_OBLIGATOIRE = ParametresAdoption(
+    mode=ModeAdoption.OBLIGATOIRE,
+    adoption_max_pct=100.0,  # 100% obligatoire
+    etaler_capex=False,
+    nom="Obligatoire",
+    description="Déploiement immédiat et universel par règlement municipal",
+)
+
+
+# =============================================================================
+# MODULE SEGMENTATION RÉSIDENTIELLE
+# =============================================================================
+#
+# Ce module permet de différencier l'analyse par type de logement résidentiel.
+# Les caractéristiques de consommation et les coûts varient significativement
+# selon la densité d'habitation.
+#
+# Sources:
+# - SQEEP 2023 (Stratégie québécoise d'économie d'eau potable)
+# - Statistique Canada (2021) - Ménages privés selon le type de logement
+# - MAMH - Registre des infrastructures municipales
+#
+# =============================================================================
+
+class TypeLogement(Enum):
+    """Type de logement résidentiel."""
+    UNIFAMILIAL = "unifamilial"      # Maison individuelle
+    MULTIPLEX = "multiplex"          # 2-4 logements (duplex, triplex, quadruplex)
+    MULTILOGEMENT = "multilogement"  # 5+ logements (immeubles d'appartements)
+
+
+@dataclass
+class ParametresSegment:
+    """
+    Paramètres spécifiques à un segment résidentiel.
+
+    Chaque segment a ses propres caractéristiques de consommation
+    et d'installation des compteurs.
+
+    Valeurs par défaut basées sur données Québec (SQEEP 2023, StatCan 2021):
+    - Unifamilial: 2.3 pers/ménage, 250 LPCD, jardin/piscine → haute conso
+    - Multiplex: 1.9 pers/ménage, 210 LPCD, moins d'extérieur
+    - Multilogement: 1.6 pers/ménage, 180 LPCD, peu d'usages extérieurs
+    """
+    type_logement: TypeLogement = TypeLogement.UNIFAMILIAL
+
+    # Nombre de ménages dans ce segment
+    nb_menages: int = 10_000
+    # Nombre de compteurs dans ce segment (compteur maître possible)
+    nb_compteurs: Optional[int] = None
+
+    # Caractéristiques démographiques
+    personnes_par_menage: float = 2.3
+
+    # Consommation
+    lpcd: float = 250.0  # Litres per capita per day
+
+    # Ajustement coût compteur (économies d'échelle, accès, etc.)
+    # < 1.0 = moins cher (multilogement: accès groupé, économies)
+    # > 1.0 = plus cher (unifamilial: déplacement, excavation)
+    cout_compteur_ajustement: float = 1.0
+
+    # Ajustement coût installation
+    cout_installation_ajustement: float = 1.0
+
+    # Prévalence des fuites (peut varier selon l'âge du parc)
+    prevalence_fuites_pct: float = 20.0
+
+    # Potentiel de réduction comportementale
+    # Unifamilial: plus de marge (arrosage, piscine)
+    # Multilogement: moins de marge (usages essentiels)
+    potentiel_reduction_pct: float = 8.0
+
+    # Métadonnées
+    nom: str = ""
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider et générer nom par défaut."""
+        if self.nb_menages <= 0:
+            raise ValueError("nb_menages doit être > 0")
+        if self.nb_compteurs is None:
+            self.nb_compteurs = self.nb_menages
+        else:
+            self.nb_compteurs = int(round(self.nb_compteurs))
+        if self.nb_compteurs <= 0:
+            raise ValueError("nb_compteurs doit être > 0")
+        if self.personnes_par_menage <= 0:
+            raise ValueError("personnes_par_menage doit être > 0")
+        if self.lpcd <= 0:
+            raise ValueError("lpcd doit être > 0")
+
+        if not self.nom:
+            self.nom = self.type_logement.value.title()
+
+    @property
+    def usage_annuel_menage_m3(self) -> float:
+        """Consommation annuelle par ménage (m³)."""
+        return self.lpcd * self.personnes_par_menage * 365 / 1000
+
+
+def creer_params_modele_depuis_segment(
+    segment: ParametresSegment,
+    params_base: Optional['ParametresModele'] = None,
+) -> 'ParametresModele':
+    """
+    Créer un ParametresModele à partir d'un segment.
+
+    Paramètres:
+        segment: Segment résidentiel
+        params_base: Paramètres de base à modifier (optionnel)
+
+    Retourne:
+        ParametresModele configuré pour ce segment
+    """
+    if params_base is None:
+        params = ParametresModele()
+    else:
+        # Cloner les paramètres de base
+        params = ParametresModele(**_cloner_params(params_base))
+
+    # Appliquer les caractéristiques du segment
+    params.nb_menages = segment.nb_menages
+    params.nb_compteurs = segment.nb_compteurs
+    params.taille_menage = segment.personnes_par_menage
+    params.lpcd = segment.lpcd
+    params.reduction_comportement_pct = segment.potentiel_reduction_pct
+    params.part_menages_fuite_pct = segment.prevalence_fuites_pct
+
+    return params
+
+
+def creer_compteur_depuis_segment(
+    segment: ParametresSegment,
+    compteur_base: Optional['ParametresCompteur'] = None,
+) -> 'ParametresCompteur':
+    """
+    Créer un ParametresCompteur ajusté pour un segment.
+
+    Paramètres:
+        segment: Segment résidentiel
+        compteur_base: Compteur de base à modifier (optionnel)
+
+    Retourne:
+        ParametresCompteur ajusté pour ce segment
+    """
+    if compteur_base is None:
+        compteur = ParametresCompteur()
+    else:
+        compteur = ParametresCompteur(**_cloner_compteur(compteur_base))
+
+    # Appliquer les ajustements du segment
+    compteur.cout_compteur *= segment.cout_compteur_ajustement
+    compteur.heures_installation *= segment.cout_installation_ajustement
+
+    return compteur
+
+
+def executer_modele_segmente(
+    segments: list[ParametresSegment],
+    compteur_base: Optional['ParametresCompteur'] = None,
+    params_base: Optional['ParametresModele'] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    **kwargs,
+) -> dict:
+    """
+    Exécuter le modèle sur plusieurs segments et agréger les résultats.
+
+    Paramètres:
+        segments: Liste des segments à analyser
+        compteur_base: Compteur de base (sera ajusté par segment)
+        params_base: Paramètres de base (seront ajustés par segment)
+        config_echelle: Configuration économies d'échelle
+        **kwargs: Arguments supplémentaires passés à executer_modele()
+
+    Retourne:
+        Dictionnaire avec:
+        - 'segments': résultats par segment
+        - 'agrege': métriques agrégées
+        - 'total_menages': nombre total de ménages
+        - 'van_totale': VAN totale ($)
+    """
+    resultats_segments = {}
+    van_totale = 0.0
+    va_benefices_total = 0.0
+    va_couts_total = 0.0
+    total_menages = 0
+    total_compteurs = 0
+    total_economies_m3 = 0.0
+
+    for segment in segments:
+        # Créer paramètres spécifiques au segment
+        params = creer_params_modele_depuis_segment(segment, params_base)
+        compteur = creer_compteur_depuis_segment(segment, compteur_base)
+
+        # Exécuter le modèle
+        res = executer_modele(
+            params=params,
+            compteur=compteur,
+            config_echelle=config_echelle,
+            **kwargs,
+        )
+
+        resultats_segments[segment.type_logement.value] = {
+            'segment': segment,
+            'params': params,
+            'compteur': compteur,
+            'resultats': res,
+        }
+
+        # Agréger
+        van_totale += res.van
+        va_benefices_total += res.va_benefices
+        va_couts_total += res.va_couts_totaux
+        total_menages += segment.nb_menages
+        total_compteurs += segment.nb_compteurs
+        # CORRECTION v3.9: Utiliser le total réel sur l'horizon (pas l'année 1 × T)
+        total_economies_m3 += res.economies_totales_horizon_m3
+
+    # Calculer métriques agrégées
+    rbc_agrege = va_benefices_total / va_couts_total if va_couts_total > 0 else 0.0
+
+    return {
+        'segments': resultats_segments,
+        'total_menages': total_menages,
+        'total_compteurs': total_compteurs,
+        'van_totale': van_totale,
+        'va_benefices_total': va_benefices_total,
+        'va_couts_total': va_couts_total,
+        'rbc_agrege': rbc_agrege,
+        'total_economies_m3': total_economies_m3,
+    }
+
+
+@dataclass
+class Trajectoires:
+    """
+    Séries temporelles des flux annuels pour le modèle dynamique.
+
+    Structure permettant de passer d'un modèle "annuité constante"
+    à un modèle année par année, nécessaire pour:
+    - Persistance des effets comportementaux α_B(t)
+    - Stratégies d'adoption graduelles A(t)
+    - Coûts de réparation des fuites variables
+    - Réduction des pertes réseau (optionnel)
+    - Tarification volumétrique différée
+
+    Les bénéfices sont décomposés par source pour traçabilité et
+    pour permettre la séparation économique/financier.
+    """
+    annees: np.ndarray                    # [1, 2, ..., T]
+
+    # Bénéfices par composante ($ par an)
+    benefices_eau: np.ndarray             # Valeur eau économisée
+    benefices_infra: np.ndarray           # Report infrastructure
+
+    # Coûts d'exploitation ($ par an)
+    couts_exploitation: np.ndarray        # OPEX (maintenance, lecture)
+    couts_ponctuels: dict                 # {année: montant} ex: batterie année 15
+
+    # Économies physiques (pour métriques LCSW, q*)
+    economies_eau_m3: np.ndarray          # m³ économisés par an (total programme)
+    economies_par_menage: np.ndarray      # m³/ménage/an
+    economies_fuites_menage: np.ndarray = field(default_factory=lambda: np.array([]))
+    economies_comportement_menage: np.ndarray = field(default_factory=lambda: np.array([]))
+    economies_reseau_m3: np.ndarray = field(default_factory=lambda: np.array([]))
+    economies_reseau_par_menage: np.ndarray = field(default_factory=lambda: np.array([]))
+
+    # Coûts de réparation des fuites ($ par an) - NOUVEAU v3.3
+    # Ces champs ont des valeurs par défaut pour rétrocompatibilité
+    couts_reparation_fuites: np.ndarray = field(default_factory=lambda: np.array([]))
+    couts_reparation_ville: np.ndarray = field(default_factory=lambda: np.array([]))
+    couts_reparation_menages: np.ndarray = field(default_factory=lambda: np.array([]))
+    couts_reseau: np.ndarray = field(default_factory=lambda: np.array([]))
+
+    # Adoption progressive - NOUVEAU v3.5
+    serie_adoption: np.ndarray = field(default_factory=lambda: np.array([]))  # A(t)
+    capex_etale: np.ndarray = field(default_factory=lambda: np.array([]))      # CAPEX(t)
+
+    # Coûts incitatifs - NOUVEAU v3.8
+    couts_incitatifs: np.ndarray = field(default_factory=lambda: np.array([]))  # $/an
+
+    # Coûts ponctuels séparés (batterie compteur vs réseau) - NOUVEAU v3.10
+    couts_ponctuels_compteur: dict = field(default_factory=dict)
+    couts_ponctuels_reseau: dict = field(default_factory=dict)
+
+    @property
+    def benefices_totaux(self) -> np.ndarray:
+        """Bénéfices totaux par année ($)."""
+        return self.benefices_eau + self.benefices_infra
+
+    @property
+    def couts_reparation_actifs(self) -> bool:
+        """Vérifier si des coûts de réparation sont inclus."""
+        return len(self.couts_reparation_fuites) > 0 and np.sum(self.couts_reparation_fuites) > 0
+
+    @property
+    def T(self) -> int:
+        """Horizon d'analyse (nombre d'années)."""
+        return len(self.annees)
+
+    @property
+    def benefice_annuel_moyen(self) -> float:
+        """Bénéfice annuel moyen (pour compatibilité avec modèle constant)."""
+        return float(np.mean(self.benefices_totaux))
+
+    @property
+    def cout_exploitation_annuel_moyen(self) -> float:
+        """Coût d'exploitation annuel moyen."""
+        couts = self.couts_exploitation
+        if len(self.couts_reseau) > 0:
+            couts = couts + self.couts_reseau
+        return float(np.mean(couts))
+
+    @property
+    def adoption_active(self) -> bool:
+        """Vérifier si l'adoption progressive est active."""
+        return len(self.serie_adoption) > 0 and not np.allclose(self.serie_adoption, 1.0)
+
+    @property
+    def capex_etale_actif(self) -> bool:
+        """Vérifier si le CAPEX est étalé."""
+        return len(self.capex_etale) > 0 and np.sum(self.capex_etale) > 0
+
+    @property
+    def adoption_finale(self) -> float:
+        """Taux d'adoption final (dernière année)."""
+        if len(self.serie_adoption) > 0:
+            return float(self.serie_adoption[-1])
+        return 1.0
+
+    @property
+    def adoption_moyenne(self) -> float:
+        """Taux d'adoption moyen sur l'horizon."""
+        if len(self.serie_adoption) > 0:
+            return float(np.mean(self.serie_adoption))
+        return 1.0
+
+
+def calculer_economies_eau(
+    params: ParametresModele,
+    params_fuites: Optional[ParametresFuites] = None,
+    compteur: Optional[ParametresCompteur] = None,  # NOUVEAU v3.8
+) -> EconomiesEau:
+    """
+    Calculer les économies d'eau par ménage.
+
+    Formules:
+    - Économies fuites = part_ménages × débit_fuite × taux_correction × facteur_efficacité
+    - Économies comportement = usage_base_sans_fuites × réduction_pct × facteur_efficacité
+
+    La réduction comportementale s'applique sur l'usage hors fuites pour
+    éviter un double-compte (les fuites ne sont pas un usage discrétionnaire).
+
+    NOUVEAU v3.8: Les facteurs d'efficacité par type de compteur modulent les économies.
+    - AMI (référence): facteur = 1.0
+    - AMR: facteur comportement = 0.875, facteur fuites = 0.91
+    - Manuel: facteur comportement = 0.625, facteur fuites = 0.765
+
+    Paramètres:
+        params: Paramètres du modèle
+        params_fuites: Paramètres de fuites optionnels
+        compteur: Paramètres du compteur (pour facteurs d'efficacité)
+
+    Retourne:
+        EconomiesEau avec les 3 composantes
+    """
+    # Usage de base (m³/ménage/an)
+    usage_base = (params.lpcd * params.taille_menage * 365.0) / 1000.0
+
+    # Facteurs d'efficacité par type de compteur (NOUVEAU v3.8)
+    if compteur is not None:
+        facteur_comportement = compteur.facteur_efficacite_comportement
+        facteur_fuites = compteur.facteur_efficacite_fuites
+    else:
+        # Défaut: AMI (facteurs = 1.0)
+        facteur_comportement = 1.0
+        facteur_fuites = 1.0
+
+    # Paramètres de fuite (source: params_fuites si fourni)
+    if params_fuites is None:
+        part_fuite = params.part_menages_fuite_pct / 100.0
+        debit_fuite = params.debit_fuite_m3_an
+        taux_correction = params.taux_correction_fuite_pct / 100.0
+    else:
+        part_fuite = params_fuites.part_menages_fuite_pct / 100.0
+        # CORRECTION 4.5: Utiliser volume_fuite_moyen_pondere si mode deux-stocks
+        if params_fuites.utiliser_prevalence_differenciee:
+            debit_fuite = params_fuites.volume_fuite_moyen_pondere
+        else:
+            debit_fuite = params_fuites.debit_fuite_m3_an
+        # CORRECTION 4.4: Utiliser taux effectif avec persistance
+        taux_correction = params_fuites.taux_correction_effectif_avec_persistance
+
+    # Volume moyen de fuites AVANT correction (m³/an/ménage)
+    volume_fuite_pre = part_fuite * debit_fuite
+
+    # Usage de base net des fuites (évite double-compte comportement/fuites)
+    usage_reductible = max(0.0, usage_base - volume_fuite_pre)
+
+    # Économies fuites: % ménages × débit × taux correction × facteur_efficacité
+    eco_fuite = part_fuite * debit_fuite * taux_correction * facteur_fuites
+
+    # Économies comportementales: % réduction × usage base net × facteur_efficacité
+    eco_comportement = usage_reductible * (params.reduction_comportement_pct / 100.0) * facteur_comportement
+
+    return EconomiesEau(
+        usage_base=usage_base,
+        usage_reductible=usage_reductible,
+        economie_fuite=eco_fuite,
+        economie_comportement=eco_comportement,
+    )
+
+
+def generer_trajectoires(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    economies: EconomiesEau,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+) -> tuple[Trajectoires, float, float, float]:
+    """
+    Générer les séries temporelles des bénéfices et coûts.
+
+    Version 3.5.0: Stratégies d'adoption progressive.
+
+    Fonctionnalités:
+    - Persistance décroissante des effets comportementaux α_B(t)
+    - Coûts de réparation des fuites (optionnel)
+    - Partage des coûts ville/ménages
+    - Mode ECONOMIQUE vs FINANCIER
+    - Fuites réseau (optionnel) avec trajectoire et coûts
+    - NOUVEAU: Adoption progressive A(t) avec CAPEX étalé
+
+    L'adoption A(t) ∈ [0,1] représente la fraction du parc équipée.
+    - OPEX et bénéfices d'eau sont proportionnels à A(t)
+    - CAPEX peut être étalé selon A(t) ou concentré en t=0
+    - NOUVEAU: économies privées calculées par cohortes (âge du compteur)
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        economies: Économies d'eau calculées (valeurs initiales à t=1)
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance (défaut: constant)
+        params_fuites: Configuration des fuites privées et réparations (défaut: sans coût)
+        params_fuites_reseau: Configuration des pertes réseau (optionnel)
+        mode_compte: ECONOMIQUE (bien-être social) ou FINANCIER (budget municipal)
+        valeur_eau: Paramètres de valorisation (défaut: utilise params.valeur_eau_m3)
+        params_adoption: Stratégie d'adoption (défaut: obligatoire immédiat)
+
+    Retourne:
+        trajectoires: Séries temporelles B[t], C[t] avec adoption et coûts
+        I0: Investissement initial (si non étalé) ou total CAPEX (si étalé)
+        facteur_echelle: Facteur appliqué aux coûts
+        cout_ajuste: Coût par compteur après économies d'échelle
+    """
+    H_menages = params.nb_menages
+    H_compteurs = params.nb_compteurs_effectif
+    T = params.horizon_analyse
+
+    # === ADOPTION (NOUVEAU v3.5) ===
+    # DÉPLACÉ ICI pour correction 4.2: calculer économies d'échelle sur H_effectif
+    if params_adoption is None:
+        params_adoption = ADOPTION_OBLIGATOIRE  # Défaut: 100% immédiat
+
+    # CORRECTION 4.2: Calculer les économies d'échelle sur le nombre effectif de compteurs
+    # Si adoption max = 70%, on n'achète que 70% des compteurs → rabais volume sur 0.70*H_compteurs
+    A_max = params_adoption.adoption_max_pct / 100.0
+    H_effectif = int(H_compteurs * A_max)
+
+    # === ÉCONOMIES D'ÉCHELLE ===
+    if config_echelle is None:
+        config_echelle = ConfigEconomiesEchelle(activer=False)
+
+    facteur_echelle = calculer_facteur_echelle(H_effectif, config_echelle)
+    cout_compteur = compteur.cout_compteur
+    cout_installation = compteur.cout_installation
+    cout_reseau = compteur.cout_reseau_par_compteur if compteur.type_compteur == TypeCompteur.AMI else 0.0
+
+    facteur_echelle_compteur = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_compteur)
+    facteur_echelle_installation = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_installation)
+    facteur_echelle_reseau = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_reseau)
+
+    cout_base = compteur.cout_initial_par_compteur
+    cout_ajuste = (
+        cout_compteur * facteur_echelle_compteur +
+        cout_installation * facteur_echelle_installation +
+        cout_reseau * facteur_echelle_reseau
+    )
+
+    # Investissement initial (pour adoption complète)
+    # = coût variable × nb_compteurs + coût fixe infrastructure (AMI seulement)
+    cout_infra_fixe = compteur.cout_infra_fixe if compteur.type_compteur == TypeCompteur.AMI else 0.0
+    I0_total = cout_ajuste * H_compteurs + cout_infra_fixe
+
+    # Générer la série d'adoption A(t) pour t = 1..T
+    serie_adoption = generer_serie_adoption(params_adoption, T)
+    delta_adoption = calculer_delta_adoption(serie_adoption)
+    serie_adoption_effective = calculer_adoption_effective(
+        serie_adoption, params_adoption.fraction_premiere_annee
+    )
+
+    # Calculer CAPEX étalé si nécessaire
+    if params_adoption.etaler_capex:
+        capex_etale = calculer_capex_etale(I0_total, params_adoption, T)
+        I0 = 0.0  # Pas d'investissement initial ponctuel
+    else:
+        capex_etale = np.zeros(T)
+        I0 = I0_total  # Investissement complet en t=0
+
+    # === PERSISTANCE ===
+    if persistance is None:
+        persistance = ParametresPersistance(
+            mode=ModePersistance.CONSTANT,
+            alpha_initial=params.reduction_comportement_pct / 100.0,
+        )
+
+    # Générer la série α_B(t) pour chaque année
+    serie_alpha_base = generer_serie_alpha(persistance, T)
+
+    # Appliquer le facteur d'efficacité comportementale du compteur (NOUVEAU v3.8)
+    # AMI: facteur=1.0 → α inchangé
+    # AMR: facteur=0.875 → α réduit de 12.5%
+    # Manuel: facteur=0.625 → α réduit de 37.5%
+    facteur_comportement = max(0.0, min(1.0, compteur.facteur_efficacite_comportement))
+    serie_alpha = serie_alpha_base * facteur_comportement
+
+    # === ÉCONOMIES D'EAU PAR ANNÉE ===
+    # Économies comportementales par âge (cohorte)
+    usage_reductible = economies.usage_reductible
+    eco_comportement_serie = usage_reductible * serie_alpha
+
+    # Économies fuites par âge (cohorte)
+    # NOUVEAU v3.8: Appliquer le facteur d'efficacité de détection
+    res_fuites_cohorte = None
+    if params_fuites is not None:
+        with etape("calculer_dynamique_fuites"):
+            res_fuites_cohorte = calculer_dynamique_fuites(
+                params_fuites, 1, T,
+                facteur_efficacite_detection=compteur.facteur_efficacite_fuites
+            )
+        eco_fuite_menage_serie = res_fuites_cohorte.economies_eau_par_an
+    else:
+        eco_fuite_menage_serie = np.full(T, economies.economie_fuite)
+
+    # Fuites réseau (optionnel) : économies et coûts dynamiques
+    economies_reseau_m3 = np.zeros(T)
+    economies_reseau_par_menage = np.zeros(T)
+    couts_reseau = np.zeros(T)
+    capex_reseau = {}
+
+    if params_fuites_reseau is not None and params_fuites_reseau.activer:
+        res_reseau = calculer_dynamique_fuites_reseau(
+            params_fuites_reseau,
+            T,
+            serie_adoption=serie_adoption_effective,
+        )
+        economies_reseau_m3 = res_reseau.economies_m3_par_an
+        couts_reseau = res_reseau.couts_totaux_par_an
+        if H_menages > 0:
+            economies_reseau_par_menage = economies_reseau_m3 / H_menages
+
+        # CAPEX ponctuel (DMA, capteurs, analytics)
+        if params_fuites_reseau.cout_capex_initial > 0:
+            capex_reseau[params_fuites_reseau.annee_capex] = params_fuites_reseau.cout_capex_initial
+
+    # Économies totales par année (pour un ménage équipé)
+    economies_par_menage = (
+        eco_fuite_menage_serie +
+        eco_comportement_serie +
+        economies_reseau_par_menage
+    )  # m³/ménage/an
+
+    # Économies privées par cohortes (comportement + fuites)
+    economies_comportement_m3 = convoluer_cohortes(
+        delta_adoption, eco_comportement_serie, H_menages,
+        fraction_premiere_annee=params_adoption.fraction_premiere_annee
+    )
+    economies_fuites_m3 = convoluer_cohortes(
+        delta_adoption, eco_fuite_menage_serie, H_menages,
+        fraction_premiere_annee=params_adoption.fraction_premiere_annee
+    )
+
+    # Économies totales (privé + réseau)
+    economies_eau_m3 = (
+        economies_comportement_m3 +
+        economies_fuites_m3 +
+        economies_reseau_m3
+    )  # m³/an total
+
+    # === VALORISATION DE L'EAU SELON LE MODE (v3.4) ===
+    if valeur_eau is None:
+        # Rétrocompatibilité: utiliser la valeur du modèle comme valeur sociale
+        # et estimer le coût variable à ~10% de la valeur sociale (Winnipeg ratio)
+        # Aucun ratio implicite: utiliser la valeur sociale du modèle
+        # et le coût variable par défaut (Québec).
+        valeur_eau = ParametresValeurEau(
+            valeur_sociale_m3=params.valeur_eau_m3,
+            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
+        )
+
+    # Sélectionner la valeur selon le mode d'analyse
+    if mode_compte == ModeCompte.ECONOMIQUE:
+        valeur_m3 = valeur_eau.valeur_sociale_m3
+    else:
+        valeur_m3 = valeur_eau.cout_variable_m3
+
+    # === BÉNÉFICES ANNUELS ===
+    annees = np.arange(1, T + 1)
+
+    # Valeur de l'eau économisée ($/an) - selon la perspective
+    benefices_eau = economies_eau_m3 * valeur_m3
+
+    # Report infrastructure
+    # Le report d'infrastructure dépend des économies totales, donc aussi de A(t)
+    benef_infra_annuel = params.benefice_report_infra_annuel
+    benefices_infra = np.full(T, benef_infra_annuel) * serie_adoption_effective
+    if params.benefice_report_infra_par_m3 > 0:
+        benefices_infra = benefices_infra + (economies_eau_m3 * params.benefice_report_infra_par_m3)
+
+    # === COÛTS D'EXPLOITATION ===
+    # L'OPEX est proportionnel au nombre de compteurs installés
+    cout_exploit_annuel = compteur.cout_exploitation_annuel * H_compteurs
+    couts_exploitation = np.full(T, cout_exploit_annuel) * serie_adoption_effective
+
+    # === COÛTS PONCTUELS ===
+    couts_ponctuels = {}
+    couts_ponctuels_compteur = {}
+    couts_ponctuels_reseau = {}
+
+    # CAPEX réseau ponctuel
+    for annee, montant in capex_reseau.items():
+        couts_ponctuels[annee] = couts_ponctuels.get(annee, 0.0) + montant
+        couts_ponctuels_reseau[annee] = couts_ponctuels_reseau.get(annee, 0.0) + montant
+
+    # Remplacement batterie (AMI/AMR seulement)
+    # Coût déclenché à l'âge batterie pour chaque cohorte installée
+    # CORRECTION v3.9: Boucle pour gérer plusieurs remplacements si horizon > durée_vie
+    # Ex: horizon 30 ans, batterie 10 ans → remplacements aux années 10, 20, 30
+    if compteur.type_compteur in [TypeCompteur.AMI, TypeCompteur.AMR]:
+        if compteur.cout_remplacement_batterie > 0 and compteur.duree_vie_batterie > 0:
+            cout_batterie_par_age = np.zeros(T)
+            # Ajouter un remplacement tous les duree_vie_batterie ans
+            annee_remplacement = compteur.duree_vie_batterie
+            while annee_remplacement <= T:
+                age_index = annee_remplacement - 1  # Conversion année → index (0-based)
+                if 0 <= age_index < T:
+                    cout_batterie_par_age[age_index] = compteur.cout_remplacement_batterie
+                annee_remplacement += compteur.duree_vie_batterie
+
+            # Convoluer avec les cohortes d'adoption
+            if np.any(cout_batterie_par_age > 0):
+                couts_batterie = convoluer_cohortes(
+                    delta_adoption, cout_batterie_par_age, H_compteurs,
+                    fraction_premiere_annee=params_adoption.fraction_premiere_annee
+                )
+                for annee, montant in enumerate(couts_batterie, start=1):
+                    if montant > 0:
+                        couts_ponctuels[annee] = couts_ponctuels.get(annee, 0.0) + montant
+                        couts_ponctuels_compteur[annee] = couts_ponctuels_compteur.get(annee, 0.0) + montant
+
+    # === COÛTS DE RÉPARATION DES FUITES (NOUVEAU v3.3) ===
+    # Les coûts suivent la même logique de cohortes que les économies privées
+    if params_fuites is not None and params_fuites.inclure_cout_reparation:
+        if res_fuites_cohorte is None:
+            with etape("calculer_dynamique_fuites"):
+                res_fuites_cohorte = calculer_dynamique_fuites(params_fuites, 1, T)
+        couts_reparation_fuites = convoluer_cohortes(
+            delta_adoption, res_fuites_cohorte.cout_total_par_an, H_menages,
+            fraction_premiere_annee=params_adoption.fraction_premiere_annee
+        )
+        couts_reparation_ville = convoluer_cohortes(
+            delta_adoption, res_fuites_cohorte.cout_ville_par_an, H_menages,
+            fraction_premiere_annee=params_adoption.fraction_premiere_annee
+        )
+        couts_reparation_menages = convoluer_cohortes(
+            delta_adoption, res_fuites_cohorte.cout_menages_par_an, H_menages,
+            fraction_premiere_annee=params_adoption.fraction_premiere_annee
+        )
+    else:
+        # Pas de coûts de réparation
+        couts_reparation_fuites = np.zeros(T)
+        couts_reparation_ville = np.zeros(T)
+        couts_reparation_menages = np.zeros(T)
+
+    # === COÛTS INCITATIFS (NOUVEAU v3.8) ===
+    # Les incitatifs sont versés aux nouveaux adoptants pendant duree_incitatif_ans années
+    # Logique: si 1000 ménages adoptent en t=1 et l'incitatif est de 180$/an pendant 3 ans,
+    # alors on paie 180k$ en t=1, t=2, t=3 pour cette cohorte
+    couts_incitatifs = np.zeros(T)
+    if params_adoption is not None and params_adoption.cout_incitatif_par_menage > 0:
+        cout_annuel_par_menage = params_adoption.cout_incitatif_par_menage / params_adoption.duree_incitatif_ans
+        duree = params_adoption.duree_incitatif_ans
+
+        # Nouveaux adoptants chaque année (delta_adoption * H_menages)
+        nouveaux_adoptants = delta_adoption * H_menages
+
+        # Pour chaque année t, calculer le coût total des incitatifs
+        # = somme des coûts pour toutes les cohortes qui reçoivent encore l'incitatif
+        for t in range(T):
+            # Cohortes qui reçoivent l'incitatif en année t+1
+            # Ce sont les adoptants des années max(0, t-duree+1) à t (inclus)
+            debut_cohorte = max(0, t - duree + 1)
+            for c in range(debut_cohorte, t + 1):
+                couts_incitatifs[t] += nouveaux_adoptants[c] * cout_annuel_par_menage
+
+    trajectoires = Trajectoires(
+        annees=annees,
+        benefices_eau=benefices_eau,
+        benefices_infra=benefices_infra,
+        couts_exploitation=couts_exploitation,
+        couts_ponctuels=couts_ponctuels,
+        couts_ponctuels_compteur=couts_ponctuels_compteur,
+        couts_ponctuels_reseau=couts_ponctuels_reseau,
+        couts_reparation_fuites=couts_reparation_fuites,
+        couts_reparation_ville=couts_reparation_ville,
+        couts_reparation_menages=couts_reparation_menages,
+        economies_eau_m3=economies_eau_m3,
+        economies_par_menage=economies_par_menage,
+        economies_fuites_menage=eco_fuite_menage_serie,
+        economies_comportement_menage=eco_comportement_serie,
+        economies_reseau_m3=economies_reseau_m3,
+        economies_reseau_par_menage=economies_reseau_par_menage,
+        couts_reseau=couts_reseau,
+        # NOUVEAU v3.5: Adoption progressive
+        serie_adoption=serie_adoption,
+        capex_etale=capex_etale,
+        # NOUVEAU v3.8: Coûts incitatifs
+        couts_incitatifs=couts_incitatifs,
+    )
+
+    return trajectoires, I0, facteur_echelle, cout_ajuste
+
+
+def actualiser_series(
+    traj: Trajectoires,
+    r: float,
+    I0: float,
+    inclure_reparations: bool = True,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    part_ville_capex: float = 1.0,
+    part_ville_opex: float = 1.0,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> tuple[float, float, float, float, float, float, float]:
+    """
+    Actualiser les séries temporelles et calculer les métriques financières.
+
+    Version 3.11.0: Support MCF (Coût Marginal des Fonds publics).
+    Version 3.8.0: Support coûts incitatifs pour stratégies d'adoption.
+
+    Formules:
+    - VA(B) = Σ B[t] / (1+r)^t
+    - VA(C) = I0 + VA(CAPEX_etale) + Σ C_exploit[t] + Σ C_reseau[t] + Σ C_reparation[t] + Σ C_incitatifs[t] + ponctuels
+    - VAN = VA(B) - VA(C)
+    - RBC = VA(B) / VA(C)
+
+    MCF (Coût Marginal des Fonds publics):
+    - En mode ÉCONOMIQUE avec MCF activé, seule la part publique est majorée
+      du facteur (1 + mcf) pour refléter le coût social de la taxation
+    - Source: Treasury Board of Canada (2007): MCF = 0.20
+
+    CAPEX étalé:
+    - Si I0 > 0: investissement initial ponctuel (adoption obligatoire)
+    - Si capex_etale non vide: investissement réparti selon A(t)
+
+    Distinction des coûts de réparation:
+    - ECONOMIQUE: coût total (ville + ménages) car tous les coûts comptent
+    - FINANCIER: coût ville seulement (perspective budget municipal)
+
+    Paramètres:
+        traj: Trajectoires des flux annuels
+        r: Taux d'actualisation (décimal, ex: 0.03 pour 3%)
+        I0: Investissement initial ($) - 0 si CAPEX étalé
+        inclure_reparations: Inclure les coûts de réparation dans VA(C)
+        mode_compte: ECONOMIQUE ou FINANCIER (affecte les coûts de réparation)
+        part_ville_capex: Part du CAPEX payé par la ville (0-1)
+        part_ville_opex: Part de l'OPEX payé par la ville (0-1)
+        valeur_eau: Paramètres de valeur d'eau (pour MCF). Si None, MCF non appliqué.
+
+    Retourne:
+        va_benefices: Valeur actuelle des bénéfices
+        va_couts_exploit: Valeur actuelle des coûts d'exploitation
+        va_couts_ponctuels: Valeur actuelle des coûts ponctuels (batterie)
+        va_couts_reparation: Valeur actuelle des coûts de réparation
+        va_couts_incitatifs: Valeur actuelle des coûts incitatifs (NOUVEAU v3.8)
+        van: Valeur Actuelle Nette
+        rbc: Ratio Bénéfices-Coûts
+    """
+    # Facteurs d'actualisation pour chaque année
+    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
+
+    # Valeurs actuelles par composante
+    va_benefices = float(np.sum(traj.benefices_totaux * facteurs_actu))
+
+    # Parts payées par la ville
+    capex_part = part_ville_capex
+    opex_part = part_ville_opex
+
+    # Facteur MCF (v3.11.0) - appliqué uniquement à la part publique en mode économique
+    # Le MCF reflète le coût social de lever des fonds publics par taxation
+    facteur_mcf = 1.0
+    if valeur_eau is not None:
+        facteur_mcf = valeur_eau.facteur_mcf(mode_compte)
+
+    if mode_compte == ModeCompte.ECONOMIQUE:
+        capex_mix = capex_part * facteur_mcf + (1.0 - capex_part)
+        opex_mix = opex_part * facteur_mcf + (1.0 - opex_part)
+        reseau_mix = facteur_mcf  # réseau = 100% public
+    else:
+        capex_mix = capex_part
+        opex_mix = opex_part
+        reseau_mix = 1.0
+
+    couts_exploit_total = traj.couts_exploitation * opex_mix
+    if len(traj.couts_reseau) > 0:
+        # Les coûts réseau sont municipaux (non partagés)
+        couts_exploit_total = couts_exploit_total + traj.couts_reseau * reseau_mix
+    va_couts_exploit = float(np.sum(couts_exploit_total * facteurs_actu))
+
+    # CAPEX étalé (v3.5) - si adoption progressive avec étalement
+    if traj.capex_etale_actif:
+        va_capex_etale = float(np.sum(traj.capex_etale * facteurs_actu)) * capex_mix
+    else:
+        va_capex_etale = 0.0
+
+    # Coûts ponctuels actualisés
+    couts_ponctuels_compteur = getattr(traj, "couts_ponctuels_compteur", {})
+    couts_ponctuels_reseau = getattr(traj, "couts_ponctuels_reseau", {})
+    if len(couts_ponctuels_compteur) == 0 and len(couts_ponctuels_reseau) == 0:
+        couts_ponctuels_compteur = traj.couts_ponctuels
+
+    va_ponctuels_compteur = sum(
+        montant / (1.0 + r) ** annee
+        for annee, montant in couts_ponctuels_compteur.items()
+    )
+    va_ponctuels_reseau = sum(
+        montant / (1.0 + r) ** annee
+        for annee, montant in couts_ponctuels_reseau.items()
+    )
+    va_couts_ponctuels = (va_ponctuels_reseau * reseau_mix) + (va_ponctuels_compteur * capex_mix)
+
+    # Coûts de réparation des fuites (v3.4: selon la perspective)
+    # CORRECTION MCF: en mode ÉCONOMIQUE, seule la part ville est majorée du MCF
+    if inclure_reparations and traj.couts_reparation_actifs:
+        if mode_compte == ModeCompte.ECONOMIQUE:
+            # Analyse économique: coûts ville (avec MCF) + coûts ménages (sans MCF)
+            # Le MCF s'applique aux dépenses publiques seulement
+            va_repar_ville = float(np.sum(traj.couts_reparation_ville * facteurs_actu))
+            va_repar_menages = float(np.sum(traj.couts_reparation_menages * facteurs_actu))
+            va_couts_reparation = (va_repar_ville * facteur_mcf) + va_repar_menages
+        else:
+            # Analyse financière: seulement les coûts de la ville (sans MCF)
+            va_couts_reparation = float(np.sum(traj.couts_reparation_ville * facteurs_actu))
+    else:
+        va_couts_reparation = 0.0
+
+    # Coûts incitatifs (NOUVEAU v3.8)
+    # En mode ÉCONOMIQUE: les incitatifs sont des TRANSFERTS (redistribution),
+    # ils n'affectent pas le bien-être social total → EXCLUS
+    # En mode FINANCIER: coût réel pour le budget municipal → INCLUS
+    if len(traj.couts_incitatifs) > 0 and mode_compte == ModeCompte.FINANCIER:
+        va_couts_incitatifs = float(np.sum(traj.couts_incitatifs * facteurs_actu))
+    else:
+        va_couts_incitatifs = 0.0
+
+    # Totaux (I0 + CAPEX étalé + OPEX + ponctuels + réparations + incitatifs si FINANCIER)
+    # I0 public est majoré du MCF en mode économique
+    I0_effectif = I0 * capex_mix
+    va_couts_totaux = I0_effectif + va_capex_etale + va_couts_exploit + va_couts_ponctuels + va_couts_reparation + va_couts_incitatifs
+    van = va_benefices - va_couts_totaux
+    rbc = division_securisee(va_benefices, va_couts_totaux)
+
+    return va_benefices, va_couts_exploit, va_couts_ponctuels, va_couts_reparation, va_couts_incitatifs, van, rbc
+
+
+def calculer_van_cumulative(
+    traj: Trajectoires,
+    r: float,
+    I0: float,
+    inclure_reparations: bool = True,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    part_ville_capex: float = 1.0,
+    part_ville_opex: float = 1.0,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> tuple[np.ndarray, float]:
+    """
+    Calculer la VAN cumulative année par année.
+
+    Version 3.12.0: Support MCF pour cohérence avec actualiser_series.
+    Version 3.5.0: Support CAPEX étalé pour adoption progressive.
+
+    Utilisé pour:
+    - Graphique VAN cumulative
+    - Calcul de la période de récupération (récupération actualisée)
+
+    Paramètres:
+        traj: Trajectoires des flux annuels
+        r: Taux d'actualisation (décimal)
+        I0: Investissement initial ($) - 0 si CAPEX étalé
+        inclure_reparations: Inclure les coûts de réparation des fuites
+        mode_compte: ECONOMIQUE ou FINANCIER (affecte les coûts de réparation)
+        part_ville_capex: Part du CAPEX payé par la ville (0-1)
+        part_ville_opex: Part de l'OPEX payé par la ville (0-1)
+        valeur_eau: Paramètres valeur d'eau (pour MCF). Si None, MCF non appliqué.
+
+    Retourne:
+        van_cumulative: VAN cumulative pour chaque année [1..T]
+        periode_recuperation: Année de récupération (fractionnaire)
+    """
+    T = traj.T
+
+    # Facteurs d'actualisation
+    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
+
+    # Facteur MCF (cohérent avec actualiser_series, appliqué à la part publique)
+    facteur_mcf = 1.0
+    if valeur_eau is not None:
+        facteur_mcf = valeur_eau.facteur_mcf(mode_compte)
+
+    # Bénéfices actualisés cumulés
+    benefices_actualises = traj.benefices_totaux * facteurs_actu
+    va_benef_cum = np.cumsum(benefices_actualises)
+
+    # Coûts actualisés cumulés (I0 + CAPEX étalé + OPEX cumulé)
+    capex_part = part_ville_capex
+    opex_part = part_ville_opex
+    if mode_compte == ModeCompte.ECONOMIQUE:
+        capex_mix = capex_part * facteur_mcf + (1.0 - capex_part)
+        opex_mix = opex_part * facteur_mcf + (1.0 - opex_part)
+        reseau_mix = facteur_mcf
+    else:
+        capex_mix = capex_part
+        opex_mix = opex_part
+        reseau_mix = 1.0
+
+    # OPEX (MCF sur part publique seulement)
+    couts_exploit_total = traj.couts_exploitation * opex_mix
+    if len(traj.couts_reseau) > 0:
+        couts_exploit_total = couts_exploit_total + traj.couts_reseau * reseau_mix
+    couts_exploit_actualises = couts_exploit_total * facteurs_actu
+
+    # I0 avec MCF partiel
+    va_cout_cum = (I0 * capex_mix) + np.cumsum(couts_exploit_actualises)
+
+    # Ajouter CAPEX étalé si actif (v3.5) avec MCF partiel
+    if traj.capex_etale_actif:
+        capex_actualise = traj.capex_etale * facteurs_actu * capex_mix
+        va_cout_cum += np.cumsum(capex_actualise)
+
+    # Ajouter coûts ponctuels aux années appropriées (MCF partiel)
+    couts_ponctuels_compteur = getattr(traj, "couts_ponctuels_compteur", {})
+    couts_ponctuels_reseau = getattr(traj, "couts_ponctuels_reseau", {})
+    if len(couts_ponctuels_compteur) == 0 and len(couts_ponctuels_reseau) == 0:
+        couts_ponctuels_compteur = traj.couts_ponctuels
+
+    for annee, montant in couts_ponctuels_compteur.items():
+        if 1 <= annee <= T:
+            va_ponctuel = (montant * capex_mix) / (1.0 + r) ** annee
+            va_cout_cum[annee - 1:] += va_ponctuel
+    for annee, montant in couts_ponctuels_reseau.items():
+        if 1 <= annee <= T:
+            va_ponctuel = (montant * reseau_mix) / (1.0 + r) ** annee
+            va_cout_cum[annee - 1:] += va_ponctuel
+
+    # Ajouter coûts de réparation des fuites (avec MCF cohérent)
+    if inclure_reparations and traj.couts_reparation_actifs:
+        if mode_compte == ModeCompte.ECONOMIQUE:
+            # Mode économique: part ville (avec MCF) + part ménages (sans MCF)
+            repar_ville_actu = traj.couts_reparation_ville * facteurs_actu * facteur_mcf
+            repar_menages_actu = traj.couts_reparation_menages * facteurs_actu
+            va_cout_cum += np.cumsum(repar_ville_actu) + np.cumsum(repar_menages_actu)
+        else:
+            # Mode financier: part ville seulement (sans MCF)
+            couts_repar_actualises = traj.couts_reparation_ville * facteurs_actu
+            va_cout_cum += np.cumsum(couts_repar_actualises)
+
+    # Ajouter coûts incitatifs (NOUVEAU v3.8)
+    # En mode ÉCONOMIQUE: EXCLUS (transferts neutres pour le bien-être social)
+    # En mode FINANCIER: INCLUS (coût réel pour le budget municipal)
+    if len(traj.couts_incitatifs) > 0 and mode_compte == ModeCompte.FINANCIER:
+        couts_incitatifs_actualises = traj.couts_incitatifs * facteurs_actu
+        va_cout_cum += np.cumsum(couts_incitatifs_actualises)
+
+    # VAN cumulative
+    van_cumulative = va_benef_cum - va_cout_cum
+
+    # Période de récupération (interpolation linéaire)
+    periode_recuperation = annee_croisement(van_cumulative)
+
+    return van_cumulative, periode_recuperation
+
+
+# =============================================================================
+# FONCTIONS UTILITAIRES
+# =============================================================================
+
+def fmt_argent(x: float, decimales: int = 0) -> str:
+    """Formater les montants en dollars."""
+    try:
+        if x is None or not np.isfinite(x):
+            return "---"
+        if abs(x) >= 1e9:
+            return f"{x/1e9:,.{decimales}f} G$"
+        if abs(x) >= 1e6:
+            return f"{x/1e6:,.{decimales}f} M$"
+        if abs(x) >= 1e3:
+            return f"{x/1e3:,.{decimales}f} k$"
+        return f"{x:,.{decimales}f} $"
+    except (TypeError, ValueError):
+        return "---"
+
+
+def facteur_recuperation_capital(r: float, n: int) -> float:
+    """
+    Facteur de récupération du capital (FRC).
+
+    Convertit une valeur actuelle en paiements annuels équivalents.
+    """
+    if n <= 0:
+        return 0.0
+    if r <= 1e-10:
+        return 1.0 / max(1, n)
+    rn = (1.0 + r) ** n
+    return r * rn / (rn - 1.0)
+
+
+def valeur_actuelle_annuite(paiement: float, r: float, n: int) -> float:
+    """Valeur actuelle d'une annuité."""
+    if n <= 0:
+        return 0.0
+    if abs(r) < 1e-10:
+        return paiement * n
+    return paiement * (1 - (1 + r) ** (-n)) / r
+
+
+def annee_croisement(serie: np.ndarray) -> float:
+    """
+    Trouver l'année fractionnaire où la VAN cumulative croise zéro.
+
+    Utilise interpolation linéaire entre les valeurs annuelles.
+    """
+    for i in range(len(serie)):
+        if serie[i] >= 0:
+            if i == 0:
+                return 0.0
+            prev, curr = serie[i - 1], serie[i]
+            if curr == prev:
+                return float(i)
+            frac = (0 - prev) / (curr - prev)
+            return i + frac
+    return float('inf')
+
+
+def division_securisee(num: float, denom: float, defaut: float = np.nan) -> float:
+    """Division sécurisée avec valeur par défaut."""
+    if abs(denom) < 1e-10:
+        return defaut
+    return num / denom
+
+
+# =============================================================================
+# MODÈLE PRINCIPAL
+# =============================================================================
+
+def executer_modele(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+) -> ResultatsModele:
+    """
+    Exécuter l'analyse coûts-bénéfices pour un type de compteur.
+
+    Version 3.5.0 - Stratégies d'adoption progressive.
+
+    Cette version utilise des séries temporelles B[t] et C[t] permettant:
+    - Persistance décroissante des effets comportementaux α_B(t)
+    - Coûts de réparation des fuites avec partage ville/ménages
+    - Analyse ECONOMIQUE (bien-être social) ou FINANCIERE (budget municipal)
+    - NOUVEAU: Adoption progressive A(t) avec CAPEX étalé
+
+    Paramètres:
+        params: Paramètres du modèle (population, consommation, etc.)
+        compteur: Paramètres du compteur (coûts, type, etc.)
+        config_echelle: Configuration des économies d'échelle (optionnel)
+        persistance: Configuration de persistance comportementale (optionnel)
+                    Si None: comportement constant (équivalent à v3.0)
+                    Utiliser PERSISTANCE_OPTIMISTE/REALISTE/PESSIMISTE
+        params_fuites: Configuration des coûts de réparation (optionnel)
+                      Si None: pas de coûts de réparation (modèle de base)
+                      Utiliser FUITES_SANS_COUT/MENAGE_SEUL/SUBVENTION_50/VILLE_SEULE
+        params_fuites_reseau: Configuration des pertes réseau (optionnel)
+        mode_compte: ECONOMIQUE (bien-être social) ou FINANCIER (budget municipal)
+                    ECONOMIQUE: valeur sociale de l'eau, sans tarification, tous les coûts
+                    FINANCIER: coût variable évité, sans tarification, coûts ville seulement
+        valeur_eau: Paramètres de valorisation (défaut: VALEUR_EAU_QUEBEC)
+        params_adoption: Stratégie d'adoption (défaut: ADOPTION_OBLIGATOIRE)
+                        Utiliser ADOPTION_OBLIGATOIRE/RAPIDE/PROGRESSIVE/NOUVEAUX/PAR_SECTEUR
+
+    Retourne:
+        ResultatsModele avec tous les calculs
+    """
+    # Extraction paramètres
+    H = params.nb_menages
+    H_compteurs = params.nb_compteurs_effectif
+    r = params.taux_actualisation_pct / 100.0
+    T = params.horizon_analyse
+    part_ville_capex = params.part_ville_capex_pct / 100.0
+    part_ville_opex = params.part_ville_opex_pct / 100.0
+
+    # Initialiser config économies d'échelle si non fournie
+    if config_echelle is None:
+        config_echelle = ConfigEconomiesEchelle(activer=False)
+
+    # === ÉTAPE 1: CALCUL DES ÉCONOMIES D'EAU (INITIALES, v3.8: avec facteurs efficacité) ===
+    with etape("calculer_economies_eau"):
+        economies = calculer_economies_eau(params, params_fuites, compteur)
+
+    # === ÉTAPE 2: GÉNÉRATION DES TRAJECTOIRES (v3.5: avec adoption) ===
+    with etape("generer_trajectoires"):
+        traj, I0, facteur_echelle, cout_ajuste = generer_trajectoires(
+            params, compteur, economies, config_echelle, persistance, params_fuites,
+            params_fuites_reseau,
+            mode_compte=mode_compte, valeur_eau=valeur_eau,
+            params_adoption=params_adoption
+        )
+    facteur_echelle_compteur = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_compteur)
+    facteur_echelle_installation = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_installation)
+    facteur_echelle_reseau = appliquer_facteur_echelle(facteur_echelle, config_echelle.poids_reseau)
+
+    # === ÉTAPE 3: ACTUALISATION DES SÉRIES (v3.8: avec coûts incitatifs, v3.11: MCF) ===
+    inclure_repar = params_fuites is not None and params_fuites.inclure_cout_reparation
+    with etape("actualiser_series"):
+        va_benef, va_exploit, va_batterie, va_reparation, va_incitatifs, van, rbc = actualiser_series(
+            traj,
+            r,
+            I0,
+            inclure_reparations=inclure_repar,
+            mode_compte=mode_compte,
+            part_ville_capex=part_ville_capex,
+            part_ville_opex=part_ville_opex,
+            valeur_eau=valeur_eau,  # v3.11: pour application du MCF
+        )
+
+    # Coûts totaux actualisés (incluant CAPEX étalé et incitatifs si actifs)
+    # Note : actualiser_series inclut déjà le CAPEX étalé et les incitatifs dans ses calculs
+    facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
+    va_couts = va_benef - van
+
+    # Valeur d'eau effective (cohérente avec generer_trajectoires)
+    if valeur_eau is None:
+        valeur_eau_eff = ParametresValeurEau(
+            valeur_sociale_m3=params.valeur_eau_m3,
+            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
+        )
+    else:
+        valeur_eau_eff = valeur_eau
+
+    # Décomposition des bénéfices d'eau (VA)
+    va_benefices_eau = float(np.sum(traj.benefices_eau * facteurs_actu))
+    va_benefices_report_infra = float(np.sum(traj.benefices_infra * facteurs_actu))
+    va_benefices_cout_variable = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.cout_variable_m3 * facteurs_actu))
+    va_benefices_infra_m3 = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.cout_infrastructure_m3 * facteurs_actu))
+    va_benefices_externalites = float(np.sum(traj.economies_eau_m3 * valeur_eau_eff.valeur_externalites_m3 * facteurs_actu))
+
+    # === ÉTAPE 4: VAN CUMULATIVE ET PÉRIODE DE RÉCUPÉRATION ===
+    # CORRECTION v3.12: Passer valeur_eau pour cohérence MCF avec actualiser_series
+    with etape("calculer_van_cumulative"):
+        van_cum, periode_recup = calculer_van_cumulative(
+            traj,
+            r,
+            I0,
+            inclure_reparations=inclure_repar,
+            mode_compte=mode_compte,
+            part_ville_capex=part_ville_capex,
+            part_ville_opex=part_ville_opex,
+            valeur_eau=valeur_eau,
+        )
+
+    # === MÉTRIQUES PAR MÉNAGE (PV-COHÉRENTES) ===
+    # PV des économies d'eau (m³) sur l'horizon
+    pv_m3 = float(np.sum(traj.economies_eau_m3 * facteurs_actu))
+
+    # Coût annuel équivalent (EAC) basé sur la VA des coûts totaux
+    frc = facteur_recuperation_capital(r, T)
+    eac = division_securisee(va_couts, H) * frc
+
+    # Coût nivelé eau économisée ($/m³) : LCSW = PV(C) / PV(m³)
+    lcsw = division_securisee(va_couts, pv_m3)
+
+    # Seuil de rentabilité (m³/an) : cohérent avec le mode de valorisation
+    valeur_m3 = valeur_eau_eff.valeur_eau(mode_compte)
+    q_star = division_securisee(eac, valeur_m3)
+
+    # === CALCULS DÉRIVÉS POUR COMPATIBILITÉ ===
+    cout_base = compteur.cout_initial_par_compteur
+    economies_echelle = (cout_base - cout_ajuste) * H_compteurs
+
+    # Bénéfices annuels (année 1 pour affichage, mais varient avec persistance)
+    benef_eau = float(traj.benefices_eau[0])
+    benef_infra = float(traj.benefices_infra[0])
+    benef_totaux = float(np.mean(traj.benefices_totaux))  # Moyenne pour persistance
+    cout_reseau_an1 = float(traj.couts_reseau[0]) if len(traj.couts_reseau) > 0 else 0.0
+    if mode_compte == ModeCompte.FINANCIER:
+        cout_exploit = float(traj.couts_exploitation[0] * part_ville_opex + cout_reseau_an1)
+        investissement_initial = I0 * part_ville_capex
+    else:
+        cout_exploit = float(traj.couts_exploitation[0] + cout_reseau_an1)
+        investissement_initial = I0
+
+    # Économies: année 1 (initial) pour compatibilité affichage
+    # Note : avec persistance, economies_par_menage varie par année
+    if len(traj.economies_fuites_menage) > 0:
+        eco_fuite_initiale = float(traj.economies_fuites_menage[0])
+    else:
+        eco_fuite_initiale = economies.economie_fuite
+
+    if len(traj.economies_comportement_menage) > 0:
+        eco_comportement_initiale = float(traj.economies_comportement_menage[0])
+    else:
+        eco_comportement_initiale = float(traj.economies_par_menage[0]) - economies.economie_fuite
+
+    if len(traj.economies_reseau_par_menage) > 0:
+        eco_reseau_initiale = float(traj.economies_reseau_par_menage[0])
+    else:
+        eco_reseau_initiale = 0.0
+
+    return ResultatsModele(
+        params=params,
+        compteur=compteur,
+        mode_compte=mode_compte,
+        # Économies d'eau par ménage (valeurs initiales année 1)
+        usage_base_menage=economies.usage_base,
+        economie_fuite_menage=eco_fuite_initiale,
+        economie_comportement_menage=eco_comportement_initiale,
+        economie_reseau_menage=eco_reseau_initiale,
+        economie_totale_menage=float(traj.economies_par_menage[0]),
+        # Économies totales sur l'horizon (m³, tous ménages, toutes années)
+        economies_totales_horizon_m3=float(np.sum(traj.economies_eau_m3)),
+        # Flux annuels
+        investissement_initial=investissement_initial,
+        benefices_eau_annuels=benef_eau,
+        benefice_infra_annuel=benef_infra,
+        benefices_totaux_annuels=benef_totaux,
+        couts_exploitation_annuels=cout_exploit,
+        # Valeurs actualisées
+        va_benefices=va_benef,
+        va_benefices_eau=va_benefices_eau,
+        va_benefices_report_infra=va_benefices_report_infra,
+        va_benefices_cout_variable=va_benefices_cout_variable,
+        va_benefices_infra_m3=va_benefices_infra_m3,
+        va_benefices_externalites=va_benefices_externalites,
+        va_economies_m3=pv_m3,
+        va_couts_exploitation=va_exploit,
+        va_couts_totaux=va_couts,
+        van=van,
+        # Métriques
+        rbc=rbc,
+        eac_menage=eac,
+        lcsw=lcsw,
+        seuil_rentabilite_m3=q_star,
+        # Séries temporelles
+        annees=traj.annees,
+        van_cumulative=van_cum,
+        periode_recuperation=periode_recup,
+        # Économies d'échelle
+        economies_echelle_actives=config_echelle.activer,
+        facteur_echelle=facteur_echelle,
+        facteur_echelle_compteur=facteur_echelle_compteur,
+        facteur_echelle_installation=facteur_echelle_installation,
+        facteur_echelle_reseau=facteur_echelle_reseau,
+        cout_par_compteur_base=cout_base,
+        cout_par_compteur_ajuste=cout_ajuste,
+        economies_realisees=economies_echelle,
+    )
+
+
+# =============================================================================
+# COPIE DES PARAMÈTRES
+# =============================================================================
+
+def _cloner_params(p: ParametresModele) -> dict:
+    """Créer copie mutable des paramètres."""
+    return p.to_dict()
+
+
+def _cloner_compteur(c: ParametresCompteur) -> dict:
+    """Créer copie mutable des paramètres compteur."""
+    return {
+        'type_compteur': c.type_compteur,
+        'cout_compteur': c.cout_compteur,
+        'heures_installation': c.heures_installation,
+        'taux_horaire_installation': c.taux_horaire_installation,
+        'cout_reseau_par_compteur': c.cout_reseau_par_compteur,
+        'duree_vie_compteur': c.duree_vie_compteur,
+        'duree_vie_batterie': c.duree_vie_batterie,
+        'cout_remplacement_batterie': c.cout_remplacement_batterie,
+        'cout_lecture_manuel': c.cout_lecture_manuel,
+        'cout_maintenance_ami': c.cout_maintenance_ami,
+        'cout_maintenance_amr': c.cout_maintenance_amr,
+        'cout_maintenance_manuel': c.cout_maintenance_manuel,
+        'cout_lecture_amr': c.cout_lecture_amr,
+        'cout_opex_non_tech_ami': c.cout_opex_non_tech_ami,
+        'ventilation_opex_ami': c.ventilation_opex_ami,
+    }
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Décomposition linéaire de la VAN: quantités physiques actualisées × prix.
+
+Pour des trajectoires physiques données (économies d'eau, adoption,
+fuites), la VAN est une combinaison linéaire de prix unitaires: valeur de
+l'eau, coûts du compteur, OPEX, report d'infrastructure, parts ville, MCF.
+Une fois la base calculée, un changement de ces entrées se réduit à un
+produit scalaire, sans nouvel appel au modèle.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .core import (
+    ModeCompte,
+    TypeCompteur,
+    ConfigEconomiesEchelle,
+    ParametresAdoption,
+    ParametresCompteur,
+    ParametresFuites,
+    ParametresFuitesReseau,
+    ParametresModele,
+    ParametresPersistance,
+    ParametresValeurEau,
+    ADOPTION_OBLIGATOIRE,
+    VALEUR_EAU_QUEBEC,
+    appliquer_facteur_echelle,
+    calculer_adoption_effective,
+    calculer_capex_etale,
+    calculer_delta_adoption,
+    calculer_economies_eau,
+    convoluer_cohortes,
+    generer_serie_adoption,
+    generer_trajectoires,
+)
+
+
+# =============================================================================
+# MODULE DÉCOMPOSITION — BASE LINÉAIRE DE LA VAN
+# =============================================================================
+#
+# VAN = Σ_k quantite_k × prix_k, avec d(t) = (1+r)^-t:
+#
+#   composante                  quantité                      prix
+#   m3_economises               Σ m³(t)·d(t)                  valeur_m3 + report_par_m3
+#   annees_adoption             Σ A_eff(t)·d(t)               report_annuel
+#   compteurs_equipement        N_inst × f_compteur           -capex_mix × cout_compteur
+#   compteurs_installation      N_inst × f_installation       -capex_mix × heures × taux
+#   compteurs_reseau            N_inst × f_reseau             -capex_mix × cout_reseau (AMI)
+#   infra_fixe                  Σ ΔA(t)·d(t) (ou 1)           -capex_mix × cout_infra_fixe (AMI)
+#   compteurs_annees            H × Σ A_eff(t)·d(t)           -opex_mix × OPEX/compteur/an
+#   remplacements_batterie      Σ batteries(t)·d(t)           -capex_mix × cout_batterie (AMI/AMR)
+#   couts_reseau                Σ C_réseau(t)·d(t) ($)        -reseau_mix
+#   reparations_ville           Σ C_rép_ville(t)·d(t) ($)     -facteur_mcf (éco) | -1 (fin.)
+#   reparations_menages         Σ C_rép_ménages(t)·d(t) ($)   -1 (éco) | 0 (fin.)
+#   incitatifs                  Σ C_incitatifs(t)·d(t) ($)    0 (éco) | -1 (fin.)
+#
+# N_inst = H × Σ ΔA(t)·d(t) si le CAPEX est étalé, H sinon (t=0).
+# capex_mix = part_ville × facteur_mcf + (1 - part_ville) en mode économique,
+# part_ville en mode financier (idem opex_mix); reseau_mix = facteur_mcf ou 1.
+#
+# Les quantités ne dépendent ni des prix ni du mode de compte: basculer en
+# mode financier, activer le MCF ou changer une part ville ne change que les
+# prix. Les coûts de réparation, réseau et incitatifs restent des montants:
+# ils dépendent des paramètres de fuites et d'adoption, non linéaires.
+#
+# =============================================================================
+
+COMPOSANTES_BASE_VAN = (
+    "m3_economises",
+    "annees_adoption",
+    "compteurs_equipement",
+    "compteurs_installation",
+    "compteurs_reseau",
+    "infra_fixe",
+    "compteurs_annees",
+    "remplacements_batterie",
+    "couts_reseau",
+    "reparations_ville",
+    "reparations_menages",
+    "incitatifs",
+)
+
+
+@dataclass
+class BaseVAN:
+    """Quantités actualisées et prix unitaires (VAN = quantités · prix)."""
+    quantites: dict[str, float]
+    prix: dict[str, float]
+    multiplicateurs: dict[str, float] = field(default_factory=dict)  # capex, opex, reseau, mcf
+
+    def van(self, prix: Optional[dict] = None) -> float:
+        """VAN pour les prix courants, éventuellement remplacés par `prix`."""
+        p = self.prix if not prix else {**self.prix, **prix}
+        return float(sum(self.quantites[k] * p[k] for k in COMPOSANTES_BASE_VAN))
+
+    def vecteurs(self) -> tuple[np.ndarray, np.ndarray]:
+        """(quantités, prix) dans l'ordre de COMPOSANTES_BASE_VAN."""
+        return (
+            np.array([self.quantites[k] for k in COMPOSANTES_BASE_VAN]),
+            np.array([self.prix[k] for k in COMPOSANTES_BASE_VAN]),
+        )
+
+    def vers_dict(self) -> dict:
+        """Résumé sérialisable (API)."""
+        return {
+            "composantes": list(COMPOSANTES_BASE_VAN),
+            "quantites": dict(self.quantites),
+            "prix": dict(self.prix),
+            "contributions": {k: self.quantites[k] * self.prix[k] for k in COMPOSANTES_BASE_VAN},
+            "multiplicateurs": dict(self.multiplicateurs),
+            "van": self.van(),
+        }
+
+
+def multiplicateurs_couts(
+    params: ParametresModele,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> dict[str, float]:
+    """
+    Multiplicateurs appliqués aux coûts par actualiser_series().
+
+    Retourne:
+        {"capex", "opex", "reseau", "mcf"}
+    """
+    facteur_mcf = valeur_eau.facteur_mcf(mode_compte) if valeur_eau is not None else 1.0
+    part_capex = params.part_ville_capex_pct / 100.0
+    part_opex = params.part_ville_opex_pct / 100.0
+    if mode_compte == ModeCompte.ECONOMIQUE:
+        return {
+            "capex": part_capex * facteur_mcf + (1.0 - part_capex),
+            "opex": part_opex * facteur_mcf + (1.0 - part_opex),
+            "reseau": facteur_mcf,
+            "mcf": facteur_mcf,
+        }
+    return {"capex": part_capex, "opex": part_opex, "reseau": 1.0, "mcf": 1.0}
+
+
+def prix_base_van(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+) -> dict[str, float]:
+    """
+    Prix unitaires de la base pour des entrées données.
+
+    Mêmes conventions que executer_modele() (valeur_eau None: valeur du
+    modèle et coût variable Québec; réparations comptées si params_fuites
+    les inclut).
+    """
+    if valeur_eau is None:
+        valeur_m3_eau = ParametresValeurEau(
+            valeur_sociale_m3=params.valeur_eau_m3,
+            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
+        ).valeur_eau(mode_compte)
+    else:
+        valeur_m3_eau = valeur_eau.valeur_eau(mode_compte)
+    mix = multiplicateurs_couts(params, mode_compte, valeur_eau)
+    ami = compteur.type_compteur == TypeCompteur.AMI
+    batterie = (
+        compteur.type_compteur in (TypeCompteur.AMI, TypeCompteur.AMR)
+        and compteur.duree_vie_batterie > 0
+    )
+    reparations = params_fuites is not None and params_fuites.inclure_cout_reparation
+    economique = mode_compte == ModeCompte.ECONOMIQUE
+
+    return {
+        "m3_economises": valeur_m3_eau + params.benefice_report_infra_par_m3,
+        "annees_adoption": params.benefice_report_infra_annuel,
+        "compteurs_equipement": -mix["capex"] * compteur.cout_compteur,
+        "compteurs_installation": -mix["capex"] * compteur.cout_installation,
+        "compteurs_reseau": -mix["capex"] * compteur.cout_reseau_par_compteur if ami else 0.0,
+        "infra_fixe": -mix["capex"] * compteur.cout_infra_fixe if ami else 0.0,
+        "compteurs_annees": -mix["opex"] * compteur.cout_exploitation_annuel,
+        "remplacements_batterie": -mix["capex"] * compteur.cout_remplacement_batterie if batterie else 0.0,
+        "couts_reseau": -mix["reseau"],
+        "reparations_ville": -(mix["mcf"] if economique else 1.0) if reparations else 0.0,
+        "reparations_menages": -1.0 if reparations and economique else 0.0,
+        "incitatifs": 0.0 if economique else -1.0,
+    }
+
+
+def calculer_base_van(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+) -> BaseVAN:
+    """
+    Calculer la base linéaire de la VAN (mêmes arguments que executer_modele).
+
+    base.van() reproduit executer_modele(...).van; base.van({"compteurs_equipement":
+    ...}) donne la VAN pour d'autres prix sans réexécuter le modèle.
+    """
+    if config_echelle is None:
+        config_echelle = ConfigEconomiesEchelle(activer=False)
+    if params_adoption is None:
+        params_adoption = ADOPTION_OBLIGATOIRE
+
+    economies = calculer_economies_eau(params, params_fuites, compteur)
+    traj, _, facteur_echelle, _ = generer_trajectoires(
+        params, compteur, economies, config_echelle, persistance, params_fuites,
+        params_fuites_reseau, mode_compte=mode_compte, valeur_eau=valeur_eau,
+        params_adoption=params_adoption,
+    )
+
+    T = params.horizon_analyse
+    H_compteurs = params.nb_compteurs_effectif
+    r = params.taux_actualisation_pct / 100.0
+    actu = 1.0 / (1.0 + r) ** np.arange(1, T + 1)
+
+    serie_adoption = generer_serie_adoption(params_adoption, T)
+    delta_adoption = calculer_delta_adoption(serie_adoption)
+    adoption_effective = calculer_adoption_effective(serie_adoption, params_adoption.fraction_premiere_annee)
+
+    # Part du CAPEX actualisée: étalée selon ΔA(t), ou entière en t=0
+    if params_adoption.etaler_capex:
+        part_capex = float(np.sum(calculer_capex_etale(1.0, params_adoption, T) * actu))
+    else:
+        part_capex = 1.0
+    compteurs_installes = H_compteurs * part_capex
+
+    # Remplacements de batterie: une par compteur tous les duree_vie_batterie ans
+    batteries = 0.0
+    if compteur.type_compteur in (TypeCompteur.AMI, TypeCompteur.AMR) and compteur.duree_vie_batterie > 0:
+        par_age = np.zeros(T)
+        par_age[compteur.duree_vie_batterie - 1::compteur.duree_vie_batterie] = 1.0
+        batteries = float(np.sum(convoluer_cohortes(
+            delta_adoption, par_age, H_compteurs,
+            fraction_premiere_annee=params_adoption.fraction_premiere_annee,
+        ) * actu))
+
+    couts_reseau = float(np.sum(traj.couts_reseau * actu)) if len(traj.couts_reseau) else 0.0
+    couts_reseau += sum(m / (1.0 + r) ** a for a, m in traj.couts_ponctuels_reseau.items())
+
+    quantites = {
+        "m3_economises": float(np.sum(traj.economies_eau_m3 * actu)),
+        "annees_adoption": float(np.sum(adoption_effective * actu)),
+        "compteurs_equipement": compteurs_installes * appliquer_facteur_echelle(
+            facteur_echelle, config_echelle.poids_compteur),
+        "compteurs_installation": compteurs_installes * appliquer_facteur_echelle(
+            facteur_echelle, config_echelle.poids_installation),
+        "compteurs_reseau": compteurs_installes * appliquer_facteur_echelle(
+            facteur_echelle, config_echelle.poids_reseau),
+        "infra_fixe": part_capex,
+        "compteurs_annees": H_compteurs * float(np.sum(adoption_effective * actu)),
+        "remplacements_batterie": batteries,
+        "couts_reseau": couts_reseau,
+        "reparations_ville": float(np.sum(traj.couts_reparation_ville * actu)),
+        "reparations_menages": float(np.sum(traj.couts_reparation_menages * actu)),
+        "incitatifs": float(np.sum(traj.couts_incitatifs * actu)),
+    }
+    return BaseVAN(
+        quantites=quantites,
+        prix=prix_base_van(params, compteur, mode_compte, valeur_eau, params_fuites),
+        multiplicateurs=multiplicateurs_couts(params, mode_compte, valeur_eau),
+    )
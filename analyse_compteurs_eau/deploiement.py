@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+"""
+Optimisation du calendrier de déploiement sous contraintes de budget annuel
+et de capacité d'installation: planification exacte par cohortes, recherche
+bornée sur le rythme d'installation et front de Pareto VAN / récupération /
+budget de pointe.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .core import (
+    TypeCompteur,
+    ModeAdoption,
+    ParametresAdoption,
+    ParametresCompteur,
+    ParametresModele,
+    ADOPTION_OBLIGATOIRE,
+    executer_modele,
+)
+
+
+# =============================================================================
+# MODULE DÉPLOIEMENT — CALENDRIERS SOUS CONTRAINTES
+# =============================================================================
+#
+# Un calendrier fixe le nombre de compteurs installés chaque année; le modèle
+# l'évalue en mode d'adoption CALENDRIER avec CAPEX étalé (chaque cohorte
+# paie ses compteurs l'année de son installation).
+#
+# Contraintes annuelles:
+#   - capacité: installations(t) ≤ capacite_max
+#   - budget:   CAPEX(t) = I0_total × installations(t) / N ≤ budget_max
+#   - horizon:  parc complet au plus tard à horizon_deploiement
+#
+# Famille explorée: rythme constant r (compteurs/an) dès l'année 1, dernière
+# année partielle. r est borné par [N / horizon, min(capacité, budget)]:
+# grille géométrique, puis section dorée autour du meilleur point de grille,
+# dans la limite de max_evaluations exécutions du modèle.
+#
+# Planification par cohortes: bénéfices et coûts sont linéaires dans les
+# cohortes annuelles ΔA(t) (convoluer_cohortes, OPEX ∝ A_eff, CAPEX étalé ∝
+# ΔA, incitatifs), donc
+#
+#     VAN(x) = VAN_0 + Σ_t v[t] · x[t]
+#
+# où x[t] = fraction du parc installée l'année t et v[t] = VAN d'équiper tout
+# le parc l'année t (hors coûts fixes VAN_0). v est identifié une fois (T + 1
+# exécutions); le calendrier optimal est alors la solution du programme
+# linéaire max v·x sous 0 ≤ x[t] ≤ limite[t], Σ x = 1: les contraintes étant
+# séparables par année, remplir les années par v[t] décroissant est exact.
+#
+# =============================================================================
+
+OBJECTIFS_DEPLOIEMENT = ("van", "payback")
+
+# Exécutions du modèle au maximum pour la recherche sur le rythme
+MAX_EVALUATIONS_DEPLOIEMENT = 40
+
+_NOMBRE_OR = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+@dataclass
+class PlanDeploiement:
+    """Calendrier évalué."""
+    calendrier: list[int]          # compteurs installés par année
+    van: float
+    rbc: float
+    payback: Optional[float]       # None: pas de récupération sur l'horizon
+    budget_pointe: float           # CAPEX annuel maximal ($)
+    investissement_total: float    # CAPEX total ($)
+
+    @property
+    def rythme(self) -> int:
+        """Installations de l'année la plus chargée."""
+        return max(self.calendrier)
+
+    @property
+    def annees_deploiement(self) -> int:
+        return len(self.calendrier)
+
+    def vers_dict(self) -> dict:
+        return {
+            "compteurs_par_an": self.rythme,
+            "annees_deploiement": self.annees_deploiement,
+            "calendrier": list(self.calendrier),
+            "budget_annuel": self.budget_pointe,
+            "investissement_total": self.investissement_total,
+            "van": self.van,
+            "rbc": self.rbc,
+            "payback": self.payback,
+        }
+
+
+@dataclass
+class ResultatsDeploiement:
+    """Résultats de optimiser_deploiement()."""
+    optimal: PlanDeploiement
+    plans: list[PlanDeploiement]      # tous les calendriers évalués
+    pareto: list[PlanDeploiement]     # non dominés (VAN, payback, budget de pointe)
+    rythme_min: int
+    rythme_max: int
+    investissement_par_compteur: float
+    n_evaluations: int
+
+
+def calendrier_rythme_constant(nb_compteurs: int, rythme: int) -> list[int]:
+    """Installer `rythme` compteurs par an jusqu'à équiper tout le parc."""
+    annees, reste = divmod(nb_compteurs, rythme)
+    return [rythme] * annees + ([reste] if reste else [])
+
+
+def evaluer_calendrier(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    calendrier: list[int],
+    params_adoption: Optional[ParametresAdoption] = None,
+    **kwargs,
+) -> PlanDeploiement:
+    """
+    Évaluer un calendrier d'installation (compteurs par année).
+
+    Paramètres:
+        params: Paramètres du modèle (nb_menages, nb_compteurs...)
+        compteur: Paramètres du compteur
+        calendrier: Compteurs installés chaque année, à partir de l'année 1
+                    de déploiement
+        params_adoption: Gabarit (année de démarrage, fraction de la
+                         première année, incitatifs); le mode et le CAPEX
+                         sont imposés
+        **kwargs: Arguments supplémentaires pour executer_modele()
+    """
+    nb_compteurs = params.nb_compteurs_effectif
+    cumul = np.cumsum(calendrier, dtype=float)
+    if cumul[-1] > nb_compteurs:
+        raise ValueError("Le calendrier installe plus de compteurs que le parc")
+
+    adoption = replace(
+        params_adoption or ADOPTION_OBLIGATOIRE,
+        mode=ModeAdoption.CALENDRIER,
+        calendrier_pct=tuple(100.0 * cumul / nb_compteurs),
+        adoption_max_pct=100.0,
+        etaler_capex=True,
+    )
+    res = executer_modele(params, compteur, params_adoption=adoption, **kwargs)
+
+    # CAPEX(t) = I0_total × ΔA(t) (cf. calculer_capex_etale)
+    i0_total = _investissement_total(compteur, nb_compteurs)
+    capex = [i0_total * n / nb_compteurs for n in calendrier]
+    return PlanDeploiement(
+        calendrier=[int(n) for n in calendrier],
+        van=float(res.van),
+        rbc=float(res.rbc),
+        payback=float(res.periode_recuperation) if math.isfinite(res.periode_recuperation) else None,
+        budget_pointe=float(max(capex)),
+        investissement_total=float(sum(capex)),
+    )
+
+
+def _investissement_total(compteur: ParametresCompteur, nb_compteurs: int) -> float:
+    """I0 pour tout le parc, hors économies d'échelle."""
+    infra = compteur.cout_infra_fixe if compteur.type_compteur == TypeCompteur.AMI else 0.0
+    return compteur.cout_initial_par_compteur * nb_compteurs + infra
+
+
+def _cle_objectif(objectif: str):
+    """Clé de tri: plus petit = meilleur."""
+    if objectif == "van":
+        return lambda p: -p.van
+    return lambda p: (p.payback if p.payback is not None else math.inf, -p.van)
+
+
+@dataclass
+class ResultatsPlanification:
+    """Calendrier optimal par cohortes."""
+    plan: PlanDeploiement          # évalué par le modèle
+    van_cohortes: np.ndarray       # v[t]: VAN d'équiper tout le parc l'année t
+    van_base: float                # VAN_0: aucun compteur (coûts fixes du programme)
+    van_lineaire: float            # VAN_0 + v · x (égale à plan.van)
+    n_evaluations: int
+
+
+def van_par_cohorte(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    params_adoption: Optional[ParametresAdoption] = None,
+    **kwargs,
+) -> tuple[float, np.ndarray]:
+    """
+    Décomposer la VAN par année d'installation.
+
+    Retourne:
+        (VAN_0, v) avec VAN(x) = VAN_0 + v · x pour tout calendrier x
+        (fraction du parc installée chaque année, t = 1..horizon_analyse)
+    """
+    def van(fractions: list[float]) -> float:
+        adoption = replace(
+            params_adoption or ADOPTION_OBLIGATOIRE,
+            mode=ModeAdoption.CALENDRIER,
+            calendrier_pct=tuple(100.0 * np.cumsum(fractions)),
+            adoption_max_pct=100.0,
+            etaler_capex=True,
+        )
+        return executer_modele(params, compteur, params_adoption=adoption, **kwargs).van
+
+    van_0 = van([0.0])
+    T = params.horizon_analyse
+    v = np.array([van([0.0] * t + [1.0]) - van_0 for t in range(T)])
+    return van_0, v
+
+
+def _par_annee(valeur: Union[float, Sequence[float]], n: int, nom: str) -> np.ndarray:
+    """Contrainte scalaire ou annuelle → tableau de n années."""
+    if np.ndim(valeur) == 0:
+        return np.full(n, float(valeur))
+    valeurs = np.asarray(valeur, dtype=float)
+    if len(valeurs) < n:
+        raise ValueError(f"{nom}: {n} valeurs annuelles requises, {len(valeurs)} fournies")
+    return valeurs[:n]
+
+
+def planifier_deploiement(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    budget_annuel_max: Union[float, Sequence[float]],
+    capacite_max: Union[int, Sequence[int]],
+    horizon_deploiement: int = 10,
+    params_adoption: Optional[ParametresAdoption] = None,
+    deploiement_complet: bool = True,
+    **kwargs,
+) -> ResultatsPlanification:
+    """
+    Calendrier d'installation qui maximise la VAN sous contraintes annuelles.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        budget_annuel_max: CAPEX maximal ($), constant ou par année
+        capacite_max: Compteurs installables, constant ou par année
+        horizon_deploiement: Années de déploiement disponibles
+        params_adoption: Gabarit d'adoption (cf. evaluer_calendrier)
+        deploiement_complet: Équiper tout le parc (sinon, seulement les
+                             cohortes de VAN positive)
+        **kwargs: Arguments supplémentaires pour executer_modele()
+
+    Retourne:
+        ResultatsPlanification
+
+    Lève ValueError si le parc ne peut pas être équipé dans l'horizon.
+    """
+    nb_compteurs = params.nb_compteurs_effectif
+    D = min(horizon_deploiement, params.horizon_analyse)
+    cout_par_compteur = _investissement_total(compteur, nb_compteurs) / nb_compteurs
+    budget = _par_annee(budget_annuel_max, D, "budget_annuel_max")
+    capacite = _par_annee(capacite_max, D, "capacite_max")
+    limites = np.minimum(np.floor(capacite), np.floor(budget / cout_par_compteur)).astype(int)
+
+    van_0, v = van_par_cohorte(params, compteur, params_adoption, **kwargs)
+
+    installes = np.zeros(D, dtype=int)
+    reste = nb_compteurs
+    for t in np.argsort(-v[:D], kind="stable"):
+        if reste == 0 or (not deploiement_complet and v[t] <= 0):
+            break
+        installes[t] = min(max(limites[t], 0), reste)
+        reste -= installes[t]
+    if deploiement_complet and reste > 0:
+        raise ValueError(
+            f"Aucun calendrier réalisable: {reste:,} compteurs non installés après "
+            f"{D} ans avec le budget et la capacité"
+        )
+
+    derniere = int(np.flatnonzero(installes)[-1]) + 1 if installes.any() else 1
+    calendrier = installes[:derniere].tolist()
+    plan = evaluer_calendrier(params, compteur, calendrier, params_adoption=params_adoption, **kwargs)
+    return ResultatsPlanification(
+        plan=plan,
+        van_cohortes=v,
+        van_base=van_0,
+        van_lineaire=float(van_0 + v[:D] @ (installes / nb_compteurs)),
+        n_evaluations=len(v) + 2,
+    )
+
+
+def front_pareto(plans: list[PlanDeploiement]) -> list[PlanDeploiement]:
+    """Plans non dominés: VAN maximale, récupération et budget de pointe minimaux."""
+    def criteres(p: PlanDeploiement) -> tuple:
+        return (-p.van, p.payback if p.payback is not None else math.inf, p.budget_pointe)
+
+    front = []
+    for p in plans:
+        cp = criteres(p)
+        domine = any(
+            all(a <= b for a, b in zip(criteres(q), cp)) and criteres(q) != cp
+            for q in plans
+        )
+        if not domine:
+            front.append(p)
+    return sorted(front, key=lambda p: p.budget_pointe)
+
+
+def optimiser_deploiement(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    budget_annuel_max: float,
+    capacite_max: int,
+    horizon_deploiement: int = 10,
+    objectif: str = "van",
+    params_adoption: Optional[ParametresAdoption] = None,
+    nb_points: int = 12,
+    max_evaluations: int = MAX_EVALUATIONS_DEPLOIEMENT,
+    **kwargs,
+) -> ResultatsDeploiement:
+    """
+    Chercher le rythme d'installation optimal sous contraintes.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        budget_annuel_max: CAPEX annuel maximal ($)
+        capacite_max: Compteurs installables par an
+        horizon_deploiement: Années maximales pour équiper le parc
+        objectif: "van" (maximiser) ou "payback" (minimiser, puis VAN)
+        params_adoption: Gabarit d'adoption (cf. evaluer_calendrier)
+        nb_points: Points de la grille initiale
+        max_evaluations: Exécutions du modèle au maximum pour la recherche sur
+                         le rythme (la planification par cohortes en ajoute
+                         horizon_analyse + 2)
+        **kwargs: Arguments supplémentaires pour executer_modele()
+
+    Retourne:
+        ResultatsDeploiement (optimal, plans évalués, front de Pareto)
+
+    Lève ValueError si aucun rythme ne respecte les contraintes.
+    """
+    if objectif not in OBJECTIFS_DEPLOIEMENT:
+        raise ValueError(f"objectif doit être parmi {OBJECTIFS_DEPLOIEMENT}")
+
+    nb_compteurs = params.nb_compteurs_effectif
+    cout_par_compteur = _investissement_total(compteur, nb_compteurs) / nb_compteurs
+    rythme_min = math.ceil(nb_compteurs / horizon_deploiement)
+    rythme_max = min(int(capacite_max), int(budget_annuel_max / cout_par_compteur), nb_compteurs)
+    if rythme_max < rythme_min:
+        raise ValueError(
+            f"Aucun calendrier réalisable: {rythme_min:,} compteurs/an requis pour "
+            f"{horizon_deploiement} ans, {rythme_max:,} permis par le budget et la capacité"
+        )
+
+    plans: dict[tuple, PlanDeploiement] = {}
+
+    def evaluer(rythme: float) -> PlanDeploiement:
+        rythme = int(round(min(max(rythme, rythme_min), rythme_max)))
+        calendrier = calendrier_rythme_constant(nb_compteurs, rythme)
+        if tuple(calendrier) not in plans:
+            plans[tuple(calendrier)] = evaluer_calendrier(
+                params, compteur, calendrier, params_adoption=params_adoption, **kwargs,
+            )
+        return plans[tuple(calendrier)]
+
+    cle = _cle_objectif(objectif)
+
+    # 1. Grille géométrique sur [rythme_min, rythme_max]
+    grille = sorted({int(round(r)) for r in np.geomspace(rythme_min, rythme_max, max(2, nb_points))})
+    for r in grille:
+        evaluer(r)
+
+    # 2. Section dorée entre les voisins du meilleur point de grille
+    i = min(range(len(grille)), key=lambda j: cle(evaluer(grille[j])))
+    a, b = grille[max(i - 1, 0)], grille[min(i + 1, len(grille) - 1)]
+    c, d = b - _NOMBRE_OR * (b - a), a + _NOMBRE_OR * (b - a)
+    while b - a > 1 and len(plans) < max_evaluations:
+        if cle(evaluer(c)) <= cle(evaluer(d)):
+            b, d = d, c
+            c = b - _NOMBRE_OR * (b - a)
+        else:
+            a, c = c, d
+            d = a + _NOMBRE_OR * (b - a)
+
+    n_evaluations = len(plans)
+
+    # 3. Calendrier de VAN maximale (planification par cohortes)
+    planification = planifier_deploiement(
+        params, compteur, budget_annuel_max, capacite_max, horizon_deploiement,
+        params_adoption=params_adoption, **kwargs,
+    )
+    plans.setdefault(tuple(planification.plan.calendrier), planification.plan)
+    n_evaluations += planification.n_evaluations
+
+    evalues = sorted(plans.values(), key=lambda p: (p.rythme, p.calendrier))
+    return ResultatsDeploiement(
+        optimal=min(evalues, key=cle),
+        plans=evalues,
+        pareto=front_pareto(evalues),
+        rythme_min=rythme_min,
+        rythme_max=rythme_max,
+        investissement_par_compteur=cout_par_compteur,
+        n_evaluations=n_evaluations,
+    )
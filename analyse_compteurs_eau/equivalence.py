@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+Équivalence numérique des moteurs optimisés avec executer_modele().
+
+Usage:
+    python -m analyse_compteurs_eau.equivalence
+    python -m analyse_compteurs_eau.equivalence -n 2000 --seed 7 --pires 20
+    python -m analyse_compteurs_eau.equivalence --moteurs municipalites noyau_js
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import shutil
+import subprocess
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from .core import (
+    ModeAdoption,
+    ModeCompte,
+    ModePersistance,
+    ModeReductionReseau,
+    TypeCompteur,
+    ConfigEconomiesEchelle,
+    ParametresAdoption,
+    ParametresCompteur,
+    ParametresModele,
+    ParametresPersistance,
+    ParametresFuitesReseau,
+    VALEUR_EAU_QUEBEC,
+    FUITES_CONTEXTE_QUEBEC,
+    ADOPTION_OBLIGATOIRE,
+    executer_modele,
+)
+from .montecarlo import DISTRIBUTIONS_DEFAUT, _configuration_tirage
+from .noyau import CHAMPS_RESULTATS_NOYAU, _nombre, entrees_noyau, resultats_noyau
+
+
+# =============================================================================
+# MODULE ÉQUIVALENCE — SORTIES DE RÉFÉRENCE
+# =============================================================================
+#
+# Chaque moteur optimisé (évaluation affine en lot des municipalités, base
+# linéaire de la VAN, noyau JS) prétend reproduire executer_modele() sur
+# son domaine. Ce module le vérifie sur un corpus aléatoire:
+#
+#   1. Corpus: les paramètres incertains sont tirés de DISTRIBUTIONS_DEFAUT
+#      (comme un tirage Monte Carlo); les dimensions discrètes parcourent
+#      toutes les combinaisons de ModeAdoption × ModePersistance × fuites
+#      (aucune, agrégées, deux stocks) × fuites réseau (sans, avec) ×
+#      ModeCompte. Un corpus d'au moins len(COMBINAISONS_CORPUS) cas les
+#      couvre toutes.
+#   2. Moteurs: fonction (liste de cas) → liste de dictionnaires {champ de
+#      ResultatsModele: valeur}, None pour un cas hors de son domaine (ex.
+#      économies d'échelle pour le calcul affine). Un moteur ne renvoie que
+#      les champs qu'il calcule.
+#   3. Comparaison: |obtenu - référence| ≤ abs + rel × |référence|, élément
+#      par élément pour les séries; l'écart normalisé (écart / tolérance)
+#      classe les pires cas. NaN et infini sont comparés comme null.
+#
+# Un nouveau moteur s'ajoute à MOTEURS_EQUIVALENCE (et, si besoin, à
+# TOLERANCES_MOTEURS).
+#
+# =============================================================================
+
+TOLERANCE_DEFAUT = {"rel": 1e-9, "abs": 1e-6}
+
+# Tolérances propres à un moteur ({nom: {"rel", "abs"}}), ex. pour un moteur
+# en simple précision; les moteurs actuels tiennent TOLERANCE_DEFAUT
+TOLERANCES_MOTEURS: dict[str, dict] = {}
+
+COMBINAISONS_CORPUS = tuple(itertools.product(
+    tuple(ModeAdoption),
+    tuple(ModePersistance),
+    (None, "agrege", "deux_stocks"),
+    (False, True),
+    tuple(ModeCompte),
+))
+
+
+@dataclass
+class CasEquivalence:
+    """Un jeu d'arguments de executer_modele()."""
+    identifiant: str
+    arguments: dict
+
+    @property
+    def description(self) -> str:
+        """Dimensions discrètes du cas (pour les rapports)."""
+        a = self.arguments
+        fuites = a["params_fuites"]
+        return " ".join((
+            a["params_adoption"].mode.value,
+            a["persistance"].mode.value,
+            "sans_fuites" if fuites is None
+            else "deux_stocks" if fuites.utiliser_prevalence_differenciee else "agrege",
+            "reseau" if a["params_fuites_reseau"] is not None else "sans_reseau",
+            a["mode_compte"].value,
+            a["compteur"].type_compteur.value,
+            "echelle" if a["config_echelle"].activer else "",
+        )).strip()
+
+
+@dataclass
+class EcartEquivalence:
+    """Plus grand écart d'un champ entre un moteur et la référence, pour un cas."""
+    moteur: str
+    cas: str
+    champ: str
+    reference: Optional[float]
+    obtenu: Optional[float]
+    ecart_normalise: float       # écart / tolérance (> 1: échec)
+    indice: Optional[int] = None  # élément de la série le plus éloigné
+
+    @property
+    def conforme(self) -> bool:
+        return self.ecart_normalise <= 1.0
+
+
+@dataclass
+class RapportEquivalence:
+    """Résultat de la comparaison d'un corpus."""
+    n_cas: int
+    cas_compares: dict[str, int] = field(default_factory=dict)      # par moteur
+    cas_hors_domaine: dict[str, int] = field(default_factory=dict)  # par moteur
+    ecarts: list[EcartEquivalence] = field(default_factory=list)
+    descriptions: dict[str, str] = field(default_factory=dict)      # par cas
+
+    @property
+    def echecs(self) -> list[EcartEquivalence]:
+        return [e for e in self.ecarts if not e.conforme]
+
+    @property
+    def conforme(self) -> bool:
+        return not self.echecs
+
+    def pires(self, n: int = 10) -> list[EcartEquivalence]:
+        """Les n plus grands écarts normalisés, tous moteurs confondus."""
+        return sorted(self.ecarts, key=lambda e: e.ecart_normalise, reverse=True)[:n]
+
+    def resume(self, n_pires: int = 10) -> str:
+        """Résumé texte: comparaisons par moteur et pires écarts."""
+        lignes = [f"Corpus: {self.n_cas} cas"]
+        for moteur, n in self.cas_compares.items():
+            echecs = sum(1 for e in self.echecs if e.moteur == moteur)
+            lignes.append(
+                f"  {moteur:<14} {n:>6} cas comparés, "
+                f"{self.cas_hors_domaine.get(moteur, 0):>5} hors domaine, {echecs} champs en échec"
+            )
+        lignes.append("Pires écarts (écart / tolérance):")
+        for e in self.pires(n_pires):
+            indice = f"[{e.indice}]" if e.indice is not None else ""
+            lignes.append(
+                f"  {e.ecart_normalise:10.3g}  {e.moteur:<14} {e.cas:<8} {e.champ}{indice}: "
+                f"{e.reference!r} → {e.obtenu!r}  ({self.descriptions.get(e.cas, '')})"
+            )
+        lignes.append("CONFORME" if self.conforme else f"ÉCHEC: {len(self.echecs)} champs hors tolérance")
+        return "\n".join(lignes)
+
+
+# =============================================================================
+# CORPUS ALÉATOIRE
+# =============================================================================
+
+def _choisir(rng: np.random.Generator, options: list):
+    return options[int(rng.integers(len(options)))]
+
+
+def _scenarios_fuites(differenciee: bool) -> list:
+    from .presets import SCENARIOS_FUITES
+    return [f for f in SCENARIOS_FUITES.values() if f.utiliser_prevalence_differenciee == differenciee]
+
+
+def _adoption_aleatoire(mode: ModeAdoption, tirage: dict, rng: np.random.Generator, T: int) -> ParametresAdoption:
+    """Stratégie d'adoption du mode demandé, paramètres tirés."""
+    calendrier = None
+    if mode == ModeAdoption.CALENDRIER:
+        n = int(rng.integers(2, T + 1))
+        calendrier = tuple(np.minimum(100.0, np.cumsum(rng.uniform(0.0, 40.0, n))).tolist())
+    return ParametresAdoption(
+        mode=mode,
+        adoption_max_pct=tirage["adoption_max"] * 100,
+        k_vitesse=tirage["adoption_k"],
+        t0_point_median=tirage["adoption_t0"],
+        taux_nouveaux_pct=float(rng.uniform(1.0, 15.0)),
+        nb_secteurs=int(rng.integers(1, 9)),
+        annees_par_secteur=float(rng.choice([0.5, 1.0, 1.5, 2.0, 3.0])),
+        calendrier_pct=calendrier,
+        etaler_capex=bool(rng.random() < 0.5),
+        cout_incitatif_par_menage=float(rng.choice([0.0, rng.uniform(50.0, 600.0)])),
+        duree_incitatif_ans=int(rng.integers(1, 4)),
+        fraction_premiere_annee=float(rng.choice([1.0, 0.5, rng.uniform(0.0, 1.0)])),
+        annee_demarrage=int(rng.integers(1, 4)),
+    )
+
+
+def _persistance_aleatoire(mode: ModePersistance, alpha0: float, rng: np.random.Generator) -> ParametresPersistance:
+    return ParametresPersistance(
+        mode=mode,
+        alpha_initial=alpha0,
+        alpha_plateau=alpha0 * float(rng.uniform(0.0, 0.6)),
+        lambda_decay=float(rng.uniform(0.0, 0.6)),
+        annees_fadeout=int(rng.integers(1, 16)),
+    )
+
+
+def _reseau_aleatoire(rng: np.random.Generator, T: int) -> ParametresFuitesReseau:
+    return ParametresFuitesReseau(
+        volume_pertes_m3_an=float(rng.uniform(1e5, 2e7)),
+        reduction_max_pct=float(rng.uniform(5.0, 40.0)),
+        mode_reduction=_choisir(rng, list(ModeReductionReseau)),
+        annees_atteinte=int(rng.integers(1, 11)),
+        lambda_reduction=float(rng.uniform(0.0, 1.0)),
+        annee_demarrage=int(rng.integers(1, 4)),
+        cout_programme_annuel=float(rng.uniform(0.0, 5e5)),
+        cout_reparation_m3=float(rng.uniform(0.0, 1.5)),
+        # CAPEX parfois au-delà de l'horizon (compté dans VA(C) seulement)
+        cout_capex_initial=float(rng.choice([0.0, rng.uniform(1e5, 5e6)])),
+        annee_capex=int(rng.integers(1, T + 6)),
+        pondere_par_adoption=bool(rng.random() < 0.7),
+    )
+
+
+def generer_corpus(
+    n: int = len(COMBINAISONS_CORPUS),
+    seed: Optional[int] = 42,
+    distributions: Optional[dict] = None,
+) -> list[CasEquivalence]:
+    """
+    Corpus aléatoire d'arguments de executer_modele().
+
+    Le cas i prend la combinaison discrète i (modulo len(COMBINAISONS_CORPUS),
+    ordre permuté par la seed); les paramètres continus sont tirés de
+    `distributions` (défaut: DISTRIBUTIONS_DEFAUT) et appliqués comme un
+    tirage Monte Carlo, les autres (taille de ville, horizon, réseau,
+    calendrier...) uniformément dans des plages réalistes.
+
+    Paramètres:
+        n: Nombre de cas
+        seed: Graine (None: non reproductible)
+        distributions: {nom: DistributionParametre}
+
+    Retourne:
+        Liste de CasEquivalence
+    """
+    if distributions is None:
+        distributions = DISTRIBUTIONS_DEFAUT
+    rng = np.random.default_rng(seed)
+    ordre = rng.permutation(len(COMBINAISONS_CORPUS))
+    tirages = {nom: d.tirer(n, rng) for nom, d in distributions.items()}
+    # L'adoption est reconstruite ici: _configuration_tirage ne conserve pas calendrier_pct
+    cles_adoption = ("adoption_max", "adoption_k", "adoption_t0")
+    tirages_modele = {k: v for k, v in tirages.items() if k not in cles_adoption}
+    defaut = ParametresAdoption()
+    centre_adoption = {"adoption_max": defaut.adoption_max_pct / 100.0,
+                       "adoption_k": defaut.k_vitesse, "adoption_t0": defaut.t0_point_median}
+
+    corpus = []
+    for i in range(n):
+        mode_adoption, mode_persistance, fuites, reseau, mode_compte = COMBINAISONS_CORPUS[ordre[i % len(ordre)]]
+        T = int(rng.integers(5, 41))
+        params_base = ParametresModele(
+            nb_menages=int(rng.integers(200, 500_000)),
+            taille_menage=float(rng.uniform(1.6, 3.2)),
+            horizon_analyse=T,
+            benefice_report_infra_annuel=float(rng.choice([0.0, rng.uniform(0.0, 1e6)])),
+            benefice_report_infra_par_m3=float(rng.choice([0.0, rng.uniform(0.0, 1.0)])),
+            part_ville_capex_pct=float(rng.choice([100.0, rng.uniform(0.0, 100.0)])),
+            part_ville_opex_pct=float(rng.choice([100.0, rng.uniform(0.0, 100.0)])),
+        )
+        compteur_base = ParametresCompteur(type_compteur=_choisir(rng, list(TypeCompteur)))
+        fuites_base = (FUITES_CONTEXTE_QUEBEC if fuites is None
+                       else _choisir(rng, _scenarios_fuites(fuites == "deux_stocks")))
+        valeur_eau = replace(VALEUR_EAU_QUEBEC, appliquer_mcf=bool(rng.random() < 0.5),
+                             mcf=float(rng.uniform(0.1, 0.4)))
+
+        params, compteur, ve, params_fuites, _ = _configuration_tirage(
+            tirages_modele, i, params_base, compteur_base, valeur_eau, fuites_base, ADOPTION_OBLIGATOIRE,
+        )
+        tirage = {k: (tirages[k][i] if k in tirages else centre_adoption[k]) for k in cles_adoption}
+
+        corpus.append(CasEquivalence(
+            identifiant=f"cas{i:05d}",
+            arguments=dict(
+                params=params,
+                compteur=compteur,
+                config_echelle=ConfigEconomiesEchelle(activer=bool(rng.random() < 0.25)),
+                persistance=_persistance_aleatoire(mode_persistance, params.reduction_comportement_pct / 100.0, rng),
+                params_fuites=None if fuites is None else params_fuites,
+                params_fuites_reseau=_reseau_aleatoire(rng, T) if reseau else None,
+                mode_compte=mode_compte,
+                valeur_eau=ve,
+                params_adoption=_adoption_aleatoire(mode_adoption, tirage, rng, T),
+            ),
+        ))
+    return corpus
+
+
+# =============================================================================
+# MOTEURS
+# =============================================================================
+
+def _sortie(valeurs: dict) -> dict:
+    """Valeurs d'un moteur au format de resultats_noyau() (non fini → None)."""
+    sortie = {}
+    for champ, valeur in valeurs.items():
+        if isinstance(valeur, np.ndarray):
+            sortie[champ] = [_nombre(v) for v in valeur.tolist()]
+        else:
+            sortie[champ] = _nombre(valeur)
+    return sortie
+
+
+def moteur_reference(corpus: list[CasEquivalence]) -> list[Optional[dict]]:
+    """executer_modele(), tous les champs de CHAMPS_RESULTATS_NOYAU."""
+    return [resultats_noyau(executer_modele(**cas.arguments)) for cas in corpus]
+
+
+def moteur_municipalites(corpus: list[CasEquivalence]) -> list[Optional[dict]]:
+    """evaluer_municipalites() sur une municipalité (hors économies d'échelle)."""
+    from .municipalites import Municipalite, evaluer_municipalites
+
+    sorties = []
+    for cas in corpus:
+        a = cas.arguments
+        params = a["params"]
+        if a["config_echelle"].activer or params.nb_compteurs is not None:
+            sorties.append(None)
+            continue
+        reseau = a["params_fuites_reseau"]
+        m = Municipalite(
+            csd_uid=cas.identifiant, nom=cas.identifiant,
+            nb_menages=params.nb_menages, taille_menage=params.taille_menage, lpcd=params.lpcd,
+            volume_pertes_m3_an=reseau.volume_pertes_m3_an if reseau is not None else None,
+        )
+        res = evaluer_municipalites(
+            [m], a["compteur"], base=params,
+            persistance=a["persistance"],
+            params_fuites=a["params_fuites"],
+            params_fuites_reseau=reseau,
+            mode_compte=a["mode_compte"],
+            valeur_eau=a["valeur_eau"],
+            params_adoption=a["params_adoption"],
+        )
+        sorties.append(_sortie({
+            "van": res.van[0],
+            "rbc": res.rbc[0],
+            "lcsw": res.lcsw[0],
+            "periode_recuperation": res.periode_recuperation[0],
+            "va_benefices": res.va_benefices[0],
+            "va_couts_totaux": res.va_couts[0],
+            "va_economies_m3": res.va_economies_m3[0],
+            "investissement_initial": res.investissement_initial[0],
+            "van_cumulative": res.van_cumulative[0],
+        }))
+    return sorties
+
+
+def moteur_base_van(corpus: list[CasEquivalence]) -> list[Optional[dict]]:
+    """calculer_base_van(): VAN = quantités · prix."""
+    from .decomposition import calculer_base_van
+
+    sorties = []
+    for cas in corpus:
+        base = calculer_base_van(**cas.arguments)
+        sorties.append(_sortie({"van": base.van(), "va_economies_m3": base.quantites["m3_economises"]}))
+    return sorties
+
+
+def moteur_noyau_js(corpus: list[CasEquivalence]) -> list[Optional[dict]]:
+    """noyau.js (racine du dépôt) exécuté par node; hors domaine sans node."""
+    node = shutil.which("node") or shutil.which("nodejs")
+    script = Path(__file__).resolve().parent.parent / "noyau.js"
+    if node is None or not script.is_file():
+        return [None] * len(corpus)
+    code = (
+        "const noyau = require(process.argv[1]);"
+        "const entrees = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+        "process.stdout.write(JSON.stringify(entrees.map(e => noyau.executerModele(e))));"
+    )
+    entrees = [entrees_noyau(**cas.arguments) for cas in corpus]
+    sortie = subprocess.run(
+        [node, "-e", code, str(script)],
+        input=json.dumps(entrees), capture_output=True, text=True, check=True,
+    )
+    return json.loads(sortie.stdout)
+
+
+MOTEURS_EQUIVALENCE: dict[str, Callable[[list[CasEquivalence]], list[Optional[dict]]]] = {
+    "municipalites": moteur_municipalites,
+    "base_van": moteur_base_van,
+    "noyau_js": moteur_noyau_js,
+}
+
+
+# =============================================================================
+# COMPARAISON
+# =============================================================================
+
+def _ecart(reference, obtenu, tolerance: dict) -> tuple[float, Optional[float], Optional[float], Optional[int]]:
+    """(écart normalisé, référence, obtenu, indice) du pire élément."""
+    if isinstance(reference, list):
+        if not isinstance(obtenu, list) or len(obtenu) != len(reference):
+            return math.inf, None, None, None
+        pire = (0.0, None, None, None)
+        for i, (r, o) in enumerate(zip(reference, obtenu)):
+            e = _ecart(r, o, tolerance)[0]
+            if e > pire[0] or pire[3] is None:
+                pire = (e, r, o, i)
+        return pire
+    if isinstance(reference, bool) or isinstance(obtenu, bool):
+        return (0.0 if reference == obtenu else math.inf), reference, obtenu, None
+    if reference is None or obtenu is None:
+        return (0.0 if reference is obtenu else math.inf), reference, obtenu, None
+    borne = tolerance["abs"] + tolerance["rel"] * abs(reference)
+    return abs(obtenu - reference) / borne, reference, obtenu, None
+
+
+def comparer_moteurs(
+    corpus: list[CasEquivalence],
+    moteurs: Optional[dict] = None,
+    tolerances: Optional[dict] = None,
+) -> RapportEquivalence:
+    """
+    Comparer des moteurs à executer_modele() sur un corpus.
+
+    Paramètres:
+        corpus: Cas à évaluer (cf. generer_corpus)
+        moteurs: {nom: fonction(corpus) → [dict | None]} (défaut: MOTEURS_EQUIVALENCE)
+        tolerances: {nom: {"rel", "abs"}}, en plus de TOLERANCES_MOTEURS
+                    (défaut: TOLERANCE_DEFAUT)
+
+    Retourne:
+        RapportEquivalence (un écart par moteur, cas et champ comparé)
+    """
+    moteurs = MOTEURS_EQUIVALENCE if moteurs is None else moteurs
+    tolerances = {**TOLERANCES_MOTEURS, **(tolerances or {})}
+    references = moteur_reference(corpus)
+
+    rapport = RapportEquivalence(
+        n_cas=len(corpus),
+        descriptions={cas.identifiant: cas.description for cas in corpus},
+    )
+    for nom, moteur in moteurs.items():
+        tolerance = tolerances.get(nom, TOLERANCE_DEFAUT)
+        sorties = moteur(corpus)
+        compares = hors_domaine = 0
+        for cas, reference, sortie in zip(corpus, references, sorties):
+            if sortie is None:
+                hors_domaine += 1
+                continue
+            compares += 1
+            for champ, obtenu in sortie.items():
+                if champ not in CHAMPS_RESULTATS_NOYAU:
+                    raise ValueError(f"Moteur {nom}: champ inconnu de ResultatsModele: {champ}")
+                ecart, r, o, indice = _ecart(reference[champ], obtenu, tolerance)
+                rapport.ecarts.append(EcartEquivalence(nom, cas.identifiant, champ, r, o, ecart, indice))
+        rapport.cas_compares[nom] = compares
+        rapport.cas_hors_domaine[nom] = hors_domaine
+    return rapport
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Point d'entrée CLI (code de sortie 1 si un écart dépasse la tolérance)."""
+    parser = argparse.ArgumentParser(description="Équivalence des moteurs optimisés avec executer_modele()")
+    parser.add_argument("-n", type=int, default=4 * len(COMBINAISONS_CORPUS), help="Nombre de cas")
+    parser.add_argument("--seed", type=int, default=42, help="Graine du corpus")
+    parser.add_argument("--moteurs", nargs="+", choices=list(MOTEURS_EQUIVALENCE),
+                        default=list(MOTEURS_EQUIVALENCE), help="Moteurs à comparer")
+    parser.add_argument("--pires", type=int, default=10, help="Nombre de pires écarts affichés")
+    args = parser.parse_args(argv)
+
+    corpus = generer_corpus(args.n, args.seed)
+    rapport = comparer_moteurs(corpus, {nom: MOTEURS_EQUIVALENCE[nom] for nom in args.moteurs})
+    print(rapport.resume(args.pires))
+    if not rapport.conforme:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,798 @@
+# -*- coding: utf-8 -*-
+"""
+Analyse Monte Carlo: distributions des paramètres incertains, simulation
+de la VAN et affichage des résultats.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+from ._differe import plt
+from .core import (
+    ModeCompte,
+    ParametresValeurEau,
+    VALEUR_EAU_QUEBEC,
+    ConfigEconomiesEchelle,
+    ParametresCompteur,
+    ParametresModele,
+    ParametresFuites,
+    FUITES_CONTEXTE_QUEBEC,
+    ParametresAdoption,
+    ADOPTION_OBLIGATOIRE,
+    fmt_argent,
+    executer_modele,
+    _cloner_params,
+    _cloner_compteur,
+)
+
+
+# =============================================================================
+# MODULE MONTE CARLO — SIMULATION STOCHASTIQUE
+# =============================================================================
+#
+# Ce module implémente l'analyse Monte Carlo pour quantifier l'incertitude
+# sur la VAN et calculer la probabilité P(VAN > 0).
+#
+# Approche:
+# 1. Définir des distributions (triangulaires/normales) sur les paramètres clés
+# 2. Tirer N échantillons de chaque distribution
+# 3. Calculer la VAN pour chaque combinaison
+# 4. Analyser la distribution résultante et les drivers de sensibilité
+#
+# Références:
+# - Boardman et al. (2018) Cost-Benefit Analysis, Ch. 7 "Uncertainty"
+# - Morgan & Henrion (1990) Uncertainty: A Guide to Dealing with Uncertainty
+# - Treasury Board of Canada (2007) Risk-Based CBA Guidelines
+#
+# =============================================================================
+
+@dataclass
+class DistributionParametre:
+    """
+    Définition d'une distribution pour un paramètre.
+
+    Types supportés:
+    - 'triangular': distribution triangulaire (min, mode, max)
+    - 'normal': distribution normale (moyenne, écart-type)
+    - 'uniform': distribution uniforme (min, max)
+    - 'lognormal': distribution log-normale (mu, sigma du log)
+    """
+    nom: str                          # Nom du paramètre (ex: "alpha0")
+    type_distribution: str = "triangular"
+    min_val: Optional[float] = None   # Pour triangular/uniform
+    mode_val: Optional[float] = None  # Pour triangular (= valeur la plus probable)
+    max_val: Optional[float] = None   # Pour triangular/uniform
+    moyenne: Optional[float] = None   # Pour normal
+    ecart_type: Optional[float] = None  # Pour normal
+    description: str = ""
+
+    def __post_init__(self):
+        """Valider la configuration."""
+        if self.type_distribution == "triangular":
+            if None in (self.min_val, self.mode_val, self.max_val):
+                raise ValueError(f"{self.nom}: triangular requiert min_val, mode_val, max_val")
+            if not (self.min_val <= self.mode_val <= self.max_val):
+                raise ValueError(f"{self.nom}: doit avoir min <= mode <= max")
+        elif self.type_distribution == "normal":
+            if None in (self.moyenne, self.ecart_type):
+                raise ValueError(f"{self.nom}: normal requiert moyenne et ecart_type")
+            if self.ecart_type <= 0:
+                raise ValueError(f"{self.nom}: ecart_type doit être > 0")
+        elif self.type_distribution == "uniform":
+            if None in (self.min_val, self.max_val):
+                raise ValueError(f"{self.nom}: uniform requiert min_val et max_val")
+
+    def tirer(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Tirer n valeurs de la distribution.
+
+        Paramètres:
+            n: Nombre de tirages
+            rng: Générateur de nombres aléatoires numpy
+
+        Retourne:
+            Array de n valeurs
+        """
+        if self.type_distribution == "triangular":
+            return rng.triangular(self.min_val, self.mode_val, self.max_val, n)
+        elif self.type_distribution == "normal":
+            return rng.normal(self.moyenne, self.ecart_type, n)
+        elif self.type_distribution == "uniform":
+            return rng.uniform(self.min_val, self.max_val, n)
+        elif self.type_distribution == "lognormal":
+            return rng.lognormal(self.moyenne, self.ecart_type, n)
+        else:
+            raise ValueError(f"Type de distribution inconnu: {self.type_distribution}")
+
+
+@dataclass
+class ParametresMonteCarlo:
+    """
+    Configuration de la simulation Monte Carlo.
+
+    Définit le nombre de simulations et les distributions à utiliser
+    pour chaque paramètre incertain.
+    """
+    n_simulations: int = 10_000
+    seed: Optional[int] = None  # Pour reproductibilité
+
+    # Distributions des paramètres clés
+    # Si None, le paramètre est fixé à sa valeur par défaut
+    distributions: dict = field(default_factory=dict)
+
+    # Paramètres à inclure dans l'analyse tornado (v3.9: étendu)
+    parametres_tornado: list = field(default_factory=lambda: [
+        "alpha0", "lpcd", "valeur_eau", "cout_compteur",
+        "heures_installation", "taux_horaire_installation", "cout_installation",
+        "opex_annuel", "prevalence_fuites", "debit_fuite_m3_an",
+        "taux_detection", "taux_reparation",
+        "adoption_max", "adoption_k", "adoption_t0",
+        "taux_actualisation"
+    ])
+
+    def __post_init__(self):
+        """Valider la configuration."""
+        if self.n_simulations < 100:
+            raise ValueError("n_simulations doit être >= 100 pour des résultats fiables")
+
+
+@dataclass
+class ResultatsMonteCarlo:
+    """
+    Résultats d'une simulation Monte Carlo.
+
+    Contient la distribution des VAN et les statistiques associées.
+    """
+    van_simulations: np.ndarray       # VAN pour chaque simulation
+    n_simulations: int
+    seed: Optional[int]
+
+    # Statistiques
+    van_moyenne: float = 0.0
+    van_mediane: float = 0.0
+    van_ecart_type: float = 0.0
+    prob_van_positive: float = 0.0
+
+    # Percentiles
+    percentile_5: float = 0.0
+    percentile_25: float = 0.0
+    percentile_75: float = 0.0
+    percentile_95: float = 0.0
+
+    # Analyse de sensibilité (corrélation paramètres/VAN)
+    correlations: dict = field(default_factory=dict)
+
+    # Valeurs tirées pour chaque paramètre (pour analyse)
+    tirages: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Calculer les statistiques."""
+        if len(self.van_simulations) > 0:
+            self.van_moyenne = float(np.mean(self.van_simulations))
+            self.van_mediane = float(np.median(self.van_simulations))
+            self.van_ecart_type = float(np.std(self.van_simulations))
+            self.prob_van_positive = float(np.mean(self.van_simulations > 0))
+
+            self.percentile_5 = float(np.percentile(self.van_simulations, 5))
+            self.percentile_25 = float(np.percentile(self.van_simulations, 25))
+            self.percentile_75 = float(np.percentile(self.van_simulations, 75))
+            self.percentile_95 = float(np.percentile(self.van_simulations, 95))
+
+    @property
+    def intervalle_confiance_90(self) -> tuple[float, float]:
+        """Intervalle de confiance 90% (P5-P95)."""
+        return (self.percentile_5, self.percentile_95)
+
+    @property
+    def intervalle_interquartile(self) -> tuple[float, float]:
+        """Intervalle interquartile (P25-P75)."""
+        return (self.percentile_25, self.percentile_75)
+
+
+# =============================================================================
+# DISTRIBUTIONS MONTE CARLO PAR DÉFAUT (v3.9: étendu)
+# =============================================================================
+#
+# Paramètres incertains organisés par catégorie:
+#   1. COMPORTEMENT: alpha0 (réduction), lpcd (consommation)
+#   2. COÛTS: cout_compteur, heures_installation, taux_horaire_installation, opex_annuel
+#   3. VALORISATION: valeur_eau
+#   4. FUITES: prevalence_fuites, debit_fuite_m3_an, taux_detection, taux_reparation
+#   5. ADOPTION: adoption_max_pct, adoption_k, adoption_t0
+#   6. FINANCIER: taux_actualisation
+#
+# Sources des intervalles:
+#   - Littérature académique sur compteurs intelligents
+#   - Études de cas municipales (Longueuil, Winnipeg, Calgary)
+#   - Méta-analyses (AWWA, IWA) sur les effets comportementaux
+# =============================================================================
+
+DISTRIBUTIONS_DEFAUT = {
+    # === COMPORTEMENT ===
+    "alpha0": DistributionParametre(
+        nom="alpha0",
+        type_distribution="triangular",
+        min_val=0.04, mode_val=0.08, max_val=0.15,
+        description="Réduction comportementale initiale (4-15%)",
+    ),
+    "lpcd": DistributionParametre(
+        nom="lpcd",
+        type_distribution="triangular",
+        min_val=180.0, mode_val=250.0, max_val=350.0,
+        description="Consommation (LPCD): 180-350 L/p/j",
+    ),
+
+    # === COÛTS ===
+    "cout_compteur": DistributionParametre(
+        nom="cout_compteur",
+        type_distribution="triangular",
+        min_val=150.0, mode_val=250.0, max_val=400.0,
+        description="Coût du compteur AMI: 150-400 $",
+    ),
+    "cout_installation": DistributionParametre(
+        nom="cout_installation",
+        type_distribution="triangular",
+        min_val=80.0, mode_val=120.0, max_val=200.0,
+        description="Coût d'installation (alias): 80-200 $/compteur",
+    ),
+    "heures_installation": DistributionParametre(
+        nom="heures_installation",
+        type_distribution="triangular",
+        min_val=1.0, mode_val=1.5, max_val=3.0,
+        description="Heures installation: 1-3 h/compteur",
+    ),
+    "taux_horaire_installation": DistributionParametre(
+        nom="taux_horaire_installation",
+        type_distribution="triangular",
+        min_val=100.0, mode_val=125.0, max_val=150.0,
+        description="Taux horaire installation: 100-150 $/h",
+    ),
+    "opex_annuel": DistributionParametre(
+        nom="opex_annuel",
+        type_distribution="triangular",
+        min_val=15.0, mode_val=20.0, max_val=40.0,
+        description="OPEX total AMI (maintenance + non-tech): 15-40 $/compteur/an",
+    ),
+
+    # === VALORISATION ===
+    "valeur_eau": DistributionParametre(
+        nom="valeur_eau",
+        type_distribution="triangular",
+        min_val=2.50, mode_val=4.69, max_val=8.00,
+        description="Valeur sociale de l'eau: 2.50-8.00 $/m³",
+    ),
+
+    # === FUITES ===
+    "prevalence_fuites": DistributionParametre(
+        nom="prevalence_fuites",
+        type_distribution="triangular",
+        min_val=0.10, mode_val=0.20, max_val=0.35,
+        description="Prévalence des fuites: 10-35%",
+    ),
+    "debit_fuite_m3_an": DistributionParametre(
+        nom="debit_fuite_m3_an",
+        type_distribution="triangular",
+        min_val=20.0, mode_val=35.0, max_val=60.0,
+        description="Débit moyen par fuite: 20-60 m³/an",
+    ),
+    "taux_detection": DistributionParametre(
+        nom="taux_detection",
+        type_distribution="triangular",
+        min_val=0.70, mode_val=0.90, max_val=0.98,
+        description="Taux détection fuites AMI: 70-98%",
+    ),
+    "taux_reparation": DistributionParametre(
+        nom="taux_reparation",
+        type_distribution="triangular",
+        min_val=0.60, mode_val=0.85, max_val=0.95,
+        description="Taux réparation après détection: 60-95%",
+    ),
+
+    # === ADOPTION ===
+    "adoption_max": DistributionParametre(
+        nom="adoption_max",
+        type_distribution="triangular",
+        min_val=0.70, mode_val=0.85, max_val=1.00,
+        description="Taux d'adoption maximal: 70-100%",
+    ),
+    "adoption_k": DistributionParametre(
+        nom="adoption_k",
+        type_distribution="triangular",
+        min_val=0.3, mode_val=0.6, max_val=1.5,
+        description="Vitesse d'adoption (k): 0.3-1.5",
+    ),
+    "adoption_t0": DistributionParametre(
+        nom="adoption_t0",
+        type_distribution="triangular",
+        min_val=2.0, mode_val=5.0, max_val=10.0,
+        description="Point médian adoption (t0): 2-10 ans",
+    ),
+
+    # === FINANCIER ===
+    "taux_actualisation": DistributionParametre(
+        nom="taux_actualisation",
+        type_distribution="triangular",
+        min_val=0.02, mode_val=0.03, max_val=0.05,
+        description="Taux d'actualisation: 2-5% (mode 3%, Québec infrastructure)",
+    ),
+}
+
+# Sous-ensemble minimal (5 paramètres les plus influents) pour simulations rapides
+DISTRIBUTIONS_MINIMALES = {
+    "alpha0": DISTRIBUTIONS_DEFAUT["alpha0"],
+    "cout_compteur": DISTRIBUTIONS_DEFAUT["cout_compteur"],
+    "valeur_eau": DISTRIBUTIONS_DEFAUT["valeur_eau"],
+    "prevalence_fuites": DISTRIBUTIONS_DEFAUT["prevalence_fuites"],
+    "adoption_max": DISTRIBUTIONS_DEFAUT["adoption_max"],
+}
+
+# Sous-ensemble étendu (tous les paramètres) pour analyse complète
+DISTRIBUTIONS_ETENDUES = DISTRIBUTIONS_DEFAUT.copy()
+
+class CalculAnnule(Exception):
+    """Simulation interrompue à la demande de l'appelant (cf. annulation)."""
+
+
+# Fréquence de vérification de l'annulation et de rapport de la progression
+# (tirages entre deux vérifications)
+TAILLE_LOT_ANNULATION = 50
+
+
+def _configuration_tirage(
+    tirages: dict,
+    i: int,
+    params_base: ParametresModele,
+    compteur_base: ParametresCompteur,
+    valeur_eau: ParametresValeurEau,
+    params_fuites_base: ParametresFuites,
+    params_adoption_base: ParametresAdoption,
+) -> tuple:
+    """
+    Appliquer le tirage i aux valeurs centrales.
+
+    Retourne:
+        (params, compteur, valeur_eau, params_fuites, params_adoption)
+    """
+    # Cloner les paramètres
+    params_dict = _cloner_params(params_base)
+    compteur_dict = _cloner_compteur(compteur_base)
+    valeur_eau_dict = {
+        'valeur_sociale_m3': valeur_eau.valeur_sociale_m3,
+        'cout_variable_m3': valeur_eau.cout_variable_m3,
+        'cout_capex_m3': valeur_eau.cout_capex_m3,           # CAPEX (était cout_infrastructure_m3)
+        'cout_opex_fixe_m3': valeur_eau.cout_opex_fixe_m3,   # OPEX fixe (était valeur_externalites_m3)
+        'prix_vente_m3': valeur_eau.prix_vente_m3,
+        'mcf': valeur_eau.mcf,
+        'appliquer_mcf': valeur_eau.appliquer_mcf,
+    }
+
+    # Appliquer les valeurs tirées
+    # v3.9: Support étendu pour installation, OPEX, adoption, fuites
+    params_fuites_dict = None  # Initialisé si nécessaire
+
+    has_heures = "heures_installation" in tirages
+    has_taux_horaire = "taux_horaire_installation" in tirages
+
+    for nom, valeur in tirages.items():
+        # === COMPORTEMENT ===
+        if nom == "alpha0":
+            # alpha0 = réduction comportementale (ex: 0.08 = 8%)
+            params_dict["reduction_comportement_pct"] = valeur[i] * 100
+        elif nom == "lpcd":
+            params_dict["lpcd"] = valeur[i]
+
+        # === COÛTS ===
+        elif nom == "cout_compteur":
+            compteur_dict["cout_compteur"] = valeur[i]
+        elif nom == "cout_installation":
+            # Alias: convertir un coût total en heures si heures/taux non tirés
+            if not has_heures and not has_taux_horaire:
+                taux = max(compteur_dict.get("taux_horaire_installation", 0.0), 1e-6)
+                compteur_dict["heures_installation"] = valeur[i] / taux
+        elif nom == "heures_installation":
+            compteur_dict["heures_installation"] = valeur[i]
+        elif nom == "taux_horaire_installation":
+            compteur_dict["taux_horaire_installation"] = valeur[i]
+        elif nom == "opex_annuel":
+            # OPEX total AMI = maintenance + non-tech → on ajuste la composante non-tech
+            base = max(compteur_dict.get("cout_maintenance_ami", 0.0), 0.0)
+            compteur_dict["cout_opex_non_tech_ami"] = max(0.0, valeur[i] - base)
+
+        # === VALORISATION ===
+        elif nom == "valeur_eau":
+            # Ajuster toutes les composantes de la valeur sociale
+            base = max(valeur_eau_dict["valeur_sociale_m3"], 1e-6)
+            ratio = valeur[i] / base
+            valeur_eau_dict["valeur_sociale_m3"] = valeur[i]
+            valeur_eau_dict["cout_capex_m3"] = valeur_eau_dict["cout_capex_m3"] * ratio
+            valeur_eau_dict["cout_opex_fixe_m3"] = valeur_eau_dict["cout_opex_fixe_m3"] * ratio
+
+        # === FUITES ===
+        elif nom == "prevalence_fuites":
+            params_dict["part_menages_fuite_pct"] = valeur[i] * 100
+        elif nom == "debit_fuite_m3_an":
+            params_dict["debit_fuite_m3_an"] = valeur[i]
+            if params_fuites_dict is None:
+                params_fuites_dict = {"debit_fuite_m3_an": valeur[i]}
+            else:
+                params_fuites_dict["debit_fuite_m3_an"] = valeur[i]
+        elif nom == "taux_detection":
+            if params_fuites_dict is None:
+                params_fuites_dict = {"taux_detection_pct": valeur[i] * 100}
+            else:
+                params_fuites_dict["taux_detection_pct"] = valeur[i] * 100
+        elif nom == "taux_reparation":
+            if params_fuites_dict is None:
+                params_fuites_dict = {"taux_reparation_pct": valeur[i] * 100}
+            else:
+                params_fuites_dict["taux_reparation_pct"] = valeur[i] * 100
+
+        # === ADOPTION ===
+        elif nom == "adoption_max":
+            # Stocké pour créer ParametresAdoption après
+            pass  # Traité séparément ci-dessous
+        elif nom == "adoption_k":
+            pass
+        elif nom == "adoption_t0":
+            pass
+
+        # === FINANCIER ===
+        elif nom == "taux_actualisation":
+            params_dict["taux_actualisation_pct"] = valeur[i] * 100
+
+    # Créer les objets
+    params = ParametresModele(**params_dict)
+    compteur = ParametresCompteur(**compteur_dict)
+    ve = ParametresValeurEau(**valeur_eau_dict)
+
+    # Créer params_fuites si des paramètres de fuites ont été variés
+    params_fuites_sim = params_fuites_base
+    if params_fuites_dict:
+        f_dict = params_fuites_sim.__dict__.copy()
+        debit_ref = f_dict.get("debit_fuite_m3_an", params_fuites_sim.debit_fuite_m3_an)
+        f_dict.update({
+            "part_menages_fuite_pct": params.part_menages_fuite_pct,
+            "debit_fuite_m3_an": params_fuites_dict.get("debit_fuite_m3_an", params_fuites_sim.debit_fuite_m3_an),
+            "taux_detection_pct": params_fuites_dict.get("taux_detection_pct", params_fuites_sim.taux_detection_pct),
+            "taux_reparation_pct": params_fuites_dict.get("taux_reparation_pct", params_fuites_sim.taux_reparation_pct),
+        })
+        params_fuites_sim = ParametresFuites(**f_dict)
+        if params_fuites_sim.utiliser_prevalence_differenciee and "debit_fuite_m3_an" in params_fuites_dict:
+            ratio = params_fuites_dict["debit_fuite_m3_an"] / max(debit_ref, 1e-6)
+            params_fuites_sim.debit_fuite_any_m3_an *= ratio
+            params_fuites_sim.debit_fuite_significative_m3_an *= ratio
+
+    # Créer params_adoption si adoption_max/k/t0 sont variés
+    base_adoption = params_adoption_base
+    params_adoption_sim = base_adoption
+    if ("adoption_max" in tirages) or ("adoption_k" in tirages) or ("adoption_t0" in tirages):
+        adoption_pct = tirages["adoption_max"][i] * 100 if "adoption_max" in tirages else base_adoption.adoption_max_pct
+        k_vitesse = tirages["adoption_k"][i] if "adoption_k" in tirages else base_adoption.k_vitesse
+        t0_median = tirages["adoption_t0"][i] if "adoption_t0" in tirages else base_adoption.t0_point_median
+        params_adoption_sim = ParametresAdoption(
+            mode=base_adoption.mode,
+            adoption_max_pct=adoption_pct,
+            etaler_capex=base_adoption.etaler_capex,
+            k_vitesse=k_vitesse,
+            t0_point_median=t0_median,
+            taux_nouveaux_pct=base_adoption.taux_nouveaux_pct,
+            nb_secteurs=base_adoption.nb_secteurs,
+            annees_par_secteur=base_adoption.annees_par_secteur,
+            cout_incitatif_par_menage=base_adoption.cout_incitatif_par_menage,
+            duree_incitatif_ans=base_adoption.duree_incitatif_ans,
+            fraction_premiere_annee=base_adoption.fraction_premiere_annee,
+            annee_demarrage=base_adoption.annee_demarrage,
+            nom=base_adoption.nom,
+            description=base_adoption.description,
+        )
+
+    return params, compteur, ve, params_fuites_sim, params_adoption_sim
+
+
+def simuler_monte_carlo(
+    params_base: ParametresModele,
+    compteur_base: ParametresCompteur,
+    config_mc: ParametresMonteCarlo = None,
+    config_echelle: ConfigEconomiesEchelle = None,
+    valeur_eau: ParametresValeurEau = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    afficher_progression: bool = True,
+    annulation=None,
+    progression: Optional[Callable[[int, int], None]] = None,
+    **kwargs,
+) -> ResultatsMonteCarlo:
+    """
+    Exécuter une simulation Monte Carlo.
+
+    Paramètres:
+        params_base: Paramètres du modèle (valeurs centrales)
+        compteur_base: Paramètres du compteur (valeurs centrales)
+        config_mc: Configuration Monte Carlo (distributions, n_simulations)
+        config_echelle: Configuration économies d'échelle
+        valeur_eau: Paramètres valeur d'eau
+        mode_compte: Mode de comptabilité
+        afficher_progression: Afficher une barre de progression
+        annulation: Objet avec is_set() (ex: threading.Event), vérifié tous les
+                    TAILLE_LOT_ANNULATION tirages; lève CalculAnnule s'il est levé
+        progression: Fonction (tirages_faits, n_total) appelée tous les
+                     TAILLE_LOT_ANNULATION tirages et à la fin
+        **kwargs: Arguments supplémentaires pour executer_modele()
+
+    Retourne:
+        ResultatsMonteCarlo avec distribution VAN et statistiques
+    """
+    if config_mc is None:
+        config_mc = ParametresMonteCarlo(distributions=DISTRIBUTIONS_DEFAUT)
+
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+
+    # Initialiser le générateur de nombres aléatoires
+    rng = np.random.default_rng(config_mc.seed)
+
+    n = config_mc.n_simulations
+    van_simulations = np.zeros(n)
+    tirages = {nom: np.zeros(n) for nom in config_mc.distributions}
+
+    # Tirer toutes les valeurs à l'avance
+    for nom, distrib in config_mc.distributions.items():
+        tirages[nom] = distrib.tirer(n, rng)
+
+    # Exécuter les simulations
+    for i in range(n):
+        if afficher_progression and i % 1000 == 0:
+            print(f"\r  Simulation {i+1}/{n}...", end="", flush=True)
+        if i % TAILLE_LOT_ANNULATION == 0:
+            if annulation is not None and annulation.is_set():
+                raise CalculAnnule(f"Simulation annulée après {i}/{n} tirages")
+            if progression is not None:
+                progression(i, n)
+
+        params, compteur, ve, params_fuites_sim, params_adoption_sim = _configuration_tirage(
+            tirages, i, params_base, compteur_base, valeur_eau,
+            kwargs.get('params_fuites', FUITES_CONTEXTE_QUEBEC),
+            kwargs.get('params_adoption', ADOPTION_OBLIGATOIRE),
+        )
+
+        # Exécuter le modèle avec les paramètres variés
+        try:
+            # Filtrer kwargs pour éviter les doublons
+            kwargs_filtered = {k: v for k, v in kwargs.items()
+                               if k not in ('params_fuites', 'params_adoption')}
+            res = executer_modele(
+                params=params,
+                compteur=compteur,
+                config_echelle=config_echelle,
+                mode_compte=mode_compte,
+                valeur_eau=ve,
+                params_fuites=params_fuites_sim,
+                params_adoption=params_adoption_sim,
+                **kwargs_filtered,
+            )
+            van_simulations[i] = res.van
+        except Exception:
+            van_simulations[i] = np.nan
+
+    if afficher_progression:
+        print(f"\r  Simulation {n}/{n}... Terminé!")
+    if progression is not None:
+        progression(n, n)
+
+    # Supprimer les NaN
+    van_valides = van_simulations[~np.isnan(van_simulations)]
+
+    # Calculer les corrélations (analyse de sensibilité)
+    correlations = {}
+    for nom, valeurs in tirages.items():
+        valeurs_valides = valeurs[~np.isnan(van_simulations)]
+        if len(valeurs_valides) > 0:
+            corr = np.corrcoef(valeurs_valides, van_valides)[0, 1]
+            correlations[nom] = float(corr) if np.isfinite(corr) else 0.0
+
+    return ResultatsMonteCarlo(
+        van_simulations=van_valides,
+        n_simulations=len(van_valides),
+        seed=config_mc.seed,
+        correlations=correlations,
+        tirages=tirages,
+    )
+
+
+def afficher_resultats_monte_carlo(resultats: ResultatsMonteCarlo) -> None:
+    """
+    Afficher un résumé des résultats Monte Carlo.
+
+    Paramètres:
+        resultats: Résultats de la simulation
+    """
+    print("\n" + "=" * 70)
+    print(" " * 18 + "RÉSULTATS SIMULATION MONTE CARLO")
+    print("=" * 70)
+
+    print(f"\n  Nombre de simulations: {resultats.n_simulations:,}")
+    if resultats.seed is not None:
+        print(f"  Seed (reproductibilité): {resultats.seed}")
+
+    print("\n  ─── STATISTIQUES VAN ───")
+    print(f"    Moyenne:      {fmt_argent(resultats.van_moyenne)}")
+    print(f"    Médiane:      {fmt_argent(resultats.van_mediane)}")
+    print(f"    Écart-type:   {fmt_argent(resultats.van_ecart_type)}")
+
+    print("\n  ─── PERCENTILES ───")
+    print(f"    P5  (pessimiste):  {fmt_argent(resultats.percentile_5)}")
+    print(f"    P25 (quartile 1):  {fmt_argent(resultats.percentile_25)}")
+    print(f"    P50 (médiane):     {fmt_argent(resultats.van_mediane)}")
+    print(f"    P75 (quartile 3):  {fmt_argent(resultats.percentile_75)}")
+    print(f"    P95 (optimiste):   {fmt_argent(resultats.percentile_95)}")
+
+    print("\n  ─── PROBABILITÉ ───")
+    pct = resultats.prob_van_positive * 100
+    barre = "█" * int(pct / 2) + "░" * (50 - int(pct / 2))
+    print(f"    P(VAN > 0) = {pct:.1f}%")
+    print(f"    [{barre}]")
+
+    if resultats.correlations:
+        print("\n  ─── DRIVERS DE SENSIBILITÉ (corrélations) ───")
+        correlations_triees = sorted(
+            resultats.correlations.items(),
+            key=lambda x: abs(x[1]),
+            reverse=True
+        )
+        for nom, corr in correlations_triees:
+            signe = "+" if corr > 0 else ""
+            impact = "█" * int(abs(corr) * 20)
+            print(f"    {nom:<20}: {signe}{corr:.3f} {impact}")
+
+    print("=" * 70 + "\n")
+
+
+def graphique_distribution_van(
+    resultats: ResultatsMonteCarlo,
+    titre: str = "Distribution Monte Carlo de la VAN",
+    dossier: str = None,
+) -> plt.Figure:
+    """
+    Créer un histogramme de la distribution VAN.
+
+    Paramètres:
+        resultats: Résultats Monte Carlo
+        titre: Titre du graphique
+        dossier: Dossier de sauvegarde (optionnel)
+
+    Retourne:
+        Figure matplotlib
+    """
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    # Histogramme
+    n_bins = min(100, resultats.n_simulations // 50)
+    n, bins, patches = ax.hist(
+        resultats.van_simulations / 1e6,  # En millions
+        bins=n_bins,
+        density=True,
+        alpha=0.7,
+        color='steelblue',
+        edgecolor='white',
+        linewidth=0.5,
+    )
+
+    # Colorier les valeurs négatives en rouge
+    for patch, left_edge in zip(patches, bins[:-1]):
+        if left_edge < 0:
+            patch.set_facecolor('#d62728')
+
+    # Lignes verticales pour les percentiles
+    ax.axvline(resultats.van_mediane / 1e6, color='orange', linewidth=2,
+               linestyle='--', label=f'Médiane: {fmt_argent(resultats.van_mediane)}')
+    ax.axvline(0, color='black', linewidth=2, linestyle='-', label='VAN = 0')
+    ax.axvline(resultats.percentile_5 / 1e6, color='red', linewidth=1.5,
+               linestyle=':', label=f'P5: {fmt_argent(resultats.percentile_5)}')
+    ax.axvline(resultats.percentile_95 / 1e6, color='green', linewidth=1.5,
+               linestyle=':', label=f'P95: {fmt_argent(resultats.percentile_95)}')
+
+    # Zone P(VAN > 0) — shading de 0 à la limite droite du graphique
+    # Note: bins est déjà en M$ (van_simulations / 1e6), pas besoin de rediviser
+    xlim_max = max(bins.max(), resultats.percentile_95 / 1e6 * 1.1)
+    ax.fill_betweenx([0, n.max() * 1.05], 0, xlim_max,
+                     alpha=0.1, color='green', label='_nolegend_')
+
+    # Annotation P(VAN > 0)
+    ax.annotate(
+        f'P(VAN > 0) = {resultats.prob_van_positive*100:.1f}%',
+        xy=(resultats.van_mediane / 1e6, n.max() * 0.8),
+        fontsize=14,
+        fontweight='bold',
+        bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.8),
+    )
+
+    ax.set_xlabel("VAN (M$)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Densité", fontsize=12, fontweight='bold')
+    ax.set_title(titre, fontsize=14, fontweight='bold', pad=15)
+    ax.legend(loc='upper right', fontsize=10)
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "monte_carlo_distribution.png")
+        fig.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Figure sauvegardée: {chemin}")
+
+    return fig
+
+
+def graphique_tornado_mc(
+    resultats: ResultatsMonteCarlo,
+    titre: str = "Analyse Tornado — Drivers de la VAN",
+    dossier: str = None,
+) -> plt.Figure:
+    """
+    Créer un graphique tornado basé sur les corrélations Monte Carlo.
+
+    Paramètres:
+        resultats: Résultats Monte Carlo avec corrélations
+        titre: Titre du graphique
+        dossier: Dossier de sauvegarde (optionnel)
+
+    Retourne:
+        Figure matplotlib
+    """
+    if not resultats.correlations:
+        raise ValueError("Pas de données de corrélation disponibles")
+
+    # Trier par impact absolu
+    correlations_triees = sorted(
+        resultats.correlations.items(),
+        key=lambda x: abs(x[1]),
+        reverse=True
+    )
+
+    noms = [x[0] for x in correlations_triees]
+    valeurs = [x[1] for x in correlations_triees]
+
+    fig, ax = plt.subplots(figsize=(10, max(4, len(noms) * 0.6)))
+
+    # Barres horizontales
+    couleurs = ['#2ca02c' if v > 0 else '#d62728' for v in valeurs]
+    y_pos = np.arange(len(noms))
+
+    ax.barh(y_pos, valeurs, color=couleurs, alpha=0.8, edgecolor='black', linewidth=1)
+
+    # Ligne verticale à 0
+    ax.axvline(0, color='black', linewidth=1.5)
+
+    # Labels
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(noms, fontsize=11)
+    ax.set_xlabel("Corrélation avec la VAN", fontsize=12, fontweight='bold')
+    ax.set_title(titre, fontsize=14, fontweight='bold', pad=15)
+
+    # Annotations
+    for i, (nom, val) in enumerate(zip(noms, valeurs)):
+        signe = "+" if val > 0 else ""
+        ax.text(val + 0.02 * np.sign(val), i, f'{signe}{val:.2f}',
+                va='center', fontsize=10, fontweight='bold')
+
+    # Légende explicative
+    ax.text(0.02, 0.98, "Vert = augmente la VAN\nRouge = diminue la VAN",
+            transform=ax.transAxes, fontsize=9, verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    ax.set_xlim(-1.1, 1.1)
+    ax.grid(True, alpha=0.3, axis='x')
+
+    plt.tight_layout()
+
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "monte_carlo_tornado.png")
+        fig.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Figure sauvegardée: {chemin}")
+
+    return fig
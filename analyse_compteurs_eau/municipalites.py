@@ -0,0 +1,713 @@
+# -*- coding: utf-8 -*-
+"""
+Analyse coûts-bénéfices à l'échelle de la province: évaluation en lot de
+toutes les municipalités de municipalities-stats.json (pipeline de la carte).
+
+Usage:
+    python -m analyse_compteurs_eau.municipalites map/data/current/municipalities-stats.json
+    python -m analyse_compteurs_eau.municipalites stats.json -o resultats.json --compteur amr
+    python -m analyse_compteurs_eau.municipalites stats.json -o mc.json --monte-carlo 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from .core import (
+    TypeCompteur,
+    ModeCompte,
+    ParametresValeurEau,
+    ParametresCompteur,
+    ParametresModele,
+    ParametresPersistance,
+    ParametresFuites,
+    ParametresFuitesReseau,
+    ParametresAdoption,
+    VALEUR_EAU_QUEBEC,
+    FUITES_CONTEXTE_QUEBEC,
+    ADOPTION_OBLIGATOIRE,
+    calculer_economies_eau,
+    executer_modele,
+)
+from .montecarlo import (
+    DISTRIBUTIONS_DEFAUT,
+    TAILLE_LOT_ANNULATION,
+    CalculAnnule,
+    ParametresMonteCarlo,
+    _configuration_tirage,
+)
+
+
+# =============================================================================
+# MODULE MUNICIPALITÉS — CALCUL EN LOT
+# =============================================================================
+#
+# Pour une configuration commune (compteur, persistance, fuites, adoption,
+# valeur de l'eau, paramètres financiers), le modèle est affine par rapport
+# aux variables propres à chaque municipalité:
+#
+#     Q = c_H · H + c_U · H · U + c_V · V + c_0
+#
+# où H = nombre de ménages, U = usage réductible par ménage (m³/an, fonction
+# de lpcd × taille_menage), V = pertes réseau de référence (m³/an). Q désigne
+# chaque valeur actualisée (bénéfices, coûts, m³) et chaque point de la VAN
+# cumulative. Les coefficients c sont obtenus par quelques exécutions du
+# modèle scalaire (3, plus 4 avec le volet réseau); toutes les municipalités
+# sont ensuite évaluées en un seul produit matriciel (M × 4) · (4 × K).
+#
+# Les économies d'échelle (non linéaires en H) ne sont pas prises en charge.
+#
+# =============================================================================
+
+# Pression moyenne de service (m) pour les pertes inévitables (UARL)
+PRESSION_SERVICE_DEFAUT_M = 50.0
+
+# Points de référence pour l'identification des coefficients
+_H_REF = 10_000
+_U_REF = (50.0, 100.0)   # m³/ménage/an
+_V_REF = 1_000_000.0     # m³/an
+
+
+@dataclass
+class Municipalite:
+    """Données d'une municipalité nécessaires au modèle."""
+    csd_uid: str
+    nom: str
+    nb_menages: int
+    taille_menage: float
+    lpcd: float
+    volume_pertes_m3_an: Optional[float] = None  # None: indice de fuites inconnu
+
+
+def pertes_reseau_m3_an(
+    indice_fuites: float,
+    longueur_reseau_km: float,
+    nb_branchements: int,
+    pression_m: float = PRESSION_SERVICE_DEFAUT_M,
+) -> float:
+    """
+    Pertes réelles du réseau (m³/an) à partir de l'indice de fuites (ILI).
+
+    ILI = CARL / UARL, avec les pertes inévitables (IWA, Lambert 1999):
+        UARL (L/j) = (18 × Lm + 0.8 × Nc) × P
+    Lm: longueur du réseau (km), Nc: nombre de branchements, P: pression (m).
+    Le terme des conduites privées (25 × Lp) est négligé: le compteur est
+    posé à l'entrée du bâtiment.
+    """
+    uarl_l_jour = (18.0 * longueur_reseau_km + 0.8 * nb_branchements) * pression_m
+    return indice_fuites * uarl_l_jour * 365.0 / 1000.0
+
+
+def municipalite_depuis_stats(
+    record: dict,
+    pression_m: float = PRESSION_SERVICE_DEFAUT_M,
+) -> Municipalite:
+    """
+    Construire une Municipalite à partir d'un enregistrement de
+    municipalities-stats.json.
+
+    - nb_menages: nb_logements (MAMH), sinon households (StatCan)
+    - taille_menage: pers_par_residence, sinon household_size, sinon
+      population_desservie / nb_logements
+    - lpcd: consommation résidentielle (L/p/j)
+    - volume_pertes_m3_an: indice_fuites × UARL (None si données absentes)
+
+    Lève ValueError (avec la raison) si une donnée obligatoire manque.
+    """
+    nb_menages = record.get("nb_logements") or record.get("households")
+    if not nb_menages or nb_menages < 1:
+        raise ValueError("nb_logements manquant")
+
+    taille = record.get("pers_par_residence") or record.get("household_size")
+    if not taille and record.get("population_desservie"):
+        taille = record["population_desservie"] / nb_menages
+    if not taille or taille <= 0:
+        raise ValueError("pers_par_residence manquant")
+
+    lpcd = record.get("lpcd")
+    if not lpcd or lpcd <= 0:
+        raise ValueError("lpcd manquant")
+
+    volume_pertes = None
+    ili = record.get("indice_fuites")
+    longueur = record.get("longueur_reseau_km")
+    if ili is not None and longueur is not None and ili >= 0 and longueur >= 0:
+        volume_pertes = pertes_reseau_m3_an(ili, longueur, int(nb_menages), pression_m)
+
+    return Municipalite(
+        csd_uid=str(record.get("csd_uid", "")),
+        nom=record.get("name") or "",
+        nb_menages=int(nb_menages),
+        taille_menage=float(taille),
+        lpcd=float(lpcd),
+        volume_pertes_m3_an=volume_pertes,
+    )
+
+
+def charger_municipalites(
+    source: Union[str, Path, dict],
+    pression_m: float = PRESSION_SERVICE_DEFAUT_M,
+) -> tuple[list[Municipalite], dict[str, str]]:
+    """
+    Charger les municipalités de municipalities-stats.json.
+
+    Paramètres:
+        source: chemin du fichier ou dictionnaire {csd_uid: enregistrement}
+
+    Retourne:
+        (municipalités exploitables, {csd_uid: raison de l'exclusion})
+    """
+    if not isinstance(source, dict):
+        with open(source, "r", encoding="utf-8") as f:
+            source = json.load(f)
+
+    municipalites = []
+    exclues = {}
+    for csd_uid, record in source.items():
+        try:
+            m = municipalite_depuis_stats({"csd_uid": csd_uid, **record}, pression_m)
+        except ValueError as e:
+            exclues[csd_uid] = str(e)
+            continue
+        municipalites.append(m)
+    return municipalites, exclues
+
+
+def parametres_municipalite(
+    m: Municipalite,
+    base: Optional[ParametresModele] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+) -> tuple[ParametresModele, Optional[ParametresFuitesReseau]]:
+    """
+    Paramètres du modèle scalaire pour une municipalité.
+
+    Les paramètres de fuites privées (ParametresFuites) sont communs: aucune
+    donnée municipale ne les renseigne. Les pertes réseau de référence du
+    gabarit params_fuites_reseau sont remplacées par celles de la municipalité.
+    """
+    if base is None:
+        base = ParametresModele()
+    params = replace(
+        base,
+        nb_menages=m.nb_menages,
+        nb_compteurs=None,
+        taille_menage=m.taille_menage,
+        lpcd=m.lpcd,
+    )
+    reseau = None
+    if params_fuites_reseau is not None:
+        reseau = replace(params_fuites_reseau, volume_pertes_m3_an=m.volume_pertes_m3_an or 0.0)
+    return params, reseau
+
+
+# =============================================================================
+# ÉVALUATION VECTORISÉE
+# =============================================================================
+
+COLONNES_RESULTATS = (
+    "van", "rbc", "lcsw", "periode_recuperation",
+    "va_benefices", "va_couts", "va_economies_m3", "investissement_initial",
+)
+
+
+@dataclass
+class ResultatsMunicipalites:
+    """Indicateurs par municipalité (tableaux alignés sur csd_uid)."""
+    csd_uid: list[str]
+    nom: list[str]
+    van: np.ndarray
+    rbc: np.ndarray
+    lcsw: np.ndarray
+    periode_recuperation: np.ndarray
+    va_benefices: np.ndarray
+    va_couts: np.ndarray
+    va_economies_m3: np.ndarray
+    investissement_initial: np.ndarray
+    van_cumulative: np.ndarray                 # (M × T)
+    exclues: dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.csd_uid)
+
+    def vers_dict(self, decimales: int = 4) -> dict:
+        """
+        Table compacte pour la carte: {csd_uid: [valeurs dans l'ordre des
+        colonnes]}. NaN et infini (pas de récupération) deviennent null.
+        """
+        def nettoyer(x: float):
+            return round(float(x), decimales) if math.isfinite(x) else None
+
+        colonnes = [getattr(self, nom) for nom in COLONNES_RESULTATS]
+        return {
+            "colonnes": list(COLONNES_RESULTATS),
+            "noms": dict(zip(self.csd_uid, self.nom)),
+            "donnees": {
+                uid: [nettoyer(col[i]) for col in colonnes]
+                for i, uid in enumerate(self.csd_uid)
+            },
+            "exclues": dict(self.exclues),
+        }
+
+
+def _quantites(res) -> np.ndarray:
+    """Quantités affines extraites d'un ResultatsModele."""
+    return np.concatenate((
+        [res.va_benefices, res.va_couts_totaux, res.va_economies_m3, res.investissement_initial],
+        res.van_cumulative,
+    ))
+
+
+def _annee_croisement_lot(van_cum: np.ndarray) -> np.ndarray:
+    """annee_croisement() appliquée à chaque ligne d'une matrice (M × T)."""
+    M, T = van_cum.shape
+    positif = van_cum >= 0
+    trouve = positif.any(axis=1)
+    i = np.argmax(positif, axis=1)
+    lignes = np.arange(M)
+    prev = van_cum[lignes, np.maximum(i - 1, 0)]
+    curr = van_cum[lignes, i]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(curr == prev, 0.0, (0 - prev) / (curr - prev))
+    periode = np.where(i == 0, 0.0, i + frac)
+    return np.where(trouve, periode, np.inf)
+
+
+def _coefficients(
+    compteur: ParametresCompteur,
+    base: ParametresModele,
+    persistance: Optional[ParametresPersistance],
+    params_fuites: Optional[ParametresFuites],
+    params_fuites_reseau: Optional[ParametresFuitesReseau],
+    mode_compte: ModeCompte,
+    valeur_eau: Optional[ParametresValeurEau],
+    params_adoption: Optional[ParametresAdoption],
+) -> tuple[float, np.ndarray, Optional[np.ndarray]]:
+    """
+    Identifier les coefficients affines d'une configuration commune.
+
+    Retourne:
+        (volume de fuites par ménage soustrait de l'usage de base,
+         coefficients (4 × K) sans pertes réseau,
+         coefficients (4 × K) avec pertes réseau, None sans volet réseau)
+    """
+    def evaluer(H: int, U: float, V: float) -> np.ndarray:
+        # taille_menage = 1: l'usage de base (m³/an) vaut lpcd × 0.365
+        params = replace(base, nb_menages=H, nb_compteurs=None, taille_menage=1.0,
+                         lpcd=(U + volume_pre) / 0.365)
+        reseau = None
+        if params_fuites_reseau is not None:
+            reseau = replace(params_fuites_reseau, volume_pertes_m3_an=V)
+        res = executer_modele(
+            params, compteur,
+            persistance=persistance,
+            params_fuites=params_fuites,
+            params_fuites_reseau=reseau,
+            mode_compte=mode_compte,
+            valeur_eau=valeur_eau,
+            params_adoption=params_adoption,
+        )
+        return _quantites(res)
+
+    # Volume de fuites soustrait de l'usage de base avant l'effet comportemental
+    eco = calculer_economies_eau(replace(base, lpcd=1e6, taille_menage=1.0), params_fuites, compteur)
+    volume_pre = eco.usage_base - eco.usage_reductible
+
+    # Colonnes (H, H·U, V, 1). Sans pertes de référence (V = 0), le programme
+    # réseau n'a ni économies ni OPEX: un jeu de coefficients distinct est
+    # identifié pour ce cas.
+    u1, u2 = _U_REF
+
+    def identifier(V: float) -> np.ndarray:
+        points = [(_H_REF, u1, V), (_H_REF, u2, V), (2 * _H_REF, u1, V)]
+        if V > 0:
+            points.append((_H_REF, u1, 2 * V))
+        B = np.array([[H, H * U, V, 1.0] for H, U, V in points])
+        Q = np.array([evaluer(H, U, V) for H, U, V in points])
+        if V > 0:
+            return np.linalg.solve(B, Q)
+        return np.insert(np.linalg.solve(B[:, [0, 1, 3]], Q), 2, 0.0, axis=0)
+
+    coef_v = identifier(_V_REF) if params_fuites_reseau is not None else None
+    return volume_pre, identifier(0.0), coef_v
+
+
+def _variables(
+    municipalites: list[Municipalite],
+    avec_reseau: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Ménages, usage de base par ménage (m³/an) et pertes réseau (m³/an)."""
+    H = np.array([m.nb_menages for m in municipalites], dtype=float)
+    usage_base = np.array([m.lpcd * m.taille_menage for m in municipalites]) * 365.0 / 1000.0
+    if avec_reseau:
+        V = np.array([m.volume_pertes_m3_an or 0.0 for m in municipalites])
+    else:
+        V = np.zeros(len(municipalites))
+    return H, usage_base, V
+
+
+def evaluer_municipalites(
+    municipalites: list[Municipalite],
+    compteur: ParametresCompteur,
+    base: Optional[ParametresModele] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+    exclues: Optional[dict[str, str]] = None,
+) -> ResultatsMunicipalites:
+    """
+    Évaluer toutes les municipalités en une passe vectorisée.
+
+    Équivaut à executer_modele(*parametres_municipalite(m, ...)) pour chaque
+    municipalité, sans économies d'échelle.
+
+    Paramètres:
+        municipalites: Municipalités à évaluer (cf. charger_municipalites)
+        compteur: Paramètres du compteur (communs)
+        base: Paramètres financiers et comportementaux communs (horizon,
+              taux, réduction comportementale, report d'infrastructure...)
+        params_fuites_reseau: Gabarit du programme réseau; None = pas de
+              volet réseau. Le volume de pertes vient de chaque municipalité.
+        exclues: Municipalités exclues au chargement (reportées telles quelles)
+        (autres paramètres: cf. executer_modele)
+
+    Retourne:
+        ResultatsMunicipalites
+    """
+    if base is None:
+        base = ParametresModele()
+
+    avec_reseau = params_fuites_reseau is not None
+    volume_pre, coef_0, coef_v = _coefficients(
+        compteur, base, persistance, params_fuites,
+        params_fuites_reseau if avec_reseau else None,
+        mode_compte, valeur_eau, params_adoption,
+    )
+
+    # Variables municipales (M × 4)
+    H, usage_base, V = _variables(municipalites, avec_reseau)
+    U = np.maximum(0.0, usage_base - volume_pre)
+    X = np.column_stack((H, H * U, V, np.ones(len(municipalites))))
+
+    valeurs = X @ coef_0
+    avec_pertes = V > 0
+    if avec_pertes.any():
+        valeurs[avec_pertes] = X[avec_pertes] @ coef_v
+    va_benefices = valeurs[:, 0]
+    va_couts = valeurs[:, 1]
+    va_m3 = valeurs[:, 2]
+    van_cumulative = valeurs[:, 4:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rbc = np.where(np.abs(va_couts) < 1e-10, np.nan, va_benefices / va_couts)
+        lcsw = np.where(np.abs(va_m3) < 1e-10, np.nan, va_couts / va_m3)
+
+    return ResultatsMunicipalites(
+        csd_uid=[m.csd_uid for m in municipalites],
+        nom=[m.nom for m in municipalites],
+        van=va_benefices - va_couts,
+        rbc=rbc,
+        lcsw=lcsw,
+        periode_recuperation=_annee_croisement_lot(van_cumulative),
+        va_benefices=va_benefices,
+        va_couts=va_couts,
+        va_economies_m3=va_m3,
+        investissement_initial=valeurs[:, 3],
+        van_cumulative=van_cumulative,
+        exclues=dict(exclues or {}),
+    )
+
+
+# =============================================================================
+# MONTE CARLO PROVINCIAL
+# =============================================================================
+#
+# Les paramètres incertains (DISTRIBUTIONS_DEFAUT: alpha0, coûts, valeur de
+# l'eau, fuites, adoption, taux) sont communs à toutes les municipalités: un
+# même tirage s'applique partout, ce qui conserve la corrélation entre
+# municipalités dans les agrégats provinciaux. Pour chaque tirage, les
+# coefficients affines de la VAN sont identifiés (3 ou 7 exécutions du
+# modèle scalaire); la matrice VAN (M × N) est ensuite calculée en place par
+# lots de municipalités, séparément pour celles avec et sans pertes réseau,
+# ce qui borne la mémoire à un tableau taille_lot × N et ses temporaires.
+#
+# Le lpcd est une donnée municipale: son éventuelle distribution est ignorée.
+#
+# =============================================================================
+
+PERCENTILES_MC = (5, 25, 50, 75, 95)
+
+# Municipalités par lot (au plus), et taille visée du tableau VAN d'un lot:
+# à 100 000 tirages, 83 municipalités par lot (64 Mio). La mémoire de pointe
+# est de l'ordre de 2 à 3 fois ce tableau (masque VAN > 0, réductions).
+TAILLE_LOT_MUNICIPALITES = 256
+MEMOIRE_LOT_OCTETS = 64 * 2**20
+
+
+@dataclass
+class ResultatsMonteCarloMunicipalites:
+    """
+    Distribution de la VAN par municipalité et pour la province.
+
+    Les tableaux par municipalité sont alignés sur csd_uid; van_province et
+    nb_viables contiennent une valeur par tirage valide.
+    """
+    csd_uid: list[str]
+    nom: list[str]
+    prob_van_positive: np.ndarray       # (M)
+    van_moyenne: np.ndarray             # (M)
+    percentiles: np.ndarray             # (M × len(PERCENTILES_MC))
+    van_province: np.ndarray            # (N) somme des VAN par tirage
+    nb_viables: np.ndarray              # (N) municipalités avec VAN > 0
+    n_simulations: int
+    seed: Optional[int]
+    exclues: dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.csd_uid)
+
+    @property
+    def prob_van_province_positive(self) -> float:
+        """P(somme des VAN > 0)."""
+        return float(np.mean(self.van_province > 0))
+
+    def resume_province(self) -> dict:
+        """Agrégats provinciaux: VAN totale et nombre de municipalités viables."""
+        def distribution(x: np.ndarray) -> dict:
+            valeurs = np.percentile(x, PERCENTILES_MC)
+            return {
+                "moyenne": float(np.mean(x)),
+                **{f"p{p}": float(v) for p, v in zip(PERCENTILES_MC, valeurs)},
+            }
+        return {
+            "n_simulations": self.n_simulations,
+            "prob_van_positive": self.prob_van_province_positive,
+            "van_totale": distribution(self.van_province),
+            "nb_viables": distribution(self.nb_viables),
+        }
+
+    def vers_dict(self, decimales: int = 0) -> dict:
+        """Table compacte: {csd_uid: [P(VAN>0), moyenne, P5, P25, P50, P75, P95]}."""
+        colonnes = ["prob_van_positive", "van_moyenne"] + [f"p{p}" for p in PERCENTILES_MC]
+        return {
+            "colonnes": colonnes,
+            "noms": dict(zip(self.csd_uid, self.nom)),
+            "donnees": {
+                uid: [round(float(self.prob_van_positive[i]), 4),
+                      round(float(self.van_moyenne[i]), decimales)]
+                     + [round(float(v), decimales) for v in self.percentiles[i]]
+                for i, uid in enumerate(self.csd_uid)
+            },
+            "province": self.resume_province(),
+            "seed": self.seed,
+            "exclues": dict(self.exclues),
+        }
+
+
+def simuler_municipalites_monte_carlo(
+    municipalites: list[Municipalite],
+    compteur: ParametresCompteur,
+    base: Optional[ParametresModele] = None,
+    config_mc: Optional[ParametresMonteCarlo] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+    taille_lot: Optional[int] = None,
+    exclues: Optional[dict[str, str]] = None,
+    annulation=None,
+    progression: Optional[Callable[[int, int], None]] = None,
+) -> ResultatsMonteCarloMunicipalites:
+    """
+    Monte Carlo sur toutes les municipalités avec des tirages communs.
+
+    Pour une municipalité donnée, la distribution obtenue est celle de
+    simuler_monte_carlo() avec les mêmes distributions (hors lpcd) et le
+    même seed.
+
+    Paramètres:
+        municipalites: Municipalités à évaluer (cf. charger_municipalites)
+        compteur: Paramètres du compteur (valeurs centrales)
+        config_mc: Distributions, n_simulations et seed
+        taille_lot: Municipalités évaluées par lot (borne la mémoire); défaut:
+                    déduit de MEMOIRE_LOT_OCTETS, au plus TAILLE_LOT_MUNICIPALITES
+        annulation: Objet avec is_set(), vérifié pendant l'identification
+                    des coefficients; lève CalculAnnule s'il est levé
+        progression: Fonction (tirages_faits, n_total)
+        (autres paramètres: cf. evaluer_municipalites)
+
+    Retourne:
+        ResultatsMonteCarloMunicipalites
+    """
+    if base is None:
+        base = ParametresModele()
+    if config_mc is None:
+        config_mc = ParametresMonteCarlo(distributions=DISTRIBUTIONS_DEFAUT)
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+    if params_fuites is None:
+        params_fuites = FUITES_CONTEXTE_QUEBEC
+    if params_adoption is None:
+        params_adoption = ADOPTION_OBLIGATOIRE
+    avec_reseau = params_fuites_reseau is not None
+
+    # Tirages communs (même séquence que simuler_monte_carlo)
+    rng = np.random.default_rng(config_mc.seed)
+    n = config_mc.n_simulations
+    tirages = {nom: distrib.tirer(n, rng) for nom, distrib in config_mc.distributions.items()}
+    tirages.pop("lpcd", None)
+
+    # Coefficients de la VAN (colonnes H, H·U, V, 1) pour chaque tirage
+    volume_pre = np.full(n, np.nan)
+    coef_0 = np.full((n, 4), np.nan)
+    coef_v = np.full((n, 4), np.nan)
+    for i in range(n):
+        if i % TAILLE_LOT_ANNULATION == 0:
+            if annulation is not None and annulation.is_set():
+                raise CalculAnnule(f"Simulation annulée après {i}/{n} tirages")
+            if progression is not None:
+                progression(i, n)
+        params, compteur_i, ve, fuites, adoption = _configuration_tirage(
+            tirages, i, base, compteur, valeur_eau, params_fuites, params_adoption,
+        )
+        try:
+            vp, c0, cv = _coefficients(
+                compteur_i, params, persistance, fuites, params_fuites_reseau,
+                mode_compte, ve, adoption,
+            )
+        except Exception:
+            continue
+        volume_pre[i] = vp
+        coef_0[i] = c0[:, 0] - c0[:, 1]
+        if cv is not None:
+            coef_v[i] = cv[:, 0] - cv[:, 1]
+    if progression is not None:
+        progression(n, n)
+
+    valides = ~np.isnan(coef_0).any(axis=1)
+    volume_pre, coef_0, coef_v = volume_pre[valides], coef_0[valides], coef_v[valides]
+    n_valides = int(valides.sum())
+
+    # VAN par lots de municipalités: (m × N) à la fois
+    H, usage_base, V = _variables(municipalites, avec_reseau)
+    M = len(municipalites)
+    prob = np.zeros(M)
+    moyenne = np.zeros(M)
+    percentiles = np.zeros((M, len(PERCENTILES_MC)))
+    van_province = np.zeros(n_valides)
+    nb_viables = np.zeros(n_valides, dtype=int)
+    if taille_lot is None:
+        taille_lot = min(TAILLE_LOT_MUNICIPALITES, max(1, MEMOIRE_LOT_OCTETS // (8 * max(1, n_valides))))
+
+    # Municipalités avec et sans pertes réseau: chaque groupe n'utilise
+    # qu'un jeu de coefficients, appliqué en place sur le tableau du lot
+    avec_v = V > 0
+    for groupe, coef in ((np.flatnonzero(avec_v), coef_v), (np.flatnonzero(~avec_v), coef_0)):
+        for debut in range(0, len(groupe), taille_lot):
+            lot = groupe[debut:debut + taille_lot]
+            # VAN = H·(c0 + U·c1) + V·c2 + c3, avec U = max(0, usage − volume_pre)
+            van = np.subtract(usage_base[lot, None], volume_pre[None, :])
+            np.maximum(van, 0.0, out=van)
+            van *= coef[:, 1]
+            van += coef[:, 0]
+            van *= H[lot, None]
+            van += coef[:, 3]
+            for ligne, v in zip(van, V[lot]):
+                if v > 0:
+                    ligne += v * coef[:, 2]
+
+            positive = van > 0
+            prob[lot] = np.mean(positive, axis=1)
+            nb_viables += positive.sum(axis=0)
+            del positive
+            moyenne[lot] = np.mean(van, axis=1)
+            van_province += van.sum(axis=0)
+            # Dernier usage du lot: le tri partiel peut écraser le tableau
+            percentiles[lot] = np.percentile(van, PERCENTILES_MC, axis=1, overwrite_input=True).T
+
+    return ResultatsMonteCarloMunicipalites(
+        csd_uid=[m.csd_uid for m in municipalites],
+        nom=[m.nom for m in municipalites],
+        prob_van_positive=prob,
+        van_moyenne=moyenne,
+        percentiles=percentiles,
+        van_province=van_province,
+        nb_viables=nb_viables,
+        n_simulations=n_valides,
+        seed=config_mc.seed,
+        exclues=dict(exclues or {}),
+    )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[list] = None) -> None:
+    """Point d'entrée CLI."""
+    from .presets import FUITES_QUEBEC_DEUX_STOCKS, PERSISTANCE_REALISTE
+
+    parser = argparse.ArgumentParser(description="ACB de toutes les municipalités")
+    parser.add_argument("stats", help="Chemin de municipalities-stats.json")
+    parser.add_argument("-o", "--output", help="Fichier JSON de sortie (défaut: stdout)")
+    parser.add_argument("--compteur", choices=[t.value for t in TypeCompteur], default=TypeCompteur.AMI.value)
+    parser.add_argument("--financier", action="store_true", help="Perspective financière (défaut: économique)")
+    parser.add_argument("--pression", type=float, default=PRESSION_SERVICE_DEFAUT_M,
+                        help="Pression moyenne de service (m) pour les pertes réseau")
+    parser.add_argument("--monte-carlo", type=int, metavar="N",
+                        help="Monte Carlo provincial à N tirages communs (P(VAN>0), percentiles)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed du Monte Carlo")
+    args = parser.parse_args(argv)
+
+    municipalites, exclues = charger_municipalites(args.stats, args.pression)
+    compteur = ParametresCompteur(type_compteur=TypeCompteur(args.compteur))
+    mode_compte = ModeCompte.FINANCIER if args.financier else ModeCompte.ECONOMIQUE
+    if args.monte_carlo:
+        resultats = simuler_municipalites_monte_carlo(
+            municipalites,
+            compteur,
+            config_mc=ParametresMonteCarlo(n_simulations=args.monte_carlo, seed=args.seed,
+                                           distributions=DISTRIBUTIONS_DEFAUT),
+            persistance=PERSISTANCE_REALISTE,
+            params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+            mode_compte=mode_compte,
+            exclues=exclues,
+        )
+    else:
+        resultats = evaluer_municipalites(
+            municipalites,
+            compteur,
+            persistance=PERSISTANCE_REALISTE,
+            params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+            mode_compte=mode_compte,
+            exclues=exclues,
+        )
+    sortie = json.dumps(resultats.vers_dict(), ensure_ascii=False, separators=(",", ":"))
+    if args.output:
+        Path(args.output).write_text(sortie, encoding="utf-8")
+        if args.monte_carlo:
+            province = resultats.resume_province()
+            print(f"{len(resultats)} municipalités × {resultats.n_simulations} tirages, "
+                  f"P(VAN province > 0) = {province['prob_van_positive']:.1%}, "
+                  f"{len(exclues)} exclues → {args.output}")
+        else:
+            viables = int(np.sum(resultats.van > 0))
+            print(f"{len(resultats)} municipalités évaluées ({viables} avec VAN > 0), "
+                  f"{len(exclues)} exclues → {args.output}")
+    else:
+        print(sortie)
+
+
+if __name__ == "__main__":
+    main()
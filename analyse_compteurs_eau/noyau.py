@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Noyau déterministe exportable: entrées résolues et spécification JSON.
+
+noyau.js (racine du dépôt) réimplémente executer_modele() sans dépendance
+pour le calcul dans le navigateur. Ce module fournit le format d'échange:
+les entrées du modèle sérialisées avec leurs défauts résolus, la forme des
+résultats attendus et les tables de préréglages dont le client a besoin pour
+traduire une requête de l'API en entrées.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import fields
+from enum import Enum
+from typing import Optional
+
+import numpy as np
+
+from .core import (
+    ModeCompte,
+    ModePersistance,
+    TypeCompteur,
+    ConfigEconomiesEchelle,
+    ParametresAdoption,
+    ParametresCompteur,
+    ParametresFuites,
+    ParametresFuitesReseau,
+    ParametresModele,
+    ParametresPersistance,
+    ParametresValeurEau,
+    ResultatsModele,
+    ADOPTION_OBLIGATOIRE,
+    VALEUR_EAU_QUEBEC,
+)
+
+
+# =============================================================================
+# MODULE NOYAU — CALCUL CÔTÉ CLIENT
+# =============================================================================
+#
+# Le modèle déterministe (économies, adoption, persistance α_B(t), dynamique
+# des fuites, actualisation) ne demande que de l'arithmétique sur des séries
+# de T ≤ 40 ans: un aller-retour serveur par mouvement de curseur est inutile.
+#
+# Format d'échange (entrees_noyau):
+#   params, compteur, echelle, persistance, adoption, valeur_eau
+#       champs des dataclasses (énumérations → valeur, paliers → paires)
+#   fuites, fuites_reseau
+#       idem, ou null (comportement de executer_modele sans ces modules)
+#   mode_compte
+#       "economique" | "financier"
+#
+# Les défauts implicites de executer_modele() sont résolus ici (adoption
+# obligatoire, persistance constante, valeur de l'eau dérivée de
+# params.valeur_eau_m3): le noyau JS n'a aucune règle de défaut à connaître.
+# Les facteurs d'efficacité du compteur sont ceux après __post_init__.
+#
+# spec_noyau() ajoute les défauts des dataclasses et les tables de
+# préréglages (fuites, adoption, valeur de l'eau, efficacité par type de
+# compteur) pour que le client construise les entrées d'une requête sans
+# appel au serveur. Le test de validation compare noyau.js à
+# executer_modele() sur SCENARIOS_CANONIQUES (validation_scenarios.py).
+#
+# =============================================================================
+
+VERSION_NOYAU = 1
+
+SECTIONS_NOYAU = (
+    "params", "compteur", "echelle", "persistance", "fuites",
+    "fuites_reseau", "adoption", "valeur_eau", "mode_compte",
+)
+
+# Champs de ResultatsModele reproduits par le noyau
+CHAMPS_RESULTATS_NOYAU = tuple(
+    f.name for f in fields(ResultatsModele)
+    if f.name not in ("params", "compteur", "mode_compte")
+)
+
+# Métadonnées et objets sans effet sur le calcul
+_CHAMPS_IGNORES = ("nom", "description", "ventilation_opex_ami")
+
+
+def _vers_json(objet) -> Optional[dict]:
+    """Champs d'une dataclass de paramètres, sérialisables en JSON."""
+    if objet is None:
+        return None
+    sortie = {}
+    for f in fields(objet):
+        if f.name in _CHAMPS_IGNORES:
+            continue
+        valeur = getattr(objet, f.name)
+        if isinstance(valeur, Enum):
+            valeur = valeur.value
+        elif isinstance(valeur, tuple):
+            valeur = list(valeur)
+        elif isinstance(valeur, dict):
+            # Clés numériques (paliers d'échelle): paires triées
+            valeur = [[k, v] for k, v in sorted(valeur.items())]
+        sortie[f.name] = valeur
+    return sortie
+
+
+def _nombre(x) -> Optional[float]:
+    """Nombre JSON (NaN et infini → None)."""
+    x = float(x)
+    return x if math.isfinite(x) else None
+
+
+def entrees_noyau(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    params_adoption: Optional[ParametresAdoption] = None,
+) -> dict:
+    """
+    Entrées de executer_modele() au format du noyau JS.
+
+    Mêmes arguments que executer_modele(); les défauts sont résolus comme
+    dans generer_trajectoires() et actualiser_series().
+
+    Retourne:
+        Dictionnaire JSON (sections SECTIONS_NOYAU)
+    """
+    if config_echelle is None:
+        config_echelle = ConfigEconomiesEchelle(activer=False)
+    if persistance is None:
+        persistance = ParametresPersistance(
+            mode=ModePersistance.CONSTANT,
+            alpha_initial=params.reduction_comportement_pct / 100.0,
+        )
+    if params_adoption is None:
+        params_adoption = ADOPTION_OBLIGATOIRE
+    if valeur_eau is None:
+        valeur_eau = ParametresValeurEau(
+            valeur_sociale_m3=params.valeur_eau_m3,
+            cout_variable_m3=VALEUR_EAU_QUEBEC.cout_variable_m3,
+        )
+
+    return {
+        "params": _vers_json(params),
+        "compteur": _vers_json(compteur),
+        "echelle": _vers_json(config_echelle),
+        "persistance": _vers_json(persistance),
+        "fuites": _vers_json(params_fuites),
+        "fuites_reseau": _vers_json(params_fuites_reseau),
+        "adoption": _vers_json(params_adoption),
+        "valeur_eau": _vers_json(valeur_eau),
+        "mode_compte": mode_compte.value,
+    }
+
+
+def resultats_noyau(resultats: ResultatsModele) -> dict:
+    """
+    Résultats de executer_modele() au format de sortie du noyau JS.
+
+    Les valeurs non finies (RBC sans coûts, récupération jamais atteinte)
+    deviennent None, comme null côté JS.
+    """
+    sortie = {}
+    for nom in CHAMPS_RESULTATS_NOYAU:
+        valeur = getattr(resultats, nom)
+        if isinstance(valeur, bool):
+            sortie[nom] = valeur
+        elif isinstance(valeur, np.ndarray):
+            sortie[nom] = [_nombre(v) for v in valeur.tolist()]
+        else:
+            sortie[nom] = _nombre(valeur)
+    return sortie
+
+
+def spec_noyau(
+    fuites: Optional[dict] = None,
+    adoption: Optional[dict] = None,
+    valeur_eau: Optional[dict] = None,
+) -> dict:
+    """
+    Spécification du noyau: version, défauts et tables de préréglages.
+
+    Paramètres:
+        fuites: {identifiant: ParametresFuites} (défaut: SCENARIOS_FUITES)
+        adoption: {identifiant: ParametresAdoption} (défaut: STRATEGIES_ADOPTION)
+        valeur_eau: {identifiant: ParametresValeurEau} (défaut: PRESETS_VALEUR_EAU)
+
+    Retourne:
+        Dictionnaire JSON
+    """
+    from .presets import PRESETS_VALEUR_EAU, SCENARIOS_FUITES, STRATEGIES_ADOPTION
+
+    fuites = SCENARIOS_FUITES if fuites is None else fuites
+    adoption = STRATEGIES_ADOPTION if adoption is None else adoption
+    valeur_eau = PRESETS_VALEUR_EAU if valeur_eau is None else valeur_eau
+
+    efficacite = {}
+    for type_compteur in TypeCompteur:
+        c = ParametresCompteur(type_compteur=type_compteur)
+        efficacite[type_compteur.value] = {
+            "facteur_efficacite_comportement": c.facteur_efficacite_comportement,
+            "facteur_efficacite_fuites": c.facteur_efficacite_fuites,
+        }
+
+    return {
+        "version": VERSION_NOYAU,
+        "sections": list(SECTIONS_NOYAU),
+        "resultats": list(CHAMPS_RESULTATS_NOYAU),
+        "defauts": {
+            "params": _vers_json(ParametresModele()),
+            "compteur": _vers_json(ParametresCompteur()),
+            "echelle": _vers_json(ConfigEconomiesEchelle()),
+            "fuites": _vers_json(ParametresFuites()),
+            "fuites_reseau": _vers_json(ParametresFuitesReseau()),
+            "adoption": _vers_json(ParametresAdoption()),
+            "valeur_eau": _vers_json(ParametresValeurEau()),
+        },
+        # Stratégie appliquée par executer_modele() sans params_adoption
+        "adoption_defaut": _vers_json(ADOPTION_OBLIGATOIRE),
+        "efficacite_compteurs": efficacite,
+        "fuites": {k: _vers_json(v) for k, v in fuites.items()},
+        "adoption": {k: _vers_json(v) for k, v in adoption.items()},
+        "valeur_eau": {k: _vers_json(v) for k, v in valeur_eau.items()},
+    }
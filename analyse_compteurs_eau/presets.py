@@ -0,0 +1,797 @@
+# -*- coding: utf-8 -*-
+"""
+Préréglages du modèle: valeurs d'eau, OPEX, municipalités de référence,
+scénarios de persistance, de fuites, d'adoption et segments résidentiels.
+
+Les préréglages servant de valeurs par défaut au moteur sont définis dans
+core.py et réexportés ici.
+"""
+
+from __future__ import annotations
+
+
+from .core import (
+    TypeCompteur,
+    ParametresValeurEau,
+    VALEUR_EAU_QUEBEC,
+    VentilationOPEX,
+    VENTILATION_OPEX_STANDARD,
+    ParametresCompteur,
+    ParametresModele,
+    ModePersistance,
+    ParametresPersistance,
+    ModeRepartitionCouts,
+    ParametresFuites,
+    FUITES_CONTEXTE_QUEBEC,
+    ModeAdoption,
+    ParametresAdoption,
+    ADOPTION_OBLIGATOIRE,
+    TypeLogement,
+    ParametresSegment,
+)
+
+
+# =============================================================================
+# PRESETS DE VALEURS D'EAU
+# =============================================================================
+
+# VALEUR_EAU_QUEBEC (défaut du moteur) est définie dans core.py
+
+# Scénario conservateur (coût complet bas)
+VALEUR_EAU_CONSERVATEUR = ParametresValeurEau(
+    cout_variable_m3=0.25,       # OPEX variable bas
+    cout_opex_fixe_m3=0.75,      # OPEX fixe réduit
+    cout_capex_m3=1.50,          # CAPEX minimal
+    valeur_sociale_m3=2.50,      # Total = 0.25 + 0.75 + 1.50
+    prix_vente_m3=2.00,
+    mcf=0.20,
+    appliquer_mcf=False,
+    nom="Conservateur",
+    description="Hypothèses prudentes pour analyse de sensibilité",
+)
+
+# Scénario avec rareté (zones de stress hydrique)
+# Note: Ce scénario INCLUT une prime de rareté/externalité environnementale
+VALEUR_EAU_RARETE = ParametresValeurEau(
+    cout_variable_m3=1.50,       # OPEX variable élevé (pompage profond)
+    cout_opex_fixe_m3=1.50,      # OPEX fixe (traitement avancé)
+    cout_capex_m3=3.00,          # CAPEX (infrastructure coûteuse)
+    valeur_sociale_m3=8.00,      # Total inclut prime rareté +2.00 $/m³
+    prix_vente_m3=4.00,
+    mcf=0.25,                    # MCF plus élevé
+    appliquer_mcf=False,
+    nom="Rareté hydrique",
+    description="Zones de stress hydrique — inclut prime environnementale",
+)
+
+# Scénario sans MCF (rétrocompatibilité)
+VALEUR_EAU_SANS_MCF = ParametresValeurEau(
+    cout_variable_m3=0.50,
+    cout_opex_fixe_m3=1.24,
+    cout_capex_m3=2.95,
+    valeur_sociale_m3=4.69,
+    prix_vente_m3=2.50,
+    mcf=0.0,
+    appliquer_mcf=False,
+    nom="Sans MCF",
+    description="Identique à Québec MAMH (MCF=0)",
+)
+
+# Scénario Québec AVEC MCF (pour analyse de sensibilité)
+VALEUR_EAU_QUEBEC_AVEC_MCF = ParametresValeurEau(
+    cout_variable_m3=0.50,
+    cout_opex_fixe_m3=1.24,
+    cout_capex_m3=2.95,
+    valeur_sociale_m3=4.69,
+    prix_vente_m3=2.50,
+    mcf=0.20,                    # Treasury Board Canada (2007)
+    appliquer_mcf=True,
+    nom="Québec avec MCF",
+    description="Sensibilité: MCF=20% appliqué aux dépenses publiques",
+)
+
+# Dictionnaire des préréglages
+PREREGLAGES_VALEUR_EAU = {
+    "quebec": VALEUR_EAU_QUEBEC,
+    "quebec_mcf": VALEUR_EAU_QUEBEC_AVEC_MCF,
+    "conservateur": VALEUR_EAU_CONSERVATEUR,
+    "rarete": VALEUR_EAU_RARETE,
+    "sans_mcf": VALEUR_EAU_SANS_MCF,  # Rétrocompatibilité
+}
+
+# Alias rétrocompatible
+PRESETS_VALEUR_EAU = PREREGLAGES_VALEUR_EAU
+
+
+# =============================================================================
+# PRÉRÉGLAGES DE VENTILATION OPEX
+# =============================================================================
+
+# VENTILATION_OPEX_STANDARD (défaut du moteur) est définie dans core.py
+
+VENTILATION_OPEX_SECURITE_ELEVEE = VentilationOPEX(
+    cybersecurite_pct=0.25,
+    licences_logiciels_pct=0.20,
+    stockage_donnees_pct=0.10,
+    service_client_pct=0.20,
+    integration_si_pct=0.25,
+    nom="Sécurité élevée",
+    description="Infrastructure critique, exigences cybersécurité renforcées",
+)
+
+VENTILATION_OPEX_CLOUD = VentilationOPEX(
+    cybersecurite_pct=0.12,
+    licences_logiciels_pct=0.25,
+    stockage_donnees_pct=0.18,
+    service_client_pct=0.20,
+    integration_si_pct=0.25,
+    nom="Cloud-native",
+    description="Infrastructure cloud (SaaS), coûts stockage plus élevés",
+)
+
+PREREGLAGES_VENTILATION_OPEX = {
+    "standard": VENTILATION_OPEX_STANDARD,
+    "securite_elevee": VENTILATION_OPEX_SECURITE_ELEVEE,
+    "cloud": VENTILATION_OPEX_CLOUD,
+}
+
+
+# =============================================================================
+# VALEURS PAR DÉFAUT RÉGIONALES
+# =============================================================================
+
+# Longueuil (basé sur SQEEP 2023 - Données Québec)
+# Source: https://www.donneesquebec.ca/recherche/dataset/sqeep-2019-2025
+DEFAUTS_LONGUEUIL = ParametresModele(
+    nb_menages=116_258,   # SQEEP 2023: nb_resid_desservi exact
+    taille_menage=2.18,   # SQEEP 2023: 253,629 pop / 116,258 ménages
+    lpcd=236.0,           # SQEEP 2023: consommation résidentielle Longueuil
+)
+
+# Ordres de grandeur Québec (repères pour cadrer les scénarios)
+ORDRES_GRANDEUR_QUEBEC = {
+    "residentiel_lpcd": 245.0,        # L/p/j résidentiel moyen (Québec)
+    "total_distribue_lpcd": 467.0,    # L/p/j tous usages distribués
+    "cible_provinciale_lpcd": 458.0,  # L/p/j cible provinciale
+    "longueuil_residentiel_lpcd": 236.0,  # Longueuil résidentiel (SQEEP 2023)
+    "longueuil_tous_usages_lpcd": 567.0,  # Longueuil tous usages (sources internes 2024)
+    "longueuil_cible_lpcd": 184.0,        # Objectif Longueuil (sources internes)
+}
+
+# Preset pour scénario forte consommation (Montréal, villes non comptées)
+LPCD_MONTREAL_HAUT = 332.0  # Source: documents municipaux Montréal
+
+COMPTEUR_LONGUEUIL_AMI = ParametresCompteur(
+    type_compteur=TypeCompteur.AMI,
+    cout_compteur=250.0,
+    heures_installation=3.0,  # "minimalement 3h" selon courriel
+    taux_horaire_installation=125.0,
+    cout_reseau_par_compteur=50.0,
+)
+
+# Compteur par défaut du calculateur web: source unique des défauts de
+# CalculRequest (api.py) et de la couche ACB de la carte (map/collectors).
+# Le coût réseau, l'infrastructure fixe et l'OPEX non technique ne
+# s'appliquent qu'aux compteurs AMI.
+DEFAUTS_COMPTEUR_CALCULATEUR = {
+    "cout_compteur": 250.0,
+    "heures_installation": 3.0,
+    "taux_horaire_installation": 125.0,
+    "cout_reseau_par_compteur": 50.0,
+    "cout_infra_fixe": 0.0,
+    "cout_opex_non_tech_ami": 15.0,
+}
+COUTS_AMI_SEULEMENT = ("cout_reseau_par_compteur", "cout_infra_fixe", "cout_opex_non_tech_ami")
+
+
+def creer_compteur_calculateur(type_compteur: TypeCompteur, **couts) -> ParametresCompteur:
+    """Compteur du calculateur: défauts remplacés par `couts`, coûts propres à l'AMI annulés sinon."""
+    valeurs = {**DEFAUTS_COMPTEUR_CALCULATEUR, **couts}
+    if type_compteur != TypeCompteur.AMI:
+        valeurs.update({cle: 0.0 for cle in COUTS_AMI_SEULEMENT})
+    return ParametresCompteur(type_compteur=type_compteur, **valeurs)
+
+
+# Winnipeg (référence)
+DEFAUTS_WINNIPEG = ParametresModele(
+    nb_menages=221_000,
+    taille_menage=2.3,
+)
+
+COMPTEUR_WINNIPEG = ParametresCompteur(
+    type_compteur=TypeCompteur.AMI,
+    cout_compteur=350.0,
+    heures_installation=1.0,
+    taux_horaire_installation=100.0,
+    cout_reseau_par_compteur=161.0,  # $135M / 221k = ~$611 total
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SCÉNARIOS OPEX AMI (sensibilité)
+# ─────────────────────────────────────────────────────────────────────────────
+# Ces scénarios permettent de tester la sensibilité aux coûts d'exploitation
+# non-techniques (télécom, cyber, licences, stockage, support).
+#
+# OPEX total AMI = cout_maintenance_ami (5$) + cout_opex_non_tech_ami
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Scénario OPEX bas: infrastructure mutualisée, contrats avantageux
+COMPTEUR_AMI_OPEX_BAS = ParametresCompteur(
+    type_compteur=TypeCompteur.AMI,
+    cout_compteur=250.0,
+    heures_installation=3.0,
+    taux_horaire_installation=125.0,
+    cout_reseau_par_compteur=50.0,
+    cout_opex_non_tech_ami=10.0,  # OPEX total: 15$/an
+)
+
+# Scénario OPEX médian: défaut réaliste (identique à COMPTEUR_LONGUEUIL_AMI)
+# cout_opex_non_tech_ami = 15.0 par défaut → OPEX total: 20$/an
+
+# Scénario OPEX haut: exigences Loi 25, cybersécurité renforcée, premium cloud
+COMPTEUR_AMI_OPEX_HAUT = ParametresCompteur(
+    type_compteur=TypeCompteur.AMI,
+    cout_compteur=250.0,
+    heures_installation=3.0,
+    taux_horaire_installation=125.0,
+    cout_reseau_par_compteur=50.0,
+    cout_opex_non_tech_ami=35.0,  # OPEX total: 40$/an
+)
+
+SCENARIOS_OPEX_AMI = {
+    "bas": COMPTEUR_AMI_OPEX_BAS,       # 15$/compteur/an
+    "median": COMPTEUR_LONGUEUIL_AMI,   # 20$/compteur/an (défaut)
+    "haut": COMPTEUR_AMI_OPEX_HAUT,     # 40$/compteur/an
+}
+
+
+# =============================================================================
+# SCÉNARIOS DE PERSISTANCE PRÉDÉFINIS
+# =============================================================================
+
+# Scénario OPTIMISTE: Effets permanents
+# Hypothèse: Les ménages forment de nouvelles habitudes durables
+# Justification: Fort effet d'ancrage, feedback AMI régulier, normes sociales
+PERSISTANCE_OPTIMISTE = ParametresPersistance(
+    mode=ModePersistance.CONSTANT,
+    alpha_initial=0.08,  # 8% de réduction permanente
+    nom="Optimiste",
+    description="Effets permanents - Les habitudes se maintiennent intégralement",
+)
+
+# Scénario RÉALISTE: Décroissance vers plateau
+# Hypothèse: L'effet initial s'estompe mais une partie devient permanente
+# Calibration basée sur:
+# - Études UK: convergence observée à ~2 ans
+# - Plateau = 25-30% de l'effet initial (habitudes formées)
+# - Demi-vie ≈ 4.6 ans (λ = 0.15, cohérent Allcott & Rogers AER)
+PERSISTANCE_REALISTE = ParametresPersistance(
+    mode=ModePersistance.EXPONENTIEL_PLATEAU,
+    alpha_initial=0.08,       # 8% réduction initiale
+    alpha_plateau=0.025,      # 2.5% plateau long terme (31% de l'initial)
+    lambda_decay=0.15,        # Demi-vie ≈ 4.6 ans (Allcott: décroissance 10-20%/an)
+    nom="Réaliste",
+    description="Décroissance vers plateau - Partie des habitudes se maintient",
+)
+
+# Scénario PESSIMISTE: Fade-out complet
+# Hypothèse: Sans signal-prix, les ménages reviennent aux anciennes habitudes
+# Justification: Pas de tarification volumétrique, effet "nouveau" s'estompe
+# Calibration: Disparition linéaire sur 10 ans (conservateur)
+PERSISTANCE_PESSIMISTE = ParametresPersistance(
+    mode=ModePersistance.FADEOUT_LINEAIRE,
+    alpha_initial=0.08,       # 8% réduction initiale
+    annees_fadeout=10,        # Retour à zéro en 10 ans
+    nom="Pessimiste",
+    description="Fade-out complet - Retour progressif aux anciennes habitudes",
+)
+
+# Scénario ULTRA-PESSIMISTE: Aucun changement comportemental
+# Hypothèse: Sans tarification volumétrique et sans engagement actif,
+# les ménages ne modifient pas du tout leur consommation.
+# Seules les fuites détectées et réparées génèrent des économies.
+# Utilité: Stress-test du business case, argumentation conservatrice maximale
+PERSISTANCE_ULTRA_PESSIMISTE = ParametresPersistance(
+    mode=ModePersistance.CONSTANT,
+    alpha_initial=0.0,        # AUCUNE réduction comportementale
+    alpha_plateau=0.0,        # Cohérent avec alpha_initial=0
+    nom="Ultra-pessimiste",
+    description="Aucun changement comportemental - Économies fuites uniquement",
+)
+
+# Dictionnaire pour accès facile
+SCENARIOS_PERSISTANCE = {
+    "optimiste": PERSISTANCE_OPTIMISTE,
+    "realiste": PERSISTANCE_REALISTE,
+    "pessimiste": PERSISTANCE_PESSIMISTE,
+    "ultra_pessimiste": PERSISTANCE_ULTRA_PESSIMISTE,
+}
+
+# =============================================================================
+# SCÉNARIOS DE FUITES PRÉDÉFINIS
+# =============================================================================
+
+# Scénario SANS_COUT: Modèle de base (ignorer les coûts de réparation)
+# Équivalent au modèle v3.1 - pour comparaison
+FUITES_SANS_COUT = ParametresFuites(
+    part_menages_fuite_pct=20.0,
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=85.0,
+    part_fuites_persistantes_pct=5.0,
+    mode_repartition=ModeRepartitionCouts.SANS_COUT,
+    inclure_cout_reparation=False,
+    duree_moyenne_fuite_sans_compteur=4.0,
+    nom="Sans coût",
+    description="Borne basse: coûts réparation ignorés (prévalence 20%, durée 4 ans)",
+)
+
+# Scénario MENAGE_SEUL: Les ménages paient 100% des réparations
+# Hypothèse réaliste par défaut
+FUITES_MENAGE_SEUL = ParametresFuites(
+    part_menages_fuite_pct=20.0,
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=85.0,
+    part_fuites_persistantes_pct=5.0,
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    part_ville_pct=0.0,
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    duree_moyenne_fuite_sans_compteur=4.0,
+    nom="Ménage seul",
+    description="Prévalence 20%, durée 4 ans; détection 90%/réparation 85% (ménage 100%)",
+)
+
+# Scénario SUBVENTION_50: La ville subventionne 50% des réparations
+# Programme incitatif modéré
+FUITES_SUBVENTION_50 = ParametresFuites(
+    part_menages_fuite_pct=20.0,
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=85.0,
+    part_fuites_persistantes_pct=5.0,
+    mode_repartition=ModeRepartitionCouts.SUBVENTION_PARTIELLE,
+    part_ville_pct=50.0,
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    duree_moyenne_fuite_sans_compteur=4.0,
+    nom="Subvention 50%",
+    description="Prévalence 20%, durée 4 ans; ville subventionne 50% (réparation 85%)",
+)
+
+# Scénario VILLE_SEULE: La ville paie 100% des réparations
+# Programme incitatif maximal (ex: programme de plomberie gratuite)
+FUITES_VILLE_SEULE = ParametresFuites(
+    part_menages_fuite_pct=20.0,
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=85.0,
+    part_fuites_persistantes_pct=5.0,
+    mode_repartition=ModeRepartitionCouts.VILLE_SEULE,
+    part_ville_pct=100.0,
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    duree_moyenne_fuite_sans_compteur=4.0,
+    nom="Ville seule",
+    description="Prévalence 20%, durée 4 ans; ville 100% (réparation 85%)",
+)
+
+# Scénario CONTEXTE_QUEBEC (défaut du moteur): défini dans core.py
+
+# Scénario QUÉBEC DEUX-STOCKS: prévalence plus élevée et coûts différenciés
+# Hypothèse plausible pour villes québécoises sans comptage historique
+FUITES_QUEBEC_DEUX_STOCKS = ParametresFuites(
+    utiliser_prevalence_differenciee=True,
+    part_menages_fuite_pct=30.0,            # Agrégé (fallback)
+    debit_fuite_m3_an=18.0,                 # Moyenne pondérée (fallback)
+    part_menages_fuite_any_pct=30.0,        # Petites fuites + significatives
+    part_menages_fuite_significative_pct=6.0,
+    debit_fuite_any_m3_an=10.0,
+    debit_fuite_significative_m3_an=50.0,
+    cout_reparation_any=150.0,
+    cout_reparation_sig=600.0,
+    part_fuites_persistantes_pct=5.0,
+    facteur_duree_longue_traine=5.0,
+    duree_moyenne_fuite_sans_compteur=6.0,  # Équilibre implicite: 5% / 30% ≈ 6 ans
+    taux_detection_pct=90.0,
+    taux_reparation_pct=85.0,
+    cout_reparation_moyen=160.0,            # Moyenne pondérée (fallback)
+    inclure_cout_reparation=True,
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    part_ville_pct=0.0,
+    nom="QC différencié",
+    description="Fuites différenciées: petites (24%) + significatives (6%), coûts 150$/600$",
+)
+
+# Dictionnaire des scénarios
+SCENARIOS_FUITES = {
+    "sans_cout": FUITES_SANS_COUT,
+    "menage": FUITES_MENAGE_SEUL,
+    "subvention_50": FUITES_SUBVENTION_50,
+    "ville": FUITES_VILLE_SEULE,
+    "quebec": FUITES_CONTEXTE_QUEBEC,
+    "quebec_deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
+}
+
+# =============================================================================
+# SCÉNARIOS SANS TARIFICATION VOLUMÉTRIQUE
+# =============================================================================
+#
+# Au Québec, l'eau est généralement incluse dans les taxes foncières (forfait).
+# Sans signal-prix, l'incitatif à réparer une fuite est réduit.
+#
+# HYPOTHÈSES COMPORTEMENTALES (défendables en soutenance):
+# - Taux réparation BASE: 55% (vs 85% avec tarification)
+#   → Reflète les incitatifs non-prix: conscience environnementale (~30%),
+#     nuisance sonore, risque de dommages, conformité assurance (~25% supp.)
+# - Grosses fuites: facteur 1.4 → taux effectif ~77%
+#   → Plus visibles (moisissures, dégâts), pression sociale/assurancielle
+# - Persistance: 10% (vs 5%) → plus de fuites jamais réparées
+#   → Absence d'urgence économique = procrastination durable
+#
+# SOURCES:
+# - Littérature "nudge" et économie comportementale (Thaler & Sunstein)
+# - Études sur la réponse aux alertes sans conséquence financière
+# =============================================================================
+
+# Scénario MENAGE_SEUL sans tarification volumétrique
+# Taux de réparation réduit car aucun incitatif financier direct
+FUITES_MENAGE_SANS_TARIF = ParametresFuites(
+    part_menages_fuite_pct=20.0,
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=55.0,         # Réduit: incitatifs non-prix seulement
+    part_fuites_persistantes_pct=10.0, # Augmenté: procrastination durable
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    part_ville_pct=0.0,
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    duree_moyenne_fuite_sans_compteur=4.0,
+    nom="Ménage seul (sans tarif)",
+    description="Sans tarification: taux réparation 55% (incitatifs non-prix), persistance 10%",
+)
+
+# Scénario CONTEXTE_QUEBEC sans tarification volumétrique
+FUITES_QUEBEC_SANS_TARIF = ParametresFuites(
+    part_menages_fuite_pct=35.0,       # Stock accumulé (pas de détection historique)
+    debit_fuite_m3_an=35.0,
+    taux_detection_pct=90.0,
+    taux_reparation_pct=55.0,          # Réduit: sans tarification
+    part_fuites_persistantes_pct=10.0, # Augmenté
+    duree_moyenne_fuite_sans_compteur=7.0,
+    cout_reparation_moyen=200.0,
+    inclure_cout_reparation=True,
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    part_ville_pct=0.0,
+    nom="Québec (sans tarif)",
+    description="Contexte QC sans tarification: prévalence 35%, réparation 55%, persistance 10%",
+)
+
+# Scénario QUEBEC_DEUX_STOCKS sans tarification volumétrique
+# Différencie petites vs grosses fuites avec facteur_reparation_sig
+FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF = ParametresFuites(
+    utiliser_prevalence_differenciee=True,
+    part_menages_fuite_pct=30.0,
+    debit_fuite_m3_an=18.0,
+    part_menages_fuite_any_pct=30.0,
+    part_menages_fuite_significative_pct=6.0,
+    debit_fuite_any_m3_an=10.0,
+    debit_fuite_significative_m3_an=50.0,
+    cout_reparation_any=150.0,
+    cout_reparation_sig=600.0,
+    # Sans tarification: taux de base réduit mais grosses fuites mieux réparées
+    taux_detection_pct=90.0,
+    taux_reparation_pct=55.0,          # Base pour petites fuites
+    facteur_reparation_sig=1.4,        # Grosses fuites: 55% × 1.4 = 77% (dommages visibles)
+    part_fuites_persistantes_pct=10.0, # Augmenté
+    facteur_duree_longue_traine=5.0,
+    duree_moyenne_fuite_sans_compteur=6.0,
+    cout_reparation_moyen=160.0,
+    inclure_cout_reparation=True,
+    mode_repartition=ModeRepartitionCouts.MENAGE_SEUL,
+    part_ville_pct=0.0,
+    nom="QC différencié (sans tarif)",
+    description="Fuites différenciées sans tarif: petites 55%, significatives 77% (×1.4), persist. 10%",
+)
+
+# Dictionnaire étendu des scénarios
+SCENARIOS_FUITES = {
+    # Avec tarification (ou hypothèse incitatif fort)
+    "sans_cout": FUITES_SANS_COUT,
+    "menage": FUITES_MENAGE_SEUL,
+    "subvention_50": FUITES_SUBVENTION_50,
+    "ville": FUITES_VILLE_SEULE,
+    "quebec": FUITES_CONTEXTE_QUEBEC,
+    "quebec_deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
+    # Sans tarification (contexte québécois typique)
+    "menage_sans_tarif": FUITES_MENAGE_SANS_TARIF,
+    "quebec_sans_tarif": FUITES_QUEBEC_SANS_TARIF,
+    "quebec_deux_stocks_sans_tarif": FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF,
+}
+
+
+# =============================================================================
+# SCÉNARIOS D'ADOPTION PRÉDÉFINIS
+# =============================================================================
+
+# Scénario OBLIGATOIRE (défaut du moteur): défini dans core.py
+
+# Scénario RAPIDE: Volontaire avec fortes incitations (3 ans pour 80%)
+# Calibration incitatif: forfait 540$/ménage sur 3 ans (crédit taxes / subvention)
+ADOPTION_RAPIDE = ParametresAdoption(
+    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
+    k_vitesse=1.5,           # Adoption rapide
+    t0_point_median=2.0,     # 50% atteint en 2 ans
+    adoption_max_pct=95.0,   # Plafond à 95%
+    etaler_capex=True,
+    cout_incitatif_par_menage=540.0,  # Forfait 3 ans
+    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
+    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
+    nom="Volontaire rapide",
+    description="Incitations fortes: crédit taxes / subvention (forfait 540$ sur 3 ans)",
+)
+
+# Scénario PROGRESSIF: Volontaire avec incitations modérées (7 ans pour 80%)
+# Calibration incitatif: forfait 180$/ménage sur 3 ans (crédit taxes / subvention)
+ADOPTION_PROGRESSIVE = ParametresAdoption(
+    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
+    k_vitesse=0.6,           # Adoption modérée
+    t0_point_median=5.0,     # 50% atteint en 5 ans
+    adoption_max_pct=85.0,   # Plafond à 85%
+    etaler_capex=True,
+    cout_incitatif_par_menage=180.0,  # Forfait 3 ans
+    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
+    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
+    nom="Volontaire progressif",
+    description="Incitations modérées: crédit taxes / subvention (forfait 180$ sur 3 ans)",
+)
+
+# Scénario NOUVEAUX SEULEMENT: Seulement nouvelles constructions
+ADOPTION_NOUVEAUX = ParametresAdoption(
+    mode=ModeAdoption.NOUVEAUX_BRANCHEMENTS,
+    taux_nouveaux_pct=3.0,   # 3% de nouvelles constructions/an
+    adoption_max_pct=60.0,   # Plafond réaliste sur 20 ans
+    etaler_capex=True,
+    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
+    nom="Nouveaux branchements",
+    description="Obligation seulement pour nouvelles constructions/rénovations majeures",
+)
+
+# Scénario PAR SECTEUR: Déploiement planifié par quartier
+ADOPTION_PAR_SECTEUR = ParametresAdoption(
+    mode=ModeAdoption.PAR_SECTEUR,
+    nb_secteurs=5,           # 5 secteurs/arrondissements
+    annees_par_secteur=2.0,  # 2 ans par secteur (10 ans total)
+    adoption_max_pct=100.0,  # Couverture complète à terme
+    etaler_capex=True,
+    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
+    nom="Par secteur",
+    description="Plan quinquennal: un arrondissement tous les 2 ans",
+)
+
+# Scénario LENT: Adoption très progressive (pour comparaison)
+# Calibration incitatif: forfait 90$/ménage sur 3 ans (crédit taxes / subvention)
+ADOPTION_LENTE = ParametresAdoption(
+    mode=ModeAdoption.VOLONTAIRE_INCITATIF,
+    k_vitesse=0.3,           # Adoption lente
+    t0_point_median=10.0,    # 50% atteint en 10 ans
+    adoption_max_pct=70.0,   # Plafond bas
+    etaler_capex=True,
+    cout_incitatif_par_menage=90.0,   # Forfait 3 ans
+    duree_incitatif_ans=3,            # Crédit versé sur 3 ans
+    fraction_premiere_annee=0.5,      # Installation moyenne sur l'année
+    nom="Volontaire lent",
+    description="Incitations minimales: crédit taxes / subvention (forfait 90$ sur 3 ans)",
+)
+
+# =============================================================================
+# SCÉNARIO ICI SEULEMENT — INSTITUTIONNEL (placeholder à calibrer)
+# =============================================================================
+# Déploiement limité aux compteurs ICI (industriel/commercial/institutionnel).
+# Le modèle est résidentiel: il faut fournir un % de parc ICI pour l'adoption.
+def creer_adoption_ici_seulement(part_ici_pct: float = 10.0) -> ParametresAdoption:
+    """
+    Créer une stratégie d'adoption "ICI seulement".
+
+    Args:
+        part_ici_pct: % du parc total correspondant aux compteurs ICI.
+    """
+    return ParametresAdoption(
+        mode=ModeAdoption.OBLIGATOIRE,
+        adoption_max_pct=part_ici_pct,
+        etaler_capex=False,
+        nom="ICI seulement",
+        description="Déploiement ICI (part du parc à calibrer localement)",
+    )
+
+
+ADOPTION_ICI_SEULEMENT = creer_adoption_ici_seulement()
+
+# =============================================================================
+# SCÉNARIO ÉCHANTILLONNAGE 380 — SQEEP/RAUEP
+# =============================================================================
+# Le SQEEP (Stratégie québécoise d'économie d'eau potable) et le RAUEP
+# exigent un échantillon statistique de 380 compteurs résidentiels pour
+# caractériser la consommation. Ce n'est PAS un déploiement universel.
+#
+# CALCUL DU POURCENTAGE:
+#   adoption_max_pct = (380 / nb_menages) × 100
+#   Ex: Longueuil (116 258 ménages) → 380/116258 × 100 = 0.327%
+#
+# CARACTÉRISTIQUES:
+#   - Sélection aléatoire stratifiée (représentativité statistique)
+#   - Coût marginal très bas (380 compteurs, pas d'économie d'échelle)
+#   - Objectif: caractérisation, pas réduction de consommation
+#   - La VAN sera NÉGATIVE (coût sans bénéfice comportemental significatif)
+#
+# FONCTION HELPER: creer_adoption_echantillonnage_380(nb_menages)
+# =============================================================================
+
+# Preset pour Longueuil (valeur par défaut du modèle)
+# Pour d'autres municipalités, utiliser creer_adoption_echantillonnage_380()
+ADOPTION_ECHANTILLONNAGE_380 = ParametresAdoption(
+    mode=ModeAdoption.OBLIGATOIRE,  # Les 380 compteurs sont sélectionnés par la ville
+    adoption_max_pct=0.327,  # 380/116258 × 100 pour Longueuil
+    etaler_capex=False,      # Installation en une seule phase
+    nom="Échantillonnage SQEEP (380)",
+    description="Échantillon statistique de 380 compteurs pour caractérisation SQEEP/RAUEP",
+)
+
+
+def creer_adoption_echantillonnage_380(nb_menages: int = 116258) -> ParametresAdoption:
+    """
+    Créer une stratégie d'adoption pour l'échantillonnage SQEEP de 380 compteurs.
+
+    Le SQEEP exige un échantillon de n=380 compteurs résidentiels pour obtenir
+    un intervalle de confiance de 95% avec une marge d'erreur de ±5%.
+
+    Args:
+        nb_menages: Nombre total de ménages dans la municipalité
+
+    Returns:
+        ParametresAdoption configuré pour 380 compteurs
+
+    Example:
+        >>> adoption_380 = creer_adoption_echantillonnage_380(nb_menages=50000)
+        >>> print(f"Taux: {adoption_380.adoption_max_pct:.3f}%")  # 0.760%
+    """
+    TAILLE_ECHANTILLON = 380
+    pct = (TAILLE_ECHANTILLON / nb_menages) * 100
+
+    return ParametresAdoption(
+        mode=ModeAdoption.OBLIGATOIRE,
+        adoption_max_pct=pct,
+        etaler_capex=False,
+        nom="Échantillonnage SQEEP (380)",
+        description=f"Échantillon de {TAILLE_ECHANTILLON} compteurs sur {nb_menages:,} ménages ({pct:.3f}%)",
+    )
+
+
+# Dictionnaire des stratégies
+STRATEGIES_ADOPTION = {
+    "obligatoire": ADOPTION_OBLIGATOIRE,
+    "rapide": ADOPTION_RAPIDE,
+    "progressif": ADOPTION_PROGRESSIVE,
+    "nouveaux": ADOPTION_NOUVEAUX,
+    "secteur": ADOPTION_PAR_SECTEUR,
+    "lent": ADOPTION_LENTE,
+    "ici_seulement": ADOPTION_ICI_SEULEMENT,
+    "echantillonnage_380": ADOPTION_ECHANTILLONNAGE_380,  # SQEEP
+}
+
+
+# =============================================================================
+# PRÉRÉGLAGES SEGMENTATION QUÉBEC (SQEEP 2023 + StatCan 2021)
+# =============================================================================
+
+SEGMENT_UNIFAMILIAL = ParametresSegment(
+    type_logement=TypeLogement.UNIFAMILIAL,
+    nb_menages=70_000,           # ~60% du parc résidentiel
+    nb_compteurs=70_000,         # 1 compteur par ménage
+    personnes_par_menage=2.5,
+    lpcd=250.0,
+    cout_compteur_ajustement=1.0,
+    cout_installation_ajustement=1.0,
+    prevalence_fuites_pct=22.0,  # Légèrement plus élevé (plus de plomberie)
+    potentiel_reduction_pct=10.0,  # Plus de marge (extérieur)
+    nom="Unifamilial",
+    description="Maisons individuelles - haute consommation, fort potentiel",
+)
+
+SEGMENT_MULTIPLEX = ParametresSegment(
+    type_logement=TypeLogement.MULTIPLEX,
+    nb_menages=25_000,           # ~21% du parc
+    nb_compteurs=10_000,         # ~1 compteur par 2.5 logements (compteur maître)
+    personnes_par_menage=2.0,
+    lpcd=210.0,
+    cout_compteur_ajustement=0.95,
+    cout_installation_ajustement=0.90,  # Accès plus facile
+    prevalence_fuites_pct=20.0,
+    potentiel_reduction_pct=7.0,
+    nom="Multiplex",
+    description="Duplex/triplex/quadruplex - consommation moyenne",
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MULTILOGEMENT — EXCLU DE L'ANALYSE PAR DÉFAUT
+# ─────────────────────────────────────────────────────────────────────────────
+#
+# LIMITATION MÉTHODOLOGIQUE ASSUMÉE
+# =================================
+# Le segment multilogement (immeubles de 5+ logements, ~18% du parc résidentiel
+# québécois) est volontairement exclu de l'analyse principale. Cette exclusion
+# constitue une limite du modèle, justifiée par l'absence de données empiriques
+# permettant de calibrer les hypothèses clés.
+#
+# PROBLÈME FONDAMENTAL : BIFURCATION COÛT-EFFET
+# ---------------------------------------------
+# L'effet comportemental dépend du mode de comptage, créant deux configurations
+# aux profils coût-bénéfice opposés et incomparables :
+#
+#   Configuration A — Compteur bâtiment (maître)
+#   • Coût par logement : ~75$ (compteur partagé entre N logements)
+#   • Effet comportemental : α ≈ 0 (aucune rétroaction individuelle)
+#   • Détection fuites : au niveau bâtiment seulement
+#   • Bénéfice net : marginal voire nul
+#
+#   Configuration B — Sous-comptage individuel (submetering)
+#   • Coût par logement : 500-800$+ (compteur + plomberie + réseau par unité)
+#   • Effet comportemental : α potentiellement comparable à l'unifamilial
+#   • Détection fuites : par logement (mais responsabilité propriétaire/locataire floue)
+#   • Bénéfice net : possiblement positif, mais CAPEX très élevé
+#
+# ABSENCE DE DONNÉES QUÉBÉCOISES
+# ------------------------------
+# • Aucune étude empirique québécoise sur l'effet comportemental en multilogement
+# • Le submetering résidentiel est rare au Québec (contrairement à l'Ontario)
+# • La dynamique propriétaire-locataire pour les réparations n'est pas documentée
+# • Les coûts réels d'installation en contexte locatif québécois sont inconnus
+#
+# JUSTIFICATION DE L'EXCLUSION
+# ----------------------------
+# 1. Inclure ce segment avec des hypothèses arbitraires fragiliserait l'ensemble
+#    de l'analyse et exposerait le modèle à des critiques légitimes.
+#
+# 2. L'analyse reste pertinente : unifamilial + multiplex représentent ~82% du
+#    parc résidentiel québécois et la grande majorité de la consommation.
+#
+# 3. Cette limitation est documentée et constitue une avenue de recherche future.
+#
+# AVENUE DE RECHERCHE FUTURE
+# --------------------------
+# Pour inclure le multilogement, il faudrait :
+# • Données empiriques sur l'effet comportemental avec compteur maître vs submeter
+# • Enquête sur les pratiques de réparation de fuites en contexte locatif
+# • Analyse des coûts réels de submetering au Québec
+# • Création de deux sous-segments : MULTILOGEMENT_BATIMENT et MULTILOGEMENT_SUBMETER
+#
+# ─────────────────────────────────────────────────────────────────────────────
+# Définition conservée pour référence et recherche future — NON UTILISÉ par défaut
+SEGMENT_MULTILOGEMENT = ParametresSegment(
+    type_logement=TypeLogement.MULTILOGEMENT,
+    nb_menages=21_000,           # ~18% du parc résidentiel québécois
+    nb_compteurs=4_200,          # Hypothèse compteur maître (1 pour ~5 logements)
+    personnes_par_menage=1.7,
+    lpcd=180.0,
+    # ATTENTION: Les ajustements ci-dessous supposent un compteur maître (config A).
+    # Pour du submetering (config B), ces valeurs seraient très différentes.
+    cout_compteur_ajustement=0.85,      # Coût/logement bas SI compteur maître
+    cout_installation_ajustement=0.75,  # Installation groupée SI compteur maître
+    prevalence_fuites_pct=18.0,
+    potentiel_reduction_pct=5.0,        # FRAGILE: α≈0 avec compteur maître
+    nom="Multilogement (non utilisé)",
+    description="EXCLU — Voir LIMITATION MÉTHODOLOGIQUE. Config compteur maître hypothétique.",
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SEGMENTS INCLUS DANS L'ANALYSE PAR DÉFAUT
+# ─────────────────────────────────────────────────────────────────────────────
+# Couverture : ~82% du parc résidentiel québécois
+# Exclusion  : Multilogement (~18%) — voir LIMITATION MÉTHODOLOGIQUE ci-dessus
+# ─────────────────────────────────────────────────────────────────────────────
+SEGMENTS_QUEBEC_DEFAUT = [
+    SEGMENT_UNIFAMILIAL,   # ~55% du parc — effet comportemental bien documenté
+    SEGMENT_MULTIPLEX,     # ~27% du parc — effet comportemental extrapolé
+    # MULTILOGEMENT EXCLU — bifurcation coût-effet non résoluble sans données empiriques
+]
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Priorisation provinciale: quelles municipalités équiper en premier sous un
+budget de subvention et une capacité d'installation.
+
+Usage:
+    python -m analyse_compteurs_eau.priorisation stats.json --budget 50e6
+    python -m analyse_compteurs_eau.priorisation stats.json --budget 50e6 --capacite 200000 --objectif m3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .core import ModeCompte, ParametresCompteur, TypeCompteur
+from .municipalites import (
+    PRESSION_SERVICE_DEFAUT_M,
+    ResultatsMunicipalites,
+    charger_municipalites,
+    evaluer_municipalites,
+)
+
+
+# =============================================================================
+# MODULE PRIORISATION — SAC À DOS PROVINCIAL
+# =============================================================================
+#
+# Chaque municipalité est un objet de sac à dos:
+#   - valeur: VAN ou m³ économisés actualisés (evaluer_municipalites)
+#   - poids 1: investissement initial, imputé au budget de subvention
+#   - poids 2: nombre de compteurs, imputé à la capacité d'installation
+#
+# Résolution gloutonne avec bornes:
+# 1. Contrainte de substitution: c/B + n/K ≤ 2 (un seul poids agrégé)
+# 2. Tri par densité valeur / poids agrégé, remplissage en sautant les
+#    objets qui ne tiennent plus dans l'une ou l'autre contrainte
+# 3. Garde-fou classique: la meilleure municipalité seule, si elle vaut plus
+# 4. Borne supérieure: relaxation linéaire (Dantzig) de chaque contrainte
+#    et de la contrainte de substitution; la plus serrée mesure l'écart à
+#    l'optimum
+#
+# Pour ~1 100 municipalités, la résolution prend quelques millisecondes.
+#
+# =============================================================================
+
+OBJECTIFS_PRIORISATION = ("van", "m3")
+
+
+@dataclass
+class ResultatsPriorisation:
+    """Sélection ordonnée (rang de priorité) et bornes."""
+    objectif: str
+    budget: float
+    capacite_compteurs: Optional[float]
+    selection: list[int]                 # indices dans ResultatsMunicipalites, par priorité
+    valeur_totale: float
+    borne_superieure: float
+    investissement_total: float
+    compteurs_total: int
+    van_totale: float
+    m3_totaux: float
+    details: list[dict] = field(default_factory=list)
+
+    @property
+    def ecart_optimalite_pct(self) -> float:
+        """Écart maximal à l'optimum (%), d'après la borne supérieure."""
+        if self.borne_superieure <= 0:
+            return 0.0
+        return max(0.0, 100.0 * (1.0 - self.valeur_totale / self.borne_superieure))
+
+    def vers_dict(self) -> dict:
+        """Résumé sérialisable (API, CLI)."""
+        return {
+            "objectif": self.objectif,
+            "contraintes": {
+                "budget": self.budget,
+                "capacite_compteurs": self.capacite_compteurs,
+            },
+            "resume": {
+                "nb_municipalites": len(self.selection),
+                "valeur_totale": round(self.valeur_totale, 2),
+                "borne_superieure": round(self.borne_superieure, 2),
+                "ecart_optimalite_pct": round(self.ecart_optimalite_pct, 3),
+                "investissement_total": round(self.investissement_total, 2),
+                "budget_restant": round(self.budget - self.investissement_total, 2),
+                "compteurs_total": self.compteurs_total,
+                "van_totale": round(self.van_totale, 2),
+                "m3_totaux": round(self.m3_totaux, 2),
+            },
+            "selection": self.details,
+        }
+
+
+def _borne_dantzig(valeurs: np.ndarray, poids: np.ndarray, capacite: float) -> float:
+    """Borne de la relaxation linéaire d'un sac à dos à une contrainte."""
+    ordre = np.argsort(-valeurs / poids, kind="stable")
+    cumul = np.cumsum(poids[ordre])
+    k = int(np.searchsorted(cumul, capacite, side="right"))
+    borne = float(valeurs[ordre[:k]].sum())
+    if k < len(ordre):
+        reste = capacite - (cumul[k - 1] if k > 0 else 0.0)
+        borne += float(valeurs[ordre[k]]) * reste / float(poids[ordre[k]])
+    return borne
+
+
+def prioriser_municipalites(
+    resultats: ResultatsMunicipalites,
+    nb_compteurs: np.ndarray,
+    budget: float,
+    capacite_compteurs: Optional[float] = None,
+    objectif: str = "van",
+) -> ResultatsPriorisation:
+    """
+    Sélectionner et ordonner les municipalités à équiper.
+
+    Paramètres:
+        resultats: Indicateurs par municipalité (evaluer_municipalites)
+        nb_compteurs: Compteurs à installer par municipalité (aligné sur resultats)
+        budget: Budget de subvention ($), imputé à l'investissement initial
+        capacite_compteurs: Compteurs installables au total (None: illimitée)
+        objectif: "van" (VAN totale) ou "m3" (m³ économisés actualisés)
+
+    Retourne:
+        ResultatsPriorisation (sélection par ordre de priorité)
+    """
+    if objectif not in OBJECTIFS_PRIORISATION:
+        raise ValueError(f"objectif doit être parmi {OBJECTIFS_PRIORISATION}")
+    if budget <= 0:
+        raise ValueError("budget doit être > 0")
+    if capacite_compteurs is not None and capacite_compteurs <= 0:
+        raise ValueError("capacite_compteurs doit être > 0")
+
+    valeurs = np.asarray(resultats.van if objectif == "van" else resultats.va_economies_m3, dtype=float)
+    couts = np.asarray(resultats.investissement_initial, dtype=float)
+    compteurs = np.asarray(nb_compteurs, dtype=float)
+
+    # Candidates: valeur positive, réalisables seules
+    ok = np.isfinite(valeurs) & (valeurs > 0) & (couts > 0) & (couts <= budget)
+    if capacite_compteurs is not None:
+        ok &= compteurs <= capacite_compteurs
+    candidats = np.flatnonzero(ok)
+
+    selection: list[int] = []
+    borne = 0.0
+    if len(candidats):
+        v = valeurs[candidats]
+        c = couts[candidats]
+        n = compteurs[candidats]
+
+        # Poids agrégé (contrainte de substitution)
+        poids = c / budget
+        capacite_agregee = 1.0
+        if capacite_compteurs is not None:
+            poids = poids + n / capacite_compteurs
+            capacite_agregee = 2.0
+
+        ordre = np.argsort(-v / poids, kind="stable")
+        reste_budget = budget
+        reste_capacite = capacite_compteurs if capacite_compteurs is not None else np.inf
+        for j in ordre:
+            if c[j] <= reste_budget and n[j] <= reste_capacite:
+                selection.append(int(j))
+                reste_budget -= c[j]
+                reste_capacite -= n[j]
+
+        meilleure = int(np.argmax(v))
+        if v[meilleure] > v[selection].sum():
+            selection = [meilleure]
+        selection = [int(candidats[j]) for j in selection]
+
+        bornes = [_borne_dantzig(v, c, budget), _borne_dantzig(v, poids, capacite_agregee)]
+        if capacite_compteurs is not None:
+            bornes.append(_borne_dantzig(v, n, capacite_compteurs))
+        borne = min(bornes)
+
+    details = []
+    investissement = 0.0
+    for rang, i in enumerate(selection, start=1):
+        investissement += float(couts[i])
+        details.append({
+            "rang": rang,
+            "csd_uid": resultats.csd_uid[i],
+            "nom": resultats.nom[i],
+            "van": round(float(resultats.van[i]), 2),
+            "va_economies_m3": round(float(resultats.va_economies_m3[i]), 2),
+            "investissement_initial": round(float(couts[i]), 2),
+            "nb_compteurs": int(compteurs[i]),
+            "investissement_cumule": round(investissement, 2),
+        })
+
+    return ResultatsPriorisation(
+        objectif=objectif,
+        budget=float(budget),
+        capacite_compteurs=None if capacite_compteurs is None else float(capacite_compteurs),
+        selection=selection,
+        valeur_totale=float(valeurs[selection].sum()),
+        borne_superieure=max(borne, float(valeurs[selection].sum())),
+        investissement_total=investissement,
+        compteurs_total=int(compteurs[selection].sum()),
+        van_totale=float(resultats.van[selection].sum()),
+        m3_totaux=float(resultats.va_economies_m3[selection].sum()),
+        details=details,
+    )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[list] = None) -> None:
+    """Point d'entrée CLI."""
+    from .presets import FUITES_QUEBEC_DEUX_STOCKS, PERSISTANCE_REALISTE
+
+    parser = argparse.ArgumentParser(description="Priorisation provinciale des municipalités à équiper")
+    parser.add_argument("stats", help="Chemin de municipalities-stats.json")
+    parser.add_argument("--budget", type=float, required=True, help="Budget de subvention ($)")
+    parser.add_argument("--capacite", type=float, help="Compteurs installables au total")
+    parser.add_argument("--objectif", choices=OBJECTIFS_PRIORISATION, default="van")
+    parser.add_argument("--compteur", choices=[t.value for t in TypeCompteur], default=TypeCompteur.AMI.value)
+    parser.add_argument("--financier", action="store_true", help="Perspective financière (défaut: économique)")
+    parser.add_argument("--pression", type=float, default=PRESSION_SERVICE_DEFAUT_M,
+                        help="Pression moyenne de service (m) pour les pertes réseau")
+    parser.add_argument("-o", "--output", help="Fichier JSON de sortie (défaut: stdout)")
+    args = parser.parse_args(argv)
+
+    municipalites, exclues = charger_municipalites(args.stats, args.pression)
+    resultats = evaluer_municipalites(
+        municipalites,
+        ParametresCompteur(type_compteur=TypeCompteur(args.compteur)),
+        persistance=PERSISTANCE_REALISTE,
+        params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+        mode_compte=ModeCompte.FINANCIER if args.financier else ModeCompte.ECONOMIQUE,
+        exclues=exclues,
+    )
+    priorisation = prioriser_municipalites(
+        resultats,
+        np.array([m.nb_menages for m in municipalites]),
+        args.budget,
+        capacite_compteurs=args.capacite,
+        objectif=args.objectif,
+    )
+    sortie = json.dumps(priorisation.vers_dict(), ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(sortie, encoding="utf-8")
+        resume = priorisation.vers_dict()["resume"]
+        print(f"{resume['nb_municipalites']} municipalités retenues, "
+              f"{args.objectif} = {resume['valeur_totale']:,.0f} "
+              f"(écart max. {resume['ecart_optimalite_pct']:.2f} %) → {args.output}")
+    else:
+        print(sortie)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2451 @@
+# -*- coding: utf-8 -*-
+"""
+Analyses comparatives, sensibilité, affichages console et graphiques du
+modèle déterministe.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import numpy as np
+
+from ._differe import pd, plt, mpatches
+from .core import (
+    TypeCompteur,
+    ModeCompte,
+    ParametresValeurEau,
+    VALEUR_EAU_QUEBEC,
+    ConfigEconomiesEchelle,
+    calculer_facteur_echelle,
+    VentilationOPEX,
+    VENTILATION_OPEX_STANDARD,
+    ParametresCompteur,
+    ParametresModele,
+    ResultatsModele,
+    ResultatsParPayeur,
+    ParametresPersistance,
+    generer_serie_alpha,
+    ParametresFuites,
+    calculer_dynamique_fuites,
+    ParametresFuitesReseau,
+    FUITES_CONTEXTE_QUEBEC,
+    generer_serie_adoption,
+    calculer_economies_eau,
+    generer_trajectoires,
+    calculer_van_cumulative,
+    fmt_argent,
+    executer_modele,
+    _cloner_params,
+    _cloner_compteur,
+)
+from .presets import (
+    PREREGLAGES_VALEUR_EAU,
+    PREREGLAGES_VENTILATION_OPEX,
+    DEFAUTS_LONGUEUIL,
+    ORDRES_GRANDEUR_QUEBEC,
+    COMPTEUR_LONGUEUIL_AMI,
+    PERSISTANCE_REALISTE,
+    SCENARIOS_PERSISTANCE,
+    SCENARIOS_FUITES,
+    STRATEGIES_ADOPTION,
+    SEGMENTS_QUEBEC_DEFAUT,
+)
+from .montecarlo import DISTRIBUTIONS_DEFAUT
+
+
+# =============================================================================
+# AFFICHAGE DES PRÉRÉGLAGES ET PARAMÈTRES
+# =============================================================================
+
+def afficher_prereglages_valeur_eau() -> None:
+    """Afficher un tableau des préréglages de valeur d'eau."""
+    print("\n" + "=" * 70)
+    print(" " * 12 + "PRÉRÉGLAGES DE VALORISATION DE L'EAU")
+    print("=" * 70)
+
+    print(f"\n{'Préréglage':<15} │ {'Val. sociale':<12} │ {'Coût var.':<10} │ {'Infra':<10} │ {'External.':<10}")
+    print("─" * 15 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10)
+
+    for nom, prereglage in PREREGLAGES_VALEUR_EAU.items():
+        print(f"{prereglage.nom:<15} │ {prereglage.valeur_sociale_m3:>10.2f} $ │ "
+              f"{prereglage.cout_variable_m3:>8.2f} $ │ {prereglage.cout_infrastructure_m3:>8.2f} $ │ "
+              f"{prereglage.valeur_externalites_m3:>8.2f} $")
+
+    print("=" * 70)
+    print("\nNote : Valeur sociale = coût variable + report infra + externalités")
+
+
+def afficher_presets_valeur_eau() -> None:
+    """Alias rétrocompatible: utiliser afficher_prereglages_valeur_eau()."""
+    afficher_prereglages_valeur_eau()
+
+
+def afficher_table_economies_echelle(config: ConfigEconomiesEchelle = None) -> None:
+    """Afficher la table des économies d'échelle."""
+    if config is None:
+        config = ConfigEconomiesEchelle(activer=True)
+
+    print("\n" + "=" * 60)
+    print(" " * 15 + "ÉCONOMIES D'ÉCHELLE")
+    print("=" * 60)
+    print(f"  Activé: {'OUI' if config.activer else 'NON'}")
+    print(f"  Modèle: {'Continu (log)' if config.utiliser_modele_continu else 'Par paliers'}")
+    print(f"  Intensité: compteur={config.poids_compteur:.2f}, réseau={config.poids_reseau:.2f}, installation={config.poids_installation:.2f}")
+    print()
+
+    if not config.utiliser_modele_continu:
+        print("  Paliers de réduction:")
+        print("  " + "-" * 40)
+        paliers_tries = sorted(config.paliers.items())
+        for i, (seuil, facteur) in enumerate(paliers_tries):
+            if i < len(paliers_tries) - 1:
+                seuil_suivant = paliers_tries[i + 1][0]
+                print(f"    {seuil:>7,} - {seuil_suivant-1:>7,} compteurs: {(1-facteur)*100:>5.1f}% réduction")
+            else:
+                print(f"    {seuil:>7,}+ compteurs:          {(1-facteur)*100:>5.1f}% réduction")
+
+    print()
+    print("  Exemples de coûts (base 675$/compteur):")
+    print("  " + "-" * 40)
+    for n in [10_000, 50_000, 100_000, 119_000, 200_000, 250_000]:
+        facteur = calculer_facteur_echelle(n, config)
+        cout_ajuste = 675 * facteur
+        reduction = (1 - facteur) * 100
+        print(f"    {n:>7,} compteurs: {cout_ajuste:>6.0f}$ ({reduction:>5.1f}% réduction)")
+    print("=" * 60 + "\n")
+
+
+def _configs_echelle_comparaison(
+    config_echelle: Optional[ConfigEconomiesEchelle],
+) -> list[tuple[str, ConfigEconomiesEchelle]]:
+    """
+    Construire les scénarios d'échelle pour les comparaisons.
+
+    Si config_echelle est fourni, retourne uniquement ce scénario.
+    Sinon, retourne deux scénarios: sans échelle et échelle activée.
+    """
+    if config_echelle is not None:
+        label = "Échelle activée" if config_echelle.activer else "Sans échelle"
+        return [(label, config_echelle)]
+
+    return [
+        ("Sans échelle", ConfigEconomiesEchelle(activer=False)),
+        ("Échelle activée", ConfigEconomiesEchelle(activer=True)),
+    ]
+
+
+def afficher_ventilation_opex(
+    cout_opex_annuel: float,
+    nb_compteurs: int = 1,
+    ventilation: VentilationOPEX = None
+) -> None:
+    """
+    Afficher la ventilation OPEX détaillée.
+
+    Paramètres:
+        cout_opex_annuel: Coût OPEX par compteur par an ($)
+        nb_compteurs: Nombre de compteurs (pour afficher le total)
+        ventilation: Configuration de ventilation (défaut: standard)
+    """
+    if ventilation is None:
+        ventilation = VENTILATION_OPEX_STANDARD
+
+    cout_total = cout_opex_annuel * nb_compteurs
+
+    print("\n" + "=" * 65)
+    print(" " * 15 + "VENTILATION OPEX AMI (COÛTS NON TECHNIQUES)")
+    print("=" * 65)
+    print(f"  Configuration: {ventilation.nom}")
+    print(f"  OPEX unitaire: {cout_opex_annuel:.2f} $/compteur/an")
+    print(f"  Nombre de compteurs: {nb_compteurs:,}")
+    print(f"  OPEX total annuel: {cout_total:,.0f} $")
+    print()
+
+    print(f"  {'Composante':<25} │ {'Part':<8} │ {'Unitaire':<12} │ {'Total':<12}")
+    print("  " + "─" * 25 + "─┼─" + "─" * 8 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12)
+
+    details = ventilation.ventiler(cout_opex_annuel)
+    for composante, pct in [
+        ("Cybersécurité", ventilation.cybersecurite_pct),
+        ("Licences logiciels", ventilation.licences_logiciels_pct),
+        ("Stockage données", ventilation.stockage_donnees_pct),
+        ("Service client", ventilation.service_client_pct),
+        ("Intégration SI", ventilation.integration_si_pct),
+    ]:
+        cout_unit = cout_opex_annuel * pct
+        cout_tot = cout_unit * nb_compteurs
+        print(f"  {composante:<25} │ {pct*100:>6.1f}% │ {cout_unit:>10.2f} $ │ {cout_tot:>10,.0f} $")
+
+    print("  " + "─" * 25 + "─┼─" + "─" * 8 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12)
+    print(f"  {'TOTAL':<25} │ {'100.0%':>7} │ {cout_opex_annuel:>10.2f} $ │ {cout_total:>10,.0f} $")
+    print("=" * 65 + "\n")
+
+
+def afficher_ordres_grandeur_quebec() -> None:
+    """Afficher un encadré des ordres de grandeur Québec pour cadrer LPCD."""
+    print("\n" + "=" * 80)
+    print(" " * 18 + "ORDRES DE GRANDEUR QUÉBEC (EAU POTABLE)")
+    print("=" * 80)
+
+    q = ORDRES_GRANDEUR_QUEBEC
+    print(f"  Résidentiel moyen Québec: {q['residentiel_lpcd']:.0f} L/p/j")
+    print(f"  Total distribué (tous usages): {q['total_distribue_lpcd']:.0f} L/p/j")
+    print(f"  Cible provinciale:        {q['cible_provinciale_lpcd']:.0f} L/p/j")
+    print(f"  Longueuil résidentiel:    {q['longueuil_residentiel_lpcd']:.0f} L/p/j")
+    print(f"  Longueuil tous usages:    {q['longueuil_tous_usages_lpcd']:.0f} L/p/j")
+    print(f"  Objectif Longueuil:       {q['longueuil_cible_lpcd']:.0f} L/p/j")
+
+    print("\n  Justification des scénarios:")
+    print("  - LPCD par défaut = 250 L/p/j (cohérent avec résidentiel Québec)")
+    print("  - Scénarios bas/haut cadrés par 180–350 L/p/j (Monte Carlo/sensibilités)")
+    print("=" * 80)
+
+
+def afficher_decomposition_payeurs(res: ResultatsParPayeur) -> None:
+    """Afficher un tableau de la décomposition par payeur."""
+    print("\n" + "=" * 70)
+    print(" " * 15 + "DÉCOMPOSITION DE LA VAN PAR PAYEUR")
+    print("=" * 70)
+
+    print(f"\n{'PERSPECTIVE':<25} │ {'VAN':<18} │ {'Coûts VA':<15} │ {'Bénéfices VA':<15}")
+    print("─" * 25 + "─┼─" + "─" * 18 + "─┼─" + "─" * 15 + "─┼─" + "─" * 15)
+
+    print(f"{'Économique (société)':<25} │ {fmt_argent(res.van_economique):>17} │ "
+          f"{'-':>14} │ {'-':>14}")
+    print(f"{'Ville (budget municipal)':<25} │ {fmt_argent(res.van_ville):>17} │ "
+          f"{fmt_argent(res.va_couts_ville):>14} │ {fmt_argent(res.va_benefices_ville):>14}")
+    print(f"{'Ménages (citoyens)':<25} │ {fmt_argent(res.van_menages):>17} │ "
+          f"{fmt_argent(res.va_couts_menages):>14} │ {fmt_argent(res.va_benefices_menages):>14}")
+    print("─" * 25 + "─┼─" + "─" * 18 + "─┼─" + "─" * 15 + "─┼─" + "─" * 15)
+    print(f"{'Externalités (non captées)':<25} │ {fmt_argent(res.va_externalites):>17} │ "
+          f"{'-':>14} │ {'-':>14}")
+
+    print("\n" + "─" * 70)
+    print("Notes:")
+    print("  - VAN économique = bien-être social total (externalités incluses)")
+    print("  - VAN ville = économies coût variable - (CAPEX + OPEX ville)")
+    print("  - VAN ménages = 0 au Québec (pas de tarification volumétrique)")
+    print("  - Externalités = infrastructure reportée + environnement")
+    print("\n  Décomposition VA (valeur sociale de l'eau):")
+    print(f"    • Coût variable évité:      {fmt_argent(res.va_benefices_cout_variable)}")
+    print(f"    • Report infra (valeur m³): {fmt_argent(res.va_benefices_infra_m3)}")
+    print(f"    • Externalités:             {fmt_argent(res.va_benefices_externalites)}")
+    print(f"    • Report infra (paramètres): {fmt_argent(res.va_benefices_report_infra)}")
+    print("=" * 70)
+
+
+def afficher_scenarios_persistance(T: int = 20) -> None:
+    """Afficher un tableau des scénarios de persistance."""
+    print("\n" + "=" * 70)
+    print(" " * 15 + "SCÉNARIOS DE PERSISTANCE COMPORTEMENTALE")
+    print("=" * 70)
+
+    for nom, params in SCENARIOS_PERSISTANCE.items():
+        serie = generer_serie_alpha(params, T)
+        print(f"\n{params.nom.upper()}: {params.description}")
+        print(f"  Mode: {params.mode.value}")
+        print(f"  α_B(t=1):  {serie[0]*100:.1f}%")
+        print(f"  α_B(t=5):  {serie[4]*100:.1f}%")
+        print(f"  α_B(t=10): {serie[9]*100:.1f}%")
+        print(f"  α_B(t=20): {serie[19]*100:.1f}%")
+        print(f"  Moyenne sur {T} ans: {np.mean(serie)*100:.1f}%")
+
+    print("\n" + "=" * 70)
+
+
+def afficher_scenarios_adoption(horizon: int = 20) -> None:
+    """Afficher un tableau récapitulatif des stratégies d'adoption."""
+    print("\n" + "=" * 85)
+    print(" " * 25 + "STRATÉGIES D'ADOPTION")
+    print("=" * 85)
+
+    print(f"\n{'Stratégie':<22} │ {'Mode':<20} │ {'A(5 ans)':<10} │ {'A(10 ans)':<10} │ {'A(20 ans)':<10}")
+    print("─" * 22 + "─┼─" + "─" * 20 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10)
+
+    for nom, params in STRATEGIES_ADOPTION.items():
+        serie = generer_serie_adoption(params, horizon)
+        a5 = serie[4] if len(serie) > 4 else serie[-1]    # A(5)
+        a10 = serie[9] if len(serie) > 9 else serie[-1]   # A(10)
+        a20 = serie[19] if len(serie) > 19 else serie[-1]  # A(20)
+
+        print(f"{params.nom:<22} │ {params.mode.value:<20} │ "
+              f"{a5*100:>8.1f}% │ {a10*100:>8.1f}% │ {a20*100:>8.1f}%")
+
+    print("=" * 85)
+
+
+# =============================================================================
+# COMPARAISON DES STRATÉGIES D'ADOPTION
+# =============================================================================
+
+def comparer_strategies_adoption(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    strategies: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Comparer les résultats du modèle selon différentes stratégies d'adoption.
+
+    Cette fonction répond à la question centrale: "Quelle stratégie maximise la VAN?"
+    Si config_echelle est None, compare deux scénarios: sans et avec économies d'échelle.
+
+    Paramètres:
+        params: Paramètres du modèle
+        params_fuites: Paramètres de fuites (optionnel)
+        params_fuites_reseau: Paramètres de pertes réseau (optionnel)
+        compteur: Paramètres du compteur (défaut: AMI standard)
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance (défaut: réaliste)
+        params_fuites: Configuration des fuites
+        mode_compte: ECONOMIQUE ou FINANCIER
+        valeur_eau: Paramètres de valorisation
+        strategies: Dict de stratégies à comparer (défaut: STRATEGIES_ADOPTION)
+
+    Retourne:
+        DataFrame avec métriques pour chaque stratégie
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if strategies is None:
+        strategies = STRATEGIES_ADOPTION
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for nom, params_adoption in strategies.items():
+            res = executer_modele(
+                params, compteur, cfg_echelle, persistance, params_fuites,
+                params_fuites_reseau,
+                mode_compte=mode_compte, valeur_eau=valeur_eau,
+                params_adoption=params_adoption
+            )
+
+            # Générer série adoption pour métriques
+            serie = generer_serie_adoption(params_adoption, params.horizon_analyse)
+            a5 = serie[4] if len(serie) > 4 else serie[-1]
+            a10 = serie[9] if len(serie) > 9 else serie[-1]
+            a_final = serie[-1]
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Stratégie": params_adoption.nom,
+                "Mode": params_adoption.mode.value,
+                "A(5 ans)": f"{a5*100:.0f}%",
+                "A(10 ans)": f"{a10*100:.0f}%",
+                "A(final)": f"{a_final*100:.0f}%",
+                "CAPEX étalé": "Oui" if params_adoption.etaler_capex else "Non",
+                "VAN ($)": res.van,
+                "RBC": res.rbc,
+                "Récup. (ans)": res.periode_recuperation,
+                "VA Bénéfices ($)": res.va_benefices,
+                "VA Coûts ($)": res.va_couts_totaux,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+def afficher_comparaison_strategies(
+    df: pd.DataFrame,
+    titre: str = "Comparaison des Stratégies d'Adoption"
+) -> None:
+    """
+    Afficher le tableau de comparaison des stratégies avec interprétation.
+
+    Paramètres:
+        df: DataFrame retourné par comparer_strategies_adoption
+        titre: Titre du tableau
+    """
+    has_echelle = "Échelle" in df.columns
+    largeur = 112 if has_echelle else 100
+    print("\n" + "=" * largeur)
+    print(f"{titre:^{largeur}}")
+    print("=" * largeur)
+
+    # En-tête
+    if has_echelle:
+        print(f"\n{'Échelle':<14} │ {'Stratégie':<22} │ {'A(5)':<6} │ {'A(fin)':<6} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<10}")
+        print("─" * 14 + "─┼─" + "─" * 22 + "─┼─" + "─" * 6 + "─┼─" + "─" * 6 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 10)
+    else:
+        print(f"\n{'Stratégie':<22} │ {'A(5)':<6} │ {'A(fin)':<6} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<10}")
+        print("─" * 22 + "─┼─" + "─" * 6 + "─┼─" + "─" * 6 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 10)
+
+    for _, row in df.iterrows():
+        van_fmt = fmt_argent(row["VAN ($)"])
+        recup_fmt = f"{row['Récup. (ans)']:.1f} ans" if row['Récup. (ans)'] < 999 else ">20 ans"
+
+        if has_echelle:
+            print(f"{row['Échelle']:<14} │ {row['Stratégie']:<22} │ {row['A(5 ans)']:<6} │ {row['A(final)']:<6} │ "
+                  f"{van_fmt:<14} │ {row['RBC']:>5.2f} │ {recup_fmt:<10}")
+        else:
+            print(f"{row['Stratégie']:<22} │ {row['A(5 ans)']:<6} │ {row['A(final)']:<6} │ "
+                  f"{van_fmt:<14} │ {row['RBC']:>5.2f} │ {recup_fmt:<10}")
+
+    print("=" * largeur)
+
+    # Interprétation
+    print("\n" + "-" * largeur)
+    print("INTERPRÉTATION:")
+    print("-" * largeur)
+
+    # Trouver la meilleure stratégie
+    best_idx = df["VAN ($)"].idxmax()
+    best = df.loc[best_idx]
+
+    worst_idx = df["VAN ($)"].idxmin()
+    worst = df.loc[worst_idx]
+
+    print(f"✓ Meilleure stratégie: {best['Stratégie']} (VAN = {fmt_argent(best['VAN ($)'])})")
+    print(f"✗ Moins favorable: {worst['Stratégie']} (VAN = {fmt_argent(worst['VAN ($)'])})")
+
+    ecart = best['VAN ($)'] - worst['VAN ($)']
+    print(f"  Écart: {fmt_argent(ecart)} ({ecart/abs(worst['VAN ($)'])*100:.0f}% de gain potentiel)")
+
+    # Conseil selon contexte
+    obligatoire = df[df["Mode"] == "obligatoire"]
+    if len(obligatoire) > 0:
+        van_oblig = obligatoire.iloc[0]["VAN ($)"]
+        if best['VAN ($)'] > van_oblig * 0.9:
+            print("\n  → L'adoption obligatoire est proche de l'optimal")
+            print("    mais une stratégie volontaire peut réduire la résistance sociale")
+        else:
+            print(f"\n  → La stratégie volontaire '{best['Stratégie']}' offre un bon compromis")
+            print("    entre VAN et acceptabilité sociale")
+
+    print("=" * largeur)
+
+
+def graphique_strategies_adoption(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    strategies: Optional[dict] = None,
+    dossier: str = "figures",
+) -> Optional[plt.Figure]:
+    """
+    Générer un graphique comparant les courbes d'adoption et VAN cumulative.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config_echelle: Configuration économies d'échelle
+        strategies: Dict de stratégies (défaut: toutes)
+        dossier: Dossier de sauvegarde
+
+    Retourne:
+        Figure matplotlib ou None si erreur
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+    if strategies is None:
+        strategies = STRATEGIES_ADOPTION
+
+    T = params.horizon_analyse
+    annees = np.arange(1, T + 1)
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Couleurs
+    couleurs = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+
+    # Graphique 1: Courbes d'adoption A(t)
+    ax1 = axes[0]
+    for i, (nom, params_adop) in enumerate(strategies.items()):
+        serie = generer_serie_adoption(params_adop, T)
+        ax1.plot(annees, serie * 100, label=params_adop.nom,
+                color=couleurs[i % len(couleurs)], linewidth=2)
+
+    ax1.set_xlabel("Année")
+    ax1.set_ylabel("Taux d'adoption A(t) (%)")
+    ax1.set_title("Courbes d'Adoption")
+    ax1.legend(loc="lower right")
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim(0, 105)
+
+    # Graphique 2: VAN pour chaque stratégie
+    ax2 = axes[1]
+    noms = []
+    vans = []
+    for nom, params_adop in strategies.items():
+        res = executer_modele(
+            params, compteur, config_echelle,
+            params_adoption=params_adop
+        )
+        noms.append(params_adop.nom)
+        vans.append(res.van / 1e6)  # En millions
+
+    bars = ax2.bar(noms, vans, color=couleurs[:len(noms)])
+    ax2.set_xlabel("Stratégie")
+    ax2.set_ylabel("VAN (M$)")
+    ax2.set_title("VAN selon la Stratégie d'Adoption")
+    ax2.tick_params(axis='x', rotation=45)
+
+    # Ligne de référence (meilleure VAN)
+    ax2.axhline(y=max(vans), color='green', linestyle='--', alpha=0.5, label='Meilleure')
+
+    plt.tight_layout()
+
+    # Sauvegarde
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "strategies_adoption.png")
+        fig.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Figure sauvegardée: {chemin}")
+
+    return fig
+
+
+def afficher_scenarios_fuites(nb_menages: int = 10_000, horizon: int = 20) -> None:
+    """Afficher un tableau récapitulatif des scénarios de fuites."""
+    print("\n" + "=" * 75)
+    print(" " * 20 + "SCÉNARIOS DE COÛTS DE RÉPARATION")
+    print("=" * 75)
+
+    print(f"\nBase de calcul: {nb_menages:,} ménages, {horizon} ans")
+    print(f"Coût moyen réparation: 200 $")
+    print(f"Prévalence initiale: 20%, Nouvelles fuites: 5%/an")
+
+    print(f"\n{'Scénario':<18} │ {'Réparations':<12} │ {'Coût total':<12} │ "
+          f"{'Part ville':<12} │ {'$/m³ éco.':<10}")
+    print("─" * 18 + "─┼─" + "─" * 12 + "─┼─" + "─" * 12 + "─┼─" +
+          "─" * 12 + "─┼─" + "─" * 10)
+
+    for nom, params in SCENARIOS_FUITES.items():
+        res = calculer_dynamique_fuites(params, nb_menages, horizon)
+        print(f"{params.nom:<18} │ {res.total_reparations:>10,} │ "
+              f"{fmt_argent(res.cout_total):<12} │ "
+              f"{fmt_argent(res.cout_ville_total):<12} │ "
+              f"{res.cout_par_m3_economise:>8.2f} $")
+
+    print("=" * 75)
+
+
+# =============================================================================
+# RÉSULTATS SEGMENTÉS
+# =============================================================================
+
+def afficher_resultats_segmentes(resultats: dict) -> None:
+    """
+    Afficher un tableau récapitulatif des résultats segmentés.
+
+    Paramètres:
+        resultats: Dictionnaire retourné par executer_modele_segmente()
+    """
+    print("\n" + "=" * 90)
+    print(" " * 25 + "RÉSULTATS PAR SEGMENT RÉSIDENTIEL")
+    print("=" * 90)
+
+    print(f"\n{'Segment':<15} │ {'Ménages':<10} │ {'Compteurs':<10} │ {'LPCD':<6} │ {'VAN':<15} │ "
+          f"{'RBC':<6} │ {'Éco. m³/mén/an':<14}")
+    print("─" * 15 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 6 + "─┼─" +
+          "─" * 15 + "─┼─" + "─" * 6 + "─┼─" + "─" * 14)
+
+    for type_log, data in resultats['segments'].items():
+        segment = data['segment']
+        res = data['resultats']
+        print(f"{segment.nom:<15} │ {segment.nb_menages:>9,} │ {segment.nb_compteurs:>9,} │ "
+              f"{segment.lpcd:>5.0f} │ {fmt_argent(res.van):>14} │ {res.rbc:>5.2f} │ {res.economie_totale_menage:>12.1f}")
+
+    print("─" * 15 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" + "─" * 6 + "─┼─" +
+          "─" * 15 + "─┼─" + "─" * 6 + "─┼─" + "─" * 14)
+    print(f"{'TOTAL':<15} │ {resultats['total_menages']:>9,} │ {resultats['total_compteurs']:>9,} │ {'---':>5} │ "
+          f"{fmt_argent(resultats['van_totale']):>14} │ {resultats['rbc_agrege']:>5.2f} │ {'---':>12}")
+
+    print("=" * 90)
+
+    # Décomposition en %
+    print("\n  Contribution à la VAN totale:")
+    for type_log, data in resultats['segments'].items():
+        segment = data['segment']
+        res = data['resultats']
+        pct = res.van / resultats['van_totale'] * 100 if resultats['van_totale'] != 0 else 0
+        barre = "█" * int(pct / 2)
+        print(f"    {segment.nom:<15}: {pct:>5.1f}% {barre}")
+
+    print()
+
+
+def graphique_segmentation(resultats: dict, dossier: str = None) -> plt.Figure:
+    """
+    Créer un graphique comparatif des segments.
+
+    Paramètres:
+        resultats: Dictionnaire retourné par executer_modele_segmente()
+        dossier: Dossier de sauvegarde (optionnel)
+
+    Retourne:
+        Figure matplotlib
+    """
+    segments_noms = []
+    vans = []
+    rbcs = []
+    economies = []
+
+    for type_log, data in resultats['segments'].items():
+        segment = data['segment']
+        res = data['resultats']
+        segments_noms.append(segment.nom)
+        vans.append(res.van / 1e6)  # En millions
+        rbcs.append(res.rbc)
+        economies.append(res.economie_totale_menage)
+
+    fig, axes = plt.subplots(1, 3, figsize=(14, 5))
+
+    # VAN par segment
+    couleurs = ['#2E86AB', '#A23B72', '#F18F01']
+    axes[0].bar(segments_noms, vans, color=couleurs)
+    axes[0].set_title("VAN par segment")
+    axes[0].set_ylabel("VAN (M$)")
+    axes[0].axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+
+    # RBC par segment
+    axes[1].bar(segments_noms, rbcs, color=couleurs)
+    axes[1].set_title("Ratio Bénéfices-Coûts")
+    axes[1].set_ylabel("RBC")
+    axes[1].axhline(y=1, color='red', linestyle='--', linewidth=1, label='Seuil rentabilité')
+    axes[1].legend()
+
+    # Économies par ménage
+    axes[2].bar(segments_noms, economies, color=couleurs)
+    axes[2].set_title("Économies d'eau par ménage")
+    axes[2].set_ylabel("m³/ménage/an")
+
+    plt.tight_layout()
+
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "segmentation_residentielle.png")
+        fig.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Figure sauvegardée: {chemin}")
+
+    return fig
+
+
+# =============================================================================
+# COMPARAISON DES TYPES DE COMPTEURS
+# =============================================================================
+
+def comparer_types_compteurs(
+    params: ParametresModele,
+    compteur_base: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None
+) -> pd.DataFrame:
+    """
+    Comparer les 3 types de compteurs (AMI, AMR, Manuel).
+
+    Utilise les mêmes paramètres de modèle mais ajuste les coûts
+    selon le type de compteur. Les coûts unitaires sont stylisés:
+    ils dépendent aussi de la plomberie, densité urbaine, réseau,
+    intégration SI et cybersécurité.
+    Si config_echelle est None, compare sans et avec économies d'échelle.
+    """
+    if compteur_base is None:
+        compteur_base = ParametresCompteur()
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for type_c in TypeCompteur:
+            # Créer compteur avec le bon type
+            compteur = ParametresCompteur(
+                type_compteur=type_c,
+                cout_compteur=_cout_compteur_par_type(type_c),
+                heures_installation=compteur_base.heures_installation,
+                taux_horaire_installation=compteur_base.taux_horaire_installation,
+                cout_reseau_par_compteur=(50.0 if type_c == TypeCompteur.AMI else 0.0),
+                duree_vie_compteur=compteur_base.duree_vie_compteur,
+                duree_vie_batterie=compteur_base.duree_vie_batterie,
+                cout_opex_non_tech_ami=compteur_base.cout_opex_non_tech_ami,
+                ventilation_opex_ami=compteur_base.ventilation_opex_ami,
+            )
+
+            res = executer_modele(params, compteur, cfg_echelle)
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Type": type_c.value.upper(),
+                "Coût initial/compteur": res.cout_par_compteur_ajuste if cfg_echelle and cfg_echelle.activer else compteur.cout_initial_par_compteur,
+                "Investissement total": res.investissement_initial,
+                "Coût exploit./an": res.couts_exploitation_annuels,
+                "VAN": res.van,
+                "RBC": res.rbc,
+                "Récupération (ans)": res.periode_recuperation,
+                "LCSW ($/m³)": res.lcsw,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+def _cout_compteur_par_type(type_c: TypeCompteur) -> float:
+    """Coût typique du compteur selon le type."""
+    couts = {
+        TypeCompteur.AMI: 250.0,
+        TypeCompteur.AMR: 180.0,
+        TypeCompteur.MANUEL: 80.0,
+    }
+    return couts.get(type_c, 250.0)
+
+
+# =============================================================================
+# COMPARAISON DES SCÉNARIOS DE PERSISTANCE
+# =============================================================================
+
+def comparer_scenarios_persistance(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    scenarios: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Comparer les résultats du modèle selon différents scénarios de persistance.
+
+    Cette fonction permet d'évaluer l'impact de la persistance des effets
+    comportementaux sur la rentabilité du projet.
+    Si config_echelle est None, compare sans et avec économies d'échelle.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur (défaut: AMI standard)
+        config_echelle: Configuration économies d'échelle
+        scenarios: Dict {nom: ParametresPersistance} (défaut: 3 scénarios standard)
+
+    Retourne:
+        DataFrame avec les métriques pour chaque scénario
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if scenarios is None:
+        scenarios = SCENARIOS_PERSISTANCE
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for nom, persistance in scenarios.items():
+            res = executer_modele(params, compteur, cfg_echelle, persistance)
+
+            # Calculer économies moyennes sur l'horizon
+            # (déjà fait dans executer_modele mais on recalcule pour clarté)
+            economies = calculer_economies_eau(params, compteur=compteur)
+            traj, _, _, _ = generer_trajectoires(
+                params, compteur, economies, cfg_echelle, persistance
+            )
+            eco_moy = float(np.mean(traj.economies_par_menage))
+            eco_an1 = float(traj.economies_par_menage[0])
+            eco_an20 = float(traj.economies_par_menage[-1])
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Scénario": persistance.nom,
+                "Mode": persistance.mode.value,
+                # Économies d'eau
+                "Éco. an 1 (m³/mén)": eco_an1,
+                "Éco. an 20 (m³/mén)": eco_an20,
+                "Éco. moyenne (m³/mén)": eco_moy,
+                "Rétention (%)": (eco_an20 / eco_an1 * 100) if eco_an1 > 0 else 0,
+                # Métriques financières
+                "VAN": res.van,
+                "RBC": res.rbc,
+                "Récup. (ans)": res.periode_recuperation,
+                "LCSW ($/m³)": res.lcsw,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+def afficher_comparaison_persistance(
+    df: pd.DataFrame,
+    titre: str = "Impact de la persistance comportementale"
+) -> None:
+    """
+    Afficher un tableau formaté de comparaison des scénarios.
+
+    Paramètres:
+        df: DataFrame retourné par comparer_scenarios_persistance()
+        titre: Titre du tableau
+    """
+    has_echelle = "Échelle" in df.columns
+    largeur = 92 if has_echelle else 80
+    print("\n" + "=" * largeur)
+    print(f" {titre}".center(largeur))
+    print("=" * largeur)
+
+    if has_echelle:
+        print(f"\n{'Échelle':<14} │ {'Scénario':<12} │ {'Éco moy':<10} │ {'Rétention':<10} │ "
+              f"{'VAN':<12} │ {'RBC':<6} │ {'Récup.':<8}")
+        print("─" * 14 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" +
+              "─" * 12 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
+    else:
+        print(f"\n{'Scénario':<12} │ {'Éco moy':<10} │ {'Rétention':<10} │ "
+              f"{'VAN':<12} │ {'RBC':<6} │ {'Récup.':<8}")
+        print("─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 10 + "─┼─" +
+              "─" * 12 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
+
+    for _, row in df.iterrows():
+        scenario = row["Scénario"][:11]
+        eco_moy = f"{row['Éco. moyenne (m³/mén)']:.1f} m³"
+        retention = f"{row['Rétention (%)']:.0f}%"
+        van = fmt_argent(row["VAN"])
+        rbc = f"{row['RBC']:.2f}"
+        recup = f"{row['Récup. (ans)']:.1f} ans"
+
+        if has_echelle:
+            print(f"{row['Échelle']:<14} │ {scenario:<12} │ {eco_moy:<10} │ {retention:<10} │ "
+                  f"{van:<12} │ {rbc:<6} │ {recup:<8}")
+        else:
+            print(f"{scenario:<12} │ {eco_moy:<10} │ {retention:<10} │ "
+                  f"{van:<12} │ {rbc:<6} │ {recup:<8}")
+
+    print("=" * largeur)
+
+    # Calcul de l'écart optimiste-pessimiste
+    if len(df) >= 2:
+        van_max = df["VAN"].max()
+        van_min = df["VAN"].min()
+        ecart = van_max - van_min
+        ecart_pct = (ecart / van_max * 100) if van_max > 0 else 0
+        print(f"\nÉcart VAN (optimiste - pessimiste): {fmt_argent(ecart)} ({ecart_pct:.0f}%)")
+
+
+def graphique_persistance(
+    params: ParametresModele,
+    scenarios: Optional[dict] = None,
+    sauvegarder: bool = True,
+    afficher: bool = True,
+    dossier: str = "figures"
+) -> Optional[plt.Figure]:
+    """
+    Générer un graphique des courbes de persistance α_B(t).
+
+    Affiche l'évolution du coefficient de réduction comportementale
+    pour chaque scénario sur l'horizon d'analyse.
+
+    Paramètres:
+        params: Paramètres du modèle (pour l'horizon)
+        scenarios: Dict {nom: ParametresPersistance}
+        sauvegarder: Sauvegarder en PNG
+        afficher: Afficher le graphique
+        dossier: Dossier de sauvegarde
+
+    Retourne:
+        Figure matplotlib (ou None si erreur)
+    """
+    if scenarios is None:
+        scenarios = SCENARIOS_PERSISTANCE
+
+    T = params.horizon_analyse
+    annees = np.arange(1, T + 1)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Couleurs pour chaque scénario
+    couleurs = {
+        "optimiste": "#2ecc71",   # Vert
+        "realiste": "#3498db",    # Bleu
+        "pessimiste": "#e74c3c",  # Rouge
+    }
+
+    # === GRAPHIQUE 1: Courbes α_B(t) ===
+    for nom, persistance in scenarios.items():
+        serie_alpha = generer_serie_alpha(persistance, T) * 100  # En %
+        couleur = couleurs.get(nom, "#95a5a6")
+        ax1.plot(annees, serie_alpha, linewidth=2.5, label=persistance.nom,
+                 color=couleur, marker='o', markersize=3, markevery=2)
+
+    ax1.set_xlabel("Année", fontsize=11)
+    ax1.set_ylabel("Réduction comportementale α_B(t) (%)", fontsize=11)
+    ax1.set_title("Persistance des effets comportementaux", fontsize=12, fontweight='bold')
+    ax1.legend(loc='upper right', fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(1, T)
+    ax1.set_ylim(0, max(s.alpha_initial for s in scenarios.values()) * 100 * 1.1)
+
+    # === GRAPHIQUE 2: Économies cumulées ===
+    # Calculer les économies pour un ménage type (sans double-compte fuites)
+    economies_base = calculer_economies_eau(params)
+    usage_reductible = economies_base.usage_reductible
+    eco_fuite = economies_base.economie_fuite
+
+    for nom, persistance in scenarios.items():
+        serie_alpha = generer_serie_alpha(persistance, T)
+        eco_comportement = usage_reductible * serie_alpha
+        eco_totale = eco_fuite + eco_comportement
+        eco_cumul = np.cumsum(eco_totale)
+
+        couleur = couleurs.get(nom, "#95a5a6")
+        ax2.plot(annees, eco_cumul, linewidth=2.5, label=persistance.nom,
+                 color=couleur, linestyle='-')
+
+    ax2.set_xlabel("Année", fontsize=11)
+    ax2.set_ylabel("Économies cumulées (m³/ménage)", fontsize=11)
+    ax2.set_title("Économies d'eau cumulées par ménage", fontsize=12, fontweight='bold')
+    ax2.legend(loc='lower right', fontsize=10)
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xlim(1, T)
+
+    plt.tight_layout()
+
+    if sauvegarder:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "persistance_scenarios.png")
+        plt.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Graphique sauvegardé: {chemin}")
+
+    if afficher:
+        plt.show()
+
+    return fig
+
+
+def graphique_van_scenarios_persistance(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    scenarios: Optional[dict] = None,
+    sauvegarder: bool = True,
+    afficher: bool = True,
+    dossier: str = "figures",
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> Optional[plt.Figure]:
+    """
+    Générer un graphique comparant la VAN cumulative selon les scénarios.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config_echelle: Configuration économies d'échelle
+        scenarios: Dict des scénarios de persistance
+        sauvegarder: Sauvegarder en PNG
+        afficher: Afficher le graphique
+        dossier: Dossier de sauvegarde
+        mode_compte: Perspective d'analyse (économique/financier)
+        valeur_eau: Paramètres de valorisation (MCF si applicable)
+
+    Retourne:
+        Figure matplotlib
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if scenarios is None:
+        scenarios = SCENARIOS_PERSISTANCE
+
+    T = params.horizon_analyse
+    r = params.taux_actualisation_pct / 100.0
+    part_ville_capex = params.part_ville_capex_pct / 100.0
+    part_ville_opex = params.part_ville_opex_pct / 100.0
+    annees = np.arange(1, T + 1)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    couleurs = {
+        "optimiste": "#2ecc71",
+        "realiste": "#3498db",
+        "pessimiste": "#e74c3c",
+    }
+
+    resultats_van = {}
+
+    for nom, persistance in scenarios.items():
+        # Exécuter le modèle (v3.8: avec facteurs efficacité compteur)
+        economies = calculer_economies_eau(params, compteur=compteur)
+        traj, I0, _, _ = generer_trajectoires(
+            params, compteur, economies, config_echelle, persistance,
+            mode_compte=mode_compte, valeur_eau=valeur_eau
+        )
+        van_cum, _ = calculer_van_cumulative(
+            traj,
+            r,
+            I0,
+            mode_compte=mode_compte,
+            part_ville_capex=part_ville_capex,
+            part_ville_opex=part_ville_opex,
+            valeur_eau=valeur_eau,
+        )
+
+        couleur = couleurs.get(nom, "#95a5a6")
+        ax.plot(annees, van_cum / 1e6, linewidth=2.5, label=persistance.nom,
+                color=couleur)
+
+        resultats_van[nom] = van_cum[-1]
+
+    # Ligne de zéro
+    ax.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
+
+    ax.set_xlabel("Année", fontsize=11)
+    ax.set_ylabel("VAN cumulative (M$)", fontsize=11)
+    ax.set_title("VAN cumulative selon le scénario de persistance", fontsize=12, fontweight='bold')
+    ax.legend(loc='lower right', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(1, T)
+
+    plt.tight_layout()
+
+    if sauvegarder:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "van_scenarios_persistance.png")
+        plt.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Graphique sauvegardé: {chemin}")
+
+    if afficher:
+        plt.show()
+
+    return fig
+
+
+# =============================================================================
+# COMPARAISON DES SCÉNARIOS DE FUITES
+# =============================================================================
+
+def comparer_scenarios_fuites(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    scenarios_fuites: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Comparer les résultats du modèle selon différents scénarios de fuites.
+
+    Cette fonction permet d'évaluer l'impact des coûts de réparation et
+    du partage des coûts ville/ménages sur la rentabilité du projet.
+    Si config_echelle est None, compare sans et avec économies d'échelle.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur (défaut: AMI standard)
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance (défaut: réaliste)
+        scenarios_fuites: Dict {nom: ParametresFuites} (défaut: 4 scénarios standard)
+
+    Retourne:
+        DataFrame avec les métriques pour chaque scénario
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if scenarios_fuites is None:
+        scenarios_fuites = SCENARIOS_FUITES
+
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for nom, params_fuites in scenarios_fuites.items():
+            # Exécuter le modèle avec ce scénario de fuites
+            res = executer_modele(params, compteur, cfg_echelle, persistance, params_fuites)
+
+            # Calculer les coûts de réparation pour ce scénario (v3.8: avec facteur efficacité)
+            res_fuites = calculer_dynamique_fuites(
+                params_fuites, params.nb_menages, params.horizon_analyse,
+                facteur_efficacite_detection=compteur.facteur_efficacite_fuites
+            )
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Scénario": params_fuites.nom,
+                "Mode": params_fuites.mode_repartition.value,
+                "Part ville (%)": params_fuites.part_ville_pct,
+                # Métriques réparations
+                "Réparations": res_fuites.total_reparations,
+                "Coût total ($)": res_fuites.cout_total,
+                "Coût ville ($)": res_fuites.cout_ville_total,
+                "Coût ménages ($)": res_fuites.cout_menages_total,
+                # Métriques financières
+                "VAN": res.van,
+                "RBC": res.rbc,
+                "Récup. (ans)": res.periode_recuperation,
+                "LCSW ($/m³)": res.lcsw,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+def afficher_comparaison_fuites(
+    df: pd.DataFrame,
+    titre: str = "Impact des coûts de réparation des fuites"
+) -> None:
+    """
+    Afficher un tableau formaté de comparaison des scénarios de fuites.
+
+    Paramètres:
+        df: DataFrame retourné par comparer_scenarios_fuites()
+        titre: Titre du tableau
+    """
+    has_echelle = "Échelle" in df.columns
+    largeur = 104 if has_echelle else 90
+    print("\n" + "=" * largeur)
+    print(f" {titre}".center(largeur))
+    print("=" * largeur)
+
+    if has_echelle:
+        print(f"\n{'Échelle':<14} │ {'Scénario':<16} │ {'Part ville':<10} │ {'Coût total':<12} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8}")
+        print("─" * 14 + "─┼─" + "─" * 16 + "─┼─" + "─" * 10 + "─┼─" + "─" * 12 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
+    else:
+        print(f"\n{'Scénario':<16} │ {'Part ville':<10} │ {'Coût total':<12} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8}")
+        print("─" * 16 + "─┼─" + "─" * 10 + "─┼─" + "─" * 12 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8)
+
+    for _, row in df.iterrows():
+        scenario = row["Scénario"][:15]
+        part_ville = f"{row['Part ville (%)']:.0f}%"
+        cout_total = fmt_argent(row["Coût total ($)"])
+        van = fmt_argent(row["VAN"])
+        rbc = f"{row['RBC']:.2f}"
+        recup = f"{row['Récup. (ans)']:.1f} ans" if np.isfinite(row['Récup. (ans)']) else "N/A"
+
+        if has_echelle:
+            print(f"{row['Échelle']:<14} │ {scenario:<16} │ {part_ville:<10} │ {cout_total:<12} │ "
+                  f"{van:<14} │ {rbc:<6} │ {recup:<8}")
+        else:
+            print(f"{scenario:<16} │ {part_ville:<10} │ {cout_total:<12} │ "
+                  f"{van:<14} │ {rbc:<6} │ {recup:<8}")
+
+    print("=" * largeur)
+
+    # Analyse de l'impact des coûts de réparation
+    if len(df) >= 2:
+        df_interpret = df
+        if has_echelle:
+            df_base = df[df["Échelle"] == "Sans échelle"]
+            if not df_base.empty:
+                df_interpret = df_base
+        van_sans_cout = df_interpret[df_interpret["Mode"] == "gratuit"]["VAN"].values
+        van_menage = df_interpret[df_interpret["Mode"] == "menage"]["VAN"].values
+        if len(van_sans_cout) > 0 and len(van_menage) > 0:
+            impact = van_sans_cout[0] - van_menage[0]
+            impact_pct = (impact / van_sans_cout[0] * 100) if van_sans_cout[0] > 0 else 0
+            print(f"\nImpact des coûts de réparation sur VAN: -{fmt_argent(impact)} ({impact_pct:.1f}%)")
+
+
+def graphique_scenarios_fuites(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    scenarios_fuites: Optional[dict] = None,
+    sauvegarder: bool = True,
+    afficher: bool = True,
+    dossier: str = "figures",
+    mode_compte: ModeCompte = ModeCompte.ECONOMIQUE,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> Optional[plt.Figure]:
+    """
+    Générer un graphique comparant la VAN selon les scénarios de fuites.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance
+        scenarios_fuites: Dict des scénarios de fuites
+        sauvegarder: Sauvegarder en PNG
+        afficher: Afficher le graphique
+        dossier: Dossier de sauvegarde
+        mode_compte: Perspective d'analyse (économique/financier)
+        valeur_eau: Paramètres de valorisation (MCF si applicable)
+
+    Retourne:
+        Figure matplotlib
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if scenarios_fuites is None:
+        scenarios_fuites = SCENARIOS_FUITES
+
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+
+    T = params.horizon_analyse
+    r = params.taux_actualisation_pct / 100.0
+    part_ville_capex = params.part_ville_capex_pct / 100.0
+    part_ville_opex = params.part_ville_opex_pct / 100.0
+    annees = np.arange(1, T + 1)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Couleurs pour chaque scénario
+    couleurs = {
+        "sans_cout": "#2ecc71",     # Vert (référence)
+        "menage": "#e74c3c",        # Rouge (coûts élevés pour ménages)
+        "subvention_50": "#f39c12", # Orange (partage)
+        "ville": "#3498db",         # Bleu (ville absorbe)
+    }
+
+    # === GRAPHIQUE 1: VAN cumulative ===
+    for nom, params_fuites in scenarios_fuites.items():
+        economies = calculer_economies_eau(params, params_fuites, compteur)
+        traj, I0, _, _ = generer_trajectoires(
+            params, compteur, economies, config_echelle, persistance, params_fuites,
+            mode_compte=mode_compte, valeur_eau=valeur_eau
+        )
+        inclure_repar = params_fuites.inclure_cout_reparation
+        van_cum, _ = calculer_van_cumulative(
+            traj,
+            r,
+            I0,
+            inclure_reparations=inclure_repar,
+            mode_compte=mode_compte,
+            part_ville_capex=part_ville_capex,
+            part_ville_opex=part_ville_opex,
+            valeur_eau=valeur_eau,
+        )
+
+        couleur = couleurs.get(nom, "#95a5a6")
+        ax1.plot(annees, van_cum / 1e6, linewidth=2.5, label=params_fuites.nom,
+                 color=couleur)
+
+    ax1.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
+    ax1.set_xlabel("Année", fontsize=11)
+    ax1.set_ylabel("VAN cumulative (M$)", fontsize=11)
+    ax1.set_title("VAN selon le partage des coûts de réparation", fontsize=12, fontweight='bold')
+    ax1.legend(loc='lower right', fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(1, T)
+
+    # === GRAPHIQUE 2: Répartition des coûts (barres empilées) ===
+    scenarios_labels = []
+    couts_ville = []
+    couts_menages = []
+
+    for nom, params_fuites in scenarios_fuites.items():
+        # v3.8: Appliquer le facteur d'efficacité du compteur
+        res_fuites = calculer_dynamique_fuites(
+            params_fuites, params.nb_menages, T,
+            facteur_efficacite_detection=compteur.facteur_efficacite_fuites
+        )
+        scenarios_labels.append(params_fuites.nom)
+        couts_ville.append(res_fuites.cout_ville_total / 1e6)
+        couts_menages.append(res_fuites.cout_menages_total / 1e6)
+
+    x = np.arange(len(scenarios_labels))
+    width = 0.6
+
+    ax2.bar(x, couts_ville, width, label='Ville', color='#3498db', alpha=0.8)
+    ax2.bar(x, couts_menages, width, bottom=couts_ville, label='Ménages', color='#e74c3c', alpha=0.8)
+
+    ax2.set_xlabel("Scénario", fontsize=11)
+    ax2.set_ylabel("Coûts de réparation (M$)", fontsize=11)
+    ax2.set_title("Répartition des coûts de réparation", fontsize=12, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(scenarios_labels, rotation=15, ha='right')
+    ax2.legend(loc='upper right', fontsize=10)
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    plt.tight_layout()
+
+    if sauvegarder:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "scenarios_fuites.png")
+        plt.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Graphique sauvegardé: {chemin}")
+
+    if afficher:
+        plt.show()
+
+    return fig
+
+
+# =============================================================================
+# COMPARAISON DES PERSPECTIVES ÉCONOMIQUE VS FINANCIER
+# =============================================================================
+
+def comparer_perspectives(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> pd.DataFrame:
+    """
+    Comparer les résultats du modèle selon les deux perspectives d'analyse.
+
+    Cette fonction fondamentale permet de distinguer:
+    - ECONOMIQUE: Le projet améliore-t-il le bien-être social collectif?
+    - FINANCIER: Le projet est-il viable pour le budget municipal?
+
+    Différences clés:
+    - Valeur de l'eau: sociale (4.69$) vs coût variable (0.50$)
+    - Coûts réparation: total vs part ville
+    - MCF: applicable en économique (si activé) vs non applicable en financier
+    Si config_echelle est None, compare sans et avec économies d'échelle.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur (défaut: AMI standard)
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance (défaut: réaliste)
+        params_fuites: Configuration des fuites (défaut: ménage seul)
+        params_fuites_reseau: Configuration des pertes réseau (optionnel)
+        valeur_eau: Paramètres de valorisation (défaut: Québec standard)
+
+    Retourne:
+        DataFrame avec les métriques pour chaque perspective
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
+            res = executer_modele(
+                params, compteur, cfg_echelle, persistance, params_fuites,
+                params_fuites_reseau,
+                mode_compte=mode, valeur_eau=valeur_eau
+            )
+
+            # Déterminer la valeur de l'eau utilisée
+            val_eau = valeur_eau.valeur_sociale_m3 if mode == ModeCompte.ECONOMIQUE else valeur_eau.cout_variable_m3
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Perspective": "Économique" if mode == ModeCompte.ECONOMIQUE else "Financier",
+                "Mode": mode.value,
+                # Valorisation
+                "Valeur eau ($/m³)": val_eau,
+                "Tarification volumétrique": "Non",
+                # Métriques financières
+                "VA Bénéfices ($)": res.va_benefices,
+                "VA Coûts ($)": res.va_couts_totaux,
+                "VAN ($)": res.van,
+                "RBC": res.rbc,
+                "Récup. (ans)": res.periode_recuperation,
+                "LCSW ($/m³)": res.lcsw,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+def afficher_comparaison_perspectives(
+    df: pd.DataFrame,
+    titre: str = "Analyse Économique vs Financière"
+) -> None:
+    """
+    Afficher un tableau formaté comparant les deux perspectives.
+
+    Paramètres:
+        df: DataFrame retourné par comparer_perspectives()
+        titre: Titre du tableau
+    """
+    has_echelle = "Échelle" in df.columns
+    largeur = 111 if has_echelle else 95
+    print("\n" + "=" * largeur)
+    print(f" {titre}".center(largeur))
+    print("=" * largeur)
+
+    if has_echelle:
+        print(f"\n{'Échelle':<14} │ {'Perspective':<12} │ {'Val. eau':<10} │ {'Tarif.':<8} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8} │ {'LCSW':<10}")
+        print("─" * 14 + "─┼─" + "─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 8 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8 + "─┼─" + "─" * 10)
+    else:
+        print(f"\n{'Perspective':<12} │ {'Val. eau':<10} │ {'Tarif.':<8} │ "
+              f"{'VAN':<14} │ {'RBC':<6} │ {'Récup.':<8} │ {'LCSW':<10}")
+        print("─" * 12 + "─┼─" + "─" * 10 + "─┼─" + "─" * 8 + "─┼─" +
+              "─" * 14 + "─┼─" + "─" * 6 + "─┼─" + "─" * 8 + "─┼─" + "─" * 10)
+
+    for _, row in df.iterrows():
+        perspective = row["Perspective"]
+        val_eau = f"{row['Valeur eau ($/m³)']:.2f} $"
+        tarif = row["Tarification volumétrique"]
+        van = fmt_argent(row["VAN ($)"])
+        rbc = f"{row['RBC']:.2f}"
+        recup = f"{row['Récup. (ans)']:.1f} ans" if np.isfinite(row['Récup. (ans)']) else "N/A"
+        lcsw = f"{row['LCSW ($/m³)']:.2f} $"
+
+        if has_echelle:
+            print(f"{row['Échelle']:<14} │ {perspective:<12} │ {val_eau:<10} │ {tarif:<8} │ "
+                  f"{van:<14} │ {rbc:<6} │ {recup:<8} │ {lcsw:<10}")
+        else:
+            print(f"{perspective:<12} │ {val_eau:<10} │ {tarif:<8} │ "
+                  f"{van:<14} │ {rbc:<6} │ {recup:<8} │ {lcsw:<10}")
+
+    print("=" * largeur)
+
+    # Interprétation
+    df_interpret = df
+    if has_echelle:
+        df_base = df[df["Échelle"] == "Sans échelle"]
+        if not df_base.empty:
+            df_interpret = df_base
+    eco_row = df_interpret[df_interpret["Mode"] == "economique"].iloc[0]
+    fin_row = df_interpret[df_interpret["Mode"] == "financier"].iloc[0]
+
+    van_eco = eco_row["VAN ($)"]
+    van_fin = fin_row["VAN ($)"]
+
+    print("\n" + "─" * largeur)
+    print("INTERPRÉTATION:")
+    print("─" * largeur)
+
+    if van_eco > 0 and van_fin > 0:
+        print("✓ Projet DOUBLEMENT VIABLE: rentable socialement ET financièrement")
+        print("  → Recommandation: Projet à réaliser sans subvention nécessaire")
+    elif van_eco > 0 and van_fin <= 0:
+        print("! Projet SOCIALEMENT RENTABLE mais FINANCIÈREMENT DÉFICITAIRE")
+        subvention = abs(van_fin)
+        print(f"  → Le projet génère du bien-être social mais nécessite une subvention")
+        print(f"  → Subvention justifiable: jusqu'à {fmt_argent(subvention)}")
+    elif van_eco <= 0 and van_fin > 0:
+        print("? Situation INHABITUELLE: rentable financièrement mais pas socialement")
+        print("  → Vérifier les hypothèses de valorisation de l'eau")
+    else:
+        print("✗ Projet NON RENTABLE: ni socialement ni financièrement")
+        print("  → Recommandation: Ne pas réaliser ou réviser les paramètres")
+
+    ecart = van_eco - van_fin
+    print(f"\nÉcart VAN (économique - financier): {fmt_argent(ecart)}")
+    print("Cet écart reflète: la valeur sociale non capturée par le marché")
+    print("=" * largeur)
+
+
+def graphique_perspectives(
+    params: ParametresModele,
+    compteur: Optional[ParametresCompteur] = None,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    params_fuites_reseau: Optional[ParametresFuitesReseau] = None,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+    sauvegarder: bool = True,
+    afficher: bool = True,
+    dossier: str = "figures"
+) -> Optional[plt.Figure]:
+    """
+    Générer un graphique comparant les VAN économique et financière.
+
+    Paramètres:
+        params: Paramètres du modèle
+        compteur: Paramètres du compteur
+        config_echelle: Configuration économies d'échelle
+        persistance: Configuration de persistance
+        params_fuites: Configuration des fuites
+        params_fuites_reseau: Configuration des pertes réseau
+        valeur_eau: Paramètres de valorisation
+        sauvegarder: Sauvegarder en PNG
+        afficher: Afficher le graphique
+        dossier: Dossier de sauvegarde
+
+    Retourne:
+        Figure matplotlib
+    """
+    if compteur is None:
+        compteur = ParametresCompteur()
+
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+
+    T = params.horizon_analyse
+    r = params.taux_actualisation_pct / 100.0
+    annees = np.arange(1, T + 1)
+
+    # Parts ville (pour mode financier)
+    part_ville_capex = params.part_ville_capex_pct / 100.0
+    part_ville_opex = params.part_ville_opex_pct / 100.0
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Couleurs
+    couleur_eco = "#2ecc71"   # Vert
+    couleur_fin = "#3498db"   # Bleu
+
+    # === GRAPHIQUE 1: VAN cumulative ===
+    for mode, couleur, label in [
+        (ModeCompte.ECONOMIQUE, couleur_eco, "Économique (bien-être social)"),
+        (ModeCompte.FINANCIER, couleur_fin, "Financier (budget municipal)")
+    ]:
+        economies = calculer_economies_eau(params, params_fuites, compteur)
+        traj, I0, _, _ = generer_trajectoires(
+            params, compteur, economies, config_echelle, persistance, params_fuites,
+            params_fuites_reseau,
+            mode_compte=mode, valeur_eau=valeur_eau
+        )
+        inclure_repar = params_fuites is not None and params_fuites.inclure_cout_reparation
+        van_cum, _ = calculer_van_cumulative(
+            traj,
+            r,
+            I0,
+            inclure_reparations=inclure_repar,
+            mode_compte=mode,
+            part_ville_capex=part_ville_capex,
+            part_ville_opex=part_ville_opex,
+            valeur_eau=valeur_eau,
+        )
+
+        ax1.plot(annees, van_cum / 1e6, linewidth=2.5, label=label, color=couleur)
+
+    ax1.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
+    ax1.set_xlabel("Année", fontsize=11)
+    ax1.set_ylabel("VAN cumulative (M$)", fontsize=11)
+    ax1.set_title("VAN cumulative: Économique vs Financier", fontsize=12, fontweight='bold')
+    ax1.legend(loc='lower right', fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(1, T)
+
+    # === GRAPHIQUE 2: Décomposition des bénéfices ===
+    # Barres groupées pour comparer les composantes
+    categories = ["Eau\néconomisée", "Report\ninfra"]
+    x = np.arange(len(categories))
+    width = 0.35
+
+    # Calculer les valeurs pour chaque mode
+    benefices_eco = []
+    benefices_fin = []
+
+    for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
+        economies = calculer_economies_eau(params, params_fuites, compteur)
+        traj, _, _, _ = generer_trajectoires(
+            params, compteur, economies, config_echelle, persistance, params_fuites,
+            mode_compte=mode, valeur_eau=valeur_eau
+        )
+        facteurs_actu = np.array([1.0 / (1.0 + r) ** t for t in traj.annees])
+
+        va_eau = float(np.sum(traj.benefices_eau * facteurs_actu)) / 1e6
+        va_infra = float(np.sum(traj.benefices_infra * facteurs_actu)) / 1e6
+
+        if mode == ModeCompte.ECONOMIQUE:
+            benefices_eco = [va_eau, va_infra]
+        else:
+            benefices_fin = [va_eau, va_infra]
+
+    ax2.bar(x - width/2, benefices_eco, width, label='Économique', color=couleur_eco, alpha=0.8)
+    ax2.bar(x + width/2, benefices_fin, width, label='Financier', color=couleur_fin, alpha=0.8)
+
+    ax2.set_xlabel("Composante", fontsize=11)
+    ax2.set_ylabel("Valeur actuelle (M$)", fontsize=11)
+    ax2.set_title("Décomposition des bénéfices actualisés", fontsize=12, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(categories)
+    ax2.legend(loc='upper right', fontsize=10)
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    plt.tight_layout()
+
+    if sauvegarder:
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, "perspectives_economique_financier.png")
+        plt.savefig(chemin, dpi=150, bbox_inches='tight')
+        print(f"Graphique sauvegardé: {chemin}")
+
+    if afficher:
+        plt.show()
+
+    return fig
+
+
+# =============================================================================
+# ANALYSES DE SENSIBILITÉ
+# =============================================================================
+
+SPECS_SENSIBILITE = [
+    {"cle": "nb_menages",              "label": "Nb ménages",                "type": "int",   "min": 1},
+    {"cle": "lpcd",                    "label": "LPCD",                      "type": "float", "min": 0.0},
+    {"cle": "taille_menage",           "label": "Taille ménage",             "type": "float", "min": 0.1},
+    {"cle": "part_menages_fuite_pct",  "label": "Ménages avec fuite (%)",    "type": "float", "min": 0.0, "max": 100.0},
+    {"cle": "debit_fuite_m3_an",       "label": "Débit fuite (m³/an)",       "type": "float", "min": 0.0},
+    {"cle": "taux_correction_fuite_pct","label": "Fuites corrigées (%)",     "type": "float", "min": 0.0, "max": 100.0},
+    {"cle": "reduction_comportement_pct","label": "Réduction comport. (%)",  "type": "float", "min": 0.0, "max": 100.0},
+    {"cle": "valeur_eau_m3",           "label": "Valeur eau ($/m³)",         "type": "float", "min": 0.0},
+    {"cle": "taux_actualisation_pct",  "label": "Taux actualisation (%)",    "type": "float", "min": 0.0, "max": 100.0},
+    {"cle": "horizon_analyse",         "label": "Horizon (ans)",             "type": "int",   "min": 1},
+]
+
+SPECS_COMPTEUR = [
+    {"cle": "cout_compteur",           "label": "Coût compteur ($)",         "type": "float", "min": 0.0},
+    {"cle": "heures_installation",     "label": "Heures installation",       "type": "float", "min": 0.0},
+    {"cle": "taux_horaire_installation","label": "Taux horaire ($/h)",       "type": "float", "min": 0.0},
+    {"cle": "cout_reseau_par_compteur","label": "Coût réseau/compteur ($)",  "type": "float", "min": 0.0},
+    {"cle": "cout_opex_non_tech_ami",  "label": "OPEX AMI non-tech ($/an)",   "type": "float", "min": 0.0},
+]
+
+
+def _appliquer_facteur(d: dict, spec: dict, facteur: float) -> dict:
+    """Appliquer facteur multiplicatif à un paramètre."""
+    q = d.copy()
+    val = float(q[spec["cle"]])
+    nouv = val * facteur
+
+    if "min" in spec and nouv < spec["min"]:
+        nouv = spec["min"]
+    if "max" in spec and nouv > spec["max"]:
+        nouv = spec["max"]
+
+    if spec["type"] == "int":
+        nouv = max(1, int(round(nouv)))
+
+    q[spec["cle"]] = nouv
+    return q
+
+
+def sensibilite_univariee(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    delta_pct: float = 10.0
+) -> pd.DataFrame:
+    """
+    Analyse de sensibilité univariée sur la VAN.
+
+    Varie chaque paramètre de ±delta_pct% et mesure l'impact sur la VAN.
+    """
+    p_dict = _cloner_params(params)
+    c_dict = _cloner_compteur(compteur)
+
+    base_van = executer_modele(params, compteur).van
+
+    lignes = []
+    f_moins = 1.0 - delta_pct / 100.0
+    f_plus = 1.0 + delta_pct / 100.0
+
+    # Paramètres du modèle
+    for spec in SPECS_SENSIBILITE:
+        p_moins = _appliquer_facteur(p_dict, spec, f_moins)
+        p_plus = _appliquer_facteur(p_dict, spec, f_plus)
+
+        van_m = executer_modele(
+            ParametresModele(**p_moins), compteur
+        ).van
+        van_p = executer_modele(
+            ParametresModele(**p_plus), compteur
+        ).van
+
+        d_moins = van_m - base_van
+        d_plus = van_p - base_van
+
+        lignes.append({
+            "Paramètre": spec["label"],
+            "ΔVAN(-%)": d_moins,
+            "ΔVAN(+%)": d_plus,
+            "Amplitude": abs(d_plus - d_moins),
+            "_ordre": max(abs(d_moins), abs(d_plus))
+        })
+
+    # Paramètres du compteur
+    for spec in SPECS_COMPTEUR:
+        c_moins = _appliquer_facteur(c_dict, spec, f_moins)
+        c_plus = _appliquer_facteur(c_dict, spec, f_plus)
+
+        van_m = executer_modele(
+            params,
+            ParametresCompteur(**c_moins)
+        ).van
+        van_p = executer_modele(
+            params,
+            ParametresCompteur(**c_plus)
+        ).van
+
+        d_moins = van_m - base_van
+        d_plus = van_p - base_van
+
+        lignes.append({
+            "Paramètre": spec["label"],
+            "ΔVAN(-%)": d_moins,
+            "ΔVAN(+%)": d_plus,
+            "Amplitude": abs(d_plus - d_moins),
+            "_ordre": max(abs(d_moins), abs(d_plus))
+        })
+
+    df = pd.DataFrame(lignes).sort_values("_ordre", ascending=False)
+    return df.drop(columns=["_ordre"])
+
+
+def table_elasticite(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    delta_pct: float = 1.0
+) -> pd.DataFrame:
+    """
+    Calcul des élasticités: % variation VAN / % variation paramètre.
+    """
+    p_dict = _cloner_params(params)
+    c_dict = _cloner_compteur(compteur)
+
+    base_van = executer_modele(params, compteur).van
+    d = delta_pct / 100.0
+
+    lignes = []
+
+    for spec in SPECS_SENSIBILITE + SPECS_COMPTEUR:
+        cle = spec["cle"]
+
+        if cle in p_dict:
+            source = p_dict
+            est_compteur = False
+        else:
+            source = c_dict
+            est_compteur = True
+
+        p0 = float(source[cle])
+
+        if abs(base_van) < 1e-6 or p0 == 0.0:
+            eps = np.nan
+        else:
+            s_moins = _appliquer_facteur(source, spec, 1 - d)
+            s_plus = _appliquer_facteur(source, spec, 1 + d)
+
+            if est_compteur:
+                van_m = executer_modele(params, ParametresCompteur(**s_moins)).van
+                van_p = executer_modele(params, ParametresCompteur(**s_plus)).van
+            else:
+                van_m = executer_modele(ParametresModele(**s_moins), compteur).van
+                van_p = executer_modele(ParametresModele(**s_plus), compteur).van
+
+            eps = (van_p - van_m) / (2.0 * d * base_van)
+
+        lignes.append({
+            "Paramètre": spec["label"],
+            "Élasticité (ε)": eps,
+            "_abs": abs(eps) if np.isfinite(eps) else 0
+        })
+
+    df = pd.DataFrame(lignes).sort_values("_abs", ascending=False)
+    return df.drop(columns=["_abs"])
+
+
+def analyse_scenarios(
+    params: ParametresModele,
+    compteur: ParametresCompteur,
+    config_echelle: Optional[ConfigEconomiesEchelle] = None,
+    params_fuites: Optional[ParametresFuites] = None,
+    persistance: Optional[ParametresPersistance] = None,
+    valeur_eau: Optional[ParametresValeurEau] = None,
+) -> pd.DataFrame:
+    """
+    Comparer scénarios pessimiste, base et optimiste.
+
+    CORRECTION v3.9: Varie les vrais paramètres du modèle:
+    - Coûts compteur: cout_compteur, cout_installation (±20-30%)
+    - Comportement: alpha_0 (±40%)
+    - Fuites: part_menages_fuite_pct, taux_detection_pct, taux_reparation_pct
+    - Valeur eau: valeur_sociale_m3 (±25%)
+
+    Si config_echelle est None, compare sans et avec économies d'échelle.
+
+    Paramètres:
+        params: Paramètres du modèle de base
+        compteur: Paramètres du compteur de base
+        config_echelle: Configuration économies d'échelle (optionnel)
+        params_fuites: Paramètres fuites de base (défaut: FUITES_CONTEXTE_QUEBEC)
+        persistance: Paramètres persistance (défaut: PERSISTANCE_REALISTE)
+        valeur_eau: Paramètres valeur eau (défaut: VALEUR_EAU_QUEBEC)
+
+    Retourne:
+        DataFrame avec VAN, RBC, récupération, LCSW pour chaque scénario
+    """
+    # Valeurs par défaut
+    if params_fuites is None:
+        params_fuites = FUITES_CONTEXTE_QUEBEC
+    if persistance is None:
+        persistance = PERSISTANCE_REALISTE
+    if valeur_eau is None:
+        valeur_eau = VALEUR_EAU_QUEBEC
+
+    # Définition des scénarios avec multiplicateurs sur les vrais paramètres
+    # Format: {param: (valeur_pessimiste, valeur_base, valeur_optimiste)}
+    scenarios_def = {
+        'Pessimiste': {
+            # Coûts +30%
+            'mult_cout_compteur': 1.30,
+            'mult_cout_installation': 1.30,
+            # Comportement -40% (alpha_0 plus bas)
+            'mult_alpha_0': 0.60,
+            # Fuites: moins de fuites détectées/réparées
+            'mult_part_menages_fuite': 0.80,      # Moins de fuites à corriger
+            'mult_taux_detection': 0.85,          # Détection moins efficace
+            'mult_taux_reparation': 0.85,         # Réparation moins fréquente
+            # Valeur eau -25%
+            'mult_valeur_sociale': 0.75,
+        },
+        'Base': {
+            'mult_cout_compteur': 1.00,
+            'mult_cout_installation': 1.00,
+            'mult_alpha_0': 1.00,
+            'mult_part_menages_fuite': 1.00,
+            'mult_taux_detection': 1.00,
+            'mult_taux_reparation': 1.00,
+            'mult_valeur_sociale': 1.00,
+        },
+        'Optimiste': {
+            # Coûts -20%
+            'mult_cout_compteur': 0.80,
+            'mult_cout_installation': 0.80,
+            # Comportement +40% (alpha_0 plus élevé)
+            'mult_alpha_0': 1.40,
+            # Fuites: plus de fuites détectées/réparées
+            'mult_part_menages_fuite': 1.20,      # Plus de fuites à corriger
+            'mult_taux_detection': 1.10,          # Détection plus efficace (plafonné à 100%)
+            'mult_taux_reparation': 1.10,         # Réparation plus fréquente (plafonné à 100%)
+            # Valeur eau +25%
+            'mult_valeur_sociale': 1.25,
+        }
+    }
+
+    resultats = []
+
+    for label_echelle, cfg_echelle in _configs_echelle_comparaison(config_echelle):
+        for nom_scenario, mults in scenarios_def.items():
+            # Cloner et modifier les paramètres du modèle
+            p_dict = _cloner_params(params)
+            p_dict['reduction_comportement_pct'] = params.reduction_comportement_pct * mults['mult_alpha_0']
+            params_scen = ParametresModele(**p_dict)
+
+            # Cloner et modifier les paramètres du compteur
+            c_dict = _cloner_compteur(compteur)
+            c_dict['cout_compteur'] = compteur.cout_compteur * mults['mult_cout_compteur']
+            c_dict['heures_installation'] = compteur.heures_installation * mults['mult_cout_installation']
+            compteur_scen = ParametresCompteur(**c_dict)
+
+            # Créer les paramètres de fuites modifiés
+            fuites_scen = ParametresFuites(
+                part_menages_fuite_pct=min(100.0, params_fuites.part_menages_fuite_pct * mults['mult_part_menages_fuite']),
+                debit_fuite_m3_an=params_fuites.debit_fuite_m3_an,
+                taux_detection_pct=min(100.0, params_fuites.taux_detection_pct * mults['mult_taux_detection']),
+                taux_reparation_pct=min(100.0, params_fuites.taux_reparation_pct * mults['mult_taux_reparation']),
+                cout_reparation_moyen=params_fuites.cout_reparation_moyen,
+                mode_repartition=params_fuites.mode_repartition,
+                part_ville_pct=params_fuites.part_ville_pct,
+                taux_nouvelles_fuites_pct=params_fuites.taux_nouvelles_fuites_pct,
+                inclure_cout_reparation=params_fuites.inclure_cout_reparation,
+                nom=f"{params_fuites.nom} ({nom_scenario})",
+            )
+
+            # Créer les paramètres de valeur eau modifiés
+            # Note: cout_capex_m3 et cout_opex_fixe_m3 sont les vrais champs
+            # (cout_infrastructure_m3 et valeur_externalites_m3 sont des alias en lecture seule)
+            valeur_scen = ParametresValeurEau(
+                cout_variable_m3=valeur_eau.cout_variable_m3 * mults['mult_valeur_sociale'],
+                cout_capex_m3=valeur_eau.cout_capex_m3 * mults['mult_valeur_sociale'],
+                cout_opex_fixe_m3=valeur_eau.cout_opex_fixe_m3 * mults['mult_valeur_sociale'],
+                valeur_sociale_m3=valeur_eau.valeur_sociale_m3 * mults['mult_valeur_sociale'],
+                prix_vente_m3=valeur_eau.prix_vente_m3,
+                mcf=valeur_eau.mcf,
+                appliquer_mcf=valeur_eau.appliquer_mcf,
+                nom=f"{valeur_eau.nom} ({nom_scenario})",
+            )
+
+            # Exécuter le modèle avec tous les paramètres
+            res = executer_modele(
+                params_scen,
+                compteur_scen,
+                cfg_echelle,
+                persistance=persistance,
+                params_fuites=fuites_scen,
+                valeur_eau=valeur_scen,
+            )
+
+            resultats.append({
+                "Échelle": label_echelle,
+                "Scénario": nom_scenario,
+                "VAN": res.van,
+                "RBC": res.rbc,
+                "Récupération (ans)": res.periode_recuperation,
+                "LCSW ($/m³)": res.lcsw,
+                # Détails pour transparence
+                "α₀ (%)": params_scen.reduction_comportement_pct,
+                "Coût/compteur ($)": compteur_scen.cout_compteur,
+                "Valeur eau ($/m³)": valeur_scen.valeur_sociale_m3,
+            })
+
+    return pd.DataFrame(resultats)
+
+
+# =============================================================================
+# VISUALISATIONS
+# =============================================================================
+
+def graphique_cascade(res: ResultatsModele, ax: Optional[plt.Axes] = None) -> plt.Figure:
+    """
+    Graphique en cascade montrant la décomposition de la VAN.
+    """
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(14, 7))
+    else:
+        fig = ax.figure
+
+    # Composantes
+    composantes = [
+        "Investissement\ninitial",
+        "Bénéfices eau\n(VA)",
+        "Exploitation\n(VA)",
+        "VAN\nfinale"
+    ]
+
+    valeurs = [
+        -res.investissement_initial,
+        res.va_benefices,
+        -res.va_couts_exploitation,
+        res.van
+    ]
+
+    couleurs = ["#d62728", "#2ca02c", "#d62728",
+                "#1f77b4" if res.van >= 0 else "#d62728"]
+
+    # Calculer positions cumulatives
+    cumul = np.zeros(len(valeurs) + 1)
+    for i, val in enumerate(valeurs[:-1]):
+        cumul[i + 1] = cumul[i] + val
+
+    largeur = 0.6
+    x_pos = np.arange(len(composantes))
+
+    # Barres intermédiaires
+    for i in range(len(composantes) - 1):
+        bas = min(cumul[i], cumul[i + 1])
+        hauteur = abs(valeurs[i])
+        ax.bar(i, hauteur, bottom=bas, width=largeur,
+               color=couleurs[i], edgecolor='black', linewidth=1.5, alpha=0.8)
+
+        # Étiquette
+        label_y = bas + hauteur / 2
+        ax.text(i, label_y, fmt_argent(valeurs[i], 1),
+                ha='center', va='center', fontweight='bold', fontsize=10,
+                color='white' if hauteur > res.investissement_initial * 0.1 else 'black')
+
+        # Connecteur
+        if i < len(composantes) - 2:
+            ax.plot([i + largeur/2, i + 1 - largeur/2],
+                    [cumul[i + 1], cumul[i + 1]],
+                    'k--', linewidth=1.5, alpha=0.6)
+
+    # Barre finale (VAN)
+    idx_final = len(composantes) - 1
+    bas_final = 0 if res.van >= 0 else res.van
+    hauteur_final = abs(res.van)
+    ax.bar(idx_final, hauteur_final, bottom=bas_final, width=largeur,
+           color=couleurs[-1], edgecolor='black', linewidth=2.5, alpha=0.9)
+    ax.text(idx_final, res.van / 2, fmt_argent(res.van, 1),
+            ha='center', va='center', fontweight='bold', fontsize=11,
+            color='white' if hauteur_final > res.investissement_initial * 0.05 else 'black')
+
+    # Formatage
+    ax.axhline(y=0, color='black', linewidth=2)
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(composantes, fontsize=11, fontweight='bold')
+    ax.set_ylabel("Montant ($)", fontsize=12, fontweight='bold')
+    ax.set_title(f"Cascade VAN — {res.compteur.type_compteur.value.upper()}",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    # Format axe Y
+    max_val = max(abs(cumul).max(), abs(res.van))
+    if max_val >= 1e6:
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
+
+    plt.tight_layout()
+    return fig
+
+
+def graphique_tornade(
+    df: pd.DataFrame,
+    delta_pct: float,
+    titre: str = "Diagramme Tornade",
+    ax: Optional[plt.Axes] = None,
+    top_n: int = 12
+) -> plt.Figure:
+    """Diagramme tornade pour sensibilité."""
+    df_plot = df.head(top_n).copy()
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 0.5 * len(df_plot) + 2.5))
+    else:
+        fig = ax.figure
+
+    labels = list(df_plot["Paramètre"])
+    d_moins = list(df_plot["ΔVAN(-%)"])
+    d_plus = list(df_plot["ΔVAN(+%)"])
+
+    y = np.arange(len(labels))
+
+    max_abs = max(max(abs(x) for x in d_moins), max(abs(x) for x in d_plus))
+    L = max_abs * 1.15 if max_abs > 0 else 1.0
+
+    for i in range(len(labels)):
+        # Côté négatif
+        if d_moins[i] < 0:
+            ax.barh(i, abs(d_moins[i]), left=d_moins[i], height=0.42,
+                    color='#d62728', alpha=0.75, edgecolor='black', linewidth=0.5)
+        else:
+            ax.barh(i, d_moins[i], left=0, height=0.42,
+                    color='#ff7f0e', alpha=0.75, edgecolor='black', linewidth=0.5)
+
+        # Côté positif
+        if d_plus[i] > 0:
+            ax.barh(i, d_plus[i], left=0, height=0.42,
+                    color='#2ca02c', alpha=0.75, edgecolor='black', linewidth=0.5)
+        else:
+            ax.barh(i, abs(d_plus[i]), left=d_plus[i], height=0.42,
+                    color='#ff7f0e', alpha=0.75, edgecolor='black', linewidth=0.5)
+
+        # Étiquettes
+        ax.text(d_moins[i], i, f' {fmt_argent(d_moins[i], 0)} ',
+                ha='right' if d_moins[i] < 0 else 'left', va='center',
+                fontsize=8, fontweight='bold')
+        ax.text(d_plus[i], i, f' {fmt_argent(d_plus[i], 0)} ',
+                ha='left' if d_plus[i] > 0 else 'right', va='center',
+                fontsize=8, fontweight='bold')
+
+    ax.axvline(0, color='black', linewidth=2.5, zorder=0)
+    ax.set_xlim(-L, L)
+    ax.set_yticks(y)
+    ax.set_yticklabels(labels, fontsize=10)
+    ax.set_xlabel("Impact sur la VAN ($)", fontsize=11, fontweight='bold')
+    ax.set_title(titre, fontsize=13, fontweight='bold', pad=15)
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+
+    if L >= 1e6:
+        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
+
+    legend_elements = [
+        mpatches.Patch(facecolor='#d62728', alpha=0.75, label=f'-{delta_pct:.0f}% (défavorable)'),
+        mpatches.Patch(facecolor='#2ca02c', alpha=0.75, label=f'+{delta_pct:.0f}% (favorable)')
+    ]
+    ax.legend(handles=legend_elements, loc='lower right', fontsize=9)
+
+    plt.tight_layout()
+    return fig
+
+
+def graphique_araignee(
+    df: pd.DataFrame,
+    base_van: float,
+    titre: str = "Diagramme Araignée",
+    top_n: int = 8
+) -> plt.Figure:
+    """Diagramme en toile d'araignée."""
+    df_plot = df.head(top_n).copy()
+
+    params = list(df_plot["Paramètre"])
+    vals_moins = list(df_plot["ΔVAN(-%)"])
+    vals_plus = list(df_plot["ΔVAN(+%)"])
+
+    # Convertir en % de VAN base
+    if abs(base_van) > 1e-6:
+        pct_moins = [v / base_van * 100 for v in vals_moins]
+        pct_plus = [v / base_van * 100 for v in vals_plus]
+    else:
+        pct_moins = [0] * len(vals_moins)
+        pct_plus = [0] * len(vals_plus)
+
+    # Fermer le polygone
+    angles = np.linspace(0, 2 * np.pi, len(params), endpoint=False).tolist()
+    pct_moins = pct_moins + [pct_moins[0]]
+    pct_plus = pct_plus + [pct_plus[0]]
+    angles = angles + [angles[0]]
+
+    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+
+    ax.plot(angles, pct_moins, 'o-', linewidth=2.5, label='-10%',
+            color='#d62728', markersize=8)
+    ax.fill(angles, pct_moins, alpha=0.15, color='#d62728')
+
+    ax.plot(angles, pct_plus, 's-', linewidth=2.5, label='+10%',
+            color='#2ca02c', markersize=8)
+    ax.fill(angles, pct_plus, alpha=0.15, color='#2ca02c')
+
+    ax.plot(angles, [0] * len(angles), 'k--', linewidth=1.5, alpha=0.5)
+
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(params, fontsize=10)
+    ax.set_ylabel("Impact VAN (%)", fontsize=10, fontweight='bold')
+    ax.set_title(titre, fontsize=13, fontweight='bold', pad=20)
+    ax.legend(loc='upper right', bbox_to_anchor=(1.25, 1.1), fontsize=11)
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return fig
+
+
+# =============================================================================
+# INVENTAIRE DES PRÉRÉGLAGES (sans tarification)
+# =============================================================================
+
+def afficher_inventaire_presets() -> None:
+    """Afficher l'inventaire des préréglages et l'espace combinatoire."""
+    print("\n" + "=" * 90)
+    print(" " * 18 + "INVENTAIRE DES PRÉRÉGLAGES (SANS TARIFICATION)")
+    print("=" * 90)
+
+    # A) Contexte de base
+    p_def = ParametresModele()
+    dl = DEFAUTS_LONGUEUIL
+    print("\nA) Contexte de base")
+    print(f"  DEFAUTS_LONGUEUIL: {dl.nb_menages} ménages, {dl.taille_menage:.2f} pers/ménage, {dl.lpcd:.0f} LPCD")
+    print("    Note: Longueuil ~236 L/p/j résidentiel; ~567 L/p/j tous usages (sources internes 2024)")
+    print(f"  ParametresModele() défauts: horizon={p_def.horizon_analyse} ans, "
+          f"taux actualisation={p_def.taux_actualisation_pct:.1f}%, "
+          f"LPCD={p_def.lpcd:.0f}, réduction comportementale={p_def.reduction_comportement_pct:.0f}%")
+
+    # B) Types de compteurs
+    print("\nB) Types de compteurs (coûts stylisés)")
+    couts_types = {t.name: _cout_compteur_par_type(t) for t in TypeCompteur}
+    print(f"  TypeCompteur: {', '.join(t.name for t in TypeCompteur)}")
+    print(f"  Comparaison (compteur nu): {couts_types}")
+    c_long = COMPTEUR_LONGUEUIL_AMI
+    cout_install = c_long.cout_installation
+    cout_total = c_long.cout_initial_par_compteur
+    print(f"  COMPTEUR_LONGUEUIL_AMI: compteur={c_long.cout_compteur:.0f}$, "
+          f"installation={c_long.heures_installation:.1f}h×{c_long.taux_horaire_installation:.0f}$/h "
+          f"({cout_install:.0f}$), réseau={c_long.cout_reseau_par_compteur:.0f}$ → total~{cout_total:.0f}$")
+    print("    Note: 250$ = compteur nu; ~675$ = compteur + MO + réseau (avant autres coûts)")
+
+    # C) Persistance comportementale
+    print("\nC) Persistance comportementale (SCENARIOS_PERSISTANCE)")
+    for key, s in SCENARIOS_PERSISTANCE.items():
+        print(f"  {key}: mode={s.mode.value}, α0={s.alpha_initial*100:.1f}%, "
+              f"plateau={s.alpha_plateau*100:.1f}%, lambda={s.lambda_decay:.2f}, "
+              f"fadeout={s.annees_fadeout} ans")
+
+    # D) Fuites privées (SCENARIOS_FUITES)
+    print("\nD) Fuites privées (SCENARIOS_FUITES)")
+    for key, f in SCENARIOS_FUITES.items():
+        print(f"  {key}: prévalence={f.part_menages_fuite_pct:.1f}%, "
+              f"durée sans compteur={f.duree_moyenne_fuite_sans_compteur} ans, "
+              f"détection={f.taux_detection_pct:.0f}%, réparation={f.taux_reparation_pct:.0f}%, "
+              f"coût moyen={f.cout_reparation_moyen:.0f}$, partage ville={f.part_ville_pct:.0f}%")
+
+    # E) Adoption / déploiement
+    print("\nE) Adoption / déploiement (STRATEGIES_ADOPTION)")
+    for key, a in STRATEGIES_ADOPTION.items():
+        print(f"  {key}: mode={a.mode.value}, Amax={a.adoption_max_pct:.3f}%, "
+              f"k={a.k_vitesse:.2f}, t0={a.t0_point_median:.1f}, incitatif={a.cout_incitatif_par_menage:.0f}$")
+    print("  Note Québec: échantillonnage SQEEP ~380 compteurs (preset dédié)")
+
+    # F) Valeur de l'eau + MCF
+    print("\nF) Valeur de l'eau (PREREGLAGES_VALEUR_EAU)")
+    for key, v in PREREGLAGES_VALEUR_EAU.items():
+        print(f"  {key}: sociale={v.valeur_sociale_m3:.2f}, variable={v.cout_variable_m3:.2f}, "
+              f"infra={v.cout_infrastructure_m3:.2f}, externalités={v.valeur_externalites_m3:.2f}, "
+              f"MCF={'ON' if v.appliquer_mcf else 'OFF'} ({v.mcf:.2f})")
+
+    # G) Ventilation OPEX AMI
+    print("\nG) Ventilation OPEX AMI (PREREGLAGES_VENTILATION_OPEX)")
+    for key, v in PREREGLAGES_VENTILATION_OPEX.items():
+        print(f"  {key}: cyber={v.cybersecurite_pct:.0%}, licences={v.licences_logiciels_pct:.0%}, "
+              f"stockage={v.stockage_donnees_pct:.0%}, service={v.service_client_pct:.0%}, "
+              f"integration={v.integration_si_pct:.0%}")
+
+    # H) Segmentation résidentielle
+    print("\nH) Segmentation résidentielle (SEGMENTS_QUEBEC_DEFAUT)")
+    for s in SEGMENTS_QUEBEC_DEFAUT:
+        print(f"  {s.nom}: LPCD={s.lpcd:.0f}, pers/ménage={s.personnes_par_menage:.2f}, "
+              f"prévalence fuites={s.prevalence_fuites_pct:.0f}%, potentiel={s.potentiel_reduction_pct:.0f}%")
+    print("  Note: Multilogement exclu par défaut (voir justification dans le code)")
+
+    # I) Monte Carlo
+    print("\nI) Monte Carlo (DISTRIBUTIONS_DEFAUT)")
+    for key, d in DISTRIBUTIONS_DEFAUT.items():
+        print(f"  {key}: {d.type_distribution} [{d.min_val}, {d.mode_val}, {d.max_val}]")
+    print("  Manques notables possibles: SI/télécom détaillé, dynamique d'adoption avancée")
+
+    # Espace combinatoire
+    print("\nEspace combinatoire:")
+    print("  adoption × persistance × fuites × valeur_eau × type_compteur × segmentation × Monte Carlo")
+    print("=" * 90)
+
+
+# =============================================================================
+# GRAPHIQUES DE SYNTHÈSE
+# =============================================================================
+
+def graphique_van_cumulative(res: ResultatsModele, ax: Optional[plt.Axes] = None) -> plt.Figure:
+    """VAN cumulative avec période de récupération."""
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 6))
+    else:
+        fig = ax.figure
+
+    annees = res.annees
+    ax.plot(annees, res.van_cumulative, marker='o', linewidth=2.5,
+            label="VAN cumulative", color='#1f77b4', markersize=7)
+
+    ax.axhline(0, color='black', linewidth=2, linestyle='--', alpha=0.7)
+    ax.fill_between(annees, 0, res.van_cumulative,
+                    where=(res.van_cumulative >= 0), alpha=0.2, color='green')
+    ax.fill_between(annees, 0, res.van_cumulative,
+                    where=(res.van_cumulative < 0), alpha=0.2, color='red')
+
+    # Marqueur récupération
+    if np.isfinite(res.periode_recuperation) and 0 < res.periode_recuperation <= res.params.horizon_analyse:
+        ax.scatter([res.periode_recuperation], [0], s=200, c='#ff7f0e',
+                   edgecolor='black', linewidth=2, zorder=5, marker='D')
+        ax.annotate(f'Récupération\n{res.periode_recuperation:.1f} ans',
+                    xy=(res.periode_recuperation, 0),
+                    xytext=(res.periode_recuperation, -abs(res.van_cumulative.min()) * 0.4),
+                    fontsize=10, ha='center', fontweight='bold',
+                    bbox=dict(boxstyle='round,pad=0.6', facecolor='yellow', alpha=0.7),
+                    arrowprops=dict(arrowstyle='->', color='black', lw=2))
+
+    ax.set_xlabel("Année", fontsize=12, fontweight='bold')
+    ax.set_ylabel("VAN cumulative ($)", fontsize=12, fontweight='bold')
+    ax.set_title(f"VAN Cumulative — {res.compteur.type_compteur.value.upper()}",
+                 fontsize=14, fontweight='bold', pad=15)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.legend(fontsize=11, loc='best')
+
+    y_max = max(abs(res.van_cumulative.min()), abs(res.van_cumulative.max()))
+    if y_max >= 1e6:
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
+
+    plt.tight_layout()
+    return fig
+
+
+def graphique_comparaison_types(df_comparaison: pd.DataFrame) -> plt.Figure:
+    """Comparer VAN et RBC des 3 types de compteurs."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    types = df_comparaison["Type"]
+    x = np.arange(len(types))
+
+    # VAN
+    vans = df_comparaison["VAN"]
+    couleurs_van = ['#d62728' if v < 0 else '#2ca02c' for v in vans]
+    bars1 = ax1.bar(x, vans, color=couleurs_van, alpha=0.8,
+                    edgecolor='black', linewidth=1.5)
+
+    ax1.set_ylabel("VAN ($)", fontsize=12, fontweight='bold')
+    ax1.set_title("VAN par Type de Compteur", fontsize=13, fontweight='bold')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(types, fontsize=11, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+    ax1.axhline(0, color='black', linewidth=2)
+
+    for bar in bars1:
+        hauteur = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., hauteur,
+                 fmt_argent(hauteur, 1), ha='center',
+                 va='bottom' if hauteur >= 0 else 'top',
+                 fontsize=10, fontweight='bold')
+
+    if max(abs(vans)) >= 1e6:
+        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f} M$'))
+
+    # RBC
+    rbcs = df_comparaison["RBC"]
+    couleurs_rbc = ['#d62728' if b < 1.0 else '#2ca02c' for b in rbcs]
+    bars2 = ax2.bar(x, rbcs, color=couleurs_rbc, alpha=0.8,
+                    edgecolor='black', linewidth=1.5)
+
+    ax2.set_ylabel("Ratio Bénéfices-Coûts", fontsize=12, fontweight='bold')
+    ax2.set_title("RBC par Type de Compteur", fontsize=13, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(types, fontsize=11, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+    ax2.axhline(1.0, color='blue', linewidth=2, linestyle='--', label='Seuil rentabilité')
+    ax2.legend(fontsize=9)
+
+    for bar in bars2:
+        hauteur = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., hauteur,
+                 f'{hauteur:.2f}', ha='center', va='bottom',
+                 fontsize=10, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+def graphique_scenarios(df_scenarios: pd.DataFrame) -> plt.Figure:
+    """Comparer les scénarios."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    scenarios = df_scenarios["Scénario"]
+    x = np.arange(len(scenarios))
+
+    # VAN
+    vans = df_scenarios["VAN"]
+    couleurs = ['#d62728', '#1f77b4', '#2ca02c']
+    bars1 = ax1.bar(x, vans, color=couleurs, alpha=0.8,
+                    edgecolor='black', linewidth=1.5)
+
+    ax1.set_ylabel("VAN ($)", fontsize=12, fontweight='bold')
+    ax1.set_title("VAN par Scénario", fontsize=13, fontweight='bold')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(scenarios, fontsize=11, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+    ax1.axhline(0, color='black', linewidth=2)
+
+    for bar in bars1:
+        hauteur = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., hauteur,
+                 fmt_argent(hauteur, 1), ha='center',
+                 va='bottom' if hauteur >= 0 else 'top',
+                 fontsize=10, fontweight='bold')
+
+    # RBC
+    rbcs = df_scenarios["RBC"]
+    bars2 = ax2.bar(x, rbcs, color=couleurs, alpha=0.8,
+                    edgecolor='black', linewidth=1.5)
+
+    ax2.set_ylabel("RBC", fontsize=12, fontweight='bold')
+    ax2.set_title("Ratio B/C par Scénario", fontsize=13, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(scenarios, fontsize=11, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+    ax2.axhline(1.0, color='blue', linewidth=2, linestyle='--', label='Seuil')
+    ax2.legend(fontsize=9)
+
+    for bar in bars2:
+        hauteur = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., hauteur,
+                 f'{hauteur:.2f}', ha='center', va='bottom',
+                 fontsize=10, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+# =============================================================================
+# AFFICHAGE RÉSULTATS
+# =============================================================================
+
+def afficher_resume(res: ResultatsModele) -> None:
+    """Afficher résumé complet des résultats."""
+    p = res.params
+    c = res.compteur
+
+    print("\n" + "=" * 80)
+    print(" " * 15 + "ANALYSE COÛTS-BÉNÉFICES — COMPTEURS D'EAU")
+    print(" " * 20 + f"Type: {c.type_compteur.value.upper()}")
+    print("=" * 80)
+
+    print(f"\n{'PARAMÈTRES DU PROJET':^80}")
+    print("-" * 80)
+    print(f"  Ménages:                  {p.nb_menages:>15,}")
+    print(f"  Compteurs:                {p.nb_compteurs_effectif:>15,}")
+    print(f"  Population:               {p.nb_personnes:>15,}")
+    print(f"  Horizon d'analyse:        {p.horizon_analyse:>15} ans")
+    print(f"  Taux d'actualisation:     {p.taux_actualisation_pct:>14.1f} %")
+
+    print(f"\n{'COÛTS DU COMPTEUR ({c.type_compteur.value.upper()})':^80}")
+    print("-" * 80)
+    print(f"  Compteur:                 {c.cout_compteur:>15.0f} $")
+    print(f"  Installation:             {c.cout_installation:>15.0f} $ ({c.heures_installation}h × {c.taux_horaire_installation}$/h)")
+    if c.type_compteur == TypeCompteur.AMI:
+        print(f"  Infrastructure réseau:    {c.cout_reseau_par_compteur:>15.0f} $")
+    print(f"  TOTAL par compteur:       {c.cout_initial_par_compteur:>15.0f} $")
+    print(f"  Exploitation annuelle:    {c.cout_exploitation_annuel:>15.0f} $/compteur")
+    if c.type_compteur == TypeCompteur.AMI and c.cout_opex_non_tech_ami > 0:
+        print(f"  OPEX non-tech AMI:         {c.cout_opex_non_tech_ami:>15.0f} $/compteur/an")
+
+    # Afficher économies d'échelle si actives
+    if res.economies_echelle_actives:
+        print(f"\n{'ÉCONOMIES D ÉCHELLE':^80}")
+        print("-" * 80)
+        reduction_pct = (1.0 - res.facteur_echelle) * 100
+        print(f"  Facteur d'échelle:        {res.facteur_echelle:>14.2f} ({reduction_pct:.1f}% réduction)")
+        print(f"  Facteurs (comp/inst/réseau): {res.facteur_echelle_compteur:.2f} / {res.facteur_echelle_installation:.2f} / {res.facteur_echelle_reseau:.2f}")
+        print(f"  Coût/compteur (base):     {res.cout_par_compteur_base:>15.0f} $")
+        print(f"  Coût/compteur (ajusté):   {res.cout_par_compteur_ajuste:>15.0f} $")
+        print(f"  ÉCONOMIES TOTALES:        {fmt_argent(res.economies_realisees):>15}")
+
+    print(f"\n{'ÉCONOMIES D EAU PAR MÉNAGE':^80}")
+    print("-" * 80)
+    print(f"  Usage de base:            {res.usage_base_menage:>15.1f} m³/an")
+    print(f"  Économies (fuites):       {res.economie_fuite_menage:>15.1f} m³/an")
+    print(f"  Économies (comportement): {res.economie_comportement_menage:>15.1f} m³/an")
+    if res.economie_reseau_menage > 0:
+        print(f"  Économies (réseau):       {res.economie_reseau_menage:>15.1f} m³/an")
+    print(f"  ÉCONOMIES TOTALES:        {res.economie_totale_menage:>15.1f} m³/an")
+
+    print(f"\n{'BÉNÉFICES ANNUELS':^80}")
+    print("-" * 80)
+    print(f"  Valeur eau économisée:    {fmt_argent(res.benefices_eau_annuels):>15}")
+    if res.benefice_infra_annuel > 0:
+        print(f"  Report infrastructure:    {fmt_argent(res.benefice_infra_annuel):>15}")
+    print(f"  BÉNÉFICES TOTAUX:         {fmt_argent(res.benefices_totaux_annuels):>15}")
+
+    print(f"\n{'VALEURS ACTUALISÉES':^80}")
+    print("-" * 80)
+    print(f"  Investissement initial:   {fmt_argent(res.investissement_initial):>15}")
+    print(f"  VA(Bénéfices):            {fmt_argent(res.va_benefices):>15}")
+    print(f"  VA(Coûts exploitation):   {fmt_argent(res.va_couts_exploitation):>15}")
+    print(f"  VA(Coûts totaux):         {fmt_argent(res.va_couts_totaux):>15}")
+
+    print(f"\n{'DÉCOMPOSITION VALEUR DE L EAU (VA)':^80}")
+    print("-" * 80)
+    print(f"  Coût variable évité:      {fmt_argent(res.va_benefices_cout_variable):>15}")
+    print(f"  Report infra (valeur m³): {fmt_argent(res.va_benefices_infra_m3):>15}")
+    print(f"  Externalités:             {fmt_argent(res.va_benefices_externalites):>15}")
+    print(f"  Report infra (paramètres): {fmt_argent(res.va_benefices_report_infra):>15}")
+    if res.mode_compte == ModeCompte.FINANCIER:
+        print("  (Info) Composantes sociales non comptées en mode financier")
+
+    print(f"\n{'RÉSULTATS PRINCIPAUX':^80}")
+    print("=" * 80)
+    statut = "PROJET RENTABLE" if res.van >= 0 else "PROJET NON RENTABLE"
+    print(f"  VAN:                      {fmt_argent(res.van):>15}  [{statut}]")
+    rbc_statut = "OK" if res.rbc >= 1.0 else "ÉCHEC"
+    print(f"  Ratio B/C:                {res.rbc:>15.2f}  [{rbc_statut}]")
+
+    print(f"\n{'MÉTRIQUES PAR MÉNAGE':^80}")
+    print("-" * 80)
+    print(f"  Coût annuel équiv. (EAC): {fmt_argent(res.eac_menage, 2):>15}/an")
+    print(f"  Coût nivelé (LCSW):       {res.lcsw:>14.2f} $/m³")
+    print(f"  Seuil rentabilité (q*):   {res.seuil_rentabilite_m3:>15.1f} m³/an")
+
+    print(f"\n{'PÉRIODE DE RÉCUPÉRATION':^80}")
+    print("-" * 80)
+    if np.isfinite(res.periode_recuperation) and res.periode_recuperation > 0:
+        print(f"  Récupération:             {res.periode_recuperation:>15.1f} ans")
+        if res.periode_recuperation <= p.horizon_analyse / 2:
+            print("  [Récupération rapide - moins de 50% de l'horizon]")
+        elif res.periode_recuperation <= p.horizon_analyse:
+            print("  [Récupération dans l'horizon d'analyse]")
+        else:
+            print("  [Récupération au-delà de l'horizon]")
+    else:
+        print("  Récupération:             JAMAIS (infini)")
+
+    print("=" * 80 + "\n")
+
+
+def afficher_comparaison_types(df: pd.DataFrame) -> None:
+    """Afficher tableau comparatif des types de compteurs."""
+    print("\n" + "=" * 80)
+    print(" " * 20 + "COMPARAISON DES TYPES DE COMPTEURS")
+    print("=" * 80 + "\n")
+
+    # Formater le DataFrame pour affichage
+    df_affich = df.copy()
+    df_affich["Investissement total"] = df_affich["Investissement total"].apply(lambda x: fmt_argent(x))
+    df_affich["Coût exploit./an"] = df_affich["Coût exploit./an"].apply(lambda x: fmt_argent(x))
+    df_affich["VAN"] = df_affich["VAN"].apply(lambda x: fmt_argent(x))
+    df_affich["RBC"] = df_affich["RBC"].apply(lambda x: f"{x:.2f}")
+    df_affich["Récupération (ans)"] = df_affich["Récupération (ans)"].apply(
+        lambda x: f"{x:.1f}" if np.isfinite(x) else "Jamais"
+    )
+    df_affich["LCSW ($/m³)"] = df_affich["LCSW ($/m³)"].apply(lambda x: f"{x:.2f}")
+    df_affich["Coût initial/compteur"] = df_affich["Coût initial/compteur"].apply(lambda x: f"{x:.0f} $")
+
+    print(df_affich.to_string(index=False))
+    print()
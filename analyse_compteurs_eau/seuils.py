@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Seuils de rentabilité: valeur d'un paramètre pour laquelle la VAN s'annule.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+# =============================================================================
+# MODULE SEUILS — RECHERCHE DE RACINE
+# =============================================================================
+#
+# Pour un paramètre p dans [borne_min, borne_max], on cherche p* tel que
+# VAN(p*) = 0:
+#
+# 1. Trois évaluations (bornes et milieu). Si la VAN est affine en p (valeur
+#    de l'eau, coûts unitaires, OPEX, report d'infrastructure...), le milieu
+#    est sur la droite: la racine est obtenue par interpolation, puis
+#    vérifiée par une évaluation.
+# 2. Sinon, méthode de Brent (bissection + sécante + interpolation quadratique
+#    inverse) sur l'intervalle où la VAN change de signe, le plus proche de
+#    la valeur actuelle si la VAN change de signe plusieurs fois.
+# 3. Sans changement de signe aux points évalués, la VAN est réputée de signe
+#    constant sur l'intervalle.
+#
+# Références:
+# - Brent (1973) Algorithms for Minimization without Derivatives, ch. 4
+# - Press et al. (2007) Numerical Recipes, 3e éd., §9.3
+#
+# =============================================================================
+
+STATUT_TROUVE = "trouve"
+STATUT_TOUJOURS_POSITIVE = "toujours_positive"
+STATUT_TOUJOURS_NEGATIVE = "toujours_negative"
+
+METHODE_LINEAIRE = "lineaire"
+METHODE_BRENT = "brent"
+
+
+@dataclass
+class SeuilRentabilite:
+    """Résultat de chercher_seuil()."""
+    valeur: Optional[float]        # p* (None si la VAN ne s'annule pas)
+    statut: str                    # trouve, toujours_positive, toujours_negative
+    methode: Optional[str]         # lineaire ou brent
+    evaluations: int
+    van_borne_min: float
+    van_borne_max: float
+
+
+def brent(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None,
+    xtol: float = 1e-9,
+    rtol: float = 1e-10,
+    max_iter: int = 100,
+) -> tuple[float, int]:
+    """
+    Racine de f dans [a, b] (f(a) et f(b) de signes opposés).
+
+    Retourne:
+        (racine, nombre d'évaluations de f)
+    """
+    n = 0
+    if fa is None:
+        fa, n = f(a), n + 1
+    if fb is None:
+        fb, n = f(b), n + 1
+    if fa == 0:
+        return a, n
+    if fb == 0:
+        return b, n
+    if fa * fb > 0:
+        raise ValueError("f(a) et f(b) doivent être de signes opposés")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * rtol * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b, n
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Sécante
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Interpolation quadratique inverse
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb, n = f(b), n + 1
+    return b, n
+
+
+def chercher_seuil(
+    f: Callable[[float], float],
+    borne_min: float,
+    borne_max: float,
+    valeur_actuelle: Optional[float] = None,
+    xtol: Optional[float] = None,
+) -> SeuilRentabilite:
+    """
+    Chercher la valeur du paramètre qui annule la VAN.
+
+    Paramètres:
+        f: VAN en fonction du paramètre
+        borne_min, borne_max: Intervalle de recherche
+        valeur_actuelle: Valeur courante (départage plusieurs racines)
+        xtol: Tolérance absolue sur le seuil (défaut: 1e-9 × largeur)
+
+    Retourne:
+        SeuilRentabilite
+    """
+    if borne_max <= borne_min:
+        raise ValueError("borne_max doit être > borne_min")
+    if xtol is None:
+        xtol = 1e-9 * (borne_max - borne_min)
+
+    milieu = 0.5 * (borne_min + borne_max)
+    points = [(borne_min, f(borne_min)), (milieu, f(milieu)), (borne_max, f(borne_max))]
+    n = 3
+    f_min, f_mil, f_max = (v for _, v in points)
+    echelle = max(abs(f_min), abs(f_max), 1.0)
+
+    def resultat(valeur, statut, methode):
+        return SeuilRentabilite(valeur, statut, methode, n, f_min, f_max)
+
+    # 1. VAN affine: interpolation, vérifiée par une évaluation
+    if abs(f_mil - 0.5 * (f_min + f_max)) <= 1e-9 * echelle:
+        if f_min * f_max > 0:
+            statut = STATUT_TOUJOURS_POSITIVE if f_min > 0 else STATUT_TOUJOURS_NEGATIVE
+            return resultat(None, statut, METHODE_LINEAIRE)
+        if f_min == f_max:
+            return resultat(borne_min, STATUT_TROUVE, METHODE_LINEAIRE)
+        x = borne_min - f_min * (borne_max - borne_min) / (f_max - f_min)
+        fx = f(x)
+        n += 1
+        if abs(fx) <= 1e-6 * echelle:
+            return resultat(x, STATUT_TROUVE, METHODE_LINEAIRE)
+        points.append((x, fx))
+
+    # 2. Brent sur l'intervalle de changement de signe le plus proche
+    if valeur_actuelle is not None and borne_min < valeur_actuelle < borne_max:
+        points.append((valeur_actuelle, f(valeur_actuelle)))
+        n += 1
+    points.sort()
+    intervalles = [
+        (p, q) for p, q in zip(points, points[1:])
+        if p[1] == 0 or p[1] * q[1] < 0
+    ]
+    if not intervalles:
+        statut = STATUT_TOUJOURS_POSITIVE if f_min > 0 else STATUT_TOUJOURS_NEGATIVE
+        return resultat(None, statut, None)
+
+    reference = valeur_actuelle if valeur_actuelle is not None else milieu
+    (a, fa), (b, fb) = min(intervalles, key=lambda i: min(abs(i[0][0] - reference), abs(i[1][0] - reference)))
+    x, n_brent = brent(f, a, b, fa, fb, xtol=xtol)
+    n += n_brent
+    return resultat(x, STATUT_TROUVE, METHODE_BRENT)
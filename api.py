@@ -13,22 +13,40 @@ Usage production:
     uvicorn api:app --host 0.0.0.0 --port $PORT
 """
 
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, get_args
 from dataclasses import replace
 from datetime import datetime, timezone
 from collections import defaultdict
+from bisect import bisect_left
+from itertools import accumulate
 from pathlib import Path
 import numpy as np
 import math
+import mimetypes
 import os
 import time
 import logging
 import json
+import asyncio
+import hashlib
+import ipaddress
+import multiprocessing
+import queue
+import random
+import threading
+import atexit
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 
 # Base directory for static file serving (security: prevent path traversal)
 BASE_DIR = Path(__file__).resolve().parent
@@ -37,59 +55,204 @@ BASE_DIR = Path(__file__).resolve().parent
 # OBSERVABILITÉ: LOGGING STRUCTURÉ & MÉTRIQUES
 # =============================================================================
 
+class JsonFormatter(logging.Formatter):
+    """Formatter JSON: horodatage + niveau + message + champs structurés."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname.lower(),
+            "message": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        return json.dumps(log_entry)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler qui ne formate pas dans le thread appelant.
+
+    QueueHandler.prepare() formate le message avant la mise en file; ici le
+    formatage (isoformat, json.dumps) est laissé au thread du QueueListener.
+    Les champs sont un dict neuf par appel, donc sûrs à partager.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class StructuredLogger:
-    """Logger qui produit des logs JSON structurés."""
+    """Logger qui produit des logs JSON structurés.
+
+    L'appel ne fait qu'enfiler l'enregistrement: le formatage JSON et
+    l'écriture sont faits par un QueueListener dans un thread dédié,
+    hors de la boucle d'événements.
+    """
 
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
+        self.listener: Optional[QueueListener] = None
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter('%(message)s'))
-            self.logger.addHandler(handler)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(JsonFormatter())
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self.logger.addHandler(DeferredQueueHandler(log_queue))
+            self.listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+            self.listener.start()
+            atexit.register(self.flush)
+            # Les threads ne survivent pas à un fork (mode preload): relancer
+            # le thread d'écriture dans chaque worker
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=self._relancer_apres_fork)
+
+    def _relancer_apres_fork(self):
+        if self.listener is not None:
+            self.listener = QueueListener(
+                self.listener.queue, *self.listener.handlers, respect_handler_level=True
+            )
+            self.listener.start()
 
-    def _log(self, level: str, message: str, **kwargs):
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": level,
-            "message": message,
-            **kwargs
-        }
-        self.logger.log(getattr(logging, level.upper()), json.dumps(log_entry))
+    def flush(self):
+        """Vider la file et arrêter le thread d'écriture."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def _log(self, level: int, message: str, **kwargs):
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, message, extra={"fields": kwargs})
 
     def info(self, message: str, **kwargs):
-        self._log("info", message, **kwargs)
+        self._log(logging.INFO, message, **kwargs)
 
     def warning(self, message: str, **kwargs):
-        self._log("warning", message, **kwargs)
+        self._log(logging.WARNING, message, **kwargs)
 
     def error(self, message: str, **kwargs):
-        self._log("error", message, **kwargs)
+        self._log(logging.ERROR, message, **kwargs)
 
 logger = StructuredLogger("api")
 
+# Bornes des seaux de l'histogramme de latence (ms), format Prometheus "le"
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Étapes du modèle: durées typiques sous la milliseconde
+STAGE_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 100, 1000, 10000)
+
+# Étiquettes pour les requêtes sans route API (fichiers statiques, 404)
+ROUTE_STATIC = "static"
+ROUTE_UNMATCHED = "unmatched"
+
+
+def route_template(request: Request) -> str:
+    """Retourner le gabarit de route (ex: /api/calculate) plutôt que le chemin brut.
+
+    Borne la cardinalité des métriques: tous les fichiers statiques partagent
+    une seule étiquette au lieu d'une clé par chemin.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return ROUTE_UNMATCHED
+    if "{path:path}" in path:
+        return ROUTE_STATIC
+    return path
+
+
+class LatencyHistogram:
+    """Histogramme à seaux fixes: enregistrement O(1), mémoire constante."""
+
+    __slots__ = ("bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, bounds: tuple = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)  # +1 pour +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        """Comptes cumulés par borne (sémantique Prometheus "le")."""
+        return list(accumulate(self.bucket_counts))
+
+
+def _histogram_lines(name: str, label: str, value: str, hist: LatencyHistogram) -> List[str]:
+    """Séries Prometheus _bucket/_sum/_count d'un histogramme."""
+    cumulative = hist.cumulative()
+    lines = [
+        f'{name}_bucket{{{label}="{value}",le="{bound}"}} {count}'
+        for bound, count in zip(hist.bounds, cumulative)
+    ]
+    lines.append(f'{name}_bucket{{{label}="{value}",le="+Inf"}} {cumulative[-1]}')
+    lines.append(f'{name}_sum{{{label}="{value}"}} {hist.sum:.3f}')
+    lines.append(f'{name}_count{{{label}="{value}"}} {hist.count}')
+    return lines
+
+
 class MetricsCollector:
     """Collecteur de métriques pour monitoring."""
 
     def __init__(self):
         self.start_time = datetime.now(timezone.utc)
         self.request_count: Dict[str, int] = defaultdict(int)
-        self.request_latency: Dict[str, List[float]] = defaultdict(list)
+        self.request_latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
         self.error_count: Dict[str, int] = defaultdict(int)
         self.last_error: Optional[Dict[str, Any]] = None
-        self._max_latency_samples = 1000  # Limiter mémoire
+        # Compteurs de travail (où va le CPU)
+        self.model_evaluations: Dict[str, int] = defaultdict(int)
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        self.mc_draws: int = 0
+        self.coalesced: Dict[str, int] = defaultdict(int)
+        self.cancelled: Dict[str, int] = defaultdict(int)
+        self.jobs: Dict[str, int] = defaultdict(int)
+        self.rate_limited: Dict[str, int] = defaultdict(int)
+        # Durées par étape du modèle (si API_STAGE_TIMING=1)
+        self.stage_latency: Dict[str, LatencyHistogram] = defaultdict(
+            lambda: LatencyHistogram(STAGE_BUCKETS_MS)
+        )
 
     def record_request(self, endpoint: str, latency_ms: float, status_code: int):
         self.request_count[endpoint] += 1
-        latencies = self.request_latency[endpoint]
-        latencies.append(latency_ms)
-        if len(latencies) > self._max_latency_samples:
-            self.request_latency[endpoint] = latencies[-self._max_latency_samples:]
+        self.request_latency[endpoint].observe(latency_ms)
 
         if status_code >= 400:
             error_key = f"{endpoint}_{status_code}"
             self.error_count[error_key] += 1
 
+    def record_model_evaluations(self, kind: str, n: int = 1):
+        """Compter les évaluations du modèle (kind: executer_modele, monte_carlo...)."""
+        self.model_evaluations[kind] += n
+
+    def record_cache_hit(self, cache: str):
+        self.cache_hits[cache] += 1
+
+    def record_mc_draws(self, n: int):
+        self.mc_draws += n
+
+    def record_coalesced(self, endpoint: str):
+        """Compter une requête servie par un calcul identique déjà en cours."""
+        self.coalesced[endpoint] += 1
+
+    def record_cancelled(self, endpoint: str):
+        """Compter un calcul abandonné parce que le client s'est déconnecté."""
+        self.cancelled[endpoint] += 1
+
+    def record_rate_limited(self, endpoint: str):
+        """Compter une requête refusée par la limitation de débit (429)."""
+        self.rate_limited[endpoint] += 1
+
+    def record_job(self, kind: str, status: str):
+        """Compter un job terminé (status: succeeded, failed, cancelled)."""
+        self.jobs[f"{kind}_{status}"] += 1
+
+    def record_stages(self, durees_ms: Dict[str, float]):
+        """Enregistrer les durées par étape d'une requête (ms)."""
+        for stage, ms in durees_ms.items():
+            self.stage_latency[stage].observe(ms)
+
     def record_error(self, endpoint: str, error_type: str, error_message: str):
         self.last_error = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -107,25 +270,59 @@ class MetricsCollector:
         lines.append("# HELP api_requests_total Total number of API requests")
         lines.append("# TYPE api_requests_total counter")
         for endpoint, count in self.request_count.items():
-            safe_endpoint = endpoint.replace("/", "_").replace("-", "_")
             lines.append(f'api_requests_total{{endpoint="{endpoint}"}} {count}')
 
         lines.append("# HELP api_request_latency_ms Request latency in milliseconds")
-        lines.append("# TYPE api_request_latency_ms summary")
-        for endpoint, latencies in self.request_latency.items():
-            if latencies:
-                avg = sum(latencies) / len(latencies)
-                p50 = sorted(latencies)[len(latencies) // 2]
-                p95 = sorted(latencies)[int(len(latencies) * 0.95)] if len(latencies) >= 20 else max(latencies)
-                lines.append(f'api_request_latency_ms{{endpoint="{endpoint}",quantile="0.5"}} {p50:.2f}')
-                lines.append(f'api_request_latency_ms{{endpoint="{endpoint}",quantile="0.95"}} {p95:.2f}')
-                lines.append(f'api_request_latency_ms_avg{{endpoint="{endpoint}"}} {avg:.2f}')
+        lines.append("# TYPE api_request_latency_ms histogram")
+        for endpoint, hist in self.request_latency.items():
+            lines.extend(_histogram_lines("api_request_latency_ms", "endpoint", endpoint, hist))
+
+        if self.stage_latency:
+            lines.append("# HELP api_stage_duration_ms Model pipeline stage duration per request")
+            lines.append("# TYPE api_stage_duration_ms histogram")
+            for stage, hist in self.stage_latency.items():
+                lines.extend(_histogram_lines("api_stage_duration_ms", "stage", stage, hist))
 
         lines.append("# HELP api_errors_total Total number of API errors")
         lines.append("# TYPE api_errors_total counter")
         for error_key, count in self.error_count.items():
             lines.append(f'api_errors_total{{error="{error_key}"}} {count}')
 
+        lines.append("# HELP api_model_evaluations_total Model evaluations by kind")
+        lines.append("# TYPE api_model_evaluations_total counter")
+        for kind, count in self.model_evaluations.items():
+            lines.append(f'api_model_evaluations_total{{kind="{kind}"}} {count}')
+
+        lines.append("# HELP api_cache_hits_total Results served from a cache")
+        lines.append("# TYPE api_cache_hits_total counter")
+        for cache, count in self.cache_hits.items():
+            lines.append(f'api_cache_hits_total{{cache="{cache}"}} {count}')
+
+        lines.append("# HELP api_mc_draws_total Monte Carlo draws simulated")
+        lines.append("# TYPE api_mc_draws_total counter")
+        lines.append(f"api_mc_draws_total {self.mc_draws}")
+
+        lines.append("# HELP api_coalesced_requests_total Requests that awaited an identical in-flight computation")
+        lines.append("# TYPE api_coalesced_requests_total counter")
+        for endpoint, count in self.coalesced.items():
+            lines.append(f'api_coalesced_requests_total{{endpoint="{endpoint}"}} {count}')
+
+        lines.append("# HELP api_cancelled_computations_total Computations stopped because the client disconnected")
+        lines.append("# TYPE api_cancelled_computations_total counter")
+        for endpoint, count in self.cancelled.items():
+            lines.append(f'api_cancelled_computations_total{{endpoint="{endpoint}"}} {count}')
+
+        lines.append("# HELP api_rate_limited_total Requests rejected by the per-client rate limiter")
+        lines.append("# TYPE api_rate_limited_total counter")
+        for endpoint, count in self.rate_limited.items():
+            lines.append(f'api_rate_limited_total{{endpoint="{endpoint}"}} {count}')
+
+        lines.append("# HELP api_jobs_total Background jobs finished, by kind and status")
+        lines.append("# TYPE api_jobs_total counter")
+        for key, count in self.jobs.items():
+            kind, status = key.rsplit("_", 1)
+            lines.append(f'api_jobs_total{{kind="{kind}",status="{status}"}} {count}')
+
         lines.append("# HELP api_uptime_seconds API uptime in seconds")
         lines.append("# TYPE api_uptime_seconds gauge")
         lines.append(f"api_uptime_seconds {self.get_uptime_seconds():.0f}")
@@ -173,22 +370,61 @@ from analyse_compteurs_eau import (
     FUITES_QUEBEC_SANS_TARIF,
     FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF,
     VALEUR_EAU_QUEBEC,
+    DEFAUTS_COMPTEUR_CALCULATEUR,
+    creer_compteur_calculateur,
     # Monte Carlo
     ParametresMonteCarlo,
     ResultatsMonteCarlo,
     simuler_monte_carlo,
     DISTRIBUTIONS_DEFAUT,
     DistributionParametre,
+    CalculAnnule,
+    # Priorisation provinciale
+    charger_municipalites,
+    evaluer_municipalites,
+    prioriser_municipalites,
+    OBJECTIFS_PRIORISATION,
+    # Optimisation du déploiement
+    optimiser_deploiement,
+    OBJECTIFS_DEPLOIEMENT,
+    MAX_EVALUATIONS_DEPLOIEMENT,
+    # Seuils de rentabilité
+    chercher_seuil,
+    STATUT_TROUVE,
+    # Décomposition linéaire de la VAN
+    calculer_base_van,
+    # Noyau JS (calcul côté client)
+    spec_noyau,
+    # Instrumentation
+    chronometrer_etapes,
+    etape,
 )
 
 # =============================================================================
 # APPLICATION FASTAPI
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Table des scénarios précalculés chargée hors de la boucle d'événements,
+    # même sans préchauffage: la première requête ne bloque pas les autres
+    if table_scenarios.reponses is None:
+        await asyncio.to_thread(table_scenarios.charger)
+    # Préchauffage avant d'accepter des requêtes (et donc avant que
+    # /api/health ne réponde)
+    if PREWARM:
+        await prechauffer()
+    purge_jobs = asyncio.create_task(purger_jobs_periodiquement())
+    yield
+    purge_jobs.cancel()
+    arreter_pool_jobs()
+
+
 app = FastAPI(
     title="API Compteurs d'Eau Québec",
     description="Analyse coûts-bénéfices des compteurs d'eau intelligents",
     version=MODEL_VERSION,
+    lifespan=lifespan,
 )
 
 # CORS pour permettre les appels depuis le frontend
@@ -201,6 +437,65 @@ else:
     allowed_origins = [origin.strip() for origin in CORS_ORIGINS.split(",") if origin.strip()]
     allow_credentials = True
 
+# Chronométrage des étapes du modèle (opt-in, API_STAGE_TIMING=1):
+# métriques api_stage_duration_ms + détail "stages_ms" dans les logs.
+STAGE_TIMING = os.environ.get("API_STAGE_TIMING", "0") == "1"
+# En-tête Server-Timing (visible dans les DevTools), nécessite STAGE_TIMING
+SERVER_TIMING = os.environ.get("API_SERVER_TIMING", "0") == "1"
+
+# Échantillonnage des logs de requêtes réussies (les erreurs sont toujours loguées)
+# LOG_SAMPLE_RATE=0.1 → 1 requête réussie sur 10 en moyenne
+LOG_SAMPLE_RATE = min(1.0, max(0.0, float(os.environ.get("LOG_SAMPLE_RATE", "1.0"))))
+# Ne pas loguer les fichiers statiques servis avec succès (LOG_STATIC=1 pour les inclure)
+LOG_STATIC = os.environ.get("LOG_STATIC", "0") == "1"
+
+# Préchauffage au démarrage (API_PREWARM=0 pour désactiver) et nombre de
+# tirages du Monte Carlo de préchauffage (minimum 100, cf. ParametresMonteCarlo)
+PREWARM = os.environ.get("API_PREWARM", "1") == "1"
+PREWARM_MC_DRAWS = int(os.environ.get("API_PREWARM_MC_DRAWS", "100"))
+
+# Limitation de débit par client (API_RATE_LIMIT=0 pour désactiver): capacité
+# du seau et remplissage, en évaluations du modèle (cf. TokenBucketLimiter)
+RATE_LIMIT = os.environ.get("API_RATE_LIMIT", "1") == "1"
+RATE_LIMIT_CAPACITY = float(os.environ.get("API_RATE_LIMIT_CAPACITY", "4000"))
+RATE_LIMIT_REFILL = float(os.environ.get("API_RATE_LIMIT_REFILL", "200"))
+# Clés X-API-Key reconnues (séparées par des virgules): seules ces clés ont
+# leur propre seau, toute autre valeur est ignorée (seau de l'adresse IP)
+API_KEYS = frozenset(k.strip() for k in os.environ.get("API_KEYS", "").split(",") if k.strip())
+# Proxys de confiance (IP ou CIDR séparés par des virgules, "*" = tous) dont
+# l'en-tête X-Forwarded-For donne l'IP réelle du client. Derrière le proxy de
+# Render: API_TRUSTED_PROXIES="*" (entrée la plus à droite; ou uvicorn --proxy-headers
+# --forwarded-allow-ips='*', qui réécrit directement request.client)
+TRUSTED_PROXIES = os.environ.get("API_TRUSTED_PROXIES", "")
+
+# Scénarios précalculés par generate_scenarios_json.py (API_SCENARIO_TABLE=""
+# pour désactiver)
+SCENARIO_TABLE = os.environ.get("API_SCENARIO_TABLE", str(BASE_DIR / "scenarios_output.json"))
+
+# Jobs asynchrones (/api/jobs): répertoire des résultats, durée de conservation
+# après la fin du job, nombre de processus de calcul et limite de tirages
+JOBS_DIR = Path(os.environ.get("API_JOBS_DIR", str(BASE_DIR / ".jobs")))
+JOBS_TTL_S = int(os.environ.get("API_JOBS_TTL_S", str(24 * 3600)))
+JOBS_WORKERS = max(1, int(os.environ.get("API_JOBS_WORKERS", "1")))
+JOBS_MAX_DRAWS = int(os.environ.get("API_JOBS_MAX_DRAWS", "100000"))
+# Intervalle de purge des jobs expirés (s)
+JOBS_PURGE_INTERVAL_S = float(os.environ.get("API_JOBS_PURGE_INTERVAL_S", "3600"))
+
+# Données fusionnées de la carte pour /api/prioritize
+MUNICIPALITIES_STATS = os.environ.get(
+    "API_MUNICIPALITIES_STATS", str(BASE_DIR / "map" / "data" / "current" / "municipalities-stats.json")
+)
+
+
+def should_log_request(endpoint: str, status_code: int) -> bool:
+    """Décider si une requête est loguée (erreurs toujours, succès échantillonnés)."""
+    if status_code >= 400:
+        return True
+    if endpoint == ROUTE_STATIC and not LOG_STATIC:
+        return False
+    return LOG_SAMPLE_RATE >= 1.0 or random.random() < LOG_SAMPLE_RATE
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -214,35 +509,45 @@ app.add_middleware(
 async def metrics_middleware(request: Request, call_next):
     start_time = time.time()
     response = None
+    durees_etapes = None
     try:
-        response = await call_next(request)
+        if STAGE_TIMING:
+            with chronometrer_etapes() as durees_etapes:
+                response = await call_next(request)
+        else:
+            response = await call_next(request)
         # Ajouter header version API
         response.headers["X-API-Version"] = MODEL_VERSION
+        if durees_etapes and SERVER_TIMING:
+            response.headers["Server-Timing"] = ", ".join(
+                f"{stage};dur={ms:.3f}" for stage, ms in durees_etapes.items()
+            )
         return response
     except Exception as e:
-        metrics.record_error(request.url.path, type(e).__name__, str(e))
+        metrics.record_error(route_template(request), type(e).__name__, str(e))
         raise
     finally:
         latency_ms = (time.time() - start_time) * 1000
-        endpoint = request.url.path
+        endpoint = route_template(request)
         status_code = response.status_code if response else 500
         metrics.record_request(endpoint, latency_ms, status_code)
-        if status_code >= 400:
-            logger.warning(
-                "request_error",
-                endpoint=endpoint,
-                method=request.method,
-                status_code=status_code,
-                latency_ms=round(latency_ms, 2)
-            )
-        else:
-            logger.info(
-                "request_completed",
-                endpoint=endpoint,
-                method=request.method,
-                status_code=status_code,
-                latency_ms=round(latency_ms, 2)
-            )
+        if durees_etapes:
+            metrics.record_stages(durees_etapes)
+        if should_log_request(endpoint, status_code):
+            fields = {
+                "endpoint": request.url.path,
+                "method": request.method,
+                "status_code": status_code,
+                "latency_ms": round(latency_ms, 2),
+            }
+            if durees_etapes:
+                fields["stages_ms"] = {stage: round(ms, 3) for stage, ms in durees_etapes.items()}
+            if status_code >= 400:
+                logger.warning("request_error", **fields)
+            else:
+                if LOG_SAMPLE_RATE < 1.0:
+                    fields["sample_rate"] = LOG_SAMPLE_RATE
+                logger.info("request_completed", **fields)
 
 
 # =============================================================================
@@ -285,15 +590,30 @@ class CalculRequest(BaseModel):
 
     # Paramètres du compteur
     type_compteur: str = Field("ami", description="Type: ami, amr, manuel")
-    cout_compteur: float = Field(250.0, ge=50, le=800, description="Coût du compteur ($)")
-    heures_installation: float = Field(3.0, ge=0.5, le=8.0, description="Heures d'installation")
-    taux_horaire: float = Field(125.0, ge=50, le=250, description="Taux horaire installation ($/h)")
-    cout_reseau: float = Field(50.0, ge=0, le=300, description="Coût réseau par compteur ($)")
-    cout_infra_fixe: float = Field(0.0, ge=0, le=5_000_000, description="Coût infrastructure fixe ($)")
+    cout_compteur: float = Field(
+        DEFAUTS_COMPTEUR_CALCULATEUR["cout_compteur"],
+        ge=50, le=800, description="Coût du compteur ($)"
+    )
+    heures_installation: float = Field(
+        DEFAUTS_COMPTEUR_CALCULATEUR["heures_installation"],
+        ge=0.5, le=8.0, description="Heures d'installation"
+    )
+    taux_horaire: float = Field(
+        DEFAUTS_COMPTEUR_CALCULATEUR["taux_horaire_installation"],
+        ge=50, le=250, description="Taux horaire installation ($/h)"
+    )
+    cout_reseau: float = Field(
+        DEFAUTS_COMPTEUR_CALCULATEUR["cout_reseau_par_compteur"],
+        ge=0, le=300, description="Coût réseau par compteur ($)"
+    )
+    cout_infra_fixe: float = Field(
+        DEFAUTS_COMPTEUR_CALCULATEUR["cout_infra_fixe"],
+        ge=0, le=5_000_000, description="Coût infrastructure fixe ($)"
+    )
 
     # OPEX AMI non-technique (cyber, logiciels, stockage, télécom)
     cout_opex_non_tech_ami: float = Field(
-        15.0,
+        DEFAUTS_COMPTEUR_CALCULATEUR["cout_opex_non_tech_ami"],
         ge=0,
         le=50,
         description="OPEX AMI non-technique ($/compteur/an). Bas=10, Médian=15, Haut=35"
@@ -494,6 +814,19 @@ class SensitivityResponse(BaseModel):
     parametres: List[dict]
 
 
+class BreakEvenRequest(BaseModel):
+    """Paramètres pour la recherche des seuils de rentabilité."""
+    params: dict = Field(default_factory=dict, description="Paramètres de calcul (CalculRequest)")
+    champs: Optional[List[str]] = Field(
+        None,
+        description="Champs numériques de CalculRequest à résoudre (défaut: tous les champs bornés)",
+    )
+    bornes: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="Intervalles de recherche [min, max] (défaut: bornes de validation du champ)",
+    )
+
+
 class PresetResponse(BaseModel):
     """Preset d'une ville."""
 
@@ -560,6 +893,22 @@ def get_persistance(
         raise ValueError(f"Scénario de persistance inconnu: {nom}")
 
 
+# Mapping des scénarios vers les presets (IDs standardisés)
+SCENARIOS_FUITES_API = {
+    # Avec signal-prix (taux réparation élevé ~85%)
+    "standard": FUITES_SANS_COUT,
+    "quebec": FUITES_CONTEXTE_QUEBEC,
+    "deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
+    "menage": FUITES_MENAGE_SEUL,
+    "subvention_50": FUITES_SUBVENTION_50,
+    "ville": FUITES_VILLE_SEULE,
+    # Sans signal-prix (taux réparation réduit ~55%)
+    "menage_sans_tarif": FUITES_MENAGE_SANS_TARIF,
+    "quebec_sans_tarif": FUITES_QUEBEC_SANS_TARIF,
+    "deux_stocks_sans_tarif": FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF,
+}
+
+
 def get_fuites(nom: str, req: CalculRequest = None) -> ParametresFuites:
     """Récupérer les paramètres de fuites selon le scénario.
 
@@ -572,23 +921,9 @@ def get_fuites(nom: str, req: CalculRequest = None) -> ParametresFuites:
         menage_sans_tarif, quebec_sans_tarif, deux_stocks_sans_tarif
     - Personnalisé: custom (utilise les paramètres avancés)
     """
-    # Mapping des scénarios vers les presets (IDs standardisés)
-    scenarios_map = {
-        # Avec signal-prix (taux réparation élevé ~85%)
-        "standard": FUITES_SANS_COUT,
-        "quebec": FUITES_CONTEXTE_QUEBEC,
-        "deux_stocks": FUITES_QUEBEC_DEUX_STOCKS,
-        "menage": FUITES_MENAGE_SEUL,
-        "subvention_50": FUITES_SUBVENTION_50,
-        "ville": FUITES_VILLE_SEULE,
-        # Sans signal-prix (taux réparation réduit ~55%)
-        "menage_sans_tarif": FUITES_MENAGE_SANS_TARIF,
-        "quebec_sans_tarif": FUITES_QUEBEC_SANS_TARIF,
-        "deux_stocks_sans_tarif": FUITES_QUEBEC_DEUX_STOCKS_SANS_TARIF,
-    }
 
-    if nom in scenarios_map:
-        return scenarios_map[nom]
+    if nom in SCENARIOS_FUITES_API:
+        return SCENARIOS_FUITES_API[nom]
     elif nom == "custom" and req is not None:
         # Calculer le total = petites + grosses
         prevalence_totale = req.prevalence_petites_pct + req.prevalence_grosses_pct
@@ -634,7 +969,7 @@ def get_fuites(nom: str, req: CalculRequest = None) -> ParametresFuites:
         )
     else:
         # Scénario inconnu → erreur explicite (pas de fallback silencieux)
-        valid_scenarios = list(scenarios_map.keys()) + ["custom"]
+        valid_scenarios = list(SCENARIOS_FUITES_API.keys()) + ["custom"]
         raise HTTPException(
             status_code=400,
             detail=f"Scénario de fuites inconnu: '{nom}'. "
@@ -745,14 +1080,14 @@ def get_compteur(req: CalculRequest) -> ParametresCompteur:
         "manuel": TypeCompteur.MANUEL,
     }
 
-    return ParametresCompteur(
-        type_compteur=type_map.get(req.type_compteur, TypeCompteur.AMI),
+    return creer_compteur_calculateur(
+        type_map.get(req.type_compteur, TypeCompteur.AMI),
         cout_compteur=req.cout_compteur,
         heures_installation=req.heures_installation,
         taux_horaire_installation=req.taux_horaire,
-        cout_reseau_par_compteur=req.cout_reseau if req.type_compteur == "ami" else 0,
-        cout_infra_fixe=req.cout_infra_fixe if req.type_compteur == "ami" else 0,
-        cout_opex_non_tech_ami=req.cout_opex_non_tech_ami if req.type_compteur == "ami" else 0,
+        cout_reseau_par_compteur=req.cout_reseau,
+        cout_infra_fixe=req.cout_infra_fixe,
+        cout_opex_non_tech_ami=req.cout_opex_non_tech_ami,
     )
 
 
@@ -771,6 +1106,448 @@ def numpy_to_python(obj):
     return obj
 
 
+# =============================================================================
+# COALESCENCE DES CALCULS IDENTIQUES (single-flight)
+# =============================================================================
+
+def cle_requete(endpoint: str, req: BaseModel, **extra) -> str:
+    """Hash canonique d'une requête: endpoint + paramètres validés (+ query)."""
+    # warnings=False: /api/sensitivity assigne des flottants à des champs int
+    params = req.model_dump(mode="json", warnings=False)
+    contenu = json.dumps(
+        {"endpoint": endpoint, "params": params, **extra},
+        sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(contenu.encode()).hexdigest()
+
+
+# Statut non standard (convention nginx) d'une requête abandonnée par le client
+STATUS_CLIENT_CLOSED = 499
+
+
+class RequeteAbandonnee(Exception):
+    """Le client s'est déconnecté avant la fin du calcul."""
+
+
+def surveiller_deconnexion(request: Request) -> asyncio.Future:
+    """Tâche qui se termine quand le client se déconnecte (à annuler ensuite).
+
+    request.is_disconnected() ne voit pas la déconnexion derrière le
+    middleware HTTP (BaseHTTPMiddleware): on attend donc le message
+    http.disconnect sur le canal de réception, le corps étant déjà lu.
+    """
+    async def attendre():
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+    return asyncio.ensure_future(attendre())
+
+
+class _Vol:
+    """Calcul en cours partagé par les requêtes d'une même clé."""
+
+    __slots__ = ("tache", "annulation", "attentes")
+
+    def __init__(self, tache: asyncio.Future, annulation: threading.Event):
+        self.tache = tache
+        self.annulation = annulation
+        self.attentes = 0
+
+
+class SingleFlight:
+    """Un seul calcul en cours par clé de requête.
+
+    Les requêtes identiques qui arrivent pendant le calcul attendent son
+    résultat au lieu de le relancer. Le calcul s'exécute dans un thread,
+    hors de la boucle d'événements, pour que ces requêtes puissent arriver.
+
+    Si `request` est fourni, fn reçoit `annulation` (threading.Event), levé
+    quand tous les clients qui attendent ce calcul se sont déconnectés.
+    """
+
+    def __init__(self):
+        self.en_cours: Dict[str, _Vol] = {}
+
+    def _terminer(self, cle: str, vol: _Vol):
+        if self.en_cours.get(cle) is vol:
+            del self.en_cours[cle]
+        # Marquer l'exception comme lue (calcul annulé sans personne pour l'attendre)
+        if not vol.tache.cancelled():
+            vol.tache.exception()
+
+    async def executer(self, endpoint: str, cle: str, fn, *args, request: Optional[Request] = None):
+        vol = self.en_cours.get(cle)
+        if vol is None:
+            annulation = threading.Event()
+            kwargs = {"annulation": annulation} if request is not None else {}
+            vol = _Vol(asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs)), annulation)
+            self.en_cours[cle] = vol
+            vol.tache.add_done_callback(lambda _: self._terminer(cle, vol))
+        else:
+            metrics.record_coalesced(endpoint)
+
+        if request is None:
+            # shield: l'abandon d'un appelant n'interrompt pas le calcul partagé
+            return await asyncio.shield(vol.tache)
+
+        vol.attentes += 1
+        veille = surveiller_deconnexion(request)
+        try:
+            await asyncio.wait({vol.tache, veille}, return_when=asyncio.FIRST_COMPLETED)
+            if vol.tache.done():
+                return vol.tache.result()
+        finally:
+            veille.cancel()
+            vol.attentes -= 1
+
+        # Plus personne n'attend ce calcul: l'arrêter au prochain lot
+        if vol.attentes == 0 and not vol.tache.done():
+            vol.annulation.set()
+            if self.en_cours.get(cle) is vol:
+                del self.en_cours[cle]
+            metrics.record_cancelled(endpoint)
+        raise RequeteAbandonnee()
+
+
+calculs_en_cours = SingleFlight()
+
+
+# =============================================================================
+# LIMITATION DE DÉBIT (seau à jetons par client, pondéré par le coût)
+# =============================================================================
+#
+# Chaque client (clé X-API-Key listée dans API_KEYS, sinon adresse IP, lue
+# dans X-Forwarded-For derrière un proxy de confiance) dispose d'un seau de
+# RATE_LIMIT_CAPACITY jetons, rempli à RATE_LIMIT_REFILL jetons/s. Une requête
+# consomme autant de jetons que d'évaluations du modèle qu'elle déclenche:
+# un /api/calculate coûte 1, un Monte Carlo de 2000 tirages en coûte 2000.
+# Un coût supérieur à la capacité est ramené à la capacité (un job lourd vide
+# le seau au lieu d'être refusé pour toujours).
+
+
+class TokenBucketLimiter:
+    """Seaux à jetons en mémoire, un par client (propre à chaque worker)."""
+
+    # Au-delà, les seaux pleins (clients inactifs) sont purgés
+    MAX_CLIENTS = 10000
+
+    def __init__(self, capacite: float, debit: float):
+        self.capacite = capacite
+        self.debit = debit
+        self.seaux: Dict[str, List[float]] = {}  # client → [jetons, horodatage]
+
+    def _jetons(self, seau: List[float], maintenant: float) -> float:
+        return min(self.capacite, seau[0] + (maintenant - seau[1]) * self.debit)
+
+    def consommer(self, client: str, cout: float, maintenant: Optional[float] = None):
+        """Retirer `cout` jetons si possible; retourne (admis, jetons restants, cout)."""
+        maintenant = time.monotonic() if maintenant is None else maintenant
+        cout = min(cout, self.capacite)
+        seau = self.seaux.get(client)
+        if seau is None:
+            if len(self.seaux) >= self.MAX_CLIENTS:
+                self._purger(maintenant)
+            seau = self.seaux[client] = [self.capacite, maintenant]
+        jetons = self._jetons(seau, maintenant)
+        admis = jetons >= cout
+        if admis:
+            jetons -= cout
+        seau[0], seau[1] = jetons, maintenant
+        return admis, jetons, cout
+
+    def _purger(self, maintenant: float):
+        for client in [c for c, seau in self.seaux.items() if self._jetons(seau, maintenant) >= self.capacite]:
+            del self.seaux[client]
+
+    def en_tetes(self, jetons: float, cout: float, admis: bool) -> Dict[str, str]:
+        """En-têtes RateLimit-* (draft IETF) et Retry-After si refusé."""
+        en_tetes = {
+            "RateLimit-Limit": str(int(self.capacite)),
+            "RateLimit-Remaining": str(int(jetons)),
+            "RateLimit-Reset": str(math.ceil((self.capacite - jetons) / self.debit)),
+            "RateLimit-Policy": f"{int(self.capacite)};w={math.ceil(self.capacite / self.debit)}",
+        }
+        if not admis:
+            en_tetes["Retry-After"] = str(math.ceil((cout - jetons) / self.debit))
+        return en_tetes
+
+
+limiteur = TokenBucketLimiter(RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL)
+
+
+def _reseaux_proxys(valeur: str) -> Optional[List[ipaddress._BaseNetwork]]:
+    """Réseaux des proxys de confiance; None si tous sont de confiance ("*")."""
+    if valeur.strip() == "*":
+        return None
+    return [ipaddress.ip_network(p.strip(), strict=False) for p in valeur.split(",") if p.strip()]
+
+
+reseaux_proxys = _reseaux_proxys(TRUSTED_PROXIES)
+
+
+def _proxy_de_confiance(adresse: str) -> bool:
+    if reseaux_proxys is None:
+        return True
+    try:
+        ip = ipaddress.ip_address(adresse)
+    except ValueError:
+        return False
+    return any(ip in reseau for reseau in reseaux_proxys)
+
+
+def adresse_client(request: Request) -> str:
+    """
+    Adresse IP réelle du client.
+
+    Si la connexion vient d'un proxy de confiance, X-Forwarded-For est lu de
+    droite à gauche en sautant les proxys de confiance: la première adresse
+    restante est celle du client (les valeurs plus à gauche sont fournies par
+    le client et ne sont pas fiables). Avec API_TRUSTED_PROXIES="*", seule
+    l'entrée la plus à droite, ajoutée par le proxy de la plateforme, est
+    retenue; de même si toutes les entrées sont des proxys de confiance.
+    """
+    adresse = request.client.host if request.client else "inconnu"
+    transmis = request.headers.get("x-forwarded-for")
+    if not transmis or not _proxy_de_confiance(adresse):
+        return adresse
+    chaine = [a.strip() for a in transmis.split(",") if a.strip()]
+    if not chaine:
+        return adresse
+    if reseaux_proxys is None:
+        return chaine[-1]
+    for saut in reversed(chaine):
+        if not _proxy_de_confiance(saut):
+            return saut
+    return chaine[-1]
+
+
+def identifiant_client(request: Request) -> str:
+    """Clé API reconnue (hachée, jamais conservée en clair) ou adresse IP du client."""
+    cle_api = request.headers.get("x-api-key")
+    if cle_api and cle_api in API_KEYS:
+        return "cle:" + hashlib.sha256(cle_api.encode()).hexdigest()[:16]
+    return "ip:" + adresse_client(request)
+
+
+def limite_debit(cout):
+    """
+    Dépendance FastAPI qui applique le seau à jetons à un endpoint.
+
+    Args:
+        cout: Nombre d'évaluations du modèle, ou fonction (request, corps JSON)
+              qui le calcule (ex: nombre de tirages Monte Carlo)
+
+    Passe par `dependencies=[...]` du décorateur de route: les appels internes
+    entre endpoints (ex: /api/sensitivity → calculate) ne sont pas facturés.
+    """
+    async def dependance(request: Request, response: Response):
+        if not RATE_LIMIT:
+            return
+        if callable(cout):
+            try:
+                corps = await request.json()
+            except Exception:
+                corps = {}
+            n = cout(request, corps if isinstance(corps, dict) else {})
+        else:
+            n = cout
+        admis, jetons, n = limiteur.consommer(identifiant_client(request), n)
+        en_tetes = limiteur.en_tetes(jetons, n, admis)
+        if not admis:
+            metrics.record_rate_limited(route_template(request))
+            raise HTTPException(status_code=429, detail="Trop de requêtes: réessayer plus tard", headers=en_tetes)
+        response.headers.update(en_tetes)
+
+    return Depends(dependance)
+
+
+def _entier(valeur, defaut: int) -> int:
+    try:
+        return int(valeur)
+    except (TypeError, ValueError):
+        return defaut
+
+
+def cout_monte_carlo(request: Request, corps: dict) -> int:
+    return min(_entier(request.query_params.get("n_simulations"), 500), 1000)
+
+
+def cout_monte_carlo_avance(request: Request, corps: dict) -> int:
+    return min(_entier(corps.get("n_simulations"), 500), 2000)
+
+
+def cout_optimisation(request: Request, corps: dict) -> int:
+    # Recherche sur le rythme, puis planification par cohortes (horizon + 2)
+    params = corps.get("params") if isinstance(corps.get("params"), dict) else {}
+    horizon = _entier(params.get("horizon"), CalculRequest.model_fields["horizon"].default)
+    return MAX_EVALUATIONS_DEPLOIEMENT + max(horizon, 0) + 2
+
+
+def cout_priorisation(request: Request, corps: dict) -> int:
+    # Identification des coefficients: 3 exécutions, + 4 avec le volet réseau
+    params = corps.get("params") if isinstance(corps.get("params"), dict) else {}
+    return 7 if params.get("reseau_activer") else 3
+
+
+def cout_job(request: Request, corps: dict) -> int:
+    if corps.get("kind") == "monte_carlo":
+        return _entier(corps.get("n_simulations"), 10000)
+    params = corps.get("params")
+    return cout_optimisation(request, params if isinstance(params, dict) else {})
+
+
+def _viabilite(van: float, rbc: float, horizon: int):
+    """Viabilité du projet et recommandation affichée."""
+    viable = van > 0 and rbc > 1
+    if viable:
+        recommandation = f"PROJET VIABLE — VAN positive de {van/1e6:.1f} M$ sur {horizon} ans"
+    elif van > 0:
+        recommandation = f"PROJET MARGINAL — VAN positive mais RBC < 1"
+    else:
+        recommandation = f"PROJET NON RENTABLE — VAN négative de {van/1e6:.1f} M$"
+    return viable, recommandation
+
+
+def _construire_calcul_response(req: CalculRequest, result, persistance: ParametresPersistance) -> CalculResponse:
+    """Formater un ResultatsModele pour le frontend."""
+    # Générer la série alpha
+    serie_alpha = [
+        calculer_alpha_comportement(t, persistance) * 100
+        for t in range(1, req.horizon + 1)
+    ]
+
+    # Déterminer la viabilité et recommandation
+    viable, recommandation = _viabilite(result.van, result.rbc, req.horizon)
+
+    # Retourner les résultats
+    return CalculResponse(
+        van=float(result.van),
+        rbc=float(result.rbc),
+        payback=float(result.periode_recuperation) if result.periode_recuperation != float('inf') else None,
+        lcsw=float(result.lcsw),
+        investissement_initial=float(result.investissement_initial),
+        va_benefices=float(result.va_benefices),
+        va_couts_exploitation=float(result.va_couts_exploitation),
+        va_couts_totaux=float(result.va_couts_totaux),
+        va_benefices_eau=float(result.va_benefices_eau),
+        va_benefices_report_infra=float(result.va_benefices_report_infra),
+        va_benefices_cout_variable=float(result.va_benefices_cout_variable),
+        economie_totale_menage=float(result.economie_totale_menage),
+        economie_comportement_menage=float(result.economie_comportement_menage),
+        economie_fuite_menage=float(result.economie_fuite_menage),
+        usage_base_menage=float(result.usage_base_menage),
+        cout_par_compteur=float(result.cout_par_compteur_ajuste),
+        annees=list(result.annees.astype(int)),
+        van_cumulative=list(result.van_cumulative),
+        serie_alpha=serie_alpha,
+        viable=viable,
+        recommandation=recommandation,
+    )
+
+
+# =============================================================================
+# SCÉNARIOS PRÉCALCULÉS (scenarios_output.json)
+# =============================================================================
+#
+# generate_scenarios_json.py précalcule ville × compteur × persistance ×
+# fuites × mode. Chaque scénario est traduit en la CalculRequest équivalente
+# (autres paramètres par défaut) et indexé par cle_requete: une requête
+# identique est servie par une recherche dans un dict, sans calcul.
+
+
+class TableScenarios:
+    """
+    Réponses précalculées de /api/calculate, chargées au démarrage (lifespan,
+    ou maître gunicorn); à défaut (application sans lifespan), au premier usage.
+    """
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self.reponses: Optional[Dict[str, CalculResponse]] = None
+
+    def get(self, cle: str) -> Optional[CalculResponse]:
+        if self.reponses is None:
+            self.charger()
+        return self.reponses.get(cle)
+
+    def charger(self):
+        """Charger et indexer le fichier; table vide s'il est absent ou périmé."""
+        self.reponses = {}
+        if not self.chemin:
+            return
+        try:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            logger.warning("scenario_table_invalid", path=self.chemin, error=str(e))
+            return
+
+        from generate_scenarios_json import empreinte_entrees
+
+        metadata = data.get("metadata", {})
+        if metadata.get("model_version") != MODEL_VERSION or metadata.get("empreinte_entrees") != empreinte_entrees():
+            logger.warning(
+                "scenario_table_stale", path=self.chemin,
+                file_version=metadata.get("model_version"), model_version=MODEL_VERSION,
+            )
+            return
+
+        reponses = {}
+        for cle_scenario, entree in data["scenarios"].items():
+            try:
+                req = _requete_scenario(data["presets"], cle_scenario)
+                reponses[cle_requete("/api/calculate", req)] = _reponse_precalculee(req, entree)
+            except Exception as e:
+                logger.warning("scenario_table_entry_skipped", scenario=cle_scenario, error=str(e))
+
+        # Garde-fou: un défaut de CalculRequest modifié sans régénérer le
+        # fichier rendrait la traduction fausse. Vérifier le scénario par défaut.
+        req_defaut = CalculRequest()
+        attendu = reponses.get(cle_requete("/api/calculate", req_defaut))
+        if attendu is not None and not math.isclose(attendu.van, _calculer(req_defaut).van, rel_tol=1e-9):
+            logger.warning("scenario_table_stale", path=self.chemin, reason="default_scenario_mismatch")
+            return
+
+        self.reponses = reponses
+        logger.info("scenario_table_loaded", path=self.chemin, scenarios=len(reponses))
+
+
+def _requete_scenario(presets: dict, cle_scenario: str) -> CalculRequest:
+    """Traduire une clé <ville>_<compteur>_<persistance>_<fuites>_<eco|fin>."""
+    ville, compteur, persistance, reste = cle_scenario.split("_", 3)
+    fuites, mode = reste.rsplit("_", 1)
+    p_ville = presets["villes"][ville]
+    p_compteur = presets["compteurs"][compteur]
+    return CalculRequest(
+        nb_menages=p_ville["nb_menages"],
+        taille_menage=p_ville["taille_menage"],
+        lpcd=p_ville["lpcd"],
+        type_compteur=compteur,
+        cout_compteur=p_compteur["cout_compteur"],
+        heures_installation=p_compteur["heures_installation"],
+        taux_horaire=p_compteur["taux_horaire"],
+        cout_reseau=p_compteur["cout_reseau"],
+        persistance=persistance,
+        scenario_fuites=fuites,
+        mode_economique=(mode == "eco"),
+    )
+
+
+def _reponse_precalculee(req: CalculRequest, entree: dict) -> CalculResponse:
+    persistance = get_persistance(req.persistance, req.reduction_comportement)
+    viable, recommandation = _viabilite(entree["van"], entree["rbc"], req.horizon)
+    return CalculResponse(
+        **entree,
+        serie_alpha=[calculer_alpha_comportement(t, persistance) * 100 for t in range(1, req.horizon + 1)],
+        viable=viable,
+        recommandation=recommandation,
+    )
+
+
+table_scenarios = TableScenarios(SCENARIO_TABLE)
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -795,6 +1572,7 @@ async def health():
         "total_requests": total_requests,
         "total_errors": total_errors,
         "last_error": metrics.last_error,
+        "prewarmed": prechauffage["termine"],
     }
 
 
@@ -804,7 +1582,49 @@ async def prometheus_metrics():
     return metrics.get_metrics_prometheus()
 
 
-@app.post("/api/calculate", response_model=CalculResponse)
+def _entrees_modele(req: CalculRequest) -> tuple:
+    """Paramètres, compteur et autres arguments de executer_modele() pour une requête."""
+    params = ParametresModele(
+        nb_menages=req.nb_menages,
+        taille_menage=req.taille_menage,
+        lpcd=req.lpcd,
+        horizon_analyse=req.horizon,
+        taux_actualisation_pct=req.taux_actualisation,
+        reduction_comportement_pct=req.reduction_comportement,
+        benefice_report_infra_annuel=req.benefice_report_infra_annuel,
+        benefice_report_infra_par_m3=req.benefice_report_infra_par_m3,
+    )
+    persistance = get_persistance(
+        req.persistance,
+        req.reduction_comportement,
+        expert_lambda_decay=req.expert_lambda_decay,
+        expert_alpha_plateau=req.expert_alpha_plateau
+    )
+    kwargs = dict(
+        mode_compte=ModeCompte.ECONOMIQUE if req.mode_economique else ModeCompte.FINANCIER,
+        valeur_eau=get_valeur_eau(req),
+        config_echelle=ConfigEconomiesEchelle(activer=req.activer_economies_echelle),
+        persistance=persistance,
+        params_fuites=get_fuites(req.scenario_fuites, req),
+        params_adoption=get_adoption(req),
+        params_fuites_reseau=get_fuites_reseau(req),
+    )
+    return params, get_compteur(req), kwargs
+
+
+def _calculer(req: CalculRequest) -> CalculResponse:
+    """Corps de /api/calculate (exécuté dans un thread, cf. SingleFlight)."""
+    params, compteur, kwargs = _entrees_modele(req)
+
+    # Exécuter le modèle
+    result = executer_modele(params=params, compteur=compteur, **kwargs)
+    metrics.record_model_evaluations("executer_modele")
+
+    with etape("construction_reponse"):
+        return _construire_calcul_response(req, result, kwargs["persistance"])
+
+
+@app.post("/api/calculate", response_model=CalculResponse, dependencies=[limite_debit(1)])
 async def calculate(req: CalculRequest):
     """
     Calcul principal — appelé à chaque changement de slider.
@@ -812,104 +1632,25 @@ async def calculate(req: CalculRequest):
     Reçoit tous les paramètres, appelle le modèle Python,
     retourne les résultats formatés pour le frontend.
     """
-
     try:
-        # Créer les paramètres du modèle
-        params = ParametresModele(
-            nb_menages=req.nb_menages,
-            taille_menage=req.taille_menage,
-            lpcd=req.lpcd,
-            horizon_analyse=req.horizon,
-            taux_actualisation_pct=req.taux_actualisation,
-            reduction_comportement_pct=req.reduction_comportement,
-            benefice_report_infra_annuel=req.benefice_report_infra_annuel,
-            benefice_report_infra_par_m3=req.benefice_report_infra_par_m3,
-        )
-
-        # Créer les autres paramètres
-        compteur = get_compteur(req)
-        persistance = get_persistance(
-            req.persistance,
-            req.reduction_comportement,
-            expert_lambda_decay=req.expert_lambda_decay,
-            expert_alpha_plateau=req.expert_alpha_plateau
-        )
-        fuites = get_fuites(req.scenario_fuites, req)
-
-        # Mode d'analyse
-        mode = ModeCompte.ECONOMIQUE if req.mode_economique else ModeCompte.FINANCIER
-        valeur_eau = get_valeur_eau(req)
-
-        # Économies d'échelle
-        config_echelle = ConfigEconomiesEchelle(activer=req.activer_economies_echelle)
-
-        params_adoption = get_adoption(req)
-        params_fuites_reseau = get_fuites_reseau(req)
-
-        # Exécuter le modèle
-        result = executer_modele(
-            params=params,
-            compteur=compteur,
-            mode_compte=mode,
-            valeur_eau=valeur_eau,
-            config_echelle=config_echelle,
-            persistance=persistance,
-            params_fuites=fuites,
-            params_adoption=params_adoption,
-            params_fuites_reseau=params_fuites_reseau,
-        )
-
-        # Générer la série alpha
-        serie_alpha = [
-            calculer_alpha_comportement(t, persistance) * 100
-            for t in range(1, req.horizon + 1)
-        ]
-
-        # Déterminer la viabilité et recommandation
-        viable = result.van > 0 and result.rbc > 1
-        if viable:
-            recommandation = f"PROJET VIABLE — VAN positive de {result.van/1e6:.1f} M$ sur {req.horizon} ans"
-        elif result.van > 0:
-            recommandation = f"PROJET MARGINAL — VAN positive mais RBC < 1"
-        else:
-            recommandation = f"PROJET NON RENTABLE — VAN négative de {result.van/1e6:.1f} M$"
-
-        # Retourner les résultats
-        return CalculResponse(
-            van=float(result.van),
-            rbc=float(result.rbc),
-            payback=float(result.periode_recuperation) if result.periode_recuperation != float('inf') else None,
-            lcsw=float(result.lcsw),
-            investissement_initial=float(result.investissement_initial),
-            va_benefices=float(result.va_benefices),
-            va_couts_exploitation=float(result.va_couts_exploitation),
-            va_couts_totaux=float(result.va_couts_totaux),
-            va_benefices_eau=float(result.va_benefices_eau),
-            va_benefices_report_infra=float(result.va_benefices_report_infra),
-            va_benefices_cout_variable=float(result.va_benefices_cout_variable),
-            economie_totale_menage=float(result.economie_totale_menage),
-            economie_comportement_menage=float(result.economie_comportement_menage),
-            economie_fuite_menage=float(result.economie_fuite_menage),
-            usage_base_menage=float(result.usage_base_menage),
-            cout_par_compteur=float(result.cout_par_compteur_ajuste),
-            annees=list(result.annees.astype(int)),
-            van_cumulative=list(result.van_cumulative),
-            serie_alpha=serie_alpha,
-            viable=viable,
-            recommandation=recommandation,
-        )
-
+        cle = cle_requete("/api/calculate", req)
+        precalcule = table_scenarios.get(cle)
+        if precalcule is not None:
+            metrics.record_cache_hit("scenarios_precalcules")
+            return precalcule
+        return await calculs_en_cours.executer("/api/calculate", cle, _calculer, req)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/sensitivity", response_model=SensitivityResponse)
-async def sensitivity(req: CalculRequest):
+@app.post("/api/sensitivity", response_model=SensitivityResponse, dependencies=[limite_debit(11)])
+async def sensitivity(req: CalculRequest, request: Request):
     """
     Analyse de sensibilité — variation ±10% des paramètres clés.
 
     Retourne l'impact de chaque paramètre sur la VAN.
     """
+    veille = surveiller_deconnexion(request)
 
     try:
         # Calcul de base
@@ -928,6 +1669,10 @@ async def sensitivity(req: CalculRequest):
         results = []
 
         for param_key, param_nom, base_val in params_to_vary:
+            if veille.done():
+                metrics.record_cancelled("/api/sensitivity")
+                return Response(status_code=STATUS_CLIENT_CLOSED)
+
             # -10%
             req_low = req.model_copy()
             setattr(req_low, param_key, base_val * 0.9 if param_key != "nb_menages" else int(base_val * 0.9))
@@ -957,6 +1702,210 @@ async def sensitivity(req: CalculRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        veille.cancel()
+
+
+def _gradient_van(req: CalculRequest, base) -> Dict[str, float]:
+    """∂VAN/∂champ pour les champs de CalculRequest où la VAN est linéaire (un à la fois)."""
+    q, mix = base.quantites, base.multiplicateurs
+    gradient = {
+        "benefice_report_infra_par_m3": q["m3_economises"],
+        "benefice_report_infra_annuel": q["annees_adoption"],
+        "cout_compteur": -mix["capex"] * q["compteurs_equipement"],
+        "heures_installation": -mix["capex"] * q["compteurs_installation"] * req.taux_horaire,
+        "taux_horaire": -mix["capex"] * q["compteurs_installation"] * req.heures_installation,
+    }
+    if (req.valeur_eau_preset or "custom").strip().lower() == "custom":
+        gradient["valeur_sociale" if req.mode_economique else "cout_variable"] = q["m3_economises"]
+    if req.type_compteur == "ami":
+        gradient["cout_reseau"] = -mix["capex"] * q["compteurs_reseau"]
+        gradient["cout_infra_fixe"] = -mix["capex"] * q["infra_fixe"]
+        gradient["cout_opex_non_tech_ami"] = -mix["opex"] * q["compteurs_annees"]
+    return gradient
+
+
+def _base_van(req: CalculRequest) -> dict:
+    """Corps de /api/van_basis (exécuté dans un thread)."""
+    params, compteur, kwargs = _entrees_modele(req)
+    base = calculer_base_van(params, compteur, **kwargs)
+    metrics.record_model_evaluations("calculer_base_van")
+    reponse = base.vers_dict()
+    reponse["gradient"] = _gradient_van(req, base)
+    return reponse
+
+
+@app.post("/api/van_basis", dependencies=[limite_debit(1)])
+async def van_basis(req: CalculRequest):
+    """
+    Base linéaire de la VAN — quantités actualisées et prix unitaires.
+
+    VAN = Σ quantites × prix. Le client recalcule la VAN pour d'autres
+    valeurs de l'eau, coûts unitaires, OPEX, report d'infrastructure, parts
+    ou MCF sans appeler le modèle; `gradient` donne directement ∂VAN/∂champ
+    pour les champs de la requête où la VAN est linéaire.
+    """
+    try:
+        return await asyncio.to_thread(_base_van, req)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        metrics.record_error("/api/van_basis", type(e).__name__, str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Champs numériques exclus des seuils (paramètres de simulation, pas du modèle)
+CHAMPS_SANS_SEUIL = ("mc_seed", "mc_n_simulations")
+
+
+def _type_numerique(nom: str):
+    """int ou float pour un champ numérique de CalculRequest, sinon None."""
+    champ = CalculRequest.model_fields.get(nom)
+    if champ is None or nom in CHAMPS_SANS_SEUIL:
+        return None
+    types = [t for t in (get_args(champ.annotation) or (champ.annotation,)) if t is not type(None)]
+    return types[0] if len(types) == 1 and types[0] in (int, float) else None
+
+
+def _bornes_champ(nom: str):
+    """Bornes de validation (ge, le) d'un champ de CalculRequest, None si absentes."""
+    ge = le = None
+    for contrainte in CalculRequest.model_fields[nom].metadata:
+        ge = getattr(contrainte, "ge", ge)
+        le = getattr(contrainte, "le", le)
+    return ge, le
+
+
+# Champs résolus par défaut: numériques, toujours renseignés, à bornes finies
+CHAMPS_SEUILS = tuple(
+    nom for nom, champ in CalculRequest.model_fields.items()
+    if _type_numerique(nom) is not None and champ.default is not None and None not in _bornes_champ(nom)
+)
+
+
+def cout_seuils(request: Request, corps: dict) -> int:
+    champs = corps.get("champs")
+    return 8 * (len(champs) if isinstance(champs, list) and champs else len(CHAMPS_SEUILS))
+
+
+def _borne_valide(f, borne: float, actuelle: float, iterations: int = 20) -> float:
+    """
+    Point le plus proche de `borne` que le modèle accepte.
+
+    Certaines bornes de validation sont plus larges que le domaine du modèle
+    (ex: réduction comportementale sous le plateau de persistance): bissection
+    entre la borne et la valeur actuelle, valide.
+    """
+    try:
+        f(borne)
+        return borne
+    except ValueError:
+        pass
+    valide, invalide = float(actuelle), borne
+    for _ in range(iterations):
+        milieu = 0.5 * (valide + invalide)
+        try:
+            f(milieu)
+            valide = milieu
+        except ValueError:
+            invalide = milieu
+    return valide
+
+
+def _seuils(req: BreakEvenRequest) -> dict:
+    """Corps de /api/break_even (exécuté dans un thread)."""
+    calc_req = CalculRequest(**req.params)
+    champs = req.champs or list(CHAMPS_SEUILS)
+    inconnus = [nom for nom in champs if _type_numerique(nom) is None]
+    if inconnus:
+        raise HTTPException(status_code=422, detail=f"Champs non numériques ou inconnus: {inconnus}")
+
+    bornes = {}
+    for nom in champs:
+        ge, le = req.bornes.get(nom) or _bornes_champ(nom)
+        if ge is None or le is None or not ge < le:
+            raise HTTPException(status_code=422, detail=f"{nom}: intervalle de recherche à préciser dans bornes")
+        bornes[nom] = (float(ge), float(le))
+
+    def van(nom, entier):
+        cache = {}
+
+        def f(x):
+            x = round(x) if entier else x
+            if x not in cache:
+                params, compteur, kwargs = _entrees_modele(calc_req.model_copy(update={nom: x}))
+                metrics.record_model_evaluations("executer_modele")
+                cache[x] = float(executer_modele(params=params, compteur=compteur, **kwargs).van)
+            return cache[x]
+        return f, cache
+
+    params, compteur, kwargs = _entrees_modele(calc_req)
+    van_base = float(executer_modele(params=params, compteur=compteur, **kwargs).van)
+    metrics.record_model_evaluations("executer_modele")
+
+    lignes = []
+    for nom in champs:
+        entier = _type_numerique(nom) is int
+        actuelle = getattr(calc_req, nom)
+        f, cache = van(nom, entier)
+        borne_min, borne_max = (_borne_valide(f, borne, actuelle) for borne in bornes[nom])
+        if not borne_min < borne_max:
+            raise HTTPException(status_code=422, detail=f"{nom}: aucun intervalle valide autour de {actuelle}")
+        seuil = chercher_seuil(
+            f, borne_min, borne_max,
+            valeur_actuelle=actuelle, xtol=1e-3 if entier else None,
+        )
+        valeur = seuil.valeur
+        if valeur is not None and entier:
+            # Premier entier au-delà du changement de signe
+            valeur = math.ceil(valeur - 1e-9)
+        lignes.append({
+            "champ": nom,
+            "description": CalculRequest.model_fields[nom].description,
+            "valeur_actuelle": actuelle,
+            "seuil": None if valeur is None else round(valeur, 6),
+            "ecart_pct": (
+                round(100.0 * (valeur - actuelle) / actuelle, 2)
+                if valeur is not None and actuelle else None
+            ),
+            "statut": seuil.statut,
+            "methode": seuil.methode,
+            "evaluations": len(cache),
+            "borne_min": borne_min,
+            "borne_max": borne_max,
+            "van_borne_min": round(seuil.van_borne_min, 2),
+            "van_borne_max": round(seuil.van_borne_max, 2),
+        })
+
+    # Tableau en tornade: plus grande amplitude de VAN sur l'intervalle en tête
+    lignes.sort(key=lambda l: abs(l["van_borne_max"] - l["van_borne_min"]), reverse=True)
+    return {
+        "van_base": van_base,
+        "seuils": lignes,
+        "nb_seuils_trouves": sum(l["statut"] == STATUT_TROUVE for l in lignes),
+        "evaluations": 1 + sum(l["evaluations"] for l in lignes),
+    }
+
+
+@app.post("/api/break_even", dependencies=[limite_debit(cout_seuils)])
+async def break_even(req: BreakEvenRequest):
+    """
+    Seuils de rentabilité — valeur de chaque paramètre qui annule la VAN.
+
+    Pour chaque champ numérique demandé (défaut: tous les champs bornés de
+    CalculRequest), les autres paramètres restant fixés: forme fermée si la
+    VAN est affine en ce paramètre, méthode de Brent sinon. Le tableau est
+    trié par amplitude de VAN sur l'intervalle (tornade).
+    """
+    try:
+        return await asyncio.to_thread(_seuils, req)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        metrics.record_error("/api/break_even", type(e).__name__, str(e))
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/presets")
@@ -1007,7 +1956,26 @@ def valeur_eau_presets():
     }
 
 
-@app.post("/api/validate_calibration")
+_SPEC_NOYAU: Optional[dict] = None
+
+
+@app.get("/api/kernel_spec")
+def kernel_spec():
+    """Spécification de noyau.js: défauts et tables pour traduire une requête /api/calculate.
+
+    Le client recalcule localement la réponse de /api/calculate à chaque
+    changement de paramètre; le serveur reste la référence (Monte Carlo,
+    sensibilité, séries détaillées).
+    """
+    global _SPEC_NOYAU
+    if _SPEC_NOYAU is None:
+        spec = spec_noyau(SCENARIOS_FUITES_API, STRATEGIES_ADOPTION, PRESETS_VALEUR_EAU)
+        spec["requete"] = CalculRequest().model_dump()
+        _SPEC_NOYAU = spec
+    return _SPEC_NOYAU
+
+
+@app.post("/api/validate_calibration", dependencies=[limite_debit(1)])
 async def validate_calibration(req: CalculRequest):
     try:
         params = ParametresModele(
@@ -1064,7 +2032,7 @@ async def validate_calibration(req: CalculRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/compare_meters")
+@app.post("/api/compare_meters", dependencies=[limite_debit(3)])
 async def compare_meters(req: CalculRequest):
     """Comparer les trois types de compteurs."""
 
@@ -1093,7 +2061,7 @@ async def compare_meters(req: CalculRequest):
     return results
 
 
-@app.post("/api/compare_persistence")
+@app.post("/api/compare_persistence", dependencies=[limite_debit(3)])
 async def compare_persistence(req: CalculRequest):
     """Comparer les scénarios de persistance."""
 
@@ -1113,7 +2081,7 @@ async def compare_persistence(req: CalculRequest):
     return results
 
 
-@app.post("/api/detailed_series")
+@app.post("/api/detailed_series", dependencies=[limite_debit(1)])
 async def detailed_series(req: CalculRequest):
     """
     Retourner les séries détaillées pour les graphiques avancés.
@@ -1150,6 +2118,7 @@ async def detailed_series(req: CalculRequest):
             nb_menages=req.nb_menages,
             horizon=req.horizon,
         )
+        metrics.record_model_evaluations("dynamique_fuites")
 
         # Générer la série alpha (comportement)
         serie_alpha = [
@@ -1235,7 +2204,7 @@ async def detailed_series(req: CalculRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/compare_fuites")
+@app.post("/api/compare_fuites", dependencies=[limite_debit(3)])
 async def compare_fuites(req: CalculRequest):
     """
     Comparer les trois scénarios de fuites.
@@ -1276,95 +2245,79 @@ async def compare_fuites(req: CalculRequest):
     return results
 
 
-@app.post("/api/monte_carlo")
-async def monte_carlo(req: CalculRequest, n_simulations: int = 500, seed: int = 42):
-    """
-    Exécuter une simulation Monte Carlo.
-
-    Retourne la distribution de la VAN et les statistiques associées.
-    """
-    try:
-        # Créer les paramètres de base
-        params = ParametresModele(
-            nb_menages=req.nb_menages,
-            taille_menage=req.taille_menage,
-            lpcd=req.lpcd,
-            horizon_analyse=req.horizon,
-            taux_actualisation_pct=req.taux_actualisation,
-            reduction_comportement_pct=req.reduction_comportement,
-            benefice_report_infra_annuel=req.benefice_report_infra_annuel,
-            benefice_report_infra_par_m3=req.benefice_report_infra_par_m3,
-        )
-
-        compteur = get_compteur(req)
-        persistance = get_persistance(
-            req.persistance,
-            req.reduction_comportement,
-            expert_lambda_decay=req.expert_lambda_decay,
-            expert_alpha_plateau=req.expert_alpha_plateau
-        )
-        fuites = get_fuites(req.scenario_fuites, req)
+def _executer_monte_carlo(req: CalculRequest, n_simulations: int, seed: int, annulation=None) -> dict:
+    """Corps de /api/monte_carlo (exécuté dans un thread, cf. SingleFlight)."""
+    # Mêmes entrées que /api/calculate
+    params, compteur, kwargs = _entrees_modele(req)
 
-        mode = ModeCompte.ECONOMIQUE if req.mode_economique else ModeCompte.FINANCIER
-        valeur_eau = get_valeur_eau(req)
+    # Configuration Monte Carlo
+    config_mc = ParametresMonteCarlo(
+        distributions=DISTRIBUTIONS_DEFAUT,
+        n_simulations=min(n_simulations, 1000),  # Limiter pour performance
+        seed=seed,
+    )
 
-        params_adoption = get_adoption(req)
-        params_fuites_reseau = get_fuites_reseau(req)
+    # Exécuter Monte Carlo
+    resultats_mc = simuler_monte_carlo(
+        params_base=params,
+        compteur_base=compteur,
+        config_mc=config_mc,
+        afficher_progression=False,
+        annulation=annulation,
+        **kwargs,
+    )
+    metrics.record_model_evaluations("executer_modele", config_mc.n_simulations)
+    metrics.record_mc_draws(config_mc.n_simulations)
 
-        # Configuration Monte Carlo
-        config_mc = ParametresMonteCarlo(
-            distributions=DISTRIBUTIONS_DEFAUT,
-            n_simulations=min(n_simulations, 1000),  # Limiter pour performance
-            seed=seed,
-        )
+    # Calculer l'histogramme pour le frontend
+    van_values = resultats_mc.van_simulations
+    hist, bin_edges = np.histogram(van_values, bins=30)
+    bin_centers = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(hist))]
 
-        # Exécuter Monte Carlo
-        resultats_mc = simuler_monte_carlo(
-            params_base=params,
-            compteur_base=compteur,
-            config_mc=config_mc,
-            mode_compte=mode,
-            valeur_eau=valeur_eau,
-            afficher_progression=False,
-            persistance=persistance,
-            params_fuites=fuites,
-            params_adoption=params_adoption,
-            params_fuites_reseau=params_fuites_reseau,
-        )
+    return {
+        "n_simulations": resultats_mc.n_simulations,
+        "van_moyenne": float(resultats_mc.van_moyenne),
+        "van_mediane": float(resultats_mc.van_mediane),
+        "van_std": float(resultats_mc.van_ecart_type),
+        "prob_van_positive": float(resultats_mc.prob_van_positive),
+        "percentiles": {
+            "p5": float(resultats_mc.percentile_5),
+            "p25": float(resultats_mc.percentile_25),
+            "p50": float(resultats_mc.van_mediane),
+            "p75": float(resultats_mc.percentile_75),
+            "p95": float(resultats_mc.percentile_95),
+        },
+        "histogram": {
+            "counts": hist.tolist(),
+            "bin_centers": [float(x) for x in bin_centers],
+            "bin_edges": [float(x) for x in bin_edges],
+        },
+        "correlations": [
+            {"param": k, "correlation": float(v)}
+            for k, v in sorted(
+                resultats_mc.correlations.items(),
+                key=lambda x: abs(x[1]),
+                reverse=True
+            )[:8]  # Top 8 paramètres
+        ] if resultats_mc.correlations else [],
+    }
 
-        # Calculer l'histogramme pour le frontend
-        van_values = resultats_mc.van_simulations
-        hist, bin_edges = np.histogram(van_values, bins=30)
-        bin_centers = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(hist))]
 
-        return {
-            "n_simulations": resultats_mc.n_simulations,
-            "van_moyenne": float(resultats_mc.van_moyenne),
-            "van_mediane": float(resultats_mc.van_mediane),
-            "van_std": float(resultats_mc.van_ecart_type),
-            "prob_van_positive": float(resultats_mc.prob_van_positive),
-            "percentiles": {
-                "p5": float(resultats_mc.percentile_5),
-                "p25": float(resultats_mc.percentile_25),
-                "p50": float(resultats_mc.van_mediane),
-                "p75": float(resultats_mc.percentile_75),
-                "p95": float(resultats_mc.percentile_95),
-            },
-            "histogram": {
-                "counts": hist.tolist(),
-                "bin_centers": [float(x) for x in bin_centers],
-                "bin_edges": [float(x) for x in bin_edges],
-            },
-            "correlations": [
-                {"param": k, "correlation": float(v)}
-                for k, v in sorted(
-                    resultats_mc.correlations.items(),
-                    key=lambda x: abs(x[1]),
-                    reverse=True
-                )[:8]  # Top 8 paramètres
-            ] if resultats_mc.correlations else [],
-        }
+@app.post("/api/monte_carlo", dependencies=[limite_debit(cout_monte_carlo)])
+async def monte_carlo(req: CalculRequest, request: Request, n_simulations: int = 500, seed: int = 42):
+    """
+    Exécuter une simulation Monte Carlo.
 
+    Retourne la distribution de la VAN et les statistiques associées.
+    """
+    try:
+        cle = cle_requete("/api/monte_carlo", req, n_simulations=n_simulations, seed=seed)
+        return await calculs_en_cours.executer(
+            "/api/monte_carlo", cle, _executer_monte_carlo, req, n_simulations, seed,
+            request=request,
+        )
+    except RequeteAbandonnee:
+        return Response(status_code=STATUS_CLIENT_CLOSED)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1391,128 +2344,117 @@ async def get_distributions():
     return result
 
 
-@app.post("/api/monte_carlo_advanced")
-async def monte_carlo_advanced(req: MonteCarloRequest):
-    """
-    Monte Carlo avec distributions personnalisées.
+def _executer_monte_carlo_avance(
+    req: MonteCarloRequest, annulation=None, progression=None, max_simulations: int = 2000
+) -> dict:
+    """Corps de /api/monte_carlo_advanced (exécuté dans un thread, cf. SingleFlight).
 
-    Permet de configurer les distributions pour chaque paramètre.
+    Les jobs (/api/jobs) l'appellent avec une limite de tirages plus haute.
     """
-    try:
-        # Convertir les params dict en CalculRequest
-        calc_req = CalculRequest(**req.params)
-
-        # Créer les paramètres de base
-        params = ParametresModele(
-            nb_menages=calc_req.nb_menages,
-            taille_menage=calc_req.taille_menage,
-            lpcd=calc_req.lpcd,
-            horizon_analyse=calc_req.horizon,
-            taux_actualisation_pct=calc_req.taux_actualisation,
-            reduction_comportement_pct=calc_req.reduction_comportement,
-            benefice_report_infra_annuel=calc_req.benefice_report_infra_annuel,
-            benefice_report_infra_par_m3=calc_req.benefice_report_infra_par_m3,
-        )
+    # Convertir les params dict en CalculRequest
+    calc_req = CalculRequest(**req.params)
+
+    # Mêmes entrées que /api/calculate
+    params, compteur, kwargs = _entrees_modele(calc_req)
+
+    # Construire les distributions
+    distributions = DISTRIBUTIONS_DEFAUT.copy()
+
+    if req.distributions_custom:
+        for d in req.distributions_custom:
+            distributions[d.nom] = DistributionParametre(
+                nom=d.nom,
+                type_distribution=d.type_distribution,
+                min_val=d.min_val,
+                mode_val=d.mode_val,
+                max_val=d.max_val,
+                moyenne=d.moyenne,
+                ecart_type=d.ecart_type,
+            )
 
-        compteur = get_compteur(calc_req)
-        persistance = get_persistance(
-            calc_req.persistance,
-            calc_req.reduction_comportement,
-            expert_lambda_decay=calc_req.expert_lambda_decay,
-            expert_alpha_plateau=calc_req.expert_alpha_plateau
-        )
-        fuites = get_fuites(calc_req.scenario_fuites, calc_req)
-
-        mode = ModeCompte.ECONOMIQUE if calc_req.mode_economique else ModeCompte.FINANCIER
-        valeur_eau = get_valeur_eau(calc_req)
-
-        params_adoption = get_adoption(calc_req)
-        params_fuites_reseau = get_fuites_reseau(calc_req)
-
-        # Construire les distributions
-        distributions = DISTRIBUTIONS_DEFAUT.copy()
-
-        if req.distributions_custom:
-            for d in req.distributions_custom:
-                distributions[d.nom] = DistributionParametre(
-                    nom=d.nom,
-                    type_distribution=d.type_distribution,
-                    min_val=d.min_val,
-                    mode_val=d.mode_val,
-                    max_val=d.max_val,
-                    moyenne=d.moyenne,
-                    ecart_type=d.ecart_type,
-                )
-
-        # Configuration Monte Carlo
-        config_mc = ParametresMonteCarlo(
-            distributions=distributions,
-            n_simulations=min(req.n_simulations, 2000),
-            seed=req.seed,
-        )
+    # Configuration Monte Carlo
+    config_mc = ParametresMonteCarlo(
+        distributions=distributions,
+        n_simulations=min(req.n_simulations, max_simulations),
+        seed=req.seed,
+    )
 
-        # Exécuter Monte Carlo
-        resultats_mc = simuler_monte_carlo(
-            params_base=params,
-            compteur_base=compteur,
-            config_mc=config_mc,
-            mode_compte=mode,
-            valeur_eau=valeur_eau,
-            afficher_progression=False,
-            persistance=persistance,
-            params_fuites=fuites,
-            params_adoption=params_adoption,
-            params_fuites_reseau=params_fuites_reseau,
-        )
+    # Exécuter Monte Carlo
+    resultats_mc = simuler_monte_carlo(
+        params_base=params,
+        compteur_base=compteur,
+        config_mc=config_mc,
+        afficher_progression=False,
+        annulation=annulation,
+        progression=progression,
+        **kwargs,
+    )
+    metrics.record_model_evaluations("executer_modele", config_mc.n_simulations)
+    metrics.record_mc_draws(config_mc.n_simulations)
 
-        # Calculer l'histogramme
-        van_values = resultats_mc.van_simulations
-        hist, bin_edges = np.histogram(van_values, bins=30)
-        bin_centers = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(hist))]
+    # Calculer l'histogramme
+    van_values = resultats_mc.van_simulations
+    hist, bin_edges = np.histogram(van_values, bins=30)
+    bin_centers = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(hist))]
 
-        return {
-            "n_simulations": resultats_mc.n_simulations,
-            "van_moyenne": float(resultats_mc.van_moyenne),
-            "van_mediane": float(resultats_mc.van_mediane),
-            "van_std": float(resultats_mc.van_ecart_type),
-            "prob_van_positive": float(resultats_mc.prob_van_positive),
-            "percentiles": {
-                "p5": float(resultats_mc.percentile_5),
-                "p25": float(resultats_mc.percentile_25),
-                "p50": float(resultats_mc.van_mediane),
-                "p75": float(resultats_mc.percentile_75),
-                "p95": float(resultats_mc.percentile_95),
-            },
-            "histogram": {
-                "counts": hist.tolist(),
-                "bin_centers": [float(x) for x in bin_centers],
-                "bin_edges": [float(x) for x in bin_edges],
-            },
-            "correlations": [
-                {"param": k, "correlation": float(v)}
-                for k, v in sorted(
-                    resultats_mc.correlations.items(),
-                    key=lambda x: abs(x[1]),
-                    reverse=True
-                )[:8]
-            ] if resultats_mc.correlations else [],
-            "distributions_used": {
-                nom: {
-                    "type": d.type_distribution,
-                    "min": d.min_val,
-                    "mode": d.mode_val,
-                    "max": d.max_val,
-                }
-                for nom, d in distributions.items()
+    return {
+        "n_simulations": resultats_mc.n_simulations,
+        "van_moyenne": float(resultats_mc.van_moyenne),
+        "van_mediane": float(resultats_mc.van_mediane),
+        "van_std": float(resultats_mc.van_ecart_type),
+        "prob_van_positive": float(resultats_mc.prob_van_positive),
+        "percentiles": {
+            "p5": float(resultats_mc.percentile_5),
+            "p25": float(resultats_mc.percentile_25),
+            "p50": float(resultats_mc.van_mediane),
+            "p75": float(resultats_mc.percentile_75),
+            "p95": float(resultats_mc.percentile_95),
+        },
+        "histogram": {
+            "counts": hist.tolist(),
+            "bin_centers": [float(x) for x in bin_centers],
+            "bin_edges": [float(x) for x in bin_edges],
+        },
+        "correlations": [
+            {"param": k, "correlation": float(v)}
+            for k, v in sorted(
+                resultats_mc.correlations.items(),
+                key=lambda x: abs(x[1]),
+                reverse=True
+            )[:8]
+        ] if resultats_mc.correlations else [],
+        "distributions_used": {
+            nom: {
+                "type": d.type_distribution,
+                "min": d.min_val,
+                "mode": d.mode_val,
+                "max": d.max_val,
             }
+            for nom, d in distributions.items()
         }
+    }
+
 
+@app.post("/api/monte_carlo_advanced", dependencies=[limite_debit(cout_monte_carlo_avance)])
+async def monte_carlo_advanced(req: MonteCarloRequest, request: Request):
+    """
+    Monte Carlo avec distributions personnalisées.
+
+    Permet de configurer les distributions pour chaque paramètre.
+    """
+    try:
+        return await calculs_en_cours.executer(
+            "/api/monte_carlo_advanced", cle_requete("/api/monte_carlo_advanced", req),
+            _executer_monte_carlo_avance, req, request=request,
+        )
+    except RequeteAbandonnee:
+        return Response(status_code=STATUS_CLIENT_CLOSED)
     except Exception as e:
         metrics.record_error("/api/monte_carlo_advanced", type(e).__name__, str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/perspectives")
+@app.post("/api/perspectives", dependencies=[limite_debit(1)])
 async def perspectives(req: CalculRequest):
     """
     Retourner la décomposition de la VAN par payeur: économique, ville, ménages.
@@ -1553,6 +2495,7 @@ async def perspectives(req: CalculRequest):
             valeur_eau=valeur_eau,
             params_adoption=params_adoption,
         )
+        metrics.record_model_evaluations("decomposer_par_payeur")
 
         return {
             "van_economique": float(result.van_economique),
@@ -1620,7 +2563,7 @@ class OptimizationRequest(BaseModel):
     horizon_deploiement: int = Field(10, ge=1, le=20, description="Horizon de déploiement (années)")
 
 
-@app.post("/api/calibrate_from_data")
+@app.post("/api/calibrate_from_data", dependencies=[limite_debit(1)])
 async def calibrate_from_data(req: CalibrationData):
     """
     Calibrer les paramètres à partir de données de consommation.
@@ -1725,108 +2668,590 @@ async def calibrate_from_data(req: CalibrationData):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/optimize_deployment")
+def _optimiser_deploiement(req: OptimizationRequest) -> dict:
+    """Corps de /api/optimize_deployment (exécuté dans un thread ou un job)."""
+    if req.objectif not in OBJECTIFS_DEPLOIEMENT:
+        raise HTTPException(status_code=422, detail=f"objectif doit être parmi {list(OBJECTIFS_DEPLOIEMENT)}")
+    calc_req = CalculRequest(**req.params)
+    params, compteur, kwargs = _entrees_modele(calc_req)
+    params_adoption = kwargs.pop("params_adoption")
+
+    try:
+        resultats = optimiser_deploiement(
+            params,
+            compteur,
+            req.budget_annuel_max,
+            req.capacite_installation_max,
+            horizon_deploiement=req.horizon_deploiement,
+            objectif=req.objectif,
+            params_adoption=params_adoption,
+            **kwargs,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    metrics.record_model_evaluations("executer_modele", resultats.n_evaluations)
+
+    optimal = resultats.optimal.vers_dict()
+    return {
+        "optimal": optimal,
+        "scenarios": [p.vers_dict() for p in sorted(resultats.plans, key=lambda p: -p.van)],
+        "pareto": [p.vers_dict() for p in resultats.pareto],
+        "evaluations": resultats.n_evaluations,
+        "contraintes": {
+            "budget_annuel_max": req.budget_annuel_max,
+            "capacite_installation_max": req.capacite_installation_max,
+            "horizon_deploiement": req.horizon_deploiement,
+            "cout_unitaire": resultats.investissement_par_compteur,
+            "compteurs_min_horizon": resultats.rythme_min,
+            "compteurs_max_budget": int(req.budget_annuel_max / resultats.investissement_par_compteur),
+            "compteurs_effectifs": resultats.rythme_max,
+        },
+        "recommandation": f"Déployer {optimal['compteurs_par_an']:,} compteurs/an sur {optimal['annees_deploiement']} ans",
+    }
+
+
+@app.post("/api/optimize_deployment", dependencies=[limite_debit(cout_optimisation)])
 async def optimize_deployment(req: OptimizationRequest):
     """
     Trouver la trajectoire de déploiement optimale sous contraintes.
 
-    Optimise le rythme de déploiement pour maximiser la VAN
-    ou minimiser le payback sous contraintes de budget et capacité.
+    Cherche le rythme d'installation annuel qui maximise la VAN ou minimise
+    le payback sous contraintes de budget annuel, de capacité et d'horizon,
+    et retourne le front de Pareto VAN / payback / budget de pointe.
     """
     try:
-        calc_req = CalculRequest(**req.params)
+        return await asyncio.to_thread(_optimiser_deploiement, req)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # Dont pydantic.ValidationError: paramètres de calcul invalides
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        metrics.record_error("/api/optimize_deployment", type(e).__name__, str(e))
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Coût par compteur
-        cout_unitaire = (
-            calc_req.cout_compteur +
-            calc_req.heures_installation * calc_req.taux_horaire +
-            calc_req.cout_reseau
-        )
 
-        # Calcul du nombre max de compteurs par an selon contraintes
-        compteurs_budget = int(req.budget_annuel_max / cout_unitaire)
-        compteurs_par_an = min(compteurs_budget, req.capacite_installation_max)
+# =============================================================================
+# PRIORISATION PROVINCIALE
+# =============================================================================
+
+class PriorisationRequest(BaseModel):
+    """Paramètres pour la priorisation des municipalités à équiper."""
+    params: dict = Field(default_factory=dict, description="Paramètres de calcul communs (ménages et lpcd ignorés)")
+    budget: float = Field(..., gt=0, description="Budget de subvention ($), imputé à l'investissement initial")
+    capacite_compteurs: Optional[int] = Field(None, ge=1, description="Compteurs installables au total")
+    objectif: str = Field("van", description="Objectif: van ou m3 (m³ économisés actualisés)")
+    limite: int = Field(100, ge=1, le=2000, description="Municipalités retournées (par priorité)")
+
+
+class TableMunicipalites:
+    """Municipalités de municipalities-stats.json, chargées au premier usage."""
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self.municipalites = None
+        self.exclues: Dict[str, str] = {}
+        self._verrou = threading.Lock()
+
+    def get(self):
+        with self._verrou:
+            if self.municipalites is None:
+                try:
+                    self.municipalites, self.exclues = charger_municipalites(self.chemin)
+                except (OSError, ValueError) as e:
+                    logger.warning("municipalities_stats_unavailable", path=self.chemin, error=str(e))
+                    raise HTTPException(status_code=503, detail="Données municipales indisponibles")
+                logger.info("municipalities_stats_loaded", path=self.chemin,
+                            municipalites=len(self.municipalites), exclues=len(self.exclues))
+        return self.municipalites, self.exclues
+
+
+table_municipalites = TableMunicipalites(MUNICIPALITIES_STATS)
+
+
+def _prioriser(req: PriorisationRequest) -> dict:
+    """Corps de /api/prioritize (exécuté dans un thread)."""
+    if req.objectif not in OBJECTIFS_PRIORISATION:
+        raise HTTPException(status_code=422, detail=f"objectif doit être parmi {list(OBJECTIFS_PRIORISATION)}")
+    calc_req = CalculRequest(**req.params)
+    if calc_req.activer_economies_echelle:
+        raise HTTPException(status_code=422, detail="Économies d'échelle non prises en charge par la priorisation")
+    municipalites, exclues = table_municipalites.get()
+
+    # Mêmes entrées que /api/calculate; ménages, taille des ménages et lpcd
+    # viennent de chaque municipalité
+    params, compteur, kwargs = _entrees_modele(calc_req)
+    defaut = ParametresModele()
+    base = replace(params, nb_menages=defaut.nb_menages, taille_menage=defaut.taille_menage, lpcd=defaut.lpcd)
+    kwargs.pop("config_echelle")
+    resultats = evaluer_municipalites(municipalites, compteur, base=base, exclues=exclues, **kwargs)
+    metrics.record_model_evaluations("evaluer_municipalites")
+
+    priorisation = prioriser_municipalites(
+        resultats,
+        np.array([m.nb_menages for m in municipalites]),
+        req.budget,
+        capacite_compteurs=req.capacite_compteurs,
+        objectif=req.objectif,
+    )
+    reponse = priorisation.vers_dict()
+    reponse["selection"] = reponse["selection"][:req.limite]
+    reponse["municipalites_evaluees"] = len(resultats)
+    reponse["municipalites_exclues"] = len(exclues)
+    return reponse
+
+
+@app.post("/api/prioritize", dependencies=[limite_debit(cout_priorisation)])
+async def prioritize(req: PriorisationRequest):
+    """
+    Prioriser les municipalités à équiper sous un budget provincial.
+
+    Évalue toutes les municipalités de la carte avec les paramètres communs,
+    puis sélectionne celles qui maximisent la VAN totale (ou les m³
+    économisés) sous contraintes de budget et de capacité d'installation.
+    """
+    try:
+        return await asyncio.to_thread(_prioriser, req)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # Dont pydantic.ValidationError: paramètres de calcul invalides
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        metrics.record_error("/api/prioritize", type(e).__name__, str(e))
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Années nécessaires pour déployer tous les compteurs
-        annees_deploiement = math.ceil(calc_req.nb_menages / compteurs_par_an)
 
-        # Générer plusieurs scénarios de déploiement
-        scenarios = []
+# =============================================================================
+# JOBS ASYNCHRONES (calculs longs hors requête)
+# =============================================================================
+#
+# Les endpoints synchrones limitent le Monte Carlo à 1000/2000 tirages pour
+# répondre en quelques secondes. Les études plus lourdes (100 000 tirages,
+# optimisation du déploiement) sont soumises comme jobs:
+#
+#   POST   /api/jobs        → 202 + identifiant
+#   GET    /api/jobs/{id}   → statut, progression, résultat une fois terminé
+#   DELETE /api/jobs/{id}   → demande d'annulation
+#
+# Les calculs tournent dans un pool de processus (hors GIL, donc sans ralentir
+# la boucle d'événements) et écrivent statut et résultat sur disque: n'importe
+# quel worker de l'API peut répondre au GET, et les résultats survivent à un
+# redémarrage jusqu'à expiration (JOBS_TTL_S): un job expiré est introuvable
+# dès expires_at et supprimé par la purge périodique.
+
+JOB_KINDS = ("monte_carlo", "optimize_deployment")
+JOB_TERMINAUX = ("succeeded", "failed", "cancelled")
+# Intervalle minimal entre deux écritures de la progression sur disque (s)
+JOB_INTERVALLE_PROGRESSION_S = 0.5
+
+
+class JobRequest(BaseModel):
+    """Soumission d'un calcul long exécuté en arrière-plan."""
+    kind: str = Field(..., description="monte_carlo ou optimize_deployment")
+    params: dict = Field(
+        ...,
+        description="monte_carlo: paramètres de calcul (format CalculRequest); "
+                    "optimize_deployment: corps de /api/optimize_deployment",
+    )
+    n_simulations: int = Field(10000, ge=100, description="Nombre de tirages (monte_carlo)")
+    seed: int = Field(42, ge=0, description="Seed pour reproductibilité (monte_carlo)")
+    distributions_custom: Optional[List[DistributionConfig]] = Field(
+        None,
+        description="Distributions personnalisées (monte_carlo)"
+    )
+
 
-        for vitesse in [0.5, 0.75, 1.0, 1.25, 1.5]:
-            compteurs_scenario = int(compteurs_par_an * vitesse)
-            if compteurs_scenario < 1000:
-                continue
+class JobStore:
+    """Statut et résultat des jobs sur disque: un répertoire par job.
 
-            annees = math.ceil(calc_req.nb_menages / compteurs_scenario)
-            if annees > req.horizon_deploiement:
-                continue
+    {racine}/{id}/status.json   statut, progression, horodatages, erreur
+    {racine}/{id}/result.json   résultat (job terminé avec succès)
+    {racine}/{id}/cancel        marqueur de demande d'annulation
 
-            # Calculer avec ce scénario d'adoption
-            params_scenario = req.params.copy()
-            params_scenario['scenario_adoption'] = 'custom'
-            params_scenario['adoption_mode'] = 'secteur'
-            params_scenario['adoption_nb_secteurs'] = annees
-            params_scenario['adoption_annees_par_secteur'] = 1
-            params_scenario['adoption_max_pct'] = 100
+    Chaque écriture passe par un fichier temporaire puis os.replace: un
+    lecteur ne voit jamais de fichier à moitié écrit.
+    """
 
+    def __init__(self, racine: Path, ttl_s: int = JOBS_TTL_S):
+        self.racine = Path(racine)
+        self.ttl_s = ttl_s
+
+    def chemin(self, job_id: str) -> Path:
+        # Identifiants générés par uuid4().hex: refuser tout le reste
+        # (protège contre le path traversal)
+        if len(job_id) != 32 or any(c not in "0123456789abcdef" for c in job_id):
+            raise KeyError(job_id)
+        return self.racine / job_id
+
+    def _ecrire(self, chemin: Path, data: dict):
+        tmp = chemin.with_name(chemin.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, chemin)
+
+    def creer(self, kind: str) -> dict:
+        job_id = uuid.uuid4().hex
+        dossier = self.racine / job_id
+        dossier.mkdir(parents=True)
+        statut = {
+            "id": job_id,
+            "kind": kind,
+            "status": "queued",
+            "progress": 0.0,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "expires_at": None,
+            "error": None,
+        }
+        self._ecrire(dossier / "status.json", statut)
+        return statut
+
+    def statut(self, job_id: str) -> Optional[dict]:
+        try:
+            return json.loads((self.chemin(job_id) / "status.json").read_text(encoding="utf-8"))
+        except (KeyError, FileNotFoundError):
+            return None
+
+    def resultat(self, job_id: str) -> Optional[dict]:
+        try:
+            return json.loads((self.chemin(job_id) / "result.json").read_text(encoding="utf-8"))
+        except (KeyError, FileNotFoundError):
+            return None
+
+    def mettre_a_jour(self, job_id: str, **champs) -> dict:
+        statut = self.statut(job_id)
+        if statut is None:
+            raise KeyError(job_id)
+        statut.update(champs)
+        if champs.get("status") in JOB_TERMINAUX:
+            fin = datetime.now(timezone.utc)
+            statut["finished_at"] = fin.isoformat()
+            statut["expires_at"] = datetime.fromtimestamp(
+                fin.timestamp() + self.ttl_s, timezone.utc
+            ).isoformat()
+        self._ecrire(self.chemin(job_id) / "status.json", statut)
+        return statut
+
+    def ecrire_resultat(self, job_id: str, resultat: dict):
+        self._ecrire(self.chemin(job_id) / "result.json", resultat)
+
+    def demander_annulation(self, job_id: str):
+        (self.chemin(job_id) / "cancel").touch()
+
+    def annulation_demandee(self, job_id: str) -> bool:
+        return (self.chemin(job_id) / "cancel").exists()
+
+    @staticmethod
+    def est_expire(statut: dict, maintenant: Optional[datetime] = None) -> bool:
+        """Job terminé dont expires_at est dépassé (servi comme introuvable)."""
+        if not statut.get("expires_at"):
+            return False
+        maintenant = datetime.now(timezone.utc) if maintenant is None else maintenant
+        return datetime.fromisoformat(statut["expires_at"]) <= maintenant
+
+    def nettoyer(self, maintenant: Optional[float] = None) -> int:
+        """Supprimer les jobs expirés; retourne le nombre de jobs supprimés.
+
+        Un job est expiré JOBS_TTL_S après sa dernière écriture de statut: fin
+        du job, ou dernière progression pour un job orphelin (processus tué).
+        """
+        if not self.racine.is_dir():
+            return 0
+        maintenant = time.time() if maintenant is None else maintenant
+        supprimes = 0
+        for dossier in self.racine.iterdir():
+            statut = dossier / "status.json"
             try:
-                calc_req_scenario = CalculRequest(**params_scenario)
-                result = await calculate(calc_req_scenario)
-
-                scenarios.append({
-                    "compteurs_par_an": compteurs_scenario,
-                    "annees_deploiement": annees,
-                    "budget_annuel": compteurs_scenario * cout_unitaire,
-                    "van": result.van,
-                    "rbc": result.rbc,
-                    "payback": result.payback,
-                    "investissement_initial": result.investissement_initial,
-                })
-            except Exception:
-                continue
-
-        if not scenarios:
-            raise HTTPException(status_code=422, detail="Aucun scénario viable trouvé")
-
-        # Trouver l'optimal selon l'objectif
-        if req.objectif == "van":
-            optimal = max(scenarios, key=lambda s: s["van"])
-        else:  # payback
-            valides = [s for s in scenarios if s["payback"] is not None]
-            if valides:
-                optimal = min(valides, key=lambda s: s["payback"])
-            else:
-                optimal = scenarios[0]
+                age = maintenant - statut.stat().st_mtime
+            except FileNotFoundError:
+                # Répertoire en cours de création ou incomplet
+                age = maintenant - dossier.stat().st_mtime
+            if age > self.ttl_s:
+                shutil.rmtree(dossier, ignore_errors=True)
+                supprimes += 1
+        return supprimes
 
-        return {
-            "optimal": optimal,
-            "scenarios": sorted(scenarios, key=lambda s: -s["van"]),
-            "contraintes": {
-                "budget_annuel_max": req.budget_annuel_max,
-                "capacite_installation_max": req.capacite_installation_max,
-                "cout_unitaire": cout_unitaire,
-                "compteurs_max_budget": compteurs_budget,
-                "compteurs_effectifs": compteurs_par_an,
-            },
-            "recommandation": f"Déployer {optimal['compteurs_par_an']:,} compteurs/an sur {optimal['annees_deploiement']} ans"
-        }
 
-    except HTTPException:
-        raise
+class _AnnulationJob:
+    """Équivalent de threading.Event.is_set() pour un job d'un autre processus."""
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+
+    def is_set(self) -> bool:
+        return self.store.annulation_demandee(self.job_id)
+
+
+def _executer_job(racine: str, job_id: str, kind: str, payload: dict):
+    """Exécuter un job dans un processus du pool; statut et résultat sur disque."""
+    store = JobStore(Path(racine))
+    annulation = _AnnulationJob(store, job_id)
+    if annulation.is_set():
+        store.mettre_a_jour(job_id, status="cancelled")
+        return
+    store.mettre_a_jour(job_id, status="running", started_at=datetime.now(timezone.utc).isoformat())
+
+    derniere_ecriture = [0.0]
+
+    def progression(faits: int, total: int):
+        maintenant = time.monotonic()
+        if maintenant - derniere_ecriture[0] >= JOB_INTERVALLE_PROGRESSION_S:
+            derniere_ecriture[0] = maintenant
+            store.mettre_a_jour(job_id, progress=round(faits / total, 4))
+
+    try:
+        if kind == "monte_carlo":
+            req = MonteCarloRequest.model_construct(
+                params=payload["params"],
+                n_simulations=payload["n_simulations"],
+                seed=payload["seed"],
+                distributions_custom=[
+                    DistributionConfig(**d) for d in payload["distributions_custom"]
+                ] if payload["distributions_custom"] else None,
+            )
+            resultat = _executer_monte_carlo_avance(
+                req, annulation=annulation, progression=progression, max_simulations=JOBS_MAX_DRAWS
+            )
+        else:
+            resultat = _optimiser_deploiement(OptimizationRequest(**payload["params"]))
+    except CalculAnnule:
+        store.mettre_a_jour(job_id, status="cancelled")
+        return
     except Exception as e:
-        metrics.record_error("/api/optimize_deployment", type(e).__name__, str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        store.mettre_a_jour(job_id, status="failed", error=f"{type(e).__name__}: {detail}"[:500])
+        return
+
+    store.ecrire_resultat(job_id, numpy_to_python(resultat))
+    store.mettre_a_jour(job_id, status="succeeded", progress=1.0)
+
+
+_pool_jobs: Optional[ProcessPoolExecutor] = None
+
+
+def pool_jobs() -> ProcessPoolExecutor:
+    """Pool de processus des jobs, créé au premier job soumis.
+
+    Démarrage en "spawn": le processus de l'API a des threads (boucle
+    d'événements, écriture des logs) qu'un fork ne recopierait pas proprement.
+    """
+    global _pool_jobs
+    if _pool_jobs is None:
+        _pool_jobs = ProcessPoolExecutor(
+            max_workers=JOBS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool_jobs
+
+
+def arreter_pool_jobs():
+    """Arrêter le pool à l'extinction; les jobs en attente sont abandonnés."""
+    global _pool_jobs
+    if _pool_jobs is not None:
+        _pool_jobs.shutdown(wait=False, cancel_futures=True)
+        _pool_jobs = None
+
+
+def _job_termine(store: JobStore, job_id: str, kind: str, future):
+    """Rappel du pool: compter le job; marquer l'échec si le processus est mort."""
+    if future.cancelled():
+        statut = store.mettre_a_jour(job_id, status="cancelled")
+    elif future.exception() is not None:
+        # Processus tué (mémoire, signal): le job n'a pas pu écrire son statut
+        e = future.exception()
+        statut = store.mettre_a_jour(job_id, status="failed", error=f"{type(e).__name__}: {e}"[:500])
+    else:
+        statut = store.statut(job_id) or {"status": "failed"}
+    metrics.record_job(kind, statut["status"])
+    logger.info("job_finished", job_id=job_id, kind=kind, status=statut["status"])
+
+
+async def purger_jobs_periodiquement():
+    """Supprimer les jobs expirés au démarrage puis toutes les JOBS_PURGE_INTERVAL_S secondes."""
+    store = JobStore(JOBS_DIR)
+    while True:
+        try:
+            supprimes = await asyncio.to_thread(store.nettoyer)
+            if supprimes:
+                logger.info("jobs_purged", count=supprimes)
+        except Exception as e:
+            logger.error("jobs_purge_failed", error_type=type(e).__name__, error=str(e))
+        await asyncio.sleep(JOBS_PURGE_INTERVAL_S)
+
+
+def _reponse_job(statut: dict) -> dict:
+    reponse = dict(statut)
+    reponse["links"] = {"self": f"/api/jobs/{statut['id']}"}
+    return reponse
+
+
+@app.post("/api/jobs", status_code=202, dependencies=[limite_debit(cout_job)])
+async def submit_job(req: JobRequest):
+    """
+    Soumettre un calcul long (Monte Carlo jusqu'à JOBS_MAX_DRAWS tirages,
+    optimisation du déploiement) exécuté en arrière-plan.
+
+    Retourne immédiatement l'identifiant du job; suivre la progression et
+    récupérer le résultat avec GET /api/jobs/{id}.
+    """
+    if req.kind not in JOB_KINDS:
+        raise HTTPException(status_code=422, detail=f"kind doit être parmi {', '.join(JOB_KINDS)}")
+    if req.kind == "monte_carlo" and req.n_simulations > JOBS_MAX_DRAWS:
+        raise HTTPException(status_code=422, detail=f"n_simulations limité à {JOBS_MAX_DRAWS}")
+    # Valider les paramètres maintenant plutôt que d'échouer dans le job
+    try:
+        if req.kind == "monte_carlo":
+            CalculRequest(**req.params)
+        else:
+            OptimizationRequest(**req.params)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    store = JobStore(JOBS_DIR)
+    await asyncio.to_thread(store.nettoyer)
+    statut = store.creer(req.kind)
+    args = (_executer_job, str(store.racine), statut["id"], req.kind, req.model_dump(mode="json"))
+    try:
+        future = pool_jobs().submit(*args)
+    except BrokenProcessPool:
+        # Un processus du pool est mort (cf. _job_termine): en recréer un
+        arreter_pool_jobs()
+        future = pool_jobs().submit(*args)
+    future.add_done_callback(partial(_job_termine, store, statut["id"], req.kind))
+    logger.info("job_submitted", job_id=statut["id"], kind=req.kind)
+    return _reponse_job(statut)
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Statut et progression d'un job; inclut le résultat une fois terminé."""
+    store = JobStore(JOBS_DIR)
+    statut = store.statut(job_id)
+    if statut is None or store.est_expire(statut):
+        raise HTTPException(status_code=404, detail="Job introuvable ou expiré")
+    reponse = _reponse_job(statut)
+    if statut["status"] == "succeeded":
+        reponse["result"] = await asyncio.to_thread(store.resultat, job_id)
+    return reponse
+
+
+@app.delete("/api/jobs/{job_id}", status_code=202)
+async def cancel_job(job_id: str):
+    """Demander l'annulation d'un job en attente ou en cours."""
+    store = JobStore(JOBS_DIR)
+    statut = store.statut(job_id)
+    if statut is None or store.est_expire(statut):
+        raise HTTPException(status_code=404, detail="Job introuvable ou expiré")
+    if statut["status"] not in JOB_TERMINAUX:
+        store.demander_annulation(job_id)
+    return _reponse_job(statut)
+
+
+# =============================================================================
+# PRÉCHAUFFAGE
+# =============================================================================
+
+# Partagé avec les workers en mode preload (gunicorn.conf.py): un worker créé
+# par fork d'un maître déjà préchauffé ne refait pas le travail.
+prechauffage = {"termine": False, "duree_ms": None}
+
+
+async def prechauffer():
+    """
+    Exécuter une fois les calculs représentatifs (calcul, séries, Monte Carlo).
+
+    Paie au démarrage les coûts du premier appel: chargement des sous-modules
+    du modèle et des préréglages, premiers appels NumPy, validation et
+    sérialisation Pydantic, schéma OpenAPI. Un échec est logué sans empêcher
+    le démarrage (les requêtes paieront simplement le premier appel).
+    """
+    if prechauffage["termine"]:
+        return
+    debut = time.perf_counter()
+
+    try:
+        req = CalculRequest.model_validate(CalculRequest().model_dump())
+        # Le défaut figure dans la table des scénarios précalculés...
+        (await calculate(req)).model_dump_json()
+        # ... donc chauffer aussi le calcul complet
+        _calculer(req)
+        await detailed_series(req)
+        _executer_monte_carlo(req, PREWARM_MC_DRAWS, 0)
+        app.openapi()
+    except Exception as e:
+        logger.error("prewarm_failed", error_type=type(e).__name__, error=str(e))
+        return
+
+    prechauffage["duree_ms"] = round((time.perf_counter() - debut) * 1000, 1)
+    prechauffage["termine"] = True
+    logger.info("prewarm_completed", duration_ms=prechauffage["duree_ms"], mc_draws=PREWARM_MC_DRAWS)
 
 
 # =============================================================================
 # SERVIR LES FICHIERS STATIQUES (avec protection contre path traversal)
 # =============================================================================
 
+# Variantes précompressées produites par map/collectors/asset_builder.py:
+# le serveur ne compresse jamais à la volée, il choisit le fichier .br/.gz.
+PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Fichiers nommés d'après leur hash de contenu → cacheables indéfiniment
+HASHED_ASSET_DIRS = {"build"}
+
+
+def encodages_acceptes(accept: str) -> set:
+    """Encodages d'Accept-Encoding avec q > 0 ("gzip;q=0" refuse gzip, "*" couvre les autres)."""
+    qualites = {}
+    for token in accept.split(","):
+        coding, *parametres = (partie.strip() for partie in token.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for parametre in parametres:
+            cle, _, valeur = parametre.partition("=")
+            if cle.strip().lower() == "q":
+                try:
+                    q = float(valeur)
+                except ValueError:
+                    q = 0.0
+        qualites[coding.lower()] = q
+    acceptes = {coding for coding, q in qualites.items() if q > 0}
+    if qualites.get("*", 0) > 0:
+        acceptes |= {encoding for encoding, _ in PRECOMPRESSED_ENCODINGS if encoding not in qualites}
+    return acceptes
+
+
+def precompressed_file_response(requested: Path, request: Request) -> FileResponse:
+    """Servir un fichier statique, en préférant sa variante précompressée."""
+    media_type = mimetypes.guess_type(requested.name)[0] or "application/octet-stream"
+    headers = {}
+    if requested.parent.name in HASHED_ASSET_DIRS:
+        headers["Cache-Control"] = "public, max-age=31536000, immutable"
+
+    variantes = [
+        (encoding, requested.with_name(requested.name + suffix))
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS
+    ]
+    variantes = [(encoding, variant) for encoding, variant in variantes if variant.is_file()]
+    # La réponse dépend d'Accept-Encoding dès qu'une variante existe,
+    # y compris quand on sert l'original (sinon un cache la resservirait à tous)
+    if variantes:
+        headers["Vary"] = "Accept-Encoding"
+
+    accepted = encodages_acceptes(request.headers.get("accept-encoding", ""))
+    for encoding, variant in variantes:
+        if encoding in accepted:
+            headers["Content-Encoding"] = encoding
+            return FileResponse(str(variant), media_type=media_type, headers=headers)
+
+    return FileResponse(str(requested), media_type=media_type, headers=headers)
+
+
 # Si index.html existe dans BASE_DIR, enregistrer la route statique/SPA
 if (BASE_DIR / "index.html").exists():
     @app.get("/{path:path}", include_in_schema=False)
-    async def serve_static(path: str):
+    async def serve_static(path: str, request: Request):
         # Cas spécial: racine ou index.html
         if path == "" or path == "index.html":
             return FileResponse(str(BASE_DIR / "index.html"))
@@ -1842,9 +3267,9 @@ if (BASE_DIR / "index.html").exists():
         if not str(requested).startswith(str(BASE_DIR)):
             raise HTTPException(404, detail="Not found")
 
-        # Si le fichier existe, le servir
+        # Si le fichier existe, le servir (variante précompressée si acceptée)
         if requested.is_file():
-            return FileResponse(str(requested))
+            return precompressed_file_response(requested, request)
 
         # Si c'est un asset (contient un point) qui n'existe pas, retourner 404
         # plutôt que de servir index.html (évite la confusion)
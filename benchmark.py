@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai des performances — modèle et API
+
+Mesure le temps d'exécution des calculs principaux (executer_modele par
+mode, dynamique des fuites, Monte Carlo, sensibilité, endpoints de l'API
+via TestClient) et le compare à une référence JSON. Échoue (code 1) si un
+temps dépasse la référence de plus du seuil. Aucun accès réseau.
+
+Usage:
+    python benchmark.py                          # comparer à benchmark_baseline.json
+    python benchmark.py --enregistrer            # (ré)écrire la référence
+    python benchmark.py -k executer_modele       # sous-ensemble (sous-chaîne du nom)
+    python benchmark.py --seuil 1.0 --budget 2   # tolérance 100%, 2 s par mesure
+    python benchmark.py --sortie bench.json      # conserver les mesures
+
+Les temps sont comparés en unités machine: chaque mesure est divisée par
+la durée d'une charge de calibration fixe (boucle Python + numpy), ce qui
+rend la référence utilisable d'une machine à l'autre à quelques dizaines
+de pourcents près. Réenregistrer la référence après une optimisation.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+REFERENCE_DEFAUT = Path(__file__).resolve().parent / "benchmark_baseline.json"
+
+# Régression tolérée avant échec (0.5 = 50% plus lent que la référence): les
+# mesures d'une même machine varient d'environ ±20% d'une exécution à l'autre
+SEUIL_DEFAUT = 0.5
+
+# Durée cible de chaque mesure (s) et bornes du nombre de répétitions
+BUDGET_DEFAUT = 1.0
+REPETITIONS_MIN = 3
+REPETITIONS_MAX = 30
+
+# Requête hors de la table des scénarios précalculés: le modèle est exécuté
+REQUETE_API = {"nb_menages": 120000, "scenario_adoption": "progressive", "reseau_activer": True,
+               "reseau_volume_pertes_m3_an": 2e6, "reseau_reduction_max_pct": 20}
+
+
+@dataclass
+class Benchmark:
+    """Une mesure: fonction sans argument appelée en boucle."""
+    nom: str
+    fonction: Callable[[], object]
+
+
+# =============================================================================
+# MESURE
+# =============================================================================
+
+def _dimensionner(fonction: Callable[[], object], budget: float) -> tuple[int, int, float]:
+    """Préchauffage non mesuré, puis taille de lot et nombre de répétitions."""
+    fonction()  # imports différés, caches: jamais mesuré
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    iterations = max(1, int(budget / REPETITIONS_MAX / duree))
+    repetitions = max(REPETITIONS_MIN, min(REPETITIONS_MAX, int(budget / (iterations * duree))))
+    return iterations, repetitions, duree
+
+
+def mesurer_entrelace(fonctions: list[Callable[[], object]], budget: float = BUDGET_DEFAUT) -> list[dict]:
+    """
+    Temps par appel (s) de chaque fonction: minimum sur les répétitions de
+    la moyenne d'un lot (médiane fournie à titre indicatif).
+
+    Les répétitions sont entrelacées: chaque tour exécute un lot de chaque
+    fonction, si bien qu'un ralentissement passager de la machine (VM
+    partagée, fréquence CPU) touche toutes les mesures au lieu d'une seule,
+    et le minimum retient les tours calmes. Les appels longs sont répétés
+    au moins REPETITIONS_MIN fois, quitte à dépasser le budget.
+    """
+    plans = [_dimensionner(f, budget) for f in fonctions]
+    # L'appel de dimensionnement compte comme première répétition s'il n'est pas groupé
+    temps = [[duree] if iterations == 1 else [] for iterations, _, duree in plans]
+    tours = max(repetitions for _, repetitions, _ in plans)
+    for tour in range(1, tours + 1):
+        for fonction, (iterations, repetitions, _), t in zip(fonctions, plans, temps):
+            # Répétitions réparties uniformément sur les tours
+            if len(t) < math.ceil(tour * repetitions / tours):
+                debut = time.perf_counter()
+                for _ in range(iterations):
+                    fonction()
+                t.append((time.perf_counter() - debut) / iterations)
+    return [
+        {"secondes": min(t), "mediane": statistics.median(t), "iterations": iterations, "repetitions": len(t)}
+        for (iterations, _, _), t in zip(plans, temps)
+    ]
+
+
+def mesurer(fonction: Callable[[], object], budget: float = BUDGET_DEFAUT) -> dict:
+    """Temps par appel (s) d'une fonction seule (cf. mesurer_entrelace)."""
+    return mesurer_entrelace([fonction], budget)[0]
+
+
+def _charge_calibration() -> float:
+    # Mélange représentatif du modèle: boucle Python scalaire et petites opérations numpy
+    total = 0.0
+    for i in range(20_000):
+        total += math.exp(-i * 1e-4)
+    serie = np.linspace(0.0, 1.0, 40)
+    for _ in range(500):
+        total += float(np.convolve(serie, serie)[:40].sum())
+    return total
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def benchmarks_modele() -> list[Benchmark]:
+    """executer_modele par mode, dynamique des fuites, Monte Carlo, sensibilité."""
+    from analyse_compteurs_eau import (
+        ModeAdoption, ModePersistance, ParametresAdoption, ParametresCompteur,
+        ParametresFuitesReseau, ParametresModele, ParametresMonteCarlo, ParametresPersistance,
+        DISTRIBUTIONS_DEFAUT, FUITES_CONTEXTE_QUEBEC, FUITES_QUEBEC_DEUX_STOCKS,
+        calculer_dynamique_fuites, executer_modele, sensibilite_univariee, simuler_monte_carlo,
+    )
+
+    params = ParametresModele()
+    compteur = ParametresCompteur()
+    benchmarks = []
+
+    def modele(nom, **kwargs):
+        kwargs.setdefault("params_fuites", FUITES_QUEBEC_DEUX_STOCKS)
+        benchmarks.append(Benchmark(f"executer_modele/{nom}",
+                                    lambda: executer_modele(params, compteur, **kwargs)))
+
+    for mode in ModeAdoption:
+        adoption = ParametresAdoption(
+            mode=mode, adoption_max_pct=85.0,
+            calendrier_pct=(10.0, 30.0, 55.0, 75.0, 85.0) if mode == ModeAdoption.CALENDRIER else None,
+        )
+        modele(f"adoption={mode.value}", params_adoption=adoption)
+    for mode in ModePersistance:
+        modele(f"persistance={mode.value}", persistance=ParametresPersistance(mode=mode))
+    modele("fuites=aucune", params_fuites=None)
+    modele("fuites=agrege", params_fuites=FUITES_CONTEXTE_QUEBEC)
+    modele("reseau", params_fuites_reseau=ParametresFuitesReseau(
+        volume_pertes_m3_an=2e6, reduction_max_pct=20.0, cout_programme_annuel=1e5))
+
+    for nom, fuites in (("agrege", FUITES_CONTEXTE_QUEBEC), ("deux_stocks", FUITES_QUEBEC_DEUX_STOCKS)):
+        benchmarks.append(Benchmark(
+            f"calculer_dynamique_fuites/{nom}",
+            lambda fuites=fuites: calculer_dynamique_fuites(fuites, params.nb_menages, params.horizon_analyse),
+        ))
+
+    for n in (1_000, 10_000):
+        config = ParametresMonteCarlo(n_simulations=n, seed=42, distributions=DISTRIBUTIONS_DEFAUT)
+        benchmarks.append(Benchmark(
+            f"simuler_monte_carlo/{n}",
+            lambda config=config: simuler_monte_carlo(params, compteur, config, afficher_progression=False),
+        ))
+
+    benchmarks.append(Benchmark("sensibilite_univariee",
+                                lambda: sensibilite_univariee(params, compteur)))
+    return benchmarks
+
+
+def benchmarks_api() -> list[Benchmark]:
+    """Endpoints principaux via TestClient (sans limitation de débit ni préchauffage)."""
+    os.environ.setdefault("API_RATE_LIMIT", "0")
+    os.environ.setdefault("API_PREWARM", "0")
+    os.environ.setdefault("LOG_SAMPLE_RATE", "0")
+    from fastapi.testclient import TestClient
+    from api import app
+
+    client = TestClient(app)
+
+    def post(chemin, corps=REQUETE_API):
+        def appel():
+            reponse = client.post(chemin, json=corps)
+            if reponse.status_code != 200:
+                raise RuntimeError(f"{chemin}: HTTP {reponse.status_code} {reponse.text[:200]}")
+        return Benchmark(f"api{chemin.split('?')[0]}", appel)
+
+    return [
+        post("/api/calculate"),
+        post("/api/detailed_series"),
+        post("/api/sensitivity"),
+        post("/api/compare_meters"),
+        post("/api/compare_persistence"),
+        post("/api/van_basis"),
+        post("/api/monte_carlo?n_simulations=500"),
+    ]
+
+
+def construire_benchmarks(filtre: Optional[str] = None) -> list[Benchmark]:
+    """Tous les benchmarks (ou ceux dont le nom contient `filtre`)."""
+    benchmarks = benchmarks_modele() + benchmarks_api()
+    if filtre:
+        benchmarks = [b for b in benchmarks if filtre in b.nom]
+    return benchmarks
+
+
+# =============================================================================
+# RÉFÉRENCE
+# =============================================================================
+
+def executer(benchmarks: list[Benchmark], budget: float = BUDGET_DEFAUT, unite: Optional[float] = None) -> dict:
+    """Mesurer les benchmarks; résultat au format du fichier de référence."""
+    fonctions = [b.fonction for b in benchmarks]
+    if unite is None:
+        # Calibration entrelacée avec les benchmarks: mêmes conditions machine
+        calibration, *mesures = mesurer_entrelace([_charge_calibration] + fonctions, budget)
+        unite = calibration["secondes"]
+    else:
+        mesures = mesurer_entrelace(fonctions, budget)
+    resultats = {}
+    for b, mesure in zip(benchmarks, mesures):
+        mesure["unites"] = mesure["secondes"] / unite
+        resultats[b.nom] = mesure
+    return {
+        "version": 1,
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plateforme": platform.platform(),
+            "processeur": platform.processor() or platform.machine(),
+        },
+        "unite_machine_s": unite,
+        "resultats": resultats,
+    }
+
+
+def comparer(mesures: dict, reference: dict, seuil: float = SEUIL_DEFAUT) -> list[dict]:
+    """
+    Comparer des mesures à la référence, en unités machine.
+
+    Retourne:
+        Une ligne par benchmark mesuré: nom, unités, unités de référence
+        (None si absent de la référence), ratio et regression (ratio > 1 + seuil)
+    """
+    lignes = []
+    for nom, mesure in mesures["resultats"].items():
+        ref = reference.get("resultats", {}).get(nom)
+        ratio = mesure["unites"] / ref["unites"] if ref else None
+        lignes.append({
+            "nom": nom,
+            "secondes": mesure["secondes"],
+            "unites": mesure["unites"],
+            "unites_reference": ref["unites"] if ref else None,
+            "ratio": ratio,
+            "regression": ratio is not None and ratio > 1.0 + seuil,
+        })
+    return lignes
+
+
+def _format_duree(secondes: float) -> str:
+    if secondes >= 1.0:
+        return f"{secondes:8.2f} s "
+    if secondes >= 1e-3:
+        return f"{secondes * 1e3:8.2f} ms"
+    return f"{secondes * 1e6:8.1f} µs"
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Banc d'essai des performances du modèle et de l'API")
+    parser.add_argument("-k", dest="filtre", help="Ne mesurer que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--reference", type=Path, default=REFERENCE_DEFAUT, help="Fichier JSON de référence")
+    parser.add_argument("--enregistrer", action="store_true",
+                        help="Écrire les mesures dans la référence (fusionnées si -k) au lieu de comparer")
+    parser.add_argument("--seuil", type=float, default=SEUIL_DEFAUT,
+                        help="Régression tolérée (0.5 = 50%% plus lent)")
+    parser.add_argument("--budget", type=float, default=BUDGET_DEFAUT, help="Durée cible par mesure (s)")
+    parser.add_argument("--sortie", type=Path, help="Écrire aussi les mesures dans ce fichier JSON")
+    args = parser.parse_args(argv)
+
+    benchmarks = construire_benchmarks(args.filtre)
+    if not benchmarks:
+        print(f"Aucun benchmark ne correspond à '{args.filtre}'")
+        return 1
+
+    mesures = executer(benchmarks, args.budget)
+    reference = {}
+    if args.reference.exists():
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+
+    lignes = comparer(mesures, reference, args.seuil)
+    print(f"Unité machine: {_format_duree(mesures['unite_machine_s']).strip()}  "
+          f"(référence: {_format_duree(reference['unite_machine_s']).strip() if reference else '—'})")
+    for ligne in lignes:
+        if ligne["ratio"] is None:
+            statut = "nouveau"
+        else:
+            statut = f"×{ligne['ratio']:.2f}" + ("  RÉGRESSION" if ligne["regression"] else "")
+        print(f"  {ligne['nom']:<45} {_format_duree(ligne['secondes'])}  {statut}")
+
+    if args.sortie:
+        args.sortie.write_text(json.dumps(mesures, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    if args.enregistrer:
+        if args.filtre and reference:
+            # Les unités machine rendent les mesures de deux exécutions comparables
+            mesures["resultats"] = {**reference["resultats"], **mesures["resultats"]}
+        args.reference.write_text(json.dumps(mesures, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Référence écrite: {args.reference}")
+        return 0
+
+    regressions = [l for l in lignes if l["regression"]]
+    if regressions:
+        print(f"ÉCHEC: {len(regressions)} régression(s) au-delà de {args.seuil:.0%}")
+        return 1
+    if not reference:
+        print(f"Pas de référence ({args.reference}): lancer avec --enregistrer")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,20 +12,38 @@ Avantages:
 - Pas de serveur requis (HTML statique)
 
 Usage:
-    python generate_scenarios_json.py
+    python generate_scenarios_json.py                 # incrémental, tous les cœurs
+    python generate_scenarios_json.py -o sortie.json  # autre fichier de sortie
+    python generate_scenarios_json.py --complet -j 1  # tout recalculer, en série
 
 Output:
-    scenarios_output.json — données précalculées pour le viewer HTML
+    scenarios_output.json — données précalculées pour le viewer HTML (JSON
+    minifié). Les scénarios dont les entrées n'ont pas changé depuis la
+    sortie précédente sont repris tels quels (cf. empreintes_scenarios).
+    scenarios/ — même contenu découpé pour un futur viewer statique: un
+    manifeste et un fichier par ville × type de compteur (cf. exporter_shards)
 
 Auteur: Enzo Simier
 Version: 1.0.0 (janvier 2026)
 """
 
+import argparse
+import gzip
+import hashlib
 import json
+import math
+import os
+import tempfile
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from itertools import product
-from typing import Any
+from typing import Any, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel: seules les variantes .gz sont produites
+    brotli = None
 
 from analyse_compteurs_eau import (
     # Version
@@ -63,6 +81,11 @@ from analyse_compteurs_eau import (
 # CONFIGURATION DES SCÉNARIOS À PRÉCALCULER
 # =============================================================================
 
+# Sortie par défaut: à côté du script (lue par l'API, cf. API_SCENARIO_TABLE)
+SORTIE_DEFAUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scenarios_output.json")
+# Manifeste + fichiers par ville × compteur pour un futur viewer statique
+SHARDS_DEFAUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scenarios")
+
 # Préréglages de villes (données SQEEP 2023)
 PRESETS_VILLES = {
     "longueuil": {
@@ -148,7 +171,7 @@ SCENARIOS_PERSISTANCE = {
     },
 }
 
-# Scénarios de fuites — utilise les préréglages de analyse_compteurs_eau.py
+# Scénarios de fuites — utilise les préréglages de analyse_compteurs_eau.presets
 # pour garantir la cohérence entre le JSON et les calculs directs
 SCENARIOS_FUITES = {
     "standard": {
@@ -253,6 +276,11 @@ def calculer_scenario(
         "va_couts_exploitation": float(result.va_couts_exploitation),
         "va_couts_totaux": float(result.va_couts_totaux),
 
+        # Décomposition des bénéfices
+        "va_benefices_eau": float(result.va_benefices_eau),
+        "va_benefices_report_infra": float(result.va_benefices_report_infra),
+        "va_benefices_cout_variable": float(result.va_benefices_cout_variable),
+
         # Économies par ménage
         "economie_totale_menage": float(result.economie_totale_menage),
         "economie_comportement_menage": float(result.economie_comportement_menage),
@@ -268,10 +296,113 @@ def calculer_scenario(
     }
 
 
-def generer_scenarios_complets() -> dict:
+def empreinte_entrees() -> str:
+    """
+    Empreinte des entrées des scénarios (préréglages de villes, compteurs,
+    persistance, fuites, valeur de l'eau).
+
+    Écrite dans les métadonnées: l'API ignore un fichier dont l'empreinte ne
+    correspond plus aux préréglages courants, même si MODEL_VERSION n'a pas
+    changé (ex: préréglage de fuites recalibré).
+    """
+    entrees = (
+        DEFAUTS_LONGUEUIL,
+        VALEUR_EAU_QUEBEC,
+        PRESETS_VILLES,
+        TYPES_COMPTEURS,
+        {k: v["params"] for k, v in SCENARIOS_PERSISTANCE.items()},
+        {k: v["params"] for k, v in SCENARIOS_FUITES.items()},
+    )
+    return hashlib.sha256(repr(entrees).encode("utf-8")).hexdigest()[:16]
+
+
+def combinaisons_scenarios():
+    """Itérer (clé, entrées de calculer_scenario) sur ville × compteur × persistance × fuites × mode."""
+    for ville_key, ville_preset in PRESETS_VILLES.items():
+        for compteur_key, compteur_preset in TYPES_COMPTEURS.items():
+            for pers_key, pers_scenario in SCENARIOS_PERSISTANCE.items():
+                for fuites_key, fuites_scenario in SCENARIOS_FUITES.items():
+                    for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
+                        mode_key = "eco" if mode == ModeCompte.ECONOMIQUE else "fin"
+                        scenario_key = f"{ville_key}_{compteur_key}_{pers_key}_{fuites_key}_{mode_key}"
+                        yield scenario_key, (
+                            creer_params_modele(ville_preset),
+                            creer_params_compteur(compteur_preset),
+                            pers_scenario["params"],
+                            fuites_scenario["params"],
+                            mode,
+                            VALEUR_EAU_QUEBEC,
+                        )
+
+
+# Version du format de sortie de calculer_scenario(): à incrémenter quand
+# ses champs changent (ajout, renommage, unité), sinon les scénarios déjà
+# calculés seraient repris avec l'ancien format
+FORMAT_SCENARIO = 2
+
+
+def empreinte_scenario(entrees: tuple) -> str:
+    """
+    Empreinte des entrées d'un scénario, de la version du modèle et du format
+    de sortie.
+
+    Tout changement numérique du modèle doit incrémenter MODEL_VERSION; à
+    défaut, il est détecté par _reutilisation_valide() qui recalcule un
+    scénario réutilisé.
+    """
+    return hashlib.sha256(repr((MODEL_VERSION, FORMAT_SCENARIO, entrees)).encode("utf-8")).hexdigest()[:16]
+
+
+def _identiques(a: Any, b: Any) -> bool:
+    """Mêmes champs et mêmes valeurs (flottants à 1e-9 près)."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_identiques(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_identiques(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) or isinstance(b, float):
+        return isinstance(a, (int, float)) and isinstance(b, (int, float)) and math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    return a == b
+
+
+def _reutilisation_valide(entrees: tuple, resultat_precedent: dict) -> bool:
+    """
+    Recalculer un scénario réutilisable et le comparer au résultat précédent.
+
+    Garde-fou contre un changement du modèle ou du format de sortie sans
+    incrément de MODEL_VERSION / FORMAT_SCENARIO (les empreintes seraient
+    identiques, les résultats périmés).
+    """
+    recalcule = json.loads(json.dumps(numpy_to_list(calculer_scenario(*entrees))))
+    return _identiques(recalcule, resultat_precedent)
+
+
+def _calculer_combinaison(cle_entrees: tuple) -> tuple:
+    """Calculer un scénario dans un processus du pool: (clé, résultat, erreur)."""
+    scenario_key, entrees = cle_entrees
+    try:
+        return scenario_key, calculer_scenario(*entrees), None
+    except Exception as e:
+        return scenario_key, None, str(e)
+
+
+def charger_precedent(filepath: str) -> Optional[dict]:
+    """Charger la sortie précédente (reconstruction incrémentale), si lisible."""
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def generer_scenarios_complets(precedent: Optional[dict] = None, workers: int = 1) -> dict:
     """
     Générer tous les scénarios précalculés pour le viewer HTML.
 
+    Paramètres:
+        precedent: Sortie précédente; les scénarios dont l'empreinte des
+                   entrées est inchangée sont repris sans recalcul
+        workers: Nombre de processus pour les scénarios à calculer
+
     Structure de sortie:
     {
         "metadata": {...},
@@ -284,6 +415,7 @@ def generer_scenarios_complets() -> dict:
         "scenarios": {
             "<ville>_<compteur>_<persistance>_<fuites>_<mode>": {...}
         },
+        "empreintes_scenarios": {"<clé du scénario>": "<empreinte des entrées>"},
         "courbes_alpha": {...},
         "sensibilite": {...}
     }
@@ -294,6 +426,7 @@ def generer_scenarios_complets() -> dict:
             "version": "1.0.0",
             "generated_at": datetime.now().isoformat(),
             "model_version": MODEL_VERSION,
+            "empreinte_entrees": empreinte_entrees(),
             "description": "Scénarios précalculés pour l'analyse coûts-bénéfices des compteurs d'eau",
         },
         "presets": {
@@ -303,6 +436,7 @@ def generer_scenarios_complets() -> dict:
             "fuites": {},
         },
         "scenarios": {},
+        "empreintes_scenarios": {},
         "courbes_alpha": {},
         "sensibilite": {},
     }
@@ -347,35 +481,49 @@ def generer_scenarios_complets() -> dict:
     # On calcule: ville × compteur × persistance × fuites × mode
 
     valeur_eau = VALEUR_EAU_QUEBEC
-    total_scenarios = 0
-
-    for ville_key, ville_preset in PRESETS_VILLES.items():
-        for compteur_key, compteur_preset in TYPES_COMPTEURS.items():
-            for pers_key, pers_scenario in SCENARIOS_PERSISTANCE.items():
-                for fuites_key, fuites_scenario in SCENARIOS_FUITES.items():
-                    for mode in [ModeCompte.ECONOMIQUE, ModeCompte.FINANCIER]:
-
-                        # Créer les paramètres
-                        params = creer_params_modele(ville_preset)
-                        compteur = creer_params_compteur(compteur_preset)
-                        persistance = pers_scenario["params"]
-                        fuites = fuites_scenario["params"]
-
-                        # Clé du scénario
-                        mode_key = "eco" if mode == ModeCompte.ECONOMIQUE else "fin"
-                        scenario_key = f"{ville_key}_{compteur_key}_{pers_key}_{fuites_key}_{mode_key}"
-
-                        # Calculer
-                        try:
-                            result = calculer_scenario(
-                                params, compteur, persistance, fuites, mode, valeur_eau
-                            )
-                            output["scenarios"][scenario_key] = result
-                            total_scenarios += 1
-                        except Exception as e:
-                            print(f"Erreur pour {scenario_key}: {e}")
-
-    print(f"Générés: {total_scenarios} scénarios")
+    empreintes_precedentes = (precedent or {}).get("empreintes_scenarios", {})
+    scenarios_precedents = (precedent or {}).get("scenarios", {})
+
+    a_calculer = []
+    for scenario_key, entrees in combinaisons_scenarios():
+        empreinte = empreinte_scenario(entrees)
+        output["empreintes_scenarios"][scenario_key] = empreinte
+        if empreintes_precedentes.get(scenario_key) == empreinte and scenario_key in scenarios_precedents:
+            # Entrées inchangées: réutiliser le résultat précédent
+            output["scenarios"][scenario_key] = scenarios_precedents[scenario_key]
+        else:
+            a_calculer.append((scenario_key, entrees))
+
+    # Un scénario réutilisé est recalculé: en cas d'écart, tout recalculer
+    reutilisables = [(k, e) for k, e in combinaisons_scenarios() if k in output["scenarios"]]
+    if reutilisables and not _reutilisation_valide(reutilisables[0][1], output["scenarios"][reutilisables[0][0]]):
+        print("Résultats précédents périmés malgré des empreintes identiques "
+              "(MODEL_VERSION ou FORMAT_SCENARIO à incrémenter?): recalcul complet")
+        output["scenarios"] = {}
+        a_calculer = list(combinaisons_scenarios())
+
+    reutilises = len(output["scenarios"])
+    if workers > 1 and len(a_calculer) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            taille_lot = max(1, len(a_calculer) // (workers * 4))
+            resultats = list(pool.map(_calculer_combinaison, a_calculer, chunksize=taille_lot))
+    else:
+        resultats = [_calculer_combinaison(c) for c in a_calculer]
+
+    for scenario_key, result, erreur in resultats:
+        if erreur is not None:
+            print(f"Erreur pour {scenario_key}: {erreur}")
+            del output["empreintes_scenarios"][scenario_key]
+            continue
+        output["scenarios"][scenario_key] = result
+
+    # Ordre stable (celui de la combinatoire), indépendant de ce qui a été réutilisé
+    output["scenarios"] = {
+        k: output["scenarios"][k] for k in output["empreintes_scenarios"] if k in output["scenarios"]
+    }
+    total_scenarios = len(output["scenarios"])
+    print(f"Générés: {total_scenarios} scénarios "
+          f"({total_scenarios - reutilises} calculés, {reutilises} réutilisés)")
 
     # 4. Analyse de sensibilité (variation ±10% des paramètres clés)
     # Scénario de base: Longueuil, AMI, réaliste, deux_stocks, économique
@@ -637,35 +785,186 @@ def generer_scenarios_complets() -> dict:
     return output
 
 
-def exporter_json(output: dict, filepath: str) -> None:
-    """Exporter les résultats en JSON."""
-    # Convertir les numpy arrays
-    output_clean = numpy_to_list(output)
+def _ecrire_atomique(filepath: str, payload: bytes) -> None:
+    """Écrire via un fichier temporaire du même répertoire puis renommer.
+
+    Un lecteur (l'API, le viewer) ne voit jamais de fichier à moitié écrit.
+    """
+    dossier = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp = tempfile.mkstemp(prefix=".scenarios-", suffix=".tmp", dir=dossier)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.chmod(tmp, 0o644)  # mkstemp crée en 0600
+        os.replace(tmp, filepath)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output_clean, f, ensure_ascii=False, indent=2)
+
+def minifier(data: Any) -> bytes:
+    """Sérialiser en JSON compact (sans espaces, UTF-8)."""
+    return json.dumps(numpy_to_list(data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def exporter_json(output: dict, filepath: str) -> None:
+    """Exporter les résultats en JSON minifié (écriture atomique)."""
+    payload = minifier(output)
+    _ecrire_atomique(filepath, payload)
 
     print(f"Exporté: {filepath}")
 
     # Statistiques
-    size_mb = len(json.dumps(output_clean)) / 1024 / 1024
-    print(f"Taille: {size_mb:.2f} MB")
+    print(f"Taille: {len(payload) / 1024:.0f} KB")
+
+
+def _colonnes(scenarios: dict) -> dict:
+    """Regrouper les champs identiques partout, puis une ligne de valeurs par scénario."""
+    champs = list(dict.fromkeys(champ for result in scenarios.values() for champ in result))
+    resultats = list(scenarios.values())
+    communs = {
+        champ: resultats[0][champ] for champ in champs
+        if all(champ in r and r[champ] == resultats[0][champ] for r in resultats)
+    }
+    variables = [champ for champ in champs if champ not in communs]
+    return {
+        "communs": communs,
+        "champs": variables,
+        "scenarios": {cle: [result.get(champ) for champ in variables] for cle, result in scenarios.items()},
+    }
+
+
+def exporter_shards(output: dict, dossier: str) -> dict:
+    """
+    Exporter un manifeste + un fichier par ville × type de compteur.
+
+    Sortie prévue pour un futur viewer statique (index.html interroge
+    encore l'API): il chargerait le manifeste (préréglages, courbes alpha,
+    sensibilité, années) puis seulement le fichier de la combinaison affichée.
+    Les tableaux communs (années, courbes alpha) n'y figurent qu'une fois.
+
+    Chaque fichier est en colonnes, sans répéter les noms de champs:
+        {"communs": {champ: valeur identique pour tous les scénarios},
+         "champs": [autres champs],
+         "scenarios": {<persistance>_<fuites>_<mode>: [valeurs dans l'ordre de champs]}}
+
+    Structure:
+        {dossier}/manifest.json
+        {dossier}/build/<ville>_<compteur>.<hash>.json (+ .gz, .br si brotli)
+
+    Les fichiers de build sont nommés d'après le hash de leur contenu
+    (cacheables indéfiniment, cf. HASHED_ASSET_DIRS de l'API); ceux qui ne
+    sont plus référencés sont supprimés.
+
+    Retourne:
+        Le manifeste écrit
+    """
+    build = os.path.join(dossier, "build")
+    os.makedirs(build, exist_ok=True)
+
+    scenarios = output["scenarios"]
+    annees = next(iter(scenarios.values()))["annees"] if scenarios else []
+
+    # Regrouper par ville × compteur; clé restante: <persistance>_<fuites>_<mode>
+    groupes: dict = {}
+    for scenario_key, result in scenarios.items():
+        ville_key, compteur_key, reste = scenario_key.split("_", 2)
+        entree = dict(result)
+        if entree.get("annees") == annees:
+            del entree["annees"]
+        groupes.setdefault(f"{ville_key}_{compteur_key}", {})[reste] = entree
+
+    shards = {}
+    for nom, contenu in groupes.items():
+        payload = minifier(_colonnes(contenu))
+        digest = hashlib.sha256(payload).hexdigest()[:12]
+        filename = f"{nom}.{digest}.json"
+        path = os.path.join(build, filename)
+        with open(path, "wb") as f:
+            f.write(payload)
+        # mtime=0: sortie déterministe (même contenu → mêmes octets)
+        gz = gzip.compress(payload, compresslevel=9, mtime=0)
+        with open(path + ".gz", "wb") as f:
+            f.write(gz)
+        shards[nom] = {
+            "path": f"build/{filename}",
+            "hash": digest,
+            "bytes": len(payload),
+            "gzip_bytes": len(gz),
+        }
+        if brotli is not None:
+            br = brotli.compress(payload, quality=11)
+            with open(path + ".br", "wb") as f:
+                f.write(br)
+            shards[nom]["br_bytes"] = len(br)
+
+    # Supprimer les fichiers qui ne sont plus référencés
+    gardes = {os.path.basename(e["path"]) for e in shards.values()}
+    for filename in os.listdir(build):
+        base = filename
+        for suffix in (".gz", ".br"):
+            if base.endswith(suffix):
+                base = base[: -len(suffix)]
+        if base not in gardes:
+            os.unlink(os.path.join(build, filename))
+
+    manifest = {
+        "metadata": output["metadata"],
+        "presets": output["presets"],
+        "annees": annees,
+        "courbes_alpha": output["courbes_alpha"],
+        "sensibilite": output["sensibilite"],
+        "cle_shard": "<ville>_<compteur>",
+        "cle_scenario": "<persistance>_<fuites>_<eco|fin>",
+        "shards": shards,
+    }
+    payload = minifier(manifest)
+    _ecrire_atomique(os.path.join(dossier, "manifest.json"), payload)
+
+    tailles = [e["bytes"] for e in shards.values()]
+    print(f"Exporté: {len(shards)} fichiers dans {dossier} "
+          f"(manifeste {len(payload) / 1024:.0f} KB, "
+          f"{min(tailles, default=0) / 1024:.0f}-{max(tailles, default=0) / 1024:.0f} KB par fichier)")
+    return manifest
 
 
 # =============================================================================
 # POINT D'ENTRÉE
 # =============================================================================
 
-if __name__ == "__main__":
+def main(argv: Optional[list] = None) -> None:
+    """Point d'entrée CLI."""
+    parser = argparse.ArgumentParser(description="Générer les scénarios précalculés")
+    parser.add_argument(
+        "-o", "--output", default=SORTIE_DEFAUT,
+        help="Fichier de sortie (défaut: scenarios_output.json à côté du script)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count() or 1,
+        help="Nombre de processus (défaut: nombre de cœurs)",
+    )
+    parser.add_argument(
+        "--shards", default=SHARDS_DEFAUT,
+        help="Répertoire du manifeste et des fichiers par ville × compteur "
+             "(défaut: scenarios/ à côté du script; \"\" pour ne pas les écrire)",
+    )
+    parser.add_argument(
+        "--complet", action="store_true",
+        help="Tout recalculer, sans réutiliser la sortie précédente",
+    )
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("GÉNÉRATION DES SCÉNARIOS PRÉCALCULÉS")
     print("=" * 60)
     print()
 
-    output = generer_scenarios_complets()
+    precedent = None if args.complet else charger_precedent(args.output)
+    output = generer_scenarios_complets(precedent=precedent, workers=args.workers)
 
-    output_path = "/Users/enzo_simier/Desktop/Water/scenarios_output.json"
-    exporter_json(output, output_path)
+    exporter_json(output, args.output)
+    if args.shards:
+        exporter_shards(output, args.shards)
 
     print()
     print("=" * 60)
@@ -673,6 +972,10 @@ if __name__ == "__main__":
     print("=" * 60)
     print(f"Scénarios générés: {len(output['scenarios'])}")
     print(f"Paramètres de sensibilité: {len(output['sensibilite']['parametres'])}")
-    print(f"Fichier de sortie: {output_path}")
+    print(f"Fichier de sortie: {args.output}")
     print()
     print("Prochaine étape: ouvrir le viewer HTML avec ce fichier JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration gunicorn: plusieurs workers uvicorn en mode preload/fork.
+
+Usage:
+    gunicorn -c gunicorn.conf.py api:app
+
+Avec `uvicorn --workers N`, chaque worker importe le modèle et reconstruit
+les préréglages, la base de calibrage et les distributions Monte Carlo. Ici,
+l'application est importée et préchauffée une seule fois dans le processus
+maître, puis les workers sont créés par fork: ces données en lecture seule
+sont partagées en copy-on-write.
+
+Variables d'environnement:
+    PORT              Port d'écoute (défaut: 8000)
+    WEB_CONCURRENCY   Nombre de workers (défaut: 2)
+"""
+
+import asyncio
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+
+def when_ready(server):
+    """Charger la table des scénarios et préchauffer dans le maître, avant la création des workers."""
+    import api
+
+    if api.table_scenarios.reponses is None:
+        api.table_scenarios.charger()
+    if api.PREWARM:
+        asyncio.run(api.prechauffer())
+    # Sortir les objets existants du ramasse-miettes: ses passages dans les
+    # workers ne touchent plus leurs en-têtes, donc les pages restent partagées
+    gc.collect()
+    gc.freeze()
@@ -0,0 +1,170 @@
+"""
+Construction des fichiers de données optimisés pour la carte.
+
+Pour chaque fichier JSON publié dans data/current/, ce module produit:
+- une variante minifiée, nommée d'après le hash de son contenu
+  (ex: build/municipalities-stats.3f2a9c1b0d4e.json), cacheable indéfiniment
+- les variantes précompressées .gz et .br (si brotli est installé)
+- un manifeste (data/current/manifest.json) qui associe chaque nom logique
+  au fichier haché correspondant
+
+Les contenus identiques (ex: bil-data.json et mamh-data.json) ne sont écrits
+qu'une seule fois: les deux noms logiques pointent vers le même fichier.
+
+Usage:
+    python -m collectors.asset_builder  # reconstruit depuis data/current/
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .config import config
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel: seules les variantes .gz sont produites
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Longueur du hash dans les noms de fichiers (48 bits, amplement suffisant)
+HASH_LENGTH = 12
+
+
+def minify_json(data: Any) -> bytes:
+    """Sérialise en JSON compact (sans espaces, UTF-8, clés dans l'ordre)."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    """Retourne le hash SHA-256 tronqué d'un contenu."""
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+class AssetBuilder:
+    """Génère les variantes minifiées, hachées et précompressées + manifeste."""
+
+    def __init__(
+        self,
+        current_dir: Optional[Path] = None,
+        build_dir: Optional[Path] = None,
+    ):
+        """
+        Initialise le constructeur.
+
+        Args:
+            current_dir: Répertoire des données publiées (défaut: config.CURRENT_DIR)
+            build_dir: Répertoire des fichiers hachés (défaut: config.BUILD_DIR)
+        """
+        self.current_dir = Path(current_dir) if current_dir else config.CURRENT_DIR
+        self.build_dir = Path(build_dir) if build_dir else config.BUILD_DIR
+        self.manifest_path = self.current_dir / config.MANIFEST_FILE
+
+    def _write_variants(self, stem: str, payload: bytes) -> Dict[str, Any]:
+        """Écrit le fichier haché et ses variantes compressées."""
+        digest = content_hash(payload)
+        filename = f"{stem}.{digest}.json"
+        path = self.build_dir / filename
+
+        path.write_bytes(payload)
+        # mtime=0: sortie déterministe (même contenu → mêmes octets)
+        gz = gzip.compress(payload, compresslevel=config.GZIP_LEVEL, mtime=0)
+        (self.build_dir / f"{filename}.gz").write_bytes(gz)
+
+        entry = {
+            "path": f"{self.build_dir.name}/{filename}",
+            "hash": digest,
+            "bytes": len(payload),
+            "gzip_bytes": len(gz),
+        }
+        if brotli is not None:
+            br = brotli.compress(payload, quality=config.BROTLI_QUALITY)
+            (self.build_dir / f"{filename}.br").write_bytes(br)
+            entry["br_bytes"] = len(br)
+        return entry
+
+    def _cleanup(self, keep: set):
+        """Supprime les fichiers hachés qui ne sont plus référencés."""
+        for path in self.build_dir.iterdir():
+            if not path.is_file():
+                continue
+            base = path.name
+            for suffix in (".gz", ".br"):
+                if base.endswith(suffix):
+                    base = base[: -len(suffix)]
+            if base not in keep:
+                path.unlink()
+                logger.debug(f"Removed stale asset {path.name}")
+
+    def build(self, sources: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Construit les fichiers optimisés et le manifeste.
+
+        Args:
+            sources: {nom logique (ex: "mamh-data.json"): données JSON}
+
+        Returns:
+            Manifeste écrit sur disque
+        """
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+
+        files: Dict[str, Dict[str, Any]] = {}
+        by_digest: Dict[str, Dict[str, Any]] = {}
+        for name, data in sources.items():
+            payload = minify_json(data)
+            digest = content_hash(payload)
+            if digest in by_digest:
+                # Contenu identique: réutiliser le même fichier
+                files[name] = dict(by_digest[digest])
+                logger.info(f"{name}: identical to {by_digest[digest]['path']}, deduplicated")
+                continue
+            entry = self._write_variants(Path(name).stem, payload)
+            by_digest[digest] = entry
+            files[name] = entry
+            logger.info(
+                f"{name}: {entry['bytes']:,} B minified, {entry['gzip_bytes']:,} B gzip"
+                + (f", {entry['br_bytes']:,} B brotli" if "br_bytes" in entry else "")
+            )
+
+        self._cleanup({Path(e["path"]).name for e in by_digest.values()})
+
+        manifest = {
+            "generated": datetime.now().isoformat(),
+            "encodings": ["br", "gzip"] if brotli is not None else ["gzip"],
+            "files": files,
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        logger.info(f"Saved {self.manifest_path}")
+        return manifest
+
+    def build_from_current(self) -> Dict[str, Any]:
+        """Reconstruit les fichiers optimisés à partir des JSON de data/current/."""
+        sources = {}
+        for name in (config.GEOJSON_FILE, config.STATS_FILE, "bil-data.json", "mamh-data.json",
+                     config.METADATA_FILE, config.CBA_FILE):
+            path = self.current_dir / name
+            if not path.exists():
+                logger.warning(f"Missing {path}, skipped")
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                sources[name] = json.load(f)
+        return self.build(sources)
+
+
+def main():
+    """Point d'entrée CLI."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    AssetBuilder().build_from_current()
+
+
+if __name__ == "__main__":
+    main()
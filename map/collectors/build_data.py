@@ -8,11 +8,15 @@ Ce script:
 3. Calcule et normalise les indicateurs
 4. Exécute les contrôles qualité
 5. Génère les fichiers de sortie
+6. Précalcule les indicateurs coûts-bénéfices par municipalité (couche carte)
 
 Usage:
     python -m collectors.build_data
     python -m collectors.build_data --year 2023
     python -m collectors.build_data --skip-qa
+
+L'étape 6 requiert le modèle analyse_compteurs_eau: depuis la racine du
+dépôt, lancer `python -m map.collectors.build_data` (sinon elle est ignorée).
 """
 
 import argparse
@@ -29,6 +33,8 @@ from .bil_collector import BILCollector
 from .statcan_csd_collector import StatCanCSDCollector
 from .data_merger import DataMerger
 from .qa_validator import QAValidator
+from .asset_builder import AssetBuilder
+from .cba_builder import CBABuilder
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +57,14 @@ class DataPipeline:
         self.statcan_collector = StatCanCSDCollector()
         self.merger = DataMerger()
         self.qa_validator = QAValidator()
+        self.asset_builder = AssetBuilder()
+        self.cba_builder = CBABuilder()
 
         self.results = {
             "statcan_csd": {"success": False, "error": None, "count": 0},
             "bil": {"success": False, "error": None, "count": 0},
             "merge": {"success": False, "error": None, "total_features": 0},
+            "cba": {"success": False, "error": None, "count": 0},
         }
 
     def collect_statcan(self) -> Optional[dict]:
@@ -159,6 +168,22 @@ class DataPipeline:
             }
         return stats
 
+    def generate_cba(self, stats: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Précalcule VAN/RBC/LCSW/récupération par municipalité et type de compteur."""
+        logger.info("Computing per-municipality CBA indicators...")
+        try:
+            cba = self.cba_builder.build(stats)
+            if cba is None:
+                self.results["cba"]["error"] = "analyse_compteurs_eau not importable"
+                return None
+            self.results["cba"]["success"] = True
+            self.results["cba"]["count"] = len(cba["donnees"])
+            return cba
+        except Exception as e:
+            logger.error(f"CBA computation failed: {e}")
+            self.results["cba"]["error"] = str(e)
+        return None
+
     def generate_metadata(self, qa_results: Dict[str, Any]) -> Dict[str, Any]:
         """Génère le fichier metadata.json enrichi."""
         # Calculate coverage
@@ -186,6 +211,7 @@ class DataPipeline:
                     "error": self.results["statcan_csd"]["error"],
                 },
                 "merge": self.results["merge"],
+                "cba": self.results["cba"],
             },
             "coverage": {
                 "lpcd": lpcd_coverage,
@@ -227,6 +253,7 @@ class DataPipeline:
         stats: Dict[str, Any],
         mamh_data: Dict[str, Any],
         metadata: Dict[str, Any],
+        cba: Optional[Dict[str, Any]] = None,
     ):
         """Sauvegarde tous les fichiers de sortie."""
         logger.info("Saving output files...")
@@ -265,6 +292,21 @@ class DataPipeline:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
         logger.info(f"Saved {metadata_path}")
 
+        # Per-municipality CBA layer
+        sources = {
+            config.GEOJSON_FILE: geojson,
+            config.STATS_FILE: stats,
+            "bil-data.json": mamh_data,
+            "mamh-data.json": mamh_data,
+            config.METADATA_FILE: metadata,
+        }
+        if cba is not None:
+            self.cba_builder.save(cba)
+            sources[config.CBA_FILE] = cba
+
+        # Minified, content-hashed, precompressed variants + manifest for map.js
+        self.asset_builder.build(sources)
+
         # Save to history/YYYY/
         year = self.year or datetime.now().year
         history_dir = config.get_history_dir(year)
@@ -318,10 +360,11 @@ class DataPipeline:
 
         # 4. Generate outputs
         stats = self.generate_stats(merged_geojson)
+        cba = self.generate_cba(stats)
         metadata = self.generate_metadata(qa_results)
 
         # 5. Save files
-        self.save_outputs(merged_geojson, stats, bil_data, metadata)
+        self.save_outputs(merged_geojson, stats, bil_data, metadata, cba)
 
         logger.info("=" * 60)
         logger.info("Pipeline completed successfully")
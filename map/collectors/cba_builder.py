@@ -0,0 +1,163 @@
+"""
+Indicateurs coûts-bénéfices précalculés par municipalité pour la carte.
+
+Pour chaque municipalité de municipalities-stats.json et chaque type de
+compteur (AMI, AMR, manuel), ce module évalue le modèle d'analyse
+(analyse_compteurs_eau) avec les hypothèses par défaut du calculateur et
+écrit une table compacte indexée par csd_uid (data/current/cba-results.json):
+
+    {
+      "compteurs": ["ami", "amr", "manuel"],
+      "colonnes": ["van", "rbc", "lcsw", "periode_recuperation"],
+      "donnees": {"2408030": [[van, rbc, lcsw, recup], [...], [...]], ...}
+    }
+
+La carte colore ainsi la VAN ou la période de récupération sans appeler
+l'API pour chaque municipalité.
+
+Le modèle est importé depuis la racine du dépôt: lancer le pipeline avec
+`python -m map.collectors.build_data`. S'il n'est pas importable, l'étape
+est ignorée.
+
+Usage:
+    python -m map.collectors.cba_builder  # reconstruit depuis data/current/
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .config import config
+
+try:
+    import analyse_compteurs_eau as ace
+except ImportError:  # modèle absent (pipeline lancé hors du dépôt): étape ignorée
+    ace = None
+
+logger = logging.getLogger(__name__)
+
+METER_TYPES = ("ami", "amr", "manuel")
+COLUMNS = ("van", "rbc", "lcsw", "periode_recuperation")
+
+# Arrondis de publication: $ entiers, ratios et années au centième
+DECIMALS = {"van": 0, "rbc": 3, "lcsw": 2, "periode_recuperation": 2}
+
+
+def calculator_meter(meter_type: str):
+    """Compteur par défaut du calculateur (source unique: ace.DEFAUTS_COMPTEUR_CALCULATEUR)."""
+    return ace.creer_compteur_calculateur(ace.TypeCompteur(meter_type))
+
+
+def _round(value: float, decimals: int):
+    """Arrondit; NaN et infini (pas de récupération) deviennent null."""
+    value = float(value)
+    if value != value or value in (float("inf"), float("-inf")):
+        return None
+    return round(value) if decimals == 0 else round(value, decimals)
+
+
+class CBABuilder:
+    """Calcule la table VAN/RBC/LCSW/récupération par municipalité."""
+
+    def __init__(self, current_dir: Optional[Path] = None):
+        """
+        Initialise le constructeur.
+
+        Args:
+            current_dir: Répertoire des données publiées (défaut: config.CURRENT_DIR)
+        """
+        self.current_dir = Path(current_dir) if current_dir else config.CURRENT_DIR
+        self.output_path = self.current_dir / config.CBA_FILE
+
+    @staticmethod
+    def available() -> bool:
+        """Le modèle d'analyse est-il importable?"""
+        return ace is not None
+
+    def build(self, stats: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Évalue toutes les municipalités pour chaque type de compteur.
+
+        Args:
+            stats: Contenu de municipalities-stats.json ({csd_uid: enregistrement})
+
+        Returns:
+            Table des résultats (None si le modèle est indisponible)
+        """
+        if ace is None:
+            logger.warning("analyse_compteurs_eau not importable, CBA layer skipped")
+            return None
+
+        from analyse_compteurs_eau.presets import FUITES_QUEBEC_DEUX_STOCKS, PERSISTANCE_REALISTE
+
+        municipalities, excluded = ace.charger_municipalites(stats)
+        by_meter = {}
+        for meter_type in METER_TYPES:
+            by_meter[meter_type] = ace.evaluer_municipalites(
+                municipalities,
+                calculator_meter(meter_type),
+                persistance=PERSISTANCE_REALISTE,
+                params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+                valeur_eau=ace.VALEUR_EAU_QUEBEC,
+            )
+
+        data = {}
+        for i, municipality in enumerate(municipalities):
+            data[municipality.csd_uid] = [
+                [_round(getattr(by_meter[m], col)[i], DECIMALS[col]) for col in COLUMNS]
+                for m in METER_TYPES
+            ]
+
+        base = ace.ParametresModele()
+        results = {
+            "generated": datetime.now().isoformat(),
+            "model_version": ace.__version__,
+            "hypotheses": {
+                "horizon": base.horizon_analyse,
+                "taux_actualisation_pct": base.taux_actualisation_pct,
+                "persistance": "realiste",
+                "scenario_fuites": "deux_stocks",
+                "valeur_eau_m3": ace.VALEUR_EAU_QUEBEC.valeur_sociale_m3,
+                "mode": "economique",
+            },
+            "compteurs": list(METER_TYPES),
+            "colonnes": list(COLUMNS),
+            "donnees": data,
+            "exclues": excluded,
+        }
+        viable = sum(1 for rows in data.values() if rows[0][0] is not None and rows[0][0] > 0)
+        logger.info(
+            f"CBA layer: {len(data)} municipalities x {len(METER_TYPES)} meter types "
+            f"({viable} with AMI VAN > 0), {len(excluded)} excluded"
+        )
+        return results
+
+    def save(self, results: Dict[str, Any]):
+        """Écrit cba-results.json dans data/current/."""
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, separators=(",", ":"))
+        logger.info(f"Saved {self.output_path}")
+
+    def build_from_current(self) -> Optional[Dict[str, Any]]:
+        """Reconstruit la table à partir de data/current/municipalities-stats.json."""
+        with open(self.current_dir / config.STATS_FILE, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        results = self.build(stats)
+        if results is not None:
+            self.save(results)
+        return results
+
+
+def main():
+    """Point d'entrée CLI."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    CBABuilder().build_from_current()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,11 +16,18 @@ class Config:
     CURRENT_DIR: Path = DATA_DIR / "current"
     CACHE_DIR: Path = DATA_DIR / "cache"
     HISTORY_DIR: Path = DATA_DIR / "history"
+    BUILD_DIR: Path = CURRENT_DIR / "build"
 
     # Fichiers de sortie
     GEOJSON_FILE: str = "quebec-municipalities.geojson"
     STATS_FILE: str = "municipalities-stats.json"
     METADATA_FILE: str = "metadata.json"
+    MANIFEST_FILE: str = "manifest.json"
+    CBA_FILE: str = "cba-results.json"
+
+    # Fichiers précompressés (servis tels quels, jamais compressés à la volée)
+    GZIP_LEVEL: int = 9
+    BROTLI_QUALITY: int = 11
 
     # Overpass API
     OVERPASS_URL: str = "https://overpass-api.de/api/interpreter"
@@ -15,6 +15,8 @@ class QuebecMap {
             statsPath: 'data/current/municipalities-stats.json',
             metadataPath: 'data/current/metadata.json',
             mamhPath: 'data/current/mamh-data.json',
+            manifestPath: 'data/current/manifest.json', // Hashed, precompressed variants
+            cbaPath: 'data/current/cba-results.json', // Precomputed VAN/payback per municipality
             onSelect: null, // Callback when municipality is selected
             ...options
         };
@@ -28,7 +30,11 @@ class QuebecMap {
         this.mamh = {};
         this.statsIndex = null;
         this.mamhIndex = null;
+        this.manifest = null;
+        this.cba = null;
+        this.cbaIndex = null;
         this.currentMetric = 'lpcd';
+        this.currentMeter = 'ami';
         this.selectedFeature = null;
         this.searchIndex = [];
         this.globalStats = null;
@@ -51,8 +57,29 @@ class QuebecMap {
                 labels: ['< 1k', '1k-5k', '5k-25k', '25k-100k', '> 100k'],
                 descriptions: ['< 1 000', '1 000 - 5 000', '5 000 - 25 000', '25 000 - 100 000', '> 100 000'],
                 unit: 'habitants'
+            },
+            van: {
+                ranges: [-1000000, -100000, 0, 100000],
+                colors: ['#b91c1c', '#f87171', '#fde68a', '#4ade80', '#15803d'],
+                labels: ['Très négative', 'Négative', 'Faiblement négative', 'Positive', 'Très positive'],
+                descriptions: ['< -1 M$', '-1 M$ à -100 k$', '-100 k$ à 0', '0 à 100 k$', '> 100 k$'],
+                unit: '$ (VAN 20 ans)'
+            },
+            periode_recuperation: {
+                ranges: [5, 10, 15, 20.001],
+                colors: ['#15803d', '#4ade80', '#fde68a', '#f87171', '#b91c1c'],
+                labels: ['Rapide', 'Bonne', 'Moyenne', 'Lente', 'Non récupéré'],
+                descriptions: ['< 5 ans', '5-10 ans', '10-15 ans', '15-20 ans', 'sur l\'horizon'],
+                unit: 'années'
             }
         };
+        this.metricTitles = {
+            lpcd: 'Consommation d\'eau',
+            population: 'Population',
+            van: 'Valeur actuelle nette',
+            periode_recuperation: 'Période de récupération'
+        };
+        this.meterLabels = { ami: 'AMI', amr: 'AMR', manuel: 'Manuel' };
 
         this.init();
     }
@@ -130,8 +157,10 @@ class QuebecMap {
         this.showLoader('Chargement des données...', 20);
 
         try {
+            await this.loadManifest();
+
             // Load GeoJSON
-            const geojsonResponse = await fetch(this.options.dataPath);
+            const geojsonResponse = await fetch(this.resolveDataPath(this.options.dataPath));
             if (!geojsonResponse.ok) throw new Error('Données géographiques non disponibles');
 
             this.showLoader('Traitement des géométries...', 40);
@@ -154,21 +183,41 @@ class QuebecMap {
         }
     }
 
+    async loadManifest() {
+        // The manifest maps each logical file to its minified, content-hashed
+        // build (identical files share one entry). Missing manifest = legacy paths.
+        if (!this.options.manifestPath) return;
+        try {
+            const res = await fetch(this.options.manifestPath, { cache: 'no-cache' });
+            if (res.ok) this.manifest = await res.json();
+        } catch {
+            this.manifest = null;
+        }
+    }
+
+    resolveDataPath(path) {
+        if (!path || !this.manifest?.files) return path;
+        const name = path.split('/').pop();
+        const entry = this.manifest.files[name];
+        if (!entry?.path) return path;
+        const base = this.options.manifestPath.slice(0, this.options.manifestPath.lastIndexOf('/') + 1);
+        return base + entry.path;
+    }
+
     async loadAuxiliaryData() {
+        const fetched = new Map(); // Deduplicate requests for identical files
         const fetchJson = async (path) => {
             if (!path) return null;
-            try {
-                const res = await fetch(path);
-                return res.ok ? await res.json() : null;
-            } catch {
-                return null;
-            }
+            const url = this.resolveDataPath(path);
+            if (!fetched.has(url)) fetched.set(url, this.fetchJsonUrl(url));
+            return fetched.get(url);
         };
 
-        const [stats, metadata, mamh] = await Promise.all([
+        const [stats, metadata, mamh, cba] = await Promise.all([
             fetchJson(this.options.statsPath),
             fetchJson(this.options.metadataPath),
-            fetchJson(this.options.mamhPath)
+            fetchJson(this.options.mamhPath),
+            fetchJson(this.options.cbaPath)
         ]);
 
         if (stats) {
@@ -184,6 +233,20 @@ class QuebecMap {
             this.mamh = mamh;
             this.buildMamhIndex(mamh);
         }
+
+        if (cba?.donnees) {
+            this.cba = cba;
+            this.buildCbaIndex(cba);
+        }
+    }
+
+    async fetchJsonUrl(url) {
+        try {
+            const res = await fetch(url);
+            return res.ok ? await res.json() : null;
+        } catch {
+            return null;
+        }
     }
 
     buildStatsIndex(stats) {
@@ -210,6 +273,41 @@ class QuebecMap {
         this.mamhIndex = { byName };
     }
 
+    buildCbaIndex(cba) {
+        // donnees[csd_uid][meter][column], in the order of cba.compteurs / cba.colonnes
+        this.cbaIndex = {
+            meters: Object.fromEntries(cba.compteurs.map((m, i) => [m, i])),
+            columns: Object.fromEntries(cba.colonnes.map((c, i) => [c, i]))
+        };
+    }
+
+    getCbaValue(props, column, meter = this.currentMeter) {
+        // undefined: no result for this municipality; null: not recovered/NaN
+        const rows = props.cba;
+        if (!rows || !this.cbaIndex) return undefined;
+        const row = rows[this.cbaIndex.meters[meter]];
+        return row ? row[this.cbaIndex.columns[column]] : undefined;
+    }
+
+    isCbaMetric(metric) {
+        return metric === 'van' || metric === 'periode_recuperation';
+    }
+
+    getMetricValue(props, metric) {
+        if (!this.isCbaMetric(metric)) return props[metric];
+        const value = this.getCbaValue(props, metric);
+        if (value === undefined) return null;
+        // Payback never reached within the horizon: last bucket, not missing
+        if (value === null) return metric === 'periode_recuperation' ? Infinity : null;
+        return value;
+    }
+
+    hasMetricData(props, metric) {
+        const value = this.getMetricValue(props, metric);
+        if (metric === 'lpcd') return value != null && props.lpcd_status !== 'missing';
+        return value != null;
+    }
+
     normalizeName(name) {
         if (!name) return '';
         return name.toString().trim().toLowerCase()
@@ -249,6 +347,12 @@ class QuebecMap {
                 props.lpcd_data_year = props.lpcd_data_year ?? statsMatch.lpcd_data_year;
             }
 
+            // Precomputed CBA results join (by csd_uid)
+            const cbaId = props.csd_uid ?? statsMatch?.csd_uid;
+            if (this.cba && cbaId != null) {
+                props.cba = this.cba.donnees[String(cbaId)] ?? null;
+            }
+
             // MAMH fallback
             if (this.mamhIndex && nameKey) {
                 const mamhMatch = this.mamhIndex.byName.get(nameKey);
@@ -470,14 +574,11 @@ class QuebecMap {
 
     getFeatureStyle(feature) {
         const props = feature.properties || {};
-        const value = props[this.currentMetric];
-        const status = props.lpcd_status;
+        const value = this.getMetricValue(props, this.currentMetric);
         const zoom = this.map?.getZoom() ?? this.options.zoom;
 
         // Metric-aware data availability check
-        const hasData = this.currentMetric === 'lpcd'
-            ? (value != null && status !== 'missing')
-            : (value != null);
+        const hasData = this.hasMetricData(props, this.currentMetric);
 
         // Opacity based on zoom
         const fillOpacity = hasData
@@ -569,11 +670,28 @@ class QuebecMap {
                         <span class="popup-stat-value">${this.formatNumber(props.population)}</span>
                     </div>
                     ` : ''}
+                    ${this.cbaPopupRow(props)}
                 </div>
             </div>
         `;
     }
 
+    cbaPopupRow(props) {
+        const van = this.getCbaValue(props, 'van');
+        if (van == null) return '';
+        const payback = this.getCbaValue(props, 'periode_recuperation');
+        return `
+                    <div class="popup-stat-row">
+                        <span class="popup-stat-label">VAN ${this.meterLabels[this.currentMeter]}</span>
+                        <span class="popup-stat-value">${this.formatMoney(van)}</span>
+                    </div>
+                    <div class="popup-stat-row">
+                        <span class="popup-stat-label">Récupération</span>
+                        <span class="popup-stat-value">${payback != null ? payback.toFixed(1) + ' ans' : 'Non récupéré'}</span>
+                    </div>
+        `;
+    }
+
     highlightFeature(e) {
         const layer = e.target;
         layer.setStyle({
@@ -761,7 +879,7 @@ class QuebecMap {
 
             let html = `
                 <div class="legend-header">
-                    <span class="legend-title">Consommation d'eau</span>
+                    <span class="legend-title">${this.metricTitles[this.currentMetric]}${this.isCbaMetric(this.currentMetric) ? ' · ' + this.meterLabels[this.currentMeter] : ''}</span>
                     <span class="legend-unit">${scale.unit}</span>
                 </div>
                 <div class="legend-scale">
@@ -781,11 +899,12 @@ class QuebecMap {
             html += `
                 </div>
                 <div class="legend-divider"></div>
+                ${this.currentMetric === 'lpcd' ? `
                 <div class="legend-target">
                     <span class="legend-target-label">Cible Quebec</span>
                     <span class="legend-target-value">${this.targetLpcd} L/pers/j</span>
                 </div>
-                <div class="legend-divider"></div>
+                <div class="legend-divider"></div>` : ''}
                 <div class="legend-item legend-missing">
                     <span class="legend-color"></span>
                     <span class="legend-label">Données non disponibles</span>
@@ -808,13 +927,12 @@ class QuebecMap {
         if (!this.geojsonData?.features) return counts;
 
         for (const feature of this.geojsonData.features) {
-            const value = feature.properties?.[this.currentMetric];
-            const status = feature.properties?.lpcd_status;
-
-            if (value == null || status === 'missing') {
+            const props = feature.properties || {};
+            if (!this.hasMetricData(props, this.currentMetric)) {
                 counts.missing++;
                 continue;
             }
+            const value = this.getMetricValue(props, this.currentMetric);
 
             let category = scale.ranges.length;
             for (let i = 0; i < scale.ranges.length; i++) {
@@ -834,17 +952,30 @@ class QuebecMap {
 
         metricControl.onAdd = () => {
             const div = L.DomUtil.create('div', 'metric-control');
+            const cbaOptions = this.cba ? `
+                    <option value="van">VAN (compteurs)</option>
+                    <option value="periode_recuperation">Récupération (compteurs)</option>` : '';
+            const meterSelector = this.cba ? `
+                <select id="meter-selector" hidden>
+                    ${this.cba.compteurs.map(m => `<option value="${m}"${m === this.currentMeter ? ' selected' : ''}>${this.meterLabels[m] || m}</option>`).join('')}
+                </select>` : '';
             div.innerHTML = `
                 <select id="metric-selector">
                     <option value="lpcd" selected>Consommation (LPCD)</option>
-                    <option value="population">Population</option>
-                </select>
+                    <option value="population">Population</option>${cbaOptions}
+                </select>${meterSelector}
             `;
 
             L.DomEvent.disableClickPropagation(div);
+            const meterSelect = div.querySelector('#meter-selector');
             div.querySelector('#metric-selector').addEventListener('change', (e) => {
+                if (meterSelect) meterSelect.hidden = !this.isCbaMetric(e.target.value);
                 this.setMetric(e.target.value);
             });
+            meterSelect?.addEventListener('change', (e) => {
+                this.currentMeter = e.target.value;
+                this.setMetric(this.currentMetric);
+            });
 
             return div;
         };
@@ -986,6 +1117,18 @@ class QuebecMap {
                 avgEl.className = 'stat-value';
             }
             if (coverageEl) coverageEl.textContent = popCoverage + '%';
+        } else if (this.isCbaMetric(this.currentMetric)) {
+            // Share of municipalities with a positive VAN for the selected meter
+            const vans = this.geojsonData.features
+                .map(f => this.getCbaValue(f.properties || {}, 'van'))
+                .filter(v => v != null);
+            const positive = vans.filter(v => v > 0).length;
+
+            if (avgEl) {
+                avgEl.textContent = vans.length ? `${positive} / ${vans.length}` : '—';
+                avgEl.className = 'stat-value';
+            }
+            if (coverageEl) coverageEl.textContent = Math.round((vans.length / this.geojsonData.features.length) * 100) + '%';
         }
 
         if (countEl) countEl.textContent = this.formatNumber(this.globalStats.total);
@@ -1068,6 +1211,14 @@ class QuebecMap {
         return Number(num).toLocaleString('fr-CA');
     }
 
+    formatMoney(value) {
+        if (value == null) return 'N/D';
+        const abs = Math.abs(value);
+        if (abs >= 1e6) return (value / 1e6).toLocaleString('fr-CA', { maximumFractionDigits: 1 }) + ' M$';
+        if (abs >= 1e3) return Math.round(value / 1e3).toLocaleString('fr-CA') + ' k$';
+        return Math.round(value).toLocaleString('fr-CA') + ' $';
+    }
+
     capitalizeFirst(str) {
         if (!str) return '';
         return str.charAt(0).toUpperCase() + str.slice(1);
@@ -0,0 +1,880 @@
+/**
+ * NoyauCompteurs - Noyau déterministe du modèle coûts-bénéfices
+ *
+ * Port sans dépendance de executer_modele() (analyse_compteurs_eau/core.py)
+ * pour recalculer la VAN dans le navigateur à chaque mouvement de curseur.
+ * Le serveur reste la référence pour Monte Carlo et les analyses lourdes.
+ *
+ * Format des entrées et des résultats: analyse_compteurs_eau/noyau.py
+ * (entrees_noyau, resultats_noyau). Tables de préréglages: GET /api/kernel_spec.
+ * Validé contre le moteur Python par test_api.py (SCENARIOS_CANONIQUES).
+ */
+(function (racine, fabrique) {
+    if (typeof module === 'object' && module.exports) {
+        module.exports = fabrique();
+    } else {
+        racine.NoyauCompteurs = fabrique();
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    'use strict';
+
+    const VERSION = 1;
+
+    function borner(x, min, max) {
+        return Math.max(min, Math.min(max, x));
+    }
+
+    function zeros(T) {
+        return new Array(T).fill(0);
+    }
+
+    function somme(serie) {
+        let total = 0;
+        for (const v of serie) total += v;
+        return total;
+    }
+
+    function divisionSecurisee(num, denom) {
+        return Math.abs(denom) < 1e-10 ? NaN : num / denom;
+    }
+
+    // =========================================================================
+    // Économies d'échelle et compteur
+    // =========================================================================
+
+    function facteurEchelle(nbCompteurs, config) {
+        if (!config.activer) return 1.0;
+        if (config.utiliser_modele_continu) {
+            if (nbCompteurs <= 0) return 1.0;
+            const ratio = nbCompteurs / config.nb_reference;
+            if (ratio <= 1) return 1.0;
+            const facteur = 1.0 - config.elasticite_echelle * Math.log(ratio);
+            return Math.max(0.70, Math.min(1.0, facteur));
+        }
+        const paliers = config.paliers.slice().sort((a, b) => a[0] - b[0]);
+        let facteur = 1.0;
+        for (const [seuil, f] of paliers) {
+            if (nbCompteurs >= seuil) facteur = f;
+        }
+        return facteur;
+    }
+
+    function appliquerFacteurEchelle(facteurBase, poids) {
+        return 1.0 - (1.0 - facteurBase) * borner(poids, 0.0, 1.0);
+    }
+
+    function coutInstallation(compteur) {
+        return compteur.heures_installation * compteur.taux_horaire_installation;
+    }
+
+    function coutInitialParCompteur(compteur) {
+        let base = compteur.cout_compteur + coutInstallation(compteur);
+        if (compteur.type_compteur === 'ami') base += compteur.cout_reseau_par_compteur;
+        return base;
+    }
+
+    function coutExploitationAnnuel(compteur) {
+        if (compteur.type_compteur === 'ami') {
+            return compteur.cout_maintenance_ami + compteur.cout_opex_non_tech_ami;
+        }
+        if (compteur.type_compteur === 'amr') {
+            return compteur.cout_maintenance_amr + compteur.cout_lecture_amr;
+        }
+        return compteur.cout_maintenance_manuel + compteur.cout_lecture_manuel;
+    }
+
+    // =========================================================================
+    // Persistance comportementale α_B(t)
+    // =========================================================================
+
+    function alphaComportement(t, p) {
+        if (t < 1) return 0.0;
+        const alpha0 = p.alpha_initial;
+        switch (p.mode) {
+            case 'constant':
+                return alpha0;
+            case 'exp_plateau':
+                return p.alpha_plateau + (alpha0 - p.alpha_plateau) * Math.exp(-p.lambda_decay * (t - 1));
+            case 'fadeout_lin':
+                if (p.annees_fadeout <= 1) return t === 1 ? alpha0 : 0.0;
+                return alpha0 * Math.max(0.0, 1.0 - (t - 1) / (p.annees_fadeout - 1));
+            case 'fadeout_exp':
+                return alpha0 * Math.exp(-p.lambda_decay * (t - 1));
+            default:
+                return alpha0;
+        }
+    }
+
+    // =========================================================================
+    // Économies d'eau initiales par ménage
+    // =========================================================================
+
+    function volumeFuiteMoyenPondere(f) {
+        if (!f.utiliser_prevalence_differenciee) return f.debit_fuite_m3_an;
+        const pAny = f.part_menages_fuite_any_pct;
+        const pSig = f.part_menages_fuite_significative_pct;
+        if (pAny <= 0) return 0.0;
+        const pAnyExcl = Math.max(0.0, pAny - pSig);
+        return (f.debit_fuite_any_m3_an * pAnyExcl + f.debit_fuite_significative_m3_an * pSig) / pAny;
+    }
+
+    function economiesEau(params, fuites, compteur) {
+        const usageBase = (params.lpcd * params.taille_menage * 365.0) / 1000.0;
+        let partFuite, debitFuite, tauxCorrection;
+        if (fuites === null) {
+            partFuite = params.part_menages_fuite_pct / 100.0;
+            debitFuite = params.debit_fuite_m3_an;
+            tauxCorrection = params.taux_correction_fuite_pct / 100.0;
+        } else {
+            partFuite = fuites.part_menages_fuite_pct / 100.0;
+            debitFuite = fuites.utiliser_prevalence_differenciee
+                ? volumeFuiteMoyenPondere(fuites)
+                : fuites.debit_fuite_m3_an;
+            tauxCorrection = (fuites.taux_detection_pct / 100.0) * (fuites.taux_reparation_pct / 100.0)
+                * (1.0 - fuites.part_fuites_persistantes_pct / 100.0);
+        }
+        const usageReductible = Math.max(0.0, usageBase - partFuite * debitFuite);
+        return {
+            usageBase,
+            usageReductible,
+            economieFuite: partFuite * debitFuite * tauxCorrection * compteur.facteur_efficacite_fuites,
+        };
+    }
+
+    // =========================================================================
+    // Dynamique des fuites privées (stock actif avec plateau), pour H ménages
+    // =========================================================================
+
+    function evoluerStock(depart, taux, nouveaux) {
+        if (taux <= 0) return [depart + nouveaux, depart + 0.5 * nouveaux];
+        const equilibre = nouveaux / taux;
+        const e = Math.exp(-taux);
+        return [
+            equilibre + (depart - equilibre) * e,
+            equilibre + (depart - equilibre) * (1.0 - e) / taux,
+        ];
+    }
+
+    // Stock réparable ou persistant d'un type de fuite: [base, compteur]
+    function stock(initial, tauxBase, tauxCompteur, nouveaux) {
+        let base = initial;
+        let comp = initial;
+        return function () {
+            let moyBase, moyComp;
+            [base, moyBase] = evoluerStock(base, tauxBase, nouveaux);
+            [comp, moyComp] = evoluerStock(comp, tauxCompteur, nouveaux);
+            return [moyBase, moyComp];
+        };
+    }
+
+    function dynamiqueFuites(f, H, T, facteurDetection) {
+        const dEff = (f.taux_detection_pct / 100.0) * borner(facteurDetection, 0.0, 1.0);
+        const rBase = f.taux_reparation_pct / 100.0;
+        const q = f.taux_nouvelles_fuites_pct / 100.0;
+        const partVille = f.inclure_cout_reparation ? f.part_ville_pct / 100.0 : 0.0;
+        const longueTraine = 1.0 / Math.max(1.0, f.facteur_duree_longue_traine);
+
+        const economies = zeros(T);
+        const couts = zeros(T);
+
+        if (f.utiliser_prevalence_differenciee) {
+            const pSig = f.part_menages_fuite_significative_pct / 100.0;
+            const pTotal = f.part_menages_fuite_any_pct / 100.0;
+            const pAnyExcl = Math.max(0.0, pTotal - pSig);
+            const fracPersist = f.part_fuites_persistantes_pct / 100.0;
+            const fracRepar = 1.0 - fracPersist;
+            let mu;
+            if (f.duree_moyenne_fuite_sans_compteur !== null) {
+                mu = 1.0 / f.duree_moyenne_fuite_sans_compteur;
+            } else {
+                mu = pTotal > 0 && q > 0 ? q / pTotal : 0.25;
+            }
+
+            const types = [
+                {
+                    p: pAnyExcl,
+                    debit: f.debit_fuite_any_m3_an,
+                    cout: f.inclure_cout_reparation ? f.cout_reparation_any : 0.0,
+                    k: dEff * rBase,
+                },
+                {
+                    p: pSig,
+                    debit: f.debit_fuite_significative_m3_an,
+                    cout: f.inclure_cout_reparation ? f.cout_reparation_sig : 0.0,
+                    k: Math.min(1.0, dEff * f.facteur_detection_sig) * (rBase * f.facteur_reparation_sig),
+                },
+            ];
+            for (const type of types) {
+                const nouvelles = pTotal > 0 ? H * q * (type.p / pTotal) : 0;
+                const kPers = type.k * longueTraine;
+                type.rep = stock(H * type.p * fracRepar, mu, mu + type.k, nouvelles * fracRepar);
+                type.pers = stock(H * type.p * fracPersist, mu * longueTraine,
+                    mu * longueTraine + kPers, nouvelles * fracPersist);
+                type.kPers = kPers;
+            }
+
+            for (let t = 0; t < T; t++) {
+                // Économies par sous-stock bornées à 0 séparément (comme core.py)
+                let eco = 0.0;
+                let cout = 0.0;
+                for (const type of types) {
+                    const [baseRep, compRep] = type.rep();
+                    const [basePers, compPers] = type.pers();
+                    eco += Math.max(0.0, (baseRep - compRep) * type.debit);
+                    eco += Math.max(0.0, (basePers - compPers) * type.debit);
+                    cout += type.k * compRep * type.cout + type.kPers * compPers * type.cout;
+                }
+                economies[t] = eco;
+                couts[t] = cout;
+            }
+        } else {
+            const p0 = f.part_menages_fuite_pct / 100.0;
+            const C = f.inclure_cout_reparation ? f.cout_reparation_moyen : 0.0;
+            const k = dEff * rBase;
+            const fracPersist = borner(f.part_fuites_persistantes_pct / 100.0, 0.0, 1.0);
+            const fracRepar = 1.0 - fracPersist;
+            let mu;
+            if (f.duree_moyenne_fuite_sans_compteur !== null) {
+                mu = 1.0 / f.duree_moyenne_fuite_sans_compteur;
+            } else if (p0 > 0 && q > 0) {
+                mu = q / p0;
+            } else {
+                mu = 0.25;
+            }
+            const kPers = k * longueTraine;
+            const rep = stock(H * p0 * fracRepar, mu, mu + k, H * q * fracRepar);
+            const pers = stock(H * p0 * fracPersist, mu * longueTraine,
+                mu * longueTraine + kPers, H * q * fracPersist);
+
+            for (let t = 0; t < T; t++) {
+                const [baseRep, compRep] = rep();
+                const [basePers, compPers] = pers();
+                economies[t] = Math.max(0.0,
+                    (baseRep - compRep) * f.debit_fuite_m3_an + (basePers - compPers) * f.debit_fuite_m3_an);
+                couts[t] = (k * compRep + kPers * compPers) * C;
+            }
+        }
+
+        return {
+            economies,
+            coutTotal: couts,
+            coutVille: couts.map(c => c * partVille),
+            coutMenages: couts.map(c => c * (1 - partVille)),
+        };
+    }
+
+    // =========================================================================
+    // Fuites réseau (optionnel)
+    // =========================================================================
+
+    function progressionReseau(t, p) {
+        if (!p.activer || t < p.annee_demarrage) return 0.0;
+        const tEff = t - p.annee_demarrage + 1;
+        if (p.mode_reduction === 'lineaire') return Math.min(1.0, tEff / p.annees_atteinte);
+        if (p.mode_reduction === 'exponentiel') return 1.0 - Math.exp(-p.lambda_reduction * (tEff - 1));
+        return 0.0;
+    }
+
+    function dynamiqueFuitesReseau(p, T, adoptionEffective) {
+        const economies = zeros(T);
+        const couts = zeros(T);
+        if (!p.activer || p.volume_pertes_m3_an <= 0) return { economies, couts };
+        const maxReduction = p.reduction_max_pct / 100.0;
+        for (let i = 0; i < T; i++) {
+            const adoption = p.pondere_par_adoption ? adoptionEffective[i] : 1.0;
+            const progression = progressionReseau(i + 1, p);
+            economies[i] = p.volume_pertes_m3_an * (maxReduction * progression) * adoption;
+            couts[i] = p.cout_programme_annuel * progression * adoption + p.cout_reparation_m3 * economies[i];
+        }
+        return { economies, couts };
+    }
+
+    // =========================================================================
+    // Adoption A(t) et cohortes
+    // =========================================================================
+
+    function adoption(t, p) {
+        if (t < p.annee_demarrage) return 0.0;
+        const tEff = t - p.annee_demarrage + 1;
+        const aMax = p.adoption_max_pct / 100.0;
+        switch (p.mode) {
+            case 'obligatoire':
+                // Valeur par défaut (90%) traitée comme 100% (cf. core.py)
+                if (p.adoption_max_pct >= 100.0 || p.adoption_max_pct === 90.0) return 1.0;
+                return aMax;
+            case 'volontaire_incitatif':
+                return aMax / (1.0 + Math.exp(-p.k_vitesse * (tEff - p.t0_point_median)));
+            case 'nouveaux_branchements':
+                return Math.min(tEff * (p.taux_nouveaux_pct / 100.0), aMax);
+            case 'par_secteur': {
+                if (tEff >= p.nb_secteurs * p.annees_par_secteur) return aMax;
+                const complets = Math.floor(tEff / p.annees_par_secteur);
+                const enCours = (tEff % p.annees_par_secteur) / p.annees_par_secteur;
+                return Math.min(((complets + enCours) / p.nb_secteurs) * aMax, aMax);
+            }
+            case 'calendrier': {
+                const calendrier = p.calendrier_pct;
+                return calendrier[Math.min(Math.trunc(tEff), calendrier.length) - 1] / 100.0;
+            }
+            default:
+                return 1.0;
+        }
+    }
+
+    function serieAdoption(p, T) {
+        const serie = zeros(T);
+        for (let t = 1; t <= T; t++) serie[t - 1] = adoption(t, p);
+        return serie;
+    }
+
+    function deltaAdoption(serie) {
+        return serie.map((a, i) => (i === 0 ? a : Math.max(0.0, a - serie[i - 1])));
+    }
+
+    function convoluerCohortes(delta, serieParAge, n, fractionPremiereAnnee) {
+        const serie = serieParAge.slice();
+        if (serie.length > 0) serie[0] *= borner(fractionPremiereAnnee, 0.0, 1.0);
+        return delta.map((_, t) => {
+            let total = 0.0;
+            for (let c = 0; c <= t; c++) total += delta[c] * serie[t - c];
+            return total * n;
+        });
+    }
+
+    // =========================================================================
+    // Trajectoires annuelles (generer_trajectoires)
+    // =========================================================================
+
+    function trajectoires(e, economies) {
+        const { params, compteur, echelle, persistance, fuites, adoption: pa, valeur_eau: ve } = e;
+        const reseau = e.fuites_reseau;
+        const T = params.horizon_analyse;
+        const H = params.nb_menages;
+        const HCompteurs = params.nb_compteurs === null ? params.nb_menages : Math.trunc(params.nb_compteurs);
+        const estAmi = compteur.type_compteur === 'ami';
+        const f1 = pa.fraction_premiere_annee;
+
+        // Économies d'échelle sur le nombre de compteurs effectivement achetés
+        const facteur = facteurEchelle(Math.trunc(HCompteurs * (pa.adoption_max_pct / 100.0)), echelle);
+        const coutAjuste = compteur.cout_compteur * appliquerFacteurEchelle(facteur, echelle.poids_compteur)
+            + coutInstallation(compteur) * appliquerFacteurEchelle(facteur, echelle.poids_installation)
+            + (estAmi ? compteur.cout_reseau_par_compteur : 0.0) * appliquerFacteurEchelle(facteur, echelle.poids_reseau);
+        const I0Total = coutAjuste * HCompteurs + (estAmi ? compteur.cout_infra_fixe : 0.0);
+
+        const A = serieAdoption(pa, T);
+        const delta = deltaAdoption(A);
+        const f = borner(f1, 0.0, 1.0);
+        const AEff = A.map((a, i) => a - (1.0 - f) * delta[i]);
+
+        let capexEtale = zeros(T);
+        let I0 = I0Total;
+        if (pa.etaler_capex) {
+            capexEtale = A.map((a, i) => Math.max(0.0, I0Total * (i === 0 ? a : a - A[i - 1])));
+            I0 = 0.0;
+        }
+
+        // Économies par âge du compteur (cohorte installée en année 1)
+        const facteurComportement = borner(compteur.facteur_efficacite_comportement, 0.0, 1.0);
+        const ecoComportement = zeros(T).map((_, i) =>
+            economies.usageReductible * (alphaComportement(i + 1, persistance) * facteurComportement));
+        let fuitesCohorte = null;
+        let ecoFuite;
+        if (fuites !== null) {
+            fuitesCohorte = dynamiqueFuites(fuites, 1, T, compteur.facteur_efficacite_fuites);
+            ecoFuite = fuitesCohorte.economies;
+        } else {
+            ecoFuite = zeros(T).fill(economies.economieFuite);
+        }
+
+        let ecoReseauM3 = zeros(T);
+        let ecoReseauMenage = zeros(T);
+        let coutsReseau = zeros(T);
+        let capexReseau = null;
+        if (reseau !== null && reseau.activer) {
+            const res = dynamiqueFuitesReseau(reseau, T, AEff);
+            ecoReseauM3 = res.economies;
+            coutsReseau = res.couts;
+            if (H > 0) ecoReseauMenage = ecoReseauM3.map(v => v / H);
+            if (reseau.cout_capex_initial > 0) {
+                capexReseau = { annee: reseau.annee_capex, montant: reseau.cout_capex_initial };
+            }
+        }
+
+        const ecoParMenage = ecoFuite.map((v, i) => v + ecoComportement[i] + ecoReseauMenage[i]);
+        const m3Comportement = convoluerCohortes(delta, ecoComportement, H, f1);
+        const m3Fuites = convoluerCohortes(delta, ecoFuite, H, f1);
+        const m3 = m3Comportement.map((v, i) => v + m3Fuites[i] + ecoReseauM3[i]);
+
+        const valeurM3 = e.mode_compte === 'economique' ? ve.valeur_sociale_m3 : ve.cout_variable_m3;
+        const beneficesEau = m3.map(v => v * valeurM3);
+        let beneficesInfra = AEff.map(a => params.benefice_report_infra_annuel * a);
+        if (params.benefice_report_infra_par_m3 > 0) {
+            beneficesInfra = beneficesInfra.map((b, i) => b + m3[i] * params.benefice_report_infra_par_m3);
+        }
+
+        const opexAnnuel = coutExploitationAnnuel(compteur) * HCompteurs;
+        const coutsExploitation = AEff.map(a => opexAnnuel * a);
+
+        // Remplacements de batterie (AMI/AMR) à chaque durée de vie, par cohorte
+        let batteries = zeros(T);
+        if ((estAmi || compteur.type_compteur === 'amr')
+            && compteur.cout_remplacement_batterie > 0 && compteur.duree_vie_batterie > 0) {
+            const parAge = zeros(T);
+            for (let annee = compteur.duree_vie_batterie; annee <= T; annee += compteur.duree_vie_batterie) {
+                parAge[annee - 1] = compteur.cout_remplacement_batterie;
+            }
+            if (parAge.some(v => v > 0)) {
+                batteries = convoluerCohortes(delta, parAge, HCompteurs, f1).map(v => (v > 0 ? v : 0.0));
+            }
+        }
+
+        let reparationsVille = zeros(T);
+        let reparationsMenages = zeros(T);
+        if (fuites !== null && fuites.inclure_cout_reparation) {
+            reparationsVille = convoluerCohortes(delta, fuitesCohorte.coutVille, H, f1);
+            reparationsMenages = convoluerCohortes(delta, fuitesCohorte.coutMenages, H, f1);
+            // Somme de contrôle de couts_reparation_actifs (coût total > 0)
+            reparationsVille.actifs = somme(convoluerCohortes(delta, fuitesCohorte.coutTotal, H, f1)) > 0;
+        }
+
+        const incitatifs = zeros(T);
+        if (pa.cout_incitatif_par_menage > 0) {
+            const parAn = pa.cout_incitatif_par_menage / pa.duree_incitatif_ans;
+            for (let t = 0; t < T; t++) {
+                for (let c = Math.max(0, t - pa.duree_incitatif_ans + 1); c <= t; c++) {
+                    incitatifs[t] += delta[c] * H * parAn;
+                }
+            }
+        }
+
+        return {
+            T, H, HCompteurs, I0, facteur, coutAjuste,
+            adoption: A, capexEtale, beneficesEau, beneficesInfra, coutsExploitation, coutsReseau,
+            capexReseau, batteries, reparationsVille, reparationsMenages,
+            reparationsActives: Boolean(reparationsVille.actifs), incitatifs,
+            m3, ecoParMenage, ecoFuite, ecoComportement, ecoReseauMenage,
+        };
+    }
+
+    // =========================================================================
+    // Actualisation et VAN cumulative
+    // =========================================================================
+
+    function multiplicateurs(e) {
+        const params = e.params;
+        const partCapex = params.part_ville_capex_pct / 100.0;
+        const partOpex = params.part_ville_opex_pct / 100.0;
+        const economique = e.mode_compte === 'economique';
+        const mcf = economique && e.valeur_eau.appliquer_mcf ? 1.0 + e.valeur_eau.mcf : 1.0;
+        if (economique) {
+            return {
+                mcf,
+                capex: partCapex * mcf + (1.0 - partCapex),
+                opex: partOpex * mcf + (1.0 - partOpex),
+                reseau: mcf,
+            };
+        }
+        return { mcf, capex: partCapex, opex: partOpex, reseau: 1.0 };
+    }
+
+    function anneeCroisement(serie) {
+        for (let i = 0; i < serie.length; i++) {
+            if (serie[i] >= 0) {
+                if (i === 0) return 0.0;
+                const prev = serie[i - 1];
+                const curr = serie[i];
+                if (curr === prev) return i;
+                return i + (0 - prev) / (curr - prev);
+            }
+        }
+        return Infinity;
+    }
+
+    function facteurRecuperationCapital(r, n) {
+        if (n <= 0) return 0.0;
+        if (r <= 1e-10) return 1.0 / Math.max(1, n);
+        const rn = Math.pow(1.0 + r, n);
+        return r * rn / (rn - 1.0);
+    }
+
+    /**
+     * Flux annuels actualisés: chaque poste de coût est une série dont la
+     * somme donne VA(C) (actualiser_series) et le cumul la VAN cumulative
+     * (calculer_van_cumulative), avec les mêmes multiplicateurs MCF.
+     */
+    function actualiser(e, traj, r) {
+        const T = traj.T;
+        const economique = e.mode_compte === 'economique';
+        const inclureRepar = e.fuites !== null && e.fuites.inclure_cout_reparation;
+        const m = multiplicateurs(e);
+        const d = zeros(T).map((_, i) => 1.0 / Math.pow(1.0 + r, i + 1));
+
+        const benefices = d.map((di, i) => (traj.beneficesEau[i] + traj.beneficesInfra[i]) * di);
+        const exploitation = d.map((di, i) =>
+            (traj.coutsExploitation[i] * m.opex + traj.coutsReseau[i] * m.reseau) * di);
+        const capexEtaleActif = somme(traj.capexEtale) > 0;
+        const capex = d.map((di, i) => (capexEtaleActif ? traj.capexEtale[i] * di * m.capex : 0.0));
+        const batteries = d.map((di, i) => (traj.batteries[i] * m.capex) * di);
+        const reparations = zeros(T);
+        if (inclureRepar && traj.reparationsActives) {
+            for (let i = 0; i < T; i++) {
+                reparations[i] = economique
+                    ? traj.reparationsVille[i] * d[i] * m.mcf + traj.reparationsMenages[i] * d[i]
+                    : traj.reparationsVille[i] * d[i];
+            }
+        }
+        const incitatifs = d.map((di, i) => (economique ? 0.0 : traj.incitatifs[i] * di));
+
+        // CAPEX réseau ponctuel: compté dans VA(C) même au-delà de l'horizon
+        let vaCapexReseau = 0.0;
+        const capexReseau = zeros(T);
+        if (traj.capexReseau !== null) {
+            const { annee, montant } = traj.capexReseau;
+            vaCapexReseau = montant / Math.pow(1.0 + r, annee) * m.reseau;
+            if (annee >= 1 && annee <= T) capexReseau[annee - 1] = (montant * m.reseau) / Math.pow(1.0 + r, annee);
+        }
+
+        const vaBenefices = somme(benefices);
+        const vaExploitation = somme(exploitation);
+        const vaBatteries = traj.batteries.reduce((s, v, i) => s + v / Math.pow(1.0 + r, i + 1), 0.0);
+        const vaCouts = traj.I0 * m.capex + (capexEtaleActif ? somme(traj.capexEtale.map((c, i) => c * d[i])) * m.capex : 0.0)
+            + vaExploitation + (vaCapexReseau + vaBatteries * m.capex) + somme(reparations) + somme(incitatifs);
+        const van = vaBenefices - vaCouts;
+
+        const vanCumulative = zeros(T);
+        let benefCum = 0.0;
+        let coutCum = traj.I0 * m.capex;
+        for (let i = 0; i < T; i++) {
+            benefCum += benefices[i];
+            coutCum += exploitation[i] + capex[i] + batteries[i] + capexReseau[i] + reparations[i] + incitatifs[i];
+            vanCumulative[i] = benefCum - coutCum;
+        }
+
+        return {
+            d, vaBenefices, vaExploitation, van,
+            rbc: divisionSecurisee(vaBenefices, vaCouts),
+            vanCumulative,
+            periodeRecuperation: anneeCroisement(vanCumulative),
+        };
+    }
+
+    // =========================================================================
+    // Modèle principal
+    // =========================================================================
+
+    /**
+     * Équivalent de executer_modele() pour des entrées entrees_noyau().
+     * Retourne les champs de ResultatsModele (CHAMPS_RESULTATS_NOYAU);
+     * NaN et infini deviennent null, comme resultats_noyau().
+     */
+    function executerModele(entrees) {
+        const { params, compteur, echelle, valeur_eau: ve } = entrees;
+        const H = params.nb_menages;
+        const r = params.taux_actualisation_pct / 100.0;
+        const T = params.horizon_analyse;
+        const partVilleCapex = params.part_ville_capex_pct / 100.0;
+        const partVilleOpex = params.part_ville_opex_pct / 100.0;
+
+        const economies = economiesEau(params, entrees.fuites, compteur);
+        const traj = trajectoires(entrees, economies);
+        const act = actualiser(entrees, traj, r);
+        const d = act.d;
+
+        const vaCouts = act.vaBenefices - act.van;
+        const actualise = (serie, prix) => serie.reduce((s, v, i) => s + v * prix * d[i], 0.0);
+        const pvM3 = actualise(traj.m3, 1.0);
+        const eac = divisionSecurisee(vaCouts, H) * facteurRecuperationCapital(r, T);
+        const valeurM3 = entrees.mode_compte === 'economique' ? ve.valeur_sociale_m3 : ve.cout_variable_m3;
+        const coutBase = coutInitialParCompteur(compteur);
+        const financier = entrees.mode_compte === 'financier';
+
+        const resultats = {
+            usage_base_menage: economies.usageBase,
+            economie_fuite_menage: traj.ecoFuite[0],
+            economie_comportement_menage: traj.ecoComportement[0],
+            economie_reseau_menage: traj.ecoReseauMenage[0],
+            economie_totale_menage: traj.ecoParMenage[0],
+            economies_totales_horizon_m3: somme(traj.m3),
+            investissement_initial: financier ? traj.I0 * partVilleCapex : traj.I0,
+            benefices_eau_annuels: traj.beneficesEau[0],
+            benefice_infra_annuel: traj.beneficesInfra[0],
+            benefices_totaux_annuels: somme(traj.beneficesEau.map((b, i) => b + traj.beneficesInfra[i])) / T,
+            couts_exploitation_annuels: financier
+                ? traj.coutsExploitation[0] * partVilleOpex + traj.coutsReseau[0]
+                : traj.coutsExploitation[0] + traj.coutsReseau[0],
+            va_benefices: act.vaBenefices,
+            va_benefices_eau: actualise(traj.beneficesEau, 1.0),
+            va_benefices_report_infra: actualise(traj.beneficesInfra, 1.0),
+            va_benefices_cout_variable: actualise(traj.m3, ve.cout_variable_m3),
+            va_benefices_infra_m3: actualise(traj.m3, ve.cout_capex_m3),
+            va_benefices_externalites: actualise(traj.m3, ve.cout_opex_fixe_m3),
+            va_economies_m3: pvM3,
+            va_couts_exploitation: act.vaExploitation,
+            va_couts_totaux: vaCouts,
+            van: act.van,
+            rbc: act.rbc,
+            eac_menage: eac,
+            lcsw: divisionSecurisee(vaCouts, pvM3),
+            seuil_rentabilite_m3: divisionSecurisee(eac, valeurM3),
+            annees: zeros(T).map((_, i) => i + 1),
+            van_cumulative: act.vanCumulative,
+            periode_recuperation: act.periodeRecuperation,
+            economies_echelle_actives: Boolean(echelle.activer),
+            facteur_echelle: traj.facteur,
+            facteur_echelle_compteur: appliquerFacteurEchelle(traj.facteur, echelle.poids_compteur),
+            facteur_echelle_installation: appliquerFacteurEchelle(traj.facteur, echelle.poids_installation),
+            facteur_echelle_reseau: appliquerFacteurEchelle(traj.facteur, echelle.poids_reseau),
+            cout_par_compteur_base: coutBase,
+            cout_par_compteur_ajuste: traj.coutAjuste,
+            economies_realisees: (coutBase - traj.coutAjuste) * traj.HCompteurs,
+        };
+        for (const [cle, valeur] of Object.entries(resultats)) {
+            if (typeof valeur === 'number' && !Number.isFinite(valeur)) resultats[cle] = null;
+            else if (Array.isArray(valeur)) resultats[cle] = valeur.map(v => (Number.isFinite(v) ? v : null));
+        }
+        return resultats;
+    }
+
+    // =========================================================================
+    // Requête /api/calculate → entrées (get_* de api.py)
+    // =========================================================================
+
+    function verifier(condition, message) {
+        if (!condition) throw new Error(message);
+    }
+
+    function persistanceDepuisRequete(req) {
+        const alpha = req.reduction_comportement / 100;
+        let p;
+        switch (req.persistance) {
+            case 'optimiste':
+                p = { mode: 'constant', alpha_initial: alpha, alpha_plateau: alpha, lambda_decay: 0.15, annees_fadeout: 10 };
+                break;
+            case 'realiste':
+                p = {
+                    mode: 'exp_plateau',
+                    alpha_initial: alpha,
+                    alpha_plateau: req.expert_alpha_plateau != null ? req.expert_alpha_plateau / 100 : 0.025,
+                    lambda_decay: req.expert_lambda_decay != null ? req.expert_lambda_decay : 0.15,
+                    annees_fadeout: 10,
+                };
+                break;
+            case 'pessimiste':
+                p = { mode: 'fadeout_lin', alpha_initial: alpha, alpha_plateau: 0.0, lambda_decay: 0.15, annees_fadeout: 10 };
+                break;
+            case 'ultra':
+                p = { mode: 'constant', alpha_initial: 0.0, alpha_plateau: 0.0, lambda_decay: 0.15, annees_fadeout: 10 };
+                break;
+            default:
+                throw new Error(`Scénario de persistance inconnu: ${req.persistance}`);
+        }
+        verifier(p.alpha_initial >= 0 && p.alpha_initial <= 1, 'alpha_initial doit être entre 0 et 1');
+        verifier(p.alpha_plateau >= 0 && p.alpha_plateau <= p.alpha_initial,
+            'alpha_plateau doit être entre 0 et alpha_initial');
+        return p;
+    }
+
+    function fuitesDepuisRequete(req, spec) {
+        if (Object.prototype.hasOwnProperty.call(spec.fuites, req.scenario_fuites)) {
+            return spec.fuites[req.scenario_fuites];
+        }
+        verifier(req.scenario_fuites === 'custom', `Scénario de fuites inconnu: '${req.scenario_fuites}'`);
+        const total = req.prevalence_petites_pct + req.prevalence_grosses_pct;
+        verifier(total <= 60, `la prévalence totale (${total.toFixed(1)}%) dépasse le maximum réaliste de 60%.`);
+        let mode = 'menage';
+        if (!req.inclure_cout_reparation) mode = 'gratuit';
+        else if (req.part_ville_pct >= 100) mode = 'ville';
+        else if (req.part_ville_pct > 0) mode = 'partage';
+        verifier(req.prevalence_grosses_pct <= total,
+            'part_menages_fuite_significative_pct doit être <= part_menages_fuite_any_pct');
+        return Object.assign({}, spec.defauts.fuites, {
+            utiliser_prevalence_differenciee: true,
+            part_menages_fuite_any_pct: total,
+            debit_fuite_any_m3_an: req.debit_petites_m3,
+            part_menages_fuite_significative_pct: req.prevalence_grosses_pct,
+            debit_fuite_significative_m3_an: req.debit_grosses_m3,
+            taux_reparation_pct: req.taux_reparation_pct,
+            taux_detection_pct: req.taux_detection_pct,
+            facteur_detection_sig: req.facteur_detection_sig,
+            facteur_reparation_sig: req.facteur_reparation_sig,
+            taux_nouvelles_fuites_pct: req.taux_nouvelles_fuites_pct,
+            part_fuites_persistantes_pct: req.part_persistantes_pct,
+            facteur_duree_longue_traine: req.facteur_duree_longue_traine,
+            cout_reparation_any: req.cout_reparation_petite,
+            cout_reparation_sig: req.cout_reparation_grosse,
+            inclure_cout_reparation: req.inclure_cout_reparation,
+            mode_repartition: mode,
+            part_ville_pct: req.part_ville_pct,
+        });
+    }
+
+    function valeurEauDepuisRequete(req, spec) {
+        const preset = (req.valeur_eau_preset || 'custom').trim().toLowerCase();
+        if (preset !== 'custom' && Object.prototype.hasOwnProperty.call(spec.valeur_eau, preset)) {
+            const base = spec.valeur_eau[preset];
+            return Object.assign({}, base, {
+                appliquer_mcf: base.appliquer_mcf || req.appliquer_mcf,
+                mcf: req.appliquer_mcf ? req.mcf : base.mcf,
+            });
+        }
+        return Object.assign({}, spec.defauts.valeur_eau, {
+            valeur_sociale_m3: req.valeur_sociale,
+            cout_variable_m3: req.cout_variable,
+            appliquer_mcf: req.appliquer_mcf,
+            mcf: req.mcf,
+        });
+    }
+
+    const SURCHARGES_ADOPTION = {
+        adoption_max_pct: 'adoption_max_pct',
+        adoption_k_vitesse: 'k_vitesse',
+        adoption_t0_point_median: 't0_point_median',
+        adoption_etaler_capex: 'etaler_capex',
+        adoption_fraction_premiere_annee: 'fraction_premiere_annee',
+        adoption_cout_incitatif_par_menage: 'cout_incitatif_par_menage',
+        adoption_duree_incitatif_ans: 'duree_incitatif_ans',
+        adoption_taux_nouveaux_pct: 'taux_nouveaux_pct',
+        adoption_nb_secteurs: 'nb_secteurs',
+        adoption_annees_par_secteur: 'annees_par_secteur',
+        adoption_annee_demarrage: 'annee_demarrage',
+    };
+
+    function adoptionDepuisRequete(req, spec) {
+        let cle = (req.scenario_adoption || 'obligatoire').trim().toLowerCase();
+        if (['none', 'aucune', 'off', '0'].includes(cle)) return spec.adoption_defaut;
+        cle = { progressive: 'progressif', par_secteur: 'secteur', 'par-secteur': 'secteur' }[cle] || cle;
+
+        let base;
+        if (cle !== 'custom') {
+            base = Object.prototype.hasOwnProperty.call(spec.adoption, cle) ? spec.adoption[cle] : spec.adoption_defaut;
+        } else {
+            const mode = (req.adoption_mode || 'logistique').trim().toLowerCase();
+            base = Object.assign({}, spec.defauts.adoption, {
+                mode: mode.startsWith('nou') ? 'nouveaux_branchements'
+                    : mode.startsWith('sec') ? 'par_secteur' : 'volontaire_incitatif',
+            });
+        }
+        const p = Object.assign({}, base);
+        for (const [champ, cible] of Object.entries(SURCHARGES_ADOPTION)) {
+            if (req[champ] != null) p[cible] = req[champ];
+        }
+        verifier(p.k_vitesse > 0, 'k_vitesse doit être positif');
+        verifier(p.adoption_max_pct > 0 && p.adoption_max_pct <= 100, 'adoption_max_pct doit être entre 0 et 100');
+        verifier(p.nb_secteurs >= 1 && p.annees_par_secteur > 0 && p.duree_incitatif_ans >= 1,
+            "paramètres d'adoption invalides");
+        return p;
+    }
+
+    function fuitesReseauDepuisRequete(req, spec) {
+        if (!req.reseau_activer) return null;
+        const mode = (req.reseau_mode_reduction || 'lineaire').trim().toLowerCase();
+        return Object.assign({}, spec.defauts.fuites_reseau, {
+            activer: true,
+            volume_pertes_m3_an: req.reseau_volume_pertes_m3_an,
+            reduction_max_pct: req.reseau_reduction_max_pct,
+            mode_reduction: mode.startsWith('exp') ? 'exponentiel' : 'lineaire',
+            annees_atteinte: req.reseau_annees_atteinte,
+            lambda_reduction: req.reseau_lambda_reduction,
+            annee_demarrage: req.reseau_annee_demarrage,
+            cout_programme_annuel: req.reseau_cout_programme_annuel,
+            cout_reparation_m3: req.reseau_cout_reparation_m3,
+            cout_capex_initial: req.reseau_cout_capex_initial,
+            annee_capex: req.reseau_annee_capex,
+            pondere_par_adoption: req.reseau_pondere_par_adoption,
+        });
+    }
+
+    function compteurDepuisRequete(req, spec) {
+        const type = ['ami', 'amr', 'manuel'].includes(req.type_compteur) ? req.type_compteur : 'ami';
+        const ami = req.type_compteur === 'ami';
+        return Object.assign({}, spec.defauts.compteur, spec.efficacite_compteurs[type], {
+            type_compteur: type,
+            cout_compteur: req.cout_compteur,
+            heures_installation: req.heures_installation,
+            taux_horaire_installation: req.taux_horaire,
+            cout_reseau_par_compteur: ami ? req.cout_reseau : 0,
+            cout_infra_fixe: ami ? req.cout_infra_fixe : 0,
+            cout_opex_non_tech_ami: ami ? req.cout_opex_non_tech_ami : 0,
+        });
+    }
+
+    /**
+     * Entrées du noyau pour une requête /api/calculate (_entrees_modele).
+     * Les champs absents prennent les défauts de CalculRequest (spec.requete).
+     */
+    function entreesDepuisRequete(requete, spec) {
+        verifier(spec.version === VERSION, `Version de spécification ${spec.version} ≠ ${VERSION}`);
+        const req = Object.assign({}, spec.requete, requete);
+        return {
+            params: Object.assign({}, spec.defauts.params, {
+                nb_menages: req.nb_menages,
+                taille_menage: req.taille_menage,
+                lpcd: req.lpcd,
+                horizon_analyse: req.horizon,
+                taux_actualisation_pct: req.taux_actualisation,
+                reduction_comportement_pct: req.reduction_comportement,
+                benefice_report_infra_annuel: req.benefice_report_infra_annuel,
+                benefice_report_infra_par_m3: req.benefice_report_infra_par_m3,
+            }),
+            compteur: compteurDepuisRequete(req, spec),
+            echelle: Object.assign({}, spec.defauts.echelle, { activer: req.activer_economies_echelle }),
+            persistance: persistanceDepuisRequete(req),
+            fuites: fuitesDepuisRequete(req, spec),
+            fuites_reseau: fuitesReseauDepuisRequete(req, spec),
+            adoption: adoptionDepuisRequete(req, spec),
+            valeur_eau: valeurEauDepuisRequete(req, spec),
+            mode_compte: req.mode_economique ? 'economique' : 'financier',
+        };
+    }
+
+    /**
+     * Réponse au format de /api/calculate (_construire_calcul_response).
+     */
+    function calculer(requete, spec) {
+        const entrees = entreesDepuisRequete(requete, spec);
+        const res = executerModele(entrees);
+        const horizon = entrees.params.horizon_analyse;
+        const viable = res.van > 0 && res.rbc > 1;
+        let recommandation;
+        if (viable) {
+            recommandation = `PROJET VIABLE — VAN positive de ${(res.van / 1e6).toFixed(1)} M$ sur ${horizon} ans`;
+        } else if (res.van > 0) {
+            recommandation = 'PROJET MARGINAL — VAN positive mais RBC < 1';
+        } else {
+            recommandation = `PROJET NON RENTABLE — VAN négative de ${(res.van / 1e6).toFixed(1)} M$`;
+        }
+        return {
+            van: res.van,
+            rbc: res.rbc,
+            payback: res.periode_recuperation,
+            lcsw: res.lcsw,
+            investissement_initial: res.investissement_initial,
+            va_benefices: res.va_benefices,
+            va_couts_exploitation: res.va_couts_exploitation,
+            va_couts_totaux: res.va_couts_totaux,
+            va_benefices_eau: res.va_benefices_eau,
+            va_benefices_report_infra: res.va_benefices_report_infra,
+            va_benefices_cout_variable: res.va_benefices_cout_variable,
+            economie_totale_menage: res.economie_totale_menage,
+            economie_comportement_menage: res.economie_comportement_menage,
+            economie_fuite_menage: res.economie_fuite_menage,
+            usage_base_menage: res.usage_base_menage,
+            cout_par_compteur: res.cout_par_compteur_ajuste,
+            annees: res.annees,
+            van_cumulative: res.van_cumulative,
+            serie_alpha: res.annees.map(t => alphaComportement(t, entrees.persistance) * 100),
+            viable,
+            recommandation,
+        };
+    }
+
+    return {
+        VERSION,
+        executerModele,
+        entreesDepuisRequete,
+        calculer,
+        alphaComportement,
+        adoption,
+        dynamiqueFuites,
+    };
+});
@@ -75,6 +75,161 @@ def test_health_check():
     assert "version" in data
 
 
+def test_metrics_histogramme_et_gabarits_de_route():
+    """Test que les métriques utilisent des histogrammes et des gabarits de route."""
+    client.post("/api/calculate", json=SCENARIO_BASELINE)
+    client.get("/translations.js")
+    client.get("/inexistant/fichier.css")
+
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    text = response.text
+
+    assert "# TYPE api_request_latency_ms histogram" in text
+    assert 'api_request_latency_ms_bucket{endpoint="/api/calculate",le="+Inf"}' in text
+    assert 'api_request_latency_ms_count{endpoint="/api/calculate"}' in text
+    # Pas de clé par chemin statique: une seule étiquette "static"
+    assert 'endpoint="static"' in text
+    assert "translations.js" not in text
+    assert "fichier.css" not in text
+    assert 'api_model_evaluations_total{kind="executer_modele"}' in text
+    assert "api_mc_draws_total" in text
+
+
+def test_chronometrage_etapes(monkeypatch):
+    """Test du chronométrage opt-in des étapes du modèle (Server-Timing + métriques)."""
+    import api
+    monkeypatch.setattr(api, "STAGE_TIMING", True)
+    monkeypatch.setattr(api, "SERVER_TIMING", True)
+
+    response = client.post("/api/calculate", json=SCENARIO_BASELINE)
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    for stage in ("calculer_economies_eau", "generer_trajectoires", "calculer_dynamique_fuites",
+                  "actualiser_series", "calculer_van_cumulative", "construction_reponse"):
+        assert f"{stage};dur=" in server_timing
+
+    text = client.get("/api/metrics").text
+    assert 'api_stage_duration_ms_count{stage="generer_trajectoires"}' in text
+
+    # Désactivé: aucun en-tête
+    monkeypatch.setattr(api, "STAGE_TIMING", False)
+    response = client.post("/api/calculate", json=SCENARIO_BASELINE)
+    assert "server-timing" not in response.headers
+
+
+def test_logs_asynchrones_et_echantillonnage(monkeypatch):
+    """Test que les logs passent par une file et que l'échantillonnage s'applique."""
+    import json
+    import logging
+    import api
+
+    assert any(isinstance(h, api.DeferredQueueHandler) for h in api.logger.logger.handlers)
+
+    record = logging.LogRecord("api", logging.INFO, __file__, 0, "request_completed", None, None)
+    record.fields = {"endpoint": "/api/calculate", "latency_ms": 1.5}
+    entry = json.loads(api.JsonFormatter().format(record))
+    assert entry["level"] == "info"
+    assert entry["message"] == "request_completed"
+    assert entry["endpoint"] == "/api/calculate"
+    assert "timestamp" in entry
+
+    # Erreurs toujours loguées, statiques exclus, succès échantillonnés
+    monkeypatch.setattr(api, "LOG_SAMPLE_RATE", 0.0)
+    assert api.should_log_request("/api/calculate", 500)
+    assert not api.should_log_request("/api/calculate", 200)
+    monkeypatch.setattr(api, "LOG_SAMPLE_RATE", 1.0)
+    assert api.should_log_request("/api/calculate", 200)
+    assert not api.should_log_request(api.ROUTE_STATIC, 200)
+    assert api.should_log_request(api.ROUTE_STATIC, 404)
+
+
+def test_prechauffage_au_demarrage(monkeypatch):
+    """Test que le préchauffage s'exécute au démarrage, une seule fois."""
+    import api
+    monkeypatch.setitem(api.prechauffage, "termine", False)
+    monkeypatch.setitem(api.prechauffage, "duree_ms", None)
+    monkeypatch.setattr(api, "PREWARM", True)
+
+    appels = []
+    calculate_original = api.calculate
+
+    async def calculate_compte(req):
+        appels.append(req)
+        return await calculate_original(req)
+
+    monkeypatch.setattr(api, "calculate", calculate_compte)
+
+    with TestClient(app) as client_demarre:
+        health = client_demarre.get("/api/health").json()
+        assert health["prewarmed"] is True
+        assert api.prechauffage["duree_ms"] > 0
+
+    # Déjà préchauffé (ex: worker forké d'un maître préchauffé): rien à refaire
+    with TestClient(app):
+        pass
+    assert len(appels) == 1
+
+
+def test_demarrage_sans_pandas_matplotlib():
+    """Test que l'import de l'API ne charge ni pandas ni matplotlib (démarrage rapide)."""
+    import json
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import json, sys, time\n"
+        "t0 = time.perf_counter()\n"
+        "import api\n"
+        "print(json.dumps({'secondes': time.perf_counter() - t0,\n"
+        "                  'charges': [m for m in ('pandas', 'matplotlib') if m in sys.modules]}))\n"
+    )
+    sortie = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    mesure = json.loads(sortie.stdout.strip().splitlines()[-1])
+    assert mesure["charges"] == []
+    # Budget large (machines CI lentes); ajustable via STARTUP_BUDGET_S
+    assert mesure["secondes"] < float(os.environ.get("STARTUP_BUDGET_S", "5"))
+
+    # Les graphiques chargent matplotlib au premier usage, avec la configuration du module
+    import analyse_compteurs_eau as ace
+    assert ace.plt.rcParams["axes.titlesize"] == 13
+
+
+def test_paquet_modele_sous_modules_differes():
+    """Test que executer_modele ne charge que le moteur et que les anciens noms restent importables."""
+    import json
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import json, sys\n"
+        "import analyse_compteurs_eau as ace\n"
+        "ace.executer_modele(ace.ParametresModele(), ace.ParametresCompteur())\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('analyse_compteurs_eau.'))))\n"
+    )
+    sortie = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    charges = json.loads(sortie.stdout.strip().splitlines()[-1])
+    assert charges == ["analyse_compteurs_eau._differe", "analyse_compteurs_eau.core"]
+
+    import analyse_compteurs_eau as ace
+    from analyse_compteurs_eau import presets, calibration
+    from analyse_compteurs_eau import PERSISTANCE_REALISTE, CALIBRATION, executer_tests_validation
+    assert PERSISTANCE_REALISTE is presets.PERSISTANCE_REALISTE
+    assert CALIBRATION is calibration.CALIBRATION
+    assert callable(executer_tests_validation)
+    assert "simuler_monte_carlo" in dir(ace)
+    with pytest.raises(AttributeError):
+        ace.nom_inexistant
+
+
 def test_presets_disponibles():
     """Test que les presets de villes sont disponibles."""
     response = client.get("/api/presets")
@@ -163,6 +318,121 @@ def test_scenario_pessimiste():
 # TESTS DE COHÉRENCE INTER-ENDPOINTS
 # =============================================================================
 
+def test_scenarios_precalcules(tmp_path):
+    """Test que les scénarios précalculés sont servis et identiques au calcul direct."""
+    import json
+    import math
+    import api
+
+    table = api.TableScenarios(api.SCENARIO_TABLE)
+    table.charger()
+    assert len(table.reponses) == 288, "scenarios_output.json périmé: relancer generate_scenarios_json.py"
+
+    # Chaque entrée correspond exactement au calcul en direct
+    data = json.loads(open(api.SCENARIO_TABLE, encoding="utf-8").read())
+    for cle_scenario in data["scenarios"]:
+        req = api._requete_scenario(data["presets"], cle_scenario)
+        precalcule = table.get(api.cle_requete("/api/calculate", req))
+        direct = api._calculer(req)
+        for champ, valeur in direct.model_dump().items():
+            attendu = getattr(precalcule, champ)
+            if isinstance(valeur, float):
+                assert math.isclose(attendu, valeur, rel_tol=1e-9, abs_tol=1e-6), (cle_scenario, champ)
+            elif not isinstance(valeur, list):
+                assert attendu == valeur, (cle_scenario, champ)
+        assert precalcule.annees == direct.annees
+        assert all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-3) for a, b in zip(precalcule.van_cumulative, direct.van_cumulative))
+
+    # Servi par l'API sans calcul
+    hits_avant = api.metrics.cache_hits["scenarios_precalcules"]
+    response = client.post("/api/calculate", json=api.CalculRequest().model_dump())
+    assert response.status_code == 200
+    assert api.metrics.cache_hits["scenarios_precalcules"] == hits_avant + 1
+
+    # Fichier d'une autre version du modèle: ignoré
+    data["metadata"]["model_version"] = "0.0.0"
+    chemin = tmp_path / "scenarios_output.json"
+    chemin.write_text(json.dumps(data), encoding="utf-8")
+    perime = api.TableScenarios(str(chemin))
+    perime.charger()
+    assert perime.reponses == {}
+
+
+def test_table_scenarios_chargee_au_demarrage(monkeypatch):
+    """Test que la table des scénarios est chargée au démarrage, même sans préchauffage."""
+    import api
+    monkeypatch.setattr(api, "PREWARM", False)
+    monkeypatch.setattr(api, "table_scenarios", api.TableScenarios(api.SCENARIO_TABLE))
+
+    with TestClient(app):
+        assert api.table_scenarios.reponses
+
+
+def test_generation_scenarios_incrementale(tmp_path):
+    """Test que la régénération réutilise les scénarios dont les entrées sont inchangées."""
+    import json
+    import generate_scenarios_json as gen
+
+    precedent = json.loads(open(gen.SORTIE_DEFAUT, encoding="utf-8").read())
+    cle = "longueuil_ami_realiste_deux_stocks_eco"
+    # Résultat factice + empreinte périmée pour un scénario: seul lui est recalculé
+    precedent["scenarios"]["montreal_amr_ultra_quebec_fin"]["van"] = 1.0
+    van_attendue = precedent["scenarios"][cle]["van"]
+    precedent["scenarios"][cle]["van"] = 0.0
+    precedent["empreintes_scenarios"][cle] = "perimee"
+
+    output = gen.generer_scenarios_complets(precedent=precedent, workers=1)
+    assert output["scenarios"][cle]["van"] == van_attendue
+    assert output["scenarios"]["montreal_amr_ultra_quebec_fin"]["van"] == 1.0  # réutilisé tel quel
+    assert list(output["scenarios"]) == list(precedent["scenarios"])
+
+    sortie = tmp_path / "scenarios.json"
+    gen.exporter_json(output, str(sortie))
+    contenu = sortie.read_bytes()
+    assert b"\n" not in contenu and b": " not in contenu  # minifié
+    assert json.loads(contenu)["scenarios"][cle]["van"] == van_attendue
+    assert [p.name for p in tmp_path.iterdir()] == ["scenarios.json"]  # pas de temporaire
+
+    # Résultat réutilisable périmé (modèle changé sans incrément de version): tout est recalculé
+    precedent = json.loads(open(gen.SORTIE_DEFAUT, encoding="utf-8").read())
+    premiere = next(iter(precedent["scenarios"]))
+    van_premiere = precedent["scenarios"][premiere]["van"]
+    precedent["scenarios"][premiere]["van"] += 1.0
+    precedent["scenarios"]["montreal_amr_ultra_quebec_fin"]["van"] = 1.0
+    output = gen.generer_scenarios_complets(precedent=precedent, workers=1)
+    assert output["scenarios"][premiere]["van"] == van_premiere
+    assert output["scenarios"]["montreal_amr_ultra_quebec_fin"]["van"] != 1.0
+
+
+def test_shards_scenarios_par_ville(tmp_path):
+    """Test que les fichiers par ville × compteur reconstituent tous les scénarios."""
+    import json
+    import generate_scenarios_json as gen
+
+    output = json.loads(open(gen.SORTIE_DEFAUT, encoding="utf-8").read())
+    manifest = gen.exporter_shards(output, str(tmp_path))
+    assert json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8")) == manifest
+    assert len(manifest["shards"]) == len(output["presets"]["villes"]) * len(output["presets"]["compteurs"])
+
+    reconstitues = {}
+    for nom, entree in manifest["shards"].items():
+        assert entree["path"].startswith("build/")  # servi avec cache immutable
+        assert entree["bytes"] <= 20 * 1024
+        shard = json.loads((tmp_path / entree["path"]).read_bytes())
+        assert "annees" not in shard["communs"] and "annees" not in shard["champs"]  # stocké dans le manifeste
+        for cle, valeurs in shard["scenarios"].items():
+            result = {**shard["communs"], **dict(zip(shard["champs"], valeurs))}
+            reconstitues[f"{nom}_{cle}"] = {**result, "annees": manifest["annees"]}
+    assert reconstitues == output["scenarios"]
+
+    # Régénération après modification: l'ancien fichier haché est supprimé
+    ancien = tmp_path / manifest["shards"]["longueuil_ami"]["path"]
+    output["scenarios"]["longueuil_ami_realiste_deux_stocks_eco"]["van"] = 0.0
+    manifest2 = gen.exporter_shards(output, str(tmp_path))
+    assert not ancien.exists()
+    assert manifest2["shards"]["montreal_ami"] == manifest["shards"]["montreal_ami"]
+
+
 def test_coherence_calculate_detailed_series():
     """Test que /api/calculate et /api/detailed_series sont cohérents."""
     # Calcul principal
@@ -224,6 +494,183 @@ def test_coherence_sensitivity():
         assert "impact_high" in param
 
 
+def test_base_lineaire_van():
+    """VAN = quantités · prix; le gradient reproduit la VAN recalculée."""
+    params = {
+        "scenario_adoption": "progressive",
+        "appliquer_mcf": True,
+        "reseau_activer": True,
+        "reseau_volume_pertes_m3_an": 2e6,
+        "reseau_reduction_max_pct": 20,
+        "reseau_cout_programme_annuel": 1e5,
+    }
+    base = client.post("/api/van_basis", json=params).json()
+    van = client.post("/api/calculate", json=params).json()["van"]
+    assert base["van"] == pytest.approx(van, rel=1e-9)
+    assert sum(base["contributions"].values()) == pytest.approx(van, rel=1e-9)
+
+    # Changement simultané de plusieurs entrées linéaires: produit scalaire
+    delta = {"cout_compteur": 80.0, "valeur_sociale": -1.2, "cout_opex_non_tech_ami": 10.0,
+             "benefice_report_infra_annuel": 3e5}
+    estimee = van + sum(base["gradient"][k] * d for k, d in delta.items())
+    nouveaux = {
+        **params,
+        "cout_compteur": 250.0 + 80.0,
+        "valeur_sociale": 4.69 - 1.2,
+        "cout_opex_non_tech_ami": 15.0 + 10.0,
+        "benefice_report_infra_annuel": 3e5,
+    }
+    recalculee = client.post("/api/calculate", json=nouveaux).json()["van"]
+    assert estimee == pytest.approx(recalculee, rel=1e-9)
+
+
+def test_seuils_rentabilite():
+    """Les seuils annulent la VAN de /api/calculate (forme fermée ou Brent)."""
+    params = {"valeur_sociale": 8.0}
+    response = client.post("/api/break_even", json={"params": params})
+    assert response.status_code == 200
+    data = response.json()
+    seuils = {l["champ"]: l for l in data["seuils"]}
+    assert seuils["valeur_sociale"]["methode"] == "lineaire"
+    assert seuils["taux_actualisation"]["methode"] == "brent"
+
+    # Tornade: amplitude de VAN décroissante
+    amplitudes = [abs(l["van_borne_max"] - l["van_borne_min"]) for l in data["seuils"]]
+    assert amplitudes == sorted(amplitudes, reverse=True)
+
+    for champ in ("valeur_sociale", "cout_compteur", "taux_actualisation", "reduction_comportement"):
+        assert seuils[champ]["statut"] == "trouve"
+        van = client.post("/api/calculate", json={**params, champ: seuils[champ]["seuil"]}).json()["van"]
+        assert abs(van) < 1e-6 * abs(data["van_base"]), champ
+
+    # Champ entier: premier entier au-delà du changement de signe
+    lpcd = seuils["lpcd"]["seuil"]
+    van_avant = client.post("/api/calculate", json={**params, "lpcd": lpcd - 1}).json()["van"]
+    van_seuil = client.post("/api/calculate", json={**params, "lpcd": lpcd}).json()["van"]
+    assert van_avant < 0 < van_seuil
+
+    # Champ sans borne supérieure: intervalle à fournir
+    response = client.post("/api/break_even", json={"champs": ["reseau_cout_capex_initial"]})
+    assert response.status_code == 422
+
+
+def test_noyau_js_equivalent():
+    """noyau.js reproduit executer_modele() et /api/calculate."""
+    import json
+    import shutil
+    import subprocess
+    from pathlib import Path
+    from analyse_compteurs_eau import (
+        ModeCompte, ParametresModele, VALEUR_EAU_QUEBEC,
+        entrees_noyau, executer_modele, resultats_noyau,
+    )
+    from validation_scenarios import (
+        SCENARIOS_CANONIQUES, get_compteur_params, get_fuites_params, get_persistance_params,
+    )
+
+    node = shutil.which("node") or shutil.which("nodejs")
+    if node is None:
+        pytest.skip("node non disponible")
+
+    entrees, attendus = [], []
+    for s in SCENARIOS_CANONIQUES:
+        kwargs = dict(
+            params=ParametresModele(nb_menages=s.nb_menages, taille_menage=s.taille_menage, lpcd=s.lpcd),
+            compteur=get_compteur_params(s.type_compteur),
+            persistance=get_persistance_params(s.persistance),
+            params_fuites=get_fuites_params(s.fuites),
+            mode_compte=s.mode,
+            valeur_eau=VALEUR_EAU_QUEBEC,
+        )
+        entrees.append(entrees_noyau(**kwargs))
+        attendus.append(resultats_noyau(executer_modele(**kwargs)))
+    assert {s.mode for s in SCENARIOS_CANONIQUES} == set(ModeCompte)
+
+    requetes = [
+        {},
+        {"scenario_fuites": "custom", "prevalence_grosses_pct": 8, "part_ville_pct": 50},
+        {"scenario_adoption": "progressive", "mode_economique": False, "type_compteur": "amr"},
+        {"scenario_adoption": "custom", "adoption_etaler_capex": True, "appliquer_mcf": True,
+         "activer_economies_echelle": True, "persistance": "pessimiste"},
+        {"reseau_activer": True, "reseau_volume_pertes_m3_an": 2e6, "reseau_mode_reduction": "exponentiel",
+         "reseau_cout_capex_initial": 1e6, "reseau_annee_capex": 25, "valeur_eau_preset": "quebec"},
+    ]
+    spec = client.get("/api/kernel_spec").json()
+
+    script = """
+        const noyau = require(process.argv[1]);
+        const { entrees, requetes, spec } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+        process.stdout.write(JSON.stringify({
+            resultats: entrees.map(e => noyau.executerModele(e)),
+            reponses: requetes.map(r => noyau.calculer(r, spec)),
+        }));
+    """
+    sortie = subprocess.run(
+        [node, "-e", script, str(Path(__file__).parent / "noyau.js")],
+        input=json.dumps({"entrees": entrees, "requetes": requetes, "spec": spec}),
+        capture_output=True, text=True, check=True,
+    )
+    obtenu = json.loads(sortie.stdout)
+
+    def comparer(obtenu, attendu, contexte):
+        assert obtenu.keys() == attendu.keys(), contexte
+        for champ, valeur in attendu.items():
+            if isinstance(valeur, (float, list)):
+                assert obtenu[champ] == pytest.approx(valeur, rel=1e-9, abs=1e-6), (contexte, champ)
+            else:
+                assert obtenu[champ] == valeur, (contexte, champ)
+
+    for s, attendu, resultat in zip(SCENARIOS_CANONIQUES, attendus, obtenu["resultats"]):
+        comparer(resultat, attendu, s.nom)
+    for requete, reponse in zip(requetes, obtenu["reponses"]):
+        comparer(reponse, client.post("/api/calculate", json=requete).json(), requete)
+
+
+def test_equivalence_moteurs_optimises():
+    """Les moteurs optimisés reproduisent executer_modele() sur un corpus aléatoire."""
+    from analyse_compteurs_eau import (
+        COMBINAISONS_CORPUS, MOTEURS_EQUIVALENCE, comparer_moteurs, generer_corpus,
+    )
+
+    corpus = generer_corpus(len(COMBINAISONS_CORPUS), seed=2024)
+    assert {tuple(c.description.split()[:5]) for c in corpus} == {
+        (a.value, p.value, f or "sans_fuites", "reseau" if r else "sans_reseau", m.value)
+        for a, p, f, r, m in COMBINAISONS_CORPUS
+    }
+
+    rapport = comparer_moteurs(corpus)
+    assert rapport.conforme, rapport.resume()
+    assert rapport.cas_compares["base_van"] == len(corpus)
+    assert rapport.cas_compares["municipalites"] > len(corpus) // 2
+
+    # Une dérive de 1e-6 sur la VAN est détectée et classée en tête
+    def moteur_derive(cas):
+        return [{**r, "van": r["van"] * (1 + 1e-6)} for r in MOTEURS_EQUIVALENCE["base_van"](cas)]
+
+    rapport = comparer_moteurs(corpus[:10], {"derive": moteur_derive})
+    assert not rapport.conforme
+    assert rapport.pires(1)[0].champ == "van"
+
+
+def test_benchmark_reference_et_regression():
+    """La référence couvre chaque benchmark; une régression au-delà du seuil est signalée."""
+    import json
+    import benchmark
+
+    noms = [b.nom for b in benchmark.construire_benchmarks()]
+    reference = json.loads(benchmark.REFERENCE_DEFAUT.read_text(encoding="utf-8"))
+    assert set(noms) <= set(reference["resultats"])
+
+    rapide = benchmark.construire_benchmarks("calculer_dynamique_fuites/agrege")
+    mesures = benchmark.executer(rapide, budget=0.05, unite=1.0)
+    nom = rapide[0].nom
+    lente = {"resultats": {nom: {"unites": mesures["resultats"][nom]["unites"] / 2}}}
+    stable = {"resultats": {nom: {"unites": mesures["resultats"][nom]["unites"]}}}
+    assert benchmark.comparer(mesures, lente, seuil=0.25)[0]["regression"]
+    assert not benchmark.comparer(mesures, stable, seuil=0.25)[0]["regression"]
+    assert benchmark.comparer(mesures, {})[0]["ratio"] is None
+
+
 # =============================================================================
 # TESTS DE VALIDATION
 # =============================================================================
@@ -337,6 +784,528 @@ def test_monte_carlo():
     print(f"P(VAN > 0): {data['prob_van_positive']*100:.1f}%")
 
 
+def test_limitation_debit_ponderee(monkeypatch):
+    """Test que le seau à jetons facture chaque endpoint selon son coût en évaluations."""
+    import api
+
+    # Seau de 1000 jetons, remplissage 10/s
+    limiteur = api.TokenBucketLimiter(1000, 10)
+    assert limiteur.consommer("a", 600, maintenant=0.0)[0]
+    admis, jetons, _ = limiteur.consommer("a", 600, maintenant=1.0)
+    assert not admis and jetons == 410
+    assert limiteur.consommer("b", 600, maintenant=1.0)[0]  # seau distinct par client
+    assert limiteur.consommer("a", 600, maintenant=20.0)[0]
+    # Coût supérieur à la capacité: ramené à la capacité
+    assert limiteur.consommer("c", 50000, maintenant=0.0)[0]
+
+    monkeypatch.setattr(api, "limiteur", api.TokenBucketLimiter(1000, 10))
+    monkeypatch.setattr(api, "API_KEYS", frozenset({"test-limitation"}))
+    cle = {"X-API-Key": "test-limitation"}
+    response = client.post("/api/calculate", json=SCENARIO_BASELINE, headers=cle)
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Limit"] == "1000"
+    assert response.headers["RateLimit-Remaining"] == "999"
+
+    # Un Monte Carlo de 900 tirages coûte 900 jetons: le second est refusé
+    requete = dict(json=SCENARIO_BASELINE, params={"n_simulations": 900, "seed": 3}, headers=cle)
+    assert client.post("/api/monte_carlo", **requete).status_code == 200
+    response = client.post("/api/monte_carlo", **requete)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    # Le coût est par client: sans clé, l'IP de test a son propre seau
+    assert client.post("/api/calculate", json=SCENARIO_BASELINE).status_code == 200
+    assert 'api_rate_limited_total{endpoint="/api/monte_carlo"}' in client.get("/api/metrics").text
+
+
+def test_identifiant_client_cles_et_proxys(monkeypatch):
+    """Test que seules les clés autorisées ont leur seau et que X-Forwarded-For n'est lu que via un proxy de confiance."""
+    import api
+    from starlette.requests import Request as RequeteStarlette
+
+    def requete(hote, **en_tetes):
+        return RequeteStarlette({"type": "http", "client": (hote, 1234), "headers": [
+            (k.replace("_", "-").lower().encode(), v.encode()) for k, v in en_tetes.items()]})
+
+    monkeypatch.setattr(api, "API_KEYS", frozenset({"cle-valide"}))
+    monkeypatch.setattr(api, "reseaux_proxys", api._reseaux_proxys("10.0.0.0/8"))
+    assert api.identifiant_client(requete("1.2.3.4", x_api_key="cle-valide")).startswith("cle:")
+    # Une clé inventée ne donne pas de nouveau seau
+    assert api.identifiant_client(requete("1.2.3.4", x_api_key="inventee")) == "ip:1.2.3.4"
+    # X-Forwarded-For ignoré hors proxy de confiance
+    assert api.identifiant_client(requete("1.2.3.4", x_forwarded_for="9.9.9.9")) == "ip:1.2.3.4"
+    # Via le proxy: premier saut non fiable en partant de la droite
+    assert api.identifiant_client(requete("10.0.0.5", x_forwarded_for="6.6.6.6, 5.6.7.8, 10.1.1.1")) == "ip:5.6.7.8"
+    # Tous les sauts de confiance: jamais l'entrée de gauche, qui peut venir du client
+    assert api.identifiant_client(requete("10.0.0.5", x_forwarded_for="10.3.3.3, 10.2.2.2")) == "ip:10.2.2.2"
+    monkeypatch.setattr(api, "reseaux_proxys", api._reseaux_proxys("*"))
+    assert api.identifiant_client(requete("10.0.0.5", x_forwarded_for="5.6.7.8")) == "ip:5.6.7.8"
+    # "*": seule l'entrée ajoutée par le proxy de la plateforme compte
+    assert api.identifiant_client(requete("10.1.1.1", x_forwarded_for="6.6.6.6, 203.0.113.5")) == "ip:203.0.113.5"
+
+
+def test_coalescence_requetes_identiques():
+    """Test que des requêtes Monte Carlo identiques simultanées partagent un seul calcul."""
+    import asyncio
+    import httpx
+    import api
+
+    async def envoyer():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            requete = dict(json=SCENARIO_BASELINE, params={"n_simulations": 200, "seed": 7})
+            return await asyncio.gather(
+                ac.post("/api/monte_carlo", **requete),
+                ac.post("/api/monte_carlo", **requete),
+                ac.post("/api/monte_carlo", json=SCENARIO_BASELINE, params={"n_simulations": 200, "seed": 8}),
+            )
+
+    tirages_avant = api.metrics.mc_draws
+    coalescees_avant = api.metrics.coalesced["/api/monte_carlo"]
+    r1, r2, r3 = asyncio.run(envoyer())
+
+    assert r1.status_code == r2.status_code == r3.status_code == 200
+    assert r1.json() == r2.json()
+    # Deux calculs (seeds différentes), pas trois
+    assert api.metrics.mc_draws - tirages_avant == 400
+    assert api.metrics.coalesced["/api/monte_carlo"] - coalescees_avant == 1
+    assert not api.calculs_en_cours.en_cours
+    assert 'api_coalesced_requests_total{endpoint="/api/monte_carlo"}' in client.get("/api/metrics").text
+
+
+def test_annulation_client_deconnecte():
+    """Test qu'un calcul abandonné par tous ses clients est interrompu et compté."""
+    import asyncio
+    import threading
+    import api
+    from analyse_compteurs_eau import (
+        CalculAnnule, ParametresModele, ParametresCompteur, ParametresMonteCarlo,
+        DISTRIBUTIONS_DEFAUT, simuler_monte_carlo,
+    )
+
+    # Le moteur s'arrête au premier lot si l'annulation est déjà levée
+    annulation = threading.Event()
+    annulation.set()
+    with pytest.raises(CalculAnnule):
+        simuler_monte_carlo(
+            ParametresModele(), ParametresCompteur(),
+            ParametresMonteCarlo(distributions=DISTRIBUTIONS_DEFAUT, n_simulations=100),
+            afficher_progression=False, annulation=annulation,
+        )
+
+    class RequeteDeconnectee:
+        """Client qui se déconnecte après 50 ms."""
+        async def receive(self):
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+
+    arrete = threading.Event()
+
+    def calcul_long(annulation):
+        while not annulation.wait(0.01):
+            pass
+        arrete.set()
+        raise CalculAnnule("annulé")
+
+    async def scenario():
+        sf = api.SingleFlight()
+        appels = [sf.executer("/test", "cle", calcul_long, request=RequeteDeconnectee()) for _ in range(2)]
+        resultats = await asyncio.gather(*appels, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        return sf, resultats
+
+    annules_avant = api.metrics.cancelled["/test"]
+    sf, resultats = asyncio.run(scenario())
+    assert all(isinstance(r, api.RequeteAbandonnee) for r in resultats)
+    assert arrete.is_set()
+    assert not sf.en_cours
+    # Deux clients, un seul calcul annulé
+    assert api.metrics.cancelled["/test"] - annules_avant == 1
+
+
+def test_jobs_asynchrones(monkeypatch, tmp_path):
+    """Test qu'un job Monte Carlo s'exécute hors requête et que son résultat est conservé."""
+    import json
+    import os
+    import time
+    import api
+
+    monkeypatch.setattr(api, "JOBS_DIR", tmp_path)
+
+    response = client.post("/api/jobs", json={
+        "kind": "monte_carlo", "params": SCENARIO_BASELINE, "n_simulations": 2500, "seed": 42,
+    })
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+
+    debut = time.time()
+    while job["status"] not in api.JOB_TERMINAUX and time.time() - debut < 120:
+        time.sleep(0.2)
+        job = client.get(f"/api/jobs/{job['id']}").json()
+    assert job["status"] == "succeeded", job
+    assert job["progress"] == 1.0
+    assert job["expires_at"] is not None
+    # Au-delà de la limite synchrone de /api/monte_carlo_advanced (2000)
+    assert job["result"]["n_simulations"] == 2500
+    assert 0 <= job["result"]["prob_van_positive"] <= 1
+
+    assert client.post("/api/jobs", json={"kind": "inconnu", "params": {}}).status_code == 422
+    assert client.get("/api/jobs/..%2F..%2Fapi").status_code == 404
+    assert client.get("/api/jobs/" + "0" * 32).status_code == 404
+
+    # Expiration: introuvable dès expires_at, même avant la purge...
+    statut = tmp_path / job["id"] / "status.json"
+    contenu = json.loads(statut.read_text(encoding="utf-8"))
+    statut.write_text(json.dumps({**contenu, "expires_at": "2000-01-01T00:00:00+00:00"}), encoding="utf-8")
+    assert client.get(f"/api/jobs/{job['id']}").status_code == 404
+    assert client.delete(f"/api/jobs/{job['id']}").status_code == 404
+
+    # ... puis supprimé une fois son statut plus vieux que le TTL
+    store = api.JobStore(tmp_path, ttl_s=60)
+    assert store.nettoyer() == 0
+    os.utime(statut, (time.time() - 120, time.time() - 120))
+    assert store.nettoyer() == 1
+    assert client.get(f"/api/jobs/{job['id']}").status_code == 404
+
+
+# =============================================================================
+# TESTS DONNÉES CARTE PRÉCOMPRESSÉES
+# =============================================================================
+
+def test_asset_builder_deduplique_et_compresse(tmp_path):
+    """Test que les contenus identiques partagent un seul fichier haché."""
+    import gzip
+    import json
+    from map.collectors.asset_builder import AssetBuilder
+
+    data = {"46005": {"nom_mun": "ABERCORN", "lpcd": 159.0}}
+    builder = AssetBuilder(current_dir=tmp_path, build_dir=tmp_path / "build")
+    manifest = builder.build({"bil-data.json": data, "mamh-data.json": data})
+
+    files = manifest["files"]
+    assert files["bil-data.json"]["path"] == files["mamh-data.json"]["path"]
+    built = tmp_path / files["bil-data.json"]["path"]
+    assert json.loads(built.read_bytes()) == data
+    assert b" " not in built.read_bytes().replace(b"ABERCORN", b"")  # minifié
+    assert json.loads(gzip.decompress((tmp_path / (files["bil-data.json"]["path"] + ".gz")).read_bytes())) == data
+    assert (tmp_path / "manifest.json").exists()
+
+    # Un contenu modifié change le hash et les anciens fichiers sont nettoyés
+    manifest2 = builder.build({"bil-data.json": {**data, "x": 1}})
+    assert manifest2["files"]["bil-data.json"]["hash"] != files["bil-data.json"]["hash"]
+    assert not built.exists()
+
+
+def test_serve_precompressed_map_data():
+    """Test que les données de la carte sont servies précompressées."""
+    import json
+    from pathlib import Path
+
+    manifest_path = Path(__file__).parent / "map" / "data" / "current" / "manifest.json"
+    if not manifest_path.exists():
+        pytest.skip("manifest.json absent (asset_builder non exécuté)")
+    entry = json.loads(manifest_path.read_text())["files"]["municipalities-stats.json"]
+
+    url = f"/map/data/current/{entry['path']}"
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("application/json")
+    assert "immutable" in response.headers["cache-control"]
+    assert len(response.json()) > 0
+
+    response_identity = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response_identity.headers
+    assert "Accept-Encoding" in response_identity.headers["vary"]
+    assert response_identity.json() == response.json()
+
+
+def test_precompressed_qvalues_et_vary(tmp_path):
+    """Test que q=0 refuse un encodage et que Vary accompagne toute réponse à variantes."""
+    from starlette.requests import Request as StarletteRequest
+    import api
+
+    assert api.encodages_acceptes("gzip;q=0, br") == {"br"}
+    assert api.encodages_acceptes("br;q=0, *;q=0.5") == {"*", "gzip"}
+    assert api.encodages_acceptes("gzip; q=0.0") == set()
+
+    original = tmp_path / "data.json"
+    original.write_text("{}")
+    (tmp_path / "data.json.gz").write_bytes(b"gz")
+
+    def servir(path, accept):
+        scope = {"type": "http", "headers": [(b"accept-encoding", accept.encode())]}
+        return api.precompressed_file_response(path, StarletteRequest(scope))
+
+    refus = servir(original, "gzip;q=0")
+    assert refus.path == str(original)
+    assert "content-encoding" not in refus.headers
+    assert refus.headers["vary"] == "Accept-Encoding"
+    assert servir(original, "gzip;q=0.8").headers["content-encoding"] == "gzip"
+
+    seul = tmp_path / "seul.json"
+    seul.write_text("{}")
+    assert "vary" not in servir(seul, "gzip").headers
+
+
+def test_optimisation_deploiement_pareto():
+    """Test que /api/optimize_deployment respecte les contraintes et retourne un front de Pareto."""
+    from analyse_compteurs_eau import (
+        ModeAdoption, ParametresAdoption, ParametresCompteur, ParametresModele,
+        evaluer_calendrier, executer_modele,
+    )
+
+    # Un calendrier à rythme constant équivaut au déploiement par secteurs
+    params = ParametresModele(nb_menages=50_000)
+    secteurs = ParametresAdoption(mode=ModeAdoption.PAR_SECTEUR, nb_secteurs=5, annees_par_secteur=1,
+                                  adoption_max_pct=100, etaler_capex=True)
+    attendu = executer_modele(params, ParametresCompteur(), params_adoption=secteurs)
+    plan = evaluer_calendrier(params, ParametresCompteur(), [10_000] * 5)
+    assert plan.van == pytest.approx(attendu.van, rel=1e-12)
+
+    corps = {
+        "params": {**SCENARIO_BASELINE, "nb_menages": 60_000},
+        "budget_annuel_max": 8_000_000,
+        "capacite_installation_max": 15_000,
+        "horizon_deploiement": 8,
+    }
+    reponse = client.post("/api/optimize_deployment", json=corps)
+    assert reponse.status_code == 200
+    data = reponse.json()
+    optimal = data["optimal"]
+    assert optimal["budget_annuel"] <= corps["budget_annuel_max"] + 1e-6
+    assert max(optimal["calendrier"]) <= corps["capacite_installation_max"]
+    assert sum(optimal["calendrier"]) == 60_000
+    assert optimal["annees_deploiement"] <= corps["horizon_deploiement"]
+    assert optimal["van"] == max(s["van"] for s in data["scenarios"])
+    assert data["evaluations"] <= 40 + SCENARIO_BASELINE["horizon"] + 2
+    # Débit facturé à la borne des exécutions du modèle
+    import api
+    assert api.cout_optimisation(None, corps) == 40 + SCENARIO_BASELINE["horizon"] + 2
+    assert api.cout_job(None, {"kind": "optimize_deployment", "params": corps}) == api.cout_optimisation(None, corps)
+
+    def domine(a, b):
+        pa = a["payback"] if a["payback"] is not None else float("inf")
+        pb = b["payback"] if b["payback"] is not None else float("inf")
+        criteres_a = (-a["van"], pa, a["budget_annuel"])
+        criteres_b = (-b["van"], pb, b["budget_annuel"])
+        return all(x <= y for x, y in zip(criteres_a, criteres_b)) and criteres_a != criteres_b
+
+    assert data["pareto"]
+    for p in data["pareto"]:
+        assert not any(domine(s, p) for s in data["scenarios"])
+
+    # Contraintes incompatibles avec l'horizon
+    corps["capacite_installation_max"] = 1_000
+    assert client.post("/api/optimize_deployment", json=corps).status_code == 422
+    # Paramètres de calcul invalides: erreur client, pas 500
+    assert client.post("/api/optimize_deployment", json={**corps, "params": {"horizon": "abc"}}).status_code == 422
+
+
+def test_planification_deploiement_par_cohortes():
+    """Test que la VAN est linéaire par cohorte et que le calendrier planifié est optimal."""
+    from analyse_compteurs_eau import (
+        ParametresCompteur, ParametresFuitesReseau, ParametresModele,
+        evaluer_calendrier, planifier_deploiement,
+    )
+    from analyse_compteurs_eau.presets import (
+        ADOPTION_PROGRESSIVE, FUITES_QUEBEC_DEUX_STOCKS, PERSISTANCE_REALISTE,
+    )
+
+    params = ParametresModele(nb_menages=20_000)
+    compteur = ParametresCompteur(cout_infra_fixe=100_000)
+    kwargs = dict(
+        persistance=PERSISTANCE_REALISTE,
+        params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+        params_fuites_reseau=ParametresFuitesReseau(volume_pertes_m3_an=5e5, reduction_max_pct=20,
+                                                    cout_programme_annuel=20_000),
+        params_adoption=ADOPTION_PROGRESSIVE,
+    )
+    budget = [2e6, 3e6, 1e6, 5e6, 5e6, 5e6]
+    res = planifier_deploiement(params, compteur, budget, 8_000, horizon_deploiement=6, **kwargs)
+
+    plan = res.plan
+    assert sum(plan.calendrier) == 20_000
+    cout = (compteur.cout_initial_par_compteur * 20_000 + 100_000) / 20_000
+    assert all(n <= 8_000 and n * cout <= b + 1e-6 for n, b in zip(plan.calendrier, budget))
+    assert res.van_lineaire == pytest.approx(plan.van, rel=1e-9)
+
+    # Tout autre calendrier réalisable: VAN(x) = VAN_0 + v · x, et pas mieux
+    for calendrier in ([2_000, 3_000, 1_000, 5_000, 5_000, 4_000], [2_900, 4_400, 1_400, 4_000, 4_000, 3_300]):
+        autre = evaluer_calendrier(params, compteur, calendrier, **kwargs)
+        fractions = [n / 20_000 for n in calendrier]
+        assert autre.van == pytest.approx(res.van_base + sum(v * x for v, x in zip(res.van_cohortes, fractions)), rel=1e-9)
+        assert autre.van <= plan.van + 1e-6
+
+
+# =============================================================================
+# TESTS ACB PAR MUNICIPALITÉ
+# =============================================================================
+
+def test_evaluation_lot_municipalites():
+    """Test que l'évaluation vectorisée reproduit le modèle scalaire."""
+    from analyse_compteurs_eau import (
+        ModeCompte, ParametresCompteur, ParametresFuitesReseau, TypeCompteur,
+        charger_municipalites, evaluer_municipalites, executer_modele,
+        parametres_municipalite,
+    )
+    from analyse_compteurs_eau.presets import (
+        ADOPTION_PROGRESSIVE, FUITES_QUEBEC_DEUX_STOCKS, PERSISTANCE_REALISTE,
+    )
+
+    stats = {
+        "1": {"name": "A", "lpcd": 171.0, "nb_logements": 79, "pers_par_residence": 2.56,
+              "indice_fuites": 0.77, "longueur_reseau_km": 2.2},
+        "2": {"name": "B", "lpcd": 312.0, "nb_logements": 907801, "pers_par_residence": 2.07,
+              "indice_fuites": 3.1, "longueur_reseau_km": 4416.9},
+        "3": {"name": "C", "lpcd": 95.0, "nb_logements": 400, "population_desservie": 900},
+        "4": {"name": "D", "lpcd": None, "nb_logements": 50, "pers_par_residence": 2.0},
+        "5": {"name": "E", "lpcd": 200.0, "nb_logements": 0},
+    }
+    municipalites, exclues = charger_municipalites(stats)
+    assert [m.csd_uid for m in municipalites] == ["1", "2", "3"]
+    assert exclues == {"4": "lpcd manquant", "5": "nb_logements manquant"}
+    assert municipalites[2].taille_menage == 2.25
+    assert municipalites[2].volume_pertes_m3_an is None
+
+    reseau = ParametresFuitesReseau(reduction_max_pct=20, cout_programme_annuel=50_000,
+                                    cout_reparation_m3=0.3, cout_capex_initial=100_000)
+    kwargs = dict(persistance=PERSISTANCE_REALISTE, params_fuites=FUITES_QUEBEC_DEUX_STOCKS,
+                  params_adoption=ADOPTION_PROGRESSIVE)
+    for compteur, mode, params_reseau in [
+        (ParametresCompteur(), ModeCompte.ECONOMIQUE, None),
+        (ParametresCompteur(cout_infra_fixe=250_000), ModeCompte.ECONOMIQUE, reseau),
+        (ParametresCompteur(type_compteur=TypeCompteur.AMR), ModeCompte.FINANCIER, reseau),
+    ]:
+        res = evaluer_municipalites(municipalites, compteur, params_fuites_reseau=params_reseau,
+                                    mode_compte=mode, exclues=exclues, **kwargs)
+        for i, m in enumerate(municipalites):
+            params, params_m = parametres_municipalite(m, params_fuites_reseau=params_reseau)
+            attendu = executer_modele(params, compteur, params_fuites_reseau=params_m,
+                                      mode_compte=mode, **kwargs)
+            assert res.van[i] == pytest.approx(attendu.van, rel=1e-9, abs=1e-3)
+            assert res.rbc[i] == pytest.approx(attendu.rbc, rel=1e-9)
+            assert res.lcsw[i] == pytest.approx(attendu.lcsw, rel=1e-9)
+            assert res.periode_recuperation[i] == pytest.approx(attendu.periode_recuperation, rel=1e-9)
+            assert res.van_cumulative[i] == pytest.approx(attendu.van_cumulative, rel=1e-9, abs=1e-3)
+
+    table = res.vers_dict()
+    assert table["colonnes"][:4] == ["van", "rbc", "lcsw", "periode_recuperation"]
+    assert set(table["donnees"]) == {"1", "2", "3"}
+    assert table["exclues"] == exclues
+
+
+def test_monte_carlo_provincial_tirages_communs():
+    """Test que le Monte Carlo provincial reproduit simuler_monte_carlo par municipalité."""
+    from analyse_compteurs_eau import (
+        DISTRIBUTIONS_DEFAUT, ParametresCompteur, ParametresFuitesReseau,
+        ParametresMonteCarlo, charger_municipalites, parametres_municipalite,
+        simuler_monte_carlo, simuler_municipalites_monte_carlo,
+    )
+
+    stats = {
+        "1": {"name": "A", "lpcd": 171.0, "nb_logements": 79, "pers_par_residence": 2.56,
+              "indice_fuites": 0.77, "longueur_reseau_km": 2.2},
+        "2": {"name": "B", "lpcd": 312.0, "nb_logements": 9078, "pers_par_residence": 2.07,
+              "indice_fuites": 3.1, "longueur_reseau_km": 441.6},
+        "3": {"name": "C", "lpcd": 95.0, "nb_logements": 400, "population_desservie": 900},
+    }
+    municipalites, _ = charger_municipalites(stats)
+    config = ParametresMonteCarlo(n_simulations=100, seed=3, distributions={
+        nom: d for nom, d in DISTRIBUTIONS_DEFAUT.items() if nom != "lpcd"})
+    reseau = ParametresFuitesReseau(reduction_max_pct=20, cout_programme_annuel=20_000)
+
+    res = simuler_municipalites_monte_carlo(municipalites, ParametresCompteur(), config_mc=config,
+                                            params_fuites_reseau=reseau, taille_lot=2)
+    assert res.n_simulations == 100
+    for i, m in enumerate(municipalites):
+        params, params_m = parametres_municipalite(m, params_fuites_reseau=reseau)
+        attendu = simuler_monte_carlo(params, ParametresCompteur(), config_mc=config,
+                                      afficher_progression=False, params_fuites_reseau=params_m)
+        assert res.prob_van_positive[i] == attendu.prob_van_positive
+        assert res.van_moyenne[i] == pytest.approx(attendu.van_moyenne, rel=1e-9, abs=1e-3)
+        assert res.percentiles[i, 0] == pytest.approx(attendu.percentile_5, rel=1e-9, abs=1e-3)
+        assert res.percentiles[i, 4] == pytest.approx(attendu.percentile_95, rel=1e-9, abs=1e-3)
+
+    # Agrégats provinciaux: somme des VAN d'un même tirage
+    assert res.van_province.sum() == pytest.approx(res.van_moyenne.sum() * 100, rel=1e-9)
+    province = res.vers_dict()["province"]
+    assert 0 <= province["nb_viables"]["moyenne"] <= 3
+
+
+def test_couche_acb_carte_coherente_avec_calculateur(tmp_path):
+    """Test que la couche ACB de la carte reproduit /api/calculate."""
+    import api
+    from map.collectors.cba_builder import CBABuilder, METER_TYPES, calculator_meter
+
+    # Mêmes compteurs par défaut que le calculateur (source commune)
+    for type_compteur in METER_TYPES:
+        assert calculator_meter(type_compteur) == api.get_compteur(api.CalculRequest(type_compteur=type_compteur))
+
+    stats = {
+        "2458227": {"name": "Longueuil", "lpcd": 236.0, "nb_logements": 116258,
+                    "pers_par_residence": 2.18},
+        "2408040": {"name": "Sainte-Paule", "lpcd": None, "nb_logements": None},
+    }
+    builder = CBABuilder(current_dir=tmp_path)
+    cba = builder.build(stats)
+    assert cba["compteurs"] == ["ami", "amr", "manuel"]
+    assert cba["exclues"] == {"2408040": "nb_logements manquant"}
+
+    colonnes = cba["colonnes"]
+    for i, type_compteur in enumerate(cba["compteurs"]):
+        valeurs = dict(zip(colonnes, cba["donnees"]["2458227"][i]))
+        reponse = client.post("/api/calculate", json={"type_compteur": type_compteur}).json()
+        assert valeurs["van"] == pytest.approx(reponse["van"], abs=1)
+        assert valeurs["rbc"] == pytest.approx(reponse["rbc"], abs=1e-3)
+        assert valeurs["lcsw"] == pytest.approx(reponse["lcsw"], abs=1e-2)
+
+    builder.save(cba)
+    assert (tmp_path / "cba-results.json").exists()
+
+
+def test_priorisation_provinciale(monkeypatch, tmp_path):
+    """Test que /api/prioritize respecte les contraintes et encadre l'optimum."""
+    import itertools
+    import json
+    import api
+
+    stats = {str(i): {"name": f"M{i}", "lpcd": 150 + 40 * i, "nb_logements": 200 + 370 * (i % 5) ** 2,
+                      "pers_par_residence": 2.3} for i in range(10)}
+    chemin = tmp_path / "municipalities-stats.json"
+    chemin.write_text(json.dumps(stats), encoding="utf-8")
+    monkeypatch.setattr(api, "table_municipalites", api.TableMunicipalites(str(chemin)))
+
+    for corps in ({"budget": 4e6}, {"budget": 8e6, "capacite_compteurs": 6000, "objectif": "m3"}):
+        reponse = client.post("/api/prioritize", json=corps)
+        assert reponse.status_code == 200
+        data = reponse.json()
+        resume, selection = data["resume"], data["selection"]
+        assert resume["investissement_total"] <= corps["budget"]
+        assert resume["compteurs_total"] <= corps.get("capacite_compteurs", float("inf"))
+        assert [s["rang"] for s in selection] == list(range(1, len(selection) + 1))
+
+        # Optimum exact par énumération: glouton <= optimum <= borne
+        objectif = corps.get("objectif", "van")
+        cle = "van" if objectif == "van" else "va_economies_m3"
+        tous = client.post("/api/prioritize", json={"budget": 1e12, "limite": 10,
+                                                    "objectif": objectif}).json()["selection"]
+        optimum = 0.0
+        for k in range(len(tous) + 1):
+            for combo in itertools.combinations(tous, k):
+                if (sum(m["investissement_initial"] for m in combo) <= corps["budget"]
+                        and sum(m["nb_compteurs"] for m in combo) <= corps.get("capacite_compteurs", 1e12)):
+                    optimum = max(optimum, sum(m[cle] for m in combo))
+        assert resume["valeur_totale"] <= optimum + 1e-6
+        assert optimum <= resume["borne_superieure"] + 1e-6
+
+    assert client.post("/api/prioritize", json={"budget": 1e6, "objectif": "rbc"}).status_code == 422
+    assert client.post("/api/prioritize", json={"budget": 1e6, "params": {"horizon": "abc"}}).status_code == 422
+    # Une unité de débit par exécution du modèle
+    assert api.cout_priorisation(None, {"budget": 1e6}) == 3
+    assert api.cout_priorisation(None, {"budget": 1e6, "params": {"reseau_activer": True}}) == 7
+
+
 # =============================================================================
 # MAIN
 # =============================================================================